@@ -10,9 +10,10 @@ from decimal import Decimal
 import hashlib
 import json
 
+from gecko_terminal_collector.analysis.indicator_engine import IndicatorEngine, IndicatorSnapshot, IndicatorState
 from gecko_terminal_collector.collectors.new_pools_collector import NewPoolsCollector
 from gecko_terminal_collector.models.core import CollectionResult
-from enhanced_new_pools_history_model import EnhancedNewPoolsHistory, PoolFeatureVector
+from enhanced_new_pools_history_model import EnhancedNewPoolsHistory, PoolFeatureVector, PoolIndicatorState
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +52,10 @@ class EnhancedNewPoolsCollector(NewPoolsCollector):
             'long': 720    # 30 days
         }
         
+        # Streaming indicator state, refreshed once per collection cycle
+        self.indicator_engine = IndicatorEngine()
+        self._indicator_snapshots: Dict[str, IndicatorSnapshot] = {}
+        
         # Initialize signal analyzer for auto-watchlist (override parent's analyzer if needed)
         if self.auto_watchlist_enabled:
             from gecko_terminal_collector.analysis.signal_analyzer import NewPoolsSignalAnalyzer
@@ -84,6 +89,9 @@ class EnhancedNewPoolsCollector(NewPoolsCollector):
             pools_data = self._normalize_response_data(response)
             self.logger.info(f"Received {len(pools_data)} new pools from API")
             
+            # Advance technical indicators for the whole page at once
+            await self._update_indicator_states(pools_data)
+            
             # Process each collection interval
             for interval in self.collection_intervals:
                 interval_records = await self._process_interval_data(pools_data, interval)
@@ -261,8 +269,7 @@ class EnhancedNewPoolsCollector(NewPoolsCollector):
     async def _calculate_advanced_metrics(self, pool_id: str, attributes: Dict) -> Dict:
         """Calculate advanced metrics for ML features."""
         try:
-            # Get historical data for calculations
-            historical_data = await self._get_pool_historical_data(pool_id, hours=24)
+            indicators = await self._get_indicator_snapshot(pool_id, attributes)
             
             # Calculate buy/sell ratios
             buys_h24 = self._safe_int(attributes.get('transactions_h24_buys', 0))
@@ -280,16 +287,13 @@ class EnhancedNewPoolsCollector(NewPoolsCollector):
             
             # Calculate liquidity metrics
             current_liquidity = self._safe_decimal(attributes.get('reserve_in_usd', 0))
-            liquidity_change = Decimal('0')  # Would calculate from historical data
+            liquidity_change = Decimal(str(indicators.liquidity_change_percentage))
             
-            # Technical indicators (real implementations)
-            rsi = self._calculate_simple_rsi(historical_data, current_price)
-            macd = self._calculate_macd(historical_data, current_price)
+            # Technical indicators from the streaming indicator state
+            rsi = Decimal(str(indicators.rsi))
+            macd = Decimal(str(indicators.macd))
             trend_strength = min(abs(price_change_h24 or 0), 100)
             
-            # Calculate liquidity change from historical data
-            liquidity_change = self._calculate_liquidity_change(historical_data, current_liquidity)
-            
             return {
                 'buy_sell_ratio_interval': buy_sell_ratio_h24,
                 'buy_sell_ratio_h24': buy_sell_ratio_h24,
@@ -726,26 +730,196 @@ class EnhancedNewPoolsCollector(NewPoolsCollector):
                 ).order_by(EnhancedNewPoolsHistory.timestamp.desc()).limit(100).all()
                 
                 # Convert to dictionaries
-                historical_data = []
-                for record in historical_records:
-                    historical_data.append({
-                        'pool_id': record.pool_id,
-                        'timestamp': record.timestamp,
-                        'base_token_price_usd': record.close_price_usd or record.open_price_usd,
-                        'volume_usd_h24': record.volume_usd_h24,
-                        'reserve_in_usd': record.reserve_in_usd,
-                        'transactions_h24_buys': record.transactions_h24_buys,
-                        'transactions_h24_sells': record.transactions_h24_sells,
-                        'price_change_percentage_h1': record.price_change_percentage_h1,
-                        'price_change_percentage_h24': record.price_change_percentage_h24
-                    })
-                
-                return historical_data
+                return [self._history_record_to_dict(record) for record in historical_records]
                 
         except Exception as e:
             self.logger.error(f"Error getting historical data for pool {pool_id}: {e}")
             return []
     
+    async def _get_pools_historical_data(
+        self, 
+        pool_ids: List[str], 
+        hours: int = 24, 
+        limit_per_pool: Optional[int] = 100
+    ) -> Dict[str, List[Dict]]:
+        """
+        Get historical data for a page of pools with a single query.
+        
+        Args:
+            pool_ids: Pool IDs to get data for
+            hours: Number of hours of historical data to retrieve
+            limit_per_pool: Most recent records kept per pool (None for all)
+            
+        Returns:
+            Dictionary mapping pool ID to its records, newest first
+        """
+        try:
+            if not pool_ids:
+                return {}
+            
+            cutoff_timestamp = int((datetime.now() - timedelta(hours=hours)).timestamp())
+            
+            with self.db_manager.connection.get_session() as session:
+                historical_records = session.query(EnhancedNewPoolsHistory).filter(
+                    EnhancedNewPoolsHistory.pool_id.in_(pool_ids),
+                    EnhancedNewPoolsHistory.timestamp >= cutoff_timestamp
+                ).order_by(
+                    EnhancedNewPoolsHistory.pool_id,
+                    EnhancedNewPoolsHistory.timestamp.desc()
+                ).all()
+                
+                history_by_pool: Dict[str, List[Dict]] = {}
+                for record in historical_records:
+                    records = history_by_pool.setdefault(record.pool_id, [])
+                    if limit_per_pool is None or len(records) < limit_per_pool:
+                        records.append(self._history_record_to_dict(record))
+                
+                return history_by_pool
+                
+        except Exception as e:
+            self.logger.error(f"Error getting historical data for {len(pool_ids)} pools: {e}")
+            return {}
+    
+    @staticmethod
+    def _history_record_to_dict(record: EnhancedNewPoolsHistory) -> Dict:
+        """Convert an enhanced history record to the dictionary used by the indicators."""
+        return {
+            'pool_id': record.pool_id,
+            'timestamp': record.timestamp,
+            'base_token_price_usd': record.close_price_usd or record.open_price_usd,
+            'volume_usd_h24': record.volume_usd_h24,
+            'reserve_in_usd': record.reserve_in_usd,
+            'transactions_h24_buys': record.transactions_h24_buys,
+            'transactions_h24_sells': record.transactions_h24_sells,
+            'price_change_percentage_h1': record.price_change_percentage_h1,
+            'price_change_percentage_h24': record.price_change_percentage_h24
+        }
+    
+    async def _update_indicator_states(self, pools_data: List[Dict]) -> None:
+        """
+        Fold the current observation of every pool into its indicator state.
+        
+        A page costs one state load and one state save; pools without a
+        stored state are backfilled from their history with one more query.
+        The resulting snapshots serve every interval and the feature vectors
+        of this cycle.
+        
+        Args:
+            pools_data: List of pool data from API
+        """
+        self._indicator_snapshots = {}
+        observations = {
+            pool_data['id']: pool_data.get('attributes', {})
+            for pool_data in pools_data if pool_data.get('id')
+        }
+        if not observations:
+            return
+        
+        timestamp = int(datetime.now().timestamp())
+        
+        try:
+            states = await self._load_indicator_states(list(observations))
+            
+            missing = [pool_id for pool_id in observations if pool_id not in states]
+            if missing:
+                history_by_pool = await self._get_pools_historical_data(
+                    missing, hours=self.lookback_periods['medium'], limit_per_pool=None
+                )
+                for pool_id in missing:
+                    states[pool_id] = self._backfill_indicator_state(history_by_pool.get(pool_id, []))
+            
+            for pool_id, attributes in observations.items():
+                self._indicator_snapshots[pool_id] = self._fold_indicator_observation(
+                    states[pool_id], timestamp, attributes
+                )
+            
+            await self._save_indicator_states(states)
+            self.logger.debug(f"Updated indicator state for {len(states)} pools ({len(missing)} backfilled)")
+            
+        except Exception as e:
+            self.logger.error(f"Error updating indicator states: {e}")
+    
+    async def _get_indicator_snapshot(self, pool_id: str, attributes: Dict) -> IndicatorSnapshot:
+        """
+        Get the indicator snapshot of a pool for the current cycle.
+        
+        Pools missing from the page update (e.g. when the state table is not
+        available) are computed from their recent history without persisting.
+        
+        Args:
+            pool_id: Pool ID
+            attributes: Current pool attributes from API
+            
+        Returns:
+            Indicator snapshot at the current observation
+        """
+        snapshot = self._indicator_snapshots.get(pool_id)
+        if snapshot is None:
+            historical_data = await self._get_pool_historical_data(pool_id, hours=self.lookback_periods['medium'])
+            state = self._backfill_indicator_state(historical_data)
+            snapshot = self._fold_indicator_observation(state, int(datetime.now().timestamp()), attributes)
+            self._indicator_snapshots[pool_id] = snapshot
+        return snapshot
+    
+    def _backfill_indicator_state(self, historical_data: List[Dict]) -> IndicatorState:
+        """Build indicator state from history records in one vectorized pass."""
+        return self.indicator_engine.backfill(
+            [record['timestamp'] for record in historical_data],
+            [record['base_token_price_usd'] for record in historical_data],
+            [record['volume_usd_h24'] for record in historical_data],
+            [record['reserve_in_usd'] for record in historical_data]
+        )
+    
+    def _fold_indicator_observation(self, state: IndicatorState, timestamp: int, attributes: Dict) -> IndicatorSnapshot:
+        """Fold a pool's current API attributes into its indicator state."""
+        return self.indicator_engine.update(
+            state,
+            timestamp,
+            price=self._safe_decimal(attributes.get('base_token_price_usd')),
+            volume=self._safe_decimal(attributes.get('volume_usd_h24')),
+            liquidity=self._safe_decimal(attributes.get('reserve_in_usd'))
+        )
+    
+    async def _load_indicator_states(self, pool_ids: List[str]) -> Dict[str, IndicatorState]:
+        """Load stored indicator states for a page of pools."""
+        with self.db_manager.connection.get_session() as session:
+            rows = session.query(PoolIndicatorState).filter(
+                PoolIndicatorState.pool_id.in_(pool_ids)
+            ).all()
+            return {row.pool_id: IndicatorState.from_dict(row.state_json) for row in rows}
+    
+    async def _save_indicator_states(self, states: Dict[str, IndicatorState]) -> None:
+        """Upsert indicator states for a page of pools in one statement."""
+        if not states:
+            return
+        
+        current_time = datetime.now()
+        rows = [
+            {
+                'pool_id': pool_id,
+                'last_timestamp': state.last_timestamp,
+                'state_json': state.to_dict(),
+                'updated_at': current_time
+            }
+            for pool_id, state in states.items()
+        ]
+        
+        with self.db_manager.connection.get_session() as session:
+            try:
+                if hasattr(self.db_manager, '_create_upsert_statement'):
+                    stmt = self.db_manager._create_upsert_statement(
+                        PoolIndicatorState, rows, ['pool_id'], ['last_timestamp', 'state_json', 'updated_at']
+                    )
+                    session.execute(stmt)
+                else:
+                    # Fallback to per-row merge
+                    for row in rows:
+                        session.merge(PoolIndicatorState(**row))
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+    
     def _calculate_data_quality_score(self, attributes: Dict) -> Decimal:
         """Calculate data quality score (0-100)."""
         try:
@@ -867,31 +1041,27 @@ class EnhancedNewPoolsCollector(NewPoolsCollector):
         try:
             attributes = pool_data.get('attributes', {})
             
-            # Get historical data for feature engineering
-            historical_data = await self._get_pool_historical_data(pool_id, hours=168)  # 7 days
-            
-            # Calculate technical indicators
-            rsi_14 = self._calculate_simple_rsi(historical_data, 
-                                              self._safe_decimal(attributes.get('base_token_price_usd', 0)))
+            # Technical indicators from the streaming indicator state
+            indicators = await self._get_indicator_snapshot(pool_id, attributes)
             
             # Normalize RSI to 0-1 range
-            rsi_normalized = float(rsi_14) / 100.0
+            rsi_normalized = indicators.rsi / 100.0
             
             # Calculate other features
-            volume_24h = float(self._safe_decimal(attributes.get('volume_usd_h24', 0)))
-            liquidity = float(self._safe_decimal(attributes.get('reserve_in_usd', 0)))
+            volume_24h = float(self._safe_decimal(attributes.get('volume_usd_h24', 0), Decimal('0')))
+            liquidity = float(self._safe_decimal(attributes.get('reserve_in_usd', 0), Decimal('0')))
             
             # Calculate advanced features
-            macd_signal = self._calculate_macd(historical_data, self._safe_decimal(attributes.get('base_token_price_usd', 0)))
-            bollinger_position = self._calculate_bollinger_position(historical_data, self._safe_decimal(attributes.get('base_token_price_usd', 0)))
-            volume_sma_ratio = self._calculate_volume_sma_ratio(historical_data, volume_24h)
+            macd_signal = Decimal(str(indicators.macd))
+            bollinger_position = Decimal(str(indicators.bollinger_position))
+            volume_sma_ratio = Decimal(str(indicators.volume_sma_ratio))
             
             # Liquidity features
-            liquidity_stability = self._calculate_liquidity_stability(historical_data)
-            liquidity_growth_rate = self._calculate_liquidity_growth_rate(historical_data)
+            liquidity_stability = Decimal(str(indicators.liquidity_stability))
+            liquidity_growth_rate = Decimal(str(indicators.liquidity_growth_rate))
             
             # Activity features
-            activity_metrics = self._calculate_activity_metrics(attributes, historical_data)
+            activity_metrics = self._calculate_activity_metrics(attributes, [])
             
             # Temporal features
             hour_of_day = current_time.hour
@@ -988,10 +1158,16 @@ class EnhancedNewPoolsCollector(NewPoolsCollector):
         
         watchlist_additions = 0
         
+        # Fetch recent history for the whole page in one query
+        pool_ids = [pool_data.get('id') for pool_data in pools_data if pool_data.get('id')]
+        history_by_pool = await self._get_pools_historical_data(pool_ids, hours=24)
+        
         for pool_data in pools_data:
             try:
                 # Analyze pool signals
-                signal_result = await self._analyze_pool_signals(pool_data)
+                signal_result = await self._analyze_pool_signals(
+                    pool_data, history_by_pool.get(pool_data.get('id'), [])
+                )
                 
                 if signal_result and self.signal_analyzer.should_add_to_watchlist(signal_result):
                     success = await self._handle_auto_watchlist(pool_data, signal_result)
@@ -1004,20 +1180,26 @@ class EnhancedNewPoolsCollector(NewPoolsCollector):
         
         return watchlist_additions
     
-    async def _analyze_pool_signals(self, pool_data: Dict) -> Optional[Any]:
+    async def _analyze_pool_signals(
+        self, 
+        pool_data: Dict, 
+        historical_data: Optional[List[Dict]] = None
+    ) -> Optional[Any]:
         """
         Analyze pool signals using the signal analyzer.
         
         Args:
             pool_data: Pool data from API
+            historical_data: Prefetched history of the pool (fetched if None)
             
         Returns:
             SignalResult or None if analysis fails
         """
         try:
             # Get historical data for better signal analysis
-            pool_id = pool_data.get('id')
-            historical_data = await self._get_pool_historical_data(pool_id, hours=24) if pool_id else []
+            if historical_data is None:
+                pool_id = pool_data.get('id')
+                historical_data = await self._get_pool_historical_data(pool_id, hours=24) if pool_id else []
             
             # Analyze signals - pass attributes as the analyzer expects flattened data
             attributes = pool_data.get('attributes', {})
@@ -33,19 +33,19 @@ class EnhancedNewPoolsHistory(Base):
     
     # Primary identification
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    pool_id = Column(String(200), nullable=False, index=True)
+    pool_id = Column(String(200), nullable=False)
     
     # Time series keys (critical for QLib)
-    timestamp = Column(BigInteger, nullable=False, index=True)  # Unix timestamp for QLib
-    datetime = Column(TIMESTAMP(timezone=True), nullable=False, index=True)  # Human readable
+    timestamp = Column(BigInteger, nullable=False)  # Unix timestamp for QLib
+    datetime = Column(TIMESTAMP(timezone=True), nullable=False)  # Human readable
     collection_interval = Column(String(10), default='1h')  # '1h', '4h', '1d' for different frequencies
     
     # Basic pool information
     type = Column(String(20), default='pool')
     name = Column(String(255))
     address = Column(String(255))
-    network_id = Column(String(50), index=True)
-    dex_id = Column(String(100), index=True)
+    network_id = Column(String(50))
+    dex_id = Column(String(100))
     
     # Token information
     base_token_id = Column(String(255))
@@ -93,7 +93,7 @@ class EnhancedNewPoolsHistory(Base):
     liquidity_depth_usd = Column(Numeric(20, 4))      # Depth of liquidity
     
     # Signal analysis (existing fields enhanced)
-    signal_score = Column(Numeric(10, 4), index=True)
+    signal_score = Column(Numeric(10, 4))
     volume_trend = Column(String(20))
     liquidity_trend = Column(String(20))
     momentum_indicator = Column(Numeric(10, 4))
@@ -124,20 +124,21 @@ class EnhancedNewPoolsHistory(Base):
     collected_at = Column(TIMESTAMP(timezone=True), nullable=False, default=func.now())
     processed_at = Column(TIMESTAMP(timezone=True))   # When processed for ML
     
-    # Indexes optimized for time series and QLib queries
+    # Indexes for the time series and QLib export queries. Every index is
+    # maintained on each insert, so lookups by pool go through the unique
+    # constraint and single-column indexes that a composite index starts with
+    # are left out.
     __table_args__ = (
-        # Unique constraint for time series data
+        # Unique constraint for time series data, also serves pool lookups
         UniqueConstraint('pool_id', 'timestamp', 'collection_interval', 
                         name='uq_enhanced_pools_history_timeseries'),
         
         # Time series indexes
         Index('idx_enhanced_pools_timestamp', 'timestamp'),
         Index('idx_enhanced_pools_datetime', 'datetime'),
-        Index('idx_enhanced_pools_pool_timestamp', 'pool_id', 'timestamp'),
         Index('idx_enhanced_pools_interval_timestamp', 'collection_interval', 'timestamp'),
         
         # QLib optimization indexes
-        Index('idx_enhanced_pools_qlib_symbol', 'qlib_symbol'),
         Index('idx_enhanced_pools_symbol_timestamp', 'qlib_symbol', 'timestamp'),
         
         # Feature-based indexes for ML queries
@@ -151,14 +152,6 @@ class EnhancedNewPoolsHistory(Base):
         # Network and DEX indexes
         Index('idx_enhanced_pools_network_timestamp', 'network_id', 'timestamp'),
         Index('idx_enhanced_pools_dex_timestamp', 'dex_id', 'timestamp'),
-        
-        # New pool tracking
-        Index('idx_enhanced_pools_new_pools', 'is_new_pool', 'timestamp'),
-        Index('idx_enhanced_pools_age', 'pool_age_hours'),
-        
-        # Data quality indexes
-        Index('idx_enhanced_pools_quality', 'data_quality_score'),
-        Index('idx_enhanced_pools_processed', 'processed_at'),
     )
 
 
@@ -228,6 +221,23 @@ class PoolFeatureVector(Base):
     )
 
 
+class PoolIndicatorState(Base):
+    """
+    Streaming technical-indicator state per pool.
+    
+    Holds the running EMAs, Wilder RSI averages and liquidity moments kept
+    by IndicatorEngine, so each collection cycle folds in the newest
+    observation instead of re-reading the pool's history.
+    """
+    
+    __tablename__ = 'pool_indicator_state'
+    
+    pool_id = Column(String(200), primary_key=True)
+    last_timestamp = Column(BigInteger, nullable=False, default=0)  # Latest folded observation
+    state_json = Column(JSONB, nullable=False)  # IndicatorState.to_dict()
+    updated_at = Column(TIMESTAMP(timezone=True), default=func.now(), onupdate=func.now())
+
+
 class QLibDataExport(Base):
     """
     QLib-formatted data export tracking table.
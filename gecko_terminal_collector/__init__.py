@@ -8,12 +8,19 @@ for Solana DEXes with QLib integration support.
 __version__ = "0.1.0"
 __author__ = "GeckoTerminal Collector Team"
 
-# Import main components
-from .qlib import QLibExporter
-from .utils.enhanced_rate_limiter import EnhancedRateLimiter, GlobalRateLimitCoordinator
+from .utils.lazy_imports import lazy_exports
+
+# Main components are imported on first access to keep CLI startup fast
+_LAZY_IMPORTS = {
+    'QLibExporter': '.qlib.exporter',
+    'EnhancedRateLimiter': '.utils.enhanced_rate_limiter',
+    'GlobalRateLimitCoordinator': '.utils.enhanced_rate_limiter',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     'QLibExporter',
     'EnhancedRateLimiter',
     'GlobalRateLimitCoordinator'
-]
\ No newline at end of file
+]
@@ -2,6 +2,22 @@
 Analysis module for signal detection and pattern recognition.
 """
 
-from .signal_analyzer import NewPoolsSignalAnalyzer, SignalResult
+from ..utils.lazy_imports import lazy_exports
 
-__all__ = ['NewPoolsSignalAnalyzer', 'SignalResult']
\ No newline at end of file
+_LAZY_IMPORTS = {
+    'IndicatorEngine': '.indicator_engine',
+    'IndicatorSnapshot': '.indicator_engine',
+    'IndicatorState': '.indicator_engine',
+    'NewPoolsSignalAnalyzer': '.signal_analyzer',
+    'SignalResult': '.signal_analyzer',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
+
+__all__ = [
+    'IndicatorEngine',
+    'IndicatorSnapshot',
+    'IndicatorState',
+    'NewPoolsSignalAnalyzer',
+    'SignalResult',
+]
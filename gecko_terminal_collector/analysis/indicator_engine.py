@@ -0,0 +1,353 @@
+"""
+Incremental technical-indicator engine for new pools history.
+
+Indicators are kept as per-pool streaming state (EMAs, Wilder RSI averages,
+exponentially weighted volume and liquidity moments and a short Bollinger
+price window) so that each collection cycle folds in only the newest
+observation instead of recomputing every indicator from the pool's history.
+State is plain JSON-serializable data and is persisted between cycles.
+
+Pools seen for the first time are backfilled from their stored history in a
+single vectorized NumPy pass that yields exactly the state a sequence of
+incremental updates would have produced.
+"""
+
+import logging
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IndicatorState:
+    """Streaming indicator state of a single pool."""
+    last_timestamp: int = 0
+
+    # Price series (positive prices only)
+    price_count: int = 0
+    last_price: float = 0.0
+    ema_fast: float = 0.0
+    ema_slow: float = 0.0
+    change_count: int = 0
+    avg_gain: float = 0.0
+    avg_loss: float = 0.0
+    price_window: List[float] = field(default_factory=list)
+
+    # Volume series
+    volume_count: int = 0
+    volume_mean: float = 0.0
+
+    # Liquidity series
+    liquidity_count: int = 0
+    liquidity_mean: float = 0.0
+    liquidity_sq_mean: float = 0.0
+    first_liquidity: float = 0.0
+    first_liquidity_timestamp: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize state for persistence."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'IndicatorState':
+        """Restore state, ignoring keys this version does not know."""
+        if not data:
+            return cls()
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+@dataclass
+class IndicatorSnapshot:
+    """Indicator values for a pool at its latest observation."""
+    rsi: float = 50.0
+    macd: float = 0.0
+    bollinger_position: float = 0.5
+    volume_sma_ratio: float = 1.0
+    liquidity_change_percentage: float = 0.0
+    liquidity_stability: float = 0.5
+    liquidity_growth_rate: float = 0.0
+
+
+class IndicatorEngine:
+    """
+    Maintain technical indicators incrementally.
+
+    Each series only takes positive values; missing or zero prices, volumes
+    and liquidity leave the corresponding state untouched. Ratios against a
+    mean (volume SMA ratio, liquidity change, Bollinger position) compare the
+    new observation with the state before it is folded in.
+    """
+
+    def __init__(
+        self,
+        rsi_period: int = 14,
+        macd_fast: int = 12,
+        macd_slow: int = 26,
+        bollinger_period: int = 20,
+        volume_span: int = 24,
+        liquidity_span: int = 24,
+        min_stability_observations: int = 5
+    ):
+        """
+        Initialize the indicator engine.
+
+        Args:
+            rsi_period: Wilder smoothing period of the RSI averages
+            macd_fast: Span of the fast MACD EMA
+            macd_slow: Span of the slow MACD EMA (also the MACD warm-up length)
+            bollinger_period: Price window length of the Bollinger bands
+            volume_span: Span of the volume moving average
+            liquidity_span: Span of the liquidity mean and variance
+            min_stability_observations: Liquidity observations needed for a stability score
+        """
+        self.rsi_period = rsi_period
+        self.macd_fast = macd_fast
+        self.macd_slow = macd_slow
+        self.bollinger_period = bollinger_period
+        self.volume_span = volume_span
+        self.liquidity_span = liquidity_span
+        self.min_stability_observations = min_stability_observations
+
+        self._rsi_alpha = 1.0 / rsi_period
+        self._fast_alpha = 2.0 / (macd_fast + 1)
+        self._slow_alpha = 2.0 / (macd_slow + 1)
+        self._volume_alpha = 2.0 / (volume_span + 1)
+        self._liquidity_alpha = 2.0 / (liquidity_span + 1)
+
+    def update(
+        self,
+        state: IndicatorState,
+        timestamp: int,
+        price: Optional[float] = None,
+        volume: Optional[float] = None,
+        liquidity: Optional[float] = None
+    ) -> IndicatorSnapshot:
+        """
+        Fold one observation into a pool's state in O(1).
+
+        Observations not newer than the state's last timestamp are evaluated
+        against the state but not folded in, so re-running a cycle does not
+        count the same observation twice.
+
+        Args:
+            state: Pool state, updated in place
+            timestamp: Unix timestamp of the observation
+            price: Base token price in USD
+            volume: 24h volume in USD
+            liquidity: Reserve in USD
+
+        Returns:
+            Indicator values at this observation
+        """
+        price = self._positive(price)
+        volume = self._positive(volume)
+        liquidity = self._positive(liquidity)
+
+        snapshot = IndicatorSnapshot(
+            bollinger_position=self._bollinger_position(state.price_window, price),
+            volume_sma_ratio=self._ratio(volume, state.volume_count, state.volume_mean),
+            liquidity_change_percentage=(
+                (self._ratio(liquidity, state.liquidity_count, state.liquidity_mean) - 1.0) * 100.0
+            ),
+        )
+
+        if timestamp > state.last_timestamp:
+            self._fold(state, timestamp, price, volume, liquidity)
+
+        snapshot.rsi = self.rsi(state)
+        snapshot.macd = self.macd(state)
+        snapshot.liquidity_stability = self.liquidity_stability(state)
+        snapshot.liquidity_growth_rate = self._growth_rate(state, timestamp, liquidity)
+        return snapshot
+
+    def backfill(
+        self,
+        timestamps: Sequence[int],
+        prices: Sequence[Optional[float]],
+        volumes: Sequence[Optional[float]],
+        liquidity: Sequence[Optional[float]]
+    ) -> IndicatorState:
+        """
+        Build a pool's state from its history in one vectorized pass.
+
+        The result equals folding the observations in timestamp order with
+        update(); duplicate timestamps keep their first observation.
+
+        Args:
+            timestamps: Unix timestamps of the observations, in any order
+            prices: Base token prices in USD (None or non-positive if missing)
+            volumes: 24h volumes in USD (None or non-positive if missing)
+            liquidity: Reserves in USD (None or non-positive if missing)
+
+        Returns:
+            Indicator state after the last observation
+        """
+        state = IndicatorState()
+        ts = np.asarray(timestamps, dtype=np.int64)
+        if ts.size == 0:
+            return state
+
+        order = np.argsort(ts, kind='stable')
+        ts = ts[order]
+        keep = np.concatenate(([True], ts[1:] > ts[:-1]))
+        ts = ts[keep]
+        state.last_timestamp = int(ts[-1])
+
+        def series(values):
+            array = np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)[order][keep]
+            valid = array > 0
+            return array[valid], ts[valid]
+
+        price_values, _ = series(prices)
+        if price_values.size:
+            state.price_count = int(price_values.size)
+            state.last_price = float(price_values[-1])
+            state.ema_fast = self._ew_final(price_values, self._fast_alpha)
+            state.ema_slow = self._ew_final(price_values, self._slow_alpha)
+            state.price_window = price_values[-self.bollinger_period:].tolist()
+
+            changes = np.diff(price_values)
+            if changes.size:
+                state.change_count = int(changes.size)
+                state.avg_gain = self._ew_final(np.maximum(changes, 0.0), self._rsi_alpha)
+                state.avg_loss = self._ew_final(np.maximum(-changes, 0.0), self._rsi_alpha)
+
+        volume_values, _ = series(volumes)
+        if volume_values.size:
+            state.volume_count = int(volume_values.size)
+            state.volume_mean = self._ew_final(volume_values, self._volume_alpha)
+
+        liquidity_values, liquidity_ts = series(liquidity)
+        if liquidity_values.size:
+            state.liquidity_count = int(liquidity_values.size)
+            state.liquidity_mean = self._ew_final(liquidity_values, self._liquidity_alpha)
+            state.liquidity_sq_mean = self._ew_final(liquidity_values ** 2, self._liquidity_alpha)
+            state.first_liquidity = float(liquidity_values[0])
+            state.first_liquidity_timestamp = int(liquidity_ts[0])
+
+        return state
+
+    def rsi(self, state: IndicatorState) -> float:
+        """Wilder RSI (0-100, 50 when undetermined)."""
+        if state.change_count == 0 or (state.avg_gain == 0 and state.avg_loss == 0):
+            return 50.0
+        if state.avg_loss == 0:
+            return 100.0
+        rs = state.avg_gain / state.avg_loss
+        return min(max(100.0 - 100.0 / (1.0 + rs), 0.0), 100.0)
+
+    def macd(self, state: IndicatorState) -> float:
+        """MACD line, 0 until the slow EMA has warmed up."""
+        if state.price_count < self.macd_slow:
+            return 0.0
+        return state.ema_fast - state.ema_slow
+
+    def liquidity_stability(self, state: IndicatorState) -> float:
+        """Liquidity stability (0-1, 1 - coefficient of variation)."""
+        if state.liquidity_count < self.min_stability_observations or state.liquidity_mean <= 0:
+            return 0.5
+        variance = max(state.liquidity_sq_mean - state.liquidity_mean ** 2, 0.0)
+        cv = variance ** 0.5 / state.liquidity_mean
+        return min(max(1.0 - cv, 0.0), 1.0)
+
+    def _fold(
+        self,
+        state: IndicatorState,
+        timestamp: int,
+        price: Optional[float],
+        volume: Optional[float],
+        liquidity: Optional[float]
+    ) -> None:
+        """Advance state by one observation."""
+        state.last_timestamp = int(timestamp)
+
+        if price is not None:
+            if state.price_count == 0:
+                state.ema_fast = state.ema_slow = price
+            else:
+                change = price - state.last_price
+                gain, loss = max(change, 0.0), max(-change, 0.0)
+                if state.change_count == 0:
+                    state.avg_gain, state.avg_loss = gain, loss
+                else:
+                    state.avg_gain += self._rsi_alpha * (gain - state.avg_gain)
+                    state.avg_loss += self._rsi_alpha * (loss - state.avg_loss)
+                state.change_count += 1
+                state.ema_fast += self._fast_alpha * (price - state.ema_fast)
+                state.ema_slow += self._slow_alpha * (price - state.ema_slow)
+            state.price_count += 1
+            state.last_price = price
+            state.price_window = (state.price_window + [price])[-self.bollinger_period:]
+
+        if volume is not None:
+            state.volume_mean = self._ew_step(state.volume_mean, volume, state.volume_count, self._volume_alpha)
+            state.volume_count += 1
+
+        if liquidity is not None:
+            if state.liquidity_count == 0:
+                state.first_liquidity = liquidity
+                state.first_liquidity_timestamp = int(timestamp)
+            alpha = self._liquidity_alpha
+            state.liquidity_mean = self._ew_step(state.liquidity_mean, liquidity, state.liquidity_count, alpha)
+            state.liquidity_sq_mean = self._ew_step(
+                state.liquidity_sq_mean, liquidity ** 2, state.liquidity_count, alpha
+            )
+            state.liquidity_count += 1
+
+    def _bollinger_position(self, window: List[float], price: Optional[float]) -> float:
+        """Position of a price within the Bollinger bands of the prior window (0-1)."""
+        if price is None or len(window) < self.bollinger_period:
+            return 0.5
+        values = np.asarray(window[-self.bollinger_period:], dtype=np.float64)
+        std = float(values.std())
+        if std == 0:
+            return 0.5
+        lower = float(values.mean()) - 2 * std
+        return min(max((price - lower) / (4 * std), 0.0), 1.0)
+
+    @staticmethod
+    def _growth_rate(state: IndicatorState, timestamp: int, liquidity: Optional[float]) -> float:
+        """Hourly liquidity growth since the pool's first liquidity observation."""
+        if liquidity is None or state.first_liquidity <= 0:
+            return 0.0
+        hours = (timestamp - state.first_liquidity_timestamp) / 3600
+        if hours <= 0:
+            return 0.0
+        return ((liquidity - state.first_liquidity) / state.first_liquidity) / hours
+
+    @staticmethod
+    def _ratio(value: Optional[float], count: int, mean: float) -> float:
+        """Ratio of a value to a running mean, 1.0 when either is missing."""
+        if value is None or count == 0 or mean <= 0:
+            return 1.0
+        return value / mean
+
+    @staticmethod
+    def _ew_step(mean: float, value: float, count: int, alpha: float) -> float:
+        """One exponentially weighted step, seeded by the first value."""
+        if count == 0:
+            return value
+        return mean + alpha * (value - mean)
+
+    @staticmethod
+    def _ew_final(values: np.ndarray, alpha: float) -> float:
+        """Final value of an exponentially weighted recursion seeded by values[0]."""
+        n = values.size
+        weights = alpha * np.power(1.0 - alpha, np.arange(n - 1, -1, -1, dtype=np.float64))
+        weights[0] = (1.0 - alpha) ** (n - 1)
+        return float(np.dot(weights, values))
+
+    @staticmethod
+    def _positive(value: Optional[float]) -> Optional[float]:
+        """Coerce a value to a positive float or None."""
+        if value is None:
+            return None
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return None
+        return value if value > 0 else None
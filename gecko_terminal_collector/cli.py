@@ -293,6 +293,60 @@ def _add_db_health_command(subparsers):
     health_parser.set_defaults(func=db_health_command)
 
 
+def _add_db_index_audit_command(subparsers):
+    """Add db-index-audit command parser."""
+    audit_parser = subparsers.add_parser(
+        'db-index-audit',
+        help='Audit database indexes against the collector query workload',
+        description='Record the queries of the hot database reads, explain them and report '
+                    'full scans, unused or redundant indexes and index write costs'
+    )
+    audit_parser.add_argument(
+        '--pools',
+        type=int,
+        default=5,
+        help='Number of watchlist pools the workload reads (default: 5)'
+    )
+    audit_parser.add_argument(
+        '--hours',
+        type=int,
+        default=24,
+        help='Length of the workload read windows in hours (default: 24)'
+    )
+    audit_parser.add_argument(
+        '--timeframe',
+        default='1h',
+        help='OHLCV timeframe of the workload (default: 1h)'
+    )
+    audit_parser.add_argument(
+        '--no-analyze',
+        action='store_true',
+        help='Use EXPLAIN without ANALYZE on PostgreSQL'
+    )
+    audit_parser.add_argument(
+        '--drop-unused',
+        action='store_true',
+        help='Suggest dropping indexes no workload query used'
+    )
+    audit_parser.add_argument(
+        '--write-migration',
+        metavar='VERSIONS_DIR',
+        help='Write the suggestions as the next Alembic migration in this directory'
+    )
+    audit_parser.add_argument(
+        '--format',
+        choices=['table', 'json'],
+        default='table',
+        help='Output format (default: table)'
+    )
+    audit_parser.add_argument(
+        '--config', '-c',
+        default='config.yaml',
+        help='Configuration file path'
+    )
+    audit_parser.set_defaults(func=db_index_audit_command)
+
+
 def _add_db_monitor_command(subparsers):
     """Add db-monitor command parser."""
     monitor_parser = subparsers.add_parser(
@@ -662,6 +716,7 @@ Examples:
   gecko-cli analyze-pool-discovery --days 7 --format json
   gecko-cli db-health --test-connectivity --test-performance
   gecko-cli db-monitor --interval 30 --duration 60
+  gecko-cli db-index-audit --pools 10 --write-migration migrations/versions
   gecko-cli analyze-pool-signals --network solana --hours 24 --min-signal-score 70
   gecko-cli monitor-pool-signals --network solana --alert-threshold 80 --interval 300
         """
@@ -692,6 +747,13 @@ Examples:
         help="Suppress non-error output"
     )
     
+    parser.add_argument(
+        "--async-logging",
+        action="store_true",
+        help="Format and write logs on a background thread, sample noisy debug/info "
+             "call sites and route collector diagnostics through logging"
+    )
+    
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
     # System setup and configuration commands
@@ -744,6 +806,7 @@ Examples:
     # Database health and monitoring commands
     _add_db_health_command(subparsers)
     _add_db_monitor_command(subparsers)
+    _add_db_index_audit_command(subparsers)
     
     args = parser.parse_args()
     
@@ -753,7 +816,18 @@ Examples:
     
     # Set up logging level based on verbosity
     import logging
-    if args.quiet:
+    if args.async_logging:
+        from gecko_terminal_collector.utils.structured_logging import (
+            LogSamplingConfig, logging_manager
+        )
+        logging_manager.setup_logging(
+            log_level="ERROR" if args.quiet else ("DEBUG" if args.verbose else "INFO"),
+            structured_format=False,
+            async_logging=True,
+            sampling=LogSamplingConfig(),
+            route_stdout_diagnostics=True
+        )
+    elif args.quiet:
         logging.basicConfig(level=logging.ERROR)
     elif args.verbose:
         logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -789,6 +863,7 @@ Examples:
         "analyze-pool-discovery": analyze_pool_discovery_command,
         "db-health": db_health_command,
         "db-monitor": db_monitor_command,
+        "db-index-audit": db_index_audit_command,
         "analyze-pool-signals": analyze_pool_signals_command,
         "monitor-pool-signals": monitor_pool_signals_command,
     }
@@ -899,6 +974,48 @@ def _add_start_command(subparsers):
         type=str,
         help="Write process ID to file"
     )
+    _add_profile_arguments(start_parser)
+
+
+def _add_profile_arguments(command_parser):
+    """Add span tracing and sampling profiler options to a command parser."""
+    command_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Trace API, rate limiter, parse/validate and database spans and log a summary per collection cycle "
+             "(toggle at runtime with SIGUSR1)"
+    )
+    command_parser.add_argument(
+        "--profile-dir",
+        type=str,
+        help="Write per-cycle folded stacks and sampling profiler dumps to this directory"
+    )
+    command_parser.add_argument(
+        "--profile-sample",
+        action="store_true",
+        help="Also run the sampling profiler for the whole run (toggle at runtime with SIGUSR2)"
+    )
+
+
+def _start_profiling(args) -> None:
+    """Enable tracing and the sampling profiler as requested on the command line."""
+    from gecko_terminal_collector.monitoring.tracing import tracer
+    
+    if args.profile:
+        tracer.enable(output_dir=args.profile_dir)
+    elif args.profile_dir:
+        tracer.output_dir = args.profile_dir
+    if args.profile_sample:
+        tracer.start_sampling()
+
+
+def _stop_profiling() -> None:
+    """Dump the sampling profiler if it is still running."""
+    from gecko_terminal_collector.monitoring.tracing import tracer
+    
+    dump_path = tracer.stop_sampling()
+    if dump_path:
+        print(f"Sampling profile written to {dump_path}")
 
 
 def _add_stop_command(subparsers):
@@ -957,6 +1074,7 @@ def _add_run_collector_command(subparsers):
         action="store_true",
         help="Show what would be collected without storing data"
     )
+    _add_profile_arguments(run_parser)
     run_parser.add_argument(
         "--network",
         type=str,
@@ -1540,12 +1658,34 @@ async def start_command(args):
         
         print("Starting GeckoTerminal Data Collector...")
         
+        from gecko_terminal_collector.monitoring.tracing import tracer
+        _start_profiling(args)
+        tracer.install_signal_handlers()
+        
         # Initialize database
         db_manager = SQLAlchemyDatabaseManager(config.database)
         await db_manager.initialize()
         
-        # Create scheduler
-        scheduler = CollectionScheduler(config)
+        # Monitoring records are queued and written in batches by the scheduler
+        from gecko_terminal_collector.monitoring.database_manager import create_monitoring_db_manager
+        monitoring_db_manager = create_monitoring_db_manager(db_manager, config.monitoring)
+        
+        # Create scheduler; with sharding enabled, nodes sharing the database
+        # split collector work and the API quota between them
+        from gecko_terminal_collector.scheduling.scheduler import SchedulerConfig
+        from gecko_terminal_collector.utils.enhanced_rate_limiter import GlobalRateLimitCoordinator
+        rate_limit_coordinator = await GlobalRateLimitCoordinator.get_instance(
+            config.rate_limiting.requests_per_minute,
+            config.rate_limiting.daily_limit,
+            config.rate_limiting.state_file_dir
+        )
+        scheduler = CollectionScheduler(
+            config,
+            scheduler_config=SchedulerConfig.from_collection_config(config),
+            monitoring_db_manager=monitoring_db_manager,
+            db_manager=db_manager,
+            rate_limit_coordinator=rate_limit_coordinator
+        )
         
         # Register collectors based on configuration
         await _register_collectors(scheduler, config, db_manager, args.collectors)
@@ -1581,6 +1721,7 @@ async def start_command(args):
             finally:
                 await scheduler.stop()
                 await db_manager.close()
+                _stop_profiling()
         
         return 0
         
@@ -1805,7 +1946,13 @@ async def run_collector_command(args):
             print("DRY RUN: No data will be stored")
             # This would need special handling in collectors
         
-        result = await collector.collect()
+        from gecko_terminal_collector.monitoring.tracing import tracer
+        _start_profiling(args)
+        try:
+            with tracer.cycle(args.collector_type):
+                result = await collector.collect()
+        finally:
+            _stop_profiling()
         
         if result.success:
             print(f"✓ Collection completed successfully")
@@ -2282,19 +2429,7 @@ async def build_ohlcv_command(args):
         # Step 1: Find the watchlist item
         print("Step 1: Locating watchlist item (this could take awhile)...")
         watchlist_processor = WatchlistProcessor(config)
-        watchlist_items = await watchlist_processor.load_watchlist()
-
-        print("--_build_ohlcv_command (from database)--")
-        print(watchlist_items)
-        print("--")
-        
-        target_item = None
-        for item in watchlist_items:
-            if (item.get('tokenSymbol', '').lower() == args.watchlist_item.lower() or
-                item.get('poolAddress', '') == args.watchlist_item or
-                item.get('networkAddress', '') == args.watchlist_item):
-                target_item = item
-                break
+        target_item = await watchlist_processor.find_watchlist_item(args.watchlist_item)
         
         if not target_item:
             print(f"✗ Watchlist item '{args.watchlist_item}' not found")
@@ -3793,6 +3928,59 @@ async def db_health_command(args):
         return 1
 
 
+async def db_index_audit_command(args):
+    """Audit database indexes against the collector query workload."""
+    try:
+        from gecko_terminal_collector.config.manager import ConfigManager
+        from gecko_terminal_collector.database.enhanced_sqlalchemy_manager import EnhancedSQLAlchemyDatabaseManager
+        from gecko_terminal_collector.database.index_advisor import IndexAdvisor, run_workload, write_migration
+        import json
+        
+        print("🔍 Auditing database indexes...")
+        
+        # Load configuration
+        manager = ConfigManager(args.config)
+        config = manager.load_config()
+        
+        db_manager = EnhancedSQLAlchemyDatabaseManager(config.database)
+        await db_manager.initialize()
+        
+        try:
+            pool_ids = (await db_manager.get_watchlist_pools())[:args.pools]
+            if not pool_ids:
+                print("⚠️  No watchlist pools found, the workload only reads empty ranges")
+            
+            advisor = IndexAdvisor(db_manager, analyze=not args.no_analyze)
+            print(f"📊 Recording workload for {len(pool_ids)} pools...")
+            with advisor.record():
+                await run_workload(db_manager, pool_ids, timeframe=args.timeframe, hours=args.hours)
+            
+            report = advisor.audit(
+                extra_tables=['new_pools_history_enhanced'], drop_unused=args.drop_unused
+            )
+            
+            if args.format == 'json':
+                print(json.dumps(report.to_dict(), indent=2, default=str))
+            else:
+                print(report.format_summary())
+            
+            if args.write_migration:
+                if report.suggestions:
+                    path = write_migration(report.suggestions, args.write_migration, dialect=report.dialect)
+                    print(f"\n✅ Wrote migration {path}")
+                else:
+                    print("\n✅ No index changes suggested, no migration written")
+        
+        finally:
+            await db_manager.close()
+        
+        return 0
+        
+    except Exception as e:
+        print(f"❌ Failed to audit database indexes: {e}")
+        return 1
+
+
 async def db_monitor_command(args):
     """Start database health monitoring."""
     try:
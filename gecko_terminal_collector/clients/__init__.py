@@ -2,8 +2,17 @@
 API clients for GeckoTerminal data collection.
 """
 
-from .gecko_client import GeckoTerminalClient, MockGeckoTerminalClient, BaseGeckoClient
-from .factory import create_gecko_client, create_async_gecko_client
+from ..utils.lazy_imports import lazy_exports
+
+_LAZY_IMPORTS = {
+    "GeckoTerminalClient": ".gecko_client",
+    "MockGeckoTerminalClient": ".gecko_client",
+    "BaseGeckoClient": ".gecko_client",
+    "create_gecko_client": ".factory",
+    "create_async_gecko_client": ".factory",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "GeckoTerminalClient", 
@@ -11,4 +20,4 @@ __all__ = [
     "BaseGeckoClient",
     "create_gecko_client",
     "create_async_gecko_client"
-]
\ No newline at end of file
+]
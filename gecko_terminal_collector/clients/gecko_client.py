@@ -13,7 +13,10 @@ from typing import Any, Dict, List, Optional, Union
 from decimal import Decimal
 
 import aiohttp
+import pandas as pd
 from geckoterminal_py import GeckoTerminalAsyncClient
+from geckoterminal_py import constants as SDK_CONSTANTS
+from glom import glom
 
 from ..config.models import APIConfig, ErrorConfig
 from ..models.core import Pool, Token, OHLCVRecord, TradeRecord
@@ -161,8 +164,10 @@ class GeckoTerminalClient(BaseGeckoClient):
             error_config.circuit_breaker_timeout
         )
         
-        # Initialize the underlying SDK client
+        # Initialize the underlying SDK client, honouring a non-default base URL
+        # (e.g. the local replay server used for benchmarks)
         self._sdk_client = GeckoTerminalAsyncClient()
+        self._sdk_client.base_url = api_config.base_url.rstrip('/')
         
         # Session for direct API calls
         self._session: Optional[aiohttp.ClientSession] = None
@@ -224,14 +229,38 @@ class GeckoTerminalClient(BaseGeckoClient):
                 if attempt == self.error_config.max_retries:
                     break
                 
-                # Calculate backoff delay
-                delay = self.error_config.backoff_factor ** attempt
+                # Calculate backoff delay, preferring the server's Retry-After on 429
+                delay = self._get_retry_after(e)
+                if delay is None:
+                    delay = self.error_config.backoff_factor ** attempt
                 await asyncio.sleep(delay)
         
         # All retries exhausted
         logger.error(f"All retries exhausted for API call: {last_exception}")
         raise last_exception
     
+    @staticmethod
+    def _get_retry_after(error: Exception) -> Optional[float]:
+        """
+        Extract the Retry-After delay from a 429 error raised by the SDK or aiohttp.
+        
+        Args:
+            error: Exception raised by the API call
+            
+        Returns:
+            Delay in seconds, or None if the error is not a rate limit response
+        """
+        response = getattr(error, 'response', None)
+        status = getattr(response, 'status_code', None) or getattr(error, 'status', None)
+        if status != 429:
+            return None
+        
+        headers = getattr(response, 'headers', None) or getattr(error, 'headers', None) or {}
+        try:
+            return float(headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
+    
     async def get_networks(self) -> Any:
         """Get available networks."""
         async def _get_networks():
@@ -249,19 +278,42 @@ class GeckoTerminalClient(BaseGeckoClient):
     async def get_top_pools_by_network(self, network: str, page: int = 1) -> Any:
         """Get top pools by network."""
         async def _get_top_pools():
-            # SDK doesn't support pagination, ignore page parameter
-            return await self._sdk_client.get_top_pools_by_network(network)
+            return await self._get_pools_page(
+                SDK_CONSTANTS.GET_TOP_POOLS_BY_NETWORK_PATH.format(network), page
+            )
         
         return await self._execute_with_retry(_get_top_pools)
     
     async def get_top_pools_by_network_dex(self, network: str, dex: str, page: int = 1) -> Any:
         """Get top pools by network and DEX."""
         async def _get_top_pools_dex():
-            # SDK doesn't support pagination, ignore page parameter
-            return await self._sdk_client.get_top_pools_by_network_dex(network, dex)
+            return await self._get_pools_page(
+                SDK_CONSTANTS.GET_TOP_POOLS_BY_NETWORK_DEX_PATH.format(network, dex), page
+            )
         
         return await self._execute_with_retry(_get_top_pools_dex)
     
+    async def _get_pools_page(self, path: str, page: int) -> pd.DataFrame:
+        """
+        Fetch one page of a pools list endpoint.
+        
+        The SDK's pools methods take no page argument, so the request goes
+        through its api_request with the page query parameter and is shaped
+        the same way as the SDK methods' DataFrame results.
+        
+        Args:
+            path: API path of the pools list endpoint
+            page: Page number to fetch (1-based)
+            
+        Returns:
+            DataFrame of pools, empty once past the last page
+        """
+        response = await self._sdk_client.api_request("GET", path, params={"page": page})
+        pools_list = glom(response, SDK_CONSTANTS.POOL_SPEC)
+        if not pools_list:
+            return pd.DataFrame()
+        return self._sdk_client.process_pools_list(pools_list)
+    
     async def get_multiple_pools_by_network(self, network: str, addresses: List[str]) -> Any:
         """Get multiple pools by their addresses."""
         async def _get_multiple_pools():
@@ -488,9 +540,13 @@ class MockGeckoTerminalClient(BaseGeckoClient):
         else:
             pools_data = []
         
-        return self._format_pools_response(pools_data)
+        # Each fixture holds a single recorded page
+        if page != 1:
+            pools_data = []
+        
+        return self._format_pools_response(pools_data, page)
     
-    def _format_pools_response(self, pools_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _format_pools_response(self, pools_data: List[Dict[str, Any]], page: int = 1) -> Dict[str, Any]:
         """Format pools data to match API response structure."""
         formatted_pools = []
         
@@ -552,7 +608,7 @@ class MockGeckoTerminalClient(BaseGeckoClient):
             "data": formatted_pools,
             "meta": {
                 "page": {
-                    "current": 1,
+                    "current": page,
                     "total": 1
                 }
             }
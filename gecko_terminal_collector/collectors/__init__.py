@@ -2,14 +2,21 @@
 Data collectors for different types of GeckoTerminal data.
 """
 
-from .base import BaseDataCollector, CollectorRegistry
-from .dex_monitoring import DEXMonitoringCollector
-from .top_pools import TopPoolsCollector
-from .watchlist_monitor import WatchlistMonitor
-from .watchlist_collector import WatchlistCollector
-from .ohlcv_collector import OHLCVCollector
-from .trade_collector import TradeCollector
-from .discovery_engine import DiscoveryEngine
+from ..utils.lazy_imports import lazy_exports
+
+_LAZY_IMPORTS = {
+    "BaseDataCollector": ".base",
+    "CollectorRegistry": ".base",
+    "DEXMonitoringCollector": ".dex_monitoring",
+    "TopPoolsCollector": ".top_pools",
+    "WatchlistMonitor": ".watchlist_monitor",
+    "WatchlistCollector": ".watchlist_collector",
+    "OHLCVCollector": ".ohlcv_collector",
+    "TradeCollector": ".trade_collector",
+    "DiscoveryEngine": ".discovery_engine",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "BaseDataCollector",
@@ -21,4 +28,4 @@ __all__ = [
     "OHLCVCollector",
     "TradeCollector",
     "DiscoveryEngine"
-]
\ No newline at end of file
+]
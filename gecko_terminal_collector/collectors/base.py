@@ -5,11 +5,12 @@ Base collector interface and common functionality.
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
 
 from gecko_terminal_collector.models.core import CollectionResult, ValidationResult
 from gecko_terminal_collector.config.models import CollectionConfig
 from gecko_terminal_collector.database.manager import DatabaseManager
+from gecko_terminal_collector.monitoring.tracing import instrument_methods, traced, tracer
 from gecko_terminal_collector.clients import BaseGeckoClient, create_gecko_client
 from gecko_terminal_collector.utils.error_handling import ErrorHandler, RetryConfig
 from gecko_terminal_collector.utils.metadata import MetadataTracker
@@ -17,6 +18,7 @@ from gecko_terminal_collector.utils.structured_logging import get_logger, LogCon
 from gecko_terminal_collector.utils.resilience import HealthChecker, HealthStatus
 from gecko_terminal_collector.utils.enhanced_rate_limiter import EnhancedRateLimiter
 from gecko_terminal_collector.utils.data_normalizer import DataTypeNormalizer
+from gecko_terminal_collector.scheduling.leases import pool_shard
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,10 @@ except ImportError:
     SYMBOL_MAPPER_AVAILABLE = False
 
 
+def _is_traced_collector_method(name: str) -> bool:
+    return name == "make_api_request" or name.lstrip("_").startswith(("parse", "validate"))
+
+
 class BaseDataCollector(ABC):
     """
     Abstract base class for all data collectors.
@@ -38,6 +44,18 @@ class BaseDataCollector(ABC):
     handling, retry logic, and metadata tracking.
     """
     
+    # Collectors that only work on watchlist pools can be split into pool
+    # shards and spread across nodes by a sharded scheduler
+    supports_pool_sharding = False
+    _pool_shards: Optional[FrozenSet[int]] = None
+    _pool_shard_count = 1
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Trace API requests, parsing and validation of every collector;
+        # the wrappers are a single flag check while tracing is disabled.
+        instrument_methods(cls, _is_traced_collector_method)
+    
     def __init__(
         self,
         config: CollectionConfig,
@@ -121,6 +139,34 @@ class BaseDataCollector(ABC):
         """
         self.rate_limiter = rate_limiter
     
+    def set_pool_shards(self, shards: Optional[Iterable[int]], shard_count: int = 1) -> None:
+        """
+        Restrict collection to the watchlist pools of the given shards.
+        
+        Args:
+            shards: Pool shards assigned to this node, or None for all pools
+            shard_count: Total number of pool shards
+        """
+        self._pool_shards = frozenset(shards) if shards is not None else None
+        self._pool_shard_count = shard_count
+    
+    def filter_owned_pools(self, pool_ids: List[str]) -> List[str]:
+        """
+        Filter pools down to the assigned pool shards.
+        
+        Args:
+            pool_ids: Pool IDs to filter
+            
+        Returns:
+            Pool IDs in the assigned shards (all of them when not sharded)
+        """
+        if self._pool_shards is None:
+            return list(pool_ids)
+        return [
+            pool_id for pool_id in pool_ids
+            if pool_shard(pool_id, self._pool_shard_count) in self._pool_shards
+        ]
+    
     def generate_symbol(self, pool) -> str:
         """
         Generate consistent symbol for a pool across all collectors.
@@ -228,57 +274,59 @@ class BaseDataCollector(ABC):
         Returns:
             CollectionResult with details about the collection operation
         """
-        start_time = datetime.now()
-        errors: List[str] = []
-        records_collected = 0
+        with tracer.cycle(self.get_collection_key()):
+            start_time = datetime.now()
+            errors: List[str] = []
+            records_collected = 0
         
-        try:
-            # Execute collection with retry and circuit breaker
-            result = await self.error_handler.with_retry(
-                self.collect,
-                context=f"{self.get_collection_key()} collection",
-                circuit_breaker_name=self.get_collection_key(),
-                collector_type=self.get_collection_key()
-            )
+            try:
+                # Execute collection with retry and circuit breaker
+                result = await self.error_handler.with_retry(
+                    self.collect,
+                    context=f"{self.get_collection_key()} collection",
+                    circuit_breaker_name=self.get_collection_key(),
+                    collector_type=self.get_collection_key()
+                )
             
-            # Store collection metadata if using enhanced database manager
-            if hasattr(self.db_manager, 'store_collection_run'):
-                try:
-                    await self.db_manager.store_collection_run(
-                        self.get_collection_key(), 
-                        result
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to store collection metadata: {e}")
+                # Store collection metadata if using enhanced database manager
+                if hasattr(self.db_manager, 'store_collection_run'):
+                    try:
+                        await self.db_manager.store_collection_run(
+                            self.get_collection_key(), 
+                            result
+                        )
+                    except Exception as e:
+                        logger.warning(f"Failed to store collection metadata: {e}")
             
-            # Update metadata tracker
-            if self.metadata_tracker:
-                self.metadata_tracker.update_metadata(result)
+                # Update metadata tracker
+                if self.metadata_tracker:
+                    self.metadata_tracker.update_metadata(result)
             
-            return result
+                return result
             
-        except Exception as e:
-            # Handle collection failure
-            error_msg = f"Collection failed: {str(e)}"
-            errors.append(error_msg)
+            except Exception as e:
+                # Handle collection failure
+                error_msg = f"Collection failed: {str(e)}"
+                errors.append(error_msg)
             
-            self.handle_error(e, "collection execution")
+                self.handle_error(e, "collection execution")
             
-            # Create failure result
-            result = CollectionResult(
-                success=False,
-                records_collected=records_collected,
-                errors=errors,
-                collection_time=start_time,
-                collector_type=self.get_collection_key()
-            )
+                # Create failure result
+                result = CollectionResult(
+                    success=False,
+                    records_collected=records_collected,
+                    errors=errors,
+                    collection_time=start_time,
+                    collector_type=self.get_collection_key()
+                )
             
-            # Update metadata tracker with failure
-            if self.metadata_tracker:
-                self.metadata_tracker.update_metadata(result)
+                # Update metadata tracker with failure
+                if self.metadata_tracker:
+                    self.metadata_tracker.update_metadata(result)
             
-            return result
+                return result
     
+    @traced()
     async def validate_data(self, data: Any) -> ValidationResult:
         """
         Validate collected data before storage.
@@ -342,6 +390,7 @@ class BaseDataCollector(ABC):
             collector_type=self.get_collection_key()
         )
     
+    @traced()
     async def make_api_request(self, request_func, *args, **kwargs) -> Any:
         """
         Make an API request with rate limiting and error handling.
@@ -355,11 +404,13 @@ class BaseDataCollector(ABC):
             API response data
         """
         # Acquire rate limit permission
-        await self.rate_limiter.acquire()
+        with tracer.span("rate_limiter.acquire"):
+            await self.rate_limiter.acquire()
         
         try:
             # Make the API request
-            response = await request_func(*args, **kwargs)
+            with tracer.span(f"api.{getattr(request_func, '__name__', 'request')}"):
+                response = await request_func(*args, **kwargs)
             return response
         except Exception as e:
             # Handle rate limit responses
@@ -367,7 +418,7 @@ class BaseDataCollector(ABC):
                 if e.response.status_code == 429:
                     # Extract retry-after header if available
                     retry_after = e.response.headers.get('Retry-After', '60')
-                    self.rate_limiter.handle_rate_limit_response({'Retry-After': retry_after})
+                    await self.rate_limiter.handle_rate_limit_response({'Retry-After': retry_after})
             raise
     
     def normalize_response_data(self, data: Any) -> List[Dict]:
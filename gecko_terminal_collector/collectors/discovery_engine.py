@@ -6,10 +6,11 @@ the automatic discovery of DEXes, pools, and tokens following the natural
 data dependency flow: DEXes → Pools → Tokens → OHLCV/Trades.
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 from decimal import Decimal
 
 from gecko_terminal_collector.config.models import CollectionConfig
@@ -17,6 +18,7 @@ from gecko_terminal_collector.database.manager import DatabaseManager
 from gecko_terminal_collector.database.models import DEX, Pool, Token
 from gecko_terminal_collector.clients import BaseGeckoClient
 from gecko_terminal_collector.utils.activity_scorer import ActivityScorer, ActivityMetrics
+from gecko_terminal_collector.utils.data_normalizer import DataTypeNormalizer
 from gecko_terminal_collector.models.core import CollectionResult
 
 logger = logging.getLogger(__name__)
@@ -91,6 +93,12 @@ class DiscoveryEngine:
         2. Discover and populate pools from DEXes
         3. Extract and populate tokens from pools
         
+        Steps 2 and 3 run as a pipeline: DEXes are paged through concurrently
+        (bounded by ``api.max_concurrent`` in-flight requests on the shared
+        client), and each page of filtered pools and its new tokens is stored
+        in bulk before the next page is fetched, so memory stays bounded and
+        data lands in the database as soon as the first page arrives.
+        
         Returns:
             DiscoveryResult with bootstrap statistics
         """
@@ -119,44 +127,39 @@ class DiscoveryEngine:
                     execution_time_seconds=(datetime.now() - start_time).total_seconds()
                 )
             
-            # Step 2: Discover pools from DEXes
-            self.logger.info("Step 2: Discovering pools from DEXes")
-            all_pools = []
-            dex_ids = [dex.id for dex in dexes if dex.id]
+            # Step 2: Discover pools from DEXes concurrently, handing each page of
+            # pools and their tokens (step 3) to bulk storage as it arrives
+            self.logger.info("Step 2: Discovering pools and tokens from DEXes")
+            dex_networks = {dex.id: dex.network for dex in dexes if dex.id}
+            semaphore = asyncio.Semaphore(max(1, self.config.api.max_concurrent))
+            seen_token_ids: Set[str] = set()
+            
+            results = await asyncio.gather(
+                *(
+                    self._bootstrap_dex(dex_id, network, semaphore, seen_token_ids)
+                    for dex_id, network in dex_networks.items()
+                ),
+                return_exceptions=True
+            )
             
-            for dex_id in dex_ids:
-                try:
-                    dex_pools = await self.discover_pools([dex_id])
-                    if dex_pools:
-                        all_pools.extend(dex_pools)
-                        self.logger.info(f"Discovered {len(dex_pools)} pools from DEX {dex_id}")
-                except Exception as e:
-                    error_msg = f"Failed to discover pools from DEX {dex_id}: {str(e)}"
+            for dex_id, result in zip(dex_networks, results):
+                if isinstance(result, Exception):
+                    error_msg = f"Failed to discover pools from DEX {dex_id}: {str(result)}"
                     errors.append(error_msg)
                     self.logger.error(error_msg)
                     continue
+                
+                dex_pools, dex_tokens = result
+                total_pools += dex_pools
+                total_tokens += dex_tokens
             
-            if all_pools:
-                total_pools = len(all_pools)
-                self.logger.info(f"Total pools discovered: {total_pools}")
+            if total_pools:
+                self.logger.info(f"Total pools discovered: {total_pools}, tokens: {total_tokens}")
             else:
                 error_msg = "No pools discovered during bootstrap"
                 errors.append(error_msg)
                 self.logger.warning(error_msg)
             
-            # Step 3: Extract tokens from pools
-            if all_pools:
-                self.logger.info("Step 3: Extracting tokens from pools")
-                try:
-                    tokens = await self.extract_tokens(all_pools)
-                    if tokens:
-                        total_tokens = len(tokens)
-                        self.logger.info(f"Extracted {total_tokens} tokens")
-                except Exception as e:
-                    error_msg = f"Failed to extract tokens: {str(e)}"
-                    errors.append(error_msg)
-                    self.logger.error(error_msg)
-            
             execution_time = (datetime.now() - start_time).total_seconds()
             
             self.logger.info(
@@ -187,6 +190,133 @@ class DiscoveryEngine:
                 errors=errors
             )
     
+    async def _bootstrap_dex(
+        self,
+        dex_id: str,
+        network: Optional[str],
+        semaphore: asyncio.Semaphore,
+        seen_token_ids: Set[str]
+    ) -> Tuple[int, int]:
+        """
+        Page through a DEX's top pools, storing pools and tokens per page.
+        
+        Paging stops at ``max_pages_per_dex``, on an empty page, on a page
+        that only repeats pools already seen, or once ``max_pools_per_dex``
+        pools have passed the filters.
+        
+        Args:
+            dex_id: DEX identifier
+            network: Network identifier, looked up from the DEX if missing
+            semaphore: Bounds concurrent API requests across DEXes
+            seen_token_ids: Token IDs already handled by any DEX in this bootstrap
+            
+        Returns:
+            Tuple of (pools stored, tokens extracted)
+        """
+        network = network or await self._get_network_for_dex(dex_id)
+        if not network:
+            self.logger.warning(f"Could not determine network for DEX {dex_id}")
+            return 0, 0
+        
+        max_pools = self.config.discovery.max_pools_per_dex
+        seen_pool_ids: Set[str] = set()
+        pools_stored = 0
+        tokens_extracted = 0
+        
+        for page in range(1, self.config.discovery.max_pages_per_dex + 1):
+            async with semaphore:
+                pools_data = await self._discover_pools_by_dex(network, dex_id, page)
+            
+            new_pools_data = [
+                pool_data for pool_data in pools_data
+                if pool_data.get('id') and pool_data['id'] not in seen_pool_ids
+            ]
+            if not new_pools_data:
+                break
+            seen_pool_ids.update(pool_data['id'] for pool_data in new_pools_data)
+            
+            page_pools = [
+                pool for pool in (self._build_pool(pool_data, dex_id) for pool_data in new_pools_data)
+                if pool
+            ]
+            filtered_pools = (await self.apply_filters(page_pools))[:max_pools - pools_stored]
+            
+            if filtered_pools:
+                await self._store_discovered_pools(filtered_pools)
+                pools_stored += len(filtered_pools)
+                tokens_extracted += await self._store_pool_tokens(
+                    filtered_pools, network, semaphore, seen_token_ids
+                )
+            
+            self.logger.info(
+                f"DEX {dex_id} page {page}: {len(new_pools_data)} found, "
+                f"{len(filtered_pools)} after filtering"
+            )
+            
+            if pools_stored >= max_pools:
+                break
+        
+        self.logger.info(f"Discovered {pools_stored} pools from DEX {dex_id}")
+        return pools_stored, tokens_extracted
+    
+    async def _store_discovered_pools(self, pools: List[Pool]) -> None:
+        """
+        Bulk store filtered pools along with their activity scores and priorities.
+        
+        Args:
+            pools: Filtered Pool objects from apply_filters
+        """
+        await self.db_manager.store_pools(pools)
+        await self.db_manager.update_pool_activity_scores({
+            pool.id: pool.activity_score for pool in pools if pool.activity_score is not None
+        })
+        await self.db_manager.update_pool_priorities({
+            pool.id: pool.collection_priority for pool in pools if pool.collection_priority
+        })
+    
+    async def _store_pool_tokens(
+        self,
+        pools: List[Pool],
+        network: str,
+        semaphore: asyncio.Semaphore,
+        seen_token_ids: Set[str]
+    ) -> int:
+        """
+        Extract tokens not seen yet from a page of pools and bulk store them.
+        
+        Args:
+            pools: Pools whose base and quote tokens to extract
+            network: Network the pools belong to
+            semaphore: Bounds concurrent API requests across DEXes
+            seen_token_ids: Token IDs already handled, updated in place
+            
+        Returns:
+            Number of tokens extracted, including ones already in the database
+        """
+        new_tokens = []
+        existing_count = 0
+        
+        for pool in pools:
+            for token_id in (pool.base_token_id, pool.quote_token_id):
+                if not token_id or token_id in seen_token_ids:
+                    continue
+                seen_token_ids.add(token_id)
+                
+                try:
+                    if await self.db_manager.get_token_by_id(token_id):
+                        existing_count += 1
+                        continue
+                    
+                    async with semaphore:
+                        new_tokens.append(await self._build_token(token_id, network))
+                except Exception as e:
+                    self.logger.error(f"Error extracting token {token_id} from pool {pool.id}: {e}")
+        
+        if new_tokens:
+            await self.db_manager.store_tokens(new_tokens)
+        
+        return existing_count + len(new_tokens)
+    
     async def discover_dexes(self) -> List[DEX]:
         """
         Discover and populate DEX information from configured networks.
@@ -456,30 +586,27 @@ class DiscoveryEngine:
             self.logger.error(f"Error processing DEX data: {e}")
             return None
     
-    async def _discover_pools_by_dex(self, network: str, dex_id: str) -> List[Dict[str, Any]]:
+    async def _discover_pools_by_dex(self, network: str, dex_id: str, page: int = 1) -> List[Dict[str, Any]]:
         """
         Discover pools for a specific DEX using API.
         
         Args:
             network: Network identifier
             dex_id: DEX identifier
+            page: Page of top pools to fetch (1-based)
             
         Returns:
             List of raw pool data from API
         """
         try:
-            response = await self.client.get_top_pools_by_network_dex(network, dex_id)
-            
-            if not response:
-                return []
-            
-            # Handle different response formats
-            if isinstance(response, dict) and 'data' in response:
-                return response['data']
-            elif isinstance(response, list):
-                return response
-            else:
-                return []
+            response = await self.client.get_top_pools_by_network_dex(network, dex_id, page=page)
+            
+            # The SDK returns a DataFrame of flat pool records; mocks return API dicts
+            return [
+                DataTypeNormalizer.nest_pool_record(pool_data)
+                for pool_data in DataTypeNormalizer.normalize_response_data(response)
+                if isinstance(pool_data, dict)
+            ]
                 
         except Exception as e:
             self.logger.error(f"Error discovering pools for DEX {dex_id}: {e}")
@@ -509,6 +636,37 @@ class DiscoveryEngine:
                 self.logger.debug(f"Pool {pool_id} already exists")
                 return existing_pool
             
+            pool = self._build_pool(pool_data, dex_id)
+            if not pool:
+                return None
+            
+            # Store in database
+            await self.db_manager.store_pool(pool)
+            self.logger.debug(f"Created pool: {pool_id}")
+            
+            return pool
+            
+        except Exception as e:
+            self.logger.error(f"Error processing pool data: {e}")
+            return None
+    
+    def _build_pool(self, pool_data: Dict[str, Any], dex_id: str) -> Optional[Pool]:
+        """
+        Create a Pool object from raw pool data without touching the database.
+        
+        Args:
+            pool_data: Raw pool data from API
+            dex_id: DEX identifier
+            
+        Returns:
+            Pool object or None if the data cannot be parsed
+        """
+        try:
+            pool_id = pool_data.get('id')
+            if not pool_id:
+                self.logger.warning("Pool data missing required 'id' field")
+                return None
+            
             # Extract attributes
             attributes = pool_data.get('attributes', {})
             relationships = pool_data.get('relationships', {})
@@ -536,8 +694,7 @@ class DiscoveryEngine:
                 except (ValueError, TypeError) as e:
                     self.logger.warning(f"Failed to parse pool_created_at '{created_at_str}': {e}")
             
-            # Create Pool object
-            pool = Pool(
+            return Pool(
                 id=pool_id,
                 address=attributes.get('address', ''),
                 name=attributes.get('name', ''),
@@ -549,14 +706,8 @@ class DiscoveryEngine:
                 last_updated=datetime.now()
             )
             
-            # Store in database
-            await self.db_manager.store_pool(pool)
-            self.logger.debug(f"Created pool: {pool_id}")
-            
-            return pool
-            
         except Exception as e:
-            self.logger.error(f"Error processing pool data: {e}")
+            self.logger.error(f"Error building pool from data: {e}")
             return None
     
     async def _extract_token_from_pool(self, pool: Pool, token_type: str) -> Optional[Token]:
@@ -582,62 +733,10 @@ class DiscoveryEngine:
             if existing_token:
                 return existing_token
             
-            # Try to get token information from API
-            try:
-                # Determine network from DEX
-                network = await self._get_network_for_dex(pool.dex_id)
-                if not network:
-                    network = "solana"  # Default fallback
-                
-                # Extract token address from token ID (format: network_address)
-                token_address = token_id
-                if '_' in token_id:
-                    token_address = token_id.split('_', 1)[1]
-                
-                # Get token data from API
-                token_response = await self.client.get_specific_token_on_network(network, token_address)
-                
-                if token_response and 'data' in token_response:
-                    token_data = token_response['data']
-                    attributes = token_data.get('attributes', {})
-                    
-                    token = Token(
-                        id=token_id,
-                        address=attributes.get('address', token_address),
-                        name=attributes.get('name', ''),
-                        symbol=attributes.get('symbol', ''),
-                        decimals=attributes.get('decimals'),
-                        network=network,
-                        last_updated=datetime.now()
-                    )
-                else:
-                    # Create minimal token record if API call fails
-                    token = Token(
-                        id=token_id,
-                        address=token_address,
-                        name='',
-                        symbol='',
-                        decimals=None,
-                        network=network,
-                        last_updated=datetime.now()
-                    )
-                
-            except Exception as api_error:
-                self.logger.warning(f"Failed to fetch token data from API: {api_error}")
-                
-                # Create minimal token record
-                network = await self._get_network_for_dex(pool.dex_id) or "solana"
-                token_address = token_id.split('_', 1)[1] if '_' in token_id else token_id
-                
-                token = Token(
-                    id=token_id,
-                    address=token_address,
-                    name='',
-                    symbol='',
-                    decimals=None,
-                    network=network,
-                    last_updated=datetime.now()
-                )
+            # Determine network from DEX
+            network = await self._get_network_for_dex(pool.dex_id) or "solana"  # Default fallback
+            
+            token = await self._build_token(token_id, network)
             
             # Store token in database
             await self.db_manager.store_token(token)
@@ -649,6 +748,56 @@ class DiscoveryEngine:
             self.logger.error(f"Error extracting {token_type} token from pool {pool.id}: {e}")
             return None
     
+    async def _build_token(self, token_id: str, network: str) -> Token:
+        """
+        Create a Token object from API token data, without storing it.
+        
+        Falls back to a minimal record (address only) if the API call fails
+        or returns no data.
+        
+        Args:
+            token_id: Token identifier (format: network_address)
+            network: Network identifier
+            
+        Returns:
+            Token object
+        """
+        # Extract token address from token ID (format: network_address)
+        token_address = token_id
+        if '_' in token_id:
+            token_address = token_id.split('_', 1)[1]
+        
+        try:
+            # Get token data from API
+            token_response = await self.client.get_specific_token_on_network(network, token_address)
+            
+            if token_response and 'data' in token_response:
+                attributes = token_response['data'].get('attributes', {})
+                
+                return Token(
+                    id=token_id,
+                    address=attributes.get('address', token_address),
+                    name=attributes.get('name', ''),
+                    symbol=attributes.get('symbol', ''),
+                    decimals=attributes.get('decimals'),
+                    network=network,
+                    last_updated=datetime.now()
+                )
+                
+        except Exception as api_error:
+            self.logger.warning(f"Failed to fetch token data from API: {api_error}")
+        
+        # Create minimal token record if API call fails
+        return Token(
+            id=token_id,
+            address=token_address,
+            name='',
+            symbol='',
+            decimals=None,
+            network=network,
+            last_updated=datetime.now()
+        )
+    
     async def _create_pool_data_for_scoring(self, pool: Pool) -> Dict[str, Any]:
         """
         Create pool data dictionary for activity scoring.
@@ -23,6 +23,7 @@ from gecko_terminal_collector.models.core import (
     CollectionResult, OHLCVRecord, ValidationResult, Gap
 )
 from gecko_terminal_collector.utils.metadata import MetadataTracker
+from gecko_terminal_collector.utils.structured_logging import diagnostic
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,8 @@ class HistoricalOHLCVCollector(BaseDataCollector):
     before_timestamp, and provides backfill functionality for data gaps and missing intervals.
     """
     
+    supports_pool_sharding = True
+    
     def __init__(
         self,
         config: CollectionConfig,
@@ -106,6 +109,7 @@ class HistoricalOHLCVCollector(BaseDataCollector):
                 # Get active watchlist pool IDs
                 logger.info("Retrieving active watchlist pools for historical OHLCV collection")
                 watchlist_pools = await self.db_manager.get_watchlist_pools()
+                watchlist_pools = self.filter_owned_pools(watchlist_pools)
                 
                 if not watchlist_pools:
                     logger.info("No active watchlist pools found")
@@ -229,12 +233,12 @@ class HistoricalOHLCVCollector(BaseDataCollector):
                     #print(pool_id)
                     #print("===")
 
-                    print("--__pool_id for lookup in SQL db: ", pool_id)
-                    print("self.network context: ", self.network)
+                    diagnostic(logger, "--__pool_id for lookup in SQL db: ", pool_id)
+                    diagnostic(logger, "self.network context: ", self.network)
 
                     database_id = self.network+"_"+pool_id
 
-                    print("database_id: ", database_id)
+                    diagnostic(logger, "database_id: ", database_id)
 
                     # if no data exists, then this function will always error out
 
@@ -424,11 +428,11 @@ class HistoricalOHLCVCollector(BaseDataCollector):
                     pool_id, timeframe, current_before_timestamp
                 )
 
-                print("-_collect_historical_data_with_pagination: ", timeframe)
+                diagnostic(logger, "-_collect_historical_data_with_pagination: ", timeframe)
 
-                print("pool_id: ", pool_id)
-                print("timeframe:", timeframe)
-                print("current_before_timestamp: ", current_before_timestamp)
+                diagnostic(logger, "pool_id: ", pool_id)
+                diagnostic(logger, "timeframe:", timeframe)
+                diagnostic(logger, "current_before_timestamp: ", current_before_timestamp)
                                 
                 if not response_data:
                     logger.debug(f"No more data available for pool {pool_id}, timeframe {timeframe}")
@@ -510,9 +514,9 @@ class HistoricalOHLCVCollector(BaseDataCollector):
             endpoint = f"networks/{self.network}/pools/{pool_id}/ohlcv/{api_timeframe}"
             url = f"{self.api_base_url}/{endpoint}"
             
-            print("-_make_direct_ohlcv_request--")
-            print(url)
-            print("---")
+            diagnostic(logger, "-_make_direct_ohlcv_request--")
+            diagnostic(logger, url)
+            diagnostic(logger, "---")
 
             # https://api.geckoterminal.com/api/v2/networks/solana/pools/7bqJG2ZdMKbEkgSmfuqNVBvqEvWavgL8UEo33ZqdL3NP/ohlcv/1h
 
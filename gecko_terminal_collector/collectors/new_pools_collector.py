@@ -15,6 +15,7 @@ from gecko_terminal_collector.database.postgresql_models import NewPoolsHistory
 from gecko_terminal_collector.config.models import CollectionConfig
 from gecko_terminal_collector.database.manager import DatabaseManager
 from gecko_terminal_collector.analysis.signal_analyzer import NewPoolsSignalAnalyzer, SignalResult
+from gecko_terminal_collector.utils.structured_logging import diagnostic
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,10 @@ class NewPoolsCollector(BaseDataCollector):
             if network_config and hasattr(network_config, 'auto_watchlist_integration'):
                 self.auto_watchlist_enabled = network_config.auto_watchlist_integration
         
+        # Pool history prefetched for the pools of the current collection run
+        self._history_cache: Optional[Dict[str, List[Dict]]] = None
+        self._history_cache_hours: Optional[int] = None
+        
     def get_collection_key(self) -> str:
         """Get unique key for this collector type."""
         return f"new_pools_{self.network}"
@@ -122,9 +127,9 @@ class NewPoolsCollector(BaseDataCollector):
             # Validate the response data
             validation_result = await self.validate_data(pools_data)
 
-            print("_validation_result_")
-            print(validation_result)
-            print("---")
+            diagnostic(logger, "_validation_result_")
+            diagnostic(logger, validation_result)
+            diagnostic(logger, "---")
 
             if not validation_result.is_valid:
                 # Log validation errors but continue processing valid records
@@ -133,6 +138,10 @@ class NewPoolsCollector(BaseDataCollector):
                 errors.append(error_msg)
                 # Don't return early - continue processing what we can
             
+            # Read the history of all pools at once for signal analysis
+            if self.signal_analysis_enabled:
+                await self._prefetch_pool_history(pools_data, hours=24)
+            
             # Process each pool
             for pool_data in pools_data:
                 try:
@@ -174,6 +183,7 @@ class NewPoolsCollector(BaseDataCollector):
                     errors.append(error_msg)
                     continue
             
+            self._history_cache = None
             total_records = pools_created + history_records
             
             self.logger.info(
@@ -196,6 +206,7 @@ class NewPoolsCollector(BaseDataCollector):
             )
             
         except Exception as e:
+            self._history_cache = None
             error_msg = f"New pools collection failed for {self.network}: {str(e)}"
             self.logger.error(error_msg)
             errors.append(error_msg)
@@ -571,6 +582,9 @@ class NewPoolsCollector(BaseDataCollector):
         Returns:
             List of historical data dictionaries
         """
+        if self._history_cache is not None and hours == self._history_cache_hours:
+            return self._history_cache.get(pool_id, [])
+        
         try:
             # Calculate cutoff time
             cutoff_time = datetime.now() - timedelta(hours=hours)
@@ -587,6 +601,38 @@ class NewPoolsCollector(BaseDataCollector):
             self.logger.error(f"Error getting historical data for pool {pool_id}: {e}")
             return []
     
+    async def _prefetch_pool_history(self, pools_data: List[Dict], hours: int = 24) -> None:
+        """
+        Read the history of many pools with one columnar query.
+        
+        _get_pool_historical_data serves these pools from the prefetched
+        history until the end of the collection run, and falls back to
+        per-pool reads if the prefetch fails.
+        
+        Args:
+            pools_data: Pool data from the API
+            hours: Number of hours to look back
+        """
+        self._history_cache = None
+        pool_ids = [pool_data.get('id') for pool_data in pools_data if isinstance(pool_data, dict) and pool_data.get('id')]
+        if not pool_ids or not hasattr(self.db_manager, 'get_pool_history_frame'):
+            return
+        
+        try:
+            import pandas as pd
+            from gecko_terminal_collector.database.frames import pool_history_records
+            
+            cutoff_time = datetime.now() - timedelta(hours=hours)
+            frame = await self.db_manager.get_pool_history_frame(pool_ids, cutoff_time)
+            if not isinstance(frame, pd.DataFrame):
+                raise TypeError(f"expected a DataFrame, got {type(frame).__name__}")
+            self._history_cache = pool_history_records(frame)
+            self._history_cache_hours = hours
+            
+        except Exception as e:
+            self.logger.warning(f"Could not prefetch pool history, reading pools one by one: {e}")
+            self._history_cache = None
+    
     async def _handle_auto_watchlist(self, pool_data: Dict, signal_result: SignalResult) -> None:
         """
         Handle automatic watchlist addition for pools with strong signals.
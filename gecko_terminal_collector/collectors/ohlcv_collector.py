@@ -19,6 +19,7 @@ from gecko_terminal_collector.models.core import (
 )
 from gecko_terminal_collector.utils.metadata import MetadataTracker
 from gecko_terminal_collector.utils.data_normalizer import DataTypeNormalizer
+from gecko_terminal_collector.utils.structured_logging import diagnostic
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,8 @@ class OHLCVCollector(BaseDataCollector):
     data continuity verification and gap detection algorithms.
     """
     
+    supports_pool_sharding = True
+    
     def __init__(
         self,
         config: CollectionConfig,
@@ -87,15 +90,16 @@ class OHLCVCollector(BaseDataCollector):
             # Get active watchlist pool IDs
             logger.info("Retrieving active watchlist pools for OHLCV collection")
             watchlist_pools = await self.db_manager.get_watchlist_pools()
+            watchlist_pools = self.filter_owned_pools(watchlist_pools)
             
             if not watchlist_pools:
                 logger.info("No active watchlist pools found")
                 return self.create_success_result(0, start_time)
             
             logger.info(f"Found {len(watchlist_pools)} watchlist pools for OHLCV collection")
-            print("---OHLCV_Collector---")
-            print(watchlist_pools)
-            print("---")
+            diagnostic(logger, "---OHLCV_Collector---")
+            diagnostic(logger, watchlist_pools)
+            diagnostic(logger, "---")
 
             # Collect OHLCV data for each pool and timeframe
             for pool_id in watchlist_pools:    
@@ -190,7 +194,7 @@ class OHLCVCollector(BaseDataCollector):
 
 
 
-                    print("===_validation_result: ")
+                    diagnostic(logger, "===_validation_result: ")
                     #print(ohlcv_records)
 
                     
@@ -342,9 +346,9 @@ class OHLCVCollector(BaseDataCollector):
             try:
                 logger.info(f"Performing bulk storage of {len(all_records_for_pool)} OHLCV records for pool {pool_id}")
                 
-                print("--------")
-                print()
-                print("-----")
+                diagnostic(logger, "--------")
+                diagnostic(logger)
+                diagnostic(logger, "-----")
 
                 # Final validation of the complete dataset
                 final_validation = await self._validate_ohlcv_data(all_records_for_pool)
@@ -406,8 +410,8 @@ class OHLCVCollector(BaseDataCollector):
         records = []
         parsing_errors = []
         
-        print("----pool_id----")
-        print(pool_id)
+        diagnostic(logger, "----pool_id----")
+        diagnostic(logger, pool_id)
 
         try:
             # Handle pandas DataFrame response (from geckoterminal-py SDK)
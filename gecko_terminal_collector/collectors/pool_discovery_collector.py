@@ -17,6 +17,7 @@ from gecko_terminal_collector.database.manager import DatabaseManager
 from gecko_terminal_collector.database.models import Pool, Token, DEX
 from gecko_terminal_collector.models.core import CollectionResult, ValidationResult
 from gecko_terminal_collector.utils.activity_scorer import ActivityScorer, CollectionPriority
+from gecko_terminal_collector.utils.data_normalizer import DataTypeNormalizer
 from gecko_terminal_collector.utils.metadata import MetadataTracker
 
 logger = logging.getLogger(__name__)
@@ -66,6 +67,7 @@ class PoolDiscoveryCollector(BaseDataCollector):
         self.max_pools_per_dex = config.discovery.max_pools_per_dex
         self.new_pool_lookback_hours = config.discovery.new_pool_lookback_hours
         self.target_networks = config.discovery.target_networks
+        self.multi_pool_batch_size = config.discovery.multi_pool_batch_size
         
         self.logger.info(
             f"PoolDiscoveryCollector initialized for networks: {self.target_networks}, "
@@ -454,6 +456,138 @@ class PoolDiscoveryCollector(BaseDataCollector):
             self.logger.error(f"Error evaluating activity for pool {pool_id}: {e}")
             return None
     
+    async def evaluate_pools_activity(self, pools: List[Any]) -> Dict[str, Decimal]:
+        """
+        Evaluate activity for a batch of pools through the multi-pool endpoint.
+        
+        Pools are grouped by network and fetched in chunks of
+        ``multi_pool_batch_size`` addresses, so re-scoring N pools costs about
+        N / batch_size API calls instead of N. Scores and priorities are then
+        written back with one bulk update each, stamped with the time the
+        evaluation started. Pools in a chunk whose request fails fall back to
+        evaluate_pool_activity().
+        
+        Args:
+            pools: Pool database records (with id, address and dex_id) to evaluate
+            
+        Returns:
+            Dictionary mapping pool_id to updated activity score
+        """
+        evaluated_at = datetime.now()
+        pools_by_network = await self._group_pools_by_network(pools)
+        pools_data = {}
+        fallback_pools = []
+        
+        for network, network_pools in pools_by_network.items():
+            for i in range(0, len(network_pools), self.multi_pool_batch_size):
+                chunk = network_pools[i:i + self.multi_pool_batch_size]
+                
+                try:
+                    response = await self.make_api_request(
+                        self.client.get_multiple_pools_by_network,
+                        network,
+                        [pool.address for pool in chunk]
+                    )
+                    pools_data.update(self._match_pools_response(response, chunk))
+                    
+                except Exception as e:
+                    self.logger.warning(
+                        f"Multi-pool request failed for {len(chunk)} pools on {network}: {e}"
+                    )
+                    fallback_pools.extend(chunk)
+        
+        missing_count = sum(len(p) for p in pools_by_network.values()) - len(pools_data) - len(fallback_pools)
+        if missing_count:
+            self.logger.warning(f"No current data available for {missing_count} pools")
+        
+        activity_scores = self.activity_scorer.calculate_activity_scores(pools_data)
+        
+        if activity_scores:
+            priorities = {
+                pool_id: self.activity_scorer.get_collection_priority(score).value
+                for pool_id, score in activity_scores.items()
+            }
+            await self.db_manager.update_pool_activity_scores(activity_scores, checked_at=evaluated_at)
+            await self.db_manager.update_pool_priorities(priorities)
+        
+        evaluated_scores = dict(activity_scores)
+        for pool in fallback_pools:
+            activity_score = await self.evaluate_pool_activity(pool.id)
+            if activity_score is not None:
+                evaluated_scores[pool.id] = activity_score
+        
+        self.logger.info(
+            f"Evaluated activity for {len(evaluated_scores)}/{len(pools)} pools "
+            f"({len(fallback_pools)} via single-pool fallback)"
+        )
+        
+        return evaluated_scores
+    
+    async def _group_pools_by_network(self, pools: List[Any]) -> Dict[str, List[Any]]:
+        """
+        Group pools by network, looking up each DEX only once.
+        
+        Args:
+            pools: Pool database records to group
+            
+        Returns:
+            Dictionary mapping network to its pools
+        """
+        dex_networks: Dict[str, Optional[str]] = {}
+        pools_by_network: Dict[str, List[Any]] = {}
+        
+        for pool in pools:
+            if pool.dex_id not in dex_networks:
+                dex = await self.db_manager.get_dex_by_id(pool.dex_id)
+                dex_networks[pool.dex_id] = dex.network if dex else None
+            
+            network = dex_networks[pool.dex_id]
+            if not network:
+                self.logger.warning(f"DEX {pool.dex_id} not found for pool {pool.id}")
+                continue
+            
+            pools_by_network.setdefault(network, []).append(pool)
+        
+        return pools_by_network
+    
+    def _match_pools_response(self, response: Any, pools: List[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Match multi-pool API response entries back to requested pools.
+        
+        The SDK returns a pandas DataFrame with flat ``address``/``id``
+        columns; JSON:API style dicts with a ``data`` list are also accepted.
+        Entries are matched on their address, falling back to the
+        ``network_address`` style entry ID. Flat records are reshaped into
+        the nested attributes layout the activity scorer reads.
+        
+        Args:
+            response: API response from get_multiple_pools_by_network
+            pools: Pools requested in the call
+            
+        Returns:
+            Dictionary mapping pool_id to pool data
+        """
+        pools_data = response
+        if isinstance(response, dict):
+            pools_data = response.get('data')
+        elif hasattr(response, 'to_dict'):  # pandas DataFrame
+            pools_data = response.to_dict('records')
+        
+        pool_ids = {}
+        for pool in pools:
+            pool_ids[pool.address] = pool.id
+            pool_ids[pool.id] = pool.id
+        
+        matched = {}
+        for pool_data in pools_data or []:
+            pool_data = DataTypeNormalizer.nest_pool_record(pool_data)
+            attributes = pool_data.get('attributes', {})
+            pool_id = pool_ids.get(attributes.get('address')) or pool_ids.get(pool_data.get('id'))
+            if pool_id:
+                matched[pool_id] = pool_data
+        
+        return matched
+    
     async def _get_available_dexes(self) -> List[DEX]:
         """
         Get available DEXes for pool discovery from target networks.
@@ -667,21 +801,9 @@ class PoolDiscoveryCollector(BaseDataCollector):
                 self.logger.debug("No pools need activity updates")
                 return 0
             
-            updated_count = 0
-            
-            for pool in pools_to_update:
-                try:
-                    # Evaluate pool activity
-                    activity_score = await self.evaluate_pool_activity(pool.id)
-                    
-                    if activity_score is not None:
-                        updated_count += 1
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error updating activity for pool {pool.id}: {e}")
-                    continue
+            activity_scores = await self.evaluate_pools_activity(pools_to_update)
             
-            return updated_count
+            return len(activity_scores)
             
         except Exception as e:
             self.logger.error(f"Error evaluating pool activity: {e}")
@@ -32,6 +32,8 @@ class TradeCollector(BaseDataCollector):
     keys, and processes trade data with proper validation.
     """
     
+    supports_pool_sharding = True
+    
     def __init__(
         self,
         config: CollectionConfig,
@@ -98,6 +100,7 @@ class TradeCollector(BaseDataCollector):
             # Get active watchlist pool IDs
             logger.info("Retrieving active watchlist pools for trade collection")
             watchlist_pools = await self.db_manager.get_watchlist_pools()
+            watchlist_pools = self.filter_owned_pools(watchlist_pools)
             
             if not watchlist_pools:
                 logger.info("No active watchlist pools found")
@@ -672,15 +675,15 @@ class TradeCollector(BaseDataCollector):
             start_time = end_time - timedelta(hours=24)
             
             # Get trade data for the period
-            trades = await self.db_manager.get_trade_data(
-                pool_id=pool_id,
+            trades = await self.db_manager.get_trades_frame(
+                pool_id,
                 start_time=start_time,
                 end_time=end_time,
                 min_volume_usd=self.min_trade_volume_usd
             )
             
             # Analyze trade distribution
-            if not trades:
+            if trades.empty:
                 return {
                     "pool_id": pool_id,
                     "has_trades": False,
@@ -690,21 +693,23 @@ class TradeCollector(BaseDataCollector):
                 }
             
             # Calculate time gaps between trades
-            trade_times = sorted([trade.block_timestamp for trade in trades])
-            gaps = []
-            
-            for i in range(1, len(trade_times)):
-                gap_duration = trade_times[i] - trade_times[i-1]
-                if gap_duration > timedelta(hours=1):  # Consider gaps > 1 hour significant
-                    gaps.append({
-                        "start": trade_times[i-1],
-                        "end": trade_times[i],
-                        "duration_hours": gap_duration.total_seconds() / 3600
-                    })
+            trade_times = trades['block_timestamp'].sort_values()
+            gap_durations = trade_times.diff()
+            significant = (gap_durations > timedelta(hours=1)).to_numpy()  # Consider gaps > 1 hour significant
+            gaps = [
+                {
+                    "start": start.to_pydatetime(),
+                    "end": end.to_pydatetime(),
+                    "duration_hours": duration.total_seconds() / 3600
+                }
+                for start, end, duration in zip(
+                    trade_times.shift()[significant], trade_times[significant], gap_durations[significant]
+                )
+            ]
             
             # Calculate data quality score
-            total_volume = sum(trade.volume_usd for trade in trades)
-            avg_volume = total_volume / len(trades) if trades else Decimal('0')
+            total_volume = float(trades['volume_usd'].sum())
+            avg_volume = total_volume / len(trades)
             
             # Simple quality score based on trade frequency and volume
             quality_score = min(1.0, len(trades) / 100.0)  # Normalize by expected trade count
@@ -714,8 +719,8 @@ class TradeCollector(BaseDataCollector):
                 "has_trades": True,
                 "trade_count": len(trades),
                 "time_span_hours": 24,
-                "total_volume_usd": float(total_volume),
-                "average_volume_usd": float(avg_volume),
+                "total_volume_usd": total_volume,
+                "average_volume_usd": avg_volume,
                 "significant_gaps": len(gaps),
                 "gaps": gaps[:5],  # Return first 5 gaps
                 "data_quality_score": quality_score,
@@ -872,32 +877,24 @@ class TradeCollector(BaseDataCollector):
             Priority score (higher = more priority)
         """
         try:
-            # Get recent trade data (last 4 hours for activity assessment)
+            # Get 24-hour trade data for volume assessment; the last 4 hours of it
+            # are used for activity assessment
             recent_end = datetime.now()
             recent_start = recent_end - timedelta(hours=4)
-            
-            recent_trades = await self.db_manager.get_trade_data(
-                pool_id=pool_id,
-                start_time=recent_start,
-                end_time=recent_end,
-                min_volume_usd=self.min_trade_volume_usd
-            )
-            
-            # Get 24-hour trade data for volume assessment
             day_start = recent_end - timedelta(hours=24)
-            day_trades = await self.db_manager.get_trade_data(
-                pool_id=pool_id,
+            day_trades = await self.db_manager.get_trades_frame(
+                pool_id,
                 start_time=day_start,
                 end_time=recent_end,
                 min_volume_usd=self.min_trade_volume_usd
             )
             
             # Calculate volume-based score
-            total_volume_24h = sum(trade.volume_usd for trade in day_trades)
-            volume_score = min(float(total_volume_24h) / self.high_volume_threshold_usd, 2.0)
+            total_volume_24h = float(day_trades['volume_usd'].sum())
+            volume_score = min(total_volume_24h / self.high_volume_threshold_usd, 2.0)
             
             # Calculate activity-based score (trade frequency)
-            trade_count_4h = len(recent_trades)
+            trade_count_4h = int((day_trades['block_timestamp'] >= recent_start).sum())
             activity_score = min(trade_count_4h / 20.0, 2.0)  # Normalize to max 2.0
             
             # Calculate recency score (when was last collection)
@@ -1194,19 +1191,24 @@ class TradeCollector(BaseDataCollector):
         try:
             pool_priorities = []
             
+            # Get recent trade data of all pools at once
+            end_time = datetime.now()
+            recent_trades = await self.db_manager.get_trades_frame(
+                pool_ids,
+                start_time=end_time - timedelta(minutes=self.rotation_window_minutes),
+                end_time=end_time,
+                min_volume_usd=self.min_trade_volume_usd
+            )
+            activity = recent_trades.groupby('pool_id')['volume_usd'].agg(['count', 'sum'])
+            
             for pool_id in pool_ids:
-                # Get recent trade data
-                recent_trades = await self.db_manager.get_trade_data(
-                    pool_id=pool_id,
-                    start_time=datetime.now() - timedelta(minutes=self.rotation_window_minutes),
-                    end_time=datetime.now(),
-                    min_volume_usd=self.min_trade_volume_usd
-                )
-                
                 # Calculate priority score based on activity and volume
-                trade_count = len(recent_trades)
-                total_volume = sum(trade.volume_usd for trade in recent_trades)
-                avg_volume = total_volume / trade_count if trade_count > 0 else Decimal('0')
+                if pool_id in activity.index:
+                    trade_count = int(activity.at[pool_id, 'count'])
+                    total_volume = float(activity.at[pool_id, 'sum'])
+                else:
+                    trade_count, total_volume = 0, 0.0
+                avg_volume = total_volume / trade_count if trade_count > 0 else 0.0
                 
                 # Check for gaps
                 gaps = await self.detect_trade_data_gaps(pool_id)
@@ -1214,7 +1216,7 @@ class TradeCollector(BaseDataCollector):
                 
                 # Calculate priority score
                 activity_score = min(trade_count / 50.0, 1.0)  # Normalize to 0-1
-                volume_score = min(float(avg_volume) / self.high_volume_threshold_usd, 1.0)
+                volume_score = min(avg_volume / self.high_volume_threshold_usd, 1.0)
                 priority = (activity_score + volume_score) - gap_penalty
                 
                 pool_priorities.append((pool_id, max(priority, 0.1)))  # Minimum priority
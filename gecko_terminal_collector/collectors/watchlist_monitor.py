@@ -6,19 +6,24 @@ parse the CSV data with proper address type handling, and detect new tokens
 for processing.
 """
 
-import csv
+import asyncio
 import logging
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
 from gecko_terminal_collector.collectors.base import BaseDataCollector
 from gecko_terminal_collector.config.models import CollectionConfig
 from gecko_terminal_collector.database.manager import DatabaseManager
 from gecko_terminal_collector.database.models import WatchlistEntry
 from gecko_terminal_collector.models.core import CollectionResult, ValidationResult
 from gecko_terminal_collector.utils.metadata import MetadataTracker
+from gecko_terminal_collector.utils.watchlist_index import WatchlistIndex
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +59,22 @@ class WatchlistRecord:
         return f"WatchlistRecord(symbol={self.token_symbol}, pool={self.pool_address})"
 
 
+class WatchlistFileHandler(FileSystemEventHandler):
+    """File system event handler flagging changes to the watchlist file."""
+    
+    def __init__(self, monitor: 'WatchlistMonitor'):
+        self.monitor = monitor
+    
+    def on_any_event(self, event):
+        """Flag events touching the watchlist file, including atomic renames."""
+        if event.is_directory:
+            return
+        paths = [event.src_path, getattr(event, 'dest_path', '')]
+        target = os.path.abspath(self.monitor.watchlist_file_path)
+        if any(path and os.path.abspath(path) == target for path in paths):
+            self.monitor._file_changed.set()
+
+
 class WatchlistMonitor(BaseDataCollector):
     """
     Monitors watchlist CSV file for changes and processes new tokens.
@@ -91,6 +112,13 @@ class WatchlistMonitor(BaseDataCollector):
         # Track file modification time for change detection
         self._last_modified: Optional[float] = None
         self._last_processed_records: Set[WatchlistRecord] = set()
+        
+        # Parsed watchlist, refreshed incrementally from the file
+        self._index: Optional[WatchlistIndex[WatchlistRecord]] = None
+        
+        # Optional file system watching instead of checking the file on every run
+        self._observer: Optional[Observer] = None
+        self._file_changed = threading.Event()
     
     def get_collection_key(self) -> str:
         """Get unique key for this collector type."""
@@ -114,24 +142,38 @@ class WatchlistMonitor(BaseDataCollector):
                 logger.warning(error_msg)
                 return self.create_failure_result([error_msg], collection_time=start_time)
             
-            # Check if file has been modified since last check
-            current_modified = os.path.getmtime(self.watchlist_file_path)
-            
-            if self._last_modified is not None and current_modified <= self._last_modified:
-                logger.debug("Watchlist file has not been modified since last check")
+            # With file watching active, skip the file entirely until it is touched
+            if self.is_file_watching_active() and self._last_modified is not None and not self._file_changed.is_set():
+                logger.debug("No watchlist file events since last check")
                 return self.create_success_result(0, start_time)
+            self._file_changed.clear()
             
-            # Parse the CSV file
-            logger.info(f"Processing watchlist file: {self.watchlist_file_path}")
-            current_records = await self._parse_watchlist_csv()
+            # Check if file has changed since last check (reads only appended rows if it grew)
+            index = self._get_index()
+            refresh = index.refresh()
+            current_modified = index.last_modified
             
-            if not current_records:
-                logger.warning("No valid records found in watchlist file")
+            if not refresh.modified and self._last_modified is not None:
+                logger.debug("Watchlist file has not been modified since last check")
                 self._last_modified = current_modified
                 return self.create_success_result(0, start_time)
             
-            # Detect changes
-            new_records, removed_records = self._detect_changes(current_records)
+            logger.info(f"Processing watchlist file: {self.watchlist_file_path}")
+            
+            if refresh.full_reload or self._last_modified is None:
+                current_records = index.records()
+                
+                if not current_records:
+                    logger.warning("No valid records found in watchlist file")
+                    self._last_modified = current_modified
+                    return self.create_success_result(0, start_time)
+                
+                # Detect changes
+                new_records, removed_records = self._detect_changes(current_records)
+            else:
+                # Rows were only appended, so nothing can have been removed
+                new_records = [record for record in refresh.records if record not in self._last_processed_records]
+                removed_records = []
             
             # Process new records
             if new_records:
@@ -146,7 +188,7 @@ class WatchlistMonitor(BaseDataCollector):
             
             # Update tracking state
             self._last_modified = current_modified
-            self._last_processed_records = set(current_records)
+            self._last_processed_records = set(index.records())
             
             logger.info(
                 f"Watchlist monitoring completed: {records_processed} new records processed, "
@@ -165,55 +207,73 @@ class WatchlistMonitor(BaseDataCollector):
         """
         Parse the watchlist CSV file and return list of records.
         
+        The whole file is parsed, independently of change tracking.
+        
         Returns:
             List of WatchlistRecord objects
         """
-        records = []
+        index = self._create_index()
         
         try:
-            with open(self.watchlist_file_path, 'r', encoding='utf-8') as file:
-                # Use csv.DictReader to handle CSV parsing properly
-                reader = csv.DictReader(file)
-                
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 since header is row 1
-                    try:
-                        # Validate required fields
-                        required_fields = ['tokenSymbol', 'tokenName', 'chain', 'dex', 'poolAddress', 'networkAddress']
-                        missing_fields = [field for field in required_fields if field not in row or not row[field].strip()]
-                        
-                        if missing_fields:
-                            logger.warning(
-                                f"Row {row_num}: Missing required fields: {missing_fields}. Skipping row."
-                            )
-                            continue
-                        
-                        # Create record with proper address type handling
-                        record = WatchlistRecord(
-                            token_symbol=row['tokenSymbol'],
-                            token_name=row['tokenName'],
-                            chain=row['chain'],
-                            dex=row['dex'],
-                            pool_address=row['poolAddress'],  # This is the "id" address for pool operations
-                            network_address=row['networkAddress']  # This is the "base_token_id" for token operations
-                        )
-                        
-                        # Validate addresses are not empty after cleaning
-                        if not record.pool_address or not record.network_address:
-                            logger.warning(f"Row {row_num}: Empty addresses after cleaning. Skipping row.")
-                            continue
-                        
-                        records.append(record)
-                        
-                    except Exception as e:
-                        logger.warning(f"Row {row_num}: Error parsing row: {e}. Skipping row.")
-                        continue
-                        
+            index.refresh()
         except Exception as e:
             logger.error(f"Error reading watchlist CSV file: {e}")
             raise
         
-        logger.info(f"Parsed {len(records)} valid records from watchlist CSV")
-        return records
+        return index.records()
+    
+    def _get_index(self) -> WatchlistIndex[WatchlistRecord]:
+        """Get the change-tracking index of the current watchlist file."""
+        if self._index is None or self._index.file_path != self.watchlist_file_path:
+            self._index = self._create_index()
+        return self._index
+    
+    def _create_index(self) -> WatchlistIndex[WatchlistRecord]:
+        """Create a watchlist index keyed by pool address."""
+        return WatchlistIndex(
+            self.watchlist_file_path,
+            self._parse_row,
+            key=lambda record: record.pool_address
+        )
+    
+    @staticmethod
+    def _parse_row(row: Dict[str, str], row_num: int) -> Optional[WatchlistRecord]:
+        """
+        Parse and validate a single watchlist CSV row.
+        
+        Args:
+            row: CSV row keyed by header
+            row_num: Row number in the file, for logging
+            
+        Returns:
+            WatchlistRecord, or None if the row is invalid
+        """
+        # Validate required fields
+        required_fields = ['tokenSymbol', 'tokenName', 'chain', 'dex', 'poolAddress', 'networkAddress']
+        missing_fields = [field for field in required_fields if not (row.get(field) or '').strip()]
+        
+        if missing_fields:
+            logger.warning(
+                f"Row {row_num}: Missing required fields: {missing_fields}. Skipping row."
+            )
+            return None
+        
+        # Create record with proper address type handling
+        record = WatchlistRecord(
+            token_symbol=row['tokenSymbol'],
+            token_name=row['tokenName'],
+            chain=row['chain'],
+            dex=row['dex'],
+            pool_address=row['poolAddress'],  # This is the "id" address for pool operations
+            network_address=row['networkAddress']  # This is the "base_token_id" for token operations
+        )
+        
+        # Validate addresses are not empty after cleaning
+        if not record.pool_address or not record.network_address:
+            logger.warning(f"Row {row_num}: Empty addresses after cleaning. Skipping row.")
+            return None
+        
+        return record
     
     def _detect_changes(self, current_records: List[WatchlistRecord]) -> Tuple[List[WatchlistRecord], List[WatchlistRecord]]:
         """
@@ -239,51 +299,37 @@ class WatchlistMonitor(BaseDataCollector):
         """
         Process new watchlist records by adding them to the database.
         
+        New pools are inserted and previously deactivated ones reactivated
+        in bulk rather than one database round trip per record.
+        
         Args:
             new_records: List of new WatchlistRecord objects
             
         Returns:
             Number of records successfully processed
         """
-        processed_count = 0
-
-        print("called _process_new_records")
-        
         if not self.auto_add_new_tokens:
             logger.info("Auto-add new tokens is disabled. New records will not be added automatically.")
-            return processed_count
+            return 0
         
-        for record in new_records:
-            try:
-                # Check if pool already exists in watchlist
-                existing_entry = await self.db_manager.get_watchlist_entry_by_pool_id(record.pool_address)
-                
-                if existing_entry:
-                    if not existing_entry.is_active:
-                        # Reactivate existing entry
-                        await self.db_manager.update_watchlist_entry_status(record.pool_address, True)
-                        logger.info(f"Reactivated watchlist entry for pool: {record.pool_address}")
-                        processed_count += 1
-                    else:
-                        logger.debug(f"Pool {record.pool_address} already in active watchlist")
-                else:
-                    # Create new watchlist entry
-                    watchlist_entry = WatchlistEntry(
-                        pool_id=record.pool_address,
-                        token_symbol=record.token_symbol,
-                        token_name=record.token_name,
-                        network_address=record.network_address,
-                        is_active=True
-                    )
-                    
-                    await self.db_manager.add_watchlist_entry(watchlist_entry)
-                    logger.info(f"Added new watchlist entry: {record.token_symbol} ({record.pool_address})")
-                    processed_count += 1
-                    
-            except Exception as e:
-                logger.error(f"Error processing new record {record}: {e}")
-                continue
+        entries = [
+            WatchlistEntry(
+                pool_id=record.pool_address,
+                token_symbol=record.token_symbol,
+                token_name=record.token_name,
+                network_address=record.network_address,
+                is_active=True
+            )
+            for record in new_records
+        ]
+        
+        try:
+            processed_count = await self.db_manager.add_or_reactivate_watchlist_entries(entries)
+        except Exception as e:
+            logger.error(f"Error processing {len(entries)} new watchlist records: {e}")
+            return 0
         
+        logger.info(f"Added or reactivated {processed_count} of {len(entries)} new watchlist records")
         return processed_count
     
     async def _process_removed_records(self, removed_records: List[WatchlistRecord]) -> None:
@@ -293,15 +339,15 @@ class WatchlistMonitor(BaseDataCollector):
         Args:
             removed_records: List of removed WatchlistRecord objects
         """
-        for record in removed_records:
-            try:
-                # Deactivate the watchlist entry instead of deleting to preserve historical data
-                await self.db_manager.update_watchlist_entry_status(record.pool_address, False)
-                logger.info(f"Deactivated watchlist entry for pool: {record.pool_address}")
-                
-            except Exception as e:
-                logger.error(f"Error deactivating record {record}: {e}")
-                continue
+        try:
+            # Deactivate the watchlist entries instead of deleting to preserve historical data
+            await self.db_manager.deactivate_watchlist_entries(
+                [record.pool_address for record in removed_records]
+            )
+            logger.info(f"Deactivated {len(removed_records)} removed watchlist entries")
+            
+        except Exception as e:
+            logger.error(f"Error deactivating {len(removed_records)} removed watchlist records: {e}")
     
     async def _validate_specific_data(self, data: List[WatchlistRecord]) -> Optional[ValidationResult]:
         """
@@ -383,4 +429,52 @@ class WatchlistMonitor(BaseDataCollector):
         This will cause the next collect() call to process the file regardless of modification time.
         """
         self._last_modified = None
-        logger.info("Forced watchlist refresh - next collection will process the file")
\ No newline at end of file
+        if self._index is not None:
+            self._index.invalidate()
+        logger.info("Forced watchlist refresh - next collection will process the file")
+    
+    def start_file_watching(self) -> None:
+        """
+        Watch the watchlist file for changes instead of checking it on every run.
+        
+        While watching, collect() returns immediately unless a file system
+        event touched the watchlist file since the last check.
+        """
+        if self._observer is not None:
+            return  # Already watching
+        
+        watch_dir = os.path.dirname(os.path.abspath(self.watchlist_file_path))
+        
+        self._observer = Observer()
+        self._observer.schedule(WatchlistFileHandler(self), watch_dir, recursive=False)
+        self._observer.start()
+        logger.info(f"Started watching watchlist file: {self.watchlist_file_path}")
+    
+    def stop_file_watching(self) -> None:
+        """Stop watching the watchlist file for changes."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+            logger.info(f"Stopped watching watchlist file: {self.watchlist_file_path}")
+    
+    def is_file_watching_active(self) -> bool:
+        """
+        Check if file watching is currently active.
+        
+        Returns:
+            True if watching for file changes, False otherwise
+        """
+        return self._observer is not None and self._observer.is_alive()
+    
+    async def wait_for_change(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the watchlist file is touched, for event-driven collection.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            True if the file changed, False on timeout
+        """
+        return await asyncio.to_thread(self._file_changed.wait, timeout)
\ No newline at end of file
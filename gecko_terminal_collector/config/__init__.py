@@ -2,25 +2,21 @@
 Configuration management for the GeckoTerminal collector system.
 """
 
-from .models import (
-    CollectionConfig,
-    DatabaseConfig,
-    APIConfig,
-    IntervalConfig,
-    ThresholdConfig,
-    TimeframeConfig,
-    DEXConfig,
-    ErrorConfig,
-    WatchlistConfig
-)
-from .manager import ConfigManager
-from .validation import (
-    CollectionConfigValidator,
-    validate_config_dict,
-    get_env_var_mappings,
-    TimeframeEnum,
-    NetworkEnum
-)
+from ..utils.lazy_imports import lazy_exports
+
+_LAZY_IMPORTS = {
+    **dict.fromkeys([
+        'CollectionConfig', 'DatabaseConfig', 'APIConfig', 'IntervalConfig', 'ThresholdConfig',
+        'TimeframeConfig', 'DEXConfig', 'ErrorConfig', 'WatchlistConfig',
+    ], '.models'),
+    'ConfigManager': '.manager',
+    **dict.fromkeys([
+        'CollectionConfigValidator', 'validate_config_dict', 'get_env_var_mappings',
+        'TimeframeEnum', 'NetworkEnum',
+    ], '.validation'),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     # Legacy models
@@ -43,4 +39,4 @@ __all__ = [
     'get_env_var_mappings',
     'TimeframeEnum',
     'NetworkEnum',
-]
\ No newline at end of file
+]
@@ -314,7 +314,7 @@ class ConfigManager:
         # Boolean fields
         elif env_var in [
             'GECKO_DB_ECHO', 'GECKO_WATCHLIST_AUTO_ADD',
-            'GECKO_WATCHLIST_REMOVE_INACTIVE'
+            'GECKO_WATCHLIST_REMOVE_INACTIVE', 'GECKO_SHARDING_ENABLED'
         ]:
             return env_value.lower() in ('true', '1', 'yes', 'on')
         
@@ -124,6 +124,27 @@ class DiscoveryConfig:
     cleanup_threshold_days: int = 7  # Days of inactivity before cleanup
     bootstrap_on_startup: bool = True  # Run bootstrap process on startup
     target_networks: List[str] = field(default_factory=lambda: ["solana"])  # Networks to discover from
+    multi_pool_batch_size: int = 30  # Max addresses per multi-pool API call
+    max_pages_per_dex: int = 10  # Top-pools pages fetched per DEX during bootstrap
+
+
+@dataclass
+class MonitoringConfig:
+    """Monitoring persistence configuration."""
+    write_behind_enabled: bool = True  # Queue monitoring records and write them in batches
+    write_behind_batch_size: int = 500
+    write_behind_flush_interval: float = 5.0  # seconds
+    write_behind_max_queue_size: int = 10000
+
+
+@dataclass
+class SchedulingConfig:
+    """Multi-node scheduling configuration."""
+    sharding_enabled: bool = False  # Split collector work across nodes sharing the database
+    node_id: Optional[str] = None  # Defaults to hostname and process ID
+    pool_shards: int = 16  # Work units per collector that supports pool sharding
+    lease_ttl: int = 60  # seconds
+    lease_heartbeat_interval: int = 20  # seconds
 
 
 @dataclass
@@ -140,6 +161,8 @@ class CollectionConfig:
     watchlist: Optional[WatchlistConfig] = field(default_factory=WatchlistConfig)  # Make watchlist optional
     new_pools: NewPoolsConfig = field(default_factory=NewPoolsConfig)
     discovery: DiscoveryConfig = field(default_factory=DiscoveryConfig)
+    monitoring: MonitoringConfig = field(default_factory=MonitoringConfig)
+    scheduling: SchedulingConfig = field(default_factory=SchedulingConfig)
     
     def validate(self) -> List[str]:
         """
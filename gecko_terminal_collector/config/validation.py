@@ -3,7 +3,7 @@ Enhanced configuration validation using Pydantic.
 """
 
 import re
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional
 from decimal import Decimal
 from pydantic import BaseModel, Field, field_validator, model_validator
 from enum import Enum
@@ -297,6 +297,39 @@ class NewPoolsConfigValidator(BaseModel):
         return v
 
 
+class MonitoringConfigValidator(BaseModel):
+    """Pydantic model for monitoring persistence configuration validation."""
+    write_behind_enabled: bool = Field(default=True, description="Write monitoring records in batches")
+    write_behind_batch_size: int = Field(default=500, ge=1, le=10000, description="Records per batch write")
+    write_behind_flush_interval: float = Field(
+        default=5.0,
+        gt=0,
+        le=300,
+        description="Seconds between batch writes"
+    )
+    write_behind_max_queue_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Queued records before back-pressure drops samples"
+    )
+
+
+class SchedulingConfigValidator(BaseModel):
+    """Pydantic model for multi-node scheduling configuration validation."""
+    sharding_enabled: bool = Field(default=False, description="Split collector work across nodes")
+    node_id: Optional[str] = Field(default=None, description="Node identifier (defaults to hostname and PID)")
+    pool_shards: int = Field(default=16, ge=1, le=1024, description="Work units per pool-sharded collector")
+    lease_ttl: int = Field(default=60, ge=5, le=3600, description="Seconds before an unrenewed lease expires")
+    lease_heartbeat_interval: int = Field(default=20, ge=1, le=1800, description="Seconds between lease renewals")
+    
+    @model_validator(mode='after')
+    def validate_heartbeat_interval(self):
+        """Leases must be renewed before they expire."""
+        if self.lease_heartbeat_interval >= self.lease_ttl:
+            raise ValueError("lease_heartbeat_interval must be shorter than lease_ttl")
+        return self
+
+
 class CollectionConfigValidator(BaseModel):
     """Main configuration validator using Pydantic."""
     dexes: DEXConfigValidator = Field(default_factory=DEXConfigValidator)
@@ -309,6 +342,8 @@ class CollectionConfigValidator(BaseModel):
     rate_limiting: RateLimitConfigValidator = Field(default_factory=RateLimitConfigValidator)
     watchlist: WatchlistConfigValidator = Field(default_factory=WatchlistConfigValidator)
     new_pools: NewPoolsConfigValidator = Field(default_factory=NewPoolsConfigValidator)
+    monitoring: MonitoringConfigValidator = Field(default_factory=MonitoringConfigValidator)
+    scheduling: SchedulingConfigValidator = Field(default_factory=SchedulingConfigValidator)
     
     model_config = {
         "validate_assignment": True,
@@ -321,7 +356,7 @@ class CollectionConfigValidator(BaseModel):
         from gecko_terminal_collector.config.models import (
             CollectionConfig, DEXConfig, IntervalConfig, ThresholdConfig,
             TimeframeConfig, DatabaseConfig, APIConfig, ErrorConfig, RateLimitConfig, WatchlistConfig,
-            NewPoolsConfig, NetworkConfig
+            NewPoolsConfig, NetworkConfig, MonitoringConfig, SchedulingConfig
         )
         
         # Convert new pools configuration
@@ -390,6 +425,19 @@ class CollectionConfigValidator(BaseModel):
             ),
             new_pools=NewPoolsConfig(
                 networks=new_pools_networks
+            ),
+            monitoring=MonitoringConfig(
+                write_behind_enabled=self.monitoring.write_behind_enabled,
+                write_behind_batch_size=self.monitoring.write_behind_batch_size,
+                write_behind_flush_interval=self.monitoring.write_behind_flush_interval,
+                write_behind_max_queue_size=self.monitoring.write_behind_max_queue_size
+            ),
+            scheduling=SchedulingConfig(
+                sharding_enabled=self.scheduling.sharding_enabled,
+                node_id=self.scheduling.node_id,
+                pool_shards=self.scheduling.pool_shards,
+                lease_ttl=self.scheduling.lease_ttl,
+                lease_heartbeat_interval=self.scheduling.lease_heartbeat_interval
             )
         )
 
@@ -473,4 +521,8 @@ def get_env_var_mappings() -> Dict[str, str]:
         'GECKO_WATCHLIST_CHECK_INTERVAL': 'watchlist.check_interval',
         'GECKO_WATCHLIST_AUTO_ADD': 'watchlist.auto_add_new_tokens',
         'GECKO_WATCHLIST_REMOVE_INACTIVE': 'watchlist.remove_inactive_tokens',
+        
+        # Multi-node scheduling configuration
+        'GECKO_SHARDING_ENABLED': 'scheduling.sharding_enabled',
+        'GECKO_NODE_ID': 'scheduling.node_id',
     }
\ No newline at end of file
@@ -2,11 +2,20 @@
 Database management and data access layer.
 """
 
-from .connection import DatabaseConnection
-from .manager import DatabaseManager
-from .migrations import MigrationManager, create_migration_manager
-from .models import Base, DEX, Pool, Token, OHLCVData, Trade, WatchlistEntry, CollectionMetadata
-from .sqlalchemy_manager import SQLAlchemyDatabaseManager
+from ..utils.lazy_imports import lazy_exports
+
+_LAZY_IMPORTS = {
+    'DatabaseConnection': '.connection',
+    'DatabaseManager': '.manager',
+    'SQLAlchemyDatabaseManager': '.sqlalchemy_manager',
+    'MigrationManager': '.migrations',
+    'create_migration_manager': '.migrations',
+    **dict.fromkeys([
+        'Base', 'DEX', 'Pool', 'Token', 'OHLCVData', 'Trade', 'WatchlistEntry', 'CollectionMetadata',
+    ], '.models'),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     'DatabaseConnection',
@@ -22,4 +31,4 @@ __all__ = [
     'Trade',
     'WatchlistEntry',
     'CollectionMetadata',
-]
\ No newline at end of file
+]
@@ -7,10 +7,10 @@ import logging
 import uuid
 import decimal
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncGenerator, Dict, List, Optional, Any, Union
 from decimal import Decimal
 
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import and_, desc, func, insert, select, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -21,6 +21,10 @@ from gecko_terminal_collector.database.models import (
     PerformanceMetrics as PerformanceMetricsModel,
     SystemAlerts as SystemAlertsModel,
 )
+from gecko_terminal_collector.models.core import Pool
+from gecko_terminal_collector.monitoring.write_behind import (
+    MonitoringWriteBehindQueue, WriteBehindConfig
+)
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +73,32 @@ class EnhancedDatabaseManager(SQLAlchemyDatabaseManager):
     metadata, execution history, performance metrics, and system alerts.
     """
     
+    monitoring_write_behind: Optional[MonitoringWriteBehindQueue] = None
+    
+    def enable_monitoring_write_behind(
+        self,
+        config: Optional[WriteBehindConfig] = None
+    ) -> MonitoringWriteBehindQueue:
+        """
+        Queue collection run metadata and persist it in batches.
+        
+        Once enabled, store_collection_run only enqueues the result; the
+        returned queue writes queued runs with multi-row inserts and must be
+        started and stopped by the caller.
+        
+        Args:
+            config: Write-behind configuration
+            
+        Returns:
+            The write-behind queue used by this manager
+        """
+        if self.monitoring_write_behind is None:
+            queue = MonitoringWriteBehindQueue(config)
+            queue.register_handler("collection_run", self.store_collection_runs)
+            self.monitoring_write_behind = queue
+        
+        return self.monitoring_write_behind
+    
     async def store_collection_run(self, result: CollectionResult) -> None:
         """
         Store comprehensive collection run information across all metadata tables.
@@ -76,6 +106,10 @@ class EnhancedDatabaseManager(SQLAlchemyDatabaseManager):
         Args:
             result: Collection result containing all run information
         """
+        if self.monitoring_write_behind is not None:
+            self.monitoring_write_behind.submit("collection_run", result)
+            return
+        
         with self.connection.get_session() as session:
             try:
                 # Store execution history
@@ -99,24 +133,145 @@ class EnhancedDatabaseManager(SQLAlchemyDatabaseManager):
                 logger.error(f"Error storing collection run metadata: {e}")
                 raise
     
+    def store_collection_runs(self, results: List[CollectionResult]) -> int:
+        """
+        Store a batch of collection runs in a single transaction.
+        
+        Execution history, performance metrics and alerts are written with
+        one multi-row INSERT each; collection metadata is updated per run.
+        Runs whose execution ID is already stored (or repeated within the
+        batch) are skipped. If the batch still violates a unique constraint,
+        e.g. because another writer stored the same rows concurrently, the
+        runs are stored one transaction at a time and only the conflicting
+        runs are dropped.
+        
+        Args:
+            results: Collection results to store
+            
+        Returns:
+            Number of collection runs stored
+        """
+        unique_results: Dict[str, CollectionResult] = {}
+        for result in results:
+            unique_results.setdefault(result.execution_id, result)
+        if not unique_results:
+            return 0
+        
+        with self.connection.get_session() as session:
+            try:
+                stored = self._insert_collection_runs(session, list(unique_results.values()))
+                session.commit()
+                
+            except IntegrityError as e:
+                session.rollback()
+                logger.warning(f"Collection run batch conflicts with stored rows, storing runs individually: {e}")
+                
+                stored = 0
+                for result in unique_results.values():
+                    try:
+                        stored += self._insert_collection_runs(session, [result])
+                        session.commit()
+                    except IntegrityError as e:
+                        session.rollback()
+                        logger.warning(f"Skipping collection run {result.execution_id}: {e}")
+                
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error storing collection run metadata batch: {e}")
+                raise
+        
+        logger.info(f"Stored metadata for {stored} collection runs")
+        return stored
+    
+    def _insert_collection_runs(self, session: Session, results: List[CollectionResult]) -> int:
+        """
+        Insert collection runs that are not stored yet within an open session.
+        
+        Args:
+            session: Open database session
+            results: Collection results with unique execution IDs
+            
+        Returns:
+            Number of collection runs inserted
+        """
+        stored_ids = set(session.scalars(
+            select(ExecutionHistoryModel.execution_id).where(
+                ExecutionHistoryModel.execution_id.in_([result.execution_id for result in results])
+            )
+        ))
+        results = [result for result in results if result.execution_id not in stored_ids]
+        if not results:
+            return 0
+        
+        session.execute(
+            insert(ExecutionHistoryModel),
+            [self._execution_history_row(result) for result in results]
+        )
+        
+        for result in results:
+            self._apply_collection_metadata(session, result)
+        
+        # One row per (collector_type, metric_name, timestamp)
+        metric_rows = {
+            (row["collector_type"], row["metric_name"], row["timestamp"]): row
+            for result in results
+            for row in self._performance_metric_rows(result)
+        }
+        if metric_rows:
+            stored_metrics = set(session.execute(
+                select(
+                    PerformanceMetricsModel.collector_type,
+                    PerformanceMetricsModel.metric_name,
+                    PerformanceMetricsModel.timestamp
+                ).where(
+                    PerformanceMetricsModel.collector_type.in_({key[0] for key in metric_rows}),
+                    PerformanceMetricsModel.timestamp.in_({key[2] for key in metric_rows})
+                )
+            ).tuples())
+            new_metric_rows = [row for key, row in metric_rows.items() if key not in stored_metrics]
+            if new_metric_rows:
+                session.execute(insert(PerformanceMetricsModel), new_metric_rows)
+        
+        alert_rows = {
+            row["alert_id"]: row
+            for row in (self._system_alert_row(result) for result in results if not result.success)
+        }
+        if alert_rows:
+            stored_alerts = set(session.scalars(
+                select(SystemAlertsModel.alert_id).where(SystemAlertsModel.alert_id.in_(list(alert_rows)))
+            ))
+            new_alert_rows = [row for alert_id, row in alert_rows.items() if alert_id not in stored_alerts]
+            if new_alert_rows:
+                session.execute(insert(SystemAlertsModel), new_alert_rows)
+        
+        return len(results)
+    
     async def _store_execution_history(self, session: Session, result: CollectionResult) -> None:
         """Store execution history record."""
-        execution_record = ExecutionHistoryModel(
-            collector_type=result.collector_type,
-            execution_id=result.execution_id,
-            start_time=result.start_time,
-            end_time=result.end_time,
-            status=result.status,
-            records_collected=result.records_collected,
-            execution_time=result.execution_time,
-            error_message="; ".join(result.errors) if result.errors else None,
-            warnings=json.dumps(result.warnings) if result.warnings else None,
-            execution_metadata=json.dumps(result.metadata) if result.metadata else None,
-        )
-        session.add(execution_record)
+        session.add(ExecutionHistoryModel(**self._execution_history_row(result)))
+    
+    @staticmethod
+    def _execution_history_row(result: CollectionResult) -> Dict[str, Any]:
+        """Build execution history column values for a collection run."""
+        return {
+            "collector_type": result.collector_type,
+            "execution_id": result.execution_id,
+            "start_time": result.start_time,
+            "end_time": result.end_time,
+            "status": result.status,
+            "records_collected": result.records_collected,
+            "execution_time": result.execution_time,
+            "error_message": "; ".join(result.errors) if result.errors else None,
+            "warnings": json.dumps(result.warnings) if result.warnings else None,
+            "execution_metadata": json.dumps(result.metadata) if result.metadata else None,
+        }
     
     async def _update_collection_metadata(self, session: Session, result: CollectionResult) -> None:
         """Update collection metadata with aggregated statistics."""
+        self._apply_collection_metadata(session, result)
+    
+    def _apply_collection_metadata(self, session: Session, result: CollectionResult) -> None:
+        """Apply a collection run to the aggregated metadata within an open session."""
         # Get or create collection metadata record
         metadata = session.query(CollectionMetadataModel).filter_by(
             collector_type=result.collector_type
@@ -180,6 +335,12 @@ class EnhancedDatabaseManager(SQLAlchemyDatabaseManager):
     
     async def _store_performance_metrics(self, session: Session, result: CollectionResult) -> None:
         """Store performance metrics from collection run."""
+        for row in self._performance_metric_rows(result):
+            session.add(PerformanceMetricsModel(**row))
+    
+    @staticmethod
+    def _performance_metric_rows(result: CollectionResult) -> List[Dict[str, Any]]:
+        """Build performance metric column values for a collection run."""
         base_metrics = [
             ("execution_time", result.execution_time),
             ("records_collected", result.records_collected),
@@ -193,7 +354,7 @@ class EnhancedDatabaseManager(SQLAlchemyDatabaseManager):
                 if isinstance(value, (int, float, Decimal)):
                     custom_metrics.append((key, value))
         
-        # Store all metrics
+        rows = []
         for metric_name, metric_value in base_metrics + custom_metrics:
             try:
                 # Convert metric value to Decimal safely
@@ -208,19 +369,25 @@ class EnhancedDatabaseManager(SQLAlchemyDatabaseManager):
                     logger.warning(f"Skipping non-numeric metric {metric_name}={metric_value}")
                     continue
                 
-                metric_record = PerformanceMetricsModel(
-                    collector_type=result.collector_type,
-                    metric_name=metric_name,
-                    metric_value=decimal_value,
-                    timestamp=result.end_time,
-                    labels=json.dumps({"execution_id": result.execution_id}),
-                )
-                session.add(metric_record)
+                rows.append({
+                    "collector_type": result.collector_type,
+                    "metric_name": metric_name,
+                    "metric_value": decimal_value,
+                    "timestamp": result.end_time,
+                    "labels": json.dumps({"execution_id": result.execution_id}),
+                })
             except (ValueError, TypeError, decimal.InvalidOperation) as e:
                 logger.warning(f"Skipping invalid metric {metric_name}={metric_value}: {e}")
+        
+        return rows
     
     async def _create_system_alert(self, session: Session, result: CollectionResult) -> None:
         """Create system alert for failed collection runs."""
+        session.add(SystemAlertsModel(**self._system_alert_row(result)))
+    
+    @staticmethod
+    def _system_alert_row(result: CollectionResult) -> Dict[str, Any]:
+        """Build system alert column values for a failed collection run."""
         alert_id = f"{result.collector_type}_{result.execution_id}_{int(result.end_time.timestamp())}"
         
         # Determine alert level based on error patterns
@@ -232,22 +399,21 @@ class EnhancedDatabaseManager(SQLAlchemyDatabaseManager):
         else:
             level = "error"
         
-        alert = SystemAlertsModel(
-            alert_id=alert_id,
-            level=level,
-            collector_type=result.collector_type,
-            message=f"Collection failed: {'; '.join(result.errors)}",
-            timestamp=result.end_time,
-            acknowledged=False,
-            resolved=False,
-            alert_metadata=json.dumps({
+        return {
+            "alert_id": alert_id,
+            "level": level,
+            "collector_type": result.collector_type,
+            "message": f"Collection failed: {'; '.join(result.errors)}",
+            "timestamp": result.end_time,
+            "acknowledged": False,
+            "resolved": False,
+            "alert_metadata": json.dumps({
                 "execution_id": result.execution_id,
                 "execution_time": result.execution_time,
                 "records_collected": result.records_collected,
                 "warnings": result.warnings,
             }),
-        )
-        session.add(alert)
+        }
     
     async def bulk_store_with_metadata(
         self,
@@ -630,28 +796,8 @@ class EnhancedDatabaseManager(SQLAlchemyDatabaseManager):
         """
         try:
             with self.connection.get_session() as session:
-                from gecko_terminal_collector.database.models import PoolModel
-                
-                pool_model = session.query(PoolModel).filter_by(address=address).first()
-                if pool_model:
-                    # Convert to Pool object
-                    from gecko_terminal_collector.models.core import Pool
-                    return Pool(
-                        id=pool_model.id,
-                        address=pool_model.address,
-                        name=pool_model.name,
-                        dex_id=pool_model.dex_id,
-                        base_token_id=pool_model.base_token_id,
-                        quote_token_id=pool_model.quote_token_id,
-                        reserve_usd=pool_model.reserve_usd,
-                        created_at=pool_model.created_at,
-                        activity_score=pool_model.activity_score,
-                        discovery_source=pool_model.discovery_source,
-                        collection_priority=pool_model.collection_priority,
-                        auto_discovered_at=pool_model.auto_discovered_at,
-                        last_activity_check=pool_model.last_activity_check
-                    )
-                return None
+                pool_model = session.query(self.PoolModel).filter_by(address=address).first()
+                return self._to_core_pool(pool_model) if pool_model else None
                 
         except Exception as e:
             logger.error(f"Error getting pool by address {address}: {e}")
@@ -659,7 +805,12 @@ class EnhancedDatabaseManager(SQLAlchemyDatabaseManager):
     
     async def search_pools_by_name_or_id(self, search_term: str, limit: int = 10) -> List:
         """
-        Search pools by name or ID.
+        Search pools by symbol or name.
+        
+        Exact matches on the indexed symbol_normalized column come first. The
+        substring search uses the FTS5 trigram table on SQLite and the pg_trgm
+        GIN indexes on PostgreSQL; terms shorter than a trigram fall back to
+        a plain case-insensitive LIKE.
         
         Args:
             search_term: Term to search for
@@ -668,37 +819,119 @@ class EnhancedDatabaseManager(SQLAlchemyDatabaseManager):
         Returns:
             List of Pool objects matching the search term
         """
+        if not search_term:
+            return []
+        
+        from gecko_terminal_collector.utils.pool_id_utils import PoolIDUtils
+        
+        normalized = PoolIDUtils.to_normalized_symbol(search_term)
         try:
             with self.connection.get_session() as session:
-                from gecko_terminal_collector.database.models import PoolModel
-                from gecko_terminal_collector.models.core import Pool
-                
-                # Search by ID or name (case-insensitive)
+                PoolModel = self.PoolModel
                 pool_models = session.query(PoolModel).filter(
-                    (PoolModel.id.ilike(f"%{search_term}%")) |
-                    (PoolModel.name.ilike(f"%{search_term}%"))
+                    PoolModel.symbol_normalized == normalized
                 ).limit(limit).all()
                 
-                pools = []
-                for pool_model in pool_models:
-                    pool = Pool(
-                        id=pool_model.id,
-                        address=pool_model.address,
-                        name=pool_model.name,
-                        dex_id=pool_model.dex_id,
-                        base_token_id=pool_model.base_token_id,
-                        quote_token_id=pool_model.quote_token_id,
-                        reserve_usd=pool_model.reserve_usd,
-                        created_at=pool_model.created_at
-                    )
-                    pools.append(pool)
+                remaining = limit - len(pool_models)
+                if remaining > 0:
+                    query = session.query(PoolModel)
+                    if pool_models:
+                        query = query.filter(PoolModel.id.notin_([p.id for p in pool_models]))
+                    
+                    if self._pool_symbol_fts and len(search_term) >= 3:
+                        # Quoted as a single FTS5 string so symbol punctuation is literal
+                        query = query.filter(text(
+                            "pools.rowid IN (SELECT rowid FROM pools_symbol_fts WHERE pools_symbol_fts MATCH :term)"
+                        )).params(term='"' + search_term.replace('"', '""') + '"')
+                    else:
+                        query = query.filter(
+                            PoolModel.symbol_normalized.ilike(f"%{normalized}%") |
+                            PoolModel.name.ilike(f"%{search_term}%")
+                        )
+                    pool_models.extend(query.limit(remaining).all())
                 
-                return pools
+                return [self._to_core_pool(pool_model) for pool_model in pool_models]
                 
         except Exception as e:
             logger.error(f"Error searching pools by name or ID '{search_term}': {e}")
             return []
     
+    async def iter_pool_ids(self, batch_size: int = 10000, limit: Optional[int] = None) -> AsyncGenerator[List[str], None]:
+        """
+        Stream pool IDs in batches without materializing pool rows.
+        
+        Uses a server-side cursor where the driver supports one, so memory
+        stays bounded by the batch size rather than the number of pools.
+        
+        Args:
+            batch_size: Number of IDs fetched per batch
+            limit: Optional limit on the total number of IDs
+            
+        Yields:
+            Lists of pool IDs
+        """
+        query = select(self.PoolModel.id).execution_options(stream_results=True, yield_per=batch_size)
+        if limit:
+            query = query.limit(limit)
+        
+        with self.connection.get_session() as session:
+            for partition in session.execute(query).scalars().partitions(batch_size):
+                yield partition
+    
+    async def get_pools_by_symbols(self, symbols: List[str], chunk_size: int = 500) -> List:
+        """
+        Get pools matching any of the given symbols or addresses.
+        
+        Symbols are matched case-insensitively against the indexed
+        symbol_normalized column, and as-is against pool addresses.
+        
+        Args:
+            symbols: Symbols or pool addresses to look up
+            chunk_size: Maximum number of values bound per query
+            
+        Returns:
+            List of matching Pool objects
+        """
+        from gecko_terminal_collector.utils.pool_id_utils import PoolIDUtils
+        
+        symbols = list(dict.fromkeys(symbol for symbol in symbols if symbol))
+        pools = {}
+        try:
+            with self.connection.get_session() as session:
+                PoolModel = self.PoolModel
+                for i in range(0, len(symbols), chunk_size):
+                    chunk = symbols[i:i + chunk_size]
+                    normalized = list({PoolIDUtils.to_normalized_symbol(symbol) for symbol in chunk})
+                    pool_models = session.query(PoolModel).filter(
+                        PoolModel.symbol_normalized.in_(normalized) | PoolModel.address.in_(chunk)
+                    ).all()
+                    for pool_model in pool_models:
+                        pools[pool_model.id] = self._to_core_pool(pool_model)
+            
+            return list(pools.values())
+            
+        except Exception as e:
+            logger.error(f"Error getting pools for {len(symbols)} symbols: {e}")
+            return []
+    
+    def _to_core_pool(self, pool_model) -> Pool:
+        """Convert a pool model row to a core Pool object."""
+        return Pool(
+            id=pool_model.id,
+            address=pool_model.address,
+            name=pool_model.name,
+            dex_id=pool_model.dex_id,
+            base_token_id=pool_model.base_token_id,
+            quote_token_id=pool_model.quote_token_id,
+            reserve_usd=pool_model.reserve_usd,
+            created_at=pool_model.created_at,
+            activity_score=pool_model.activity_score,
+            discovery_source=pool_model.discovery_source,
+            collection_priority=pool_model.collection_priority,
+            auto_discovered_at=pool_model.auto_discovered_at,
+            last_activity_check=pool_model.last_activity_check
+        )
+    
     async def store_enhanced_new_pools_history(self, history_entry: Any) -> None:
         """
         Store enhanced new pools history entry.
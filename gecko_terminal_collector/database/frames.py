@@ -0,0 +1,146 @@
+"""
+Columnar frames for analytical reads.
+
+get_ohlcv_data/get_trade_data/get_pool_history hydrate one ORM object and
+one record of Decimal fields per row, which analytical consumers then
+convert straight back to floats. The frame readers select only the columns
+below with a Core SELECT, cast numeric columns to floating point in the
+database and decode each result column into one typed array: float64 for
+prices, amounts and volumes, int64 for timestamps and counts and naive
+UTC datetime64 for times, whether the backend returns naive or
+time-zone-aware values. Frames are pandas DataFrames; use
+DataFrame[column].to_numpy() for raw arrays or pyarrow.Table.from_pandas()
+where an Arrow table is needed.
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence, Union
+
+import pandas as pd
+from sqlalchemy import Float, cast
+
+# Frame columns and their dtypes, in column order
+OHLCV_FRAME_COLUMNS: Dict[str, str] = {
+    'pool_id': 'object',
+    'timeframe': 'object',
+    'timestamp': 'int64',
+    'datetime': 'datetime64[ns]',
+    'open_price': 'float64',
+    'high_price': 'float64',
+    'low_price': 'float64',
+    'close_price': 'float64',
+    'volume_usd': 'float64',
+}
+
+TRADE_FRAME_COLUMNS: Dict[str, str] = {
+    'id': 'object',
+    'pool_id': 'object',
+    'block_number': 'Int64',  # nullable
+    'from_token_amount': 'float64',
+    'to_token_amount': 'float64',
+    'price_usd': 'float64',
+    'volume_usd': 'float64',
+    'side': 'object',
+    'block_timestamp': 'datetime64[ns]',
+}
+
+# Missing counts read as 0, matching get_pool_history
+POOL_HISTORY_FRAME_COLUMNS: Dict[str, str] = {
+    'pool_id': 'object',
+    'collected_at': 'datetime64[ns]',
+    'volume_usd_h24': 'float64',
+    'reserve_in_usd': 'float64',
+    'price_change_percentage_h1': 'float64',
+    'price_change_percentage_h24': 'float64',
+    'transactions_h1_buys': 'int64',
+    'transactions_h1_sells': 'int64',
+    'transactions_h24_buys': 'int64',
+    'transactions_h24_sells': 'int64',
+}
+
+
+def as_pool_ids(pool_ids: Union[str, Iterable[str]]) -> List[str]:
+    """Normalize a single pool ID or an iterable of pool IDs to a list."""
+    if isinstance(pool_ids, str):
+        return [pool_ids]
+    return list(dict.fromkeys(pool_ids))
+
+
+def select_columns(model, columns: Dict[str, str]) -> List[Any]:
+    """Model columns for a frame SELECT, with float columns cast in the database."""
+    return [
+        cast(getattr(model, name), Float).label(name) if dtype == 'float64' else getattr(model, name)
+        for name, dtype in columns.items()
+    ]
+
+
+def rows_to_frame(rows: Sequence[Sequence[Any]], columns: Dict[str, str]) -> pd.DataFrame:
+    """
+    Decode result rows into a frame of typed columns.
+
+    Args:
+        rows: Row tuples in the column order of columns
+        columns: Frame columns and their dtypes
+
+    Returns:
+        DataFrame with one typed array per column
+    """
+    frame = pd.DataFrame.from_records(rows, columns=list(columns), coerce_float=True)
+    for name, dtype in columns.items():
+        if dtype == 'datetime64[ns]':
+            # TIMESTAMPTZ columns decode tz-aware; naive values are taken as UTC
+            frame[name] = pd.to_datetime(frame[name], utc=True).dt.tz_localize(None)
+        elif dtype == 'int64':
+            frame[name] = frame[name].fillna(0).astype('int64')
+        elif dtype != 'object':
+            frame[name] = frame[name].astype(dtype)
+    return frame
+
+
+def ohlcv_records_to_frame(records: Iterable[Any]) -> pd.DataFrame:
+    """Build an OHLCV frame from OHLCVRecord objects."""
+    return rows_to_frame(
+        [tuple(getattr(record, name) for name in OHLCV_FRAME_COLUMNS) for record in records],
+        OHLCV_FRAME_COLUMNS
+    )
+
+
+def trade_records_to_frame(records: Iterable[Any]) -> pd.DataFrame:
+    """Build a trade frame from TradeRecord objects."""
+    return rows_to_frame(
+        [tuple(getattr(record, name) for name in TRADE_FRAME_COLUMNS) for record in records],
+        TRADE_FRAME_COLUMNS
+    )
+
+
+def pool_history_to_frame(pool_id: str, history: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+    """Build a pool history frame from get_pool_history dictionaries."""
+    return rows_to_frame(
+        [
+            tuple(pool_id if name == 'pool_id' else entry.get(name) for name in POOL_HISTORY_FRAME_COLUMNS)
+            for entry in history
+        ],
+        POOL_HISTORY_FRAME_COLUMNS
+    )
+
+
+def pool_history_records(frame: pd.DataFrame) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Split a pool history frame into get_pool_history dictionaries per pool.
+
+    Args:
+        frame: Pool history frame
+
+    Returns:
+        Dictionary mapping pool IDs to their history, newest first
+    """
+    frame = frame.sort_values(['pool_id', 'collected_at'], ascending=[True, False])
+    numeric = [name for name, dtype in POOL_HISTORY_FRAME_COLUMNS.items() if dtype == 'float64']
+    frame[numeric] = frame[numeric].fillna(0.0)
+
+    history = {}
+    for pool_id, pool_frame in frame.groupby('pool_id', sort=False):
+        entries = pool_frame.drop(columns='pool_id').to_dict('records')
+        for entry in entries:
+            entry['collected_at'] = entry['collected_at'].to_pydatetime()
+        history[pool_id] = entries
+    return history
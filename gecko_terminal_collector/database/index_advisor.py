@@ -0,0 +1,915 @@
+"""
+Workload-driven index advisor.
+
+IndexAdvisor records the SQL a database manager issues while a workload
+runs. Each statement is attributed to the DatabaseManager method it came
+from through the tracing spans that instrument_methods puts around every
+get_*/store_* method. After recording, audit() captures the query plan of
+every distinct read statement (EXPLAIN QUERY PLAN on SQLite, EXPLAIN
+(ANALYZE, FORMAT JSON) on PostgreSQL) and reports:
+
+- full table scans, with an index suggested from the filter columns of the
+  statement: its equality columns first, then one range column
+- indexes no recorded plan used, and indexes whose columns are a leading
+  prefix of another index on the same table
+- the write cost of every index: index entries maintained per row written
+  to its table during the workload, and the index size
+
+Suggestions render as an Alembic migration that only creates an index when
+no index on the same columns exists and drops indexes by name if present,
+so the same migration converges SQLite and PostgreSQL databases to one
+index set. index_parity() compares the index sets of the two model modules.
+
+PostgreSQL plans depend on table statistics: audit a database with
+production-sized tables, where the planner has a reason to use indexes.
+"""
+
+import json
+import logging
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from sqlalchemy import Column, event, inspect, text
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import BinaryExpression
+
+from gecko_terminal_collector.monitoring.tracing import current_span_path, tracer
+
+logger = logging.getLogger(__name__)
+
+
+EQUALITY_OPERATORS = (operators.eq, operators.in_op)
+RANGE_OPERATORS = (operators.lt, operators.le, operators.gt, operators.ge, operators.between_op)
+
+# PostgreSQL truncates longer identifiers
+MAX_INDEX_NAME_LENGTH = 63
+
+_START_TIMES_KEY = 'index_advisor_start_times'
+_WRITE_STATEMENT = re.compile(
+    r'^\s*(INSERT|UPDATE|DELETE|REPLACE)\b(?:\s+OR\s+\w+)?(?:\s+INTO|\s+FROM)?\s+"?(\w+)"?',
+    re.IGNORECASE
+)
+_SET_CLAUSE = re.compile(r'\bSET\s+(.*?)(?:\bWHERE\b|\bRETURNING\b|$)', re.IGNORECASE | re.DOTALL)
+_SET_COLUMN = re.compile(r'"?(\w+)"?\s*=')
+_SQLITE_SCAN = re.compile(r'^SCAN (\w+)')
+_SQLITE_INDEX = re.compile(r'USING (?:COVERING )?INDEX (\S+)')
+
+_POSTGRESQL_INDEXES = text("""
+    SELECT t.relname, i.relname, ix.indisunique,
+           ix.indisprimary OR EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = ix.indexrelid),
+           ix.indpred IS NOT NULL,
+           array(SELECT pg_get_indexdef(ix.indexrelid, k, true)
+                 FROM generate_series(1, ix.indnatts) AS k ORDER BY k),
+           pg_relation_size(ix.indexrelid),
+           s.idx_scan
+    FROM pg_index ix
+    JOIN pg_class t ON t.oid = ix.indrelid
+    JOIN pg_class i ON i.oid = ix.indexrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    LEFT JOIN pg_stat_user_indexes s ON s.indexrelid = ix.indexrelid
+    WHERE n.nspname = current_schema() AND t.relname = ANY(:tables)
+""")
+
+
+@dataclass
+class RecordedStatement:
+    """A distinct statement issued by one manager method during the workload."""
+    method: str
+    sql: str
+    kind: str  # 'read' or 'write'
+    parameters: Any = None  # First parameters seen, used to explain the statement
+    filters: Dict[str, Tuple[List[str], List[str]]] = field(default_factory=dict)  # table -> (equality, range)
+    operation: Optional[str] = None  # INSERT, UPDATE or DELETE for writes
+    table: Optional[str] = None  # Written table
+    set_columns: Optional[Set[str]] = None  # Columns changed by an UPDATE (None if unknown)
+    calls: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+    plan: List[str] = field(default_factory=list)
+    plan_error: Optional[str] = None
+    scanned_tables: Set[str] = field(default_factory=set)
+    used_indexes: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class IndexInfo:
+    """An index as found in the database."""
+    table: str
+    name: str
+    columns: Tuple[str, ...]
+    unique: bool = False
+    constraint: bool = False  # Backs a primary key or unique constraint
+    partial: bool = False
+    size_bytes: Optional[int] = None
+    scans: Optional[int] = None  # PostgreSQL pg_stat_user_indexes.idx_scan
+
+
+@dataclass
+class IndexWriteCost:
+    """Write cost of one index over the workload."""
+    table: str
+    index: str
+    columns: Tuple[str, ...]
+    row_writes: int
+    entries_written: int
+    size_bytes: Optional[int] = None
+    estimated_bytes_written: Optional[int] = None
+    observed: bool = True  # False when the workload did not write the table
+
+    @property
+    def entries_per_row(self) -> float:
+        return self.entries_written / self.row_writes if self.row_writes else 1.0
+
+
+@dataclass
+class IndexSuggestion:
+    """An index to create or drop."""
+    action: str  # 'create' or 'drop'
+    table: str
+    name: str
+    columns: Tuple[str, ...]
+    reason: str
+
+
+@dataclass
+class IndexAuditReport:
+    """Findings of an index audit."""
+    dialect: str
+    statements: List[RecordedStatement] = field(default_factory=list)
+    indexes: Dict[str, List[IndexInfo]] = field(default_factory=dict)
+    full_scans: List[Dict[str, Any]] = field(default_factory=list)
+    unused_indexes: List[IndexInfo] = field(default_factory=list)
+    redundant_indexes: List[Tuple[IndexInfo, IndexInfo]] = field(default_factory=list)  # (redundant, covered by)
+    write_costs: List[IndexWriteCost] = field(default_factory=list)
+    write_amplification: Dict[str, float] = field(default_factory=dict)  # table -> writes per row written
+    suggestions: List[IndexSuggestion] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form of the report."""
+        return {
+            'dialect': self.dialect,
+            'statements': [
+                {
+                    'method': s.method, 'kind': s.kind, 'sql': s.sql, 'calls': s.calls, 'rows': s.rows,
+                    'seconds': round(s.seconds, 6), 'plan': s.plan, 'plan_error': s.plan_error,
+                    'full_scans': sorted(s.scanned_tables), 'indexes_used': sorted(s.used_indexes)
+                }
+                for s in self.statements
+            ],
+            'full_scans': self.full_scans,
+            'unused_indexes': [asdict(index) for index in self.unused_indexes],
+            'redundant_indexes': [
+                {'index': asdict(redundant), 'covered_by': covering.name}
+                for redundant, covering in self.redundant_indexes
+            ],
+            'write_costs': [
+                dict(asdict(cost), entries_per_row=round(cost.entries_per_row, 3)) for cost in self.write_costs
+            ],
+            'write_amplification': {table: round(value, 3) for table, value in self.write_amplification.items()},
+            'suggestions': [asdict(suggestion) for suggestion in self.suggestions],
+        }
+
+    def format_summary(self) -> str:
+        """Human-readable summary of the findings."""
+        lines = [f"Index audit ({self.dialect}): {len(self.statements)} distinct statements recorded"]
+
+        lines.append(f"\nFull scans ({len(self.full_scans)}):")
+        for scan in self.full_scans:
+            suggestion = ', '.join(scan['suggested_columns']) or 'no filter columns'
+            lines.append(f"  {scan['method']}: {scan['table']} x{scan['calls']} -> ({suggestion})")
+
+        lines.append(f"\nUnused indexes ({len(self.unused_indexes)}):")
+        for index in self.unused_indexes:
+            note = ' [enforces constraint]' if index.constraint else ''
+            lines.append(f"  {index.table}.{index.name} ({', '.join(index.columns)}){note}")
+
+        lines.append(f"\nRedundant indexes ({len(self.redundant_indexes)}):")
+        for redundant, covering in self.redundant_indexes:
+            lines.append(f"  {redundant.table}.{redundant.name} is covered by {covering.name}")
+
+        lines.append("\nWrite amplification (writes per row written):")
+        for table, amplification in sorted(self.write_amplification.items()):
+            lines.append(f"  {table}: {amplification:.2f}x")
+        for cost in self.write_costs:
+            size = f", {cost.size_bytes / 1024:.0f} KiB" if cost.size_bytes is not None else ''
+            observed = '' if cost.observed else ' (estimated, table not written)'
+            lines.append(
+                f"  {cost.table}.{cost.index}: {cost.entries_per_row:.2f} entries/row{size}{observed}"
+            )
+
+        lines.append(f"\nSuggestions ({len(self.suggestions)}):")
+        for suggestion in self.suggestions:
+            lines.append(
+                f"  {suggestion.action} {suggestion.table}.{suggestion.name} "
+                f"({', '.join(suggestion.columns)}): {suggestion.reason}"
+            )
+        return '\n'.join(lines)
+
+
+def statement_filters(statement) -> Dict[str, Tuple[List[str], List[str]]]:
+    """
+    Equality and range filter columns per table of a SQLAlchemy statement.
+
+    Args:
+        statement: Select, Update or Delete construct
+
+    Returns:
+        Dictionary mapping table names to (equality columns, range columns)
+    """
+    filters: Dict[str, Tuple[List[str], List[str]]] = {}
+    where = getattr(statement, 'whereclause', None)
+    if where is None:
+        return filters
+
+    for element in visitors.iterate(where):
+        if not isinstance(element, BinaryExpression) or not isinstance(element.left, Column):
+            continue
+        table = getattr(element.left.table, 'name', None)
+        if table is None:
+            continue
+        if element.operator in EQUALITY_OPERATORS:
+            columns = filters.setdefault(table, ([], []))[0]
+        elif element.operator in RANGE_OPERATORS:
+            columns = filters.setdefault(table, ([], []))[1]
+        else:
+            continue
+        if element.left.name not in columns:
+            columns.append(element.left.name)
+    return filters
+
+
+def suggested_index_columns(filters: Tuple[List[str], List[str]]) -> Tuple[str, ...]:
+    """Index columns serving a filter: equality columns, then one range column."""
+    equality, ranges = filters
+    return tuple(equality) + tuple(column for column in ranges[:1] if column not in equality)
+
+
+def index_name(table: str, columns: Sequence[str]) -> str:
+    """Name for a suggested index."""
+    return f"idx_{table}_{'_'.join(columns)}"[:MAX_INDEX_NAME_LENGTH]
+
+
+def _statement_kind(sql: str) -> Optional[str]:
+    words = sql.lstrip().split(None, 1)
+    keyword = words[0].upper() if words else ''
+    if keyword in ('SELECT', 'WITH'):
+        return 'read'
+    if keyword in ('INSERT', 'UPDATE', 'DELETE', 'REPLACE'):
+        return 'write'
+    return None
+
+
+def _current_method() -> str:
+    """Innermost database manager span, else the innermost span."""
+    path = current_span_path()
+    for name in reversed(path):
+        if 'Manager.' in name:
+            return name
+    return path[-1] if path else 'unattributed'
+
+
+def _covers(index: IndexInfo, columns: Sequence[str]) -> bool:
+    """Whether a full index has the given columns as its leading columns."""
+    return not index.partial and index.columns[:len(columns)] == tuple(columns)
+
+
+class IndexAdvisor:
+    """
+    Record the statements of a workload and audit the indexes they need.
+
+    Usage:
+        advisor = IndexAdvisor(db_manager)
+        with advisor.record():
+            await run_workload(db_manager, pool_ids)
+        report = advisor.audit()
+    """
+
+    def __init__(self, db_manager, analyze: bool = True):
+        """
+        Initialize the advisor.
+
+        Args:
+            db_manager: Database manager whose engine is recorded
+            analyze: Use EXPLAIN ANALYZE on PostgreSQL (runs each read statement once more)
+        """
+        self.db_manager = db_manager
+        self.engine = db_manager.connection.engine
+        self.analyze = analyze
+        self._statements: Dict[Tuple[str, str], RecordedStatement] = {}
+
+    @property
+    def statements(self) -> List[RecordedStatement]:
+        return list(self._statements.values())
+
+    @contextmanager
+    def record(self):
+        """Record the statements executed on the engine inside this block."""
+        # Spans attribute statements to manager methods
+        was_tracing = tracer.enabled
+        if not was_tracing:
+            tracer.toggle()
+        event.listen(self.engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(self.engine, 'after_cursor_execute', self._after_cursor_execute)
+        try:
+            yield self
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.remove(self.engine, 'after_cursor_execute', self._after_cursor_execute)
+            if not was_tracing:
+                tracer.toggle()
+
+    def reset(self) -> None:
+        """Forget all recorded statements."""
+        self._statements.clear()
+
+    def audit(
+        self,
+        extra_tables: Iterable[str] = (),
+        drop_unused: bool = False,
+        min_table_rows: int = 1000
+    ) -> IndexAuditReport:
+        """
+        Explain the recorded read statements and analyze the indexes of the tables involved.
+
+        Args:
+            extra_tables: Tables to include in the index and write cost analysis
+                even if the workload did not touch them
+            drop_unused: Suggest dropping unused indexes of tables the workload reads
+            min_table_rows: Tables with fewer rows are cheaper to scan than to
+                index, full scans of them get no index suggestion
+
+        Returns:
+            IndexAuditReport with findings and suggestions
+        """
+        report = IndexAuditReport(dialect=self.engine.dialect.name, statements=self.statements)
+
+        with self.engine.connect() as connection:
+            known_tables = set(inspect(connection).get_table_names())
+            for statement in report.statements:
+                if statement.kind == 'read':
+                    self._explain(connection, statement, known_tables)
+
+            read_tables, written_tables = self._workload_tables(known_tables)
+            tables = read_tables | written_tables | (set(extra_tables) & known_tables)
+            report.indexes = self._load_indexes(connection, sorted(tables))
+            row_counts = {
+                table: connection.execute(
+                    text(f"SELECT COUNT(*) FROM {connection.dialect.identifier_preparer.quote(table)}")
+                ).scalar()
+                for table in tables
+            }
+
+        used = set().union(*(s.used_indexes for s in report.statements))
+        self._find_full_scans(report)
+        self._find_unused(report, read_tables, used)
+        self._find_redundant(report)
+        self._estimate_write_costs(report, row_counts)
+        small_tables = {table for table, count in row_counts.items() if count < min_table_rows}
+        self._suggest(report, read_tables, drop_unused, small_tables)
+        return report
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start_times = conn.info.get(_START_TIMES_KEY)
+        elapsed = time.perf_counter() - start_times.pop() if start_times else 0.0
+
+        kind = _statement_kind(statement)
+        if kind is None:
+            return
+
+        method = _current_method()
+        recorded = self._statements.get((method, statement))
+        if recorded is None:
+            compiled = getattr(context, 'compiled', None)
+            recorded = RecordedStatement(
+                method=method,
+                sql=statement,
+                kind=kind,
+                parameters=parameters[0] if executemany and parameters else parameters,
+                filters=statement_filters(compiled.statement) if compiled is not None else {}
+            )
+            if kind == 'write':
+                self._describe_write(recorded)
+            self._statements[(method, statement)] = recorded
+
+        recorded.calls += 1
+        recorded.seconds += elapsed
+        if kind == 'write':
+            rowcount = getattr(cursor, 'rowcount', -1)
+            if rowcount is None or rowcount < 0:
+                rowcount = len(parameters) if executemany else 1
+            recorded.rows += rowcount
+
+    @staticmethod
+    def _describe_write(recorded: RecordedStatement) -> None:
+        """Fill in the operation, table and changed columns of a write."""
+        match = _WRITE_STATEMENT.match(recorded.sql)
+        if not match:
+            return
+        operation = match.group(1).upper()
+        recorded.operation = 'INSERT' if operation == 'REPLACE' else operation
+        recorded.table = match.group(2)
+        if recorded.operation == 'UPDATE':
+            clause = _SET_CLAUSE.search(recorded.sql)
+            if clause:
+                recorded.set_columns = set(_SET_COLUMN.findall(clause.group(1)))
+
+    def _explain(self, connection, statement: RecordedStatement, known_tables: Set[str]) -> None:
+        """Capture the plan of a read statement."""
+        try:
+            if connection.dialect.name == 'postgresql':
+                self._explain_postgresql(connection, statement)
+            else:
+                self._explain_sqlite(connection, statement)
+        except Exception as e:
+            statement.plan_error = str(e)
+            logger.warning(f"Could not explain statement of {statement.method}: {e}")
+        finally:
+            connection.rollback()
+        statement.scanned_tables &= known_tables
+
+    def _explain_sqlite(self, connection, statement: RecordedStatement) -> None:
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement.sql}", statement.parameters).fetchall()
+        statement.plan = [row[-1] for row in rows]
+        for detail in statement.plan:
+            scan = _SQLITE_SCAN.match(detail)
+            if scan:
+                # Also a full scan when walking a whole index to avoid a sort
+                statement.scanned_tables.add(scan.group(1))
+            index = _SQLITE_INDEX.search(detail)
+            if index:
+                statement.used_indexes.add(index.group(1))
+
+    def _explain_postgresql(self, connection, statement: RecordedStatement) -> None:
+        options = 'ANALYZE, FORMAT JSON' if self.analyze else 'FORMAT JSON'
+        plan = connection.exec_driver_sql(f"EXPLAIN ({options}) {statement.sql}", statement.parameters).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        nodes = [plan[0]['Plan']]
+        while nodes:
+            node = nodes.pop()
+            nodes.extend(node.get('Plans', []))
+            relation = node.get('Relation Name')
+            detail = node['Node Type'] + (f" on {relation}" if relation else '')
+            if 'Index Name' in node:
+                detail += f" using {node['Index Name']}"
+                statement.used_indexes.add(node['Index Name'])
+            if 'Actual Total Time' in node:
+                detail += f" ({node['Actual Total Time']:.3f} ms, {node.get('Actual Rows', 0)} rows)"
+            statement.plan.append(detail)
+            if node['Node Type'] == 'Seq Scan' and relation:
+                statement.scanned_tables.add(relation)
+
+    def _workload_tables(self, known_tables: Set[str]) -> Tuple[Set[str], Set[str]]:
+        """Tables read and tables written by the recorded statements."""
+        read_tables, written_tables = set(), set()
+        for statement in self._statements.values():
+            if statement.kind == 'write':
+                if statement.table in known_tables:
+                    written_tables.add(statement.table)
+                continue
+            read_tables.update(
+                table for table in known_tables if re.search(rf'\b{re.escape(table)}\b', statement.sql)
+            )
+        return read_tables, written_tables
+
+    def _load_indexes(self, connection, tables: List[str]) -> Dict[str, List[IndexInfo]]:
+        indexes: Dict[str, List[IndexInfo]] = {table: [] for table in tables}
+        if not tables:
+            return indexes
+
+        if connection.dialect.name == 'postgresql':
+            for table, name, unique, constraint, partial, columns, size, scans in connection.execute(
+                _POSTGRESQL_INDEXES, {'tables': tables}
+            ):
+                indexes[table].append(IndexInfo(
+                    table=table, name=name, columns=tuple(columns), unique=unique, constraint=constraint,
+                    partial=partial, size_bytes=size, scans=scans
+                ))
+            return indexes
+
+        quote = connection.dialect.identifier_preparer.quote
+        sizes = self._sqlite_index_sizes(connection)
+        for table in tables:
+            for _, name, unique, origin, partial in connection.exec_driver_sql(f"PRAGMA index_list({quote(table)})"):
+                columns = tuple(row[2] for row in connection.exec_driver_sql(f"PRAGMA index_info({quote(name)})"))
+                indexes[table].append(IndexInfo(
+                    table=table, name=name, columns=columns, unique=bool(unique),
+                    constraint=origin in ('u', 'pk'), partial=bool(partial), size_bytes=sizes.get(name)
+                ))
+        return indexes
+
+    @staticmethod
+    def _sqlite_index_sizes(connection) -> Dict[str, int]:
+        """Index sizes from the dbstat virtual table, if SQLite was built with it."""
+        try:
+            return dict(connection.exec_driver_sql("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name").fetchall())
+        except Exception:
+            return {}
+
+    def _find_full_scans(self, report: IndexAuditReport) -> None:
+        for statement in report.statements:
+            for table in sorted(statement.scanned_tables):
+                filters = statement.filters.get(table, ([], []))
+                report.full_scans.append({
+                    'method': statement.method,
+                    'table': table,
+                    'calls': statement.calls,
+                    'seconds': round(statement.seconds, 6),
+                    'sql': statement.sql,
+                    'suggested_columns': list(suggested_index_columns(filters)),
+                })
+
+    def _find_unused(self, report: IndexAuditReport, read_tables: Set[str], used: Set[str]) -> None:
+        for table in sorted(read_tables):
+            for index in report.indexes.get(table, []):
+                # PostgreSQL statistics also count scans from outside the workload
+                if index.name not in used and not index.scans:
+                    report.unused_indexes.append(index)
+
+    def _find_redundant(self, report: IndexAuditReport) -> None:
+        for table_indexes in report.indexes.values():
+            for index in table_indexes:
+                if index.constraint or index.unique or index.partial:
+                    continue
+                for other in table_indexes:
+                    if other is index or not _covers(other, index.columns):
+                        continue
+                    # Of two indexes on the same columns keep the constraint or the first by name
+                    if len(other.columns) == len(index.columns) and not other.constraint and not other.unique \
+                            and other.name > index.name:
+                        continue
+                    report.redundant_indexes.append((index, other))
+                    break
+
+    def _estimate_write_costs(self, report: IndexAuditReport, row_counts: Dict[str, int]) -> None:
+        writes = [s for s in report.statements if s.kind == 'write' and s.table in report.indexes]
+        for table, table_indexes in sorted(report.indexes.items()):
+            table_writes = [s for s in writes if s.table == table]
+            row_writes = sum(s.rows for s in table_writes)
+            observed = row_writes > 0
+
+            total_entries = 0
+            for index in table_indexes:
+                if observed:
+                    entries = 0
+                    for statement in table_writes:
+                        if statement.operation != 'UPDATE':
+                            entries += statement.rows
+                        elif statement.set_columns is None or statement.set_columns & set(index.columns):
+                            entries += 2 * statement.rows  # Old entry removed, new entry added
+                else:
+                    entries = 0  # Reported per inserted row below
+                total_entries += entries
+
+                bytes_per_entry = (
+                    index.size_bytes / row_counts[table]
+                    if index.size_bytes is not None and row_counts.get(table) else None
+                )
+                report.write_costs.append(IndexWriteCost(
+                    table=table,
+                    index=index.name,
+                    columns=index.columns,
+                    row_writes=row_writes,
+                    entries_written=entries if observed else 1,
+                    size_bytes=index.size_bytes,
+                    estimated_bytes_written=int(entries * bytes_per_entry) if observed and bytes_per_entry else None,
+                    observed=observed
+                ))
+
+            # Every row write touches the table itself plus the indexes it maintains
+            report.write_amplification[table] = (
+                1 + total_entries / row_writes if observed else 1.0 + len(table_indexes)
+            )
+
+    def _suggest(
+        self, report: IndexAuditReport, read_tables: Set[str], drop_unused: bool, small_tables: Set[str]
+    ) -> None:
+        suggestions: Dict[Tuple[str, str], IndexSuggestion] = {}
+        created: Dict[str, List[Tuple[str, ...]]] = {}
+
+        for scan in report.full_scans:
+            table, columns = scan['table'], tuple(scan['suggested_columns'])
+            if not columns or table in small_tables \
+                    or any(_covers(index, columns) for index in report.indexes.get(table, [])):
+                continue
+            if any(existing[:len(columns)] == columns for existing in created.get(table, [])):
+                continue
+            # A longer suggestion replaces shorter ones it covers
+            for shorter in [c for c in created.get(table, []) if columns[:len(c)] == c]:
+                created[table].remove(shorter)
+                suggestions.pop(('create', index_name(table, shorter)), None)
+            created.setdefault(table, []).append(columns)
+            name = index_name(table, columns)
+            suggestions[('create', name)] = IndexSuggestion(
+                'create', table, name, columns, f"full scan in {scan['method']}"
+            )
+
+        for redundant, covering in report.redundant_indexes:
+            suggestions[('drop', redundant.name)] = IndexSuggestion(
+                'drop', redundant.table, redundant.name, redundant.columns, f"covered by {covering.name}"
+            )
+
+        # Existing indexes made redundant by a suggested one
+        for table, columns_list in created.items():
+            for columns in columns_list:
+                for index in report.indexes.get(table, []):
+                    if not (index.constraint or index.unique or index.partial) \
+                            and len(index.columns) < len(columns) and columns[:len(index.columns)] == index.columns:
+                        suggestions[('drop', index.name)] = IndexSuggestion(
+                            'drop', table, index.name, index.columns, f"covered by {index_name(table, columns)}"
+                        )
+
+        if drop_unused:
+            for index in report.unused_indexes:
+                if index.table in read_tables and not (index.constraint or index.unique):
+                    suggestions.setdefault(('drop', index.name), IndexSuggestion(
+                        'drop', index.table, index.name, index.columns, "not used by any workload query"
+                    ))
+
+        report.suggestions = sorted(suggestions.values(), key=lambda s: (s.action, s.table, s.name))
+
+
+MIGRATION_TEMPLATE = '''"""{message}
+
+Revision ID: {revision}_{slug}
+Revises: {down_revision}
+Create Date: {create_date}
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '{revision}'
+down_revision = {down_revision_literal}
+branch_labels = None
+depends_on = None
+
+# (table, index, columns)
+CREATE_INDEXES = [{create_indexes}]
+# Indexes an earlier revision owns: created if missing, kept on downgrade
+ENSURE_INDEXES = [{ensure_indexes}]
+# (table, index, columns, dialect the index exists on or None for any)
+DROP_INDEXES = [{drop_indexes}]
+
+
+def _indexed_columns(table):
+    """Column lists of the indexes and unique constraints of a table, or None if it does not exist."""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    columns = {{tuple(index['column_names']) for index in inspector.get_indexes(table)}}
+    columns.update(tuple(constraint['column_names']) for constraint in inspector.get_unique_constraints(table))
+    return columns
+
+
+def _applies(dialect):
+    """Whether an entry limited to a backend applies to the one being migrated."""
+    return dialect is None or dialect == op.get_bind().dialect.name
+
+
+def upgrade():
+    """Create missing indexes under any name and drop redundant ones on both backends."""
+    for table, name, columns in CREATE_INDEXES + ENSURE_INDEXES:
+        existing = _indexed_columns(table)
+        if existing is not None and tuple(columns) not in existing:
+            op.create_index(name, table, columns)
+
+    for table, name, columns, dialect in DROP_INDEXES:
+        if _applies(dialect):
+            op.execute(f"DROP INDEX IF EXISTS {{name}}")
+
+
+def downgrade():
+    """Restore dropped indexes on their backend and drop the ones only this revision creates."""
+    for table, name, columns, dialect in DROP_INDEXES:
+        if _applies(dialect) and _indexed_columns(table) is not None:
+            op.execute(f"CREATE INDEX IF NOT EXISTS {{name}} ON {{table}} ({{', '.join(columns)}})")
+
+    # Names no earlier revision uses, so an existing one was created by upgrade
+    for table, name, columns in CREATE_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {{name}}")
+'''
+
+
+def _index_list_literal(suggestions: List[IndexSuggestion], extra: Tuple[Any, ...] = ()) -> str:
+    if not suggestions:
+        return ''
+    suffix = ''.join(f", {value!r}" for value in extra)
+    entries = ',\n'.join(f"    ({s.table!r}, {s.name!r}, {list(s.columns)!r}{suffix})" for s in suggestions)
+    return f"\n{entries},\n"
+
+
+def render_migration(
+    suggestions: List[IndexSuggestion],
+    revision: str,
+    down_revision: Optional[str],
+    message: str = "Tune indexes for the recorded workload",
+    create_date: Optional[datetime] = None,
+    owned_indexes: Iterable[str] = (),
+    dialect: Optional[str] = None
+) -> str:
+    """
+    Render index suggestions as an Alembic migration.
+
+    Suggested indexes whose name an earlier revision already uses are only
+    ensured: the migration creates them if missing but never drops them on
+    downgrade, which would break that revision's own downgrade. Drops are
+    limited to the backend the audit ran on, so downgrade only restores
+    indexes that upgrade can actually have dropped.
+
+    Args:
+        suggestions: Index suggestions to apply
+        revision: Revision ID of the migration
+        down_revision: Revision it follows
+        message: First line of the migration docstring
+        create_date: Creation date shown in the docstring (defaults to now)
+        owned_indexes: Index names used by earlier revisions
+        dialect: Backend the suggestions were audited on (None: any)
+
+    Returns:
+        Migration module source
+    """
+    owned = set(owned_indexes)
+    creates = [s for s in suggestions if s.action == 'create']
+    slug = re.sub(r'[^a-z0-9]+', '_', message.lower()).strip('_')[:40]
+    return MIGRATION_TEMPLATE.format(
+        message=message,
+        revision=revision,
+        slug=slug,
+        down_revision=down_revision,
+        down_revision_literal=repr(down_revision),
+        create_date=(create_date or datetime.now()).strftime('%Y-%m-%d %H:%M:%S.%f'),
+        create_indexes=_index_list_literal([s for s in creates if s.name not in owned]),
+        ensure_indexes=_index_list_literal([s for s in creates if s.name in owned]),
+        drop_indexes=_index_list_literal([s for s in suggestions if s.action == 'drop'], extra=(dialect,)),
+    )
+
+
+def next_revision(versions_dir: Union[str, Path]) -> Tuple[str, Optional[str]]:
+    """
+    Next numbered revision ID and the current head of a migrations directory.
+
+    Args:
+        versions_dir: Alembic versions directory
+
+    Returns:
+        Tuple of (new revision, current head revision or None)
+    """
+    revisions = []
+    for path in Path(versions_dir).glob('*.py'):
+        match = re.search(r"^revision = '(\d+)'", path.read_text(encoding='utf-8'), re.MULTILINE)
+        if match:
+            revisions.append(match.group(1))
+    if not revisions:
+        return '001', None
+    head = max(revisions, key=int)
+    return f"{int(head) + 1:03d}", head
+
+
+def revision_index_names(versions_dir: Union[str, Path]) -> Set[str]:
+    """
+    Index names referenced by the migrations of a versions directory.
+
+    Args:
+        versions_dir: Alembic versions directory
+
+    Returns:
+        Set of quoted ``idx_``/``ix_`` names found in the migration sources
+    """
+    names = set()
+    for path in Path(versions_dir).glob('*.py'):
+        names.update(re.findall(r"""['"]((?:idx|ix)_\w+)['"]""", path.read_text(encoding='utf-8')))
+    return names
+
+
+def write_migration(
+    suggestions: List[IndexSuggestion],
+    versions_dir: Union[str, Path],
+    message: str = "Tune indexes for the recorded workload",
+    dialect: Optional[str] = None
+) -> Path:
+    """
+    Write index suggestions as the next numbered migration of a versions directory.
+
+    Args:
+        suggestions: Index suggestions to apply
+        versions_dir: Alembic versions directory
+        message: First line of the migration docstring
+        dialect: Backend the suggestions were audited on (None: any)
+
+    Returns:
+        Path of the written migration
+    """
+    revision, head = next_revision(versions_dir)
+    source = render_migration(
+        suggestions, revision, head, message,
+        owned_indexes=revision_index_names(versions_dir), dialect=dialect
+    )
+    slug = re.sub(r'[^a-z0-9]+', '_', message.lower()).strip('_')[:40]
+    path = Path(versions_dir) / f"{revision}_{slug}.py"
+    path.write_text(source, encoding='utf-8')
+    logger.info(f"Wrote index migration {path}")
+    return path
+
+
+def index_parity(tables: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, List[Tuple[str, ...]]]]:
+    """
+    Compare the indexed column lists of the SQLite and PostgreSQL models.
+
+    Args:
+        tables: Tables to compare (defaults to every table in both model sets)
+
+    Returns:
+        Dictionary mapping tables to the column lists indexed only in the
+        'sqlite' models and only in the 'postgresql' models
+    """
+    from gecko_terminal_collector.database import models, postgresql_models
+
+    def indexed_columns(table) -> Set[Tuple[str, ...]]:
+        columns = {tuple(column.name for column in index.columns) for index in table.indexes}
+        columns.update(
+            tuple(column.name for column in constraint.columns)
+            for constraint in table.constraints if constraint.__class__.__name__ in ('UniqueConstraint', 'PrimaryKeyConstraint')
+        )
+        return columns
+
+    sqlite_tables = models.Base.metadata.tables
+    postgresql_tables = postgresql_models.Base.metadata.tables
+    names = set(tables) if tables is not None else set(sqlite_tables) & set(postgresql_tables)
+
+    parity = {}
+    for name in sorted(names):
+        if name not in sqlite_tables or name not in postgresql_tables:
+            continue
+        sqlite_columns = indexed_columns(sqlite_tables[name])
+        postgresql_columns = indexed_columns(postgresql_tables[name])
+        if sqlite_columns != postgresql_columns:
+            parity[name] = {
+                'sqlite': sorted(sqlite_columns - postgresql_columns),
+                'postgresql': sorted(postgresql_columns - sqlite_columns),
+            }
+    return parity
+
+
+async def run_workload(
+    db_manager,
+    pool_ids: Sequence[str],
+    timeframe: str = '1h',
+    hours: int = 24,
+    min_trade_volume_usd: Optional[float] = None
+) -> None:
+    """
+    Run the hot read paths of a database manager for a set of pools.
+
+    Mirrors the reads of the collectors and exporters: OHLCV ranges, trade
+    windows (gap detection and pool prioritization), new pool history, gap
+    and continuity checks and watchlist lookups. Methods a manager does not
+    implement, or that fail, are skipped.
+
+    Args:
+        db_manager: Database manager to exercise
+        pool_ids: Pools to read
+        timeframe: OHLCV timeframe
+        hours: Length of the read windows
+        min_trade_volume_usd: Minimum trade volume of the trade reads
+    """
+    end = datetime.now()
+    start = end - timedelta(hours=hours)
+    manager_name = type(db_manager).__name__
+
+    calls = [('get_watchlist_pools', ())]
+    for pool_id in pool_ids:
+        calls.extend([
+            ('get_pool', (pool_id,)),
+            ('get_ohlcv_data', (pool_id, timeframe, start, end)),
+            ('get_trade_data', (pool_id, start, end, min_trade_volume_usd)),
+            ('get_trade_data', (pool_id, end - timedelta(hours=4), end, min_trade_volume_usd)),
+            ('get_pool_history', (pool_id, start)),
+            ('get_data_gaps', (pool_id, timeframe, start, end)),
+            ('check_data_continuity', (pool_id, timeframe)),
+        ])
+    calls.extend([
+        ('get_ohlcv_frame', (list(pool_ids), timeframe, start, end)),
+        ('get_trades_frame', (list(pool_ids), start, end, min_trade_volume_usd)),
+        ('get_pool_history_frame', (list(pool_ids), start)),
+    ])
+
+    for method, args in calls:
+        function = getattr(db_manager, method, None)
+        if function is None:
+            continue
+        with tracer.span(f"{manager_name}.{method}"):
+            try:
+                await function(*args)
+            except Exception as e:
+                logger.warning(f"Workload call {method} failed: {e}")
@@ -3,12 +3,20 @@ Database manager and data access layer.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, Iterable, List, Optional, Dict, Any, Union
 from datetime import datetime
 from gecko_terminal_collector.models.core import (
     Pool, Token, OHLCVRecord, TradeRecord, Gap, ContinuityReport
 )
 from gecko_terminal_collector.config.models import DatabaseConfig
+from gecko_terminal_collector.monitoring.tracing import instrument_methods
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _is_traced_db_method(name: str) -> bool:
+    return name.startswith(("store_", "get_"))
 
 
 class DatabaseManager(ABC):
@@ -19,6 +27,11 @@ class DatabaseManager(ABC):
     storage backends (SQLite, PostgreSQL, etc.).
     """
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Time every store/get implementation when span tracing is enabled
+        instrument_methods(cls, _is_traced_db_method)
+    
     def __init__(self, config: DatabaseConfig):
         """
         Initialize database manager with configuration.
@@ -182,6 +195,97 @@ class DatabaseManager(ABC):
         """Get trade data for a pool with optional filtering."""
         pass
     
+    # Columnar reads (see database.frames)
+    async def get_ohlcv_frame(
+        self,
+        pool_ids: Union[str, Iterable[str]],
+        timeframe: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> 'pd.DataFrame':
+        """
+        Get OHLCV data for one or more pools as typed columns.
+        
+        Implementations should override this with a columnar query; the
+        default converts get_ohlcv_data results pool by pool.
+        
+        Args:
+            pool_ids: Pool ID or pool IDs to read
+            timeframe: Data timeframe (e.g., '1h', '1d')
+            start_time: Optional inclusive start of the time range
+            end_time: Optional inclusive end of the time range
+            
+        Returns:
+            Frame with OHLCV_FRAME_COLUMNS, ordered by pool and time
+        """
+        from gecko_terminal_collector.database.frames import as_pool_ids, ohlcv_records_to_frame
+        
+        records = []
+        for pool_id in as_pool_ids(pool_ids):
+            records.extend(await self.get_ohlcv_data(pool_id, timeframe, start_time, end_time))
+        return ohlcv_records_to_frame(records)
+    
+    async def get_trades_frame(
+        self,
+        pool_ids: Union[str, Iterable[str]],
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        min_volume_usd: Optional[float] = None
+    ) -> 'pd.DataFrame':
+        """
+        Get trade data for one or more pools as typed columns.
+        
+        Implementations should override this with a columnar query; the
+        default converts get_trade_data results pool by pool.
+        
+        Args:
+            pool_ids: Pool ID or pool IDs to read
+            start_time: Optional inclusive start of the time range
+            end_time: Optional inclusive end of the time range
+            min_volume_usd: Optional minimum trade volume
+            
+        Returns:
+            Frame with TRADE_FRAME_COLUMNS, ordered by pool and block time
+        """
+        from gecko_terminal_collector.database.frames import as_pool_ids, trade_records_to_frame
+        
+        records = []
+        for pool_id in as_pool_ids(pool_ids):
+            trades = await self.get_trade_data(pool_id, start_time, end_time, min_volume_usd)
+            records.extend(sorted(trades, key=lambda trade: trade.block_timestamp))
+        return trade_records_to_frame(records)
+    
+    async def get_pool_history_frame(
+        self,
+        pool_ids: Union[str, Iterable[str]],
+        cutoff_time: datetime
+    ) -> 'pd.DataFrame':
+        """
+        Get new pools history for one or more pools as typed columns.
+        
+        Implementations should override this with a columnar query; the
+        default converts get_pool_history results pool by pool.
+        
+        Args:
+            pool_ids: Pool ID or pool IDs to read
+            cutoff_time: Datetime cutoff for historical data
+            
+        Returns:
+            Frame with POOL_HISTORY_FRAME_COLUMNS, newest first per pool
+        """
+        import pandas as pd
+        from gecko_terminal_collector.database.frames import (
+            POOL_HISTORY_FRAME_COLUMNS, as_pool_ids, pool_history_to_frame, rows_to_frame
+        )
+        
+        frames = [
+            pool_history_to_frame(pool_id, await self.get_pool_history(pool_id, cutoff_time))
+            for pool_id in as_pool_ids(pool_ids)
+        ]
+        if not frames:
+            return rows_to_frame([], POOL_HISTORY_FRAME_COLUMNS)
+        return pd.concat(frames, ignore_index=True)
+    
     # Watchlist operations
     @abstractmethod
     async def store_watchlist_entry(self, pool_id: str, metadata: Dict[str, Any]) -> None:
@@ -218,6 +322,47 @@ class DatabaseManager(ABC):
         """Remove a pool from the watchlist."""
         pass
     
+    async def add_or_reactivate_watchlist_entries(self, entries: List[Any]) -> int:
+        """
+        Add new watchlist entries and reactivate inactive existing ones.
+        
+        Implementations should override this with bulk statements; the
+        default applies the entries one at a time.
+        
+        Args:
+            entries: Watchlist entries to add
+            
+        Returns:
+            Number of entries added or reactivated
+        """
+        changed = 0
+        for entry in entries:
+            existing_entry = await self.get_watchlist_entry_by_pool_id(entry.pool_id)
+            if existing_entry is None:
+                await self.add_watchlist_entry(entry)
+                changed += 1
+            elif not existing_entry.is_active:
+                await self.update_watchlist_entry_status(entry.pool_id, True)
+                changed += 1
+        return changed
+    
+    async def deactivate_watchlist_entries(self, pool_ids: List[str]) -> int:
+        """
+        Deactivate the watchlist entries of several pools.
+        
+        Implementations should override this with a bulk statement; the
+        default deactivates the entries one at a time.
+        
+        Args:
+            pool_ids: Pool IDs whose entries to deactivate
+            
+        Returns:
+            Number of pools processed
+        """
+        for pool_id in pool_ids:
+            await self.update_watchlist_entry_status(pool_id, False)
+        return len(pool_ids)
+    
     # DEX operations
     @abstractmethod
     async def store_dex_data(self, dexes: List[Any]) -> int:
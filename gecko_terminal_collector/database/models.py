@@ -12,6 +12,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -26,6 +27,14 @@ from sqlalchemy.sql import func
 Base = declarative_base()
 
 
+def pool_symbol_normalized_default(context) -> str:
+    """Column default deriving the lowercase QLib symbol from the inserted pool ID."""
+    # Imported here: the utils package imports these models at load time
+    from gecko_terminal_collector.utils.pool_id_utils import PoolIDUtils
+
+    return PoolIDUtils.to_normalized_symbol(context.get_current_parameters()["id"])
+
+
 class DEX(Base):
     """DEX information table."""
     
@@ -51,6 +60,7 @@ class Pool(Base):
     id = Column(String(100), primary_key=True)
     address = Column(String(100), nullable=False)
     name = Column(String(200))
+    symbol_normalized = Column(String(100), default=pool_symbol_normalized_default)  # Lowercase QLib symbol
     dex_id = Column(String(50), ForeignKey("dexes.id"), nullable=False)
     base_token_id = Column(String(100))
     quote_token_id = Column(String(100))
@@ -73,6 +83,11 @@ class Pool(Base):
     ohlcv_data = relationship("OHLCVData", back_populates="pool", cascade="all, delete-orphan")
     trades = relationship("Trade", back_populates="pool", cascade="all, delete-orphan")
     watchlist_entries = relationship("WatchlistEntry", back_populates="pool", cascade="all, delete-orphan")
+    
+    # Named as in migration 006 and the PostgreSQL models
+    __table_args__ = (
+        Index('idx_pools_symbol_normalized', 'symbol_normalized'),
+    )
 
 
 class Token(Base):
@@ -138,6 +153,11 @@ class Trade(Base):
     
     # Relationships
     pool = relationship("Pool", back_populates="trades")
+    
+    # Trade windows per pool (gap detection, pool prioritization)
+    __table_args__ = (
+        Index('idx_trades_pool_timestamp', 'pool_id', 'block_timestamp'),
+    )
 
 
 class WatchlistEntry(Base):
@@ -204,6 +224,10 @@ class ExecutionHistory(Base):
     warnings = Column(Text)  # JSON array of warnings
     execution_metadata = Column(Text)  # JSON metadata
     created_at = Column(DateTime, default=func.current_timestamp())
+    
+    __table_args__ = (
+        Index('idx_execution_history_start_time', 'start_time'),
+    )
 
 
 class PerformanceMetrics(Base):
@@ -259,9 +283,94 @@ class NewPoolsHistory(Base):
     # Unique constraint to prevent duplicate records for same pool at same collection time
     __table_args__ = (
         UniqueConstraint('pool_id', 'collected_at', name='uq_new_pools_history_pool_collected'),
+        Index('idx_new_pools_history_collected_at', 'collected_at'),
+    )
+
+
+class NewPoolsHistoryHourly(Base):
+    """Hourly new_pools_history rollup per network and DEX."""
+    
+    __tablename__ = "new_pools_history_hourly"
+    
+    bucket_start = Column(DateTime, primary_key=True)
+    network_id = Column(String(50), primary_key=True)  # '' when the source row had none
+    dex_id = Column(String(100), primary_key=True)  # '' when the source row had none
+    records = Column(BigInteger, nullable=False, default=0)
+    unique_pools = Column(Integer, nullable=False, default=0)
+    reserve_in_usd_sum = Column(Numeric(30, 4))
+    reserve_in_usd_count = Column(Integer, nullable=False, default=0)
+    volume_usd_h24_sum = Column(Numeric(30, 4))
+    updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
+
+
+class NewPoolsHistoryTotals(Base):
+    """All-time new_pools_history record counts per network and DEX."""
+    
+    __tablename__ = "new_pools_history_totals"
+    
+    network_id = Column(String(50), primary_key=True)
+    dex_id = Column(String(100), primary_key=True)
+    records = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
+
+
+class ExecutionHistoryHourly(Base):
+    """Hourly execution_history rollup per collector type."""
+    
+    __tablename__ = "execution_history_hourly"
+    
+    bucket_start = Column(DateTime, primary_key=True)
+    collector_type = Column(String(50), primary_key=True)
+    executions = Column(Integer, nullable=False, default=0)
+    successful_executions = Column(Integer, nullable=False, default=0)
+    failed_executions = Column(Integer, nullable=False, default=0)
+    partial_executions = Column(Integer, nullable=False, default=0)
+    timed_executions = Column(Integer, nullable=False, default=0)  # executions with an execution_time
+    execution_time_sum = Column(Numeric(20, 3))
+    execution_time_min = Column(Numeric(10, 3))
+    execution_time_max = Column(Numeric(10, 3))
+    records_collected = Column(BigInteger, nullable=False, default=0)  # over timed executions
+    updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
+
+
+class RollupWatermark(Base):
+    """Highest source row id folded into a rollup."""
+    
+    __tablename__ = "rollup_watermarks"
+    
+    name = Column(String(50), primary_key=True)
+    last_id = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp())
+
+
+class WorkLease(Base):
+    """Lease on a unit of collection work for sharded multi-node collection."""
+    
+    __tablename__ = "work_leases"
+    
+    unit_id = Column(String(150), primary_key=True)  # "<collector_key>:<shard>"
+    collector_key = Column(String(100), nullable=False)
+    shard = Column(Integer, nullable=False, default=0)
+    owner = Column(String(100))  # Node holding the lease, None when free
+    expires_at = Column(DateTime)
+    acquired_at = Column(DateTime)
+    heartbeat_at = Column(DateTime)
+    
+    __table_args__ = (
+        Index('idx_work_leases_owner', 'owner'),
     )
 
 
+class CollectorNode(Base):
+    """Heartbeat of a collection node taking part in sharded collection."""
+    
+    __tablename__ = "collector_nodes"
+    
+    node_id = Column(String(100), primary_key=True)
+    started_at = Column(DateTime, nullable=False)
+    heartbeat_at = Column(DateTime, nullable=False)
+
+
 class DiscoveryMetadata(Base):
     """Track discovery operations and statistics."""
     
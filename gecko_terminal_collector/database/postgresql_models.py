@@ -15,6 +15,8 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
+from gecko_terminal_collector.database.models import pool_symbol_normalized_default
+
 Base = declarative_base()
 
 
@@ -75,6 +77,7 @@ class Pool(Base):
     id = Column(String(200), primary_key=True)
     address = Column(String(100), nullable=False)
     name = Column(String(200))
+    symbol_normalized = Column(String(200), default=pool_symbol_normalized_default)  # Lowercase QLib symbol
     dex_id = Column(String(100), ForeignKey('dexes.id'), nullable=False, index=True)
     base_token_id = Column(String(200), ForeignKey('tokens.id'), index=True)
     quote_token_id = Column(String(200), ForeignKey('tokens.id'), index=True)
@@ -110,6 +113,8 @@ class Pool(Base):
         Index('idx_pools_auto_discovered_at', 'auto_discovered_at'),
         Index('idx_pools_last_activity_check', 'last_activity_check'),
         Index('idx_pools_reserve_usd', 'reserve_usd', postgresql_using='btree', postgresql_ops={'reserve_usd': 'DESC'}),
+        Index('idx_pools_symbol_normalized', 'symbol_normalized'),
+        # pg_trgm GIN indexes for fuzzy search are created by create_pool_symbol_search_indexes()
     )
 
 
@@ -123,20 +128,20 @@ class Trade(Base):
     __tablename__ = 'trades'
     
     id = Column(String(200), primary_key=True)
-    pool_id = Column(String(200), ForeignKey('pools.id'), nullable=False, index=True)
-    block_number = Column(BigInteger, nullable=False, index=True)
-    tx_hash = Column(String(100), nullable=False, index=True)
+    pool_id = Column(String(200), ForeignKey('pools.id'), nullable=False)
+    block_number = Column(BigInteger, nullable=False)
+    tx_hash = Column(String(100), nullable=False)
     tx_from_address = Column(String(100))
     
     # Trade amounts
     from_token_amount = Column(Numeric(30, 10))
     to_token_amount = Column(Numeric(30, 10))
     price_usd = Column(Numeric(20, 8))
-    volume_usd = Column(Numeric(20, 2), index=True)
+    volume_usd = Column(Numeric(20, 2))
     
     # Trade metadata
     side = Column(String(10))  # 'buy' or 'sell'
-    block_timestamp = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
+    block_timestamp = Column(TIMESTAMP(timezone=True), nullable=False)
     
     # Additional metadata
     metadata_json = Column(JSONB, default={})
@@ -144,7 +149,8 @@ class Trade(Base):
     # Relationships
     pool = relationship("Pool", back_populates="trades")
     
-    # Indexes optimized for time-series queries
+    # Indexes optimized for time-series queries (columns carry no index=True,
+    # which would duplicate these)
     __table_args__ = (
         Index('idx_trades_pool_id_timestamp', 'pool_id', 'block_timestamp'),
         Index('idx_trades_block_timestamp_desc', 'block_timestamp', postgresql_using='btree', postgresql_ops={'block_timestamp': 'DESC'}),
@@ -389,6 +395,14 @@ def create_postgresql_extensions():
     ]
 
 
+def create_pool_symbol_search_indexes():
+    """Trigram indexes backing fuzzy pool symbol/name search (requires pg_trgm)."""
+    return [
+        "CREATE INDEX IF NOT EXISTS idx_pools_symbol_normalized_trgm ON pools USING gin (symbol_normalized gin_trgm_ops);",
+        "CREATE INDEX IF NOT EXISTS idx_pools_name_trgm ON pools USING gin (name gin_trgm_ops);",
+    ]
+
+
 def create_materialized_views():
     """Create materialized views for common queries."""
     return [
@@ -0,0 +1,412 @@
+"""
+Incremental hourly rollups backing the statistics engine.
+
+new_pools_history and execution_history grow without bound, so statistics
+are served from pre-aggregated rollup tables instead of scanning them.
+Rollups are maintained by a watermark-driven compaction job: each run only
+looks at source rows with an id above the last watermark. Hour buckets
+touched by new rows are recomputed from an indexed time range of the source
+table, which keeps distinct pool counts and averages exact, and all-time
+totals move by the change in the recomputed buckets.
+
+Ids are assigned at insert but become visible at commit, so a row can commit
+with an id below a watermark that has already advanced past it. To pick such
+rows up, the buckets within COMMIT_LAG of the latest rolled-up hour are also
+recomputed from the source, on every run that folds new rows and at least
+every RECONCILE_INTERVAL otherwise. Rows committing later than that after
+their timestamp are only picked up by rebuild().
+
+Bucket keys are naive UTC. On PostgreSQL, TIMESTAMPTZ source columns are
+truncated in UTC and scanned with tz-aware UTC bounds, so the session
+TimeZone does not shift buckets.
+
+Compaction is cheap enough to run before every statistics read and can
+also be scheduled as a periodic job. Works on SQLite and PostgreSQL.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, case, delete, distinct, func, insert, inspect, select, update
+from sqlalchemy.orm import Session
+
+from gecko_terminal_collector.database.models import (
+    ExecutionHistory,
+    ExecutionHistoryHourly,
+    NewPoolsHistory,
+    NewPoolsHistoryHourly,
+    NewPoolsHistoryTotals,
+    RollupWatermark,
+)
+
+logger = logging.getLogger(__name__)
+
+
+ROLLUP_MODELS = (NewPoolsHistoryHourly, NewPoolsHistoryTotals, ExecutionHistoryHourly, RollupWatermark)
+BUCKET_SIZE = timedelta(hours=1)
+# Recent buckets recomputed to catch rows committed below the watermark
+COMMIT_LAG = timedelta(hours=1)
+RECONCILE_INTERVAL = timedelta(minutes=5)
+
+
+def hour_floor(value: datetime) -> datetime:
+    """Start of the hour bucket containing a timestamp."""
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+class StatisticsRollups:
+    """
+    Maintain the hourly and all-time rollup tables.
+
+    Rollups are keyed by hour, network and DEX for new_pools_history and by
+    hour and collector type for execution_history. Since a pool belongs to a
+    single network and DEX, per-bucket distinct pool counts can be summed
+    across DEXes and networks without double counting.
+    """
+
+    def __init__(self, db_manager):
+        """
+        Initialize rollup maintenance.
+
+        Args:
+            db_manager: Database manager whose connection holds the source tables
+        """
+        self.db_manager = db_manager
+        self._sources: Optional[Set[str]] = None
+        # (table, column) of source timestamps stored with a time zone
+        self._tz_columns: Set[Tuple[str, str]] = set()
+        # Monotonic time of the last recent-bucket recomputation per source
+        self._reconciled_at: Dict[str, float] = {}
+
+    @property
+    def _engine(self):
+        return self.db_manager.connection.engine
+
+    def ensure_tables(self) -> None:
+        """Create rollup tables and source time indexes that do not exist yet."""
+        if self._sources is not None:
+            return
+
+        engine = self._engine
+        for model in ROLLUP_MODELS:
+            model.__table__.create(bind=engine, checkfirst=True)
+
+        # Bucket recomputation range-scans the sources by time; databases
+        # created before these indexes were declared get them here
+        existing_tables = set(inspect(engine).get_table_names())
+        self._sources = {
+            table.name for table in (NewPoolsHistory.__table__, ExecutionHistory.__table__)
+            if table.name in existing_tables
+        }
+        inspector = inspect(engine)
+        for model in (NewPoolsHistory, ExecutionHistory):
+            if model.__tablename__ in self._sources:
+                for index in model.__table__.indexes:
+                    index.create(bind=engine, checkfirst=True)
+                # The PostgreSQL schema may declare TIMESTAMPTZ where the ORM model does not
+                self._tz_columns.update(
+                    (model.__tablename__, column['name'])
+                    for column in inspector.get_columns(model.__tablename__)
+                    if getattr(column['type'], 'timezone', False)
+                )
+
+    async def compact(self) -> Dict[str, int]:
+        """
+        Fold source rows added since the last compaction into the rollups.
+
+        Returns:
+            Number of newly folded source rows per source table
+        """
+        self.ensure_tables()
+
+        folded = {}
+        with self.db_manager.connection.get_session() as session:
+            try:
+                if NewPoolsHistory.__tablename__ in self._sources:
+                    folded[NewPoolsHistory.__tablename__] = self._compact_new_pools_history(session)
+                if ExecutionHistory.__tablename__ in self._sources:
+                    folded[ExecutionHistory.__tablename__] = self._compact_execution_history(session)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error compacting statistics rollups: {e}")
+                raise
+
+        if any(folded.values()):
+            logger.debug(f"Compacted statistics rollups: {folded}")
+        return folded
+
+    async def rebuild(self) -> Dict[str, int]:
+        """
+        Discard all rollups and recompute them from the source tables.
+
+        Needed after rows are deleted from a source table (e.g. retention
+        cleanup), since incremental compaction only sees new rows.
+
+        Returns:
+            Number of folded source rows per source table
+        """
+        self.ensure_tables()
+
+        with self.db_manager.connection.get_session() as session:
+            try:
+                for model in ROLLUP_MODELS:
+                    session.execute(delete(model))
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error clearing statistics rollups: {e}")
+                raise
+
+        return await self.compact()
+
+    def _compact_new_pools_history(self, session: Session) -> int:
+        """Fold new new_pools_history rows into the totals and hourly rollups."""
+        source = NewPoolsHistory
+        watermark, high_id, new_rows = self._claim_new_rows(session, source)
+        bucket = self._hour_bucket(source.collected_at)
+        touched = self._buckets_to_recompute(session, source, NewPoolsHistoryHourly, bucket, new_rows)
+        if new_rows is None and not touched:
+            return 0
+
+        network = func.coalesce(source.network_id, '')
+        dex = func.coalesce(source.dex_id, '')
+
+        # Totals move by the change of the recomputed buckets; rows without a
+        # timestamp belong to no bucket and are counted directly
+        deltas: Dict[Tuple[str, str], int] = {}
+        folded = 0
+        if new_rows is not None:
+            folded = session.scalar(select(func.count(source.id)).where(new_rows))
+            for network_id, dex_id, count in session.execute(
+                select(network, dex, func.count(source.id))
+                .where(new_rows, source.collected_at.is_(None))
+                .group_by(network, dex)
+            ):
+                deltas[(network_id, dex_id)] = count
+        for network_id, dex_id, count in self._bucket_records(session, touched):
+            deltas[(network_id, dex_id)] = deltas.get((network_id, dex_id), 0) - count
+
+        # Distinct pools and averages are not additive: recompute touched hours
+        rows = []
+        for start, end in self._bucket_ranges(touched, source.collected_at):
+            result = session.execute(
+                select(
+                    bucket,
+                    network,
+                    dex,
+                    func.count(source.id),
+                    func.count(distinct(source.pool_id)),
+                    func.sum(source.reserve_in_usd),
+                    func.count(source.reserve_in_usd),
+                    func.sum(source.volume_usd_h24),
+                )
+                .where(source.collected_at >= start, source.collected_at < end)
+                .group_by(bucket, network, dex)
+            )
+            for bucket_value, network_id, dex_id, records, pools, reserve_sum, reserve_count, volume_sum in result:
+                rows.append({
+                    'bucket_start': self._to_datetime(bucket_value),
+                    'network_id': network_id,
+                    'dex_id': dex_id,
+                    'records': records,
+                    'unique_pools': pools,
+                    'reserve_in_usd_sum': reserve_sum,
+                    'reserve_in_usd_count': reserve_count,
+                    'volume_usd_h24_sum': volume_sum,
+                })
+        self._replace_buckets(session, NewPoolsHistoryHourly, touched, rows)
+
+        for row in rows:
+            key = (row['network_id'], row['dex_id'])
+            deltas[key] = deltas.get(key, 0) + row['records']
+        self._apply_total_deltas(session, deltas)
+
+        if new_rows is not None:
+            watermark.last_id = high_id
+        return folded
+
+    @staticmethod
+    def _bucket_records(session: Session, buckets: Set[datetime]) -> List[Tuple[str, str, int]]:
+        """Rolled-up record counts per network and DEX of the given hour buckets."""
+        ordered = sorted(buckets)
+        records = []
+        for i in range(0, len(ordered), 500):
+            records.extend(session.execute(
+                select(
+                    NewPoolsHistoryHourly.network_id,
+                    NewPoolsHistoryHourly.dex_id,
+                    func.sum(NewPoolsHistoryHourly.records)
+                )
+                .where(NewPoolsHistoryHourly.bucket_start.in_(ordered[i:i + 500]))
+                .group_by(NewPoolsHistoryHourly.network_id, NewPoolsHistoryHourly.dex_id)
+            ).all())
+        return records
+
+    @staticmethod
+    def _apply_total_deltas(session: Session, deltas: Dict[Tuple[str, str], int]) -> None:
+        """Add record count changes to the all-time totals."""
+        for (network_id, dex_id), count in deltas.items():
+            if not count:
+                continue
+            result = session.execute(
+                update(NewPoolsHistoryTotals)
+                .where(NewPoolsHistoryTotals.network_id == network_id, NewPoolsHistoryTotals.dex_id == dex_id)
+                .values(records=NewPoolsHistoryTotals.records + count)
+            )
+            if result.rowcount == 0:
+                session.execute(insert(NewPoolsHistoryTotals).values(
+                    network_id=network_id, dex_id=dex_id, records=count
+                ))
+
+    def _compact_execution_history(self, session: Session) -> int:
+        """Fold new execution_history rows into the hourly rollup."""
+        source = ExecutionHistory
+        watermark, high_id, new_rows = self._claim_new_rows(session, source)
+        bucket = self._hour_bucket(source.start_time)
+        touched = self._buckets_to_recompute(session, source, ExecutionHistoryHourly, bucket, new_rows)
+        if new_rows is None and not touched:
+            return 0
+
+        folded = session.scalar(select(func.count(source.id)).where(new_rows)) if new_rows is not None else 0
+
+        timed = source.execution_time.isnot(None)
+        rows = []
+        for start, end in self._bucket_ranges(touched, source.start_time):
+            result = session.execute(
+                select(
+                    bucket,
+                    source.collector_type,
+                    func.count(source.id),
+                    func.sum(case((source.status == 'success', 1), else_=0)),
+                    func.sum(case((source.status == 'failure', 1), else_=0)),
+                    func.sum(case((source.status == 'partial', 1), else_=0)),
+                    func.count(source.execution_time),
+                    func.sum(source.execution_time),
+                    func.min(source.execution_time),
+                    func.max(source.execution_time),
+                    func.sum(case((timed, func.coalesce(source.records_collected, 0)), else_=0)),
+                )
+                .where(source.start_time >= start, source.start_time < end)
+                .group_by(bucket, source.collector_type)
+            )
+            for (bucket_value, collector_type, executions, successful, failed, partial,
+                 timed_count, time_sum, time_min, time_max, records) in result:
+                rows.append({
+                    'bucket_start': self._to_datetime(bucket_value),
+                    'collector_type': collector_type,
+                    'executions': executions,
+                    'successful_executions': successful or 0,
+                    'failed_executions': failed or 0,
+                    'partial_executions': partial or 0,
+                    'timed_executions': timed_count,
+                    'execution_time_sum': time_sum,
+                    'execution_time_min': time_min,
+                    'execution_time_max': time_max,
+                    'records_collected': records or 0,
+                })
+        self._replace_buckets(session, ExecutionHistoryHourly, touched, rows)
+
+        if new_rows is not None:
+            watermark.last_id = high_id
+        return folded
+
+    def _claim_new_rows(self, session: Session, source) -> Tuple[RollupWatermark, Optional[int], Any]:
+        """
+        Lock the source's watermark and build the filter for rows beyond it.
+
+        Returns:
+            Tuple of (watermark row, highest source id, id range filter or
+            None when nothing is new)
+        """
+        name = source.__tablename__
+        watermark = session.execute(
+            select(RollupWatermark).where(RollupWatermark.name == name).with_for_update()
+        ).scalar_one_or_none()
+        if watermark is None:
+            watermark = RollupWatermark(name=name, last_id=0)
+            session.add(watermark)
+
+        high_id = session.scalar(select(func.max(source.id)))
+        if high_id is None or high_id <= watermark.last_id:
+            return watermark, high_id, None
+
+        return watermark, high_id, and_(source.id > watermark.last_id, source.id <= high_id)
+
+    def _buckets_to_recompute(self, session: Session, source, model, bucket, new_rows) -> Set[datetime]:
+        """
+        Hour buckets to recompute: those of new rows plus the recent ones.
+
+        Recent buckets (within COMMIT_LAG of the latest rolled-up hour) are
+        included whenever there are new rows and at least every
+        RECONCILE_INTERVAL, so rows that committed with an id below the
+        watermark are still folded in.
+        """
+        touched = self._touched_buckets(session, bucket, new_rows) if new_rows is not None else set()
+
+        name = source.__tablename__
+        now = time.monotonic()
+        last = self._reconciled_at.get(name)
+        if touched or last is None or now - last >= RECONCILE_INTERVAL.total_seconds():
+            latest = session.scalar(select(func.max(model.bucket_start)))
+            if latest is not None:
+                latest = self._to_datetime(latest)
+                touched.update(latest - BUCKET_SIZE * i for i in range(int(COMMIT_LAG / BUCKET_SIZE) + 1))
+            self._reconciled_at[name] = now
+        return touched
+
+    def _touched_buckets(self, session: Session, bucket, new_rows) -> Set[datetime]:
+        """Hour buckets containing at least one new source row."""
+        values = session.scalars(select(bucket).where(new_rows).distinct())
+        return {self._to_datetime(value) for value in values if value is not None}
+
+    def _bucket_ranges(self, buckets: Iterable[datetime], column) -> List[Tuple[datetime, datetime]]:
+        """
+        Merge hour buckets into contiguous [start, end) ranges to scan.
+
+        Bounds are tz-aware UTC for time-zone-aware columns, so PostgreSQL
+        does not read them in the session time zone.
+        """
+        tzinfo = timezone.utc if self._is_tz_aware(column) else None
+        ranges = []
+        for bucket in sorted(buckets):
+            if ranges and ranges[-1][1] == bucket:
+                ranges[-1] = (ranges[-1][0], bucket + BUCKET_SIZE)
+            else:
+                ranges.append((bucket, bucket + BUCKET_SIZE))
+        return [(start.replace(tzinfo=tzinfo), end.replace(tzinfo=tzinfo)) for start, end in ranges]
+
+    @staticmethod
+    def _replace_buckets(session: Session, model, buckets: Set[datetime], rows: List[Dict[str, Any]]) -> None:
+        """Swap the rollup rows of recomputed buckets for their new values."""
+        if not buckets:
+            return
+        ordered = sorted(buckets)
+        for i in range(0, len(ordered), 500):
+            session.execute(delete(model).where(model.bucket_start.in_(ordered[i:i + 500])))
+        if rows:
+            session.execute(insert(model), rows)
+
+    def _is_tz_aware(self, column) -> bool:
+        """Whether a source column stores timestamps with a time zone."""
+        return (column.table.name, column.name) in self._tz_columns
+
+    def _hour_bucket(self, column):
+        """SQL expression truncating a timestamp column to its UTC hour."""
+        if self._engine.dialect.name == 'postgresql':
+            if self._is_tz_aware(column):
+                # Truncate in UTC rather than in the session TimeZone
+                return func.date_trunc('hour', func.timezone('UTC', column))
+            return func.date_trunc('hour', column)
+        return func.strftime('%Y-%m-%d %H:00:00', column)
+
+    @staticmethod
+    def _to_datetime(value) -> datetime:
+        """Normalize a bucket value to a naive UTC datetime."""
+        if isinstance(value, str):
+            return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+        if value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
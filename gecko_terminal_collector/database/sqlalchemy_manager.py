@@ -8,9 +8,9 @@ import time
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, Iterable, List, Optional, Any, Set, Union
 
-from sqlalchemy import and_, desc, func, or_, select, text
+from sqlalchemy import and_, case, desc, func, inspect, or_, select, text, update
 from sqlalchemy import Column, DateTime, func
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.dialects.postgresql import insert as postgresql_insert
@@ -91,6 +91,9 @@ class SQLAlchemyDatabaseManager(DatabaseManager):
         self.max_retries = 3
         self.base_retry_delay = 0.1
         self.max_retry_delay = 2.0
+        
+        # Set by initialize() once the SQLite FTS5 symbol table is available
+        self._pool_symbol_fts = False
     
     async def initialize(self) -> None:
         """Initialize database connection and create tables if needed."""
@@ -102,6 +105,9 @@ class SQLAlchemyDatabaseManager(DatabaseManager):
         # Apply database optimizations
         self._apply_database_optimizations()
         
+        # Make sure symbol lookups are indexed on databases created before the column existed
+        self._ensure_pool_symbol_search()
+        
         logger.info("SQLAlchemy database manager initialized")
     
     def _apply_database_optimizations(self):
@@ -134,6 +140,98 @@ class SQLAlchemyDatabaseManager(DatabaseManager):
         except Exception as e:
             logger.warning(f"Failed to apply database optimizations: {e}")
     
+    def _ensure_pool_symbol_search(self):
+        """
+        Ensure pools.symbol_normalized exists, is populated and is searchable.
+        
+        Older databases gain the column and its index, rows inserted without
+        it are backfilled, and fuzzy search structures are created: an FTS5
+        trigram table kept in sync by triggers on SQLite and pg_trgm GIN
+        indexes on PostgreSQL.
+        """
+        from gecko_terminal_collector.utils.pool_id_utils import PoolIDUtils
+        
+        try:
+            db_url = str(self.connection.engine.url)
+            is_postgresql = "postgresql" in db_url
+            
+            with self.connection.engine.begin() as conn:
+                columns = {column['name'] for column in inspect(conn).get_columns('pools')}
+                if 'symbol_normalized' not in columns:
+                    column_type = "VARCHAR(200)" if is_postgresql else "VARCHAR(100)"
+                    conn.execute(text(f"ALTER TABLE pools ADD COLUMN symbol_normalized {column_type}"))
+                    logger.info("Added pools.symbol_normalized column")
+                
+                # One index under the name migration 006 uses; earlier SQLite
+                # databases created it as ix_pools_symbol_normalized
+                conn.execute(text("CREATE INDEX IF NOT EXISTS idx_pools_symbol_normalized ON pools (symbol_normalized)"))
+                conn.execute(text("DROP INDEX IF EXISTS ix_pools_symbol_normalized"))
+                
+                missing_ids = conn.execute(
+                    text("SELECT id FROM pools WHERE symbol_normalized IS NULL")
+                ).scalars().all()
+                if missing_ids:
+                    conn.execute(
+                        text("UPDATE pools SET symbol_normalized = :symbol WHERE id = :id"),
+                        [{'id': pool_id, 'symbol': PoolIDUtils.to_normalized_symbol(pool_id)} for pool_id in missing_ids]
+                    )
+                    logger.info(f"Backfilled symbol_normalized for {len(missing_ids)} pools")
+            
+            if "sqlite" in db_url:
+                self._ensure_sqlite_symbol_fts()
+            elif is_postgresql:
+                from gecko_terminal_collector.database.postgresql_models import create_pool_symbol_search_indexes
+                
+                with self.connection.engine.begin() as conn:
+                    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                    for statement in create_pool_symbol_search_indexes():
+                        conn.execute(text(statement))
+                    
+        except Exception as e:
+            logger.warning(f"Failed to set up pool symbol search: {e}")
+    
+    def _ensure_sqlite_symbol_fts(self):
+        """Create the FTS5 trigram table mirroring pool symbols and names."""
+        with self.connection.engine.begin() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'pools_symbol_fts'")
+            ).first()
+            if exists:
+                self._pool_symbol_fts = True
+                return
+            
+            try:
+                conn.execute(text(
+                    "CREATE VIRTUAL TABLE pools_symbol_fts USING fts5("
+                    "symbol_normalized, name, content='pools', content_rowid='rowid', tokenize='trigram')"
+                ))
+            except OperationalError as e:
+                # The trigram tokenizer needs SQLite 3.34+; searches fall back to LIKE
+                logger.info(f"SQLite FTS5 trigram search unavailable: {e}")
+                self._pool_symbol_fts = False
+                return
+            
+            conn.execute(text(
+                "CREATE TRIGGER pools_symbol_fts_ai AFTER INSERT ON pools BEGIN "
+                "INSERT INTO pools_symbol_fts(rowid, symbol_normalized, name) "
+                "VALUES (new.rowid, new.symbol_normalized, new.name); END"
+            ))
+            conn.execute(text(
+                "CREATE TRIGGER pools_symbol_fts_ad AFTER DELETE ON pools BEGIN "
+                "INSERT INTO pools_symbol_fts(pools_symbol_fts, rowid, symbol_normalized, name) "
+                "VALUES ('delete', old.rowid, old.symbol_normalized, old.name); END"
+            ))
+            conn.execute(text(
+                "CREATE TRIGGER pools_symbol_fts_au AFTER UPDATE OF symbol_normalized, name ON pools BEGIN "
+                "INSERT INTO pools_symbol_fts(pools_symbol_fts, rowid, symbol_normalized, name) "
+                "VALUES ('delete', old.rowid, old.symbol_normalized, old.name); "
+                "INSERT INTO pools_symbol_fts(rowid, symbol_normalized, name) "
+                "VALUES (new.rowid, new.symbol_normalized, new.name); END"
+            ))
+            conn.execute(text("INSERT INTO pools_symbol_fts(pools_symbol_fts) VALUES ('rebuild')"))
+            self._pool_symbol_fts = True
+            logger.info("Created pools_symbol_fts trigram search table")
+    
     def _create_upsert_statement(self, model_class, values, conflict_columns, update_columns):
         """Create database-specific upsert statement."""
         db_url = str(self.connection.engine.url)
@@ -191,8 +289,15 @@ class SQLAlchemyDatabaseManager(DatabaseManager):
             session.rollback()
             raise
         finally:
+            if read_only and "sqlite" in str(self.connection.engine.url):
+                # query_only is per-connection; clear it before the connection
+                # returns to the pool or later writes fail as read-only
+                try:
+                    session.execute(text("PRAGMA query_only=0"))
+                except Exception as e:
+                    logger.warning(f"Failed to reset query_only pragma: {e}")
             session.close()
-    
+
     async def _retry_with_backoff(self, func, *args, **kwargs):
         """Execute function with exponential backoff retry logic."""
         last_exception = None
@@ -1411,6 +1516,63 @@ class SQLAlchemyDatabaseManager(DatabaseManager):
         
         return records
     
+    async def get_ohlcv_frame(
+        self,
+        pool_ids: Union[str, Iterable[str]],
+        timeframe: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ):
+        """Get OHLCV data for one or more pools as typed columns in one query."""
+        from gecko_terminal_collector.database.frames import (
+            OHLCV_FRAME_COLUMNS, as_pool_ids, rows_to_frame, select_columns
+        )
+        
+        model = self.OHLCVDataModel
+        query = select(*select_columns(model, OHLCV_FRAME_COLUMNS)).where(
+            model.pool_id.in_(as_pool_ids(pool_ids)),
+            model.timeframe == timeframe
+        )
+        if start_time:
+            query = query.where(model.datetime >= start_time)
+        if end_time:
+            query = query.where(model.datetime <= end_time)
+        query = query.order_by(model.pool_id, model.datetime)
+        
+        with self.connection.get_session() as session:
+            rows = session.execute(query).all()
+        
+        return rows_to_frame(rows, OHLCV_FRAME_COLUMNS)
+    
+    async def get_trades_frame(
+        self,
+        pool_ids: Union[str, Iterable[str]],
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        min_volume_usd: Optional[float] = None
+    ):
+        """Get trade data for one or more pools as typed columns in one query."""
+        from gecko_terminal_collector.database.frames import (
+            TRADE_FRAME_COLUMNS, as_pool_ids, rows_to_frame, select_columns
+        )
+        
+        model = self.TradeModel
+        query = select(*select_columns(model, TRADE_FRAME_COLUMNS)).where(
+            model.pool_id.in_(as_pool_ids(pool_ids))
+        )
+        if start_time:
+            query = query.where(model.block_timestamp >= start_time)
+        if end_time:
+            query = query.where(model.block_timestamp <= end_time)
+        if min_volume_usd:
+            query = query.where(model.volume_usd >= min_volume_usd)
+        query = query.order_by(model.pool_id, model.block_timestamp)
+        
+        with self.connection.get_session() as session:
+            rows = session.execute(query).all()
+        
+        return rows_to_frame(rows, TRADE_FRAME_COLUMNS)
+    
     # Watchlist operations
     async def store_watchlist_entry(self, pool_id: str, metadata: Dict[str, Any]) -> None:
         """Add or update a watchlist entry."""
@@ -1481,6 +1643,112 @@ class SQLAlchemyDatabaseManager(DatabaseManager):
                 logger.error(f"Error updating watchlist entry status: {e}")
                 raise
     
+    async def add_or_reactivate_watchlist_entries(self, entries: List[Any]) -> int:
+        """
+        Add new watchlist entries and reactivate inactive existing ones in bulk.
+        
+        One query finds the existing entries, then all new entries are
+        inserted with one statement and all inactive ones reactivated with
+        another. New entries whose pool is not stored are skipped so one
+        unknown pool cannot fail the whole insert on the pools foreign key.
+        
+        Args:
+            entries: Watchlist entries to add
+            
+        Returns:
+            Number of entries added or reactivated
+        """
+        entries_by_pool = {}
+        for entry in entries:
+            entries_by_pool.setdefault(entry.pool_id, entry)
+        if not entries_by_pool:
+            return 0
+        
+        model = self.WatchlistEntryModel
+        pool_ids = list(entries_by_pool)
+        
+        with self.connection.get_session() as session:
+            try:
+                existing = {}
+                for i in range(0, len(pool_ids), 500):
+                    existing.update(session.execute(
+                        select(model.pool_id, model.is_active).where(model.pool_id.in_(pool_ids[i:i + 500]))
+                    ).all())
+                
+                missing = [pool_id for pool_id in pool_ids if pool_id not in existing]
+                known_pools = set()
+                for i in range(0, len(missing), 500):
+                    known_pools.update(session.execute(
+                        select(self.PoolModel.id).where(self.PoolModel.id.in_(missing[i:i + 500]))
+                    ).scalars())
+                unknown_pools = [pool_id for pool_id in missing if pool_id not in known_pools]
+                if unknown_pools:
+                    logger.warning(
+                        f"Skipping {len(unknown_pools)} watchlist entries for unknown pools: "
+                        f"{', '.join(unknown_pools[:10])}"
+                    )
+                
+                new_rows = [
+                    {
+                        'pool_id': entry.pool_id,
+                        'token_symbol': entry.token_symbol,
+                        'token_name': entry.token_name,
+                        'network_address': entry.network_address,
+                        'is_active': True,
+                    }
+                    for pool_id, entry in entries_by_pool.items() if pool_id in known_pools
+                ]
+                reactivate = [pool_id for pool_id, is_active in existing.items() if not is_active]
+                
+                if new_rows:
+                    session.execute(model.__table__.insert(), new_rows)
+                if reactivate:
+                    session.execute(
+                        update(model).where(model.pool_id.in_(reactivate)).values(is_active=True)
+                    )
+                session.commit()
+                
+                logger.info(
+                    f"Added {len(new_rows)} and reactivated {len(reactivate)} watchlist entries"
+                )
+                return len(new_rows) + len(reactivate)
+                
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error adding watchlist entries: {e}")
+                raise
+    
+    async def deactivate_watchlist_entries(self, pool_ids: List[str]) -> int:
+        """
+        Deactivate the watchlist entries of several pools with one statement.
+        
+        Args:
+            pool_ids: Pool IDs whose entries to deactivate
+            
+        Returns:
+            Number of entries deactivated
+        """
+        if not pool_ids:
+            return 0
+        
+        model = self.WatchlistEntryModel
+        with self.connection.get_session() as session:
+            try:
+                result = session.execute(
+                    update(model)
+                    .where(model.pool_id.in_(list(pool_ids)), model.is_active.is_(True))
+                    .values(is_active=False)
+                    .execution_options(synchronize_session=False)
+                )
+                session.commit()
+                logger.info(f"Deactivated {result.rowcount} watchlist entries")
+                return result.rowcount
+                
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error deactivating watchlist entries: {e}")
+                raise
+    
     async def get_watchlist_pools(self) -> List[str]:
         """Get all active watchlist pool IDs."""
         pool_ids = []
@@ -2070,6 +2338,23 @@ class SQLAlchemyDatabaseManager(DatabaseManager):
                 logger.error(f"Error getting pool history for {pool_id}: {e}")
                 return []
     
+    async def get_pool_history_frame(self, pool_ids: Union[str, Iterable[str]], cutoff_time: datetime):
+        """Get new pools history for one or more pools as typed columns in one query."""
+        from gecko_terminal_collector.database.frames import (
+            POOL_HISTORY_FRAME_COLUMNS, as_pool_ids, rows_to_frame, select_columns
+        )
+        from gecko_terminal_collector.database.models import NewPoolsHistory
+        
+        query = select(*select_columns(NewPoolsHistory, POOL_HISTORY_FRAME_COLUMNS)).where(
+            NewPoolsHistory.pool_id.in_(as_pool_ids(pool_ids)),
+            NewPoolsHistory.collected_at >= cutoff_time
+        ).order_by(NewPoolsHistory.pool_id, NewPoolsHistory.collected_at.desc())
+        
+        with self.connection.get_session() as session:
+            rows = session.execute(query).all()
+        
+        return rows_to_frame(rows, POOL_HISTORY_FRAME_COLUMNS)
+    
     async def is_pool_in_watchlist(self, pool_id: str) -> bool:
         """
         Check if pool is already in watchlist.
@@ -2369,12 +2654,20 @@ class SQLAlchemyDatabaseManager(DatabaseManager):
             
             return query.all()
     
-    async def update_pool_activity_scores(self, pool_scores: Dict[str, Decimal]) -> int:
+    async def update_pool_activity_scores(
+        self,
+        pool_scores: Dict[str, Decimal],
+        checked_at: Optional[datetime] = None
+    ) -> int:
         """
         Bulk update activity scores for multiple pools.
         
+        All scores are written with a single UPDATE statement keyed on
+        pool ID rather than one query and update per pool.
+        
         Args:
             pool_scores: Dictionary mapping pool_id to activity_score
+            checked_at: Activity check timestamp to record (defaults to now)
             
         Returns:
             Number of pools updated
@@ -2382,16 +2675,20 @@ class SQLAlchemyDatabaseManager(DatabaseManager):
         if not pool_scores:
             return 0
         
-        updated_count = 0
+        checked_at = checked_at or datetime.now()
         
         with self.connection.get_session() as session:
             try:
-                for pool_id, score in pool_scores.items():
-                    pool = session.query(self.PoolModel).filter_by(id=pool_id).first()
-                    if pool:
-                        pool.activity_score = score
-                        pool.last_activity_check = datetime.utcnow()
-                        updated_count += 1
+                result = session.execute(
+                    update(self.PoolModel)
+                    .where(self.PoolModel.id.in_(list(pool_scores)))
+                    .values(
+                        activity_score=case(pool_scores, value=self.PoolModel.id),
+                        last_activity_check=checked_at
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                updated_count = result.rowcount
                 
                 session.commit()
                 logger.info(f"Updated activity scores for {updated_count} pools")
@@ -2407,6 +2704,9 @@ class SQLAlchemyDatabaseManager(DatabaseManager):
         """
         Bulk update collection priorities for multiple pools.
         
+        All priorities are written with a single UPDATE statement keyed on
+        pool ID rather than one query and update per pool.
+        
         Args:
             pool_priorities: Dictionary mapping pool_id to collection_priority
             
@@ -2416,16 +2716,18 @@ class SQLAlchemyDatabaseManager(DatabaseManager):
         if not pool_priorities:
             return 0
         
-        updated_count = 0
-        
         with self.connection.get_session() as session:
             try:
-                for pool_id, priority in pool_priorities.items():
-                    pool = session.query(self.PoolModel).filter_by(id=pool_id).first()
-                    if pool:
-                        pool.collection_priority = priority
-                        pool.last_updated = datetime.utcnow()
-                        updated_count += 1
+                result = session.execute(
+                    update(self.PoolModel)
+                    .where(self.PoolModel.id.in_(list(pool_priorities)))
+                    .values(
+                        collection_priority=case(pool_priorities, value=self.PoolModel.id),
+                        last_updated=datetime.now()
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                updated_count = result.rowcount
                 
                 session.commit()
                 logger.info(f"Updated priorities for {updated_count} pools")
@@ -2,9 +2,26 @@
 Monitoring and coordination components for the GeckoTerminal collector system.
 """
 
-from .collection_monitor import CollectionMonitor, CollectionStatus, AlertLevel
-from .performance_metrics import PerformanceMetrics, MetricsCollector
-from .execution_history import ExecutionHistoryTracker, ExecutionRecord
+from ..utils.lazy_imports import lazy_exports
+
+_LAZY_IMPORTS = {
+    "CollectionMonitor": ".collection_monitor",
+    "CollectionStatus": ".collection_monitor",
+    "AlertLevel": ".collection_monitor",
+    "PerformanceMetrics": ".performance_metrics",
+    "MetricsCollector": ".performance_metrics",
+    "ExecutionHistoryTracker": ".execution_history",
+    "ExecutionRecord": ".execution_history",
+    "MonitoringWriteBehindQueue": ".write_behind",
+    "WriteBehindConfig": ".write_behind",
+    "CycleProfile": ".tracing",
+    "SamplingProfiler": ".tracing",
+    "Tracer": ".tracing",
+    "traced": ".tracing",
+    "tracer": ".tracing",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "CollectionMonitor",
@@ -13,5 +30,12 @@ __all__ = [
     "PerformanceMetrics",
     "MetricsCollector",
     "ExecutionHistoryTracker",
-    "ExecutionRecord"
-]
\ No newline at end of file
+    "ExecutionRecord",
+    "MonitoringWriteBehindQueue",
+    "WriteBehindConfig",
+    "CycleProfile",
+    "SamplingProfiler",
+    "Tracer",
+    "traced",
+    "tracer"
+]
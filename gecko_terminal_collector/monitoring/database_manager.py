@@ -7,13 +7,18 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_
+from sqlalchemy import desc, and_, or_, insert
+from sqlalchemy.exc import IntegrityError
 
+from gecko_terminal_collector.config.models import MonitoringConfig
 from gecko_terminal_collector.database.models import (
     CollectionMetadata, ExecutionHistory, PerformanceMetrics, SystemAlerts
 )
 from gecko_terminal_collector.monitoring.execution_history import ExecutionRecord, ExecutionStatus
 from gecko_terminal_collector.monitoring.collection_monitor import Alert, AlertLevel
+from gecko_terminal_collector.monitoring.write_behind import (
+    MonitoringWriteBehindQueue, WriteBehindConfig
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +29,10 @@ class MonitoringDatabaseManager:
     
     Handles storage and retrieval of execution history, performance metrics,
     and system alerts with efficient querying and data retention management.
+    
+    When write-behind is enabled, the ``store_*`` and ``update_*`` methods
+    only queue records; they are persisted in multi-row batches by a
+    :class:`MonitoringWriteBehindQueue`.
     """
     
     def __init__(self, session_factory):
@@ -34,6 +43,33 @@ class MonitoringDatabaseManager:
             session_factory: SQLAlchemy session factory
         """
         self.session_factory = session_factory
+        self.write_behind: Optional[MonitoringWriteBehindQueue] = None
+    
+    def enable_write_behind(
+        self,
+        config: Optional[WriteBehindConfig] = None
+    ) -> MonitoringWriteBehindQueue:
+        """
+        Route monitoring writes through a batched write-behind queue.
+        
+        The returned queue must be started with ``await queue.start()`` and
+        stopped (which flushes it) on shutdown.
+        
+        Args:
+            config: Write-behind configuration
+            
+        Returns:
+            The write-behind queue used by this manager
+        """
+        if self.write_behind is None:
+            queue = MonitoringWriteBehindQueue(config)
+            queue.register_handler("execution", self.store_execution_records)
+            queue.register_handler("metric", self.store_performance_metrics, sampleable=True)
+            queue.register_handler("alert", self.store_alerts)
+            queue.register_handler("collection_metadata", self.apply_collection_metadata_updates)
+            self.write_behind = queue
+        
+        return self.write_behind
     
     def store_execution_record(self, record: ExecutionRecord) -> bool:
         """
@@ -43,8 +79,11 @@ class MonitoringDatabaseManager:
             record: ExecutionRecord to store
             
         Returns:
-            True if stored successfully, False otherwise
+            True if stored (or queued) successfully, False otherwise
         """
+        if self.write_behind is not None:
+            return self.write_behind.submit("execution", record)
+        
         try:
             with self.session_factory() as session:
                 # Check if record already exists
@@ -84,6 +123,65 @@ class MonitoringDatabaseManager:
             logger.error(f"Error storing execution record {record.execution_id}: {e}")
             return False
     
+    def store_execution_records(self, records: List[ExecutionRecord]) -> int:
+        """
+        Store multiple execution records in a single transaction.
+        
+        Existing records are updated, new records are inserted with one
+        multi-row INSERT. If the same execution ID appears more than once,
+        the last record wins.
+        
+        Args:
+            records: ExecutionRecords to store
+            
+        Returns:
+            Number of records stored
+        """
+        latest = {record.execution_id: record for record in records}
+        if not latest:
+            return 0
+        
+        with self.session_factory() as session:
+            existing = {
+                row.execution_id: row
+                for row in session.query(ExecutionHistory).filter(
+                    ExecutionHistory.execution_id.in_(list(latest.keys()))
+                )
+            }
+            
+            new_rows = []
+            for execution_id, record in latest.items():
+                values = self._execution_record_values(record)
+                db_record = existing.get(execution_id)
+                if db_record is not None:
+                    for key, value in values.items():
+                        setattr(db_record, key, value)
+                else:
+                    new_rows.append(values)
+            
+            if new_rows:
+                session.execute(insert(ExecutionHistory), new_rows)
+            
+            session.commit()
+        
+        return len(latest)
+    
+    @staticmethod
+    def _execution_record_values(record: ExecutionRecord) -> Dict[str, Any]:
+        """Convert an ExecutionRecord to ExecutionHistory column values."""
+        return {
+            "collector_type": record.collector_type,
+            "execution_id": record.execution_id,
+            "start_time": record.start_time,
+            "end_time": record.end_time,
+            "status": record.status.value,
+            "records_collected": record.records_collected,
+            "execution_time": record.duration_seconds,
+            "error_message": "; ".join(record.errors) if record.errors else None,
+            "warnings": json.dumps(record.warnings) if record.warnings else None,
+            "execution_metadata": json.dumps(record.metadata) if record.metadata else None,
+        }
+    
     def get_execution_history(
         self,
         collector_type: Optional[str] = None,
@@ -175,8 +273,17 @@ class MonitoringDatabaseManager:
             labels: Optional labels for the metric
             
         Returns:
-            True if stored successfully, False otherwise
+            True if stored (or queued) successfully, False otherwise
         """
+        if self.write_behind is not None:
+            return self.write_behind.submit("metric", {
+                "collector_type": collector_type,
+                "metric_name": metric_name,
+                "value": value,
+                "timestamp": timestamp or datetime.now(),
+                "labels": labels,
+            })
+        
         try:
             with self.session_factory() as session:
                 metric = PerformanceMetrics(
@@ -194,6 +301,51 @@ class MonitoringDatabaseManager:
             logger.error(f"Error storing performance metric {metric_name}: {e}")
             return False
     
+    def store_performance_metrics(self, metrics: List[Dict[str, Any]]) -> int:
+        """
+        Store multiple performance metrics with one multi-row INSERT.
+        
+        Falls back to row-by-row inserts, skipping duplicates, if the batch
+        violates the (collector_type, metric_name, timestamp) constraint.
+        
+        Args:
+            metrics: Metric dictionaries with collector_type, metric_name,
+                value, timestamp and optional labels
+            
+        Returns:
+            Number of metrics stored
+        """
+        rows = {}
+        for metric in metrics:
+            key = (metric["collector_type"], metric["metric_name"], metric["timestamp"])
+            rows[key] = {
+                "collector_type": metric["collector_type"],
+                "metric_name": metric["metric_name"],
+                "metric_value": metric["value"],
+                "timestamp": metric["timestamp"],
+                "labels": json.dumps(metric["labels"]) if metric.get("labels") else None,
+            }
+        if not rows:
+            return 0
+        
+        with self.session_factory() as session:
+            try:
+                session.execute(insert(PerformanceMetrics), list(rows.values()))
+                session.commit()
+                return len(rows)
+            except IntegrityError:
+                session.rollback()
+            
+            stored = 0
+            for row in rows.values():
+                try:
+                    session.execute(insert(PerformanceMetrics), [row])
+                    session.commit()
+                    stored += 1
+                except IntegrityError:
+                    session.rollback()
+            return stored
+    
     def get_performance_metrics(
         self,
         collector_type: Optional[str] = None,
@@ -268,8 +420,11 @@ class MonitoringDatabaseManager:
             alert: Alert to store
             
         Returns:
-            True if stored successfully, False otherwise
+            True if stored (or queued) successfully, False otherwise
         """
+        if self.write_behind is not None:
+            return self.write_behind.submit("alert", alert)
+        
         try:
             with self.session_factory() as session:
                 # Check if alert already exists
@@ -303,6 +458,55 @@ class MonitoringDatabaseManager:
             logger.error(f"Error storing alert {alert.id}: {e}")
             return False
     
+    def store_alerts(self, alerts: List[Alert]) -> int:
+        """
+        Store multiple alerts in a single transaction.
+        
+        Args:
+            alerts: Alerts to store; the last state of a repeated alert ID wins
+            
+        Returns:
+            Number of alerts stored
+        """
+        latest = {alert.id: alert for alert in alerts}
+        if not latest:
+            return 0
+        
+        with self.session_factory() as session:
+            existing = {
+                row.alert_id: row
+                for row in session.query(SystemAlerts).filter(
+                    SystemAlerts.alert_id.in_(list(latest.keys()))
+                )
+            }
+            
+            new_rows = []
+            for alert_id, alert in latest.items():
+                alert_metadata = json.dumps(alert.metadata) if alert.metadata else None
+                db_alert = existing.get(alert_id)
+                if db_alert is not None:
+                    db_alert.acknowledged = alert.acknowledged
+                    db_alert.resolved = alert.resolved
+                    db_alert.alert_metadata = alert_metadata
+                else:
+                    new_rows.append({
+                        "alert_id": alert.id,
+                        "level": alert.level.value,
+                        "collector_type": alert.collector_type,
+                        "message": alert.message,
+                        "timestamp": alert.timestamp,
+                        "acknowledged": alert.acknowledged,
+                        "resolved": alert.resolved,
+                        "alert_metadata": alert_metadata,
+                    })
+            
+            if new_rows:
+                session.execute(insert(SystemAlerts), new_rows)
+            
+            session.commit()
+        
+        return len(latest)
+    
     def get_alerts(
         self,
         level: Optional[AlertLevel] = None,
@@ -390,48 +594,23 @@ class MonitoringDatabaseManager:
             error_message: Optional error message
             
         Returns:
-            True if updated successfully, False otherwise
+            True if updated (or queued) successfully, False otherwise
         """
+        update = {
+            "collector_type": collector_type,
+            "execution_time": execution_time,
+            "records_collected": records_collected,
+            "success": success,
+            "error_message": error_message,
+            "timestamp": datetime.now(),
+        }
+        
+        if self.write_behind is not None:
+            return self.write_behind.submit("collection_metadata", update)
+        
         try:
             with self.session_factory() as session:
-                # Get or create metadata record
-                metadata = session.query(CollectionMetadata).filter_by(
-                    collector_type=collector_type
-                ).first()
-                
-                if not metadata:
-                    metadata = CollectionMetadata(collector_type=collector_type)
-                    session.add(metadata)
-                
-                # Update metadata
-                metadata.last_run = datetime.now()
-                metadata.run_count = (metadata.run_count or 0) + 1
-                metadata.total_execution_time = (metadata.total_execution_time or 0) + execution_time
-                metadata.total_records_collected = (metadata.total_records_collected or 0) + records_collected
-                
-                if success:
-                    metadata.last_success = datetime.now()
-                    metadata.last_error = None
-                else:
-                    metadata.error_count = (metadata.error_count or 0) + 1
-                    metadata.last_error = error_message
-                
-                # Calculate derived metrics
-                if metadata.run_count > 0:
-                    metadata.average_execution_time = metadata.total_execution_time / metadata.run_count
-                    success_count = metadata.run_count - (metadata.error_count or 0)
-                    metadata.success_rate = (success_count / metadata.run_count) * 100
-                
-                # Calculate health score (simplified)
-                if metadata.success_rate >= 95:
-                    metadata.health_score = 100.0
-                elif metadata.success_rate >= 80:
-                    metadata.health_score = 80.0
-                elif metadata.success_rate >= 60:
-                    metadata.health_score = 60.0
-                else:
-                    metadata.health_score = 40.0
-                
+                self._apply_collection_metadata_update(session, update)
                 session.commit()
                 return True
                 
@@ -439,6 +618,85 @@ class MonitoringDatabaseManager:
             logger.error(f"Error updating collection metadata for {collector_type}: {e}")
             return False
     
+    def apply_collection_metadata_updates(self, updates: List[Dict[str, Any]]) -> int:
+        """
+        Apply multiple collection metadata updates in a single transaction.
+        
+        Args:
+            updates: Update dictionaries as built by update_collection_metadata
+            
+        Returns:
+            Number of updates applied
+        """
+        if not updates:
+            return 0
+        
+        with self.session_factory() as session:
+            metadata_by_type: Dict[str, CollectionMetadata] = {}
+            for update in updates:
+                self._apply_collection_metadata_update(session, update, metadata_by_type)
+            session.commit()
+        
+        return len(updates)
+    
+    @staticmethod
+    def _apply_collection_metadata_update(
+        session: Session,
+        update: Dict[str, Any],
+        metadata_by_type: Optional[Dict[str, CollectionMetadata]] = None
+    ) -> None:
+        """Apply one collection metadata update within an open session."""
+        collector_type = update["collector_type"]
+        timestamp = update["timestamp"]
+        
+        metadata = metadata_by_type.get(collector_type) if metadata_by_type is not None else None
+        if metadata is None:
+            # Get or create metadata record
+            metadata = session.query(CollectionMetadata).filter_by(
+                collector_type=collector_type
+            ).first()
+            
+            if not metadata:
+                metadata = CollectionMetadata(collector_type=collector_type)
+                session.add(metadata)
+            
+            if metadata_by_type is not None:
+                metadata_by_type[collector_type] = metadata
+        
+        execution_time = update["execution_time"]
+        records_collected = update["records_collected"]
+        success = update["success"]
+        error_message = update["error_message"]
+        
+        # Update metadata
+        metadata.last_run = timestamp
+        metadata.run_count = (metadata.run_count or 0) + 1
+        metadata.total_execution_time = (metadata.total_execution_time or 0) + execution_time
+        metadata.total_records_collected = (metadata.total_records_collected or 0) + records_collected
+        
+        if success:
+            metadata.last_success = timestamp
+            metadata.last_error = None
+        else:
+            metadata.error_count = (metadata.error_count or 0) + 1
+            metadata.last_error = error_message
+        
+        # Calculate derived metrics
+        if metadata.run_count > 0:
+            metadata.average_execution_time = metadata.total_execution_time / metadata.run_count
+            success_count = metadata.run_count - (metadata.error_count or 0)
+            metadata.success_rate = (success_count / metadata.run_count) * 100
+        
+        # Calculate health score (simplified)
+        if metadata.success_rate >= 95:
+            metadata.health_score = 100.0
+        elif metadata.success_rate >= 80:
+            metadata.health_score = 80.0
+        elif metadata.success_rate >= 60:
+            metadata.health_score = 60.0
+        else:
+            metadata.health_score = 40.0
+    
     def cleanup_old_data(self, days_to_keep: int = 30) -> Dict[str, int]:
         """
         Clean up old monitoring data.
@@ -502,4 +760,33 @@ class MonitoringDatabaseManager:
         except Exception as e:
             logger.error(f"Error cleaning up old monitoring data: {e}")
         
-        return removed_counts
\ No newline at end of file
+        return removed_counts
+
+def create_monitoring_db_manager(db_manager, config: MonitoringConfig) -> MonitoringDatabaseManager:
+    """
+    Create the monitoring database manager for an initialized database manager.
+    
+    With write-behind enabled, monitoring records of both the returned
+    manager and, if it supports it, the database manager's collection run
+    metadata are queued; CollectionScheduler starts and flushes the queues.
+    
+    Args:
+        db_manager: Initialized SQLAlchemy database manager
+        config: Monitoring configuration
+        
+    Returns:
+        MonitoringDatabaseManager sharing the database manager's connection
+    """
+    monitoring_db_manager = MonitoringDatabaseManager(db_manager.connection.get_session)
+    
+    if config.write_behind_enabled:
+        write_behind_config = WriteBehindConfig(
+            max_batch_size=config.write_behind_batch_size,
+            flush_interval=config.write_behind_flush_interval,
+            max_queue_size=config.write_behind_max_queue_size
+        )
+        monitoring_db_manager.enable_write_behind(write_behind_config)
+        if hasattr(db_manager, 'enable_monitoring_write_behind'):
+            db_manager.enable_monitoring_write_behind(write_behind_config)
+    
+    return monitoring_db_manager
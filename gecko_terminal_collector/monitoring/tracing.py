@@ -0,0 +1,463 @@
+"""
+Opt-in span tracing and sampling profiler for collector hot paths.
+
+Spans time API requests, rate-limiter waits, parsing, validation and
+database calls. They nest through a context variable, so concurrent
+asyncio tasks keep separate stacks, and are aggregated per collection
+cycle. Each cycle is tagged with the structured-logging correlation ID,
+which ties its flame summary to the log lines emitted during it.
+
+Tracing is off by default. While disabled, ``Tracer.span`` returns a
+shared no-op context manager and traced functions call straight through
+after a single flag check.
+"""
+
+import functools
+import inspect
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SpanPath = Tuple[str, ...]
+
+_NULL_SPAN = nullcontext()
+
+
+@dataclass
+class SpanAggregate:
+    """Timing totals for every span recorded at one stack path."""
+    count: int = 0
+    total_seconds: float = 0.0
+    self_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def add(self, duration: float, self_time: float) -> None:
+        self.count += 1
+        self.total_seconds += duration
+        self.self_seconds += self_time
+        self.max_seconds = max(self.max_seconds, duration)
+
+
+@dataclass
+class CycleProfile:
+    """Spans aggregated over one collection cycle."""
+    name: str
+    correlation_id: str
+    started_at: datetime
+    duration_seconds: float = 0.0
+    spans: Dict[SpanPath, SpanAggregate] = field(default_factory=lambda: defaultdict(SpanAggregate))
+
+    def by_span_name(self) -> Dict[str, SpanAggregate]:
+        """Merge aggregates of the same span across all stack paths."""
+        merged: Dict[str, SpanAggregate] = defaultdict(SpanAggregate)
+        for path, aggregate in self.spans.items():
+            target = merged[path[-1]]
+            target.count += aggregate.count
+            target.total_seconds += aggregate.total_seconds
+            target.self_seconds += aggregate.self_seconds
+            target.max_seconds = max(target.max_seconds, aggregate.max_seconds)
+        return merged
+
+    def to_folded(self) -> str:
+        """
+        Render self time as folded stacks (one ``a;b;c <microseconds>`` line
+        per path), the input format of flamegraph.pl and speedscope.
+        """
+        lines = [
+            f"{';'.join(path)} {int(aggregate.self_seconds * 1_000_000)}"
+            for path, aggregate in sorted(self.spans.items())
+            if aggregate.self_seconds > 0
+        ]
+        return "\n".join(lines)
+
+    def format_summary(self, limit: int = 10) -> str:
+        """Render the spans with the most self time as a plain-text table."""
+        lines = [
+            f"Cycle {self.name} [{self.correlation_id}] took {self.duration_seconds * 1000:.1f}ms",
+            f"  {'span':<48} {'calls':>6} {'self_ms':>9} {'total_ms':>9} {'max_ms':>8}",
+        ]
+        ranked = sorted(self.by_span_name().items(), key=lambda item: item[1].self_seconds, reverse=True)
+        for name, aggregate in ranked[:limit]:
+            lines.append(
+                f"  {name[:48]:<48} {aggregate.count:>6} {aggregate.self_seconds * 1000:>9.1f} "
+                f"{aggregate.total_seconds * 1000:>9.1f} {aggregate.max_seconds * 1000:>8.1f}"
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "name": self.name,
+            "correlation_id": self.correlation_id,
+            "started_at": self.started_at.isoformat(),
+            "duration_seconds": self.duration_seconds,
+            "spans": {
+                ";".join(path): {
+                    "count": aggregate.count,
+                    "total_seconds": aggregate.total_seconds,
+                    "self_seconds": aggregate.self_seconds,
+                    "max_seconds": aggregate.max_seconds,
+                }
+                for path, aggregate in self.spans.items()
+            },
+        }
+
+
+class _Span:
+    """An active span; records its duration into the tracer on exit."""
+
+    __slots__ = ("tracer", "name", "path", "parent", "child_seconds", "start", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self) -> "_Span":
+        self.parent = _current_span.get()
+        self.path = self.parent.path + (self.name,) if self.parent else (self.name,)
+        self.child_seconds = 0.0
+        self._token = _current_span.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        duration = time.perf_counter() - self.start
+        _current_span.reset(self._token)
+        if self.parent is not None:
+            # Children running concurrently can add up to more than the
+            # parent's wall time, so self time is clamped below.
+            self.parent.child_seconds += duration
+        self.tracer._record(self.path, duration, max(duration - self.child_seconds, 0.0))
+        return False
+
+
+_current_span: ContextVar[Optional[_Span]] = ContextVar("tracing_current_span", default=None)
+_current_cycle: ContextVar[Optional[CycleProfile]] = ContextVar("tracing_current_cycle", default=None)
+
+
+def current_span_path() -> SpanPath:
+    """Names of the spans open in the current task, outermost first."""
+    span = _current_span.get()
+    return span.path if span is not None else ()
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler sampling one thread's Python stack on a timer.
+
+    Samples are folded into ``frame;frame;frame count`` lines so they can
+    be rendered with the same flame graph tooling as span summaries.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None):
+        """
+        Initialize sampling profiler.
+
+        Args:
+            interval: Seconds between samples
+            thread_id: Thread to sample (defaults to the calling thread)
+        """
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.samples: Dict[str, int] = defaultdict(int)
+        self.total_samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling on a background thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+            self.total_samples += 1
+
+    def to_folded(self) -> str:
+        """Render samples as folded stacks, hottest first."""
+        ranked = sorted(self.samples.items(), key=lambda item: item[1], reverse=True)
+        return "\n".join(f"{stack} {count}" for stack, count in ranked)
+
+    def dump(self, path: str) -> str:
+        """Write folded samples to a file and return its path."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_folded())
+            f.write("\n")
+        logger.info(f"Wrote {self.total_samples} profiler samples to {path}")
+        return path
+
+
+class Tracer:
+    """
+    Collects timed spans into per-cycle profiles.
+
+    A cycle is opened with ``cycle()`` around one collector run; spans
+    opened inside it (in the same task or tasks it spawns) are aggregated
+    by stack path. Spans outside any cycle are aggregated globally.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.output_dir: Optional[str] = None
+        self.summary_limit = 10
+        self.cycles: Deque[CycleProfile] = deque(maxlen=100)
+        self.global_spans: Dict[SpanPath, SpanAggregate] = defaultdict(SpanAggregate)
+        self.sampler: Optional[SamplingProfiler] = None
+        self._lock = threading.Lock()
+
+    def enable(
+        self,
+        output_dir: Optional[str] = None,
+        summary_limit: int = 10,
+        max_cycles: int = 100
+    ) -> None:
+        """
+        Enable span tracing.
+
+        Args:
+            output_dir: Directory for per-cycle folded stack files (None to only log)
+            summary_limit: Number of spans listed in each cycle summary
+            max_cycles: Number of completed cycle profiles kept in memory
+        """
+        self.output_dir = output_dir
+        self.summary_limit = summary_limit
+        if self.cycles.maxlen != max_cycles:
+            self.cycles = deque(self.cycles, maxlen=max_cycles)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        self.enabled = True
+        logger.info("Span tracing enabled")
+
+    def disable(self) -> None:
+        """Disable span tracing; spans already open still complete."""
+        self.enabled = False
+        logger.info("Span tracing disabled")
+
+    def toggle(self) -> bool:
+        """Flip tracing on or off, keeping the current settings."""
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable(self.output_dir, self.summary_limit, self.cycles.maxlen)
+        return self.enabled
+
+    def reset(self) -> None:
+        """Drop all recorded cycles and global spans."""
+        with self._lock:
+            self.cycles.clear()
+            self.global_spans.clear()
+
+    def span(self, name: str):
+        """Context manager timing a span (a shared no-op while disabled)."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def cycle(self, name: str):
+        """
+        Context manager opening a collection cycle.
+
+        The cycle adopts the current correlation ID, or sets a fresh one for
+        its duration. A cycle opened inside another cycle is recorded as a
+        span of the outer one.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        if _current_cycle.get() is not None:
+            return _Span(self, name)
+        return self._cycle(name)
+
+    @contextmanager
+    def _cycle(self, name: str):
+        from gecko_terminal_collector.utils.structured_logging import correlation_id
+
+        corr_id = correlation_id.get()
+        corr_token = None
+        if corr_id is None:
+            corr_id = str(uuid.uuid4())
+            corr_token = correlation_id.set(corr_id)
+
+        profile = CycleProfile(name=name, correlation_id=corr_id, started_at=datetime.now())
+        cycle_token = _current_cycle.set(profile)
+        start = time.perf_counter()
+        try:
+            with _Span(self, name):
+                yield profile
+        finally:
+            profile.duration_seconds = time.perf_counter() - start
+            _current_cycle.reset(cycle_token)
+            if corr_token is not None:
+                correlation_id.reset(corr_token)
+            self._finish_cycle(profile)
+
+    def _record(self, path: SpanPath, duration: float, self_time: float) -> None:
+        profile = _current_cycle.get()
+        spans = profile.spans if profile is not None else self.global_spans
+        with self._lock:
+            spans[path].add(duration, self_time)
+
+    def _finish_cycle(self, profile: CycleProfile) -> None:
+        with self._lock:
+            self.cycles.append(profile)
+
+        logger.info(profile.format_summary(self.summary_limit))
+
+        if self.output_dir:
+            filename = f"{profile.started_at:%Y%m%d_%H%M%S}_{profile.name}_{profile.correlation_id[:8]}.folded"
+            try:
+                with open(os.path.join(self.output_dir, filename), "w", encoding="utf-8") as f:
+                    f.write(profile.to_folded())
+                    f.write("\n")
+            except OSError as e:
+                logger.warning(f"Failed to write cycle profile {filename}: {e}")
+
+    def get_cycles(self, name: Optional[str] = None) -> List[CycleProfile]:
+        """Get completed cycle profiles, optionally for one cycle name."""
+        with self._lock:
+            return [profile for profile in self.cycles if name is None or profile.name == name]
+
+    # Sampling profiler
+    def start_sampling(self, interval: float = 0.005) -> SamplingProfiler:
+        """Start sampling the calling thread's stack."""
+        if self.sampler is None or not self.sampler.running:
+            self.sampler = SamplingProfiler(interval)
+            self.sampler.start()
+            logger.info(f"Sampling profiler started ({interval * 1000:.0f}ms interval)")
+        return self.sampler
+
+    def stop_sampling(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Stop the sampling profiler and dump its samples.
+
+        Args:
+            path: Output file (defaults to a timestamped file in output_dir or cwd)
+
+        Returns:
+            Path of the dump, or None if the profiler was not running
+        """
+        if self.sampler is None:
+            return None
+        self.sampler.stop()
+        if path is None:
+            path = os.path.join(self.output_dir or ".", f"sampling_{datetime.now():%Y%m%d_%H%M%S}.folded")
+        dump_path = self.sampler.dump(path)
+        self.sampler = None
+        return dump_path
+
+    def toggle_sampling(self) -> Optional[str]:
+        """Start the sampling profiler, or stop it and return the dump path."""
+        if self.sampler is not None and self.sampler.running:
+            return self.stop_sampling()
+        self.start_sampling()
+        return None
+
+    def install_signal_handlers(self) -> bool:
+        """
+        Toggle tracing on SIGUSR1 and the sampling profiler on SIGUSR2.
+
+        Must be called from the main thread. Returns False on platforms
+        without these signals.
+        """
+        if not hasattr(signal, "SIGUSR1"):
+            return False
+        signal.signal(signal.SIGUSR1, lambda signum, frame: self.toggle())
+        signal.signal(signal.SIGUSR2, lambda signum, frame: self.toggle_sampling())
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tracer statistics."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "cycles_recorded": len(self.cycles),
+                "global_span_paths": len(self.global_spans),
+                "sampling": self.sampler is not None and self.sampler.running,
+                "output_dir": self.output_dir,
+            }
+
+
+tracer = Tracer()
+
+
+def traced(name: Optional[str] = None):
+    """
+    Decorator timing each call of a function as a span.
+
+    Works for plain and async functions; generators are returned unwrapped.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+    """
+    def decorator(func: Callable) -> Callable:
+        if getattr(func, "__traced__", False) or inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func):
+            return func
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not tracer.enabled:
+                    return await func(*args, **kwargs)
+                with _Span(tracer, span_name):
+                    return await func(*args, **kwargs)
+            wrapper = async_wrapper
+        else:
+            @functools.wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                if not tracer.enabled:
+                    return func(*args, **kwargs)
+                with _Span(tracer, span_name):
+                    return func(*args, **kwargs)
+            wrapper = sync_wrapper
+
+        wrapper.__traced__ = True
+        return wrapper
+    return decorator
+
+
+def instrument_methods(cls: type, should_trace: Callable[[str], bool]) -> None:
+    """
+    Wrap the functions defined directly on a class whose names match.
+
+    Intended for ``__init_subclass__`` hooks, so every implementation of an
+    interface is traced without decorating each method by hand. Spans are
+    named ``ClassName.method``.
+    """
+    for attr, value in list(vars(cls).items()):
+        if inspect.isfunction(value) and should_trace(attr):
+            setattr(cls, attr, traced(f"{cls.__name__}.{attr}")(value))
@@ -0,0 +1,325 @@
+"""
+Write-behind queue for monitoring records.
+
+Buffers execution history, performance metrics, alerts and collection
+metadata updates in memory and flushes them to the database in multi-row
+batches, so telemetry writes no longer take SQLite's writer lock once per
+record while OHLCV and trade data is being stored.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriteBehindConfig:
+    """Configuration for the monitoring write-behind queue."""
+    max_batch_size: int = 500
+    flush_interval: float = 5.0  # seconds
+    max_queue_size: int = 10000
+    high_watermark: float = 0.8  # fraction of max_queue_size
+    sample_rate: int = 10  # keep 1 in N sampleable records above the watermark
+    max_retries: int = 3
+    retry_delay: float = 0.5  # seconds
+    offload_to_thread: bool = False  # only safe with a pooled (non-SQLite) engine
+
+
+@dataclass
+class _RecordKind:
+    """Registered handler for one kind of monitoring record."""
+    handler: Callable[[List[Any]], int]
+    sampleable: bool = False
+    submitted: int = 0
+    written: int = 0
+    dropped: int = 0
+    sampled_out: int = 0
+
+
+class MonitoringWriteBehindQueue:
+    """
+    Bounded, asynchronous write-behind queue for monitoring records.
+
+    Producers call :meth:`submit`, which never blocks and never touches the
+    database. A background task drains the queue when it reaches
+    ``max_batch_size`` or every ``flush_interval`` seconds, grouping records
+    by kind and handing each group to its registered bulk handler in a
+    single call.
+
+    When the queue falls behind, back-pressure is applied in two stages:
+    above the high watermark only every ``sample_rate``-th record of a
+    sampleable kind (e.g. performance metrics) is accepted, and once the
+    queue is full the oldest sampleable record is evicted to make room, or
+    the new record is dropped if nothing can be evicted.
+    """
+
+    def __init__(self, config: Optional[WriteBehindConfig] = None):
+        """
+        Initialize write-behind queue.
+
+        Args:
+            config: Write-behind configuration
+        """
+        self.config = config or WriteBehindConfig()
+
+        self._kinds: Dict[str, _RecordKind] = {}
+        self._queue: Deque[Tuple[str, Any]] = deque()
+        self._sample_counters: Dict[str, int] = {}
+
+        self._flush_event: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._worker_task: Optional[asyncio.Task] = None
+        self._running = False
+
+        self.total_flushes = 0
+        self.failed_flushes = 0
+        self.last_flush_time: Optional[datetime] = None
+        self.last_flush_duration: float = 0.0
+
+    def register_handler(
+        self,
+        kind: str,
+        handler: Callable[[List[Any]], int],
+        sampleable: bool = False
+    ) -> None:
+        """
+        Register the bulk handler for a record kind.
+
+        Args:
+            kind: Record kind name (e.g. "execution", "metric")
+            handler: Synchronous function storing a list of records in one
+                transaction and returning the number of records written
+            sampleable: Whether records of this kind may be sampled or
+                evicted under back-pressure
+        """
+        self._kinds[kind] = _RecordKind(handler=handler, sampleable=sampleable)
+        self._sample_counters[kind] = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the background flush task is running."""
+        return self._running
+
+    @property
+    def pending(self) -> int:
+        """Number of records waiting to be flushed."""
+        return len(self._queue)
+
+    def submit(self, kind: str, record: Any) -> bool:
+        """
+        Queue a record for asynchronous persistence.
+
+        Args:
+            kind: Registered record kind
+            record: Record passed unchanged to the kind's handler
+
+        Returns:
+            True if the record was queued, False if it was sampled out or dropped
+        """
+        record_kind = self._kinds.get(kind)
+        if record_kind is None:
+            raise ValueError(f"No write-behind handler registered for '{kind}'")
+
+        record_kind.submitted += 1
+        queue_size = len(self._queue)
+
+        if record_kind.sampleable and queue_size >= self._high_watermark_size:
+            self._sample_counters[kind] += 1
+            if self._sample_counters[kind] % max(self.config.sample_rate, 1) != 0:
+                record_kind.sampled_out += 1
+                return False
+
+        if queue_size >= self.config.max_queue_size and not self._evict_sampleable():
+            record_kind.dropped += 1
+            logger.warning(
+                f"Monitoring write-behind queue full ({queue_size} records), "
+                f"dropping {kind} record"
+            )
+            return False
+
+        self._queue.append((kind, record))
+
+        if self._flush_event and len(self._queue) >= self.config.max_batch_size:
+            self._flush_event.set()
+
+        return True
+
+    @property
+    def _high_watermark_size(self) -> int:
+        return int(self.config.max_queue_size * self.config.high_watermark)
+
+    def _evict_sampleable(self) -> bool:
+        """Drop the oldest sampleable record to make room for a new one."""
+        for index, (kind, _) in enumerate(self._queue):
+            if self._kinds[kind].sampleable:
+                del self._queue[index]
+                self._kinds[kind].dropped += 1
+                return True
+        return False
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if self._running:
+            return
+
+        self._flush_event = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._running = True
+        self._worker_task = asyncio.create_task(self._flush_loop())
+
+        logger.info(
+            f"Monitoring write-behind queue started "
+            f"(batch={self.config.max_batch_size}, interval={self.config.flush_interval}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the background task and flush everything still queued."""
+        if not self._running:
+            await self.flush()
+            return
+
+        self._running = False
+        if self._flush_event:
+            self._flush_event.set()
+
+        if self._worker_task:
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+
+        await self.flush()
+        logger.info("Monitoring write-behind queue stopped")
+
+    async def _flush_loop(self) -> None:
+        """Flush on size threshold or time interval until stopped."""
+        while self._running:
+            try:
+                await asyncio.wait_for(
+                    self._flush_event.wait(),
+                    timeout=self.config.flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                break
+
+            self._flush_event.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing monitoring write-behind queue: {e}")
+
+    async def flush(self) -> int:
+        """
+        Flush all queued records immediately.
+
+        Returns:
+            Number of records written
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        written = 0
+        async with self._flush_lock:
+            while self._queue:
+                written += await self._flush_batch(self._take_batch())
+        return written
+
+    def flush_sync(self) -> int:
+        """
+        Flush all queued records from synchronous code.
+
+        Returns:
+            Number of records written
+        """
+        written = 0
+        while self._queue:
+            written += self._write_groups(self._group(self._take_batch()))
+        return written
+
+    def _take_batch(self) -> List[Tuple[str, Any]]:
+        batch_size = min(len(self._queue), self.config.max_batch_size)
+        return [self._queue.popleft() for _ in range(batch_size)]
+
+    @staticmethod
+    def _group(batch: List[Tuple[str, Any]]) -> Dict[str, List[Any]]:
+        groups: Dict[str, List[Any]] = {}
+        for kind, record in batch:
+            groups.setdefault(kind, []).append(record)
+        return groups
+
+    async def _flush_batch(self, batch: List[Tuple[str, Any]]) -> int:
+        """Write one batch, grouped by kind, with retry logic."""
+        groups = self._group(batch)
+        start = datetime.now()
+
+        for attempt in range(self.config.max_retries):
+            try:
+                if self.config.offload_to_thread:
+                    loop = asyncio.get_running_loop()
+                    written = await loop.run_in_executor(None, self._write_groups, groups)
+                else:
+                    written = self._write_groups(groups)
+
+                self.total_flushes += 1
+                self.last_flush_time = datetime.now()
+                self.last_flush_duration = (self.last_flush_time - start).total_seconds()
+
+                logger.debug(f"Flushed {written} monitoring records in {self.last_flush_duration:.3f}s")
+                return written
+
+            except Exception as e:
+                if attempt < self.config.max_retries - 1:
+                    delay = self.config.retry_delay * (2 ** attempt)
+                    logger.warning(
+                        f"Monitoring flush failed (attempt {attempt + 1}), retrying in {delay}s: {e}"
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    self.failed_flushes += 1
+                    for kind, records in groups.items():
+                        self._kinds[kind].dropped += len(records)
+                    logger.error(
+                        f"Monitoring flush failed after {self.config.max_retries} attempts, "
+                        f"dropping {len(batch)} records: {e}"
+                    )
+
+        return 0
+
+    def _write_groups(self, groups: Dict[str, List[Any]]) -> int:
+        written = 0
+        for kind, records in groups.items():
+            record_kind = self._kinds[kind]
+            count = record_kind.handler(records)
+            record_kind.written += count
+            written += count
+        return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get write-behind queue statistics."""
+        return {
+            "running": self._running,
+            "pending": len(self._queue),
+            "max_queue_size": self.config.max_queue_size,
+            "total_flushes": self.total_flushes,
+            "failed_flushes": self.failed_flushes,
+            "last_flush_time": self.last_flush_time.isoformat() if self.last_flush_time else None,
+            "last_flush_duration": self.last_flush_duration,
+            "kinds": {
+                kind: {
+                    "submitted": record_kind.submitted,
+                    "written": record_kind.written,
+                    "dropped": record_kind.dropped,
+                    "sampled_out": record_kind.sampled_out,
+                }
+                for kind, record_kind in self._kinds.items()
+            },
+        }
@@ -2,7 +2,15 @@
 QLib integration module for GeckoTerminal data export.
 """
 
-from .exporter import QLibExporter
-from .symbol_mapper import SymbolMapper, PoolLookupResult, SymbolMetadata
+from ..utils.lazy_imports import lazy_exports
 
-__all__ = ['QLibExporter', 'SymbolMapper', 'PoolLookupResult', 'SymbolMetadata']
\ No newline at end of file
+_LAZY_IMPORTS = {
+    'QLibExporter': '.exporter',
+    'SymbolMapper': '.symbol_mapper',
+    'PoolLookupResult': '.symbol_mapper',
+    'SymbolMetadata': '.symbol_mapper',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
+
+__all__ = ['QLibExporter', 'SymbolMapper', 'PoolLookupResult', 'SymbolMetadata']
@@ -8,7 +8,7 @@ QLib's predictive modeling framework.
 
 import pandas as pd
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict, Any, Union
+from typing import Iterable, List, Optional, Dict, Any, Union
 from pathlib import Path
 import logging
 from decimal import Decimal
@@ -174,30 +174,27 @@ class QLibExporter:
             
             # Collect data for all symbols
             all_data = []
+            pools = await self._resolve_pools(symbols)
+            pool_frames = await self._get_pool_ohlcv_frames(pools.values(), timeframe, start_dt, end_dt)
             
             for symbol in symbols:
                 try:
-                    pool = await self._get_pool_for_symbol(symbol)
+                    pool = pools.get(symbol)
                     if not pool:
                         logger.warning(f"Pool not found for symbol: {symbol}")
                         continue
                     
                     # Get OHLCV data for this pool
-                    ohlcv_records = await self.db_manager.get_ohlcv_data(
-                        pool_id=pool.id,
-                        timeframe=timeframe,
-                        start_time=start_dt,
-                        end_time=end_dt
-                    )
+                    pool_frame = pool_frames.get(pool.id)
                     
-                    if not ohlcv_records:
+                    if pool_frame is None or pool_frame.empty:
                         logger.debug(f"No OHLCV data found for symbol: {symbol}")
                         continue
                     
                     # Convert to DataFrame format - use canonical symbol from pool
                     canonical_symbol = self._generate_symbol_name(pool)
-                    symbol_data = self._convert_ohlcv_to_qlib_format(
-                        ohlcv_records, canonical_symbol, include_volume
+                    symbol_data = self._convert_ohlcv_frame_to_qlib_format(
+                        pool_frame, canonical_symbol, include_volume
                     )
                     
                     if not symbol_data.empty:
@@ -254,10 +251,12 @@ class QLibExporter:
                 symbols = await self.get_symbol_list()
             
             availability_report = {}
+            pools = await self._resolve_pools(symbols)
+            pool_frames = await self._get_pool_ohlcv_frames(pools.values(), timeframe)
             
             for symbol in symbols:
                 try:
-                    pool = await self._get_pool_for_symbol(symbol)
+                    pool = pools.get(symbol)
                     if not pool:
                         availability_report[symbol] = {
                             'available': False,
@@ -266,12 +265,9 @@ class QLibExporter:
                         continue
                     
                     # Get data range
-                    ohlcv_records = await self.db_manager.get_ohlcv_data(
-                        pool_id=pool.id,
-                        timeframe=timeframe
-                    )
+                    pool_frame = pool_frames.get(pool.id)
                     
-                    if not ohlcv_records:
+                    if pool_frame is None or pool_frame.empty:
                         availability_report[symbol] = {
                             'available': False,
                             'reason': 'No OHLCV data found'
@@ -279,10 +275,9 @@ class QLibExporter:
                         continue
                     
                     # Calculate availability metrics
-                    dates = [record.datetime for record in ohlcv_records]
-                    min_date = min(dates)
-                    max_date = max(dates)
-                    total_records = len(ohlcv_records)
+                    min_date = pool_frame['datetime'].min().to_pydatetime()
+                    max_date = pool_frame['datetime'].max().to_pydatetime()
+                    total_records = len(pool_frame)
                     
                     # Check data continuity
                     continuity_report = await self.db_manager.check_data_continuity(
@@ -413,19 +408,9 @@ class QLibExporter:
         # Fallback to original logic
         # Use the full pool ID as the symbol to ensure uniqueness and reversibility
         # Keep original case to maintain exact mapping
-        symbol = pool.id
-        
-        # Ensure valid symbol format (alphanumeric + underscore)
-        symbol = ''.join(c if c.isalnum() or c == '_' else '_' for c in symbol)
+        from gecko_terminal_collector.utils.pool_id_utils import PoolIDUtils
         
-        # Remove duplicate underscores
-        while '__' in symbol:
-            symbol = symbol.replace('__', '_')
-        
-        # Remove leading/trailing underscores
-        symbol = symbol.strip('_')
-        
-        return symbol
+        return PoolIDUtils.to_symbol(pool.id)
     
     def _convert_ohlcv_to_qlib_format(self,
                                      ohlcv_records: List[OHLCVRecord],
@@ -473,6 +458,96 @@ class QLibExporter:
         
         return df
     
+    def _convert_ohlcv_frame_to_qlib_format(self,
+                                           ohlcv_frame: pd.DataFrame,
+                                           symbol: str,
+                                           include_volume: bool = True) -> pd.DataFrame:
+        """
+        Convert an OHLCV frame of one pool to QLib-compatible DataFrame format.
+        
+        Args:
+            ohlcv_frame: OHLCV frame (see database.frames.OHLCV_FRAME_COLUMNS)
+            symbol: Symbol identifier
+            include_volume: Whether to include volume column
+            
+        Returns:
+            QLib-formatted DataFrame
+        """
+        if ohlcv_frame.empty:
+            return pd.DataFrame()
+        
+        columns = {
+            'datetime': 'datetime',
+            'open_price': 'open',
+            'high_price': 'high',
+            'low_price': 'low',
+            'close_price': 'close'
+        }
+        if include_volume:
+            columns['volume_usd'] = 'volume'
+        
+        df = ohlcv_frame[list(columns)].rename(columns=columns)
+        df.insert(1, 'symbol', symbol)
+        
+        # Sort by datetime
+        df = df.sort_values('datetime', kind='stable').reset_index(drop=True)
+        
+        return df
+    
+    async def _get_pool_ohlcv_frames(self,
+                                     pools: Iterable[Optional[Pool]],
+                                     timeframe: str,
+                                     start_dt: Optional[datetime] = None,
+                                     end_dt: Optional[datetime] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Read OHLCV data of many pools with one columnar query.
+        
+        Args:
+            pools: Pools to read (None entries are skipped)
+            timeframe: Data timeframe
+            start_dt: Optional start of the time range
+            end_dt: Optional end of the time range
+            
+        Returns:
+            Dictionary mapping pool IDs to their OHLCV frames
+        """
+        pool_ids = list(dict.fromkeys(pool.id for pool in pools if pool))
+        if not pool_ids:
+            return {}
+        
+        frame = await self.db_manager.get_ohlcv_frame(
+            pool_ids,
+            timeframe,
+            start_time=start_dt,
+            end_time=end_dt
+        )
+        return {pool_id: pool_frame for pool_id, pool_frame in frame.groupby('pool_id', sort=False)}
+    
+    async def _resolve_pools(self, symbols: List[str]) -> Dict[str, Optional[Pool]]:
+        """
+        Get pool objects for many symbols at once.
+        
+        Uses the integrated symbol mapper's bulk resolution when available,
+        otherwise looks each symbol up individually.
+        
+        Args:
+            symbols: Symbol identifiers
+            
+        Returns:
+            Dictionary mapping each symbol to its Pool, or None if not found
+        """
+        if self.symbol_mapper:
+            return await self.symbol_mapper.resolve_symbols(symbols)
+        
+        pools = {}
+        for symbol in symbols:
+            try:
+                pools[symbol] = await self._get_pool_for_symbol(symbol)
+            except Exception as e:
+                logger.error(f"Error looking up pool for symbol {symbol}: {e}")
+                pools[symbol] = None
+        return pools
+    
     async def _get_pool_for_symbol(self, symbol: str) -> Optional[Pool]:
         """
         Get pool object for a given symbol.
@@ -680,36 +755,32 @@ class QLibExporter:
         
         # Collect data with limits
         all_data = []
+        pools = await self._resolve_pools(symbols)
+        pool_frames = await self._get_pool_ohlcv_frames(pools.values(), timeframe, start_dt, end_dt)
         
         for symbol in symbols:
             try:
-                pool = await self._get_pool_for_symbol(symbol)
+                pool = pools.get(symbol)
                 if not pool:
                     logger.warning(f"Pool not found for symbol: {symbol}")
                     continue
                 
                 # Get OHLCV data for this pool with date range
-                ohlcv_records = await self.db_manager.get_ohlcv_data(
-                    pool_id=pool.id,
-                    timeframe=timeframe,
-                    start_time=start_dt,
-                    end_time=end_dt
-                )
+                pool_frame = pool_frames.get(pool.id)
                 
-                if not ohlcv_records:
+                if pool_frame is None or pool_frame.empty:
                     logger.debug(f"No OHLCV data found for symbol: {symbol}")
                     continue
                 
                 # Apply record limit if specified
-                if max_records_per_symbol and len(ohlcv_records) > max_records_per_symbol:
+                if max_records_per_symbol and len(pool_frame) > max_records_per_symbol:
                     # Take the most recent records
-                    ohlcv_records = sorted(ohlcv_records, key=lambda x: x.datetime, reverse=True)
-                    ohlcv_records = ohlcv_records[:max_records_per_symbol]
+                    pool_frame = pool_frame.sort_values('datetime').iloc[-max_records_per_symbol:]
                     logger.info(f"Limited {symbol} to {max_records_per_symbol} most recent records")
                 
                 # Convert to DataFrame format
-                symbol_data = self._convert_ohlcv_to_qlib_format(
-                    ohlcv_records, symbol, include_volume=True
+                symbol_data = self._convert_ohlcv_frame_to_qlib_format(
+                    pool_frame, symbol, include_volume=True
                 )
                 
                 if not symbol_data.empty:
@@ -7,7 +7,11 @@ fallback and caching capabilities.
 """
 
 import logging
-from typing import Optional, Dict, Any, List
+import sys
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Optional, Dict, Any, Iterable, List
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
@@ -27,6 +31,101 @@ class IntegratedSymbolMetadata(SymbolMetadata):
     last_database_lookup: Optional[datetime] = None
 
 
+def _normalized_symbol_key(pool_id: str) -> str:
+    from gecko_terminal_collector.utils.pool_id_utils import PoolIDUtils
+    
+    return PoolIDUtils.to_normalized_symbol(pool_id)
+
+
+class CompactSymbolIndex:
+    """
+    Memory-compact symbol index backed by a single sorted list of pool IDs.
+    
+    Symbols are derived from pool IDs, so only the interned IDs are stored,
+    ordered by their normalized symbol. Lookups binary-search on the
+    normalized symbol, which is recomputed for the O(log n) probed entries
+    (bisect only accepts a key function from Python 3.10 on).
+    """
+    
+    def __init__(self):
+        self._pool_ids: List[str] = []
+        self._string_bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._pool_ids)
+    
+    def build(self, pool_ids: Iterable[str]) -> int:
+        """
+        Replace the index contents with the given pool IDs.
+        
+        Args:
+            pool_ids: Pool IDs to index
+            
+        Returns:
+            Number of indexed pool IDs
+        """
+        self._pool_ids = sorted((sys.intern(pool_id) for pool_id in pool_ids if pool_id), key=_normalized_symbol_key)
+        self._string_bytes = sum(sys.getsizeof(pool_id) for pool_id in self._pool_ids)
+        return len(self._pool_ids)
+    
+    def add(self, pool_id: str) -> None:
+        """Insert a pool ID, keeping the list sorted."""
+        if pool_id in self._candidates(_normalized_symbol_key(pool_id)):
+            return
+        pool_id = sys.intern(pool_id)
+        self._pool_ids.insert(self._bisect(_normalized_symbol_key(pool_id), right=True), pool_id)
+        self._string_bytes += sys.getsizeof(pool_id)
+    
+    def lookup(self, symbol: str) -> Optional[str]:
+        """
+        Find the pool ID for a symbol or raw pool ID, case-insensitively.
+        
+        An exact-case match wins when several pools share a normalized symbol.
+        
+        Args:
+            symbol: Symbol or pool ID to look up
+            
+        Returns:
+            Pool ID if indexed, None otherwise
+        """
+        from gecko_terminal_collector.utils.pool_id_utils import PoolIDUtils
+        
+        candidates = self._candidates(_normalized_symbol_key(symbol))
+        for pool_id in candidates:
+            if pool_id == symbol or PoolIDUtils.to_symbol(pool_id) == symbol:
+                return pool_id
+        return candidates[0] if candidates else None
+    
+    def clear(self) -> None:
+        """Remove all indexed pool IDs."""
+        self._pool_ids = []
+        self._string_bytes = 0
+    
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the index (list plus ID strings)."""
+        return sys.getsizeof(self._pool_ids) + self._string_bytes
+    
+    def _bisect(self, normalized: str, right: bool = False) -> int:
+        """Insertion point of a normalized symbol, like bisect_left/bisect_right."""
+        low, high = 0, len(self._pool_ids)
+        while low < high:
+            middle = (low + high) // 2
+            key = _normalized_symbol_key(self._pool_ids[middle])
+            if key < normalized or (right and key == normalized):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    def _candidates(self, normalized: str) -> List[str]:
+        index = self._bisect(normalized)
+        candidates = []
+        while index < len(self._pool_ids) and _normalized_symbol_key(self._pool_ids[index]) == normalized:
+            candidates.append(self._pool_ids[index])
+            index += 1
+        return candidates
+
+
 class IntegratedSymbolMapper(SymbolMapper):
     """
     Enhanced symbol mapper that integrates with EnhancedDatabaseManager.
@@ -36,14 +135,27 @@ class IntegratedSymbolMapper(SymbolMapper):
     - Integration with enhanced database manager
     - Performance tracking and metrics
     - Bulk symbol population from database
+    - Negative caching of symbols the database could not resolve
+    - Optional compact mode for very large pool sets: only pool IDs are
+      kept in a CompactSymbolIndex and Pool rows are loaded on demand into
+      a bounded LRU, without per-symbol metadata
     """
     
-    def __init__(self, db_manager: EnhancedDatabaseManager):
+    def __init__(self, 
+                 db_manager: EnhancedDatabaseManager,
+                 negative_cache_ttl: float = 300.0,
+                 max_negative_cache_size: int = 10000,
+                 compact_cache: bool = False,
+                 pool_cache_size: int = 1024):
         """
         Initialize the integrated symbol mapper.
         
         Args:
             db_manager: Enhanced database manager instance
+            negative_cache_ttl: Seconds a failed lookup is remembered before retrying the database
+            max_negative_cache_size: Maximum number of remembered failed lookups
+            compact_cache: Keep only a compact symbol index and load pools lazily
+            pool_cache_size: Maximum number of Pool objects kept in compact mode
         """
         super().__init__(db_manager)
         self.enhanced_db_manager = db_manager
@@ -51,10 +163,22 @@ class IntegratedSymbolMapper(SymbolMapper):
         # Extended metadata tracking
         self._integrated_metadata: Dict[str, IntegratedSymbolMetadata] = {}
         
+        # Symbols not found in the database, mapped to monotonic expiry time
+        self.negative_cache_ttl = negative_cache_ttl
+        self.max_negative_cache_size = max_negative_cache_size
+        self._negative_cache: Dict[str, float] = {}
+        
+        # Compact mode: symbol index plus a bounded LRU of pool ID -> Pool
+        self._compact_index: Optional[CompactSymbolIndex] = CompactSymbolIndex() if compact_cache else None
+        self.pool_cache_size = pool_cache_size
+        self._pool_lru: "OrderedDict[str, Pool]" = OrderedDict()
+        self._lazy_pool_loads = 0
+        
         # Performance metrics
         self._cache_hits = 0
         self._cache_misses = 0
         self._database_lookups = 0
+        self._negative_cache_hits = 0
         
         logger.info("IntegratedSymbolMapper initialized with enhanced database manager")
     
@@ -71,6 +195,9 @@ class IntegratedSymbolMapper(SymbolMapper):
         try:
             logger.info("Populating symbol cache from database...")
             
+            if self._compact_index is not None:
+                return await self._populate_compact_index(limit)
+            
             # Get all pools from database
             pools = await self.enhanced_db_manager.get_all_pools(limit=limit)
             
@@ -94,6 +221,43 @@ class IntegratedSymbolMapper(SymbolMapper):
             logger.error(f"Error populating cache from database: {e}")
             return 0
     
+    async def _populate_compact_index(self, limit: Optional[int] = None) -> int:
+        """Stream pool IDs from the database into the compact symbol index."""
+        pool_ids: List[str] = []
+        async for batch in self.enhanced_db_manager.iter_pool_ids(limit=limit):
+            pool_ids.extend(batch)
+        
+        symbols_loaded = self._compact_index.build(pool_ids)
+        logger.info(f"Loaded {symbols_loaded} symbols into compact cache "
+                    f"({self._compact_index.memory_bytes() / max(symbols_loaded, 1):.0f} bytes/entry)")
+        return symbols_loaded
+    
+    async def _compact_lookup(self, symbol: str) -> Optional[Pool]:
+        """Resolve a symbol through the compact index, loading the pool if needed."""
+        pool_id = self._compact_index.lookup(symbol)
+        if pool_id is None:
+            return None
+        
+        pool = self._get_lru_pool(pool_id)
+        if pool is None:
+            pool = await self.enhanced_db_manager.get_pool(pool_id)
+            self._lazy_pool_loads += 1
+            if pool:
+                self._put_lru_pool(pool)
+        return pool
+    
+    def _get_lru_pool(self, pool_id: str) -> Optional[Pool]:
+        pool = self._pool_lru.get(pool_id)
+        if pool is not None:
+            self._pool_lru.move_to_end(pool_id)
+        return pool
+    
+    def _put_lru_pool(self, pool: Pool) -> None:
+        self._pool_lru[pool.id] = pool
+        self._pool_lru.move_to_end(pool.id)
+        while len(self._pool_lru) > self.pool_cache_size:
+            self._pool_lru.popitem(last=False)
+    
     async def lookup_pool_with_fallback(self, symbol: str) -> Optional[Pool]:
         """
         Enhanced lookup with database fallback and caching.
@@ -128,6 +292,18 @@ class IntegratedSymbolMapper(SymbolMapper):
                 logger.debug(f"Case-insensitive cache hit for symbol '{symbol}' -> '{original_symbol}'")
                 return pool
         
+        if self._compact_index is not None:
+            pool = await self._compact_lookup(symbol)
+            if pool:
+                self._cache_hits += 1
+                logger.debug(f"Compact cache hit for symbol '{symbol}' -> pool {pool.id}")
+                return pool
+        
+        # Skip the database for symbols that recently failed to resolve
+        if self._is_negative_cached(symbol):
+            logger.debug(f"Negative cache hit for symbol '{symbol}'")
+            return None
+        
         # Database fallback
         self._cache_misses += 1
         pool = await self._enhanced_database_lookup(symbol)
@@ -143,6 +319,7 @@ class IntegratedSymbolMapper(SymbolMapper):
             logger.debug(f"Database lookup successful for symbol '{symbol}' -> pool {pool.id}")
             return pool
         
+        self._add_to_negative_cache(symbol)
         logger.debug(f"No match found for symbol '{symbol}'")
         return None
     
@@ -188,6 +365,26 @@ class IntegratedSymbolMapper(SymbolMapper):
                     confidence=0.9
                 )
         
+        if self._compact_index is not None:
+            pool = await self._compact_lookup(symbol)
+            if pool:
+                self._cache_hits += 1
+                matched_symbol = self.generate_symbol(pool)
+                return PoolLookupResult(
+                    pool=pool,
+                    matched_symbol=matched_symbol,
+                    lookup_method="compact_cache",
+                    confidence=1.0 if matched_symbol == symbol else 0.9
+                )
+        
+        if self._is_negative_cached(symbol):
+            return PoolLookupResult(
+                pool=None,
+                matched_symbol=symbol,
+                lookup_method="negative_cache",
+                confidence=0.0
+            )
+        
         # Try database lookup
         self._cache_misses += 1
         pool = await self._enhanced_database_lookup(symbol)
@@ -199,6 +396,7 @@ class IntegratedSymbolMapper(SymbolMapper):
                 confidence=0.8
             )
         
+        self._add_to_negative_cache(symbol)
         return PoolLookupResult(
             pool=None,
             matched_symbol=symbol,
@@ -206,6 +404,123 @@ class IntegratedSymbolMapper(SymbolMapper):
             confidence=0.0
         )
     
+    async def resolve_symbols(self, symbols: List[str]) -> Dict[str, Optional[Pool]]:
+        """
+        Resolve many symbols with a single bulk database query.
+        
+        Cached and negatively cached symbols are answered without touching
+        the database. The rest are matched in one query against the indexed
+        symbol_normalized and address columns, preferring an exact-case
+        symbol match; symbols the bulk query misses go through the regular
+        per-symbol fallback, which negatively caches them.
+        
+        Args:
+            symbols: Symbols to resolve
+            
+        Returns:
+            Dictionary mapping each symbol to its Pool, or None if not found
+        """
+        from gecko_terminal_collector.utils.pool_id_utils import PoolIDUtils
+        
+        resolved: Dict[str, Optional[Pool]] = {}
+        pending = []
+        
+        for symbol in dict.fromkeys(symbols):
+            if not symbol:
+                continue
+            
+            pool = self._get_cached_pool(symbol)
+            if pool:
+                self._cache_hits += 1
+                resolved[symbol] = pool
+            elif self._is_negative_cached(symbol):
+                resolved[symbol] = None
+            else:
+                pending.append(symbol)
+        
+        if pending:
+            self._database_lookups += 1
+            try:
+                pools = list(await self.enhanced_db_manager.get_pools_by_symbols(pending))
+            except Exception as e:
+                logger.error(f"Bulk symbol lookup failed for {len(pending)} symbols: {e}")
+                pools = []
+            
+            by_normalized_symbol: Dict[str, Pool] = {}
+            by_address: Dict[str, Pool] = {}
+            for pool in pools:
+                generated_symbol = super().generate_symbol(pool)
+                self._add_to_cache(generated_symbol, pool, database_cached=True)
+                by_normalized_symbol.setdefault(self.normalize_symbol(generated_symbol), pool)
+                by_address[pool.address] = pool
+            
+            for symbol in pending:
+                pool = (
+                    self._get_cached_pool(symbol)
+                    or by_normalized_symbol.get(PoolIDUtils.to_normalized_symbol(symbol))
+                    or by_address.get(symbol)
+                )
+                if pool:
+                    self._cache_misses += 1
+                    resolved[symbol] = pool
+                else:
+                    resolved[symbol] = await self.lookup_pool_with_fallback(symbol)
+        
+        found = sum(1 for pool in resolved.values() if pool)
+        logger.debug(f"Resolved {found}/{len(resolved)} symbols ({len(pending)} needed the database)")
+        return resolved
+    
+    def _get_cached_pool(self, symbol: str) -> Optional[Pool]:
+        """Look a symbol up in the exact and case-insensitive caches only."""
+        if symbol in self._symbol_to_pool_cache:
+            return self._symbol_to_pool_cache[symbol]
+        
+        from gecko_terminal_collector.utils.pool_id_utils import PoolIDUtils
+        
+        # Also accept raw pool IDs, which normalize to the symbol they generate
+        original_symbol = (
+            self._normalized_to_symbol_cache.get(self.normalize_symbol(symbol))
+            or self._normalized_to_symbol_cache.get(PoolIDUtils.to_normalized_symbol(symbol))
+        )
+        if original_symbol:
+            return self._symbol_to_pool_cache.get(original_symbol)
+        
+        if self._compact_index is not None:
+            pool_id = self._compact_index.lookup(symbol)
+            if pool_id is not None:
+                return self._get_lru_pool(pool_id)
+        return None
+    
+    def _is_negative_cached(self, symbol: str) -> bool:
+        """Check whether a symbol recently failed to resolve, expiring stale entries."""
+        expires_at = self._negative_cache.get(symbol)
+        if expires_at is None:
+            return False
+        
+        if expires_at <= time.monotonic():
+            del self._negative_cache[symbol]
+            return False
+        
+        self._negative_cache_hits += 1
+        return True
+    
+    def _add_to_negative_cache(self, symbol: str) -> None:
+        """Remember that a symbol could not be resolved."""
+        if self.negative_cache_ttl <= 0 or self.max_negative_cache_size <= 0:
+            return
+        
+        now = time.monotonic()
+        if len(self._negative_cache) >= self.max_negative_cache_size:
+            self._negative_cache = {
+                cached: expires_at for cached, expires_at in self._negative_cache.items() if expires_at > now
+            }
+            while len(self._negative_cache) >= self.max_negative_cache_size:
+                # Entries are inserted in expiry order, so the first one is the oldest
+                del self._negative_cache[next(iter(self._negative_cache))]
+        
+        self._negative_cache.pop(symbol, None)
+        self._negative_cache[symbol] = now + self.negative_cache_ttl
+    
     async def _enhanced_database_lookup(self, symbol: str) -> Optional[Pool]:
         """
         Enhanced database lookup with multiple strategies.
@@ -259,8 +574,16 @@ class IntegratedSymbolMapper(SymbolMapper):
             pool: Pool object to associate
             database_cached: Whether this symbol was loaded from database
         """
+        if self._compact_index is not None:
+            # Compact mode keeps no per-symbol objects; the pool stays reachable through the LRU
+            self._compact_index.add(pool.id)
+            self._put_lru_pool(pool)
+            self._negative_cache.pop(symbol, None)
+            return
+        
         # Call parent method
         super()._add_to_cache(symbol, pool)
+        self._negative_cache.pop(symbol, None)
         
         # Add integrated metadata
         self._integrated_metadata[symbol] = IntegratedSymbolMetadata(
@@ -386,11 +709,20 @@ class IntegratedSymbolMapper(SymbolMapper):
         """
         total_lookups = self._cache_hits + self._cache_misses
         cache_hit_rate = (self._cache_hits / total_lookups) if total_lookups > 0 else 0.0
+        memory = self._estimate_cache_memory()
         
         return {
+            'cache_mode': 'compact' if self._compact_index is not None else 'full',
+            'memory_bytes': memory['total_bytes'],
+            'memory_bytes_per_entry': memory['bytes_per_entry'],
+            'compact_index_entries': len(self._compact_index) if self._compact_index is not None else 0,
+            'pool_cache_entries': len(self._pool_lru),
+            'lazy_pool_loads': self._lazy_pool_loads,
             'cache_hits': self._cache_hits,
             'cache_misses': self._cache_misses,
             'database_lookups': self._database_lookups,
+            'negative_cache_hits': self._negative_cache_hits,
+            'negative_cached_symbols': len(self._negative_cache),
             'cache_hit_rate': cache_hit_rate,
             'total_cached_symbols': len(self._symbol_to_pool_cache),
             'database_cached_symbols': sum(
@@ -400,6 +732,59 @@ class IntegratedSymbolMapper(SymbolMapper):
             'most_accessed_symbols': self._get_most_accessed_symbols(5)
         }
     
+    def _estimate_cache_memory(self, sample_size: int = 256) -> Dict[str, float]:
+        """
+        Estimate memory held by the symbol caches.
+        
+        The compact index is measured exactly; cached Pool objects and
+        full-mode entries are extrapolated from a sample.
+        
+        Args:
+            sample_size: Maximum number of cached entries to measure
+            
+        Returns:
+            Dictionary with total_bytes and bytes_per_entry
+        """
+        def object_bytes(obj) -> int:
+            if obj is None:
+                return 0
+            size = sys.getsizeof(obj)
+            attributes = getattr(obj, '__dict__', None)
+            if attributes is not None:
+                size += sys.getsizeof(attributes) + sum(sys.getsizeof(value) for value in attributes.values())
+            return size
+        
+        def sampled_bytes(items, count: int, entry_bytes) -> float:
+            if not count:
+                return 0.0
+            sample = [entry_bytes(item) for item in islice(items, sample_size)]
+            return sum(sample) / len(sample) * count
+        
+        if self._compact_index is not None:
+            entries = len(self._compact_index)
+            total = self._compact_index.memory_bytes() + sys.getsizeof(self._pool_lru) + sampled_bytes(
+                iter(self._pool_lru.values()), len(self._pool_lru), object_bytes
+            )
+        else:
+            entries = len(self._symbol_to_pool_cache)
+            total = (
+                sys.getsizeof(self._symbol_to_pool_cache)
+                + sys.getsizeof(self._normalized_to_symbol_cache)
+                + sys.getsizeof(self._symbol_metadata)
+                + sys.getsizeof(self._integrated_metadata)
+                + sampled_bytes(iter(self._symbol_to_pool_cache.items()), entries, lambda item: (
+                    sys.getsizeof(item[0]) * 2
+                    + object_bytes(item[1])
+                    + object_bytes(self._symbol_metadata.get(item[0]))
+                    + object_bytes(self._integrated_metadata.get(item[0]))
+                ))
+            )
+        
+        return {
+            'total_bytes': int(total),
+            'bytes_per_entry': total / entries if entries else 0.0
+        }
+    
     def _get_most_accessed_symbols(self, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Get the most frequently accessed symbols.
@@ -441,11 +826,17 @@ class IntegratedSymbolMapper(SymbolMapper):
         """Clear all cached symbol mappings including integrated metadata."""
         super().clear_cache()
         self._integrated_metadata.clear()
+        self._negative_cache.clear()
+        self._pool_lru.clear()
+        if self._compact_index is not None:
+            self._compact_index.clear()
         
         # Reset performance counters
         self._cache_hits = 0
         self._cache_misses = 0
         self._database_lookups = 0
+        self._negative_cache_hits = 0
+        self._lazy_pool_loads = 0
         
         logger.info("Integrated symbol mapper cache cleared")
     
@@ -93,20 +93,13 @@ class SymbolMapper:
         if not pool or not pool.id:
             raise ValueError("Pool and pool.id are required")
         
+        from gecko_terminal_collector.utils.pool_id_utils import PoolIDUtils
+        
         # Use the full pool ID as the symbol to ensure uniqueness and reversibility
         # Keep original case to maintain exact mapping (Requirement 1.1)
-        symbol = pool.id
-        
-        # Ensure valid symbol format (alphanumeric + underscore)
-        # Replace invalid characters with underscores
-        symbol = ''.join(c if c.isalnum() or c == '_' else '_' for c in symbol)
-        
-        # Remove duplicate underscores
-        while '__' in symbol:
-            symbol = symbol.replace('__', '_')
-        
-        # Remove leading/trailing underscores
-        symbol = symbol.strip('_')
+        # Invalid characters are replaced with underscores (alphanumeric + underscore);
+        # the same rules populate the indexed pools.symbol_normalized column
+        symbol = PoolIDUtils.to_symbol(pool.id)
         
         # Cache the symbol mapping
         self._add_to_cache(symbol, pool)
@@ -2,10 +2,22 @@
 Scheduling and orchestration system for data collection.
 """
 
-from .scheduler import CollectionScheduler, SchedulerConfig, ScheduledCollector
+from ..utils.lazy_imports import lazy_exports
+
+_LAZY_IMPORTS = {
+    "CollectionScheduler": ".scheduler",
+    "SchedulerConfig": ".scheduler",
+    "ScheduledCollector": ".scheduler",
+    "WorkLeaseManager": ".leases",
+    "pool_shard": ".leases",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "CollectionScheduler",
     "SchedulerConfig", 
-    "ScheduledCollector"
-]
\ No newline at end of file
+    "ScheduledCollector",
+    "WorkLeaseManager",
+    "pool_shard"
+]
@@ -0,0 +1,312 @@
+"""
+Database-backed work leases for sharded multi-node collection.
+
+Several collector processes can share one database and one API key. Each
+scheduled collector is split into work units: one per pool shard for
+collectors that support pool sharding, a single unit otherwise. Nodes claim
+units through lease rows that expire unless renewed by heartbeats, so every
+unit is worked on by one live node and the units of a node that dies are
+picked up by the others once its leases expire.
+
+Every node aims for an equal share of the units (the unit count divided by
+the number of live nodes, rounded up): it claims free or expired units up to
+that share and releases units above it, so work rebalances as nodes join and
+leave. Claims lock their candidate rows with SELECT ... FOR UPDATE SKIP
+LOCKED on PostgreSQL and run in BEGIN IMMEDIATE transactions on SQLite.
+
+Lease expiry compares node clocks, so lease_ttl must be well above the
+clock skew between nodes.
+"""
+
+import logging
+import math
+import os
+import socket
+import uuid
+import zlib
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, delete, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from gecko_terminal_collector.database.models import CollectorNode, WorkLease
+
+logger = logging.getLogger(__name__)
+
+
+LEASE_MODELS = (WorkLease, CollectorNode)
+# Node rows without a heartbeat for this many lease TTLs are removed
+STALE_NODE_TTLS = 10
+
+
+def _utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+def pool_shard(pool_id: str, shard_count: int) -> int:
+    """Shard index of a pool; stable across nodes and processes."""
+    if shard_count <= 1:
+        return 0
+    return zlib.crc32(pool_id.encode('utf-8')) % shard_count
+
+
+def work_unit_id(collector_key: str, shard: int) -> str:
+    """Lease row key of a work unit."""
+    return f"{collector_key}:{shard}"
+
+
+class WorkLeaseManager:
+    """
+    Claim, renew and release work unit leases for one collection node.
+
+    Lease state is only changed by rebalance(), which the scheduler calls
+    every heartbeat interval; between heartbeats owned_shards() answers from
+    the last known state and stops reporting units whose lease ran out.
+    """
+
+    def __init__(self, db_manager, node_id: Optional[str] = None, lease_ttl: int = 60):
+        """
+        Initialize the lease manager.
+
+        Args:
+            db_manager: Database manager whose connection holds the lease tables
+            node_id: Unique name of this node (defaults to host, pid and a random suffix)
+            lease_ttl: Seconds a lease stays valid without a heartbeat
+        """
+        self.db_manager = db_manager
+        self.node_id = node_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.lease_ttl = timedelta(seconds=lease_ttl)
+
+        self.live_nodes = 1
+        self._units: Dict[str, Tuple[str, int]] = {}  # unit_id -> (collector_key, shard)
+        self._owned: Set[str] = set()
+        self._owned_until: Optional[datetime] = None
+        self._tables_ready = False
+
+    @property
+    def _is_sqlite(self) -> bool:
+        return self.db_manager.connection.engine.dialect.name == 'sqlite'
+
+    def register_units(self, collector_key: str, shard_count: int = 1) -> List[str]:
+        """
+        Register the work units of a collector.
+
+        Args:
+            collector_key: Collection key of the collector
+            shard_count: Number of pool shards the collector is split into
+
+        Returns:
+            Work unit IDs of the collector
+        """
+        self.unregister_collector(collector_key)
+        unit_ids = []
+        for shard in range(max(1, shard_count)):
+            unit_id = work_unit_id(collector_key, shard)
+            self._units[unit_id] = (collector_key, shard)
+            unit_ids.append(unit_id)
+        return unit_ids
+
+    def unregister_collector(self, collector_key: str) -> None:
+        """Forget the work units of a collector; held leases expire on their own."""
+        for unit_id in [u for u, (key, _) in self._units.items() if key == collector_key]:
+            del self._units[unit_id]
+            self._owned.discard(unit_id)
+
+    def owned_shards(self, collector_key: str) -> List[int]:
+        """Shards of a collector leased to this node, empty once the leases ran out."""
+        if self._owned_until is None or _utcnow() >= self._owned_until:
+            return []
+        return sorted(
+            shard for unit_id, (key, shard) in self._units.items()
+            if key == collector_key and unit_id in self._owned
+        )
+
+    def ensure_tables(self) -> None:
+        """Create the lease tables if they do not exist yet."""
+        if self._tables_ready:
+            return
+        for model in LEASE_MODELS:
+            model.__table__.create(bind=self.db_manager.connection.engine, checkfirst=True)
+        self._tables_ready = True
+
+    async def rebalance(self) -> Dict[str, int]:
+        """
+        Heartbeat this node, renew its leases and move toward a fair share.
+
+        Returns:
+            Counts of owned, claimed and released units and of live nodes
+        """
+        self.ensure_tables()
+        now = _utcnow()
+        expires_at = now + self.lease_ttl
+        unit_ids = sorted(self._units)
+
+        with self._transaction() as session:
+            self._heartbeat_node(session, now)
+            self.live_nodes = max(1, session.scalar(
+                select(func.count()).select_from(CollectorNode).where(
+                    CollectorNode.heartbeat_at > now - self.lease_ttl
+                )
+            ))
+
+            if unit_ids:
+                self._create_missing_units(session, unit_ids)
+
+                # Renew leases still held; units taken over after an expiry are lost
+                session.execute(
+                    update(WorkLease)
+                    .where(WorkLease.owner == self.node_id, WorkLease.unit_id.in_(unit_ids))
+                    .values(expires_at=expires_at, heartbeat_at=now)
+                )
+            owned = set(session.scalars(
+                select(WorkLease.unit_id).where(
+                    WorkLease.owner == self.node_id, WorkLease.unit_id.in_(unit_ids)
+                )
+            )) if unit_ids else set()
+
+            target = math.ceil(len(unit_ids) / self.live_nodes)
+            claimed, released = [], []
+            if len(owned) > target:
+                released = sorted(owned, key=self._unit_order)[target:]
+                self._release(session, released)
+                owned.difference_update(released)
+            elif len(owned) < target:
+                claimed = self._claim(session, unit_ids, target - len(owned), now, expires_at)
+                owned.update(claimed)
+
+        self._owned = owned
+        self._owned_until = expires_at
+
+        if claimed or released:
+            logger.info(
+                f"Node {self.node_id} claimed {len(claimed)} and released {len(released)} work units; "
+                f"holding {len(owned)}/{len(unit_ids)} with {self.live_nodes} live nodes"
+            )
+        return {
+            "owned": len(owned),
+            "claimed": len(claimed),
+            "released": len(released),
+            "live_nodes": self.live_nodes
+        }
+
+    async def release_all(self) -> int:
+        """
+        Release every lease of this node and leave the node registry.
+
+        Returns:
+            Number of released leases
+        """
+        self.ensure_tables()
+        with self._transaction() as session:
+            released = session.execute(
+                update(WorkLease)
+                .where(WorkLease.owner == self.node_id)
+                .values(owner=None, expires_at=None)
+            ).rowcount
+            session.execute(delete(CollectorNode).where(CollectorNode.node_id == self.node_id))
+
+        self._owned = set()
+        self._owned_until = None
+        logger.info(f"Node {self.node_id} released {released} work leases")
+        return released
+
+    def get_status(self) -> Dict[str, Any]:
+        """Lease status of this node."""
+        return {
+            "node_id": self.node_id,
+            "live_nodes": self.live_nodes,
+            "total_units": len(self._units),
+            "owned_units": sorted(self._owned),
+            "leases_valid_until": self._owned_until
+        }
+
+    @contextmanager
+    def _transaction(self):
+        """Session whose claims are serialized against other nodes."""
+        with self.db_manager.connection.get_session() as session:
+            try:
+                if self._is_sqlite:
+                    # Take the write lock up front so claims of other nodes wait
+                    session.execute(text("BEGIN IMMEDIATE"))
+                yield session
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error updating work leases for node {self.node_id}: {e}")
+                raise
+
+    def _heartbeat_node(self, session: Session, now: datetime) -> None:
+        """Record this node's heartbeat and drop long-dead nodes."""
+        node = session.get(CollectorNode, self.node_id)
+        if node is None:
+            session.add(CollectorNode(node_id=self.node_id, started_at=now, heartbeat_at=now))
+        else:
+            node.heartbeat_at = now
+        session.execute(delete(CollectorNode).where(
+            CollectorNode.heartbeat_at < now - self.lease_ttl * STALE_NODE_TTLS
+        ))
+        session.flush()
+
+    def _create_missing_units(self, session: Session, unit_ids: List[str]) -> None:
+        """
+        Insert free lease rows for units no node has registered before.
+
+        Nodes starting together can both see a unit as missing, so rows
+        another node inserted in the meantime are skipped with ON CONFLICT
+        DO NOTHING instead of failing the whole rebalance.
+        """
+        existing = set(session.scalars(select(WorkLease.unit_id).where(WorkLease.unit_id.in_(unit_ids))))
+        missing = [unit_id for unit_id in unit_ids if unit_id not in existing]
+        if missing:
+            dialect_insert = sqlite_insert if self._is_sqlite else postgresql_insert
+            session.execute(
+                dialect_insert(WorkLease)
+                .values([
+                    {'unit_id': unit_id, 'collector_key': self._units[unit_id][0], 'shard': self._units[unit_id][1]}
+                    for unit_id in missing
+                ])
+                .on_conflict_do_nothing(index_elements=['unit_id'])
+            )
+
+    def _claim(
+        self,
+        session: Session,
+        unit_ids: List[str],
+        limit: int,
+        now: datetime,
+        expires_at: datetime
+    ) -> List[str]:
+        """Claim up to limit free or expired units."""
+        claimable = or_(WorkLease.owner.is_(None), WorkLease.expires_at.is_(None), WorkLease.expires_at <= now)
+        # Low shards first across all collectors, so each node gets a mix of collectors
+        candidates = list(session.scalars(
+            select(WorkLease.unit_id)
+            .where(WorkLease.unit_id.in_(unit_ids), claimable)
+            .order_by(WorkLease.shard, WorkLease.unit_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ))
+        if not candidates:
+            return []
+
+        session.execute(
+            update(WorkLease)
+            .where(and_(WorkLease.unit_id.in_(candidates), claimable))
+            .values(owner=self.node_id, expires_at=expires_at, acquired_at=now, heartbeat_at=now)
+        )
+        return candidates
+
+    def _release(self, session: Session, unit_ids: Iterable[str]) -> None:
+        """Free leases of this node for other nodes to claim."""
+        session.execute(
+            update(WorkLease)
+            .where(WorkLease.owner == self.node_id, WorkLease.unit_id.in_(list(unit_ids)))
+            .values(owner=None, expires_at=None)
+        )
+
+    def _unit_order(self, unit_id: str) -> Tuple[int, str]:
+        return self._units[unit_id][1], unit_id
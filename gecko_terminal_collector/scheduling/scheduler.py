@@ -18,11 +18,15 @@ from apscheduler.job import Job
 from gecko_terminal_collector.collectors.base import BaseDataCollector, CollectorRegistry
 from gecko_terminal_collector.models.core import CollectionResult
 from gecko_terminal_collector.config.models import CollectionConfig
+from gecko_terminal_collector.database.manager import DatabaseManager
+from gecko_terminal_collector.utils.enhanced_rate_limiter import GlobalRateLimitCoordinator
 from gecko_terminal_collector.utils.metadata import MetadataTracker
 from gecko_terminal_collector.monitoring.collection_monitor import CollectionMonitor
 from gecko_terminal_collector.monitoring.execution_history import ExecutionHistoryTracker
 from gecko_terminal_collector.monitoring.performance_metrics import MetricsCollector
 from gecko_terminal_collector.monitoring.database_manager import MonitoringDatabaseManager
+from gecko_terminal_collector.monitoring.write_behind import MonitoringWriteBehindQueue
+from gecko_terminal_collector.scheduling.leases import WorkLeaseManager
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +54,7 @@ class ScheduledCollector:
     last_success: Optional[datetime] = None
     error_count: int = 0
     consecutive_errors: int = 0
+    shards: int = 1  # Work units the collector is split into when sharding
 
 
 @dataclass
@@ -66,6 +71,25 @@ class SchedulerConfig:
     error_recovery_delay: int = 60  # seconds
     max_consecutive_errors: int = 5
     health_check_interval: int = 300  # seconds
+    # Multi-node sharding: nodes sharing a database split collector work
+    # units through lease rows instead of each running every collector
+    sharding_enabled: bool = False
+    node_id: Optional[str] = None
+    pool_shards: int = 16  # per collector that supports pool sharding
+    lease_ttl: int = 60  # seconds
+    lease_heartbeat_interval: int = 20  # seconds
+    
+    @classmethod
+    def from_collection_config(cls, config: CollectionConfig) -> 'SchedulerConfig':
+        """Scheduler configuration with the multi-node settings of a collection config."""
+        scheduling = config.scheduling
+        return cls(
+            sharding_enabled=scheduling.sharding_enabled,
+            node_id=scheduling.node_id,
+            pool_shards=scheduling.pool_shards,
+            lease_ttl=scheduling.lease_ttl,
+            lease_heartbeat_interval=scheduling.lease_heartbeat_interval
+        )
 
 
 class CollectionScheduler:
@@ -81,7 +105,9 @@ class CollectionScheduler:
         config: CollectionConfig,
         scheduler_config: Optional[SchedulerConfig] = None,
         metadata_tracker: Optional[MetadataTracker] = None,
-        monitoring_db_manager: Optional[MonitoringDatabaseManager] = None
+        monitoring_db_manager: Optional[MonitoringDatabaseManager] = None,
+        db_manager: Optional[DatabaseManager] = None,
+        rate_limit_coordinator: Optional[GlobalRateLimitCoordinator] = None
     ):
         """
         Initialize the collection scheduler.
@@ -91,6 +117,9 @@ class CollectionScheduler:
             scheduler_config: Scheduler-specific configuration
             metadata_tracker: Optional metadata tracker for statistics
             monitoring_db_manager: Optional monitoring database manager
+            db_manager: Database manager holding work leases (required for sharding)
+            rate_limit_coordinator: Optional coordinator whose quotas are split
+                across live nodes when sharding
         """
         self.config = config
         self.scheduler_config = scheduler_config or SchedulerConfig()
@@ -104,6 +133,20 @@ class CollectionScheduler:
             self.metrics_collector
         )
         self.monitoring_db_manager = monitoring_db_manager
+        self.db_manager = db_manager
+        self.rate_limit_coordinator = rate_limit_coordinator
+        
+        # Work leases shared with other nodes when sharding
+        self.lease_manager: Optional[WorkLeaseManager] = None
+        self._lease_task: Optional[asyncio.Task] = None
+        if self.scheduler_config.sharding_enabled:
+            if db_manager is None:
+                raise ValueError("Sharded scheduling requires a database manager for work leases")
+            self.lease_manager = WorkLeaseManager(
+                db_manager,
+                node_id=self.scheduler_config.node_id,
+                lease_ttl=self.scheduler_config.lease_ttl
+            )
         
         # Initialize APScheduler
         self._scheduler = AsyncIOScheduler(
@@ -186,6 +229,10 @@ class CollectionScheduler:
         # Register collector in registry
         self._collector_registry.register(collector)
         
+        # Pool-sharded collectors are split into one work unit per shard
+        if self.lease_manager and collector.supports_pool_sharding:
+            kwargs.setdefault('shards', self.scheduler_config.pool_shards)
+        
         # Create scheduled collector configuration
         scheduled_collector = ScheduledCollector(
             collector=collector,
@@ -196,6 +243,8 @@ class CollectionScheduler:
         )
         
         self._scheduled_collectors[job_id] = scheduled_collector
+        if self.lease_manager:
+            self.lease_manager.register_units(collector_key, scheduled_collector.shards)
         
         # Add job to scheduler if running
         if self._state == SchedulerState.RUNNING and enabled:
@@ -227,6 +276,8 @@ class CollectionScheduler:
         scheduled_collector = self._scheduled_collectors.pop(job_id)
         collector_key = scheduled_collector.collector.get_collection_key()
         self._collector_registry.unregister(collector_key)
+        if self.lease_manager:
+            self.lease_manager.unregister_collector(collector_key)
         
         # Cancel error recovery task if exists
         if job_id in self._error_recovery_tasks:
@@ -348,6 +399,15 @@ class CollectionScheduler:
         collector = scheduled_collector.collector
         collector_type = collector.get_collection_key()
         
+        # Only run the work units leased to this node
+        if self.lease_manager:
+            shards = self.lease_manager.owned_shards(collector_type)
+            if not shards:
+                logger.debug(f"Skipping {collector_type}: no work leases held by node {self.lease_manager.node_id}")
+                return
+            if scheduled_collector.shards > 1:
+                collector.set_pool_shards(shards, scheduled_collector.shards)
+        
         # Generate unique execution ID
         execution_id = f"{collector_type}_{int(datetime.now().timestamp())}_{job_id}"
         
@@ -517,6 +577,23 @@ class CollectionScheduler:
         logger.info("Starting collection scheduler")
         
         try:
+            # Start batched monitoring writes before the first job runs
+            for queue in self._write_behind_queues():
+                await queue.start()
+            
+            # Collectors draw from this node's share of the global API quota
+            if self.rate_limit_coordinator:
+                for scheduled_collector in self._scheduled_collectors.values():
+                    collector = scheduled_collector.collector
+                    collector.set_rate_limiter(
+                        await self.rate_limit_coordinator.get_limiter(collector.get_collection_key())
+                    )
+            
+            # Claim work leases before the first job runs
+            if self.lease_manager:
+                await self._rebalance_leases()
+                self._lease_task = asyncio.create_task(self._lease_heartbeat_loop())
+            
             # Start APScheduler
             self._scheduler.start()
             
@@ -567,6 +644,20 @@ class CollectionScheduler:
             # Wait for any remaining tasks
             await asyncio.sleep(1)
             
+            # Hand work units over to the remaining nodes
+            if self.lease_manager:
+                if self._lease_task:
+                    self._lease_task.cancel()
+                    self._lease_task = None
+                try:
+                    await self.lease_manager.release_all()
+                except Exception as e:
+                    logger.warning(f"Error releasing work leases: {e}")
+            
+            # Flush queued monitoring records
+            for queue in self._write_behind_queues():
+                await queue.stop()
+            
             self._state = SchedulerState.STOPPED
             logger.info("Collection scheduler stopped")
             
@@ -575,6 +666,31 @@ class CollectionScheduler:
             logger.error(f"Error stopping scheduler: {e}")
             raise
     
+    def _write_behind_queues(self) -> List[MonitoringWriteBehindQueue]:
+        """Write-behind queues enabled on the monitoring and collector database managers."""
+        queues = []
+        if self.monitoring_db_manager and self.monitoring_db_manager.write_behind:
+            queues.append(self.monitoring_db_manager.write_behind)
+        
+        # EnhancedDatabaseManager queues collection run metadata
+        queue = getattr(self.db_manager, 'monitoring_write_behind', None)
+        if isinstance(queue, MonitoringWriteBehindQueue) and queue not in queues:
+            queues.append(queue)
+        
+        return queues
+    
+    async def flush_monitoring_writes(self) -> int:
+        """
+        Write all queued monitoring records now.
+        
+        Returns:
+            Number of records written
+        """
+        written = 0
+        for queue in self._write_behind_queues():
+            written += await queue.flush()
+        return written
+    
     async def _health_check_loop(self) -> None:
         """Periodic health check for collectors and scheduler."""
         while self._state == SchedulerState.RUNNING and not self._shutdown_event.is_set():
@@ -597,6 +713,29 @@ class CollectionScheduler:
             except Exception as e:
                 logger.error(f"Error in health check: {e}")
     
+    async def _rebalance_leases(self) -> None:
+        """Renew and rebalance work leases, then resize this node's rate limits."""
+        try:
+            await self.lease_manager.rebalance()
+            if self.rate_limit_coordinator:
+                self.rate_limit_coordinator.set_node_count(self.lease_manager.live_nodes)
+        except Exception as e:
+            logger.error(f"Error rebalancing work leases: {e}")
+    
+    async def _lease_heartbeat_loop(self) -> None:
+        """Periodic lease heartbeat while sharding."""
+        while self._state in [SchedulerState.STARTING, SchedulerState.RUNNING] and not self._shutdown_event.is_set():
+            try:
+                await asyncio.sleep(self.scheduler_config.lease_heartbeat_interval)
+                
+                if self._shutdown_event.is_set():
+                    break
+                
+                await self._rebalance_leases()
+                
+            except asyncio.CancelledError:
+                break
+    
     def get_status(self) -> Dict[str, Any]:
         """
         Get comprehensive scheduler status.
@@ -623,7 +762,8 @@ class CollectionScheduler:
             "running_jobs": len(self._scheduler.get_jobs()) if self._scheduler.running else 0,
             "collectors": collector_status,
             "registry_summary": self._collector_registry.get_registry_summary(),
-            "scheduler_running": self._scheduler.running
+            "scheduler_running": self._scheduler.running,
+            "sharding": self.lease_manager.get_status() if self.lease_manager else None
         }
     
     def get_collector_status(self, job_id: str) -> Optional[Dict[str, Any]]:
@@ -2,10 +2,26 @@
 Utility modules for the GeckoTerminal collector system.
 """
 
-from .error_handling import ErrorHandler, CircuitBreaker, RetryConfig
-from .metadata import CollectionMetadata, MetadataTracker
-from .activity_scorer import ActivityScorer, CollectionPriority, ActivityMetrics, ScoringWeights
-from .bootstrap import SystemBootstrap, BootstrapResult, BootstrapProgress, BootstrapError
+from .lazy_imports import lazy_exports
+
+# Resolved on first access; bootstrap in particular pulls in the collectors
+_LAZY_IMPORTS = {
+    "ErrorHandler": ".error_handling",
+    "CircuitBreaker": ".error_handling",
+    "RetryConfig": ".error_handling",
+    "CollectionMetadata": ".metadata",
+    "MetadataTracker": ".metadata",
+    "ActivityScorer": ".activity_scorer",
+    "CollectionPriority": ".activity_scorer",
+    "ActivityMetrics": ".activity_scorer",
+    "ScoringWeights": ".activity_scorer",
+    "SystemBootstrap": ".bootstrap",
+    "BootstrapResult": ".bootstrap",
+    "BootstrapProgress": ".bootstrap",
+    "BootstrapError": ".bootstrap",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "ErrorHandler",
@@ -21,4 +37,4 @@ __all__ = [
     "BootstrapResult",
     "BootstrapProgress",
     "BootstrapError"
-]
\ No newline at end of file
+]
@@ -152,6 +152,29 @@ class ActivityScorer:
             logger.error(f"Error calculating activity score: {e}")
             raise ValueError(f"Failed to calculate activity score: {e}")
     
+    def calculate_activity_scores(self, pools_data: Dict[str, Dict[str, Any]]) -> Dict[str, Decimal]:
+        """
+        Calculate activity scores for a batch of pools.
+        
+        Pools whose metrics cannot be scored are logged and left out of
+        the result instead of failing the whole batch.
+        
+        Args:
+            pools_data: Dictionary mapping pool_id to pool data from API response
+            
+        Returns:
+            Dictionary mapping pool_id to activity score
+        """
+        scores = {}
+        
+        for pool_id, pool_data in pools_data.items():
+            try:
+                scores[pool_id] = self.calculate_activity_score(pool_data)
+            except ValueError as e:
+                logger.warning(f"Skipping activity score for pool {pool_id}: {e}")
+        
+        return scores
+    
     def should_include_pool(self, pool_data: Dict[str, Any]) -> bool:
         """
         Determine if a pool meets inclusion criteria based on thresholds.
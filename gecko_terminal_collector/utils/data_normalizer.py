@@ -306,6 +306,53 @@ class DataTypeNormalizer:
         
         return ValidationResult(len(errors) == 0, errors, warnings)
     
+    @staticmethod
+    def nest_pool_record(record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reshape a flat pool record from an SDK DataFrame into API format.
+        
+        The SDK returns pools as flat columns (``address``, ``volume_usd_h24``,
+        ``transactions_h24_buys``...) while parsers and the activity scorer
+        read the JSON:API ``attributes``/``relationships`` layout. Records that
+        already have attributes are returned unchanged.
+        
+        Args:
+            record: Pool record, flat or in API format
+            
+        Returns:
+            Pool record in API format
+        """
+        if 'attributes' in record:
+            return record
+        
+        def value(key: str) -> Any:
+            field = record.get(key)
+            if field is None or field != field:  # None or NaN
+                return None
+            return field.isoformat() if hasattr(field, 'isoformat') else field
+        
+        buys, sells = value('transactions_h24_buys'), value('transactions_h24_sells')
+        transactions = None if buys is None and sells is None else int(buys or 0) + int(sells or 0)
+        
+        return {
+            'id': value('id'),
+            'type': 'pool',
+            'attributes': {
+                'name': value('name'),
+                'address': value('address'),
+                'pool_created_at': value('pool_created_at'),
+                'reserve_in_usd': value('reserve_in_usd'),
+                'volume_usd': {'h24': value('volume_usd_h24')},
+                'transactions': {'h24': transactions},
+                'price_change_percentage': {'h24': value('price_change_percentage_h24')},
+            },
+            'relationships': {
+                relation: {'data': {'id': value(f'{relation}_id'), 'type': relation_type}}
+                for relation, relation_type in (('dex', 'dex'), ('base_token', 'token'), ('quote_token', 'token'))
+                if value(f'{relation}_id')
+            },
+        }
+    
     @staticmethod
     def convert_dataframe_to_records(df: pd.DataFrame) -> List[Dict]:
         """
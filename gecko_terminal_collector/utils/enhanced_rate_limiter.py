@@ -425,6 +425,42 @@ class GlobalRateLimitCoordinator:
         self.daily_limit = daily_limit
         self.state_dir = Path(state_dir) if state_dir else Path.cwd() / ".rate_limiter_state"
         self.limiters: Dict[str, EnhancedRateLimiter] = {}
+        # Collection nodes sharing the API key; each gets an equal quota share
+        self.node_count = 1
+    
+    @property
+    def node_requests_per_minute(self) -> int:
+        """Per-minute quota of this node."""
+        return max(1, self.requests_per_minute // self.node_count)
+    
+    @property
+    def node_daily_limit(self) -> int:
+        """Daily quota of this node."""
+        return max(1, self.daily_limit // self.node_count)
+    
+    def set_node_count(self, node_count: int) -> None:
+        """
+        Split the global quotas evenly across collection nodes.
+        
+        Limiters already handed out are updated in place, so a sharded
+        scheduler can call this whenever the number of live nodes changes.
+        
+        Args:
+            node_count: Number of live nodes sharing the API key
+        """
+        node_count = max(1, node_count)
+        if node_count == self.node_count:
+            return
+        
+        self.node_count = node_count
+        for limiter in self.limiters.values():
+            limiter.requests_per_minute = self.node_requests_per_minute
+            limiter.daily_limit = self.node_daily_limit
+        
+        logger.info(
+            f"Rate limits split across {node_count} nodes: "
+            f"{self.node_requests_per_minute}/min, {self.node_daily_limit}/day per node"
+        )
     
     @classmethod
     async def get_instance(
@@ -444,8 +480,8 @@ class GlobalRateLimitCoordinator:
         if collector_id not in self.limiters:
             state_file = self.state_dir / f"{collector_id}_rate_limiter.json"
             self.limiters[collector_id] = EnhancedRateLimiter(
-                requests_per_minute=self.requests_per_minute,
-                daily_limit=self.daily_limit,
+                requests_per_minute=self.node_requests_per_minute,
+                daily_limit=self.node_daily_limit,
                 state_file=str(state_file),
                 instance_id=collector_id
             )
@@ -459,6 +495,11 @@ class GlobalRateLimitCoordinator:
                 "requests_per_minute": self.requests_per_minute,
                 "daily_limit": self.daily_limit
             },
+            "node_count": self.node_count,
+            "node_limits": {
+                "requests_per_minute": self.node_requests_per_minute,
+                "daily_limit": self.node_daily_limit
+            },
             "limiters": {}
         }
         
@@ -470,7 +511,7 @@ class GlobalRateLimitCoordinator:
         
         status["global_usage"] = {
             "total_daily_requests": total_daily_requests,
-            "daily_usage_percentage": (total_daily_requests / self.daily_limit) * 100
+            "daily_usage_percentage": (total_daily_requests / self.node_daily_limit) * 100
         }
         
         return status
\ No newline at end of file
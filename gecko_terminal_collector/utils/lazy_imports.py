@@ -0,0 +1,42 @@
+"""
+Lazy attribute loading for package ``__init__`` modules (PEP 562).
+
+Package ``__init__`` files declare which submodule provides each public name
+and resolve it on first attribute access, so importing a package (or the CLI)
+does not pull in pandas, SQLAlchemy, aiohttp or APScheduler until a component
+that needs them is actually used.
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package_name: str,
+    exports: Dict[str, str]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package_name: ``__name__`` of the package defining the exports
+        exports: Mapping of public name to the relative submodule providing it
+
+    Returns:
+        Tuple of (``__getattr__``, ``__dir__``) functions for the package
+    """
+    def __getattr__(name: str) -> object:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module_name, package_name), name)
+        # Cache on the package so later lookups bypass __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(exports))
+
+    return __getattr__, __dir__
@@ -147,9 +147,45 @@ class PoolIDUtils:
         # Address part should be alphanumeric (allowing some special chars)
         if not re.match(r'^[a-zA-Z0-9_-]+$', address):
             return False
-            
+
         return True
 
+    @staticmethod
+    def to_symbol(pool_id: str) -> str:
+        """
+        Convert a pool ID to its case-preserving QLib symbol.
+
+        Invalid characters become underscores, runs of underscores are
+        collapsed and leading/trailing underscores are stripped.
+
+        Args:
+            pool_id: Pool ID to convert
+
+        Returns:
+            QLib symbol for the pool
+
+        Examples:
+            >>> PoolIDUtils.to_symbol("eth_0xAbC-123")
+            'eth_0xAbC_123'
+        """
+        symbol = ''.join(c if c.isalnum() or c == '_' else '_' for c in pool_id)
+        while '__' in symbol:
+            symbol = symbol.replace('__', '_')
+        return symbol.strip('_')
+
+    @staticmethod
+    def to_normalized_symbol(pool_id: str) -> str:
+        """
+        Convert a pool ID to the lowercase symbol used for case-insensitive lookup.
+
+        Args:
+            pool_id: Pool ID to convert
+
+        Returns:
+            Lowercase QLib symbol for the pool
+        """
+        return PoolIDUtils.to_symbol(pool_id).lower()
+
 
 # Convenience functions for backward compatibility
 def ensure_solana_prefix(pool_id: str) -> str:
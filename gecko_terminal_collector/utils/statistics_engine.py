@@ -3,6 +3,10 @@ Statistics and monitoring engine for new pools collection.
 
 This module provides comprehensive statistics collection, analysis, and reporting
 for new pools collection activities with network and DEX distribution analysis.
+
+Counts, distributions, activity timelines and execution metrics are read from
+the incremental hourly rollups (see database.rollups), so their cost does not
+grow with the size of new_pools_history and execution_history.
 """
 
 import logging
@@ -15,11 +19,15 @@ from sqlalchemy.orm import Session
 
 from gecko_terminal_collector.database.models import (
     NewPoolsHistory as NewPoolsHistoryModel,
+    NewPoolsHistoryHourly as NewPoolsHistoryHourlyModel,
+    NewPoolsHistoryTotals as NewPoolsHistoryTotalsModel,
     Pool as PoolModel,
     CollectionMetadata as CollectionMetadataModel,
     ExecutionHistory as ExecutionHistoryModel,
+    ExecutionHistoryHourly as ExecutionHistoryHourlyModel,
     SystemAlerts as SystemAlertsModel
 )
+from gecko_terminal_collector.database.rollups import StatisticsRollups, hour_floor
 
 logger = logging.getLogger(__name__)
 
@@ -69,15 +77,42 @@ class StatisticsEngine:
     and comprehensive error reporting with rate limiting context.
     """
     
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, use_rollups: bool = True):
         """
         Initialize statistics engine.
         
         Args:
             db_manager: Database manager instance for data access
+            use_rollups: Read from the hourly rollup tables instead of scanning
+                the history tables (activity timelines are then hour-aligned)
         """
         self.db_manager = db_manager
         self.logger = logging.getLogger(__name__)
+        self.use_rollups = use_rollups
+        self.rollups = StatisticsRollups(db_manager)
+        self._rollups_current = False
+    
+    async def refresh_rollups(self) -> bool:
+        """
+        Bring the rollups up to date before reading from them.
+        
+        Compaction only folds in rows added since the previous call. When it
+        fails, statistics fall back to scanning the history tables.
+        
+        Returns:
+            True if statistics will be served from the rollups
+        """
+        self._rollups_current = False
+        if not self.use_rollups:
+            return False
+        
+        try:
+            await self.rollups.compact()
+            self._rollups_current = True
+        except Exception as e:
+            self.logger.warning(f"Statistics rollups unavailable, scanning history tables: {e}")
+        
+        return self._rollups_current
     
     async def get_comprehensive_statistics(
         self,
@@ -97,6 +132,7 @@ class StatisticsEngine:
             CollectionStatistics object with all statistics
         """
         self.logger.info(f"Collecting comprehensive statistics (network: {network_filter}, limit: {limit})")
+        await self.refresh_rollups()
         
         with self.db_manager.connection.get_session() as session:
             try:
@@ -147,6 +183,7 @@ class StatisticsEngine:
             NetworkStatistics object with network-specific data
         """
         self.logger.info(f"Collecting statistics for network: {network_id}")
+        await self.refresh_rollups()
         
         with self.db_manager.connection.get_session() as session:
             try:
@@ -278,6 +315,12 @@ class StatisticsEngine:
     
     async def _get_total_history_count(self, session: Session, network_filter: Optional[str]) -> int:
         """Get total history records count with optional network filtering."""
+        if self._rollups_current:
+            query = session.query(func.sum(NewPoolsHistoryTotalsModel.records))
+            if network_filter:
+                query = query.filter(NewPoolsHistoryTotalsModel.network_id == network_filter)
+            return int(query.scalar() or 0)
+        
         query = session.query(func.count(NewPoolsHistoryModel.id))
         
         if network_filter:
@@ -291,6 +334,9 @@ class StatisticsEngine:
         network_filter: Optional[str]
     ) -> Dict[str, int]:
         """Get network distribution analysis."""
+        if self._rollups_current:
+            return self._get_totals_distribution(session, NewPoolsHistoryTotalsModel.network_id, network_filter)
+        
         query = session.query(
             NewPoolsHistoryModel.network_id,
             func.count(NewPoolsHistoryModel.id).label('count')
@@ -312,6 +358,9 @@ class StatisticsEngine:
         network_filter: Optional[str]
     ) -> Dict[str, int]:
         """Get DEX distribution analysis."""
+        if self._rollups_current:
+            return self._get_totals_distribution(session, NewPoolsHistoryTotalsModel.dex_id, network_filter)
+        
         query = session.query(
             NewPoolsHistoryModel.dex_id,
             func.count(NewPoolsHistoryModel.id).label('count')
@@ -327,6 +376,24 @@ class StatisticsEngine:
         
         return distribution
     
+    def _get_totals_distribution(
+        self,
+        session: Session,
+        key_column,
+        network_filter: Optional[str]
+    ) -> Dict[str, int]:
+        """Get record counts grouped by a rollup totals key column."""
+        query = session.query(
+            key_column,
+            func.sum(NewPoolsHistoryTotalsModel.records)
+        ).group_by(key_column)
+        
+        if network_filter:
+            query = query.filter(NewPoolsHistoryTotalsModel.network_id == network_filter)
+        
+        # Rows without a network or DEX are rolled up under ''
+        return {name: int(count) for name, count in query.all() if name}
+    
     async def _get_collection_activity(
         self,
         session: Session,
@@ -336,6 +403,9 @@ class StatisticsEngine:
         """Get collection activity timeline for the specified time period."""
         cutoff_time = datetime.utcnow() - timedelta(hours=hours_back)
         
+        if self._rollups_current:
+            return self._get_rollup_collection_activity(session, network_filter, cutoff_time)
+        
         # Group by hour for activity timeline
         activity_query = session.query(
             func.strftime('%Y-%m-%d %H:00', NewPoolsHistoryModel.collected_at).label('hour'),
@@ -364,6 +434,41 @@ class StatisticsEngine:
         
         return activity
     
+    def _get_rollup_collection_activity(
+        self,
+        session: Session,
+        network_filter: Optional[str],
+        cutoff_time: datetime
+    ) -> List[Dict[str, Any]]:
+        """Get the hourly activity timeline from the rollup, starting at the cutoff's hour."""
+        hourly = NewPoolsHistoryHourlyModel
+        activity_query = session.query(
+            hourly.bucket_start,
+            func.sum(hourly.records),
+            func.sum(hourly.unique_pools),
+            func.sum(hourly.reserve_in_usd_sum),
+            func.sum(hourly.reserve_in_usd_count),
+            func.sum(hourly.volume_usd_h24_sum)
+        ).filter(
+            hourly.bucket_start >= hour_floor(cutoff_time)
+        ).group_by(hourly.bucket_start).order_by(hourly.bucket_start)
+        
+        if network_filter:
+            activity_query = activity_query.filter(hourly.network_id == network_filter)
+        
+        activity = []
+        for hour, records, unique_pools, reserve_sum, reserve_count, total_volume in activity_query.all():
+            avg_reserve = float(reserve_sum) / reserve_count if reserve_sum and reserve_count else None
+            activity.append({
+                'hour': hour.strftime('%Y-%m-%d %H:00'),
+                'records': int(records),
+                'unique_pools': int(unique_pools),
+                'avg_reserve_usd': avg_reserve,
+                'total_volume_h24': float(total_volume) if total_volume else None
+            })
+        
+        return activity
+    
     async def _get_recent_records(
         self,
         session: Session,
@@ -411,6 +516,34 @@ class StatisticsEngine:
         """Get error summary for the specified time period."""
         cutoff_time = datetime.utcnow() - timedelta(hours=hours_back)
         
+        if self._rollups_current:
+            hourly = ExecutionHistoryHourlyModel
+            query = session.query(
+                func.sum(hourly.executions),
+                func.sum(hourly.successful_executions),
+                func.sum(hourly.failed_executions),
+                func.sum(hourly.partial_executions)
+            ).filter(
+                hourly.collector_type.like('%new_pools%'),
+                hourly.bucket_start >= hour_floor(cutoff_time)
+            )
+            if network_filter:
+                query = query.filter(hourly.collector_type.like(f"%{network_filter}%"))
+            
+            total_executions, successful_executions, failed_executions, partial_executions = (
+                int(value or 0) for value in query.one()
+            )
+            success_rate = (successful_executions / total_executions * 100) if total_executions > 0 else 0
+            
+            return {
+                'total_executions': total_executions,
+                'successful_executions': successful_executions,
+                'failed_executions': failed_executions,
+                'partial_executions': partial_executions,
+                'success_rate': round(success_rate, 2),
+                'time_period_hours': hours_back
+            }
+        
         # Get execution history for new pools collectors
         error_query = session.query(ExecutionHistoryModel).filter(
             and_(
@@ -542,10 +675,15 @@ class StatisticsEngine:
         Returns:
             Dictionary containing performance metrics
         """
+        await self.refresh_rollups()
+        
         with self.db_manager.connection.get_session() as session:
             try:
                 cutoff_time = datetime.utcnow() - timedelta(hours=hours_back)
                 
+                if self._rollups_current:
+                    return self._get_rollup_performance_metrics(session, network_filter, cutoff_time, hours_back)
+                
                 # Get execution performance metrics
                 perf_query = session.query(ExecutionHistoryModel).filter(
                     and_(
@@ -592,4 +730,54 @@ class StatisticsEngine:
                 
             except Exception as e:
                 self.logger.error(f"Error collecting performance metrics: {e}")
-                raise
\ No newline at end of file
+                raise
+    
+    def _get_rollup_performance_metrics(
+        self,
+        session: Session,
+        network_filter: Optional[str],
+        cutoff_time: datetime,
+        hours_back: int
+    ) -> Dict[str, Any]:
+        """Get collection performance metrics from the hourly execution rollup."""
+        hourly = ExecutionHistoryHourlyModel
+        query = session.query(
+            func.sum(hourly.timed_executions),
+            func.sum(hourly.execution_time_sum),
+            func.min(hourly.execution_time_min),
+            func.max(hourly.execution_time_max),
+            func.sum(hourly.records_collected)
+        ).filter(
+            hourly.collector_type.like('%new_pools%'),
+            hourly.bucket_start >= hour_floor(cutoff_time),
+            hourly.timed_executions > 0
+        )
+        if network_filter:
+            query = query.filter(hourly.collector_type.like(f"%{network_filter}%"))
+        
+        executions, total_time, min_time, max_time, total_records = query.one()
+        if not executions:
+            return {
+                'total_executions': 0,
+                'avg_execution_time': 0,
+                'min_execution_time': 0,
+                'max_execution_time': 0,
+                'total_records_collected': 0,
+                'avg_records_per_execution': 0,
+                'records_per_second': 0
+            }
+        
+        executions = int(executions)
+        total_time = float(total_time or 0)
+        total_records = int(total_records or 0)
+        
+        return {
+            'total_executions': executions,
+            'avg_execution_time': round(total_time / executions, 2),
+            'min_execution_time': round(float(min_time), 2),
+            'max_execution_time': round(float(max_time), 2),
+            'total_records_collected': total_records,
+            'avg_records_per_execution': round(total_records / executions, 2),
+            'records_per_second': round(total_records / total_time, 2) if total_time > 0 else 0,
+            'time_period_hours': hours_back
+        }
@@ -2,21 +2,27 @@
 Structured logging with correlation IDs and comprehensive error context.
 """
 
+import atexit
 import json
 import logging
 import logging.handlers
+import queue
 import sys
 import threading
+import time
 import uuid
 from contextvars import ContextVar
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 from pathlib import Path
 
 # Context variable for correlation ID
 correlation_id: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
 
+# Whether collector stdout diagnostics go through logging instead of print()
+_route_stdout_diagnostics = False
+
 
 @dataclass
 class LogContext:
@@ -41,6 +47,98 @@ class CorrelationIdFilter(logging.Filter):
         return True
 
 
+@dataclass
+class LogSamplingConfig:
+    """Per-call-site rate limiting and sampling for low-severity log records."""
+    max_level: int = logging.INFO  # records above this level are never limited
+    burst: int = 20  # records allowed per call site per interval
+    interval: float = 1.0  # seconds
+    sample_rate: int = 100  # keep 1 in N records once the burst is exhausted
+
+
+class RateLimitingFilter(logging.Filter):
+    """
+    Logging filter that rate limits and samples DEBUG/INFO records per call site.
+    
+    Each (pathname, lineno) call site may emit ``burst`` records per
+    ``interval``; after that only every ``sample_rate``-th record passes and
+    carries a ``suppressed`` count of the records dropped since the last one.
+    Warnings and errors always pass.
+    """
+    
+    def __init__(self, config: Optional[LogSamplingConfig] = None):
+        super().__init__()
+        self.config = config or LogSamplingConfig()
+        # call site -> [window_start, emitted_in_window, suppressed_since_last]
+        self._sites: Dict[Tuple[str, int], list] = {}
+        self._lock = threading.Lock()
+        self.total_suppressed = 0
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether the record passes the call-site budget."""
+        if record.levelno > self.config.max_level:
+            return True
+        
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None or now - site[0] >= self.config.interval:
+                suppressed = site[2] if site else 0
+                self._sites[key] = [now, 1, 0]
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            
+            site[1] += 1
+            if site[1] <= self.config.burst:
+                return True
+            
+            if (site[1] - self.config.burst) % max(self.config.sample_rate, 1) == 0:
+                record.suppressed = site[2]
+                site[2] = 0
+                return True
+            
+            site[2] += 1
+            self.total_suppressed += 1
+            return False
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never blocks the caller and defers formatting.
+    
+    Only the message template is merged on the calling thread; JSON
+    encoding, exception formatting and I/O happen on the listener thread.
+    Records are dropped (and counted) when the queue is full.
+    """
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge args into the message without running the formatter."""
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _DrainingQueueListener(logging.handlers.QueueListener):
+    """Queue listener whose stop() waits for room instead of failing on a full queue."""
+    
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
 class StructuredFormatter(logging.Formatter):
     """
     Custom formatter that outputs structured JSON logs.
@@ -69,7 +167,7 @@ class StructuredFormatter(logging.Formatter):
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
-            "thread": threading.current_thread().name,
+            "thread": record.threadName,
             "process": record.process,
             "correlation_id": getattr(record, 'correlation_id', 'unknown')
         }
@@ -222,6 +320,9 @@ class LoggingManager:
     def __init__(self):
         self._configured = False
         self._log_handlers: Dict[str, logging.Handler] = {}
+        self._queue_handler: Optional[NonBlockingQueueHandler] = None
+        self._queue_listener: Optional[logging.handlers.QueueListener] = None
+        self._rate_limiter: Optional[RateLimitingFilter] = None
     
     def setup_logging(
         self,
@@ -231,11 +332,20 @@ class LoggingManager:
         backup_count: int = 5,
         console_output: bool = True,
         structured_format: bool = True,
-        include_extra_fields: bool = True
+        include_extra_fields: bool = True,
+        async_logging: bool = False,
+        queue_size: int = 10000,
+        sampling: Optional[LogSamplingConfig] = None,
+        route_stdout_diagnostics: bool = False
     ) -> None:
         """
         Set up comprehensive logging configuration.
         
+        With ``async_logging`` enabled, the root logger only gets a
+        non-blocking queue handler; console and file handlers run behind a
+        ``QueueListener`` on a background thread, so formatting and I/O stay
+        off the event loop.
+        
         Args:
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             log_file: Path to log file (optional)
@@ -244,10 +354,17 @@ class LoggingManager:
             console_output: Whether to output logs to console
             structured_format: Whether to use structured JSON format
             include_extra_fields: Whether to include extra fields in structured logs
+            async_logging: Whether to format and write logs on a background thread
+            queue_size: Maximum number of queued records before records are dropped
+            sampling: Optional per-call-site rate limiting for DEBUG/INFO records
+            route_stdout_diagnostics: Whether collector stdout diagnostics are
+                logged at DEBUG instead of printed
         """
         if self._configured:
             return
         
+        set_stdout_diagnostics_routing(route_stdout_diagnostics)
+        
         # Configure root logger
         root_logger = logging.getLogger()
         root_logger.setLevel(getattr(logging, log_level.upper()))
@@ -263,12 +380,13 @@ class LoggingManager:
                 '%(asctime)s - %(name)s - %(levelname)s - %(correlation_id)s - %(message)s'
             )
         
+        output_handlers = []
+        
         # Console handler
         if console_output:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setFormatter(formatter)
-            console_handler.addFilter(CorrelationIdFilter())
-            root_logger.addHandler(console_handler)
+            output_handlers.append(console_handler)
             self._log_handlers['console'] = console_handler
         
         # File handler with rotation
@@ -283,10 +401,34 @@ class LoggingManager:
                 encoding='utf-8'
             )
             file_handler.setFormatter(formatter)
-            file_handler.addFilter(CorrelationIdFilter())
-            root_logger.addHandler(file_handler)
+            output_handlers.append(file_handler)
             self._log_handlers['file'] = file_handler
         
+        if sampling is not None:
+            self._rate_limiter = RateLimitingFilter(sampling)
+        
+        if async_logging:
+            # Correlation IDs live in contextvars, so they must be captured
+            # on the calling side before the record crosses threads
+            log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+            self._queue_handler = NonBlockingQueueHandler(log_queue)
+            if self._rate_limiter:
+                self._queue_handler.addFilter(self._rate_limiter)
+            self._queue_handler.addFilter(CorrelationIdFilter())
+            root_logger.addHandler(self._queue_handler)
+            
+            self._queue_listener = _DrainingQueueListener(
+                log_queue, *output_handlers, respect_handler_level=True
+            )
+            self._queue_listener.start()
+            atexit.register(self.shutdown_logging)
+        else:
+            for handler in output_handlers:
+                if self._rate_limiter:
+                    handler.addFilter(self._rate_limiter)
+                handler.addFilter(CorrelationIdFilter())
+                root_logger.addHandler(handler)
+        
         # Set specific logger levels
         self._configure_logger_levels()
         
@@ -300,10 +442,24 @@ class LoggingManager:
                 "log_level": log_level,
                 "log_file": log_file,
                 "structured_format": structured_format,
-                "console_output": console_output
+                "console_output": console_output,
+                "async_logging": async_logging
             }
         )
     
+    def shutdown_logging(self) -> None:
+        """Stop the background listener, writing out any queued records."""
+        if self._queue_listener is not None:
+            self._queue_listener.stop()
+            self._queue_listener = None
+        
+        if self._queue_handler is not None:
+            logging.getLogger().removeHandler(self._queue_handler)
+            self._queue_handler = None
+        
+        for handler in self._log_handlers.values():
+            handler.flush()
+    
     def _configure_logger_levels(self) -> None:
         """Configure specific logger levels."""
         # Reduce noise from third-party libraries
@@ -360,15 +516,23 @@ class LoggingManager:
     
     def add_handler(self, name: str, handler: logging.Handler) -> None:
         """Add a custom logging handler."""
-        handler.addFilter(CorrelationIdFilter())
-        logging.getLogger().addHandler(handler)
+        if self._queue_listener is not None:
+            # Attach behind the queue so the handler runs on the listener thread
+            self._queue_listener.handlers = self._queue_listener.handlers + (handler,)
+        else:
+            handler.addFilter(CorrelationIdFilter())
+            logging.getLogger().addHandler(handler)
         self._log_handlers[name] = handler
     
     def remove_handler(self, name: str) -> None:
         """Remove a logging handler."""
         if name in self._log_handlers:
-            logging.getLogger().removeHandler(self._log_handlers[name])
-            del self._log_handlers[name]
+            handler = self._log_handlers.pop(name)
+            if self._queue_listener is not None:
+                self._queue_listener.handlers = tuple(
+                    h for h in self._queue_listener.handlers if h is not handler
+                )
+            logging.getLogger().removeHandler(handler)
     
     def get_log_stats(self) -> Dict[str, Any]:
         """Get logging statistics and configuration."""
@@ -377,6 +541,11 @@ class LoggingManager:
             "handlers": list(self._log_handlers.keys()),
             "root_level": logging.getLogger().level,
             "correlation_id": self.get_correlation_id(),
+            "async_logging": self._queue_listener is not None,
+            "queued_records": self._queue_handler.queue.qsize() if self._queue_handler else 0,
+            "dropped_records": self._queue_handler.dropped if self._queue_handler else 0,
+            "suppressed_records": self._rate_limiter.total_suppressed if self._rate_limiter else 0,
+            "stdout_diagnostics_routed": _route_stdout_diagnostics,
             "handler_details": {
                 name: {
                     "class": handler.__class__.__name__,
@@ -406,6 +575,50 @@ def get_logger(name: str, context: Optional[LogContext] = None) -> ContextualLog
     return logging_manager.get_contextual_logger(name, context)
 
 
+def set_stdout_diagnostics_routing(enabled: bool) -> None:
+    """
+    Route collector stdout diagnostics through logging instead of print().
+    
+    Args:
+        enabled: True to log diagnostics at DEBUG, False to print them
+    """
+    global _route_stdout_diagnostics
+    _route_stdout_diagnostics = enabled
+
+
+class _LazyJoin:
+    """Defers str() of diagnostic values until a handler formats the record."""
+    
+    __slots__ = ("values", "sep")
+    
+    def __init__(self, values: Tuple[Any, ...], sep: str):
+        self.values = values
+        self.sep = sep
+    
+    def __str__(self) -> str:
+        return self.sep.join(str(value) for value in self.values)
+
+
+def diagnostic(target_logger: logging.Logger, *values: Any, sep: str = " ") -> None:
+    """
+    Emit a collector stdout diagnostic.
+    
+    Prints like ``print(*values)`` by default. When routing is enabled the
+    values are logged at DEBUG on ``target_logger`` instead, so they are
+    skipped without formatting when DEBUG is off and are subject to the same
+    queueing and per-call-site sampling as other records.
+    
+    Args:
+        target_logger: Logger of the calling module
+        *values: Values to print or log
+        sep: Separator between values
+    """
+    if not _route_stdout_diagnostics:
+        print(*values, sep=sep)
+    elif target_logger.isEnabledFor(logging.DEBUG):
+        target_logger.debug("%s", _LazyJoin(values, sep), stacklevel=2)
+
+
 def with_correlation_id(corr_id: Optional[str] = None):
     """
     Decorator to set correlation ID for function execution.
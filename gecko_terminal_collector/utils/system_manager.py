@@ -12,11 +12,17 @@ from contextlib import asynccontextmanager
 
 from gecko_terminal_collector.config.manager import ConfigManager
 from gecko_terminal_collector.database.manager import DatabaseManager
-from gecko_terminal_collector.scheduling.scheduler import CollectionScheduler
+from gecko_terminal_collector.scheduling.scheduler import CollectionScheduler, SchedulerConfig
+from gecko_terminal_collector.monitoring.database_manager import (
+    MonitoringDatabaseManager, create_monitoring_db_manager
+)
 from gecko_terminal_collector.monitoring.health_endpoints import SystemHealthEndpoints
 from gecko_terminal_collector.utils.resilience import GracefulShutdownHandler, SystemMonitor
-from gecko_terminal_collector.utils.structured_logging import logging_manager, get_logger, LogContext
+from gecko_terminal_collector.utils.structured_logging import (
+    logging_manager, get_logger, LogContext, LogSamplingConfig
+)
 from gecko_terminal_collector.utils.error_handling import ErrorHandler
+from gecko_terminal_collector.utils.enhanced_rate_limiter import GlobalRateLimitCoordinator
 
 logger = get_logger(__name__)
 
@@ -34,6 +40,7 @@ class SystemManager:
         self.config_path = config_path
         self.config_manager: Optional[ConfigManager] = None
         self.db_manager: Optional[DatabaseManager] = None
+        self.monitoring_db_manager: Optional[MonitoringDatabaseManager] = None
         self.scheduler: Optional[CollectionScheduler] = None
         self.health_endpoints: Optional[SystemHealthEndpoints] = None
         self.system_monitor: Optional[SystemMonitor] = None
@@ -105,7 +112,9 @@ class SystemManager:
                 log_level="INFO",
                 log_file="logs/gecko_collector.log",
                 console_output=True,
-                structured_format=True
+                structured_format=True,
+                async_logging=True,
+                sampling=LogSamplingConfig()
             )
             
             logger.info("Logging system initialized")
@@ -154,15 +163,17 @@ class SystemManager:
     async def _initialize_database(self) -> None:
         """Initialize database connection and management."""
         try:
+            from gecko_terminal_collector.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+            
             config = self.config_manager.get_config()
-            self.db_manager = DatabaseManager(config.database)
+            self.db_manager = SQLAlchemyDatabaseManager(config.database)
             
             # Test database connection
             await self.db_manager.initialize()
             
             # Register shutdown callback for database cleanup
             self.shutdown_handler.register_shutdown_callback(
-                self.db_manager.close_all_connections
+                self.db_manager.close
             )
             
             logger.info("Database management initialized")
@@ -175,15 +186,23 @@ class SystemManager:
         """Initialize collection scheduler."""
         try:
             config = self.config_manager.get_config()
+            self.monitoring_db_manager = create_monitoring_db_manager(self.db_manager, config.monitoring)
+            rate_limit_coordinator = await GlobalRateLimitCoordinator.get_instance(
+                config.rate_limiting.requests_per_minute,
+                config.rate_limiting.daily_limit,
+                config.rate_limiting.state_file_dir
+            )
             self.scheduler = CollectionScheduler(
                 config=config,
+                scheduler_config=SchedulerConfig.from_collection_config(config),
+                monitoring_db_manager=self.monitoring_db_manager,
                 db_manager=self.db_manager,
-                error_handler=self.error_handler
+                rate_limit_coordinator=rate_limit_coordinator
             )
             
             # Register shutdown callback for scheduler
             self.shutdown_handler.register_shutdown_callback(
-                self.scheduler.shutdown
+                self.scheduler.stop
             )
             
             logger.info("Collection scheduler initialized")
@@ -280,7 +299,7 @@ class SystemManager:
     async def stop_scheduler(self) -> None:
         """Stop the collection scheduler."""
         if self.scheduler:
-            await self.scheduler.shutdown()
+            await self.scheduler.stop()
             logger.info("Collection scheduler stopped")
     
     async def get_system_status(self) -> Dict[str, Any]:
@@ -343,10 +362,11 @@ class SystemManager:
         try:
             logger.info("Cleaning up system resources...")
             
-            # Stop scheduler
+            # Stop scheduler, flushing queued monitoring records while the
+            # database is still open
             if self.scheduler:
                 try:
-                    await self.scheduler.shutdown()
+                    await self.scheduler.stop()
                 except Exception as e:
                     logger.error("Error stopping scheduler", exc_info=True)
             
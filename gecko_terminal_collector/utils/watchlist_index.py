@@ -0,0 +1,208 @@
+"""
+Incremental, keyed loading of watchlist CSV files.
+
+The watchlist is re-read by the watchlist monitor on every check and by CLI
+commands looking up a single entry. WatchlistIndex keeps the parsed records
+keyed by pool address and only touches the file again when it changed:
+
+- size and mtime unchanged: nothing is read
+- file grew and the previously read bytes still hash the same: only the
+  appended tail is parsed
+- anything else: the file is hashed and re-parsed if its content changed
+"""
+
+import csv
+import hashlib
+import io
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Generic, Iterable, List, Optional, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+@dataclass
+class WatchlistRefresh(Generic[T]):
+    """Outcome of refreshing a watchlist index."""
+    modified: bool
+    full_reload: bool = False
+    records: List[T] = field(default_factory=list)  # Appended records, or all records on a full reload
+
+
+class WatchlistIndex(Generic[T]):
+    """
+    Parsed watchlist records keyed for O(1) lookups, refreshed incrementally.
+
+    Row parsing and validation are supplied by the caller, so the monitor and
+    the processor keep their own record types and rules. Records are kept in
+    file order; a key seen again later in the file is ignored.
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        parse_row: Callable[[Dict[str, str], int], Optional[T]],
+        key: Callable[[T], Optional[str]],
+        aliases: Optional[Callable[[T], Iterable[str]]] = None
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            file_path: Path to the watchlist CSV file
+            parse_row: Builds a record from a CSV row and its row number, or
+                returns None to skip the row
+            key: Primary key of a record (e.g. its pool address)
+            aliases: Additional lookup keys of a record (e.g. its symbol)
+        """
+        self.file_path = Path(file_path)
+        self._parse_row = parse_row
+        self._key = key
+        self._aliases = aliases
+
+        self._records: Dict[str, T] = {}
+        self._alias_keys: Dict[str, str] = {}
+        self._fieldnames: Optional[List[str]] = None
+        self._rows_read = 0
+
+        # File state as of the last read
+        self._size: Optional[int] = None
+        self._mtime_ns: Optional[int] = None
+        self._content_hash: Optional[str] = None
+        self._hasher = None
+        self._ends_with_newline = True
+
+    @property
+    def last_modified(self) -> Optional[float]:
+        """Modification time of the file as of the last read."""
+        return self._mtime_ns / 1e9 if self._mtime_ns is not None else None
+
+    def refresh(self) -> WatchlistRefresh[T]:
+        """
+        Bring the index up to date with the file.
+
+        Returns:
+            WatchlistRefresh describing what changed
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        stat = os.stat(self.file_path)
+        if stat.st_size == self._size and stat.st_mtime_ns == self._mtime_ns:
+            return WatchlistRefresh(modified=False)
+
+        with open(self.file_path, 'rb') as file:
+            data = file.read()
+
+        if self._can_read_tail(data):
+            return self._append(data[self._size:], stat)
+
+        if self._content_hash is not None and hashlib.sha256(data).hexdigest() == self._content_hash:
+            # Touched or rewritten with identical content
+            self._size, self._mtime_ns = len(data), stat.st_mtime_ns
+            return WatchlistRefresh(modified=False)
+
+        return self._reload(data, stat)
+
+    def invalidate(self) -> None:
+        """Force the next refresh to re-parse the whole file."""
+        self._size = self._mtime_ns = self._content_hash = None
+
+    def records(self) -> List[T]:
+        """All records in file order."""
+        return list(self._records.values())
+
+    def get(self, identifier: str) -> Optional[T]:
+        """Look up a record by its key or one of its aliases."""
+        record = self._records.get(identifier)
+        if record is None and identifier in self._alias_keys:
+            record = self._records.get(self._alias_keys[identifier])
+        return record
+
+    def __contains__(self, identifier: str) -> bool:
+        return self.get(identifier) is not None
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _can_read_tail(self, data: bytes) -> bool:
+        """
+        Whether the file only had bytes appended since the last read.
+
+        The bytes up to the previous end of file are hashed and compared with
+        the hash of everything read so far, so an in-place edit anywhere
+        before the appended tail forces a full reload. Hashing is far cheaper
+        than re-parsing the rows.
+        """
+        if self._content_hash is None or self._fieldnames is None:
+            return False
+        if not self._ends_with_newline or len(data) <= self._size:
+            # A new size-preserving edit, or an append extending the last line
+            return False
+
+        return hashlib.sha256(memoryview(data)[:self._size]).hexdigest() == self._content_hash
+
+    def _append(self, tail: bytes, stat: os.stat_result) -> WatchlistRefresh[T]:
+        """Parse rows appended to the file."""
+        reader = csv.DictReader(io.StringIO(tail.decode('utf-8')), fieldnames=self._fieldnames)
+        added = self._add_rows(reader)
+
+        self._hasher.update(tail)
+        self._remember(stat, self._size + len(tail), tail)
+
+        logger.debug(f"Read {len(tail)} appended bytes from {self.file_path}: {len(added)} new records")
+        return WatchlistRefresh(modified=True, records=added)
+
+    def _reload(self, data: bytes, stat: os.stat_result) -> WatchlistRefresh[T]:
+        """Re-parse the whole file."""
+        self._records = {}
+        self._alias_keys = {}
+        self._rows_read = 0
+
+        reader = csv.DictReader(io.StringIO(data.decode('utf-8')))
+        self._add_rows(reader)
+        self._fieldnames = reader.fieldnames
+
+        self._hasher = hashlib.sha256(data)
+        self._remember(stat, len(data), data)
+
+        logger.info(f"Parsed {len(self._records)} valid records from {self.file_path}")
+        return WatchlistRefresh(modified=True, full_reload=True, records=self.records())
+
+    def _add_rows(self, reader: csv.DictReader) -> List[T]:
+        """Parse rows into the index and return the newly added records."""
+        added = []
+        for row in reader:
+            self._rows_read += 1
+            row_num = self._rows_read + 1  # Header is row 1
+            try:
+                record = self._parse_row(row, row_num)
+            except Exception as e:
+                logger.warning(f"Row {row_num}: Error parsing row: {e}. Skipping row.")
+                continue
+
+            key = self._key(record) if record is not None else None
+            if not key:
+                continue
+            if key in self._records:
+                logger.debug(f"Row {row_num}: Duplicate watchlist key {key}. Skipping row.")
+                continue
+
+            self._records[key] = record
+            for alias in (self._aliases(record) if self._aliases else ()):
+                if alias:
+                    self._alias_keys.setdefault(alias, key)
+            added.append(record)
+
+        return added
+
+    def _remember(self, stat: os.stat_result, size: int, content_end: bytes) -> None:
+        """Record the file state after reading it up to size bytes."""
+        self._size = size
+        self._mtime_ns = stat.st_mtime_ns
+        self._content_hash = self._hasher.hexdigest()
+        self._ends_with_newline = not content_end or content_end.endswith(b'\n')
@@ -2,14 +2,16 @@
 Watchlist processing utilities for loading and parsing watchlist CSV files.
 """
 
-import csv
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from gecko_terminal_collector.config.models import CollectionConfig
+from gecko_terminal_collector.utils.watchlist_index import WatchlistIndex
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_WATCHLIST_PATH = "specs/watchlist.csv"
+
 
 class WatchlistProcessor:
     """
@@ -28,6 +30,9 @@ class WatchlistProcessor:
         """
         self.config = config
         
+        # Parsed watchlists by file path, refreshed only when the file changes
+        self._indexes: Dict[Path, WatchlistIndex[Dict[str, Any]]] = {}
+        
     async def load_watchlist(self, file_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Load watchlist items from CSV file.
@@ -39,7 +44,7 @@ class WatchlistProcessor:
             List of watchlist item dictionaries
         """
         if file_path is None:
-            file_path = "specs/watchlist.csv"  # Default path
+            file_path = DEFAULT_WATCHLIST_PATH
             
         try:
             watchlist_path = Path(file_path)
@@ -48,32 +53,62 @@ class WatchlistProcessor:
                 logger.error(f"Watchlist file not found: {file_path}")
                 return []
             
-            watchlist_items = []
+            index = self._get_index(watchlist_path)
+            if index.refresh().modified:
+                logger.info(f"Loaded {len(index)} valid watchlist items from {file_path}")
             
-            with open(watchlist_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 for header
-                    try:
-                        # Clean and validate row data
-                        item = self._clean_watchlist_item(row)
-                        
-                        if self._validate_watchlist_item(item):
-                            watchlist_items.append(item)
-                        else:
-                            logger.warning(f"Invalid watchlist item at row {row_num}: {item}")
-                            
-                    except Exception as e:
-                        logger.error(f"Error processing watchlist row {row_num}: {e}")
-                        continue
-            
-            logger.info(f"Loaded {len(watchlist_items)} valid watchlist items from {file_path}")
-            return watchlist_items
+            return index.records()
             
         except Exception as e:
             logger.error(f"Error loading watchlist from {file_path}: {e}")
             return []
     
+    def _get_index(self, watchlist_path: Path) -> WatchlistIndex[Dict[str, Any]]:
+        """
+        Get the index of a watchlist file.
+        
+        Items are keyed by pool address (network address when there is none)
+        and can also be looked up by lowercased token symbol.
+        
+        Args:
+            watchlist_path: Path to watchlist CSV file
+            
+        Returns:
+            Watchlist index for the file
+        """
+        index = self._indexes.get(watchlist_path)
+        if index is None:
+            index = WatchlistIndex(
+                watchlist_path,
+                self._parse_watchlist_row,
+                key=lambda item: item.get('poolAddress') or item.get('networkAddress'),
+                aliases=lambda item: (
+                    (item.get('tokenSymbol') or '').lower(),
+                    item.get('networkAddress')
+                )
+            )
+            self._indexes[watchlist_path] = index
+        return index
+    
+    def _parse_watchlist_row(self, row: Dict[str, str], row_num: int) -> Optional[Dict[str, Any]]:
+        """
+        Clean and validate a single watchlist CSV row.
+        
+        Args:
+            row: Raw CSV row data
+            row_num: Row number in the file, for logging
+            
+        Returns:
+            Cleaned watchlist item, or None if it is invalid
+        """
+        item = self._clean_watchlist_item(row)
+        
+        if not self._validate_watchlist_item(item):
+            logger.warning(f"Invalid watchlist item at row {row_num}: {item}")
+            return None
+        
+        return item
+    
     def _clean_watchlist_item(self, row: Dict[str, str]) -> Dict[str, Any]:
         """
         Clean and normalize watchlist item data.
@@ -154,24 +189,13 @@ class WatchlistProcessor:
         Returns:
             Matching watchlist item or None if not found
         """
-        watchlist_items = await self.load_watchlist(file_path)
-        
-        identifier_lower = identifier.lower()
+        if not await self.load_watchlist(file_path):
+            return None
         
-        for item in watchlist_items:
-            # Check token symbol (case insensitive)
-            if item.get('tokenSymbol', '').lower() == identifier_lower:
-                return item
-            
-            # Check pool address (exact match)
-            if item.get('poolAddress') == identifier:
-                return item
-            
-            # Check network address (exact match)
-            if item.get('networkAddress') == identifier:
-                return item
+        index = self._get_index(Path(file_path or DEFAULT_WATCHLIST_PATH))
         
-        return None
+        # Pool or network address (exact match), then token symbol (case insensitive)
+        return index.get(identifier) or index.get(identifier.lower())
     
     async def get_watchlist_summary(self, file_path: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -204,14 +204,14 @@ class WorkflowValidator:
             start_date = end_date - timedelta(days=days_back)
             
             # Get OHLCV data for the pool
-            ohlcv_records = await self.db_manager.get_ohlcv_data(
-                pool_id=pool_id,
-                timeframe=timeframe,
+            ohlcv_frame = await self.db_manager.get_ohlcv_frame(
+                pool_id,
+                timeframe,
                 start_time=start_date,
                 end_time=end_date
             )
             
-            if not ohlcv_records:
+            if ohlcv_frame.empty:
                 errors.append(f"No OHLCV data found for pool {pool_id}")
                 return ValidationResult(
                     success=False,
@@ -221,29 +221,29 @@ class WorkflowValidator:
                     warnings=warnings
                 )
             
-            details['total_records'] = len(ohlcv_records)
+            details['total_records'] = len(ohlcv_frame)
             details['date_range'] = {
-                'start': min(record.datetime for record in ohlcv_records).isoformat(),
-                'end': max(record.datetime for record in ohlcv_records).isoformat()
+                'start': ohlcv_frame['datetime'].min().isoformat(),
+                'end': ohlcv_frame['datetime'].max().isoformat()
             }
             
             # Check for data consistency
-            price_issues = 0
-            volume_issues = 0
-            
-            for record in ohlcv_records:
-                # Check price relationships
-                if not (record.low_price <= record.open_price <= record.high_price and
-                        record.low_price <= record.close_price <= record.high_price):
-                    price_issues += 1
-                
-                # Check for zero or negative values
-                if (record.open_price <= 0 or record.high_price <= 0 or 
-                    record.low_price <= 0 or record.close_price <= 0):
-                    price_issues += 1
-                
-                if record.volume_usd < 0:
-                    volume_issues += 1
+            open_price = ohlcv_frame['open_price'].to_numpy()
+            high_price = ohlcv_frame['high_price'].to_numpy()
+            low_price = ohlcv_frame['low_price'].to_numpy()
+            close_price = ohlcv_frame['close_price'].to_numpy()
+            
+            # Check price relationships
+            inconsistent = ~(
+                (low_price <= open_price) & (open_price <= high_price) &
+                (low_price <= close_price) & (close_price <= high_price)
+            )
+            # Check for zero or negative values
+            non_positive = (
+                (open_price <= 0) | (high_price <= 0) | (low_price <= 0) | (close_price <= 0)
+            )
+            price_issues = int(inconsistent.sum() + non_positive.sum())
+            volume_issues = int((ohlcv_frame['volume_usd'].to_numpy() < 0).sum())
             
             details['price_issues'] = price_issues
             details['volume_issues'] = volume_issues
@@ -256,7 +256,7 @@ class WorkflowValidator:
             
             # Calculate data quality score
             total_issues = price_issues + volume_issues
-            quality_score = max(0, 1 - (total_issues / len(ohlcv_records)))
+            quality_score = max(0, 1 - (total_issues / len(ohlcv_frame)))
             details['quality_score'] = quality_score
             
             # Check data continuity
@@ -389,10 +389,6 @@ class HistoryTableMigration:
                     WHERE signal_score IS NOT NULL
                     """,
                     """
-                    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enhanced_pools_history_time_series
-                    ON new_pools_history_enhanced (collection_interval, timestamp, pool_id)
-                    """,
-                    """
                     CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_feature_vectors_ml_ready
                     ON pool_feature_vectors (feature_set_version, timestamp, pool_id)
                     """
@@ -0,0 +1,75 @@
+"""Add indexed normalized symbol column and fuzzy search to pools
+
+Revision ID: 006_add_pool_symbol_normalized
+Revises: 005_add_pool_discovery_fields
+Create Date: 2025-09-20 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from gecko_terminal_collector.utils.pool_id_utils import PoolIDUtils
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add pools.symbol_normalized, backfill it and create search indexes."""
+    op.add_column('pools', sa.Column('symbol_normalized', sa.String(200), nullable=True))
+    op.create_index('idx_pools_symbol_normalized', 'pools', ['symbol_normalized'])
+
+    # Same rules as SymbolMapper.generate_symbol, lowercased
+    connection = op.get_bind()
+    pool_ids = connection.execute(sa.text("SELECT id FROM pools")).scalars().all()
+    if pool_ids:
+        connection.execute(
+            sa.text("UPDATE pools SET symbol_normalized = :symbol WHERE id = :id"),
+            [{'id': pool_id, 'symbol': PoolIDUtils.to_normalized_symbol(pool_id)} for pool_id in pool_ids]
+        )
+
+    if connection.dialect.name == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX IF NOT EXISTS idx_pools_symbol_normalized_trgm ON pools USING gin (symbol_normalized gin_trgm_ops)")
+        op.execute("CREATE INDEX IF NOT EXISTS idx_pools_name_trgm ON pools USING gin (name gin_trgm_ops)")
+    elif connection.dialect.name == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS pools_symbol_fts USING fts5("
+            "symbol_normalized, name, content='pools', content_rowid='rowid', tokenize='trigram')"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS pools_symbol_fts_ai AFTER INSERT ON pools BEGIN "
+            "INSERT INTO pools_symbol_fts(rowid, symbol_normalized, name) "
+            "VALUES (new.rowid, new.symbol_normalized, new.name); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS pools_symbol_fts_ad AFTER DELETE ON pools BEGIN "
+            "INSERT INTO pools_symbol_fts(pools_symbol_fts, rowid, symbol_normalized, name) "
+            "VALUES ('delete', old.rowid, old.symbol_normalized, old.name); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS pools_symbol_fts_au AFTER UPDATE OF symbol_normalized, name ON pools BEGIN "
+            "INSERT INTO pools_symbol_fts(pools_symbol_fts, rowid, symbol_normalized, name) "
+            "VALUES ('delete', old.rowid, old.symbol_normalized, old.name); "
+            "INSERT INTO pools_symbol_fts(rowid, symbol_normalized, name) "
+            "VALUES (new.rowid, new.symbol_normalized, new.name); END"
+        )
+        op.execute("INSERT INTO pools_symbol_fts(pools_symbol_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    """Remove pools.symbol_normalized and its search structures."""
+    connection = op.get_bind()
+    if connection.dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_pools_name_trgm")
+        op.execute("DROP INDEX IF EXISTS idx_pools_symbol_normalized_trgm")
+    elif connection.dialect.name == 'sqlite':
+        for trigger in ('pools_symbol_fts_ai', 'pools_symbol_fts_ad', 'pools_symbol_fts_au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS pools_symbol_fts")
+
+    op.drop_index('idx_pools_symbol_normalized', table_name='pools')
+    op.drop_column('pools', 'symbol_normalized')
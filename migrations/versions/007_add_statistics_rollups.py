@@ -0,0 +1,78 @@
+"""Add hourly statistics rollup tables and history time indexes
+
+Revision ID: 007_add_statistics_rollups
+Revises: 006_add_pool_symbol_normalized
+Create Date: 2025-09-27 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create rollup tables; StatisticsRollups.compact() backfills them on first run."""
+    op.create_table(
+        'new_pools_history_hourly',
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        sa.Column('network_id', sa.String(50), nullable=False),
+        sa.Column('dex_id', sa.String(100), nullable=False),
+        sa.Column('records', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('unique_pools', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reserve_in_usd_sum', sa.Numeric(30, 4)),
+        sa.Column('reserve_in_usd_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('volume_usd_h24_sum', sa.Numeric(30, 4)),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.current_timestamp()),
+        sa.PrimaryKeyConstraint('bucket_start', 'network_id', 'dex_id')
+    )
+
+    op.create_table(
+        'new_pools_history_totals',
+        sa.Column('network_id', sa.String(50), nullable=False),
+        sa.Column('dex_id', sa.String(100), nullable=False),
+        sa.Column('records', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.current_timestamp()),
+        sa.PrimaryKeyConstraint('network_id', 'dex_id')
+    )
+
+    op.create_table(
+        'execution_history_hourly',
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        sa.Column('collector_type', sa.String(50), nullable=False),
+        sa.Column('executions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('successful_executions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('failed_executions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('partial_executions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('timed_executions', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('execution_time_sum', sa.Numeric(20, 3)),
+        sa.Column('execution_time_min', sa.Numeric(10, 3)),
+        sa.Column('execution_time_max', sa.Numeric(10, 3)),
+        sa.Column('records_collected', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.current_timestamp()),
+        sa.PrimaryKeyConstraint('bucket_start', 'collector_type')
+    )
+
+    op.create_table(
+        'rollup_watermarks',
+        sa.Column('name', sa.String(50), nullable=False),
+        sa.Column('last_id', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.current_timestamp()),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+    # Touched hour buckets are recomputed from a time range of the source tables
+    op.execute("CREATE INDEX IF NOT EXISTS idx_new_pools_history_collected_at ON new_pools_history (collected_at)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_execution_history_start_time ON execution_history (start_time)")
+
+
+def downgrade():
+    """Drop rollup tables; the history time indexes are kept."""
+    op.drop_table('rollup_watermarks')
+    op.drop_table('execution_history_hourly')
+    op.drop_table('new_pools_history_totals')
+    op.drop_table('new_pools_history_hourly')
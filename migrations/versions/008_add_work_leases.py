@@ -0,0 +1,46 @@
+"""Add work lease and collector node tables for sharded collection
+
+Revision ID: 008_add_work_leases
+Revises: 007_add_statistics_rollups
+Create Date: 2025-09-28 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create work lease tables; WorkLeaseManager fills them as nodes start."""
+    op.create_table(
+        'work_leases',
+        sa.Column('unit_id', sa.String(150), nullable=False),
+        sa.Column('collector_key', sa.String(100), nullable=False),
+        sa.Column('shard', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('owner', sa.String(100)),
+        sa.Column('expires_at', sa.DateTime()),
+        sa.Column('acquired_at', sa.DateTime()),
+        sa.Column('heartbeat_at', sa.DateTime()),
+        sa.PrimaryKeyConstraint('unit_id')
+    )
+    op.create_index('idx_work_leases_owner', 'work_leases', ['owner'])
+
+    op.create_table(
+        'collector_nodes',
+        sa.Column('node_id', sa.String(100), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=False),
+        sa.Column('heartbeat_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('node_id')
+    )
+
+
+def downgrade():
+    """Drop work lease tables."""
+    op.drop_table('collector_nodes')
+    op.drop_index('idx_work_leases_owner', table_name='work_leases')
+    op.drop_table('work_leases')
@@ -0,0 +1,85 @@
+"""Tune indexes of the hot trade and enhanced history queries
+
+Revision ID: 009_tune_hot_query_indexes
+Revises: 008_add_work_leases
+Create Date: 2025-10-05 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+# (table, index, columns)
+CREATE_INDEXES = []
+# Indexes an earlier revision owns: created if missing, kept on downgrade
+ENSURE_INDEXES = [
+    # Trade windows per pool; owned by 001, but create_all databases never had it
+    ('trades', 'idx_trades_pool_timestamp', ['pool_id', 'block_timestamp']),
+]
+# (table, index, columns, dialect the index exists on or None for any)
+DROP_INDEXES = [
+    # index=True duplicates of the explicit PostgreSQL trade indexes
+    ('trades', 'ix_trades_pool_id', ['pool_id'], 'postgresql'),
+    ('trades', 'ix_trades_block_number', ['block_number'], 'postgresql'),
+    ('trades', 'ix_trades_tx_hash', ['tx_hash'], 'postgresql'),
+    ('trades', 'ix_trades_volume_usd', ['volume_usd'], 'postgresql'),
+    ('trades', 'ix_trades_block_timestamp', ['block_timestamp'], 'postgresql'),
+    # Leading columns of the unique constraint or of a composite index
+    ('new_pools_history_enhanced', 'ix_new_pools_history_enhanced_pool_id', ['pool_id'], None),
+    ('new_pools_history_enhanced', 'ix_new_pools_history_enhanced_timestamp', ['timestamp'], None),
+    ('new_pools_history_enhanced', 'ix_new_pools_history_enhanced_datetime', ['datetime'], None),
+    ('new_pools_history_enhanced', 'ix_new_pools_history_enhanced_network_id', ['network_id'], None),
+    ('new_pools_history_enhanced', 'ix_new_pools_history_enhanced_dex_id', ['dex_id'], None),
+    ('new_pools_history_enhanced', 'ix_new_pools_history_enhanced_signal_score', ['signal_score'], None),
+    ('new_pools_history_enhanced', 'idx_enhanced_pools_pool_timestamp', ['pool_id', 'timestamp'], None),
+    ('new_pools_history_enhanced', 'idx_enhanced_pools_qlib_symbol', ['qlib_symbol'], None),
+    ('new_pools_history_enhanced', 'idx_enhanced_pools_history_time_series', ['collection_interval', 'timestamp', 'pool_id'], None),
+    # Filter columns no query uses, maintained on every insert
+    ('new_pools_history_enhanced', 'idx_enhanced_pools_new_pools', ['is_new_pool', 'timestamp'], None),
+    ('new_pools_history_enhanced', 'idx_enhanced_pools_age', ['pool_age_hours'], None),
+    ('new_pools_history_enhanced', 'idx_enhanced_pools_quality', ['data_quality_score'], None),
+    ('new_pools_history_enhanced', 'idx_enhanced_pools_processed', ['processed_at'], None),
+]
+
+
+def _indexed_columns(table):
+    """Column lists of the indexes and unique constraints of a table, or None if it does not exist."""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    columns = {tuple(index['column_names']) for index in inspector.get_indexes(table)}
+    columns.update(tuple(constraint['column_names']) for constraint in inspector.get_unique_constraints(table))
+    return columns
+
+
+def _applies(dialect):
+    """Whether an entry limited to a backend applies to the one being migrated."""
+    return dialect is None or dialect == op.get_bind().dialect.name
+
+
+def upgrade():
+    """Create missing indexes under any name and drop redundant ones on both backends."""
+    for table, name, columns in CREATE_INDEXES + ENSURE_INDEXES:
+        existing = _indexed_columns(table)
+        if existing is not None and tuple(columns) not in existing:
+            op.create_index(name, table, columns)
+
+    for table, name, columns, dialect in DROP_INDEXES:
+        if _applies(dialect):
+            op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def downgrade():
+    """Restore dropped indexes on their backend and drop the ones only this revision creates."""
+    for table, name, columns, dialect in DROP_INDEXES:
+        if _applies(dialect) and _indexed_columns(table) is not None:
+            op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+
+    # Names no earlier revision uses, so an existing one was created by upgrade
+    for table, name, columns in CREATE_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
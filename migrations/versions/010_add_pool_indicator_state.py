@@ -0,0 +1,33 @@
+"""Add streaming indicator state table for enhanced new pools collection
+
+Revision ID: 010_add_pool_indicator_state
+Revises: 009_tune_hot_query_indexes
+Create Date: 2025-10-12 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create indicator state table; IndicatorEngine seeds rows on each pool's next observation."""
+    op.create_table(
+        'pool_indicator_state',
+        sa.Column('pool_id', sa.String(200), nullable=False),
+        sa.Column('last_timestamp', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('state_json', sa.JSON().with_variant(postgresql.JSONB(), 'postgresql'), nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.func.current_timestamp()),
+        sa.PrimaryKeyConstraint('pool_id')
+    )
+
+
+def downgrade():
+    """Drop indicator state table."""
+    op.drop_table('pool_indicator_state')
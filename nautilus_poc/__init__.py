@@ -7,8 +7,10 @@ signals with NautilusTrader and PumpSwap DEX execution.
 
 from .config import ConfigManager, NautilusPOCConfig
 from .signal_loader import Q50SignalLoader
+from .signal_store import SignalStore, convert_pickle_to_store, write_signal_store
 from .regime_detector import RegimeDetector
 from .pumpswap_executor import PumpSwapExecutor, TradeExecutionRecord
+from .pool_data_cache import PumpSwapPoolCache
 from .liquidity_validator import LiquidityValidator, LiquidityValidationResult, LiquidityStatus
 from .position_sizer import KellyPositionSizer, PositionSizeResult
 from .risk_manager import RiskManager, TradeValidationResult, CircuitBreakerStatus, PositionRisk, RiskLevel
@@ -20,9 +22,13 @@ __all__ = [
     "ConfigManager",
     "NautilusPOCConfig", 
     "Q50SignalLoader",
+    "SignalStore",
+    "convert_pickle_to_store",
+    "write_signal_store",
     "RegimeDetector",
     "PumpSwapExecutor",
     "TradeExecutionRecord",
+    "PumpSwapPoolCache",
     "LiquidityValidator",
     "LiquidityValidationResult",
     "LiquidityStatus",
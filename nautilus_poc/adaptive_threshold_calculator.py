@@ -9,16 +9,29 @@ with liquidity constraints.
 
 import logging
 import math
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Mapping, Sequence, Union
 from dataclasses import dataclass
 from enum import Enum
 import pandas as pd
 import numpy as np
 
 from .config import NautilusPOCConfig
+from .regime_detector import REGIME_ORDER
 
 logger = logging.getLogger(__name__)
 
+# Per-signal defaults for fields missing from a signal (NaN percentile: not available)
+SIGNAL_DEFAULTS = {
+    'q50': 0.0,
+    'prob_up': 0.5,
+    'vol_risk': 0.1,
+    'vol_risk_percentile': np.nan,
+    'regime_multiplier': 1.0,
+    'tradeable': False,
+    'high_quality': False,
+    'economically_significant': False
+}
+
 class ThresholdType(Enum):
     """Types of adaptive thresholds"""
     ECONOMIC_SIGNIFICANCE = "economic_significance"
@@ -119,67 +132,18 @@ class AdaptiveThresholdCalculator:
             EconomicSignificanceResult with detailed calculation
         """
         try:
-            self.calculation_count += 1
-            
-            # Extract signal components
-            q50_value = signal.get('q50', 0)
-            prob_up = signal.get('prob_up', 0.5)
-            vol_risk = signal.get('vol_risk', 0.1)
-            
-            # Calculate potential gains and losses
-            potential_gain = abs(q50_value)
-            potential_loss = abs(q50_value)
-            
-            # Calculate transaction costs
-            base_transaction_cost = self.realistic_transaction_cost
-            
-            # Add PumpSwap-specific costs
-            price_impact_cost = self._calculate_price_impact_cost(
-                pool_data, estimated_position_size
+            batch = self.calculate_economic_significance_batch(
+                self._signal_columns([signal]),
+                pool_liquidity_sol=[self._get_pool_liquidity(pool_data)],
+                position_size=estimated_position_size
             )
-            
-            # Additional costs for uncertain execution
-            if not pool_data:
-                uncertainty_cost = base_transaction_cost * 0.5  # 50% penalty for no data
-            else:
-                uncertainty_cost = 0.0
-            
-            total_transaction_costs = base_transaction_cost + uncertainty_cost
-            total_costs = total_transaction_costs + price_impact_cost
-            
-            # Calculate expected value
-            adjusted_gain = potential_gain - total_costs
-            adjusted_loss = potential_loss + total_costs
-            
-            expected_value = (prob_up * adjusted_gain) - ((1 - prob_up) * adjusted_loss)
-            net_expected_value = expected_value
-            
-            # Determine economic significance
-            is_economically_significant = net_expected_value > self.base_economic_threshold
-            significance_margin = net_expected_value - self.base_economic_threshold
-            
-            # Calculate break-even probability
-            if potential_gain + potential_loss > 0:
-                break_even_prob = (potential_loss + total_costs) / (potential_gain + potential_loss + 2 * total_costs)
-            else:
-                break_even_prob = 0.5
-            
             result = EconomicSignificanceResult(
-                expected_value=expected_value,
-                potential_gain=potential_gain,
-                potential_loss=potential_loss,
-                transaction_costs=total_transaction_costs,
-                price_impact_costs=price_impact_cost,
-                total_costs=total_costs,
-                net_expected_value=net_expected_value,
-                is_economically_significant=is_economically_significant,
-                significance_margin=significance_margin,
-                break_even_probability=break_even_prob
+                **{name: values.tolist()[0] for name, values in batch.items()}
             )
             
-            logger.debug(f"Economic significance: {is_economically_significant}, "
-                        f"expected_value: {net_expected_value:.6f}, "
-                        f"margin: {significance_margin:.6f}")
+            logger.debug(f"Economic significance: {result.is_economically_significant}, "
+                        f"expected_value: {result.net_expected_value:.6f}, "
+                        f"margin: {result.significance_margin:.6f}")
             
             return result
             
@@ -199,6 +163,65 @@ class AdaptiveThresholdCalculator:
                 break_even_probability=0.5
             )
     
+    def calculate_economic_significance_batch(self, signals: Mapping[str, Any],
+                                              pool_liquidity_sol: Optional[Sequence[float]] = None,
+                                              position_size: Union[float, Sequence[float]] = 0.1) -> Dict[str, np.ndarray]:
+        """
+        Calculate economic significance for many signals at once
+        
+        Args:
+            signals: Signal columns (DataFrame or dict of aligned arrays); missing
+                columns take the per-signal defaults
+            pool_liquidity_sol: Pool liquidity in SOL per signal (NaN: no pool data)
+            position_size: Estimated position size in SOL, scalar or per signal
+            
+        Returns:
+            Dictionary of per-signal arrays keyed like EconomicSignificanceResult
+        """
+        count = self._signal_count(signals)
+        self.calculation_count += count
+        q50 = self._signal_array(signals, 'q50', count)
+        prob_up = self._signal_array(signals, 'prob_up', count)
+        liquidity = self._liquidity_array(pool_liquidity_sol, count)
+        sizes = np.broadcast_to(np.asarray(position_size, dtype=np.float64), (count,))
+        
+        # Potential gains and losses
+        potential_gain = np.abs(q50)
+        potential_loss = np.abs(q50)
+        
+        # Transaction costs, with a 50% penalty for uncertain execution without pool data
+        price_impact_cost = self._price_impact_costs(liquidity, sizes)
+        uncertainty_cost = np.where(np.isnan(liquidity), self.realistic_transaction_cost * 0.5, 0.0)
+        total_transaction_costs = self.realistic_transaction_cost + uncertainty_cost
+        total_costs = total_transaction_costs + price_impact_cost
+        
+        # Expected value net of costs
+        adjusted_gain = potential_gain - total_costs
+        adjusted_loss = potential_loss + total_costs
+        expected_value = (prob_up * adjusted_gain) - ((1 - prob_up) * adjusted_loss)
+        
+        # Break-even probability
+        total_move = potential_gain + potential_loss
+        with np.errstate(divide='ignore', invalid='ignore'):
+            break_even_prob = np.where(
+                total_move > 0,
+                (potential_loss + total_costs) / (total_move + 2 * total_costs),
+                0.5
+            )
+        
+        return {
+            'expected_value': expected_value,
+            'potential_gain': potential_gain,
+            'potential_loss': potential_loss,
+            'transaction_costs': total_transaction_costs,
+            'price_impact_costs': price_impact_cost,
+            'total_costs': total_costs,
+            'net_expected_value': expected_value,
+            'is_economically_significant': expected_value > self.base_economic_threshold,
+            'significance_margin': expected_value - self.base_economic_threshold,
+            'break_even_probability': break_even_prob
+        }
+    
     def calculate_adaptive_threshold(self, signal: Dict[str, Any],
                                    pool_data: Optional[Dict[str, Any]] = None,
                                    threshold_type: ThresholdType = ThresholdType.ECONOMIC_SIGNIFICANCE,
@@ -216,40 +239,22 @@ class AdaptiveThresholdCalculator:
             ThresholdCalculationResult with detailed calculation
         """
         try:
-            # Get base threshold
-            base_threshold = self._get_base_threshold(threshold_type)
-            
-            # Calculate adjustment components
-            liquidity_adjustment = self._calculate_liquidity_adjustment(pool_data, estimated_position_size)
-            price_impact_adjustment = self._calculate_price_impact_adjustment(pool_data, estimated_position_size)
-            variance_adjustment = self._calculate_variance_adjustment(signal)
-            regime_adjustment = self._calculate_regime_adjustment(signal)
-            
-            # Combine adjustments
-            total_adjustment = (
-                liquidity_adjustment +
-                price_impact_adjustment +
-                variance_adjustment +
-                regime_adjustment
+            batch = self.calculate_adaptive_thresholds_batch(
+                self._signal_columns([signal]),
+                pool_liquidity_sol=[self._get_pool_liquidity(pool_data)],
+                threshold_type=threshold_type,
+                position_size=estimated_position_size
             )
+            values = {name: column.tolist()[0] for name, column in batch.items()}
             
-            # Calculate final threshold
-            final_threshold = base_threshold * (1 + total_adjustment)
-            final_threshold = max(final_threshold, base_threshold * 0.1)  # Minimum 10% of base
-            
-            # Check if signal meets threshold
-            signal_value = self._get_signal_value(signal, threshold_type)
-            is_above_threshold = signal_value > final_threshold
-            
-            # Create detailed result
             threshold_components = {
-                'base_threshold': base_threshold,
-                'liquidity_adjustment': liquidity_adjustment,
-                'price_impact_adjustment': price_impact_adjustment,
-                'variance_adjustment': variance_adjustment,
-                'regime_adjustment': regime_adjustment,
-                'total_adjustment': total_adjustment,
-                'signal_value': signal_value
+                'base_threshold': values['base_threshold'],
+                'liquidity_adjustment': values['liquidity_adjustment'],
+                'price_impact_adjustment': values['price_impact_adjustment'],
+                'variance_adjustment': values['variance_adjustment'],
+                'regime_adjustment': values['regime_adjustment'],
+                'total_adjustment': values['total_adjustment'],
+                'signal_value': values['signal_value']
             }
             
             calculation_details = {
@@ -259,26 +264,26 @@ class AdaptiveThresholdCalculator:
                 'adjustment_breakdown': {
                     'liquidity_factor': self._get_liquidity_factor(pool_data),
                     'price_impact_factor': self._get_price_impact_factor(pool_data, estimated_position_size),
-                    'variance_regime': self._classify_variance_regime(signal),
+                    'variance_regime': values['variance_regime'],
                     'regime_multiplier': signal.get('regime_multiplier', 1.0)
                 }
             }
             
             result = ThresholdCalculationResult(
                 threshold_type=threshold_type,
-                base_threshold=base_threshold,
-                liquidity_adjustment=liquidity_adjustment,
-                price_impact_adjustment=price_impact_adjustment,
-                variance_adjustment=variance_adjustment,
-                regime_adjustment=regime_adjustment,
-                final_threshold=final_threshold,
+                base_threshold=values['base_threshold'],
+                liquidity_adjustment=values['liquidity_adjustment'],
+                price_impact_adjustment=values['price_impact_adjustment'],
+                variance_adjustment=values['variance_adjustment'],
+                regime_adjustment=values['regime_adjustment'],
+                final_threshold=values['final_threshold'],
                 threshold_components=threshold_components,
                 calculation_details=calculation_details,
-                is_above_threshold=is_above_threshold
+                is_above_threshold=values['is_above_threshold']
             )
             
-            logger.debug(f"Adaptive threshold calculated: {final_threshold:.6f} "
-                        f"(base: {base_threshold:.6f}, adjustment: {total_adjustment:.3f})")
+            logger.debug(f"Adaptive threshold calculated: {result.final_threshold:.6f} "
+                        f"(base: {result.base_threshold:.6f}, adjustment: {values['total_adjustment']:.3f})")
             
             return result
             
@@ -299,6 +304,67 @@ class AdaptiveThresholdCalculator:
                 is_above_threshold=False
             )
     
+    def calculate_adaptive_thresholds_batch(self, signals: Mapping[str, Any],
+                                            pool_liquidity_sol: Optional[Sequence[float]] = None,
+                                            threshold_type: ThresholdType = ThresholdType.ECONOMIC_SIGNIFICANCE,
+                                            position_size: Union[float, Sequence[float]] = 0.1) -> Dict[str, np.ndarray]:
+        """
+        Calculate adaptive thresholds for many signals at once
+        
+        Args:
+            signals: Signal columns (DataFrame or dict of aligned arrays); missing
+                columns take the per-signal defaults
+            pool_liquidity_sol: Pool liquidity in SOL per signal (NaN: no pool data)
+            threshold_type: Type of threshold to calculate
+            position_size: Estimated position size in SOL, scalar or per signal
+            
+        Returns:
+            Dictionary of per-signal arrays: base_threshold, the four adjustments,
+            total_adjustment, final_threshold, signal_value, is_above_threshold
+            and variance_regime
+        """
+        count = self._signal_count(signals)
+        vol_risk = self._signal_array(signals, 'vol_risk', count)
+        liquidity = self._liquidity_array(pool_liquidity_sol, count)
+        sizes = np.broadcast_to(np.asarray(position_size, dtype=np.float64), (count,))
+        base_threshold = self._get_base_threshold(threshold_type)
+        
+        # Adjustment components
+        liquidity_adjustment = self._liquidity_adjustments(liquidity, sizes)
+        price_impact_adjustment = self._price_impact_adjustments(self._price_impact_costs(liquidity, sizes))
+        regime_index = self._variance_regime_indices(
+            vol_risk, self._signal_array(signals, 'vol_risk_percentile', count)
+        )
+        variance_adjustment = np.array(
+            [self.regime_threshold_adjustments.get(regime, 0.0) for regime in REGIME_ORDER]
+        )[regime_index]
+        regime_adjustment = self._regime_adjustments(self._signal_array(signals, 'regime_multiplier', count))
+        
+        # Combine adjustments, keeping at least 10% of the base threshold
+        total_adjustment = (
+            liquidity_adjustment +
+            price_impact_adjustment +
+            variance_adjustment +
+            regime_adjustment
+        )
+        final_threshold = base_threshold * (1 + total_adjustment)
+        final_threshold = np.where(base_threshold * 0.1 > final_threshold, base_threshold * 0.1, final_threshold)
+        
+        signal_value = self._signal_values(signals, threshold_type, count)
+        
+        return {
+            'base_threshold': np.full(count, base_threshold),
+            'liquidity_adjustment': liquidity_adjustment,
+            'price_impact_adjustment': price_impact_adjustment,
+            'variance_adjustment': variance_adjustment,
+            'regime_adjustment': regime_adjustment,
+            'total_adjustment': total_adjustment,
+            'final_threshold': final_threshold,
+            'signal_value': signal_value,
+            'is_above_threshold': signal_value > final_threshold,
+            'variance_regime': np.array(REGIME_ORDER, dtype=object)[regime_index]
+        }
+    
     def calculate_variance_based_thresholds(self, signals: List[Dict[str, Any]],
                                           pool_data_list: Optional[List[Dict[str, Any]]] = None) -> Dict[str, float]:
         """
@@ -315,9 +381,9 @@ class AdaptiveThresholdCalculator:
             if not signals:
                 return {}
             
-            # Extract variance data
-            vol_risks = [s.get('vol_risk', 0.1) for s in signals]
-            vol_risk_series = pd.Series(vol_risks)
+            columns = self._signal_columns(signals)
+            liquidity = self._pool_liquidity_list(pool_data_list, len(signals))
+            vol_risk_series = pd.Series(columns['vol_risk'])
             
             # Calculate percentiles
             percentiles = {
@@ -326,29 +392,30 @@ class AdaptiveThresholdCalculator:
                 'extreme': vol_risk_series.quantile(self.variance_percentiles['extreme'])
             }
             
-            # Calculate regime-specific thresholds
-            regime_thresholds = {}
-            
-            for i, signal in enumerate(signals):
-                vol_risk = signal.get('vol_risk', 0.1)
-                pool_data = pool_data_list[i] if pool_data_list and i < len(pool_data_list) else None
-                
-                # Classify regime
-                if vol_risk <= percentiles['low']:
-                    regime = 'low_variance'
-                elif vol_risk <= percentiles['high']:
-                    regime = 'medium_variance'
-                elif vol_risk <= percentiles['extreme']:
-                    regime = 'high_variance'
-                else:
-                    regime = 'extreme_variance'
-                
-                # Calculate threshold for this regime
-                if regime not in regime_thresholds:
-                    threshold_result = self.calculate_adaptive_threshold(
-                        signal, pool_data, ThresholdType.ECONOMIC_SIGNIFICANCE
-                    )
-                    regime_thresholds[regime] = threshold_result.final_threshold
+            # Classify every signal, then calculate each regime's threshold from
+            # its first signal
+            regime_index = np.select(
+                [
+                    columns['vol_risk'] <= percentiles['low'],
+                    columns['vol_risk'] <= percentiles['high'],
+                    columns['vol_risk'] <= percentiles['extreme']
+                ],
+                [0, 1, 2],
+                default=3
+            )
+            regimes, first_rows = np.unique(regime_index, return_index=True)
+            order = np.argsort(first_rows)
+            regimes, first_rows = regimes[order], first_rows[order]
+            
+            batch = self.calculate_adaptive_thresholds_batch(
+                {name: values[first_rows] for name, values in columns.items()},
+                pool_liquidity_sol=liquidity[first_rows],
+                threshold_type=ThresholdType.ECONOMIC_SIGNIFICANCE
+            )
+            regime_thresholds = {
+                REGIME_ORDER[regime]: threshold
+                for regime, threshold in zip(regimes.tolist(), batch['final_threshold'].tolist())
+            }
             
             # Add summary statistics
             regime_thresholds['percentiles'] = percentiles
@@ -379,60 +446,51 @@ class AdaptiveThresholdCalculator:
             if not signals:
                 return {'error': 'No signals provided'}
             
+            columns = self._signal_columns(signals)
+            
+            # Adaptive and traditional economic significance for every signal
+            adaptive = self.calculate_economic_significance_batch(
+                columns, pool_liquidity_sol=self._pool_liquidity_list(pool_data_list, len(signals))
+            )
+            adaptive_significant = adaptive['is_economically_significant']
+            traditional_values = self._traditional_expected_values(columns['q50'], columns['prob_up'])
+            traditional_significant = traditional_values > self.base_economic_threshold
+            agreement = adaptive_significant == traditional_significant
+            
+            total_signals = len(signals)
             results = {
-                'total_signals': len(signals),
-                'adaptive_significant': 0,
-                'traditional_significant': 0,
-                'agreement_count': 0,
-                'disagreement_count': 0,
-                'adaptive_only': 0,
-                'traditional_only': 0,
-                'threshold_comparisons': [],
+                'total_signals': total_signals,
+                'adaptive_significant': int(np.count_nonzero(adaptive_significant)),
+                'traditional_significant': int(np.count_nonzero(traditional_significant)),
+                'agreement_count': int(np.count_nonzero(agreement)),
+                'disagreement_count': int(np.count_nonzero(~agreement)),
+                'adaptive_only': int(np.count_nonzero(adaptive_significant & ~traditional_significant)),
+                'traditional_only': int(np.count_nonzero(traditional_significant & ~adaptive_significant)),
+                'threshold_comparisons': [
+                    {
+                        'signal_index': i,
+                        'adaptive_expected_value': adaptive_value,
+                        'traditional_expected_value': traditional_value,
+                        'adaptive_significant': adaptive_flag,
+                        'traditional_significant': traditional_flag,
+                        'agreement': adaptive_flag == traditional_flag,
+                        'price_impact_cost': impact_cost,
+                        'total_costs': total_cost
+                    }
+                    for i, (adaptive_value, traditional_value, adaptive_flag, traditional_flag, impact_cost, total_cost)
+                    in enumerate(zip(
+                        adaptive['net_expected_value'].tolist(),
+                        traditional_values.tolist(),
+                        adaptive_significant.tolist(),
+                        traditional_significant.tolist(),
+                        adaptive['price_impact_costs'].tolist(),
+                        adaptive['total_costs'].tolist()
+                    ))
+                ],
                 'performance_metrics': {}
             }
             
-            for i, signal in enumerate(signals):
-                pool_data = pool_data_list[i] if pool_data_list and i < len(pool_data_list) else None
-                
-                # Calculate adaptive economic significance
-                adaptive_result = self.calculate_economic_significance(signal, pool_data)
-                adaptive_significant = adaptive_result.is_economically_significant
-                
-                # Calculate traditional expected value
-                traditional_result = self._calculate_traditional_expected_value(signal)
-                traditional_significant = traditional_result > self.base_economic_threshold
-                
-                # Track results
-                if adaptive_significant:
-                    results['adaptive_significant'] += 1
-                if traditional_significant:
-                    results['traditional_significant'] += 1
-                
-                # Check agreement
-                if adaptive_significant == traditional_significant:
-                    results['agreement_count'] += 1
-                else:
-                    results['disagreement_count'] += 1
-                    if adaptive_significant and not traditional_significant:
-                        results['adaptive_only'] += 1
-                    elif traditional_significant and not adaptive_significant:
-                        results['traditional_only'] += 1
-                
-                # Store comparison details
-                comparison = {
-                    'signal_index': i,
-                    'adaptive_expected_value': adaptive_result.net_expected_value,
-                    'traditional_expected_value': traditional_result,
-                    'adaptive_significant': adaptive_significant,
-                    'traditional_significant': traditional_significant,
-                    'agreement': adaptive_significant == traditional_significant,
-                    'price_impact_cost': adaptive_result.price_impact_costs,
-                    'total_costs': adaptive_result.total_costs
-                }
-                results['threshold_comparisons'].append(comparison)
-            
             # Calculate performance metrics
-            total_signals = len(signals)
             results['performance_metrics'] = {
                 'agreement_rate': results['agreement_count'] / total_signals,
                 'adaptive_rate': results['adaptive_significant'] / total_signals,
@@ -464,124 +522,172 @@ class AdaptiveThresholdCalculator:
     
     def _get_signal_value(self, signal: Dict[str, Any], threshold_type: ThresholdType) -> float:
         """Get signal value for comparison with threshold"""
+        return self._signal_values(self._signal_columns([signal]), threshold_type, 1)[0].item()
+    
+    def _signal_values(self, signals: Mapping[str, Any], threshold_type: ThresholdType, count: int) -> np.ndarray:
+        """Get signal values for comparison with thresholds"""
         if threshold_type == ThresholdType.ECONOMIC_SIGNIFICANCE:
-            # Calculate expected value
-            economic_result = self.calculate_economic_significance(signal)
-            return economic_result.net_expected_value
+            # Expected value without pool data
+            return self.calculate_economic_significance_batch(signals)['net_expected_value']
         elif threshold_type == ThresholdType.SIGNAL_STRENGTH:
-            return abs(signal.get('q50', 0))
+            return np.abs(self._signal_array(signals, 'q50', count))
         elif threshold_type == ThresholdType.EXECUTION_FEASIBILITY:
             # Composite feasibility score
-            tradeable = 1.0 if signal.get('tradeable', False) else 0.0
-            high_quality = 1.0 if signal.get('high_quality', False) else 0.0
-            economic_sig = 1.0 if signal.get('economically_significant', False) else 0.0
-            return (tradeable + high_quality + economic_sig) / 3.0
+            tradeable = self._signal_array(signals, 'tradeable', count).astype(bool)
+            high_quality = self._signal_array(signals, 'high_quality', count).astype(bool)
+            economic_sig = self._signal_array(signals, 'economically_significant', count).astype(bool)
+            return (tradeable * 1.0 + high_quality * 1.0 + economic_sig * 1.0) / 3.0
         elif threshold_type == ThresholdType.RISK_ADJUSTED:
-            q50_value = abs(signal.get('q50', 0))
-            vol_risk = signal.get('vol_risk', 0.1)
-            return q50_value / max(vol_risk, 0.01)  # Risk-adjusted return
+            q50_value = np.abs(self._signal_array(signals, 'q50', count))
+            vol_risk = self._signal_array(signals, 'vol_risk', count)
+            return q50_value / np.where(0.01 > vol_risk, 0.01, vol_risk)  # Risk-adjusted return
         else:
-            return 0.0
+            return np.zeros(count)
+    
+    @staticmethod
+    def _signal_count(signals: Mapping[str, Any]) -> int:
+        """Number of signals in a DataFrame or dict of columns"""
+        if isinstance(signals, pd.DataFrame):
+            return len(signals)
+        return len(next(iter(signals.values()))) if signals else 0
+    
+    @staticmethod
+    def _signal_array(signals: Mapping[str, Any], name: str, count: int) -> np.ndarray:
+        """Get one signal column as a float array, or its default if the column is missing"""
+        if name in signals:
+            return np.asarray(signals[name], dtype=np.float64)
+        return np.full(count, SIGNAL_DEFAULTS[name], dtype=np.float64)
+    
+    @staticmethod
+    def _signal_columns(signals: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Convert signal dicts to columns, filling missing keys with their defaults"""
+        return {
+            name: np.array([signal.get(name, default) for signal in signals], dtype=np.float64)
+            for name, default in SIGNAL_DEFAULTS.items()
+        }
+    
+    @staticmethod
+    def _liquidity_array(pool_liquidity_sol: Optional[Sequence[float]], count: int) -> np.ndarray:
+        """Pool liquidity per signal, NaN where there is no pool data"""
+        if pool_liquidity_sol is None:
+            return np.full(count, np.nan)
+        return np.asarray(pool_liquidity_sol, dtype=np.float64)
+    
+    @staticmethod
+    def _get_pool_liquidity(pool_data: Optional[Dict[str, Any]]) -> float:
+        """Pool liquidity in SOL, falling back to a rough USD conversion (NaN without pool data)"""
+        if not pool_data:
+            return np.nan
+        pool_liquidity = pool_data.get('reserve_sol', 0)
+        if pool_liquidity <= 0:
+            pool_liquidity = pool_data.get('reserve_in_usd', 0) / 100  # Rough SOL conversion
+        return float(pool_liquidity)
+    
+    def _pool_liquidity_list(self, pool_data_list: Optional[List[Dict[str, Any]]], count: int) -> np.ndarray:
+        """Pool liquidity for each signal position in a pool data list"""
+        pool_data_list = pool_data_list or []
+        return np.array(
+            [self._get_pool_liquidity(pool_data_list[i] if i < len(pool_data_list) else None) for i in range(count)],
+            dtype=np.float64
+        )
     
     def _calculate_price_impact_cost(self, pool_data: Optional[Dict[str, Any]], 
                                    position_size: float) -> float:
         """Calculate price impact cost for position size"""
         try:
-            if not pool_data or position_size <= 0:
-                return self.realistic_transaction_cost  # Default cost
-            
-            # Extract pool liquidity
-            pool_liquidity = pool_data.get('reserve_sol', 0)
-            if pool_liquidity <= 0:
-                # Try USD conversion
-                pool_liquidity_usd = pool_data.get('reserve_in_usd', 0)
-                pool_liquidity = pool_liquidity_usd / 100  # Rough SOL conversion
-            
-            if pool_liquidity <= 0:
-                return self.realistic_transaction_cost * 2  # Higher cost for unknown liquidity
+            return self._price_impact_costs(
+                np.array([self._get_pool_liquidity(pool_data)]), np.array([position_size], dtype=np.float64)
+            )[0].item()
             
-            # Calculate price impact using constant product formula
-            impact_ratio = position_size / (pool_liquidity + position_size)
+        except Exception as e:
+            logger.error(f"Error calculating price impact cost: {e}")
+            return self.realistic_transaction_cost * 2  # Conservative fallback
+    
+    def _price_impact_costs(self, liquidity: np.ndarray, position_sizes: np.ndarray) -> np.ndarray:
+        """Price impact costs for position sizes against pool liquidity"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Price impact using constant product formula
+            impact_ratio = position_sizes / (liquidity + position_sizes)
             price_impact_percent = impact_ratio * 100
             
             # Apply impact curve (quadratic for larger trades)
-            if price_impact_percent > 5:
-                price_impact_percent *= (1 + (price_impact_percent - 5) * 0.1)
-            
-            # Convert to cost (percentage of position)
-            price_impact_cost = min(price_impact_percent / 100, 0.2)  # Cap at 20%
-            
-            return price_impact_cost
+            price_impact_percent = np.where(
+                price_impact_percent > 5,
+                price_impact_percent * (1 + (price_impact_percent - 5) * 0.1),
+                price_impact_percent
+            )
             
-        except Exception as e:
-            logger.error(f"Error calculating price impact cost: {e}")
-            return self.realistic_transaction_cost * 2  # Conservative fallback
+            # Convert to cost (percentage of position), capped at 20%
+            price_impact_cost = price_impact_percent / 100
+            price_impact_cost = np.where(0.2 < price_impact_cost, 0.2, price_impact_cost)
+        
+        # Default cost without pool data, higher cost for unknown liquidity
+        price_impact_cost = np.where(liquidity <= 0, self.realistic_transaction_cost * 2, price_impact_cost)
+        return np.where(np.isnan(liquidity) | (position_sizes <= 0), self.realistic_transaction_cost, price_impact_cost)
     
     def _calculate_liquidity_adjustment(self, pool_data: Optional[Dict[str, Any]], 
                                       position_size: float) -> float:
         """Calculate liquidity-based threshold adjustment"""
         try:
-            if not pool_data:
-                return 0.5  # 50% penalty for no liquidity data
-            
-            pool_liquidity = pool_data.get('reserve_sol', 0)
-            if pool_liquidity <= 0:
-                pool_liquidity_usd = pool_data.get('reserve_in_usd', 0)
-                pool_liquidity = pool_liquidity_usd / 100
-            
-            if pool_liquidity <= 0:
-                return 0.5  # 50% penalty for unknown liquidity
-            
-            # Calculate liquidity factor
-            if pool_liquidity >= self.optimal_liquidity_threshold:
-                liquidity_factor = -0.2  # 20% bonus for excellent liquidity
-            elif pool_liquidity >= self.min_liquidity_threshold * 2:
-                liquidity_factor = -0.1  # 10% bonus for good liquidity
-            elif pool_liquidity >= self.min_liquidity_threshold:
-                liquidity_factor = 0.0  # No adjustment for minimum liquidity
-            else:
-                # Penalty for insufficient liquidity
-                deficit_ratio = (self.min_liquidity_threshold - pool_liquidity) / self.min_liquidity_threshold
-                liquidity_factor = deficit_ratio * 0.5  # Up to 50% penalty
-            
-            # Adjust based on position size relative to liquidity
-            position_ratio = position_size / pool_liquidity
-            if position_ratio > 0.25:  # More than 25% of pool
-                liquidity_factor += position_ratio * 0.5  # Additional penalty
-            
-            return liquidity_factor * self.liquidity_impact_weight
+            return self._liquidity_adjustments(
+                np.array([self._get_pool_liquidity(pool_data)]), np.array([position_size], dtype=np.float64)
+            )[0].item()
             
         except Exception as e:
             logger.error(f"Error calculating liquidity adjustment: {e}")
             return 0.3  # Conservative penalty
     
+    def _liquidity_adjustments(self, liquidity: np.ndarray, position_sizes: np.ndarray) -> np.ndarray:
+        """Liquidity-based threshold adjustments"""
+        min_liquidity = self.min_liquidity_threshold
+        with np.errstate(divide='ignore', invalid='ignore'):
+            liquidity_factor = np.select(
+                [
+                    liquidity >= self.optimal_liquidity_threshold,  # 20% bonus for excellent liquidity
+                    liquidity >= min_liquidity * 2,  # 10% bonus for good liquidity
+                    liquidity >= min_liquidity  # No adjustment for minimum liquidity
+                ],
+                [-0.2, -0.1, 0.0],
+                # Up to 50% penalty for insufficient liquidity
+                default=((min_liquidity - liquidity) / min_liquidity) * 0.5
+            )
+            
+            # Additional penalty for positions above 25% of the pool
+            position_ratio = position_sizes / liquidity
+            liquidity_factor = np.where(
+                position_ratio > 0.25, liquidity_factor + position_ratio * 0.5, liquidity_factor
+            )
+        
+        # 50% penalty for missing or unknown liquidity
+        return np.where(np.isnan(liquidity) | (liquidity <= 0), 0.5, liquidity_factor * self.liquidity_impact_weight)
+    
     def _calculate_price_impact_adjustment(self, pool_data: Optional[Dict[str, Any]], 
                                          position_size: float) -> float:
         """Calculate price impact-based threshold adjustment"""
         try:
             price_impact_cost = self._calculate_price_impact_cost(pool_data, position_size)
-            
-            # Convert cost to threshold adjustment
-            if price_impact_cost <= 0.01:  # Less than 1% impact
-                return -0.1  # 10% bonus for low impact
-            elif price_impact_cost <= 0.05:  # Less than 5% impact
-                return 0.0  # No adjustment
-            elif price_impact_cost <= 0.1:  # Less than 10% impact
-                return 0.2  # 20% penalty
-            else:
-                # High impact penalty
-                excess_impact = price_impact_cost - 0.1
-                return 0.2 + (excess_impact * self.price_impact_penalty_factor)
+            return self._price_impact_adjustments(np.array([price_impact_cost]))[0].item()
             
         except Exception as e:
             logger.error(f"Error calculating price impact adjustment: {e}")
             return 0.2  # Conservative penalty
     
+    def _price_impact_adjustments(self, price_impact_costs: np.ndarray) -> np.ndarray:
+        """Threshold adjustments for price impact costs"""
+        return np.select(
+            [
+                price_impact_costs <= 0.01,  # 10% bonus below 1% impact
+                price_impact_costs <= 0.05,  # No adjustment below 5% impact
+                price_impact_costs <= 0.1  # 20% penalty below 10% impact
+            ],
+            [-0.1, 0.0, 0.2],
+            # High impact penalty
+            default=0.2 + ((price_impact_costs - 0.1) * self.price_impact_penalty_factor)
+        )
+    
     def _calculate_variance_adjustment(self, signal: Dict[str, Any]) -> float:
         """Calculate variance-based threshold adjustment"""
         try:
-            vol_risk = signal.get('vol_risk', 0.1)
-            
             # Classify variance regime (using signal-specific percentiles if available)
             regime = self._classify_variance_regime(signal)
             
@@ -596,55 +702,61 @@ class AdaptiveThresholdCalculator:
         """Calculate regime-based threshold adjustment"""
         try:
             regime_multiplier = signal.get('regime_multiplier', 1.0)
-            
-            # Convert multiplier to threshold adjustment
-            # Higher multiplier means easier threshold (negative adjustment)
-            if regime_multiplier > 1.2:
-                return -0.1  # 10% easier threshold
-            elif regime_multiplier > 1.0:
-                return -0.05  # 5% easier threshold
-            elif regime_multiplier < 0.8:
-                return 0.2  # 20% harder threshold
-            elif regime_multiplier < 1.0:
-                return 0.1  # 10% harder threshold
-            else:
-                return 0.0  # No adjustment
+            return self._regime_adjustments(np.array([regime_multiplier], dtype=np.float64))[0].item()
             
         except Exception as e:
             logger.error(f"Error calculating regime adjustment: {e}")
             return 0.0
     
+    @staticmethod
+    def _regime_adjustments(regime_multipliers: np.ndarray) -> np.ndarray:
+        """Threshold adjustments for regime multipliers"""
+        # Higher multiplier means easier threshold (negative adjustment)
+        return np.select(
+            [
+                regime_multipliers > 1.2,  # 10% easier threshold
+                regime_multipliers > 1.0,  # 5% easier threshold
+                regime_multipliers < 0.8,  # 20% harder threshold
+                regime_multipliers < 1.0  # 10% harder threshold
+            ],
+            [-0.1, -0.05, 0.2, 0.1],
+            default=0.0
+        )
+    
     def _classify_variance_regime(self, signal: Dict[str, Any]) -> str:
         """Classify variance regime for signal"""
         try:
             vol_risk = signal.get('vol_risk', 0.1)
-            
-            # Use global percentiles or signal-specific if available
-            if 'vol_risk_percentile' in signal:
-                percentile = signal['vol_risk_percentile']
-                if percentile <= 0.30:
-                    return 'low_variance'
-                elif percentile <= 0.70:
-                    return 'medium_variance'
-                elif percentile <= 0.90:
-                    return 'high_variance'
-                else:
-                    return 'extreme_variance'
-            else:
-                # Use absolute thresholds as fallback
-                if vol_risk <= 0.05:
-                    return 'low_variance'
-                elif vol_risk <= 0.15:
-                    return 'medium_variance'
-                elif vol_risk <= 0.30:
-                    return 'high_variance'
-                else:
-                    return 'extreme_variance'
+            percentile = signal.get('vol_risk_percentile', np.nan)
+            regime_index = self._variance_regime_indices(
+                np.array([vol_risk], dtype=np.float64), np.array([percentile], dtype=np.float64)
+            )
+            return REGIME_ORDER[regime_index[0]]
                     
         except Exception as e:
             logger.error(f"Error classifying variance regime: {e}")
             return 'medium_variance'
     
+    @staticmethod
+    def _variance_regime_indices(vol_risk: np.ndarray, vol_risk_percentile: np.ndarray) -> np.ndarray:
+        """
+        Variance regime per signal as an index into REGIME_ORDER
+        
+        Uses the signal's vol_risk percentile where available (not NaN), and
+        absolute vol_risk thresholds as fallback.
+        """
+        by_percentile = np.select(
+            [vol_risk_percentile <= 0.30, vol_risk_percentile <= 0.70, vol_risk_percentile <= 0.90],
+            [0, 1, 2],
+            default=3
+        )
+        by_vol_risk = np.select(
+            [vol_risk <= 0.05, vol_risk <= 0.15, vol_risk <= 0.30],
+            [0, 1, 2],
+            default=3
+        )
+        return np.where(np.isnan(vol_risk_percentile), by_vol_risk, by_percentile)
+    
     def _get_liquidity_factor(self, pool_data: Optional[Dict[str, Any]]) -> str:
         """Get liquidity factor classification"""
         if not pool_data:
@@ -681,19 +793,20 @@ class AdaptiveThresholdCalculator:
     def _calculate_traditional_expected_value(self, signal: Dict[str, Any]) -> float:
         """Calculate traditional expected value for comparison"""
         try:
-            q50_value = signal.get('q50', 0)
-            prob_up = signal.get('prob_up', 0.5)
-            
-            potential_gain = abs(q50_value) - self.realistic_transaction_cost
-            potential_loss = abs(q50_value) + self.realistic_transaction_cost
-            
-            expected_value = (prob_up * potential_gain) - ((1 - prob_up) * potential_loss)
-            return expected_value
+            q50_value = np.array([signal.get('q50', 0)], dtype=np.float64)
+            prob_up = np.array([signal.get('prob_up', 0.5)], dtype=np.float64)
+            return self._traditional_expected_values(q50_value, prob_up)[0].item()
             
         except Exception as e:
             logger.error(f"Error calculating traditional expected value: {e}")
             return 0.0
     
+    def _traditional_expected_values(self, q50: np.ndarray, prob_up: np.ndarray) -> np.ndarray:
+        """Traditional expected values with flat transaction costs"""
+        potential_gain = np.abs(q50) - self.realistic_transaction_cost
+        potential_loss = np.abs(q50) + self.realistic_transaction_cost
+        return (prob_up * potential_gain) - ((1 - prob_up) * potential_loss)
+    
     def get_calculation_summary(self) -> Dict[str, Any]:
         """Get summary of threshold calculations"""
         return {
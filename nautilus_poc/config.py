@@ -29,6 +29,9 @@ class Q50Config:
     required_columns: List[str]
     backup_features_path: str = ""
     signal_cache_ttl_minutes: int = 60
+    signal_cache_size: int = 1024
+    signal_store_path: str = ""
+    signal_reload_interval_seconds: int = 60
 
 @dataclass
 class WalletConfig:
@@ -203,7 +206,10 @@ class ConfigManager:
             signal_tolerance_minutes=nautilus_data.get('q50', {}).get('signal_tolerance_minutes', 5),
             required_columns=nautilus_data.get('q50', {}).get('required_columns', []),
             backup_features_path=nautilus_data.get('q50', {}).get('backup_features_path', ''),
-            signal_cache_ttl_minutes=nautilus_data.get('q50', {}).get('signal_cache_ttl_minutes', 60)
+            signal_cache_ttl_minutes=nautilus_data.get('q50', {}).get('signal_cache_ttl_minutes', 60),
+            signal_cache_size=nautilus_data.get('q50', {}).get('signal_cache_size', 1024),
+            signal_store_path=nautilus_data.get('q50', {}).get('signal_store_path', ''),
+            signal_reload_interval_seconds=nautilus_data.get('q50', {}).get('signal_reload_interval_seconds', 60)
         )
         
         wallet_config = WalletConfig(
@@ -305,6 +311,7 @@ class ConfigManager:
             # Q50 configuration
             'NAUTILUS_Q50_FEATURES_PATH': ['q50', 'features_path'],
             'NAUTILUS_Q50_BACKUP_PATH': ['q50', 'backup_features_path'],
+            'NAUTILUS_Q50_SIGNAL_STORE_PATH': ['q50', 'signal_store_path'],
             'NAUTILUS_Q50_SIGNAL_TOLERANCE': ['q50', 'signal_tolerance_minutes'],
         }
         
@@ -0,0 +1,299 @@
+"""
+Shared database access for NautilusTrader POC components.
+
+This module provides one engine, session factory and write-behind journal per
+database URL, shared by PositionManager and TradeExecutionRecorder, so the
+components reuse a single connection pool, create tables once and never block
+the strategy's event loop on a commit.
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+logger = logging.getLogger(__name__)
+
+JournalOperation = Callable[[Session], Any]
+
+# Session.info key for callbacks to run once an operation's batch has committed
+AFTER_COMMIT_KEY = 'write_behind_after_commit'
+
+
+def after_commit(session: Session, callback: Callable[[], Any]) -> None:
+    """
+    Run a callback once the journal batch containing this session commits.
+
+    Callbacks of a batch that fails are discarded with it; the operations are
+    then retried individually and register their callbacks again.
+
+    Args:
+        session: Session passed to a journal operation
+        callback: Callable run on the journal's worker thread after commit
+    """
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+
+def database_url_from_config(config: Dict[str, Any]) -> str:
+    """
+    Build the database URL from a component configuration dictionary.
+
+    Args:
+        config: Configuration dictionary containing database settings
+
+    Returns:
+        SQLAlchemy database URL
+    """
+    db_config = config.get('database', {})
+    if db_config.get('type') == 'postgresql':
+        return f"postgresql://{db_config.get('user')}:{db_config.get('password')}@{db_config.get('host')}:{db_config.get('port')}/{db_config.get('database')}"
+
+    # Default to SQLite
+    db_path = db_config.get('path', 'nautilus_positions.db')
+    return f"sqlite:///{db_path}"
+
+
+class WriteBehindJournal:
+    """
+    Ordered queue of database writes applied off the event loop.
+
+    Operations are callables taking a Session. They are applied in submission
+    order, in batches of up to ``max_batch_size`` per transaction, on a worker
+    thread. If a batch fails, its operations are retried one per transaction
+    so a single bad write cannot discard the others. Side effects that must
+    only happen once a write is durable are registered with after_commit().
+
+    Outside a running event loop (scripts, synchronous tests) operations are
+    applied immediately.
+    """
+
+    def __init__(self, session_factory: sessionmaker, max_batch_size: int = 500):
+        """
+        Initialize the journal.
+
+        Args:
+            session_factory: Session factory bound to the target engine
+            max_batch_size: Maximum operations committed per transaction
+        """
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size
+
+        self._pending: Deque[JournalOperation] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._progress: Optional[asyncio.Condition] = None
+        self._submitted = 0
+        self._completed = 0
+
+        # Journal statistics
+        self.batches_committed = 0
+        self.operations_applied = 0
+        self.operations_failed = 0
+
+    @property
+    def pending_count(self) -> int:
+        """Operations submitted but not yet applied."""
+        return self._submitted - self._completed
+
+    def submit(self, operation: JournalOperation) -> None:
+        """
+        Queue a write without waiting for it.
+
+        Args:
+            operation: Callable applying the write to a Session
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._apply_batch([operation])
+            return
+
+        self._ensure_worker(loop)
+        self._pending.append(operation)
+        self._submitted += 1
+        self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Wait until every operation submitted so far has been applied."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Writes left behind by a previous event loop are applied inline
+            if self._pending:
+                self._ensure_worker(loop)
+            return
+        target = self._submitted
+        async with self._progress:
+            await self._progress.wait_for(lambda: self._completed >= target)
+
+    async def close(self) -> None:
+        """Flush pending writes and stop the worker."""
+        await self.flush()
+        if self._worker is not None and self._loop is asyncio.get_running_loop():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+        self._loop = None
+
+    def drain(self) -> None:
+        """Apply queued writes synchronously (used at interpreter exit)."""
+        if self._pending:
+            leftovers = list(self._pending)
+            self._pending.clear()
+            self._apply_batch(leftovers)
+            self._completed += len(leftovers)
+
+    def _ensure_worker(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._loop is loop and self._worker is not None and not self._worker.done():
+            return
+
+        # A previous loop went away before its writes were applied; apply them now
+        self.drain()
+        self._completed = self._submitted
+
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._progress = asyncio.Condition()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._pending:
+                batch = [self._pending.popleft() for _ in range(min(self.max_batch_size, len(self._pending)))]
+                await asyncio.to_thread(self._apply_batch, batch)
+                async with self._progress:
+                    self._completed += len(batch)
+                    self._progress.notify_all()
+
+    def _apply_batch(self, batch: List[JournalOperation]) -> None:
+        try:
+            with self.session_factory() as session:
+                for operation in batch:
+                    operation(session)
+                    # Later operations in the batch may query rows added by earlier ones
+                    session.flush()
+                session.commit()
+                callbacks = session.info.get(AFTER_COMMIT_KEY, [])
+            self.batches_committed += 1
+            self.operations_applied += len(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                self.operations_failed += 1
+                logger.error(f"Write-behind operation failed: {e}")
+                return
+            logger.warning(f"Write-behind batch of {len(batch)} failed, retrying individually: {e}")
+        else:
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"Write-behind after-commit callback failed: {e}")
+            return
+
+        for operation in batch:
+            self._apply_batch([operation])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get journal statistics."""
+        return {
+            'pending': self.pending_count,
+            'batches_committed': self.batches_committed,
+            'operations_applied': self.operations_applied,
+            'operations_failed': self.operations_failed
+        }
+
+
+@dataclass
+class SharedDatabase:
+    """Engine, session factory and journal shared by all users of one URL."""
+    url: str
+    engine: Engine
+    session_factory: sessionmaker
+    journal: WriteBehindJournal
+    users: int = 0
+    initialized_metadata: set = field(default_factory=set)
+
+    def ensure_tables(self, metadata) -> None:
+        """Create the tables of a metadata collection once per database."""
+        if id(metadata) not in self.initialized_metadata:
+            metadata.create_all(bind=self.engine)
+            self.initialized_metadata.add(id(metadata))
+
+
+_databases: Dict[str, SharedDatabase] = {}
+_databases_lock = threading.Lock()
+
+
+@atexit.register
+def _drain_journals_at_exit() -> None:
+    # Writes queued by components that were never closed would otherwise be lost
+    for database in list(_databases.values()):
+        database.journal.drain()
+
+
+def acquire_database(config: Dict[str, Any]) -> SharedDatabase:
+    """
+    Get the shared database for a configuration, creating it on first use.
+
+    Every call must be paired with release_database().
+
+    Args:
+        config: Configuration dictionary containing database settings
+
+    Returns:
+        SharedDatabase for the configured URL
+    """
+    url = database_url_from_config(config)
+    with _databases_lock:
+        database = _databases.get(url)
+        if database is None:
+            engine_kwargs: Dict[str, Any] = {'echo': False}
+            if url.startswith('sqlite'):
+                # Writes run on the journal's worker thread
+                engine_kwargs['connect_args'] = {'check_same_thread': False}
+                if url in ('sqlite://', 'sqlite:///:memory:'):
+                    engine_kwargs['poolclass'] = StaticPool
+            engine = create_engine(url, **engine_kwargs)
+            session_factory = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+            database = SharedDatabase(
+                url=url,
+                engine=engine,
+                session_factory=session_factory,
+                journal=WriteBehindJournal(session_factory)
+            )
+            _databases[url] = database
+            logger.info(f"Created shared database engine: {url}")
+        database.users += 1
+        return database
+
+
+async def release_database(database: SharedDatabase) -> None:
+    """
+    Release a shared database, flushing its journal and disposing the engine
+    once the last user has released it.
+
+    Args:
+        database: Database returned by acquire_database()
+    """
+    await database.journal.flush()
+    with _databases_lock:
+        database.users -= 1
+        if database.users > 0:
+            return
+        _databases.pop(database.url, None)
+    await database.journal.close()
+    database.engine.dispose()
+    logger.info(f"Disposed shared database engine: {database.url}")
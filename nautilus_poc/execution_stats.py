@@ -0,0 +1,393 @@
+"""
+Incremental execution statistics for TradeExecutionRecorder.
+
+This module provides running aggregates of trade execution performance
+(counts per status, Welford mean/variance of latency, slippage, gas and P&L,
+and a latency quantile sketch) kept overall, per regime and per day, so the
+monitoring loop can poll execution statistics without scanning the trade
+table. Aggregates support removal, so a trade whose status or metrics change
+is moved between buckets by subtracting its old contribution and adding the
+new one.
+"""
+
+import math
+import threading
+from datetime import date, datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# Quantiles reported for execution latency
+LATENCY_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class TradeContribution(NamedTuple):
+    """The part of one trade record that feeds the execution statistics"""
+    day: date
+    regime: str
+    status: str
+    latency_ms: Optional[float]
+    slippage_percent: Optional[float]
+    gas_used: Optional[float]
+    pnl_sol: Optional[float]
+
+    @classmethod
+    def from_record(cls, record: Any) -> "TradeContribution":
+        """
+        Build a contribution from a TradeExecutionModel (or any object with
+        the same attribute names)
+        """
+        return cls(
+            day=record.timestamp.date(),
+            regime=record.regime_at_execution or 'unknown',
+            status=record.execution_status or 'unknown',
+            latency_ms=_optional_float(record.execution_latency_ms),
+            slippage_percent=_optional_float(record.slippage_percent),
+            gas_used=_optional_float(record.gas_used),
+            pnl_sol=_optional_float(record.pnl_sol)
+        )
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+class RunningMoments:
+    """
+    Count, sum, mean and variance of a stream using Welford's algorithm.
+
+    Values can be removed again (reverse Welford update) and partial
+    aggregates merged (Chan et al. parallel update).
+    """
+
+    __slots__ = ('count', 'total', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    @classmethod
+    def from_sums(cls, count: int, total: float, sum_squares: float) -> "RunningMoments":
+        """Build moments from SQL aggregates COUNT(x), SUM(x) and SUM(x * x)"""
+        moments = cls()
+        if count:
+            moments.count = int(count)
+            moments.total = float(total)
+            moments.mean = moments.total / moments.count
+            moments.m2 = max(float(sum_squares) - moments.total * moments.mean, 0.0)
+        return moments
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float) -> None:
+        if self.count <= 1:
+            self.__init__()
+            return
+        old_mean = self.mean
+        self.count -= 1
+        self.total -= value
+        self.mean = (old_mean * (self.count + 1) - value) / self.count
+        self.m2 = max(self.m2 - (value - old_mean) * (value - self.mean), 0.0)
+
+    def merge(self, other: "RunningMoments") -> None:
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.total, self.mean, self.m2 = other.count, other.total, other.mean, other.m2
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+
+    @property
+    def variance(self) -> float:
+        """Population variance"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class LatencySketch:
+    """
+    Log-bucketed quantile sketch with bounded relative error.
+
+    Each positive value is counted in bucket ``ceil(log_gamma(value))``; a
+    quantile is reported as the bucket's midpoint, which is within
+    ``relative_accuracy`` of the true value. Buckets are plain counters, so
+    values can be removed and sketches merged exactly.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _key(self, value: float) -> Optional[int]:
+        return math.ceil(math.log(value) / self._log_gamma) if value > 0 else None
+
+    def add(self, value: float, count: int = 1) -> None:
+        key = self._key(value)
+        if key is None:
+            self.zero_count += count
+        else:
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.count += count
+
+    def remove(self, value: float, count: int = 1) -> None:
+        key = self._key(value)
+        if key is None:
+            self.zero_count = max(self.zero_count - count, 0)
+        else:
+            remaining = self.buckets.get(key, 0) - count
+            if remaining > 0:
+                self.buckets[key] = remaining
+            else:
+                self.buckets.pop(key, None)
+        self.count = max(self.count - count, 0)
+
+    def merge(self, other: "LatencySketch") -> None:
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Approximate quantile of the sketched values
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Approximate value, or None when the sketch is empty
+        """
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class ExecutionStatsAggregate:
+    """Running execution statistics for one group of trades"""
+
+    METRICS = ('latency_ms', 'slippage_percent', 'gas_used', 'pnl_sol')
+
+    def __init__(self):
+        self.total_trades = 0
+        self.status_counts: Dict[str, int] = {}
+        self.moments: Dict[str, RunningMoments] = {metric: RunningMoments() for metric in self.METRICS}
+        self.latency_sketch = LatencySketch()
+
+    def add(self, contribution: TradeContribution) -> None:
+        self.total_trades += 1
+        self.status_counts[contribution.status] = self.status_counts.get(contribution.status, 0) + 1
+        for metric in self.METRICS:
+            value = getattr(contribution, metric)
+            if value is not None:
+                self.moments[metric].add(value)
+        if contribution.latency_ms is not None:
+            self.latency_sketch.add(contribution.latency_ms)
+
+    def remove(self, contribution: TradeContribution) -> None:
+        self.total_trades -= 1
+        remaining = self.status_counts.get(contribution.status, 0) - 1
+        if remaining > 0:
+            self.status_counts[contribution.status] = remaining
+        else:
+            self.status_counts.pop(contribution.status, None)
+        for metric in self.METRICS:
+            value = getattr(contribution, metric)
+            if value is not None:
+                self.moments[metric].remove(value)
+        if contribution.latency_ms is not None:
+            self.latency_sketch.remove(contribution.latency_ms)
+
+    def add_group(self, status: str, count: int, sums: Dict[str, Tuple[int, float, float]]) -> None:
+        """
+        Add a pre-aggregated group of trades sharing one status
+
+        Args:
+            status: Execution status of the group
+            count: Number of trades in the group
+            sums: Metric -> (non-null count, sum, sum of squares)
+        """
+        self.total_trades += count
+        self.status_counts[status] = self.status_counts.get(status, 0) + count
+        for metric, (n, total, sum_squares) in sums.items():
+            self.moments[metric].merge(RunningMoments.from_sums(n, total or 0.0, sum_squares or 0.0))
+
+    def merge(self, other: "ExecutionStatsAggregate") -> None:
+        self.total_trades += other.total_trades
+        for status, count in other.status_counts.items():
+            self.status_counts[status] = self.status_counts.get(status, 0) + count
+        for metric in self.METRICS:
+            self.moments[metric].merge(other.moments[metric])
+        self.latency_sketch.merge(other.latency_sketch)
+
+    def summary(self) -> Dict[str, Any]:
+        """Execution statistics in the format returned by get_execution_statistics()"""
+        successful = self.status_counts.get('confirmed', 0)
+        latency = self.moments['latency_ms']
+        slippage = self.moments['slippage_percent']
+        return {
+            'total_trades': self.total_trades,
+            'successful_trades': successful,
+            'failed_trades': self.status_counts.get('failed', 0),
+            'success_rate': (successful / self.total_trades) * 100 if self.total_trades > 0 else 0,
+            'average_execution_latency_ms': latency.mean,
+            'average_slippage_percent': slippage.mean,
+            'average_gas_used': self.moments['gas_used'].mean,
+            'total_pnl_sol': self.moments['pnl_sol'].total,
+            'execution_latency_std_ms': latency.std,
+            'execution_latency_percentiles_ms': {
+                f"p{int(q * 100)}": self.latency_sketch.quantile(q) for q in LATENCY_QUANTILES
+            },
+            'slippage_std_percent': slippage.std,
+            'status_counts': dict(self.status_counts)
+        }
+
+
+class ExecutionStatsTracker:
+    """
+    Execution statistics maintained overall, per regime and per day.
+
+    Key behaviours:
+    - apply() moves a trade's contribution between buckets in O(1)
+    - statistics() reads the running aggregates without touching the database
+    - Updates may come from the write-behind journal's worker thread, so all
+      access is serialized by a lock
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = ExecutionStatsAggregate()
+        self.by_regime: Dict[str, ExecutionStatsAggregate] = {}
+        self.by_day: Dict[date, ExecutionStatsAggregate] = {}
+
+    def _buckets(self, day: date, regime: str) -> List[ExecutionStatsAggregate]:
+        if regime not in self.by_regime:
+            self.by_regime[regime] = ExecutionStatsAggregate()
+        if day not in self.by_day:
+            self.by_day[day] = ExecutionStatsAggregate()
+        return [self.total, self.by_regime[regime], self.by_day[day]]
+
+    def apply(self, before: Optional[TradeContribution], after: Optional[TradeContribution]) -> None:
+        """
+        Replace a trade's previous contribution with its current one
+
+        Args:
+            before: Contribution before the change (None for a new trade)
+            after: Contribution after the change (None for a deleted trade)
+        """
+        if before == after:
+            return
+        with self._lock:
+            if before is not None:
+                for aggregate in self._buckets(before.day, before.regime):
+                    aggregate.remove(before)
+                self._prune(before)
+            if after is not None:
+                for aggregate in self._buckets(after.day, after.regime):
+                    aggregate.add(after)
+
+    def _prune(self, contribution: TradeContribution) -> None:
+        if self.by_regime[contribution.regime].total_trades <= 0:
+            del self.by_regime[contribution.regime]
+        if self.by_day[contribution.day].total_trades <= 0:
+            del self.by_day[contribution.day]
+
+    def add_group(self, day: date, regime: str, status: str, count: int,
+                  sums: Dict[str, Tuple[int, float, float]]) -> None:
+        """Add a (day, regime, status) group from a SQL GROUP BY"""
+        with self._lock:
+            for aggregate in self._buckets(day, regime):
+                aggregate.add_group(status, count, sums)
+
+    def add_latencies(self, day: date, regime: str, latency_ms: float, count: int) -> None:
+        """Add ``count`` occurrences of one latency value to the sketches"""
+        with self._lock:
+            for aggregate in self._buckets(day, regime):
+                aggregate.latency_sketch.add(latency_ms, count)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.total = ExecutionStatsAggregate()
+            self.by_regime.clear()
+            self.by_day.clear()
+
+    def replace_with(self, other: "ExecutionStatsTracker") -> None:
+        """Atomically adopt the aggregates of another tracker"""
+        with self._lock:
+            self.total, self.by_regime, self.by_day = other.total, other.by_regime, other.by_day
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Overall execution statistics with a per-regime breakdown
+
+        Returns:
+            Dictionary with execution statistics
+        """
+        with self._lock:
+            if self.total.total_trades == 0:
+                return empty_statistics()
+            stats = self.total.summary()
+            stats['regime_breakdown'] = {
+                regime: aggregate.total_trades for regime, aggregate in self.by_regime.items()
+            }
+            stats['regime_statistics'] = {
+                regime: aggregate.summary() for regime, aggregate in self.by_regime.items()
+            }
+            return stats
+
+    def daily_statistics(self) -> Dict[date, Dict[str, Any]]:
+        """
+        Execution statistics per day
+
+        Returns:
+            Dict mapping day to its execution statistics, oldest first
+        """
+        with self._lock:
+            return {day: self.by_day[day].summary() for day in sorted(self.by_day)}
+
+
+def empty_statistics() -> Dict[str, Any]:
+    """Statistics reported when no trades match"""
+    return {
+        'total_trades': 0,
+        'successful_trades': 0,
+        'failed_trades': 0,
+        'success_rate': 0,
+        'average_execution_latency_ms': 0,
+        'average_slippage_percent': 0,
+        'average_gas_used': 0,
+        'total_pnl_sol': 0
+    }
+
+
+def as_date(value: Any) -> date:
+    """Normalize a SQL DATE() result (date on PostgreSQL, ISO string on SQLite)"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from .config import NautilusPOCConfig
+from .pool_data_cache import PumpSwapPoolCache
 
 logger = logging.getLogger(__name__)
 
@@ -47,9 +48,17 @@ class LiquidityValidator:
     - Validate minimum liquidity requirements before trade execution
     """
     
-    def __init__(self, config: NautilusPOCConfig):
-        """Initialize liquidity validator with configuration"""
+    def __init__(self, config: NautilusPOCConfig, pool_cache: Optional[PumpSwapPoolCache] = None):
+        """
+        Initialize liquidity validator with configuration
+        
+        Args:
+            config: POC configuration
+            pool_cache: Shared pool data cache; the signal analyzer and executor
+                attach theirs here when none is given
+        """
         self.config = config
+        self.pool_cache = pool_cache
         env_config = config.get_current_env_config()
         self.min_liquidity_sol = env_config.pumpswap.min_liquidity_sol
         self.max_price_impact = env_config.pumpswap.max_price_impact_percent
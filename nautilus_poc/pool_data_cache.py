@@ -0,0 +1,236 @@
+"""
+Shared PumpSwap pool-data cache.
+
+This module provides the PumpSwapPoolCache class that fronts the PumpSwap SDK's
+get_pair_address()/get_pool_data() calls for the signal analyzer, liquidity
+validator and executor, so one mint is fetched once no matter how many
+components or concurrent analyses ask for it.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolDataEntry:
+    """Cached pool lookup for one mint"""
+    pool_data: Optional[Dict[str, Any]]
+    pair_address: Optional[str]
+    fetched_at: float
+
+    def age(self, now: float) -> float:
+        return now - self.fetched_at
+
+
+class PumpSwapPoolCache:
+    """
+    LRU + TTL cache of PumpSwap pool data with single-flight fetches.
+
+    Key behaviours:
+    - Fresh entries (younger than ``ttl_seconds``) are served directly
+    - Stale entries (younger than ``stale_ttl_seconds``) are served while a
+      background refresh runs, unless the caller asks for fresh data
+    - Concurrent misses for the same mint share one in-flight fetch
+    - At most ``max_entries`` mints are kept, least recently used first out
+    - Fetch errors are not cached; every waiter of that fetch sees the error
+    """
+
+    def __init__(self, sdk: Any, ttl_seconds: float = 60.0, stale_ttl_seconds: float = 300.0,
+                 max_entries: int = 1024, max_concurrency: int = 10):
+        """
+        Initialize pool-data cache
+
+        Args:
+            sdk: PumpSwap SDK exposing async get_pair_address() and get_pool_data()
+            ttl_seconds: Age below which entries are served without refreshing
+            stale_ttl_seconds: Age below which stale entries may still be served
+            max_entries: Maximum number of cached mints
+            max_concurrency: Maximum concurrent SDK fetches during prefetch
+        """
+        self.sdk = sdk
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = max(stale_ttl_seconds, ttl_seconds)
+        self.max_entries = max_entries
+        self.max_concurrency = max_concurrency
+
+        self._entries: "OrderedDict[str, PoolDataEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Cache statistics
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.evictions = 0
+        self.fetch_errors = 0
+
+    @classmethod
+    def from_config(cls, sdk: Any, config: Any) -> "PumpSwapPoolCache":
+        """
+        Create a cache using the pool_cache_* settings in config.monitoring
+
+        Args:
+            sdk: PumpSwap SDK instance
+            config: NautilusPOCConfig
+        """
+        monitoring = getattr(config, 'monitoring', None) or {}
+        return cls(
+            sdk,
+            ttl_seconds=monitoring.get('pool_cache_ttl_seconds', 60.0),
+            stale_ttl_seconds=monitoring.get('pool_cache_stale_ttl_seconds', 300.0),
+            max_entries=monitoring.get('pool_cache_max_entries', 1024),
+            max_concurrency=monitoring.get('pool_cache_max_concurrency', 10)
+        )
+
+    async def get(self, mint_address: str, allow_stale: bool = True) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Get pool data and pair address for a mint
+
+        Args:
+            mint_address: Token mint address
+            allow_stale: Serve a stale entry while refreshing it in the background.
+                Pass False on the execution path to always wait for fresh data.
+
+        Returns:
+            Tuple of (pool_data, pair_address); pool_data is None when the pair
+            or pool does not exist
+        """
+        entry = self._entries.get(mint_address)
+        if entry is not None:
+            age = entry.age(time.monotonic())
+            if age < self.ttl_seconds:
+                self._entries.move_to_end(mint_address)
+                self.hits += 1
+                return entry.pool_data, entry.pair_address
+            if allow_stale and age < self.stale_ttl_seconds:
+                self._entries.move_to_end(mint_address)
+                self.stale_hits += 1
+                self._refresh_in_background(mint_address)
+                return entry.pool_data, entry.pair_address
+
+        self.misses += 1
+        # Shield the shared fetch so one cancelled caller does not cancel it for the others
+        entry = await asyncio.shield(self._fetch_single_flight(mint_address))
+        return entry.pool_data, entry.pair_address
+
+    async def prefetch(self, mint_addresses: Iterable[str]) -> Dict[str, Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Resolve pool data for a batch of mints in one pass
+
+        Duplicate mints are fetched once and fresh entries are not refetched.
+        Mints whose fetch fails are omitted from the result.
+
+        Args:
+            mint_addresses: Mints to resolve
+
+        Returns:
+            Dict mapping mint address to (pool_data, pair_address)
+        """
+        unique_mints = list(dict.fromkeys(mint_addresses))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def resolve(mint_address: str):
+            async with semaphore:
+                return await self.get(mint_address)
+
+        results = await asyncio.gather(*[resolve(mint) for mint in unique_mints], return_exceptions=True)
+
+        resolved = {}
+        for mint_address, result in zip(unique_mints, results):
+            if isinstance(result, Exception):
+                logger.debug(f"Prefetch failed for {mint_address}: {result}")
+            else:
+                resolved[mint_address] = result
+        return resolved
+
+    def invalidate(self, mint_address: str) -> None:
+        """Drop the cached entry for a mint (e.g. after trading against its pool)"""
+        self._entries.pop(mint_address, None)
+        # A fetch already in flight may predate the change; let it finish
+        # for its waiters but do not let it repopulate the cache
+        self._inflight.pop(mint_address, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, mint_address: str) -> bool:
+        return mint_address in self._entries
+
+    def _fetch_single_flight(self, mint_address: str) -> asyncio.Future:
+        """Return the in-flight fetch for a mint, starting one if needed"""
+        future = self._inflight.get(mint_address)
+        if future is not None:
+            self.coalesced += 1
+            return future
+
+        future = asyncio.ensure_future(self._fetch(mint_address))
+        self._inflight[mint_address] = future
+        future.add_done_callback(lambda f: self._discard_inflight(mint_address, f))
+        return future
+
+    def _discard_inflight(self, mint_address: str, future: asyncio.Future) -> None:
+        if self._inflight.get(mint_address) is future:
+            del self._inflight[mint_address]
+
+    def _refresh_in_background(self, mint_address: str) -> None:
+        if mint_address in self._inflight:
+            return
+        self.refreshes += 1
+        future = self._fetch_single_flight(mint_address)
+        # Background refresh failures keep the stale entry; retrieve the
+        # exception so it is not reported as never retrieved
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    async def _fetch(self, mint_address: str) -> PoolDataEntry:
+        try:
+            pair_address = await self.sdk.get_pair_address(mint_address)
+            pool_data = await self.sdk.get_pool_data(mint_address) if pair_address else None
+        except Exception:
+            self.fetch_errors += 1
+            raise
+
+        entry = PoolDataEntry(
+            pool_data=pool_data or None,
+            pair_address=pair_address,
+            fetched_at=time.monotonic()
+        )
+        if self._inflight.get(mint_address) is asyncio.current_task():
+            self._store(mint_address, entry)
+        return entry
+
+    def _store(self, mint_address: str, entry: PoolDataEntry) -> None:
+        self._entries[mint_address] = entry
+        self._entries.move_to_end(mint_address)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'stale_ttl_seconds': self.stale_ttl_seconds,
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'refreshes': self.refreshes,
+            'evictions': self.evictions,
+            'fetch_errors': self.fetch_errors,
+            'inflight': len(self._inflight),
+            'hit_rate_percent': ((self.hits + self.stale_hits) / lookups * 100) if lookups else 0.0
+        }
@@ -3,6 +3,8 @@ Position Manager for tracking trading positions and P&L.
 
 This module provides comprehensive position tracking with database integration,
 unrealized P&L calculation, and position update logic for buy/sell operations.
+Positions are served from an in-memory columnar book and persisted through the
+shared write-behind journal, so reads and updates never wait on the database.
 """
 
 import asyncio
@@ -11,12 +13,15 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 from decimal import Decimal
 from typing import Dict, List, Optional, Any
+import numpy as np
 import pandas as pd
 
-from sqlalchemy import Column, String, Numeric, DateTime, Boolean, Integer, Text, create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import Column, String, Numeric, DateTime, Boolean, Integer, Text, update
+from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 
+from .database_manager import acquire_database, release_database
+
 # Create a separate base for position tracking models
 PositionBase = declarative_base()
 
@@ -134,6 +139,140 @@ class TradeExecutionRecord:
     retry_count: int = 0
 
 
+class PositionBook:
+    """
+    Columnar in-memory store of positions keyed by mint address.
+    
+    Numeric fields live in NumPy arrays indexed by a per-mint slot, so single
+    positions are read in O(1) and unrealized P&L for many positions is
+    recomputed with array operations.
+    """
+    
+    FLOAT_FIELDS = (
+        'token_amount', 'average_buy_price', 'total_sol_invested',
+        'current_value_sol', 'unrealized_pnl_sol', 'unrealized_pnl_percent'
+    )
+    
+    def __init__(self, capacity: int = 64):
+        """
+        Initialize an empty book.
+        
+        Args:
+            capacity: Initial number of slots (grows as needed)
+        """
+        self._slots: Dict[str, int] = {}
+        self._mints: List[str] = []
+        self._floats = {name: np.zeros(capacity) for name in self.FLOAT_FIELDS}
+        self._trade_count = np.zeros(capacity, dtype=np.int64)
+        self._is_active = np.zeros(capacity, dtype=bool)
+        self._first_buy_timestamp: List[Optional[datetime]] = []
+        self._last_trade_timestamp: List[Optional[datetime]] = []
+    
+    def __len__(self) -> int:
+        return len(self._mints)
+    
+    def __contains__(self, mint_address: str) -> bool:
+        return mint_address in self._slots
+    
+    def get(self, mint_address: str) -> Optional[Position]:
+        """
+        Get a copy of a position.
+        
+        Timestamps are returned as stored; first_buy_timestamp is None until
+        the first buy.
+        """
+        slot = self._slots.get(mint_address)
+        if slot is None:
+            return None
+        floats = {name: float(values[slot]) for name, values in self._floats.items()}
+        return Position(
+            mint_address=mint_address,
+            first_buy_timestamp=self._first_buy_timestamp[slot],
+            last_trade_timestamp=self._last_trade_timestamp[slot],
+            trade_count=int(self._trade_count[slot]),
+            is_active=bool(self._is_active[slot]),
+            **floats
+        )
+    
+    def put(self, position: Position) -> None:
+        """Insert or replace a position."""
+        slot = self._slots.get(position.mint_address)
+        if slot is None:
+            slot = len(self._mints)
+            if slot == len(self._trade_count):
+                self._grow()
+            self._slots[position.mint_address] = slot
+            self._mints.append(position.mint_address)
+            self._first_buy_timestamp.append(None)
+            self._last_trade_timestamp.append(None)
+        
+        for name, values in self._floats.items():
+            values[slot] = float(getattr(position, name))
+        self._trade_count[slot] = position.trade_count
+        self._is_active[slot] = position.is_active
+        self._first_buy_timestamp[slot] = position.first_buy_timestamp
+        self._last_trade_timestamp[slot] = position.last_trade_timestamp
+    
+    def mints(self, active_only: bool = True) -> List[str]:
+        """Mint addresses in the book, optionally only active positions."""
+        if not active_only:
+            return list(self._mints)
+        return [self._mints[slot] for slot in np.flatnonzero(self._is_active[:len(self._mints)])]
+    
+    def apply_prices(self, price_data: Dict[str, float]) -> List[str]:
+        """
+        Recompute value and unrealized P&L for active positions with a price.
+        
+        Args:
+            price_data: Dictionary mapping mint_address to current price
+            
+        Returns:
+            Mint addresses whose P&L changed
+        """
+        mints = [mint for mint in price_data if mint in self._slots]
+        if not mints:
+            return []
+        
+        slots = np.fromiter((self._slots[mint] for mint in mints), dtype=np.int64, count=len(mints))
+        prices = np.fromiter((price_data[mint] or 0.0 for mint in mints), dtype=np.float64, count=len(mints))
+        tokens = self._floats['token_amount'][slots]
+        
+        mask = self._is_active[slots] & (tokens > 0) & (prices > 0)
+        slots, prices, tokens = slots[mask], prices[mask], tokens[mask]
+        
+        invested = self._floats['total_sol_invested'][slots]
+        current_value = tokens * prices
+        unrealized_pnl = current_value - invested
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pnl_percent = np.where(invested > 0, unrealized_pnl / invested * 100, 0.0)
+        
+        self._floats['current_value_sol'][slots] = current_value
+        self._floats['unrealized_pnl_sol'][slots] = unrealized_pnl
+        self._floats['unrealized_pnl_percent'][slots] = pnl_percent
+        
+        return [mints[i] for i in np.flatnonzero(mask)]
+    
+    def totals(self, active_only: bool = True) -> Dict[str, float]:
+        """Sum invested, current value and unrealized P&L across positions."""
+        size = len(self._mints)
+        mask = self._is_active[:size] if active_only else np.ones(size, dtype=bool)
+        return {
+            name: float(self._floats[name][:size][mask].sum())
+            for name in ('total_sol_invested', 'current_value_sol', 'unrealized_pnl_sol')
+        }
+    
+    def clear(self) -> None:
+        """Remove all positions."""
+        self.__init__(capacity=len(self._trade_count))
+    
+    def _grow(self) -> None:
+        capacity = max(len(self._trade_count) * 2, 1)
+        for name, values in self._floats.items():
+            self._floats[name] = np.resize(values, capacity)
+        self._trade_count = np.resize(self._trade_count, capacity)
+        self._is_active = np.resize(self._is_active, capacity)
+
+
 class PositionManager:
     """
     Position Manager for tracking trading positions and P&L.
@@ -141,6 +280,11 @@ class PositionManager:
     Provides comprehensive position tracking with database integration,
     unrealized P&L calculation with current prices, and position update
     logic for buy/sell operations.
+    
+    The in-memory PositionBook is the source of truth while the manager is
+    running; it is loaded from the database on start-up and every change is
+    queued on the shared write-behind journal. Only one process should manage
+    positions for a given database.
     """
     
     def __init__(self, config: Dict[str, Any]):
@@ -153,27 +297,58 @@ class PositionManager:
         self.config = config
         self.logger = logging.getLogger(__name__)
         
-        # Database configuration
-        db_config = config.get('database', {})
-        if db_config.get('type') == 'postgresql':
-            db_url = f"postgresql://{db_config.get('user')}:{db_config.get('password')}@{db_config.get('host')}:{db_config.get('port')}/{db_config.get('database')}"
-        else:
-            # Default to SQLite
-            db_path = db_config.get('path', 'nautilus_positions.db')
-            db_url = f"sqlite:///{db_path}"
-        
-        self.engine = create_engine(db_url, echo=False)
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        # Shared engine, session factory and write-behind journal
+        self.database = acquire_database(config)
+        self.engine = self.database.engine
+        self.SessionLocal = self.database.session_factory
+        self.journal = self.database.journal
+        self._active = True
         
         # Create tables if they don't exist
-        PositionBase.metadata.create_all(bind=self.engine)
+        self.database.ensure_tables(PositionBase.metadata)
         
-        self.logger.info(f"PositionManager initialized with database: {db_url}")
+        # Load persisted positions into the in-memory book
+        self.book = PositionBook()
+        self._load_book()
+        
+        self.logger.info(f"PositionManager initialized with database: {self.database.url}")
+    
+    def _load_book(self) -> None:
+        """Load all persisted positions into the book."""
+        with self.SessionLocal() as session:
+            for model in session.query(PositionModel).all():
+                self.book.put(Position(
+                    mint_address=model.mint_address,
+                    token_amount=float(model.token_amount),
+                    average_buy_price=float(model.average_buy_price),
+                    total_sol_invested=float(model.total_sol_invested),
+                    current_value_sol=float(model.current_value_sol),
+                    unrealized_pnl_sol=float(model.unrealized_pnl_sol),
+                    unrealized_pnl_percent=float(model.unrealized_pnl_percent),
+                    first_buy_timestamp=model.first_buy_timestamp,
+                    last_trade_timestamp=model.last_trade_timestamp,
+                    trade_count=model.trade_count,
+                    is_active=model.is_active
+                ))
+        self.logger.debug(f"Loaded {len(self.book)} positions into position book")
     
     async def initialize(self) -> None:
         """Initialize the position manager."""
         self.logger.info("PositionManager initialized successfully")
     
+    def _to_public(self, position: Position) -> Position:
+        """Convert a book position to the public representation."""
+        position.first_buy_timestamp = (
+            pd.Timestamp(position.first_buy_timestamp) if position.first_buy_timestamp else pd.Timestamp.now()
+        )
+        position.last_trade_timestamp = pd.Timestamp(position.last_trade_timestamp)
+        return position
+    
+    def _persist_position(self, mint_address: str) -> None:
+        """Queue an upsert of one position's current state."""
+        row = asdict(self.book.get(mint_address))
+        self.journal.submit(lambda session: session.merge(PositionModel(**row)))
+    
     async def get_position(self, mint_address: str) -> Optional[Position]:
         """
         Get current position for a mint address.
@@ -185,29 +360,8 @@ class PositionManager:
             Position object if exists, None otherwise
         """
         try:
-            with self.SessionLocal() as session:
-                position_model = session.query(PositionModel).filter(
-                    PositionModel.mint_address == mint_address
-                ).first()
-                
-                if not position_model:
-                    return None
-                
-                # Convert to Position dataclass
-                return Position(
-                    mint_address=position_model.mint_address,
-                    token_amount=float(position_model.token_amount),
-                    average_buy_price=float(position_model.average_buy_price),
-                    total_sol_invested=float(position_model.total_sol_invested),
-                    current_value_sol=float(position_model.current_value_sol),
-                    unrealized_pnl_sol=float(position_model.unrealized_pnl_sol),
-                    unrealized_pnl_percent=float(position_model.unrealized_pnl_percent),
-                    first_buy_timestamp=pd.Timestamp(position_model.first_buy_timestamp) if position_model.first_buy_timestamp else pd.Timestamp.now(),
-                    last_trade_timestamp=pd.Timestamp(position_model.last_trade_timestamp),
-                    trade_count=position_model.trade_count,
-                    is_active=position_model.is_active
-                )
-                
+            position = self.book.get(mint_address)
+            return self._to_public(position) if position else None
         except Exception as e:
             self.logger.error(f"Error getting position for {mint_address}: {e}")
             return None
@@ -231,46 +385,43 @@ class PositionManager:
             current_price: Current token price for P&L calculation
         """
         try:
-            with self.SessionLocal() as session:
-                # Get or create position
-                position = session.query(PositionModel).filter(
-                    PositionModel.mint_address == mint_address
-                ).first()
-                
-                if not position:
-                    position = PositionModel(
-                        mint_address=mint_address,
-                        token_amount=0,
-                        average_buy_price=0,
-                        total_sol_invested=0,
-                        current_value_sol=0,
-                        unrealized_pnl_sol=0,
-                        unrealized_pnl_percent=0,
-                        first_buy_timestamp=None,
-                        last_trade_timestamp=datetime.utcnow(),
-                        trade_count=0,
-                        is_active=True
-                    )
-                    session.add(position)
-                
-                # Update position based on action
-                if action == 'buy':
-                    await self._handle_buy_update(position, amount, execution_result)
-                elif action == 'sell':
-                    await self._handle_sell_update(position, amount, execution_result)
-                
-                # Update P&L if current price is available
-                if current_price:
-                    await self._update_unrealized_pnl(position, current_price)
-                
-                # Update timestamps and trade count
-                position.last_trade_timestamp = datetime.utcnow()
-                position.trade_count += 1
-                
-                # Commit changes
-                session.commit()
-                
-                self.logger.info(f"Position updated for {mint_address}: {action} {amount}")
+            # Get or create position
+            position = self.book.get(mint_address)
+            
+            if not position:
+                position = Position(
+                    mint_address=mint_address,
+                    token_amount=0,
+                    average_buy_price=0,
+                    total_sol_invested=0,
+                    current_value_sol=0,
+                    unrealized_pnl_sol=0,
+                    unrealized_pnl_percent=0,
+                    first_buy_timestamp=None,
+                    last_trade_timestamp=datetime.utcnow(),
+                    trade_count=0,
+                    is_active=True
+                )
+            
+            # Update position based on action
+            if action == 'buy':
+                await self._handle_buy_update(position, amount, execution_result)
+            elif action == 'sell':
+                await self._handle_sell_update(position, amount, execution_result)
+            
+            # Update P&L if current price is available
+            if current_price:
+                await self._update_unrealized_pnl(position, current_price)
+            
+            # Update timestamps and trade count
+            position.last_trade_timestamp = datetime.utcnow()
+            position.trade_count += 1
+            
+            # Apply in memory and queue persistence
+            self.book.put(position)
+            self._persist_position(mint_address)
+            
+            self.logger.info(f"Position updated for {mint_address}: {action} {amount}")
                 
         except Exception as e:
             self.logger.error(f"Error updating position for {mint_address}: {e}")
@@ -278,7 +429,7 @@ class PositionManager:
     
     async def _handle_buy_update(
         self, 
-        position: PositionModel, 
+        position: Position, 
         sol_amount: float, 
         execution_result: Dict[str, Any]
     ) -> None:
@@ -316,7 +467,7 @@ class PositionManager:
     
     async def _handle_sell_update(
         self, 
-        position: PositionModel, 
+        position: Position, 
         token_amount: float, 
         execution_result: Dict[str, Any]
     ) -> None:
@@ -344,7 +495,7 @@ class PositionManager:
             position.token_amount = 0
             position.total_sol_invested = 0
     
-    async def _update_unrealized_pnl(self, position: PositionModel, current_price: float) -> None:
+    async def _update_unrealized_pnl(self, position: Position, current_price: float) -> None:
         """Update unrealized P&L based on current price."""
         if float(position.token_amount) > 0 and current_price > 0:
             # Calculate current value
@@ -369,20 +520,21 @@ class PositionManager:
             price_data: Dictionary mapping mint_address to current price
         """
         try:
-            with self.SessionLocal() as session:
-                active_positions = session.query(PositionModel).filter(
-                    PositionModel.is_active == True,
-                    PositionModel.token_amount > 0
-                ).all()
-                
-                for position in active_positions:
-                    current_price = price_data.get(position.mint_address)
-                    if current_price:
-                        await self._update_unrealized_pnl(position, current_price)
-                
-                session.commit()
-                
-                self.logger.info(f"Updated prices for {len(active_positions)} active positions")
+            updated_mints = self.book.apply_prices(price_data)
+            
+            if updated_mints:
+                rows = [
+                    {
+                        'mint_address': mint,
+                        'current_value_sol': position.current_value_sol,
+                        'unrealized_pnl_sol': position.unrealized_pnl_sol,
+                        'unrealized_pnl_percent': position.unrealized_pnl_percent
+                    }
+                    for mint, position in ((mint, self.book.get(mint)) for mint in updated_mints)
+                ]
+                self.journal.submit(lambda session: session.execute(update(PositionModel), rows))
+            
+            self.logger.info(f"Updated prices for {len(updated_mints)} active positions")
                 
         except Exception as e:
             self.logger.error(f"Error updating position prices: {e}")
@@ -398,33 +550,7 @@ class PositionManager:
             List of Position objects
         """
         try:
-            with self.SessionLocal() as session:
-                query = session.query(PositionModel)
-                
-                if active_only:
-                    query = query.filter(PositionModel.is_active == True)
-                
-                position_models = query.all()
-                
-                positions = []
-                for model in position_models:
-                    position = Position(
-                        mint_address=model.mint_address,
-                        token_amount=float(model.token_amount),
-                        average_buy_price=float(model.average_buy_price),
-                        total_sol_invested=float(model.total_sol_invested),
-                        current_value_sol=float(model.current_value_sol),
-                        unrealized_pnl_sol=float(model.unrealized_pnl_sol),
-                        unrealized_pnl_percent=float(model.unrealized_pnl_percent),
-                        first_buy_timestamp=pd.Timestamp(model.first_buy_timestamp) if model.first_buy_timestamp else pd.Timestamp.now(),
-                        last_trade_timestamp=pd.Timestamp(model.last_trade_timestamp),
-                        trade_count=model.trade_count,
-                        is_active=model.is_active
-                    )
-                    positions.append(position)
-                
-                return positions
-                
+            return [self._to_public(self.book.get(mint)) for mint in self.book.mints(active_only)]
         except Exception as e:
             self.logger.error(f"Error getting all positions: {e}")
             return []
@@ -438,10 +564,11 @@ class PositionManager:
         """
         try:
             positions = await self.get_all_positions(active_only=True)
+            totals = self.book.totals(active_only=True)
             
-            total_invested = sum(pos.total_sol_invested for pos in positions)
-            total_current_value = sum(pos.current_value_sol for pos in positions)
-            total_unrealized_pnl = sum(pos.unrealized_pnl_sol for pos in positions)
+            total_invested = totals['total_sol_invested']
+            total_current_value = totals['current_value_sol']
+            total_unrealized_pnl = totals['unrealized_pnl_sol']
             
             portfolio_pnl_percent = 0
             if total_invested > 0:
@@ -467,10 +594,17 @@ class PositionManager:
                 'positions': []
             }
     
+    async def flush(self) -> None:
+        """Wait until all queued position writes have been persisted."""
+        await self.journal.flush()
+    
     async def close(self) -> None:
-        """Close database connections and cleanup resources."""
+        """Flush pending writes and release the shared database."""
+        if not self._active:
+            return
+        self._active = False
         try:
-            self.engine.dispose()
+            await release_database(self.database)
             self.logger.info("PositionManager closed successfully")
         except Exception as e:
-            self.logger.error(f"Error closing PositionManager: {e}")
\ No newline at end of file
+            self.logger.error(f"Error closing PositionManager: {e}")
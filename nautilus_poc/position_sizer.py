@@ -13,6 +13,16 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+
+def _py_max(a, b):
+    """Elementwise max(a, b) with Python's semantics (a unless b > a, so NaN-safe)"""
+    return np.where(b > a, b, a)
+
+
+def _py_min(a, b):
+    """Elementwise min(a, b) with Python's semantics (a unless b < a)"""
+    return np.where(b < a, b, a)
+
 @dataclass
 class PositionSizeResult:
     """Result of position size calculation"""
@@ -174,6 +184,83 @@ class KellyPositionSizer:
                 liquidity_constrained=False
             )
     
+    def calculate_position_sizes(
+        self,
+        vol_risk: np.ndarray,
+        q50: np.ndarray,
+        enhanced_info_ratio: Optional[np.ndarray] = None,
+        regime_multiplier: Optional[np.ndarray] = None,
+        regime: Optional[np.ndarray] = None,
+        pool_liquidity_sol: Optional[np.ndarray] = None,
+        current_balance: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_position_size() for backtest replay
+
+        Applies the same base size, signal multiplier, regime multiplier,
+        liquidity cap and position limits elementwise, keeping Python's
+        min/max semantics so results match the scalar path exactly.
+
+        Args:
+            vol_risk: vol_risk per signal
+            q50: q50 per signal
+            enhanced_info_ratio: Enhanced info ratio per signal (default 1.0)
+            regime_multiplier: Regime multiplier per signal (default 1.0)
+            regime: Regime name per signal, used where the multiplier is not positive
+            pool_liquidity_sol: Pool liquidity in SOL per signal (NaN or
+                non-positive: no liquidity constraint)
+            current_balance: Current wallet balance in SOL
+
+        Returns:
+            Final position size in SOL per signal
+        """
+        vol_risk = np.asarray(vol_risk, dtype=np.float64)
+        count = len(vol_risk)
+        q50_abs = np.abs(np.asarray(q50, dtype=np.float64))
+        info_ratio = np.ones(count) if enhanced_info_ratio is None else np.asarray(enhanced_info_ratio, dtype=np.float64)
+        multiplier = np.ones(count) if regime_multiplier is None else np.asarray(regime_multiplier, dtype=np.float64)
+
+        # Base size (inverse variance scaling)
+        variance_divisor = _py_max(vol_risk * self.variance_scale_factor, self.min_variance_divisor)
+        base_size = self.base_position_factor / variance_divisor
+        base_size = _py_max(_py_min(base_size, self.max_position_size), self.min_position_size)
+
+        # Signal strength multiplier
+        if self.info_ratio_threshold > 0:
+            info_ratio_factor = _py_min(info_ratio / self.info_ratio_threshold, self.max_signal_multiplier)
+        else:
+            info_ratio_factor = np.ones(count)
+        signal_multiplier = _py_max(_py_min(q50_abs * info_ratio_factor, self.max_signal_multiplier), 0.1)
+
+        # Regime multiplier, falling back to the default table by regime name
+        usable = (multiplier != 0) & (multiplier > 0)
+        if not usable.all():
+            defaults = {'low_variance': 0.7, 'medium_variance': 1.0, 'high_variance': 1.4, 'extreme_variance': 1.8}
+            names = np.full(count, 'medium_variance', dtype=object) if regime is None else np.asarray(regime, dtype=object)
+            fallback = np.array([defaults.get(name, 1.0) for name in names[~usable]])
+            multiplier = multiplier.copy()
+            multiplier[~usable] = fallback
+
+        position = base_size * signal_multiplier * multiplier
+
+        # Liquidity constraint (max 25% of pool)
+        if pool_liquidity_sol is not None:
+            liquidity = np.asarray(pool_liquidity_sol, dtype=np.float64)
+            cap = liquidity * self.max_pool_utilization
+            constrained = (liquidity > 0) & (position > cap)
+            position = np.where(constrained, cap, position)
+
+        # Position limits and balance constraints
+        position = np.where(position > self.max_position_size, self.max_position_size, position)
+        position = np.where(position < self.min_position_size, self.min_position_size, position)
+        if current_balance is not None:
+            available_balance = max(current_balance - 0.01, 0)
+            position = np.where(position > available_balance, available_balance, position)
+            max_balance_usage = available_balance * 0.9
+            position = np.where(position > max_balance_usage, max_balance_usage, position)
+
+        return _py_max(position, 0)
+
     def _calculate_base_size(self, signal_data: Dict[str, Any]) -> float:
         """
         Calculate base position size using inverse variance scaling
@@ -59,6 +59,7 @@ except ImportError:
             return f'pair_{mint_address[:8]}'
 
 from .config import NautilusPOCConfig
+from .pool_data_cache import PumpSwapPoolCache
 
 logger = logging.getLogger(__name__)
 
@@ -112,6 +113,7 @@ class PumpSwapExecutor:
         """Initialize PumpSwap executor with configuration"""
         self.config = config
         self.sdk = PumpSwapSDK()
+        self.pool_cache = PumpSwapPoolCache.from_config(self.sdk, config)
         self.payer_pk = config.wallet.payer_public_key
         
         # Initialize components (will be injected later)
@@ -136,6 +138,13 @@ class PumpSwapExecutor:
         self.liquidity_validator = liquidity_validator
         self.position_manager = position_manager
         self.risk_manager = risk_manager
+        
+        # Share one pool data cache with the validator (and signal analyzer)
+        if liquidity_validator is not None:
+            if getattr(liquidity_validator, 'pool_cache', None) is not None:
+                self.pool_cache = liquidity_validator.pool_cache
+            else:
+                liquidity_validator.pool_cache = self.pool_cache
         logger.info("PumpSwapExecutor dependencies set")
     
     async def execute_buy_signal(self, signal: Dict[str, Any], tick_data: Optional[Dict] = None) -> Dict[str, Any]:
@@ -160,13 +169,12 @@ class PumpSwapExecutor:
             if not mint_address:
                 return self._create_error_result(trade_id, "invalid_mint_address", signal)
             
-            # Get pair address for validation
-            pair_address = await self.sdk.get_pair_address(mint_address)
+            # Get pair address and pool data, never serving stale reserves on execution
+            pool_data, pair_address = await self.pool_cache.get(mint_address, allow_stale=False)
             if not pair_address:
                 return self._create_error_result(trade_id, "pair_not_found", signal)
             
             # Validate pool liquidity
-            pool_data = await self.sdk.get_pool_data(mint_address)
             if not pool_data:
                 return self._create_error_result(trade_id, "pool_data_unavailable", signal)
             
@@ -203,6 +211,9 @@ class PumpSwapExecutor:
                 payer_pk=self.payer_pk
             )
             
+            # The trade moved the pool's reserves
+            self.pool_cache.invalidate(mint_address)
+            
             # Calculate execution metrics
             execution_latency = int((time.time() - start_time) * 1000)
             
@@ -308,8 +319,7 @@ class PumpSwapExecutor:
                 position = {'token_amount': 1000.0, 'average_buy_price': 0.001}
             
             # Get pair address and pool data
-            pair_address = await self.sdk.get_pair_address(mint_address)
-            pool_data = await self.sdk.get_pool_data(mint_address)
+            pool_data, pair_address = await self.pool_cache.get(mint_address, allow_stale=False)
             
             # Calculate sell amount based on signal strength
             sell_amount = self._calculate_sell_amount(position, signal)
@@ -324,6 +334,9 @@ class PumpSwapExecutor:
                 payer_pk=self.payer_pk
             )
             
+            # The trade moved the pool's reserves
+            self.pool_cache.invalidate(mint_address)
+            
             # Calculate execution metrics
             execution_latency = int((time.time() - start_time) * 1000)
             
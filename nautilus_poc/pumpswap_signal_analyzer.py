@@ -18,6 +18,7 @@ import numpy as np
 from .config import NautilusPOCConfig
 from .signal_loader import Q50SignalLoader
 from .liquidity_validator import LiquidityValidator, LiquidityValidationResult
+from .pool_data_cache import PumpSwapPoolCache
 
 logger = logging.getLogger(__name__)
 
@@ -119,7 +120,13 @@ class PumpSwapSignalAnalyzer:
         self.analysis_count = 0
         self.successful_analyses = 0
         self.fallback_count = 0
-        self.cache = {}
+        
+        # Pool data cache, shared through the liquidity validator with the executor
+        self.pool_cache = getattr(liquidity_validator, 'pool_cache', None)
+        if self.pool_cache is None:
+            self.pool_cache = PumpSwapPoolCache.from_config(self.pumpswap_sdk, config)
+            if liquidity_validator is not None:
+                liquidity_validator.pool_cache = self.pool_cache
         
         logger.info("PumpSwapSignalAnalyzer initialized")
     
@@ -265,6 +272,9 @@ class PumpSwapSignalAnalyzer:
         """
         logger.info(f"Analyzing batch of {len(signals)} signals")
         
+        # Resolve each distinct mint once before fanning out the analyses
+        await self.pool_cache.prefetch(mint_address for _, mint_address in signals)
+        
         # Create analysis tasks
         tasks = [
             self.analyze_signal(signal, mint_address)
@@ -301,31 +311,12 @@ class PumpSwapSignalAnalyzer:
     async def _get_pumpswap_data(self, mint_address: str) -> Tuple[Optional[Dict], Optional[str]]:
         """Get PumpSwap pool data and pair address"""
         try:
-            # Check cache first
-            cache_key = f"pumpswap_{mint_address}"
-            if cache_key in self.cache:
-                cached_data = self.cache[cache_key]
-                if time.time() - cached_data['timestamp'] < 60:  # 1-minute cache
-                    return cached_data['pool_data'], cached_data['pair_address']
-            
-            # Get pair address
-            pair_address = await self.pumpswap_sdk.get_pair_address(mint_address)
+            pool_data, pair_address = await self.pool_cache.get(mint_address)
+            
             if not pair_address:
                 logger.debug(f"No pair found for {mint_address}")
-                return None, None
-            
-            # Get pool data
-            pool_data = await self.pumpswap_sdk.get_pool_data(mint_address)
-            if not pool_data:
+            elif not pool_data:
                 logger.debug(f"No pool data for {mint_address}")
-                return None, pair_address
-            
-            # Cache the result
-            self.cache[cache_key] = {
-                'pool_data': pool_data,
-                'pair_address': pair_address,
-                'timestamp': time.time()
-            }
             
             return pool_data, pair_address
             
@@ -779,10 +770,11 @@ class PumpSwapSignalAnalyzer:
             'fallback_count': self.fallback_count,
             'success_rate_percent': success_rate,
             'fallback_rate_percent': fallback_rate,
-            'cache_size': len(self.cache)
+            'cache_size': len(self.pool_cache),
+            'pool_cache': self.pool_cache.get_stats()
         }
     
     def clear_cache(self) -> None:
-        """Clear the analysis cache"""
-        self.cache.clear()
+        """Clear the pool data cache"""
+        self.pool_cache.clear()
         logger.info("PumpSwapSignalAnalyzer cache cleared")
\ No newline at end of file
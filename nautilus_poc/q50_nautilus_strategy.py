@@ -8,6 +8,7 @@ trading execution with PumpSwap DEX integration.
 
 import asyncio
 import logging
+import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock
@@ -72,6 +73,7 @@ from .pumpswap_executor import PumpSwapExecutor
 from .liquidity_validator import LiquidityValidator
 from .position_sizer import KellyPositionSizer
 from .risk_manager import RiskManager
+from .backtest_replay import replay_bars
 
 logger = logging.getLogger(__name__)
 
@@ -170,6 +172,8 @@ class Q50NautilusStrategy(Strategy):
         
         # Strategy state
         self._is_strategy_initialized = False
+        self._signal_reload_task: Optional[asyncio.Task] = None
+        self._last_signal_reload_check = time.monotonic()
         self.last_signal_timestamp = None
         self.processed_signals_count = 0
         self.trading_enabled = True
@@ -200,6 +204,8 @@ class Q50NautilusStrategy(Strategy):
             'q50': {
                 'features_path': self.poc_config.q50.features_path,
                 'signal_tolerance_minutes': self.poc_config.q50.signal_tolerance_minutes,
+                'signal_cache_size': self.poc_config.q50.signal_cache_size,
+                'signal_store_path': self.poc_config.q50.signal_store_path,
                 'required_columns': self.poc_config.q50.required_columns
             },
             'regime_detection': self.poc_config.regime_detection,
@@ -289,8 +295,9 @@ class Q50NautilusStrategy(Strategy):
             
             # Initialize regime detector with historical data if available
             try:
-                if hasattr(self.signal_loader, 'signals_df') and self.signal_loader.signals_df is not None:
-                    vol_risk_history = self.signal_loader.signals_df['vol_risk'].dropna().tolist()
+                vol_risk = self.signal_loader.get_column('vol_risk')
+                if vol_risk is not None:
+                    vol_risk_history = vol_risk[~pd.isna(vol_risk)]
                     self.regime_detector.load_historical_data(vol_risk_history)
                     logger.info(f"Loaded {len(vol_risk_history)} historical vol_risk observations for regime detection")
             except Exception as e:
@@ -350,6 +357,8 @@ class Q50NautilusStrategy(Strategy):
         
         start_time = datetime.now()
         
+        self._schedule_signal_reload_check()
+        
         try:
             # Convert tick timestamp to pandas Timestamp
             tick_timestamp = pd.Timestamp(tick.ts_event, unit='ns')
@@ -403,6 +412,23 @@ class Q50NautilusStrategy(Strategy):
             logger.error(f"Error processing quote tick: {e}")
             self.error_count += 1
     
+    def _schedule_signal_reload_check(self) -> None:
+        """
+        Periodically check for a replaced signal file in the background.
+        
+        The reload runs as its own task; ticks keep using the current
+        signals until the new ones are swapped in.
+        """
+        now = time.monotonic()
+        if now - self._last_signal_reload_check < self.poc_config.q50.signal_reload_interval_seconds:
+            return
+        self._last_signal_reload_check = now
+        
+        if not isinstance(self.signal_loader, Q50SignalLoader):
+            return
+        if self._signal_reload_task is None or self._signal_reload_task.done():
+            self._signal_reload_task = asyncio.create_task(self.signal_loader.reload_if_changed())
+    
     async def _process_trading_signal(self, enhanced_signal: Dict[str, Any], tick: QuoteTick) -> None:
         """
         Process enhanced Q50 signal and make trading decisions.
@@ -895,7 +921,23 @@ class Q50NautilusStrategy(Strategy):
         except Exception as e:
             logger.error(f"Error applying signal enhancements: {e}")
             return enhanced_signal
-    
+
+    def replay_bars(self, bars: pd.DataFrame, update_state: bool = True) -> pd.DataFrame:
+        """
+        Backtest stored OHLCV bars against the loaded Q50 signals.
+
+        Vectorized equivalent of feeding each bar's close to on_quote_tick();
+        decisions match the tick path but no trades are executed.
+
+        Args:
+            bars: OHLCV bars in time order (see backtest_replay.load_ohlcv_bars)
+            update_state: Advance regime history and signal tracking as ticks would
+
+        Returns:
+            DataFrame of decisions, one row per processed signal
+        """
+        return replay_bars(self, bars, update_state=update_state)
+
     def get_current_positions(self) -> Dict[str, Any]:
         """
         Get current trading positions (placeholder for position manager integration).
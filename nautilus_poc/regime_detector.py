@@ -7,12 +7,141 @@ regime-specific threshold adjustments for enhanced Q50 signal processing.
 """
 
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+from bisect import bisect_left, insort
+from typing import Dict, Any, Optional, List, Tuple, Sequence, Union
 import numpy as np
-import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Regime labels in order of increasing vol_risk, matching the percentile bands
+REGIME_ORDER = ('low_variance', 'medium_variance', 'high_variance', 'extreme_variance')
+
+
+class RollingPercentileWindow:
+    """
+    Fixed-capacity rolling window with fast order statistics.
+
+    Observations are kept twice: in a preallocated ring buffer (arrival
+    order, for eviction and recent-history queries) and in a sorted list
+    maintained with bisect insert/delete. Percentile rank is a binary
+    search and quantiles are an index lookup, so neither depends on
+    scanning the window.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        """
+        Initialize the window.
+
+        Args:
+            capacity: Maximum number of observations retained
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._ring = np.empty(capacity, dtype=np.float64)
+        self._start = 0
+        self._size = 0
+        self._sorted: List[float] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, value: float) -> None:
+        """
+        Add an observation, evicting the oldest one when full.
+
+        Args:
+            value: New observation
+        """
+        value = float(value)
+        if self._size == self.capacity:
+            oldest = float(self._ring[self._start])
+            del self._sorted[bisect_left(self._sorted, oldest)]
+            self._ring[self._start] = value
+            self._start = (self._start + 1) % self.capacity
+        else:
+            self._ring[(self._start + self._size) % self.capacity] = value
+            self._size += 1
+        insort(self._sorted, value)
+
+    def extend(self, values: Union[Sequence[float], np.ndarray]) -> None:
+        """
+        Bulk-add observations, rebuilding both structures in one pass.
+
+        Args:
+            values: Observations in arrival order
+        """
+        combined = np.concatenate([self.values(), np.asarray(values, dtype=np.float64)])
+        combined = combined[-self.capacity:]
+
+        self._size = len(combined)
+        self._start = 0
+        self._ring[:self._size] = combined
+        self._sorted = np.sort(combined).tolist()
+
+    def clear(self) -> None:
+        """Remove all observations."""
+        self._start = 0
+        self._size = 0
+        self._sorted = []
+
+    def values(self) -> np.ndarray:
+        """Observations in arrival order (oldest first)."""
+        return self.recent(self._size)
+
+    def recent(self, count: int) -> np.ndarray:
+        """
+        Most recent observations in arrival order.
+
+        Args:
+            count: Maximum number of observations to return
+
+        Returns:
+            Array of at most ``count`` observations
+        """
+        count = min(count, self._size)
+        first = (self._start + self._size - count) % self.capacity
+        if first + count <= self.capacity:
+            return self._ring[first:first + count].copy()
+        return np.concatenate([self._ring[first:], self._ring[:first + count - self.capacity]])
+
+    def sorted_values(self) -> np.ndarray:
+        """Observations in ascending order."""
+        return np.asarray(self._sorted, dtype=np.float64)
+
+    def rank(self, value: float) -> float:
+        """
+        Fraction of observations strictly below a value.
+
+        Args:
+            value: Value to rank
+
+        Returns:
+            Rank in [0, 1], or 0.0 for an empty window
+        """
+        if not self._size:
+            return 0.0
+        return bisect_left(self._sorted, value) / self._size
+
+    def quantile(self, q: float) -> float:
+        """
+        Quantile using linear interpolation (as ``np.percentile``).
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Interpolated quantile value
+        """
+        if not self._size:
+            raise ValueError("quantile of empty window")
+        position = min(max(q, 0.0), 1.0) * (self._size - 1)
+        lower = int(position)
+        value = self._sorted[lower]
+        if lower + 1 < self._size:
+            value += (position - lower) * (self._sorted[lower + 1] - value)
+        return value
+
 
 class RegimeDetector:
     """
@@ -79,13 +208,20 @@ class RegimeDetector:
             self.DEFAULT_THRESHOLD_ADJUSTMENTS
         )
         
-        # Historical volatility data for percentile calculation
-        self.vol_risk_history: List[float] = []
+        # Rolling volatility window for percentile calculation
+        self.max_history_size = regime_config.get('max_history_size', 10000)
+        self.vol_risk_window = RollingPercentileWindow(self.max_history_size)
         self.percentile_cache: Optional[Dict[str, float]] = None
         self.cache_update_threshold = 100  # Update percentiles every N new observations
+        self._observations_since_refresh = 0
         
         logger.info("RegimeDetector initialized with percentiles: %s", self.vol_risk_percentiles)
     
+    @property
+    def vol_risk_history(self) -> List[float]:
+        """Retained vol_risk observations, oldest first."""
+        return self.vol_risk_window.values().tolist()
+
     def classify_regime(self, signal_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Classify the current market regime based on volatility risk.
@@ -211,15 +347,11 @@ class RegimeDetector:
         Args:
             vol_risk: New volatility risk observation
         """
-        self.vol_risk_history.append(vol_risk)
-        
-        # Limit history size to prevent memory issues
-        max_history_size = 10000
-        if len(self.vol_risk_history) > max_history_size:
-            self.vol_risk_history = self.vol_risk_history[-max_history_size:]
+        self.vol_risk_window.append(vol_risk)
         
         # Invalidate percentile cache if we have enough new observations
-        if len(self.vol_risk_history) % self.cache_update_threshold == 0:
+        self._observations_since_refresh += 1
+        if self._observations_since_refresh >= self.cache_update_threshold:
             self.percentile_cache = None
     
     def _get_current_percentiles(self) -> Dict[str, float]:
@@ -234,19 +366,19 @@ class RegimeDetector:
             return self.percentile_cache
         
         # Calculate percentiles from historical data if we have enough observations
-        if len(self.vol_risk_history) >= 100:  # Need minimum observations for reliable percentiles
+        if len(self.vol_risk_window) >= 100:  # Need minimum observations for reliable percentiles
             try:
-                vol_risk_array = np.array(self.vol_risk_history)
                 calculated_percentiles = {
-                    'low': float(np.percentile(vol_risk_array, self.vol_risk_percentiles['low'] * 100)),
-                    'high': float(np.percentile(vol_risk_array, self.vol_risk_percentiles['high'] * 100)),
-                    'extreme': float(np.percentile(vol_risk_array, self.vol_risk_percentiles['extreme'] * 100))
+                    'low': self.vol_risk_window.quantile(self.vol_risk_percentiles['low']),
+                    'high': self.vol_risk_window.quantile(self.vol_risk_percentiles['high']),
+                    'extreme': self.vol_risk_window.quantile(self.vol_risk_percentiles['extreme'])
                 }
                 
                 # Cache the calculated percentiles
                 self.percentile_cache = calculated_percentiles
+                self._observations_since_refresh = 0
                 
-                logger.debug(f"Updated percentiles from {len(self.vol_risk_history)} observations: {calculated_percentiles}")
+                logger.debug(f"Updated percentiles from {len(self.vol_risk_window)} observations: {calculated_percentiles}")
                 
                 return calculated_percentiles
                 
@@ -270,17 +402,192 @@ class RegimeDetector:
         Returns:
             Percentile rank (0-100)
         """
-        if len(self.vol_risk_history) < 10:
+        if len(self.vol_risk_window) < 10:
             return 50.0  # Default to median if insufficient history
         
         try:
-            vol_risk_array = np.array(self.vol_risk_history)
-            percentile_rank = (vol_risk_array < vol_risk).mean() * 100
-            return float(percentile_rank)
+            return float(self.vol_risk_window.rank(vol_risk) * 100)
         except Exception as e:
             logger.error(f"Error calculating percentile rank: {e}")
             return 50.0
     
+    @staticmethod
+    def _classify_vol_risk_array(vol_risk: np.ndarray, percentiles: Dict[str, float]) -> np.ndarray:
+        """
+        Classify many vol_risk values at once.
+        
+        Args:
+            vol_risk: Volatility risk values
+            percentiles: Current percentile thresholds
+            
+        Returns:
+            Array of indices into REGIME_ORDER, using the same inclusive
+            upper bounds as _classify_vol_risk_regime
+        """
+        bounds = np.array([percentiles['low'], percentiles['high'], percentiles['extreme']])
+        return np.searchsorted(bounds, vol_risk, side='left')
+    
+    def classify_regime_batch(
+        self,
+        vol_risk: np.ndarray,
+        q50: Optional[np.ndarray] = None,
+        vol_raw: Optional[np.ndarray] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Classify a sequence of signals at once, as classify_regime() would
+        one call at a time.
+
+        Each observation is appended to the rolling window, percentile
+        thresholds are refreshed on the same schedule as the per-signal path
+        and confidence is taken over the same 50 most recent observations, so
+        results and the detector's final state match sequential calls.
+        ``vol_risk_percentile`` is not computed.
+
+        Args:
+            vol_risk: vol_risk per signal, in arrival order
+            q50: q50 per signal (default 0.0)
+            vol_raw: vol_raw per signal (default 0.1)
+
+        Returns:
+            Dictionary of per-signal arrays: regime_index (into REGIME_ORDER),
+            vol_risk (NaN replaced by 0.5), threshold_adjustment,
+            regime_multiplier, enhanced_info_ratio, regime_adjusted_threshold,
+            regime_adjusted_signal_strength and regime_confidence
+        """
+        values = np.array(vol_risk, dtype=np.float64)
+        count = len(values)
+        values[np.isnan(values)] = 0.5  # Same default as classify_regime
+        q50 = np.zeros(count) if q50 is None else np.asarray(q50, dtype=np.float64)
+        vol_raw = np.full(count, 0.1) if vol_raw is None else np.asarray(vol_raw, dtype=np.float64)
+
+        history = self.vol_risk_window.values()
+        combined = np.concatenate([history, values])
+        window_sizes = np.minimum(len(history) + np.arange(1, count + 1), self.vol_risk_window.capacity)
+
+        bounds = self._replay_percentile_schedule(combined, len(history), window_sizes)
+
+        regime_index = np.where(
+            values <= bounds[:, 0], 0,
+            np.where(values <= bounds[:, 1], 1, np.where(values <= bounds[:, 2], 2, 3))
+        )
+        threshold_adjustment = np.array([self.threshold_adjustments.get(r, 0.0) for r in REGIME_ORDER])[regime_index]
+        regime_multiplier = np.array([self.regime_multipliers.get(r, 1.0) for r in REGIME_ORDER])[regime_index]
+
+        # Enhanced info ratio, as in _calculate_regime_enhancements
+        market_variance = vol_raw + (values * regime_multiplier)
+        prediction_variance = values * 0.1
+        total_variance = market_variance + prediction_variance
+        with np.errstate(invalid='ignore', divide='ignore'):
+            enhanced_info_ratio = np.where(total_variance > 0, np.abs(q50) / np.sqrt(total_variance), 0.0)
+
+        # Regime confidence over the 50 most recent observations
+        confidence = np.full(count, 0.5)
+        eligible = np.flatnonzero(window_sizes >= 50)
+        if len(eligible) and len(combined) >= 50:
+            windows = np.lib.stride_tricks.sliding_window_view(combined, 50)
+            for chunk_start in range(0, len(eligible), 8192):
+                steps = eligible[chunk_start:chunk_start + 8192]
+                recent = windows[len(history) + steps + 1 - 50]
+                step_bounds = bounds[steps]
+                recent_regimes = (
+                    (recent > step_bounds[:, 0:1]).astype(np.int8) +
+                    (recent > step_bounds[:, 1:2]) +
+                    (recent > step_bounds[:, 2:3])
+                )
+                frequency = np.count_nonzero(recent_regimes == regime_index[steps, None], axis=1) / 50
+                confidence[steps] = np.minimum(frequency * 1.5, 1.0)
+
+        # Leave the window where sequential classification would have left it
+        self.vol_risk_window.extend(values)
+
+        return {
+            'regime_index': regime_index,
+            'vol_risk': values,
+            'threshold_adjustment': threshold_adjustment,
+            'regime_multiplier': regime_multiplier,
+            'enhanced_info_ratio': enhanced_info_ratio,
+            'regime_adjusted_threshold': 0.0005 * (1 + threshold_adjustment),
+            'regime_adjusted_signal_strength': np.abs(q50) * regime_multiplier,
+            'regime_confidence': confidence
+        }
+
+    def _replay_percentile_schedule(
+        self,
+        combined: np.ndarray,
+        history_size: int,
+        window_sizes: np.ndarray
+    ) -> np.ndarray:
+        """
+        Percentile thresholds in effect at each step of a batch.
+
+        Follows the cache refresh rules of _update_vol_risk_history() and
+        _get_current_percentiles(), jumping from one refresh to the next, and
+        leaves percentile_cache and the refresh counter as sequential calls
+        would.
+
+        Args:
+            combined: Window contents before the batch followed by the batch values
+            history_size: Number of observations in the window before the batch
+            window_sizes: Window size after each step
+
+        Returns:
+            Array of shape (steps, 3) with the low/high/extreme thresholds
+        """
+        count = len(window_sizes)
+        keys = ('low', 'high', 'extreme')
+        defaults = [self.vol_risk_percentiles[key] for key in keys]
+        quantiles = [self.vol_risk_percentiles[key] for key in keys]
+        bounds = np.empty((count, 3))
+
+        cache = self.percentile_cache
+        counter = self._observations_since_refresh
+        step = 0
+        while step < count:
+            if cache is not None:
+                # Steps served from the cache before the counter invalidates it
+                cached_steps = min(max(self.cache_update_threshold - 1 - counter, 0), count - step)
+                bounds[step:step + cached_steps] = [cache[key] for key in keys]
+                counter += cached_steps
+                step += cached_steps
+                if step < count:
+                    cache = None
+                continue
+
+            # Without a cache, the first step with enough history refreshes it
+            refresh = max(step, 99 - history_size)
+            if self.vol_risk_window.capacity < 100 or refresh >= count:
+                bounds[step:] = defaults
+                counter += count - step
+                break
+            bounds[step:refresh] = defaults
+
+            window = combined[history_size + refresh + 1 - window_sizes[refresh]:history_size + refresh + 1]
+            cache = dict(zip(keys, self._window_quantiles(window, quantiles)))
+            bounds[refresh] = [cache[key] for key in keys]
+            counter = 0
+            step = refresh + 1
+
+        self.percentile_cache = cache
+        self._observations_since_refresh = counter
+        return bounds
+
+    @staticmethod
+    def _window_quantiles(window: np.ndarray, quantiles: Sequence[float]) -> List[float]:
+        """Quantiles computed exactly as RollingPercentileWindow.quantile()."""
+        size = len(window)
+        positions = [min(max(q, 0.0), 1.0) * (size - 1) for q in quantiles]
+        order_stats = sorted({int(p) for p in positions} | {min(int(p) + 1, size - 1) for p in positions})
+        partitioned = np.partition(window, order_stats)
+
+        results = []
+        for position in positions:
+            lower = int(position)
+            value = float(partitioned[lower])
+            if lower + 1 < size:
+                value += (position - lower) * (float(partitioned[lower + 1]) - value)
+            results.append(value)
+        return results
+
     def _calculate_regime_confidence(self, regime: str) -> float:
         """
         Calculate confidence score for the current regime classification.
@@ -291,21 +598,16 @@ class RegimeDetector:
         Returns:
             Confidence score (0-1)
         """
-        if len(self.vol_risk_history) < 50:
+        if len(self.vol_risk_window) < 50:
             return 0.5  # Low confidence with insufficient history
         
         try:
             # Calculate regime stability over recent history
-            recent_history = self.vol_risk_history[-50:]  # Last 50 observations
-            recent_regimes = []
-            
-            for vol_risk in recent_history:
-                temp_regime_info = self._classify_vol_risk_regime(vol_risk, self._get_current_percentiles())
-                recent_regimes.append(temp_regime_info['regime'])
+            recent_history = self.vol_risk_window.recent(50)  # Last 50 observations
+            recent_regimes = self._classify_vol_risk_array(recent_history, self._get_current_percentiles())
             
             # Calculate regime consistency
-            regime_counts = pd.Series(recent_regimes).value_counts()
-            current_regime_frequency = regime_counts.get(regime, 0) / len(recent_regimes)
+            current_regime_frequency = np.count_nonzero(recent_regimes == REGIME_ORDER.index(regime)) / len(recent_regimes)
             
             # Confidence based on regime consistency and transition smoothness
             confidence = min(current_regime_frequency * 1.5, 1.0)  # Cap at 1.0
@@ -403,28 +705,21 @@ class RegimeDetector:
         Returns:
             Dictionary containing regime statistics
         """
-        if not self.vol_risk_history:
+        if not len(self.vol_risk_window):
             return {'status': 'no_history'}
         
         try:
             # Calculate regime distribution
-            regime_counts = {}
             percentiles = self._get_current_percentiles()
+            vol_risk_array = self.vol_risk_window.sorted_values()
+            regime_indices = self._classify_vol_risk_array(vol_risk_array, percentiles)
             
-            for vol_risk in self.vol_risk_history:
-                regime_info = self._classify_vol_risk_regime(vol_risk, percentiles)
-                regime = regime_info['regime']
-                regime_counts[regime] = regime_counts.get(regime, 0) + 1
-            
-            total_observations = len(self.vol_risk_history)
+            total_observations = len(vol_risk_array)
             regime_distribution = {
-                regime: count / total_observations 
-                for regime, count in regime_counts.items()
+                REGIME_ORDER[index]: float(count / total_observations)
+                for index, count in zip(*np.unique(regime_indices, return_counts=True))
             }
             
-            # Calculate volatility statistics
-            vol_risk_array = np.array(self.vol_risk_history)
-            
             return {
                 'total_observations': total_observations,
                 'regime_distribution': regime_distribution,
@@ -432,9 +727,9 @@ class RegimeDetector:
                 'vol_risk_stats': {
                     'mean': float(np.mean(vol_risk_array)),
                     'std': float(np.std(vol_risk_array)),
-                    'min': float(np.min(vol_risk_array)),
-                    'max': float(np.max(vol_risk_array)),
-                    'median': float(np.median(vol_risk_array))
+                    'min': float(vol_risk_array[0]),
+                    'max': float(vol_risk_array[-1]),
+                    'median': self.vol_risk_window.quantile(0.5)
                 },
                 'cache_status': 'cached' if self.percentile_cache is not None else 'calculated'
             }
@@ -445,28 +740,37 @@ class RegimeDetector:
     
     def reset_history(self) -> None:
         """Reset volatility history and clear caches."""
-        self.vol_risk_history.clear()
+        self.vol_risk_window.clear()
         self.percentile_cache = None
+        self._observations_since_refresh = 0
         logger.info("Regime detector history reset")
     
-    def load_historical_data(self, vol_risk_data: List[float]) -> None:
+    def load_historical_data(self, vol_risk_data: Union[Sequence[float], np.ndarray]) -> None:
         """
         Load historical volatility risk data for better regime classification.
         
+        Only the most recent ``max_history_size`` observations are retained.
+        
         Args:
-            vol_risk_data: List of historical vol_risk values
+            vol_risk_data: Historical vol_risk values, oldest first
         """
         try:
             # Validate and clean data
-            cleaned_data = [
-                float(val) for val in vol_risk_data 
-                if val is not None and isinstance(val, (int, float)) and not np.isnan(val) and np.isfinite(val)
-            ]
+            values = np.asarray(vol_risk_data)
+            if values.dtype.kind in 'iuf':
+                values = values.astype(np.float64, copy=False)
+            else:
+                values = np.array([
+                    float(val) for val in vol_risk_data
+                    if val is not None and isinstance(val, (int, float))
+                ], dtype=np.float64)
+            cleaned_data = values[np.isfinite(values)]
             
-            self.vol_risk_history.extend(cleaned_data)
+            self.vol_risk_window.extend(cleaned_data)
             self.percentile_cache = None  # Invalidate cache
+            self._observations_since_refresh = 0
             
             logger.info(f"Loaded {len(cleaned_data)} historical vol_risk observations")
             
         except Exception as e:
-            logger.error(f"Error loading historical data: {e}")
\ No newline at end of file
+            logger.error(f"Error loading historical data: {e}")
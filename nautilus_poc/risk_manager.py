@@ -11,6 +11,7 @@ import time
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
@@ -309,6 +310,21 @@ class RiskManager:
             'rejection_reason': None
         })()
     
+    def validate_trades_batch(self, position_sizes: np.ndarray) -> np.ndarray:
+        """
+        Vectorized validate_trade() for backtest replay
+
+        Args:
+            position_sizes: Proposed position sizes in SOL
+
+        Returns:
+            Boolean array, True where validate_trade() would accept the trade
+        """
+        position_sizes = np.asarray(position_sizes, dtype=np.float64)
+        if self.circuit_breaker_status == CircuitBreakerStatus.TRIGGERED:
+            return np.zeros(len(position_sizes), dtype=bool)
+        return ~(position_sizes > self.max_position_size)
+
     def record_trade_success(self, trade_data: Dict[str, Any]) -> None:
         """
         Record successful trade execution
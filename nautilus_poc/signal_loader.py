@@ -5,21 +5,241 @@ This module provides the Q50SignalLoader class that bridges between the existing
 Q50 quantile prediction system and NautilusTrader trading framework.
 """
 
+import asyncio
 import logging
-import pickle
+import os
+from collections import OrderedDict
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional, Any, List
+from typing import Dict, Iterable, Optional, Any, List, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Session
 
 from gecko_terminal_collector.database.connection import DatabaseConnection
 from gecko_terminal_collector.config.models import DatabaseConfig
+from nautilus_poc.signal_store import (
+    STORE_SUFFIXES,
+    SignalStore,
+    frame_from_pickle,
+    is_signal_store_path,
+)
 
 logger = logging.getLogger(__name__)
 
 
+_NS_PER_MINUTE = 60_000_000_000
+
+
+def _to_python(value: Any) -> Any:
+    """Convert a NumPy scalar to the value pandas' ``to_dict()`` would give."""
+    if isinstance(value, np.datetime64):
+        return pd.Timestamp(value)
+    if isinstance(value, np.timedelta64):
+        return pd.Timedelta(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class SignalRow(Mapping):
+    """
+    Read-only mapping over one signal row.
+    
+    Behaves like the dictionary previously built with ``to_dict()``
+    (``timestamp``, ``time_diff_minutes`` and every signal column) but
+    shares the row's values instead of copying them. ``copy()`` returns a
+    plain, mutable dict.
+    """
+    
+    __slots__ = ('_columns', '_values', 'timestamp', 'time_diff_minutes')
+    
+    def __init__(self, columns: Dict[str, int], values: Tuple, timestamp: pd.Timestamp, time_diff_minutes: float):
+        self._columns = columns
+        self._values = values
+        self.timestamp = timestamp
+        self.time_diff_minutes = time_diff_minutes
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == 'timestamp':
+            return self.timestamp
+        if key == 'time_diff_minutes':
+            return self.time_diff_minutes
+        return self._values[self._columns[key]]
+    
+    def __iter__(self):
+        yield 'timestamp'
+        yield 'time_diff_minutes'
+        yield from self._columns
+    
+    def __len__(self) -> int:
+        return len(self._columns) + 2
+    
+    def copy(self) -> Dict[str, Any]:
+        return dict(self)
+    
+    def __repr__(self) -> str:
+        return f"SignalRow({dict(self)!r})"
+
+
+class SignalLookupIndex:
+    """
+    Nearest-timestamp lookup over a sorted signal frame.
+    
+    The index is kept as a contiguous int64 nanosecond array searched with
+    ``searchsorted``, and each signal column as its own contiguous array.
+    Rows are materialized to Python values once, on first use, and kept in
+    a bounded LRU keyed by row position.
+    """
+    
+    def __init__(
+        self,
+        index_ns: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        cache_size: int = 1024,
+        row_positions: Optional[np.ndarray] = None
+    ):
+        """
+        Initialize lookup index over column arrays.
+        
+        Args:
+            index_ns: Strictly increasing int64 nanosecond timestamps
+            columns: Signal column arrays by name
+            cache_size: Maximum number of materialized rows kept
+            row_positions: Row in the column arrays for each index entry
+                (None when the arrays are already in index order)
+        """
+        self.index_ns = index_ns
+        self.row_positions = row_positions
+        self.columns: Dict[str, int] = {name: i for i, name in enumerate(columns)}
+        self.column_arrays = list(columns.values())
+        self.cache_size = cache_size
+        self.row_cache: 'OrderedDict[int, Tuple[pd.Timestamp, Tuple]]' = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Bracket of the previous lookup; ticks arrive in time order, so most
+        # lookups land in the same bracket and skip the binary search.
+        self._bracket_lo = self._bracket_hi = 0
+        self._bracket_pos = -1
+        self._last_position = -1
+        self._last_row: Optional[Tuple[pd.Timestamp, Tuple]] = None
+    
+    @classmethod
+    def from_frame(cls, signals_df: pd.DataFrame, cache_size: int = 1024) -> 'SignalLookupIndex':
+        """
+        Build lookup arrays from a signal frame indexed by timestamp.
+        
+        Duplicate timestamps resolve to their first row.
+        """
+        index = signals_df.index
+        if index.tz is not None:
+            index = index.tz_convert('UTC').tz_localize(None)
+        index_ns, row_positions = np.unique(np.asarray(index.asi8, dtype=np.int64), return_index=True)
+        columns = {
+            str(column): np.ascontiguousarray(signals_df.iloc[:, i].to_numpy())
+            for i, column in enumerate(signals_df.columns)
+        }
+        return cls(index_ns, columns, cache_size, row_positions)
+    
+    @classmethod
+    def from_store(cls, store: SignalStore, cache_size: int = 1024) -> 'SignalLookupIndex':
+        """Build a lookup index directly on a store's memory-mapped columns."""
+        return cls(store.timestamps, store.columns, cache_size)
+    
+    def column(self, name: str) -> np.ndarray:
+        """Get a signal column in timestamp order."""
+        values = self.column_arrays[self.columns[name]]
+        return values if self.row_positions is None else values[self.row_positions]
+    
+    def slice(self, start_ns: int, end_ns: int) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Get timestamps and column values for start_ns <= t <= end_ns."""
+        lo = int(self.index_ns.searchsorted(start_ns, 'left'))
+        hi = int(self.index_ns.searchsorted(end_ns, 'right'))
+        rows = slice(lo, hi) if self.row_positions is None else self.row_positions[lo:hi]
+        return self.index_ns[lo:hi], {name: self.column_arrays[i][rows] for name, i in self.columns.items()}
+    
+    def clear_cache(self) -> None:
+        """Drop all materialized rows."""
+        self.row_cache.clear()
+        self._last_position = -1
+        self._last_row = None
+    
+    def __len__(self) -> int:
+        return len(self.index_ns)
+    
+    def nearest(self, timestamp_ns: int, tolerance_ns: int) -> Optional[Tuple[int, int]]:
+        """
+        Find the signal closest to a timestamp within a tolerance.
+        
+        Ties go to the earlier signal.
+        
+        Args:
+            timestamp_ns: Target time in nanoseconds since the epoch (UTC)
+            tolerance_ns: Maximum distance in nanoseconds
+            
+        Returns:
+            (position, signed distance in ns) or None if nothing is within tolerance
+        """
+        index_ns = self.index_ns
+        count = len(index_ns)
+        if count == 0:
+            return None
+        
+        if self._bracket_pos >= 0 and self._bracket_lo < timestamp_ns <= self._bracket_hi:
+            pos = self._bracket_pos
+        else:
+            pos = int(index_ns.searchsorted(timestamp_ns))
+            self._bracket_pos = pos
+            self._bracket_lo = int(index_ns[pos - 1]) if pos > 0 else -(1 << 63)
+            self._bracket_hi = int(index_ns[pos]) if pos < count else (1 << 63) - 1
+        
+        best = None
+        if pos > 0:
+            diff = timestamp_ns - self._bracket_lo
+            if diff <= tolerance_ns:
+                best = (pos - 1, diff)
+        if pos < count:
+            diff = self._bracket_hi - timestamp_ns
+            if diff <= tolerance_ns and (best is None or diff < best[1]):
+                best = (pos, -diff)
+        return best
+    
+    def row(self, position: int) -> Tuple[pd.Timestamp, Tuple]:
+        """Get the timestamp and Python values of a row, through the LRU."""
+        if position == self._last_position:
+            self.cache_hits += 1
+            return self._last_row
+        
+        cached = self.row_cache.get(position)
+        if cached is not None:
+            self.row_cache.move_to_end(position)
+            self.cache_hits += 1
+            self._last_position, self._last_row = position, cached
+            return cached
+        
+        self.cache_misses += 1
+        row_position = position if self.row_positions is None else self.row_positions[position]
+        values = tuple(_to_python(array[row_position]) for array in self.column_arrays)
+        cached = (pd.Timestamp(int(self.index_ns[position]), unit='ns'), values)
+        self.row_cache[position] = cached
+        if len(self.row_cache) > self.cache_size:
+            self.row_cache.popitem(last=False)
+        self._last_position, self._last_row = position, cached
+        return cached
+    
+    def lookup(self, timestamp_ns: int, tolerance_ns: int) -> Optional[SignalRow]:
+        """Get a row view of the nearest signal within tolerance."""
+        match = self.nearest(timestamp_ns, tolerance_ns)
+        if match is None:
+            return None
+        position, diff_ns = match
+        signal_timestamp, values = self.row(position)
+        return SignalRow(self.columns, values, signal_timestamp, abs(diff_ns) / _NS_PER_MINUTE)
+
+
 class Q50SignalLoader:
     """
     Loads and manages Q50 signals for NautilusTrader integration.
@@ -41,13 +261,16 @@ class Q50SignalLoader:
         
         Args:
             config: Configuration dictionary containing:
-                - q50.features_path: Path to macro_features.pkl
+                - q50.features_path: Path to macro_features.pkl or a signal store
+                - q50.signal_store_path: Optional signal store overriding features_path
                 - q50.signal_tolerance_minutes: Tolerance for timestamp matching
+                - q50.signal_cache_size: Number of signal rows kept materialized
                 - database: Database configuration
         """
         self.config = config
         self.features_path = Path(config['q50']['features_path'])
         self.signal_tolerance_minutes = config['q50'].get('signal_tolerance_minutes', 5)
+        self.signal_cache_size = config['q50'].get('signal_cache_size', 1024)
         
         # Initialize database connection
         try:
@@ -74,63 +297,77 @@ class Q50SignalLoader:
         
         # Signal data storage
         self.signals_df: Optional[pd.DataFrame] = None
+        self.signal_store: Optional[SignalStore] = None
+        self.source_path: Optional[Path] = None
+        self._source_signature: Optional[Tuple[int, int, int]] = None
         self.last_loaded: Optional[datetime] = None
-        self.signal_cache: Dict[str, Dict] = {}
+        self.lookup_index: Optional[SignalLookupIndex] = None
         
         logger.info(f"Q50SignalLoader initialized with features path: {self.features_path}")
     
+    def resolve_signal_source(self) -> Path:
+        """
+        Pick the file signals are loaded from.
+        
+        An explicit ``q50.signal_store_path`` wins; otherwise a features path
+        naming a signal store is used as is, and a legacy pickle is replaced
+        by a store converted next to it (``macro_features.arrow``) if one exists.
+        """
+        store_path = self.config['q50'].get('signal_store_path')
+        if store_path:
+            return Path(store_path)
+        if is_signal_store_path(self.features_path):
+            return self.features_path
+        sibling = self.features_path.with_suffix(STORE_SUFFIXES[0])
+        if sibling.exists():
+            return sibling
+        return self.features_path
+    
     async def load_signals(self) -> bool:
         """
-        Load Q50 signals from macro_features.pkl file.
+        Load Q50 signals from a memory-mapped signal store or macro_features.pkl.
         
         Returns:
             True if signals loaded successfully, False otherwise
         """
         try:
-            if not self.features_path.exists():
-                logger.error(f"Features file not found: {self.features_path}")
+            source_path = self.resolve_signal_source()
+            if not source_path.exists():
+                logger.error(f"Features file not found: {source_path}")
                 return False
             
-            logger.info(f"Loading Q50 signals from {self.features_path}")
+            logger.info(f"Loading Q50 signals from {source_path}")
             
-            # Load pickle file
-            with open(self.features_path, 'rb') as f:
-                data = pickle.load(f)
-            
-            # Handle different data formats
-            if isinstance(data, pd.DataFrame):
-                self.signals_df = data
-            elif isinstance(data, dict) and 'signals' in data:
-                self.signals_df = data['signals']
-            elif isinstance(data, dict) and 'macro_features' in data:
-                self.signals_df = data['macro_features']
+            if is_signal_store_path(source_path):
+                # Opening only maps the file, but keep even that off the event loop
+                store = await asyncio.to_thread(SignalStore, source_path)
+                if not self.validate_signal_columns(store.columns):
+                    logger.error("Signal validation failed - missing required columns")
+                    return False
+                signals_df = None
+                lookup_index = SignalLookupIndex.from_store(store, self.signal_cache_size)
             else:
-                logger.error(f"Unexpected data format in {self.features_path}")
-                return False
-            
-            # Validate signal columns
-            if not self.validate_signal_columns(self.signals_df):
-                logger.error("Signal validation failed - missing required columns")
-                return False
-            
-            # Ensure timestamp index
-            if not isinstance(self.signals_df.index, pd.DatetimeIndex):
-                if 'timestamp' in self.signals_df.columns:
-                    self.signals_df.set_index('timestamp', inplace=True)
-                elif 'datetime' in self.signals_df.columns:
-                    self.signals_df.set_index('datetime', inplace=True)
-                else:
-                    logger.error("No timestamp column found in signals data")
+                # Legacy pickle: only load from trusted paths
+                store = None
+                signals_df = frame_from_pickle(source_path)
+                if not self.validate_signal_columns(signals_df):
+                    logger.error("Signal validation failed - missing required columns")
                     return False
+                signals_df.sort_index(inplace=True)
+                lookup_index = SignalLookupIndex.from_frame(signals_df, self.signal_cache_size)
             
-            # Sort by timestamp
-            self.signals_df.sort_index(inplace=True)
-            
+            # Swap in one step; lookups in flight keep using the previous index
+            self.signals_df, self.signal_store, self.lookup_index = signals_df, store, lookup_index
+            self.source_path = source_path
+            self._source_signature = self._file_signature(source_path)
             self.last_loaded = datetime.now()
-            self.signal_cache.clear()  # Clear cache on reload
             
-            logger.info(f"Successfully loaded {len(self.signals_df)} Q50 signals")
-            logger.info(f"Signal date range: {self.signals_df.index.min()} to {self.signals_df.index.max()}")
+            logger.info(f"Successfully loaded {len(lookup_index)} Q50 signals")
+            if len(lookup_index):
+                logger.info(
+                    f"Signal date range: {pd.Timestamp(int(lookup_index.index_ns[0]))} "
+                    f"to {pd.Timestamp(int(lookup_index.index_ns[-1]))}"
+                )
             
             return True
             
@@ -138,17 +375,53 @@ class Q50SignalLoader:
             logger.error(f"Failed to load Q50 signals: {e}")
             return False
     
-    def validate_signal_columns(self, df: pd.DataFrame) -> bool:
+    async def reload_if_changed(self) -> bool:
+        """
+        Reload signals if the source file has been replaced.
+        
+        Stores are meant to be updated by writing a new file and renaming it
+        over the old one. Ticks processed while the new file is opened still
+        see the previous signals.
+        
+        Returns:
+            True if signals were reloaded
+        """
+        if self.source_path is None or self._file_signature(self.resolve_signal_source()) == self._source_signature:
+            return False
+        
+        logger.info(f"Signal source {self.source_path} changed, reloading")
+        return await self.load_signals()
+    
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    
+    def get_column(self, name: str) -> Optional[np.ndarray]:
+        """
+        Get one signal column in timestamp order.
+        
+        For signal stores this is a read-only view of the mapped file.
+        """
+        if self.lookup_index is None or name not in self.lookup_index.columns:
+            return None
+        return self.lookup_index.column(name)
+    
+    def validate_signal_columns(self, df: Union[pd.DataFrame, Iterable[str]]) -> bool:
         """
-        Validate that required Q50 columns are present in the DataFrame.
+        Validate that required Q50 columns are present.
         
         Args:
-            df: DataFrame to validate
+            df: DataFrame or column names to validate
             
         Returns:
             True if all required columns are present, False otherwise
         """
-        missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
+        columns = set(df.columns if isinstance(df, pd.DataFrame) else df)
+        missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in columns]
         
         if missing_columns:
             logger.error(f"Missing required Q50 columns: {missing_columns}")
@@ -157,61 +430,40 @@ class Q50SignalLoader:
         logger.info("All required Q50 columns validated successfully")
         return True
     
-    async def get_signal_for_timestamp(self, timestamp: pd.Timestamp) -> Optional[Dict]:
+    async def get_signal_for_timestamp(self, timestamp: pd.Timestamp) -> Optional[SignalRow]:
         """
         Get Q50 signal for a specific timestamp with tolerance.
         
         Args:
-            timestamp: Target timestamp for signal retrieval
+            timestamp: Target timestamp for signal retrieval (Timestamp,
+                datetime or nanoseconds since the epoch)
             
         Returns:
-            Dictionary containing signal data, or None if no signal found
+            Read-only mapping with the signal data (call ``copy()`` for a
+            mutable dict), or None if no signal found
         """
-        if self.signals_df is None:
+        if self.lookup_index is None:
             logger.warning("No signals loaded - call load_signals() first")
             return None
         
-        # Convert timestamp to pandas Timestamp if needed
-        if not isinstance(timestamp, pd.Timestamp):
-            timestamp = pd.Timestamp(timestamp)
-        
-        # Check cache first
-        cache_key = timestamp.isoformat()
-        if cache_key in self.signal_cache:
-            return self.signal_cache[cache_key]
-        
         try:
-            # Define tolerance window
-            tolerance = pd.Timedelta(minutes=self.signal_tolerance_minutes)
-            start_time = timestamp - tolerance
-            end_time = timestamp + tolerance
+            # Nanoseconds since the epoch; naive timestamps are taken as UTC
+            if isinstance(timestamp, pd.Timestamp):
+                timestamp_ns = timestamp.value
+            elif isinstance(timestamp, (int, np.integer)):
+                timestamp_ns = int(timestamp)
+            else:
+                timestamp_ns = pd.Timestamp(timestamp).value
             
-            # Find signals within tolerance window
-            mask = (self.signals_df.index >= start_time) & (self.signals_df.index <= end_time)
-            matching_signals = self.signals_df[mask]
+            signal = self.lookup_index.lookup(
+                timestamp_ns, self.signal_tolerance_minutes * _NS_PER_MINUTE
+            )
             
-            if matching_signals.empty:
+            if signal is None:
                 logger.debug(f"No signals found within {self.signal_tolerance_minutes} minutes of {timestamp}")
                 return None
             
-            # Get the closest signal by timestamp
-            time_diffs = abs(matching_signals.index - timestamp)
-            closest_idx = time_diffs.idxmin()
-            closest_signal = matching_signals.loc[closest_idx]
-            
-            # Convert to dictionary
-            signal_dict = {
-                'timestamp': closest_idx,
-                'time_diff_minutes': time_diffs.loc[closest_idx].total_seconds() / 60,
-                **closest_signal.to_dict()
-            }
-            
-            # Cache the result
-            self.signal_cache[cache_key] = signal_dict
-            
-            logger.debug(f"Found signal for {timestamp} (closest: {closest_idx}, diff: {signal_dict['time_diff_minutes']:.2f} min)")
-            
-            return signal_dict
+            return signal
             
         except Exception as e:
             logger.error(f"Error retrieving signal for timestamp {timestamp}: {e}")
@@ -224,18 +476,13 @@ class Q50SignalLoader:
         Returns:
             Dictionary containing the latest signal data, or None if no signals loaded
         """
-        if self.signals_df is None or self.signals_df.empty:
+        index = self.lookup_index
+        if index is None or len(index) == 0:
             return None
         
         try:
-            latest_timestamp = self.signals_df.index.max()
-            latest_signal = self.signals_df.loc[latest_timestamp]
-            
-            return {
-                'timestamp': latest_timestamp,
-                'time_diff_minutes': 0.0,
-                **latest_signal.to_dict()
-            }
+            signal_timestamp, values = index.row(len(index) - 1)
+            return SignalRow(index.columns, values, signal_timestamp, 0.0).copy()
             
         except Exception as e:
             logger.error(f"Error retrieving latest signal: {e}")
@@ -248,45 +495,53 @@ class Q50SignalLoader:
         Returns:
             Dictionary containing signal statistics
         """
-        if self.signals_df is None:
+        index = self.lookup_index
+        if index is None:
             return {'status': 'no_signals_loaded'}
         
         try:
+            def flag_count(name: str) -> int:
+                return int(np.count_nonzero(index.column(name))) if name in index.columns else 0
+            
             stats = {
-                'total_signals': len(self.signals_df),
+                'total_signals': len(index),
                 'date_range': {
-                    'start': self.signals_df.index.min().isoformat(),
-                    'end': self.signals_df.index.max().isoformat()
+                    'start': pd.Timestamp(int(index.index_ns[0])).isoformat() if len(index) else None,
+                    'end': pd.Timestamp(int(index.index_ns[-1])).isoformat() if len(index) else None
                 },
-                'tradeable_signals': int(self.signals_df['tradeable'].sum()) if 'tradeable' in self.signals_df.columns else 0,
-                'economically_significant': int(self.signals_df['economically_significant'].sum()) if 'economically_significant' in self.signals_df.columns else 0,
-                'high_quality': int(self.signals_df['high_quality'].sum()) if 'high_quality' in self.signals_df.columns else 0,
+                'tradeable_signals': flag_count('tradeable'),
+                'economically_significant': flag_count('economically_significant'),
+                'high_quality': flag_count('high_quality'),
                 'last_loaded': self.last_loaded.isoformat() if self.last_loaded else None,
-                'cache_size': len(self.signal_cache)
+                'source': 'signal_store' if self.signal_store is not None else 'pickle',
+                'cache_size': len(index.row_cache),
+                'cache_hits': index.cache_hits,
+                'cache_misses': index.cache_misses
             }
             
-            # Add Q50 value statistics
-            if 'q50' in self.signals_df.columns:
-                q50_series = self.signals_df['q50']
+            # Add Q50 value statistics (NaN-skipping, like pandas)
+            if 'q50' in index.columns:
+                q50_values = index.column('q50')
                 stats['q50_stats'] = {
-                    'mean': float(q50_series.mean()),
-                    'std': float(q50_series.std()),
-                    'min': float(q50_series.min()),
-                    'max': float(q50_series.max()),
-                    'positive_signals': int((q50_series > 0).sum()),
-                    'negative_signals': int((q50_series < 0).sum())
+                    'mean': float(np.nanmean(q50_values)),
+                    'std': float(np.nanstd(q50_values, ddof=1)),
+                    'min': float(np.nanmin(q50_values)),
+                    'max': float(np.nanmax(q50_values)),
+                    'positive_signals': int(np.count_nonzero(q50_values > 0)),
+                    'negative_signals': int(np.count_nonzero(q50_values < 0))
                 }
             
             # Add volatility risk statistics
-            if 'vol_risk' in self.signals_df.columns:
-                vol_risk_series = self.signals_df['vol_risk']
+            if 'vol_risk' in index.columns:
+                vol_risk_values = index.column('vol_risk')
+                percentiles = np.nanquantile(vol_risk_values, [0.30, 0.70, 0.90])
                 stats['vol_risk_stats'] = {
-                    'mean': float(vol_risk_series.mean()),
-                    'std': float(vol_risk_series.std()),
+                    'mean': float(np.nanmean(vol_risk_values)),
+                    'std': float(np.nanstd(vol_risk_values, ddof=1)),
                     'percentiles': {
-                        '30': float(vol_risk_series.quantile(0.30)),
-                        '70': float(vol_risk_series.quantile(0.70)),
-                        '90': float(vol_risk_series.quantile(0.90))
+                        '30': float(percentiles[0]),
+                        '70': float(percentiles[1]),
+                        '90': float(percentiles[2])
                     }
                 }
             
@@ -307,12 +562,16 @@ class Q50SignalLoader:
         Returns:
             DataFrame containing signals in the specified range
         """
-        if self.signals_df is None:
+        index = self.lookup_index
+        if index is None:
             return pd.DataFrame()
         
         try:
-            mask = (self.signals_df.index >= start_time) & (self.signals_df.index <= end_time)
-            return self.signals_df[mask].copy()
+            timestamps, columns = index.slice(pd.Timestamp(start_time).value, pd.Timestamp(end_time).value)
+            return pd.DataFrame(
+                {name: np.array(values) for name, values in columns.items()},
+                index=pd.DatetimeIndex(timestamps.astype('datetime64[ns]'), name='timestamp')
+            )
             
         except Exception as e:
             logger.error(f"Error retrieving signals in range {start_time} to {end_time}: {e}")
@@ -320,7 +579,8 @@ class Q50SignalLoader:
     
     def clear_cache(self) -> None:
         """Clear the signal cache."""
-        self.signal_cache.clear()
+        if self.lookup_index is not None:
+            self.lookup_index.clear_cache()
         logger.info("Signal cache cleared")
     
     def close(self) -> None:
@@ -343,11 +603,11 @@ class Q50SignalLoader:
             Dictionary containing health check results
         """
         health_status = {
-            'signals_loaded': self.signals_df is not None,
-            'features_file_exists': self.features_path.exists(),
+            'signals_loaded': self.lookup_index is not None,
+            'features_file_exists': self.resolve_signal_source().exists(),
             'database_healthy': False,
             'last_loaded': self.last_loaded.isoformat() if self.last_loaded else None,
-            'signal_count': len(self.signals_df) if self.signals_df is not None else 0
+            'signal_count': len(self.lookup_index) if self.lookup_index is not None else 0
         }
         
         # Check database health
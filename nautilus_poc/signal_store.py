@@ -0,0 +1,263 @@
+"""
+Memory-mapped columnar store for Q50 signals.
+
+Signals are written once as an uncompressed Arrow IPC file holding a
+sorted, de-duplicated ``timestamp`` column (int64 nanoseconds, UTC) and
+one column per signal, in a single record batch. A small JSON header in
+the schema metadata records the format version, row count, time range
+and original column dtypes.
+
+Opening a store memory-maps the file and exposes each column as a
+zero-copy NumPy array, so start-up cost is independent of the file size
+and pages are only read when touched. Stores are replaced by writing a
+new file and renaming it over the old one; readers holding the previous
+mapping are unaffected.
+
+Convert an existing pickle with:
+
+    python -m nautilus_poc.signal_store data3/macro_features.pkl data3/macro_features.arrow
+"""
+
+import argparse
+import json
+import logging
+import os
+import pickle
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+STORE_FORMAT_VERSION = 1
+STORE_METADATA_KEY = b"q50_signal_store"
+STORE_SUFFIXES = (".arrow", ".feather")
+TIMESTAMP_COLUMN = "timestamp"
+
+
+class SignalStoreError(Exception):
+    """Raised when a signal store cannot be written or opened."""
+
+
+def frame_from_pickle(path: Union[str, Path]) -> pd.DataFrame:
+    """
+    Load a signal frame from a legacy macro_features pickle.
+
+    Only use this on trusted files: unpickling can execute arbitrary code.
+
+    Args:
+        path: Path to the pickle file
+
+    Returns:
+        Signal DataFrame indexed by timestamp
+    """
+    with open(path, 'rb') as f:
+        data = pickle.load(f)
+
+    if isinstance(data, pd.DataFrame):
+        frame = data
+    elif isinstance(data, dict) and 'signals' in data:
+        frame = data['signals']
+    elif isinstance(data, dict) and 'macro_features' in data:
+        frame = data['macro_features']
+    else:
+        raise SignalStoreError(f"Unexpected data format in {path}")
+
+    if not isinstance(frame.index, pd.DatetimeIndex):
+        for column in ('timestamp', 'datetime'):
+            if column in frame.columns:
+                frame = frame.set_index(column)
+                break
+        else:
+            raise SignalStoreError(f"No timestamp column found in {path}")
+
+    return frame
+
+
+def write_signal_store(frame: pd.DataFrame, path: Union[str, Path], source: Optional[str] = None) -> Path:
+    """
+    Write a signal frame as a memory-mappable store, atomically.
+
+    Rows are sorted by timestamp and duplicate timestamps keep their first
+    row. Numeric and boolean columns are stored; other columns are skipped
+    with a warning.
+
+    Args:
+        frame: Signals indexed by a DatetimeIndex
+        path: Destination file (conventionally ``*.arrow``)
+        source: Optional description of where the signals came from
+
+    Returns:
+        Path of the written store
+    """
+    if not isinstance(frame.index, pd.DatetimeIndex):
+        raise SignalStoreError("Signal frame must be indexed by a DatetimeIndex")
+
+    path = Path(path)
+    index = frame.index
+    if index.tz is not None:
+        index = index.tz_convert('UTC').tz_localize(None)
+
+    timestamps = index.asi8
+    order = np.argsort(timestamps, kind='stable')
+    timestamps = timestamps[order]
+    keep = np.ones(len(timestamps), dtype=bool)
+    keep[1:] = timestamps[1:] != timestamps[:-1]
+    rows = order[keep]
+    timestamps = timestamps[keep]
+
+    arrays = [pa.array(timestamps, type=pa.int64())]
+    names = [TIMESTAMP_COLUMN]
+    dtypes: Dict[str, str] = {}
+
+    for column in frame.columns:
+        name = str(column)
+        if name == TIMESTAMP_COLUMN:
+            continue
+        values = frame[column].to_numpy()
+        if values.dtype == np.bool_:
+            # Arrow packs booleans into bits; bytes keep the column zero-copy
+            values = values.view(np.uint8)
+        elif values.dtype.kind not in 'iuf':
+            logger.warning(f"Skipping non-numeric signal column {name} ({values.dtype})")
+            continue
+        arrays.append(pa.array(np.ascontiguousarray(values[rows])))
+        names.append(name)
+        dtypes[name] = str(frame[column].dtype)
+
+    header = {
+        'format_version': STORE_FORMAT_VERSION,
+        'rows': int(len(timestamps)),
+        'start_ns': int(timestamps[0]) if len(timestamps) else None,
+        'end_ns': int(timestamps[-1]) if len(timestamps) else None,
+        'columns': dtypes,
+        'created_at': datetime.now().isoformat(),
+        'source': source,
+    }
+    schema = pa.schema(
+        [pa.field(name, array.type) for name, array in zip(names, arrays)],
+        metadata={STORE_METADATA_KEY: json.dumps(header).encode()}
+    )
+    batch = pa.record_batch(arrays, schema=schema)
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with pa.OSFile(str(tmp_path), 'wb') as sink:
+            with pa.ipc.new_file(sink, schema) as writer:
+                writer.write_batch(batch)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    logger.info(f"Wrote {header['rows']} signals ({len(dtypes)} columns) to {path}")
+    return path
+
+
+def convert_pickle_to_store(pickle_path: Union[str, Path], store_path: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Convert a macro_features pickle into a signal store.
+
+    Args:
+        pickle_path: Trusted legacy pickle file
+        store_path: Destination (defaults to the pickle path with ``.arrow``)
+
+    Returns:
+        Path of the written store
+    """
+    pickle_path = Path(pickle_path)
+    store_path = Path(store_path) if store_path else pickle_path.with_suffix(STORE_SUFFIXES[0])
+    return write_signal_store(frame_from_pickle(pickle_path), store_path, source=str(pickle_path))
+
+
+def is_signal_store_path(path: Union[str, Path]) -> bool:
+    """Whether a path names a signal store rather than a legacy pickle."""
+    return Path(path).suffix.lower() in STORE_SUFFIXES
+
+
+class SignalStore:
+    """
+    Read-only, memory-mapped view of a signal store file.
+
+    Columns are NumPy arrays backed by the mapping; they stay valid for as
+    long as the store object (or an array taken from it) is referenced,
+    even after the file on disk has been replaced.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a signal store.
+
+        Args:
+            path: Store file written by write_signal_store
+        """
+        self.path = Path(path)
+        try:
+            stat = os.stat(self.path)
+            self.file_signature: Tuple[int, int, int] = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            self._source = pa.memory_map(str(self.path), 'r')
+            table = pa.ipc.open_file(self._source).read_all()
+        except (OSError, pa.ArrowInvalid) as e:
+            raise SignalStoreError(f"Cannot open signal store {self.path}: {e}") from e
+
+        metadata = table.schema.metadata or {}
+        if STORE_METADATA_KEY not in metadata:
+            raise SignalStoreError(f"{self.path} is not a Q50 signal store")
+        self.header: Dict[str, Any] = json.loads(metadata[STORE_METADATA_KEY])
+        if self.header.get('format_version') != STORE_FORMAT_VERSION:
+            raise SignalStoreError(
+                f"Signal store {self.path} has format version {self.header.get('format_version')}, "
+                f"expected {STORE_FORMAT_VERSION}"
+            )
+
+        self.timestamps = self._column_array(table, TIMESTAMP_COLUMN)
+        self.columns: Dict[str, np.ndarray] = {}
+        for name, dtype in self.header['columns'].items():
+            values = self._column_array(table, name)
+            self.columns[name] = values.view(np.bool_) if dtype == 'bool' else values
+
+    @staticmethod
+    def _column_array(table: pa.Table, name: str) -> np.ndarray:
+        column = table.column(name)
+        if column.num_chunks == 0:
+            return np.empty(0, dtype=column.type.to_pandas_dtype())
+        return column.chunk(0).to_numpy(zero_copy_only=True)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def file_changed(self) -> bool:
+        """Whether the file at the store's path has been replaced since opening."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns) != self.file_signature
+
+    def close(self) -> None:
+        """Release the mapping once no arrays from it are referenced."""
+        self._source.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Convert macro_features.pkl to a memory-mapped Q50 signal store")
+    parser.add_argument("pickle_path", help="Trusted macro_features pickle to convert")
+    parser.add_argument("store_path", nargs="?", help="Output store (default: <pickle_path>.arrow)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+    try:
+        path = convert_pickle_to_store(args.pickle_path, args.store_path)
+    except (OSError, SignalStoreError) as e:
+        logger.error(f"Conversion failed: {e}")
+        return 1
+    print(f"Signal store written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,19 +4,25 @@ Trade Execution Record System for comprehensive trade logging and monitoring.
 This module provides comprehensive trade logging with transaction hashes,
 execution performance tracking (latency, slippage, gas costs), trade status
 monitoring and confirmation, and storage of signal context and regime data.
+Writes go through the shared write-behind journal; reads flush it first so
+they always see every write made before them. Execution statistics are kept
+as running aggregates updated when each write commits, so polling them does
+not scan the trade table.
 """
 
 import asyncio
 import json
 import logging
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from typing import Dict, List, Optional, Any
 import pandas as pd
 
-from sqlalchemy import Column, String, Numeric, DateTime, Boolean, Integer, Text, desc
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Column, String, Numeric, DateTime, Boolean, Integer, Text, desc, func
+from sqlalchemy.orm import Session
 
+from .database_manager import acquire_database, after_commit, release_database
+from .execution_stats import ExecutionStatsTracker, TradeContribution, as_date
 from .position_manager import PositionBase, TradeExecutionModel, TradeExecutionRecord
 
 
@@ -38,29 +44,93 @@ class TradeExecutionRecorder:
         self.config = config
         self.logger = logging.getLogger(__name__)
         
-        # Use the same database configuration as PositionManager
-        from sqlalchemy import create_engine
-        
-        db_config = config.get('database', {})
-        if db_config.get('type') == 'postgresql':
-            db_url = f"postgresql://{db_config.get('user')}:{db_config.get('password')}@{db_config.get('host')}:{db_config.get('port')}/{db_config.get('database')}"
-        else:
-            # Default to SQLite
-            db_path = db_config.get('path', 'nautilus_positions.db')
-            db_url = f"sqlite:///{db_path}"
-        
-        self.engine = create_engine(db_url, echo=False)
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        # Share the engine and write-behind journal with PositionManager
+        self.database = acquire_database(config)
+        self.engine = self.database.engine
+        self.SessionLocal = self.database.session_factory
+        self.journal = self.database.journal
+        self._active = True
         
         # Ensure tables exist
-        PositionBase.metadata.create_all(bind=self.engine)
+        self.database.ensure_tables(PositionBase.metadata)
         
-        self.logger.info(f"TradeExecutionRecorder initialized with database: {db_url}")
+        # Running execution statistics, seeded from the trade table once
+        self.execution_stats = ExecutionStatsTracker()
+        self._load_execution_stats()
+        
+        self.logger.info(f"TradeExecutionRecorder initialized with database: {self.database.url}")
     
     async def initialize(self) -> None:
         """Initialize the trade execution recorder."""
         self.logger.info("TradeExecutionRecorder initialized successfully")
     
+    def _load_execution_stats(self) -> None:
+        """Seed the running execution statistics from the trade table."""
+        try:
+            with self.SessionLocal() as session:
+                self.execution_stats.replace_with(self._query_execution_stats(session))
+        except Exception as e:
+            self.logger.error(f"Error loading execution statistics: {e}")
+    
+    def _query_execution_stats(
+        self,
+        session: Session,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> ExecutionStatsTracker:
+        """
+        Aggregate trades in a time range with SQL GROUP BY.
+        
+        Args:
+            session: Database session
+            start_date: Start of the range (optional)
+            end_date: End of the range, inclusive (optional)
+            
+        Returns:
+            ExecutionStatsTracker holding the aggregated trades
+        """
+        model = TradeExecutionModel
+        day = func.date(model.timestamp)
+        metric_columns = {
+            'latency_ms': model.execution_latency_ms,
+            'slippage_percent': model.slippage_percent,
+            'gas_used': model.gas_used,
+            'pnl_sol': model.pnl_sol
+        }
+        
+        filters = []
+        if start_date:
+            filters.append(model.timestamp >= start_date)
+        if end_date:
+            filters.append(model.timestamp <= end_date)
+        
+        sums = []
+        for column in metric_columns.values():
+            sums.extend([func.count(column), func.sum(column), func.sum(column * column)])
+        
+        tracker = ExecutionStatsTracker()
+        groups = session.query(
+            day, model.regime_at_execution, model.execution_status, func.count(model.id), *sums
+        ).filter(*filters).group_by(day, model.regime_at_execution, model.execution_status)
+        
+        for row in groups:
+            metric_sums = {
+                metric: tuple(row[4 + 3 * i:7 + 3 * i]) for i, metric in enumerate(metric_columns)
+            }
+            tracker.add_group(as_date(row[0]), row[1] or 'unknown', row[2] or 'unknown', row[3], metric_sums)
+        
+        # Latencies are integer milliseconds, so the distinct values per day are few
+        latencies = session.query(
+            day, model.regime_at_execution, model.execution_latency_ms, func.count(model.id)
+        ).filter(*filters, model.execution_latency_ms.isnot(None)).group_by(
+            day, model.regime_at_execution, model.execution_latency_ms
+        )
+        
+        for row in latencies:
+            tracker.add_latencies(as_date(row[0]), row[1] or 'unknown', float(row[2]), row[3])
+        
+        return tracker
+    
     async def record_trade_attempt(
         self,
         mint_address: str,
@@ -87,30 +157,33 @@ class TradeExecutionRecorder:
             Trade ID for tracking the execution
         """
         try:
-            import uuid
             trade_id = f"{action}_{mint_address}_{int(datetime.utcnow().timestamp())}_{uuid.uuid4().hex[:8]}"
             
-            with self.SessionLocal() as session:
-                trade_record = TradeExecutionModel(
-                    trade_id=trade_id,
-                    mint_address=mint_address,
-                    pair_address=pair_address,
-                    timestamp=datetime.utcnow(),
-                    action=action,
-                    sol_amount=sol_amount,
-                    token_amount=token_amount,
-                    expected_price=expected_price,
-                    execution_status='pending',
-                    signal_data=json.dumps(signal_data),
-                    regime_at_execution=signal_data.get('regime', 'unknown'),
-                    retry_count=0
-                )
-                
+            trade_values = dict(
+                trade_id=trade_id,
+                mint_address=mint_address,
+                pair_address=pair_address,
+                timestamp=datetime.utcnow(),
+                action=action,
+                sol_amount=sol_amount,
+                token_amount=token_amount,
+                expected_price=expected_price,
+                execution_status='pending',
+                signal_data=json.dumps(signal_data),
+                regime_at_execution=signal_data.get('regime', 'unknown'),
+                retry_count=0
+            )
+            
+            def apply(session: Session) -> None:
+                trade_record = TradeExecutionModel(**trade_values)
                 session.add(trade_record)
-                session.commit()
-                
-                self.logger.info(f"Trade attempt recorded: {trade_id}")
-                return trade_id
+                contribution = TradeContribution.from_record(trade_record)
+                after_commit(session, lambda: self.execution_stats.apply(None, contribution))
+            
+            self.journal.submit(apply)
+            
+            self.logger.info(f"Trade attempt recorded: {trade_id}")
+            return trade_id
                 
         except Exception as e:
             self.logger.error(f"Error recording trade attempt: {e}")
@@ -130,54 +203,52 @@ class TradeExecutionRecorder:
             execution_result: Result from PumpSwap execution
             execution_latency_ms: Execution latency in milliseconds
         """
-        try:
-            with self.SessionLocal() as session:
-                trade_record = session.query(TradeExecutionModel).filter(
-                    TradeExecutionModel.trade_id == trade_id
-                ).first()
-                
-                if not trade_record:
-                    self.logger.warning(f"Trade record not found: {trade_id}")
-                    return
-                
-                # Update execution details
-                trade_record.transaction_hash = execution_result.get('transaction_hash')
-                trade_record.actual_price = execution_result.get('actual_price')
-                trade_record.execution_status = execution_result.get('status', 'unknown')
-                trade_record.gas_used = execution_result.get('gas_used')
-                trade_record.execution_latency_ms = execution_latency_ms
-                
-                # Calculate performance metrics
-                if trade_record.expected_price and trade_record.actual_price:
-                    expected = float(trade_record.expected_price)
-                    actual = float(trade_record.actual_price)
-                    
-                    # Calculate slippage
-                    slippage = abs(actual - expected) / expected * 100
-                    trade_record.slippage_percent = slippage
-                
-                # Calculate price impact if available
-                if 'price_impact_percent' in execution_result:
-                    trade_record.price_impact_percent = execution_result['price_impact_percent']
-                
-                # Calculate P&L for sell orders
-                if trade_record.action == 'sell' and 'sol_received' in execution_result:
-                    sol_received = execution_result['sol_received']
-                    if trade_record.token_amount and trade_record.expected_price:
-                        expected_sol = float(trade_record.token_amount) * float(trade_record.expected_price)
-                        trade_record.pnl_sol = sol_received - expected_sol
-                
-                # Handle errors
-                if execution_result.get('status') == 'error':
-                    trade_record.error_message = execution_result.get('error_message', 'Unknown error')
-                    trade_record.retry_count += 1
-                
-                session.commit()
-                
-                self.logger.info(f"Trade execution updated: {trade_id} - {execution_result.get('status')}")
-                
-        except Exception as e:
-            self.logger.error(f"Error updating trade execution {trade_id}: {e}")
+        def apply(session: Session) -> None:
+            trade_record = session.query(TradeExecutionModel).filter(
+                TradeExecutionModel.trade_id == trade_id
+            ).first()
+            
+            if not trade_record:
+                self.logger.warning(f"Trade record not found: {trade_id}")
+                return
+            
+            before = TradeContribution.from_record(trade_record)
+            # Update execution details
+            trade_record.transaction_hash = execution_result.get('transaction_hash')
+            trade_record.actual_price = execution_result.get('actual_price')
+            trade_record.execution_status = execution_result.get('status', 'unknown')
+            trade_record.gas_used = execution_result.get('gas_used')
+            trade_record.execution_latency_ms = execution_latency_ms
+            
+            # Calculate performance metrics
+            if trade_record.expected_price and trade_record.actual_price:
+                expected = float(trade_record.expected_price)
+                actual = float(trade_record.actual_price)
+                
+                # Calculate slippage
+                slippage = abs(actual - expected) / expected * 100
+                trade_record.slippage_percent = slippage
+            
+            # Calculate price impact if available
+            if 'price_impact_percent' in execution_result:
+                trade_record.price_impact_percent = execution_result['price_impact_percent']
+            
+            # Calculate P&L for sell orders
+            if trade_record.action == 'sell' and 'sol_received' in execution_result:
+                sol_received = execution_result['sol_received']
+                if trade_record.token_amount and trade_record.expected_price:
+                    expected_sol = float(trade_record.token_amount) * float(trade_record.expected_price)
+                    trade_record.pnl_sol = sol_received - expected_sol
+            
+            # Handle errors
+            if execution_result.get('status') == 'error':
+                trade_record.error_message = execution_result.get('error_message', 'Unknown error')
+                trade_record.retry_count += 1
+            
+            self._track_change(session, before, trade_record)
+            self.logger.info(f"Trade execution updated: {trade_id} - {execution_result.get('status')}")
+        
+        self.journal.submit(apply)
     
     async def confirm_transaction(
         self,
@@ -193,40 +264,38 @@ class TradeExecutionRecorder:
             transaction_hash: Blockchain transaction hash
             confirmation_data: Additional confirmation data from blockchain
         """
-        try:
-            with self.SessionLocal() as session:
-                trade_record = session.query(TradeExecutionModel).filter(
-                    TradeExecutionModel.trade_id == trade_id
-                ).first()
-                
-                if not trade_record:
-                    self.logger.warning(f"Trade record not found for confirmation: {trade_id}")
-                    return
-                
-                # Update confirmation status
-                trade_record.execution_status = 'confirmed'
-                trade_record.transaction_hash = transaction_hash
-                
-                # Update with blockchain confirmation data
-                if 'gas_used' in confirmation_data:
-                    trade_record.gas_used = confirmation_data['gas_used']
-                
-                if 'actual_price' in confirmation_data:
-                    trade_record.actual_price = confirmation_data['actual_price']
-                
-                # Recalculate slippage with confirmed price
-                if trade_record.expected_price and trade_record.actual_price:
-                    expected = float(trade_record.expected_price)
-                    actual = float(trade_record.actual_price)
-                    slippage = abs(actual - expected) / expected * 100
-                    trade_record.slippage_percent = slippage
-                
-                session.commit()
-                
-                self.logger.info(f"Transaction confirmed: {trade_id} - {transaction_hash}")
-                
-        except Exception as e:
-            self.logger.error(f"Error confirming transaction {trade_id}: {e}")
+        def apply(session: Session) -> None:
+            trade_record = session.query(TradeExecutionModel).filter(
+                TradeExecutionModel.trade_id == trade_id
+            ).first()
+            
+            if not trade_record:
+                self.logger.warning(f"Trade record not found for confirmation: {trade_id}")
+                return
+            
+            before = TradeContribution.from_record(trade_record)
+            # Update confirmation status
+            trade_record.execution_status = 'confirmed'
+            trade_record.transaction_hash = transaction_hash
+            
+            # Update with blockchain confirmation data
+            if 'gas_used' in confirmation_data:
+                trade_record.gas_used = confirmation_data['gas_used']
+            
+            if 'actual_price' in confirmation_data:
+                trade_record.actual_price = confirmation_data['actual_price']
+            
+            # Recalculate slippage with confirmed price
+            if trade_record.expected_price and trade_record.actual_price:
+                expected = float(trade_record.expected_price)
+                actual = float(trade_record.actual_price)
+                slippage = abs(actual - expected) / expected * 100
+                trade_record.slippage_percent = slippage
+            
+            self._track_change(session, before, trade_record)
+            self.logger.info(f"Transaction confirmed: {trade_id} - {transaction_hash}")
+        
+        self.journal.submit(apply)
     
     async def mark_trade_failed(
         self,
@@ -242,30 +311,38 @@ class TradeExecutionRecorder:
             error_message: Error message describing the failure
             retry_count: Number of retry attempts
         """
-        try:
-            with self.SessionLocal() as session:
-                trade_record = session.query(TradeExecutionModel).filter(
-                    TradeExecutionModel.trade_id == trade_id
-                ).first()
-                
-                if not trade_record:
-                    self.logger.warning(f"Trade record not found for failure: {trade_id}")
-                    return
-                
-                trade_record.execution_status = 'failed'
-                trade_record.error_message = error_message
-                
-                if retry_count is not None:
-                    trade_record.retry_count = retry_count
-                else:
-                    trade_record.retry_count += 1
-                
-                session.commit()
-                
-                self.logger.warning(f"Trade marked as failed: {trade_id} - {error_message}")
-                
-        except Exception as e:
-            self.logger.error(f"Error marking trade as failed {trade_id}: {e}")
+        def apply(session: Session) -> None:
+            trade_record = session.query(TradeExecutionModel).filter(
+                TradeExecutionModel.trade_id == trade_id
+            ).first()
+            
+            if not trade_record:
+                self.logger.warning(f"Trade record not found for failure: {trade_id}")
+                return
+            
+            before = TradeContribution.from_record(trade_record)
+            trade_record.execution_status = 'failed'
+            trade_record.error_message = error_message
+            
+            if retry_count is not None:
+                trade_record.retry_count = retry_count
+            else:
+                trade_record.retry_count += 1
+            
+            self._track_change(session, before, trade_record)
+            self.logger.warning(f"Trade marked as failed: {trade_id} - {error_message}")
+        
+        self.journal.submit(apply)
+    
+    def _track_change(
+        self,
+        session: Session,
+        before: TradeContribution,
+        trade_record: TradeExecutionModel
+    ) -> None:
+        """Move a modified trade between statistics buckets once its write commits."""
+        after = TradeContribution.from_record(trade_record)
+        after_commit(session, lambda: self.execution_stats.apply(before, after))
     
     async def get_trade_record(self, trade_id: str) -> Optional[TradeExecutionRecord]:
         """
@@ -278,6 +355,9 @@ class TradeExecutionRecorder:
             TradeExecutionRecord if found, None otherwise
         """
         try:
+            # Read-your-writes: apply queued writes first
+            await self.journal.flush()
+            
             with self.SessionLocal() as session:
                 trade_model = session.query(TradeExecutionModel).filter(
                     TradeExecutionModel.trade_id == trade_id
@@ -339,6 +419,9 @@ class TradeExecutionRecorder:
             List of TradeExecutionRecord objects
         """
         try:
+            # Read-your-writes: apply queued writes first
+            await self.journal.flush()
+            
             with self.SessionLocal() as session:
                 query = session.query(TradeExecutionModel)
                 
@@ -398,6 +481,9 @@ class TradeExecutionRecorder:
         """
         Get execution performance statistics.
         
+        Without a date range the running aggregates are returned directly;
+        a date range is aggregated in the database with GROUP BY.
+        
         Args:
             start_date: Start date for statistics (optional)
             end_date: End date for statistics (optional)
@@ -406,74 +492,46 @@ class TradeExecutionRecorder:
             Dictionary with execution statistics
         """
         try:
+            # Read-your-writes: apply queued writes first
+            await self.journal.flush()
+            
+            if start_date is None and end_date is None:
+                return self.execution_stats.statistics()
+            
             with self.SessionLocal() as session:
-                query = session.query(TradeExecutionModel)
-                
-                if start_date:
-                    query = query.filter(TradeExecutionModel.timestamp >= start_date)
-                
-                if end_date:
-                    query = query.filter(TradeExecutionModel.timestamp <= end_date)
-                
-                all_trades = query.all()
-                
-                if not all_trades:
-                    return {
-                        'total_trades': 0,
-                        'successful_trades': 0,
-                        'failed_trades': 0,
-                        'success_rate': 0,
-                        'average_execution_latency_ms': 0,
-                        'average_slippage_percent': 0,
-                        'average_gas_used': 0,
-                        'total_pnl_sol': 0
-                    }
-                
-                # Calculate statistics
-                total_trades = len(all_trades)
-                successful_trades = len([t for t in all_trades if t.execution_status == 'confirmed'])
-                failed_trades = len([t for t in all_trades if t.execution_status == 'failed'])
-                success_rate = (successful_trades / total_trades) * 100 if total_trades > 0 else 0
-                
-                # Latency statistics
-                latencies = [t.execution_latency_ms for t in all_trades if t.execution_latency_ms is not None]
-                avg_latency = sum(latencies) / len(latencies) if latencies else 0
-                
-                # Slippage statistics
-                slippages = [float(t.slippage_percent) for t in all_trades if t.slippage_percent is not None]
-                avg_slippage = sum(slippages) / len(slippages) if slippages else 0
-                
-                # Gas statistics
-                gas_amounts = [t.gas_used for t in all_trades if t.gas_used is not None]
-                avg_gas = sum(gas_amounts) / len(gas_amounts) if gas_amounts else 0
-                
-                # P&L statistics
-                pnls = [float(t.pnl_sol) for t in all_trades if t.pnl_sol is not None]
-                total_pnl = sum(pnls) if pnls else 0
-                
-                return {
-                    'total_trades': total_trades,
-                    'successful_trades': successful_trades,
-                    'failed_trades': failed_trades,
-                    'success_rate': success_rate,
-                    'average_execution_latency_ms': avg_latency,
-                    'average_slippage_percent': avg_slippage,
-                    'average_gas_used': avg_gas,
-                    'total_pnl_sol': total_pnl,
-                    'regime_breakdown': self._get_regime_breakdown(all_trades)
-                }
+                return self._query_execution_stats(session, start_date, end_date).statistics()
                 
         except Exception as e:
             self.logger.error(f"Error getting execution statistics: {e}")
             return {}
     
-    def _get_regime_breakdown(self, trades: List[TradeExecutionModel]) -> Dict[str, int]:
-        """Get breakdown of trades by regime."""
-        regime_counts = {}
-        for trade in trades:
-            regime = trade.regime_at_execution or 'unknown'
-            regime_counts[regime] = regime_counts.get(regime, 0) + 1
-        return regime_counts
+    async def get_daily_execution_statistics(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Dict[date, Dict[str, Any]]:
+        """
+        Get execution performance statistics per day from the running aggregates.
+        
+        Args:
+            start_date: First day to include (optional)
+            end_date: Last day to include (optional)
+            
+        Returns:
+            Dict mapping day to its execution statistics, oldest first
+        """
+        try:
+            await self.journal.flush()
+            
+            daily = self.execution_stats.daily_statistics()
+            return {
+                day: stats for day, stats in daily.items()
+                if (start_date is None or day >= start_date) and (end_date is None or day <= end_date)
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error getting daily execution statistics: {e}")
+            return {}
     
     async def cleanup_old_records(self, days_to_keep: int = 30) -> int:
         """
@@ -487,6 +545,7 @@ class TradeExecutionRecorder:
         """
         try:
             cutoff_date = datetime.utcnow() - pd.Timedelta(days=days_to_keep)
+            await self.journal.flush()
             
             with self.SessionLocal() as session:
                 deleted_count = session.query(TradeExecutionModel).filter(
@@ -495,6 +554,9 @@ class TradeExecutionRecorder:
                 
                 session.commit()
                 
+                # Bulk deletes bypass the per-trade updates; rebuild from the table
+                self.execution_stats.replace_with(self._query_execution_stats(session))
+                
                 self.logger.info(f"Cleaned up {deleted_count} old trade records")
                 return deleted_count
                 
@@ -502,10 +564,17 @@ class TradeExecutionRecorder:
             self.logger.error(f"Error cleaning up old records: {e}")
             return 0
     
+    async def flush(self) -> None:
+        """Wait until all queued trade writes have been persisted."""
+        await self.journal.flush()
+    
     async def close(self) -> None:
-        """Close database connections and cleanup resources."""
+        """Flush pending writes and release the shared database."""
+        if not self._active:
+            return
+        self._active = False
         try:
-            self.engine.dispose()
+            await release_database(self.database)
             self.logger.info("TradeExecutionRecorder closed successfully")
         except Exception as e:
-            self.logger.error(f"Error closing TradeExecutionRecorder: {e}")
\ No newline at end of file
+            self.logger.error(f"Error closing TradeExecutionRecorder: {e}")
@@ -13,12 +13,14 @@ from typing import Dict, List, Optional, Tuple, Any
 import logging
 from pathlib import Path
 import json
+import re
 import shutil
+import tempfile
 from functools import partial
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from tqdm import tqdm
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from gecko_terminal_collector.database.manager import DatabaseManager
 
 logger = logging.getLogger(__name__)
@@ -45,13 +47,24 @@ class QLibBinDataExporter:
     INSTRUMENTS_START_FIELD = "start_datetime"
     INSTRUMENTS_END_FIELD = "end_datetime"
     
+    # History columns always fetched to key, symbolize and order rows
+    HISTORY_KEY_COLUMNS = ['pool_id', 'datetime', 'qlib_symbol']
+    HISTORY_TEXT_COLUMNS = {
+        'pool_id', 'qlib_symbol', 'network_id', 'dex_id', 'collection_interval', 'qlib_features_json'
+    }
+    # Rows per typed chunk when streaming history data
+    FETCH_CHUNK_SIZE = 50000
+    # COPY output kept in memory up to this size before spilling to disk
+    COPY_SPOOL_BYTES = 64 * 1024 * 1024
+    
     def __init__(
         self, 
         db_manager: DatabaseManager, 
         qlib_dir: str = "./qlib_data",
         freq: str = "60min",
         max_workers: int = 16,
-        backup_dir: str = None
+        backup_dir: str = None,
+        feature_mapping: Optional[Dict[str, str]] = None
     ):
         self.db_manager = db_manager
         self.qlib_dir = Path(qlib_dir).expanduser()
@@ -68,8 +81,9 @@ class QLibBinDataExporter:
         self._features_dir = self.qlib_dir.joinpath(self.FEATURES_DIR_NAME)
         self._instruments_dir = self.qlib_dir.joinpath(self.INSTRUMENTS_DIR_NAME)
         
-        # QLib feature mapping (database field -> qlib field)
-        self.feature_mapping = {
+        # QLib feature mapping (database field -> qlib field); only these
+        # columns are read from the database
+        self.feature_mapping = feature_mapping or {
             'open_price_usd': 'open',
             'high_price_usd': 'high', 
             'low_price_usd': 'low',
@@ -188,68 +202,76 @@ class QLibBinDataExporter:
         end_date: datetime,
         networks: List[str] = None,
         min_liquidity_usd: float = 1000,
-        min_volume_usd: float = 100
+        min_volume_usd: float = 100,
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
-        """Fetch history data from database."""
+        """
+        Fetch history data from database.
+        
+        Only the key columns and the columns of the feature mapping are read,
+        with all filters applied in the database, and rows are streamed in
+        typed chunks (COPY ... TO STDOUT on PostgreSQL, chunked cursor reads
+        elsewhere) instead of being materialized as Python tuples first.
+        qlib_features_json is only fetched when listed in columns and is
+        never parsed.
+        
+        Args:
+            start_date: Start date for data export
+            end_date: End date for data export
+            networks: List of networks to include (None for all)
+            min_liquidity_usd: Minimum liquidity threshold
+            min_volume_usd: Minimum volume threshold
+            columns: History columns to fetch (defaults to those the export needs)
+            
+        Returns:
+            DataFrame with one row per history record, ordered by pool and time
+        """
         try:
-            # Build query
-            query = """
-            SELECT 
-                pool_id,
-                timestamp,
-                datetime,
-                collection_interval,
-                network_id,
-                dex_id,
-                qlib_symbol,
-                
-                -- Price data
-                open_price_usd,
-                high_price_usd,
-                low_price_usd,
-                close_price_usd,
-                
-                -- Volume and liquidity
-                volume_usd_h24,
-                volume_usd_h1,
-                reserve_in_usd,
-                liquidity_depth_usd,
-                
-                -- Market metrics
-                market_cap_usd,
-                fdv_usd,
-                
-                -- Price changes
-                price_change_percentage_h1,
-                price_change_percentage_h24,
-                price_change_percentage_interval,
-                
-                -- Trading activity
-                transactions_h24_buys,
-                transactions_h24_sells,
-                transactions_h1_buys,
-                transactions_h1_sells,
-                buy_sell_ratio_h24,
-                
-                -- Technical indicators
-                relative_strength_index,
-                moving_average_convergence,
-                trend_strength,
-                volatility_score,
-                
-                -- Signal analysis
-                signal_score,
-                activity_score,
-                momentum_indicator,
-                
-                -- Pool characteristics
-                pool_age_hours,
-                is_new_pool,
-                data_quality_score,
-                
-                -- QLib features
-                qlib_features_json
+            columns = columns or self._history_columns()
+            query, params = self._build_history_query(
+                columns, start_date, end_date, networks, min_liquidity_usd, min_volume_usd
+            )
+            
+            engine = self.db_manager.connection.engine
+            if engine.dialect.name == 'postgresql':
+                chunks = self._stream_history_copy(engine, query, params, columns)
+            else:
+                chunks = self._stream_history_chunks(engine, query, params, columns)
+            
+            frames = [self._type_history_chunk(chunk) for chunk in chunks if not chunk.empty]
+            if not frames:
+                return pd.DataFrame()
+            
+            return pd.concat(frames, ignore_index=True)
                 
+        except Exception as e:
+            logger.error(f"Error fetching history data: {e}")
+            return pd.DataFrame()
+    
+    def _history_columns(self) -> List[str]:
+        """History columns needed for the configured feature mapping."""
+        columns = list(self.HISTORY_KEY_COLUMNS)
+        for column in self.feature_mapping:
+            if column not in columns:
+                columns.append(column)
+        return columns
+    
+    def _build_history_query(
+        self,
+        columns: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        networks: Optional[List[str]],
+        min_liquidity_usd: float,
+        min_volume_usd: float
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Build the history SELECT for the requested columns."""
+        for column in columns:
+            if not re.fullmatch(r'[a-z_][a-z0-9_]*', column):
+                raise ValueError(f"Invalid history column name: {column}")
+        
+        query = f"""
+            SELECT {', '.join(columns)}
             FROM new_pools_history_enhanced
             WHERE datetime >= :start_date 
                 AND datetime <= :end_date
@@ -257,38 +279,76 @@ class QLibBinDataExporter:
                 AND volume_usd_h24 >= :min_volume
                 AND data_quality_score >= 50
             """
-            
-            params = {
-                'start_date': start_date,
-                'end_date': end_date,
-                'min_liquidity': min_liquidity_usd,
-                'min_volume': min_volume_usd
-            }
-            
-            # Add network filter if specified
-            if networks:
-                query += " AND network_id = ANY(:networks)"
-                params['networks'] = networks
-            
-            query += " ORDER BY pool_id, datetime"
-            
-            # Execute query
-            with self.db_manager.connection.get_session() as session:
-                result = session.execute(text(query), params)
-                data = result.fetchall()
-                
-                if not data:
-                    return pd.DataFrame()
-                
-                # Convert to DataFrame
-                columns = result.keys()
-                df = pd.DataFrame(data, columns=columns)
-                
-                return df
-                
-        except Exception as e:
-            logger.error(f"Error fetching history data: {e}")
-            return pd.DataFrame()
+        
+        params = {
+            'start_date': start_date,
+            'end_date': end_date,
+            'min_liquidity': min_liquidity_usd,
+            'min_volume': min_volume_usd
+        }
+        
+        # Add network filter if specified
+        is_postgresql = self.db_manager.connection.engine.dialect.name == 'postgresql'
+        if networks:
+            query += " AND network_id = ANY(:networks)" if is_postgresql else " AND network_id IN :networks"
+            params['networks'] = list(networks)
+        
+        query += " ORDER BY pool_id, datetime"
+        
+        statement = text(query)
+        if networks and not is_postgresql:
+            statement = statement.bindparams(bindparam('networks', expanding=True))
+        return statement, params
+    
+    def _stream_history_copy(self, engine, query, params: Dict[str, Any], columns: List[str]):
+        """Stream history rows from PostgreSQL with COPY ... TO STDOUT as CSV."""
+        raw_connection = engine.raw_connection()
+        try:
+            with raw_connection.cursor() as cursor:
+                copy_sql = self._history_copy_sql(engine.dialect, query, params, cursor.mogrify)
+                with tempfile.SpooledTemporaryFile(max_size=self.COPY_SPOOL_BYTES, mode='w+b') as buffer:
+                    cursor.copy_expert(copy_sql, buffer)
+                    buffer.seek(0)
+                    
+                    yield from pd.read_csv(
+                        buffer,
+                        dtype=self._history_dtypes(columns),
+                        chunksize=self.FETCH_CHUNK_SIZE
+                    )
+        finally:
+            raw_connection.close()
+    
+    @staticmethod
+    def _history_copy_sql(dialect, query, params: Dict[str, Any], mogrify) -> str:
+        """Render the history SELECT with its parameters inlined into a COPY statement."""
+        compiled = query.bindparams(**params).compile(dialect=dialect)
+        select_sql = mogrify(str(compiled), compiled.params).decode()
+        return f"COPY ({select_sql}) TO STDOUT WITH (FORMAT csv, HEADER true)"
+    
+    def _stream_history_chunks(self, engine, query, params: Dict[str, Any], columns: List[str]):
+        """Stream history rows with a server-side cursor in DataFrame chunks."""
+        with engine.connect().execution_options(stream_results=True) as connection:
+            yield from pd.read_sql_query(
+                query,
+                connection,
+                params=params,
+                chunksize=self.FETCH_CHUNK_SIZE,
+                dtype=self._history_dtypes(columns)
+            )
+    
+    def _history_dtypes(self, columns: List[str]) -> Dict[str, Any]:
+        """Column dtypes of fetched history chunks (datetime is parsed separately)."""
+        return {
+            column: object if column in self.HISTORY_TEXT_COLUMNS else 'float64'
+            for column in columns if column != 'datetime'
+        }
+    
+    @staticmethod
+    def _type_history_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+        """Normalize the datetime column of a fetched chunk to naive UTC."""
+        if 'datetime' in chunk.columns:
+            chunk['datetime'] = pd.to_datetime(chunk['datetime'], utc=True).dt.tz_localize(None)
+        return chunk
     
     def _process_for_qlib_bin(self, raw_data: pd.DataFrame) -> pd.DataFrame:
         """Process raw data for QLib bin format."""
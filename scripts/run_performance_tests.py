@@ -23,6 +23,14 @@ sys.path.insert(0, str(project_root))
 
 from gecko_terminal_collector.config.models import DatabaseConfig
 from gecko_terminal_collector.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from tests.benchmark_suite import (
+    BENCHMARKS,
+    BaselineStore,
+    BenchmarkSuite,
+    check_startup_budget,
+    compare_results,
+    format_comparison_report
+)
 from tests.performance_config import get_performance_config, create_custom_config
 from tests.test_performance_load import (
     TestSQLitePerformanceBaseline,
@@ -30,6 +38,8 @@ from tests.test_performance_load import (
     TestDatabaseScalabilityLimits,
     TestMemoryResourceMonitoring,
     TestAPIRateLimitCompliance,
+    TestLoggingPipelineOverhead,
+    TestReplayServerThroughput,
     TestPostgreSQLMigrationBenchmarks,
     test_comprehensive_performance_suite
 )
@@ -255,6 +265,44 @@ class PerformanceTestRunner:
         
         return results
     
+    async def run_logging_tests(self) -> Dict:
+        """Run logging pipeline overhead benchmark."""
+        logger.info("Running logging overhead tests...")
+        
+        logging_tester = TestLoggingPipelineOverhead()
+        results = {}
+        
+        try:
+            logger.info("Measuring OHLCV cycle logging overhead...")
+            overhead_results = await logging_tester.test_ohlcv_cycle_logging_overhead()
+            results['ohlcv_cycle_logging_overhead'] = 'PASSED'
+            results['logging_overhead_details'] = overhead_results
+            
+        except Exception as e:
+            logger.error(f"Logging overhead test failed: {e}")
+            results['ohlcv_cycle_logging_overhead'] = f'FAILED: {e}'
+        
+        return results
+    
+    async def run_replay_tests(self, db_manager: SQLAlchemyDatabaseManager) -> Dict:
+        """Run end-to-end collector throughput against the local replay server."""
+        logger.info("Running replay server throughput tests...")
+        
+        replay_tester = TestReplayServerThroughput()
+        results = {}
+        
+        try:
+            logger.info("Measuring collector throughput through the HTTP client and SDK...")
+            throughput_results = await replay_tester.test_collector_throughput_against_replay_server(db_manager)
+            results['collector_throughput'] = 'PASSED'
+            results['throughput_details'] = throughput_results
+            
+        except Exception as e:
+            logger.error(f"Replay throughput test failed: {e}")
+            results['collector_throughput'] = f'FAILED: {e}'
+        
+        return results
+    
     async def run_migration_benchmark_tests(self, db_manager: SQLAlchemyDatabaseManager) -> Dict:
         """Run PostgreSQL migration benchmark tests."""
         logger.info("Running PostgreSQL migration benchmark tests...")
@@ -315,7 +363,7 @@ class PerformanceTestRunner:
         try:
             all_categories = [
                 'baseline', 'concurrency', 'scalability', 
-                'memory', 'rate_limit', 'migration', 'comprehensive'
+                'memory', 'rate_limit', 'logging', 'replay', 'migration', 'comprehensive'
             ]
             
             categories_to_run = test_categories or all_categories
@@ -331,6 +379,10 @@ class PerformanceTestRunner:
                     self.results['memory'] = await self.run_memory_tests(db_manager)
                 elif category == 'rate_limit':
                     self.results['rate_limit'] = await self.run_rate_limit_tests()
+                elif category == 'logging':
+                    self.results['logging'] = await self.run_logging_tests()
+                elif category == 'replay':
+                    self.results['replay'] = await self.run_replay_tests(db_manager)
                 elif category == 'migration':
                     self.results['migration'] = await self.run_migration_benchmark_tests(db_manager)
                 elif category == 'comprehensive':
@@ -413,7 +465,22 @@ class PerformanceTestRunner:
                         if 'migration_recommended' in details:
                             status = "MIGRATE" if details['migration_recommended'] else "OK"
                             report_lines.append(f"  {indicator}: {status}")
-        
+
+        # Replay throughput
+        replay_details = self.results.get('replay', {}).get('throughput_details')
+        if replay_details:
+            report_lines.extend([
+                "",
+                "REPLAY SERVER THROUGHPUT",
+                "-" * 40,
+            ])
+            for collector_name, summary in replay_details.items():
+                report_lines.append(
+                    f"  {collector_name}: {summary['pools_per_minute']:.0f} pools/min, "
+                    f"{summary['api_calls_per_record']:.3f} API calls/record, "
+                    f"p99 cycle {summary['p99_cycle_seconds']:.2f}s"
+                )
+
         report_content = "\n".join(report_lines)
         
         if output_file:
@@ -424,6 +491,70 @@ class PerformanceTestRunner:
         return report_content
 
 
+async def run_benchmarks(args) -> int:
+    """
+    Run the regression-gated benchmark suite.
+
+    Returns:
+        Process exit code (1 when any metric regressed against the baseline)
+    """
+    config = get_performance_config()
+    suite = BenchmarkSuite(iterations=args.iterations, warmup=args.warmup)
+    store = BaselineStore(args.baseline_dir)
+
+    # Load the baseline up front so a missing or stale one fails fast
+    baseline = store.load(args.compare_baseline) if args.compare_baseline else None
+
+    results = await suite.run(args.benchmarks or None)
+
+    print(f"{'benchmark':<18} {'median_s':>10} {'p95_s':>10} {'items/s':>12} {'peak_rss_mb':>12}")
+    print("-" * 66)
+    for result in results.values():
+        print(
+            f"{result.name:<18} {result.median_seconds:>10.4f} {result.p95_seconds:>10.4f} "
+            f"{result.throughput:>12.1f} {result.peak_rss_mb:>12.1f}"
+        )
+
+    if args.json_output:
+        with open(args.json_output, 'w') as f:
+            json.dump({name: r.to_dict() for name, r in results.items()}, f, indent=2)
+        logger.info(f"JSON results saved to: {args.json_output}")
+
+    if args.save_baseline:
+        path = store.save(args.save_baseline, results)
+        logger.info(f"Baseline '{args.save_baseline}' saved to: {path}")
+
+    if args.compare_baseline:
+        comparisons = compare_results(baseline, results, config.regression_tolerances)
+        print()
+        print(f"Comparison against baseline '{args.compare_baseline}':")
+        print(format_comparison_report(comparisons))
+
+        regressions = [c for c in comparisons if c.regressed]
+        if regressions:
+            logger.error(f"{len(regressions)} benchmark metric(s) regressed")
+            return 1
+        logger.info("No benchmark regressions detected")
+
+    return 0
+
+
+def run_startup_check() -> int:
+    """
+    Check CLI startup against the configured startup budget.
+
+    Returns:
+        Process exit code (1 when the budget is exceeded)
+    """
+    violations = check_startup_budget(get_performance_config().startup_budget)
+    for violation in violations:
+        logger.error(f"Startup budget exceeded: {violation}")
+    if violations:
+        return 1
+    logger.info("CLI startup within budget")
+    return 0
+
+
 async def main():
     """Main entry point for the performance test runner."""
     parser = argparse.ArgumentParser(description="Run GeckoTerminal collector performance tests")
@@ -431,7 +562,7 @@ async def main():
     parser.add_argument(
         '--categories', 
         nargs='+', 
-        choices=['baseline', 'concurrency', 'scalability', 'memory', 'rate_limit', 'migration', 'comprehensive'],
+        choices=['baseline', 'concurrency', 'scalability', 'memory', 'rate_limit', 'logging', 'replay', 'migration', 'comprehensive'],
         help='Test categories to run (default: all)'
     )
     
@@ -453,6 +584,51 @@ async def main():
         help='Enable verbose logging'
     )
     
+    parser.add_argument(
+        '--benchmarks',
+        nargs='*',
+        choices=list(BENCHMARKS),
+        help='Run the benchmark suite instead of the load tests (no names: all benchmarks)'
+    )
+    
+    parser.add_argument(
+        '--iterations',
+        type=int,
+        help='Timed iterations per benchmark (default: per benchmark)'
+    )
+    
+    parser.add_argument(
+        '--warmup',
+        type=int,
+        help='Warmup iterations per benchmark (default: per benchmark)'
+    )
+    
+    parser.add_argument(
+        '--baseline-dir',
+        type=str,
+        help='Directory holding benchmark baselines (default: tests/performance_baselines)'
+    )
+    
+    parser.add_argument(
+        '--save-baseline',
+        type=str,
+        metavar='LABEL',
+        help='Save benchmark results as the named baseline'
+    )
+    
+    parser.add_argument(
+        '--compare-baseline',
+        type=str,
+        metavar='LABEL',
+        help='Compare benchmark results against the named baseline and fail on regression'
+    )
+    
+    parser.add_argument(
+        '--check-startup',
+        action='store_true',
+        help='Check CLI import time and --help latency against the startup budget'
+    )
+    
     args = parser.parse_args()
     
     # Configure logging
@@ -462,6 +638,16 @@ async def main():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
+    if args.check_startup:
+        sys.exit(run_startup_check())
+    
+    if args.benchmarks is not None or args.save_baseline or args.compare_baseline:
+        try:
+            sys.exit(await run_benchmarks(args))
+        except (ValueError, FileNotFoundError) as e:
+            logger.error(f"Benchmark run failed: {e}")
+            sys.exit(1)
+    
     # Run tests
     runner = PerformanceTestRunner()
     
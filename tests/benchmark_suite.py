@@ -0,0 +1,722 @@
+"""
+Regression-gated benchmark suite for the GeckoTerminal collector system.
+
+Named micro- and macrobenchmarks are run repeatedly after a warmup, and
+their per-iteration timings, throughput and peak RSS are stored as
+versioned JSON baselines. A later run is compared against a baseline and
+fails when throughput drops, or p95 latency or peak RSS rises, beyond the
+configured RegressionTolerances.
+
+CLI startup is additionally held to an absolute StartupBudget, measured
+with ``python -X importtime`` in a fresh interpreter.
+
+Used by scripts/run_performance_tests.py (--benchmarks, --save-baseline,
+--compare-baseline, --check-startup).
+"""
+
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import psutil
+
+from gecko_terminal_collector.config.models import DatabaseConfig
+from gecko_terminal_collector.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from tests.performance_config import RegressionTolerances, StartupBudget
+from tests.test_performance_load import (
+    generate_test_ohlcv_data,
+    generate_test_trade_data,
+    setup_test_pool
+)
+
+logger = logging.getLogger(__name__)
+
+
+BASELINE_SCHEMA_VERSION = 1
+DEFAULT_BASELINE_DIR = Path(__file__).parent / "performance_baselines"
+REPO_ROOT = Path(__file__).parent.parent
+CLI_MODULE = "gecko_terminal_collector.cli"
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements from repeated runs of one benchmark."""
+    name: str
+    kind: str
+    iterations: int
+    warmup: int
+    items_per_iteration: int
+    durations: List[float] = field(default_factory=list)
+    peak_rss_mb: float = 0.0
+
+    @property
+    def median_seconds(self) -> float:
+        return statistics.median(self.durations) if self.durations else 0.0
+
+    @property
+    def p95_seconds(self) -> float:
+        return percentile(self.durations, 95)
+
+    @property
+    def throughput(self) -> float:
+        """Items per second at the median iteration time."""
+        median = self.median_seconds
+        return self.items_per_iteration / median if median > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data.update({
+            'median_seconds': self.median_seconds,
+            'p95_seconds': self.p95_seconds,
+            'throughput': self.throughput,
+        })
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BenchmarkResult':
+        fields = {'name', 'kind', 'iterations', 'warmup', 'items_per_iteration', 'durations', 'peak_rss_mb'}
+        return cls(**{key: value for key, value in data.items() if key in fields})
+
+
+@dataclass
+class MetricComparison:
+    """Comparison of one metric between a baseline and the current run."""
+    benchmark: str
+    metric: str
+    baseline: float
+    current: float
+    tolerance: float
+    regressed: bool
+
+    @property
+    def change(self) -> float:
+        """Relative change from the baseline (positive means larger)."""
+        return (self.current - self.baseline) / self.baseline if self.baseline else 0.0
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def relative_mad(values: List[float]) -> float:
+    """Median absolute deviation relative to the median, a robust noise estimate."""
+    if len(values) < 2:
+        return 0.0
+    median = statistics.median(values)
+    if median == 0:
+        return 0.0
+    return statistics.median(abs(value - median) for value in values) / median
+
+
+class _PeakRSSMonitor:
+    """Sample process RSS on a background thread and keep the peak."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self):
+        self.peak_bytes = self._process.memory_info().rss
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stop.set()
+        self._thread.join()
+        self.peak_bytes = max(self.peak_bytes, self._process.memory_info().rss)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak_bytes = max(self.peak_bytes, self._process.memory_info().rss)
+
+    @property
+    def peak_mb(self) -> float:
+        return self.peak_bytes / (1024 * 1024)
+
+
+class Benchmark:
+    """
+    Base class for a named benchmark.
+
+    Subclasses prepare state in ``setup`` and do one unit of work per
+    ``run_once`` call, returning the number of items processed.
+    """
+
+    name = ""
+    kind = "micro"  # "micro" or "macro"
+    iterations = 10
+    warmup = 2
+
+    def __init__(self, work_dir: str):
+        self.work_dir = work_dir
+
+    async def setup(self) -> None:
+        pass
+
+    async def run_once(self, iteration: int) -> int:
+        raise NotImplementedError
+
+    async def teardown(self) -> None:
+        pass
+
+
+class _DatabaseBenchmark(Benchmark):
+    """Benchmark running against a fresh file-backed SQLite database."""
+
+    POOL_ID = "solana_bench_pool"
+
+    async def setup(self) -> None:
+        db_path = os.path.join(self.work_dir, f"{self.name}.db")
+        self.db_manager = SQLAlchemyDatabaseManager(DatabaseConfig(url=f"sqlite:///{db_path}", echo=False))
+        await self.db_manager.initialize()
+        await setup_test_pool(self.db_manager, self.POOL_ID)
+
+    async def teardown(self) -> None:
+        await self.db_manager.close()
+
+
+class OHLCVUpsertBenchmark(_DatabaseBenchmark):
+    """Store OHLCV batches where half the rows already exist."""
+
+    name = "ohlcv_upsert"
+    BATCH_SIZE = 1000
+
+    async def run_once(self, iteration: int) -> int:
+        # Each batch overlaps the previous one by half, exercising both paths
+        start = datetime(2024, 1, 1) + timedelta(hours=iteration * self.BATCH_SIZE // 2)
+        records = generate_test_ohlcv_data(self.POOL_ID, "1h", self.BATCH_SIZE, start)
+        await self.db_manager.store_ohlcv_data(records)
+        return len(records)
+
+
+class TradeInsertBenchmark(_DatabaseBenchmark):
+    """Insert batches of new trades."""
+
+    name = "trade_insert"
+    BATCH_SIZE = 1000
+
+    async def run_once(self, iteration: int) -> int:
+        start = datetime.utcnow() - timedelta(hours=12) + timedelta(seconds=iteration * self.BATCH_SIZE * 30)
+        network, _, address = self.POOL_ID.partition("_")
+        records = generate_test_trade_data(address, self.BATCH_SIZE, start)
+        for record in records:
+            # store_trade_data derives the network prefix of the pool id from
+            # the trade id, the same way the trade collector builds its ids.
+            record.id = f"{network}_{record.id}_{iteration}"
+        await self.db_manager.store_trade_data(records)
+        return len(records)
+
+
+class GapDetectionBenchmark(_DatabaseBenchmark):
+    """Detect gaps over a month of hourly candles with holes in it."""
+
+    name = "gap_detection"
+    CANDLES = 24 * 30
+
+    async def setup(self) -> None:
+        await super().setup()
+        self.start = datetime(2024, 1, 1)
+        records = generate_test_ohlcv_data(self.POOL_ID, "1h", self.CANDLES, self.start)
+        # Drop every 50th candle to create gaps
+        await self.db_manager.store_ohlcv_data([r for i, r in enumerate(records) if i % 50 != 25])
+        self.end = self.start + timedelta(hours=self.CANDLES - 1)
+
+    async def run_once(self, iteration: int) -> int:
+        await self.db_manager.get_data_gaps(self.POOL_ID, "1h", self.start, self.end)
+        return self.CANDLES
+
+
+class OHLCVRecordReadBenchmark(_DatabaseBenchmark):
+    """Read a quarter of hourly candles as OHLCVRecord dataclasses."""
+
+    name = "ohlcv_read_records"
+    CANDLES = 24 * 90
+
+    async def setup(self) -> None:
+        await super().setup()
+        records = generate_test_ohlcv_data(self.POOL_ID, "1h", self.CANDLES, datetime(2024, 1, 1))
+        await self.db_manager.store_ohlcv_data(records)
+
+    async def run_once(self, iteration: int) -> int:
+        records = await self.db_manager.get_ohlcv_data(self.POOL_ID, "1h")
+        return len(records)
+
+
+class OHLCVFrameReadBenchmark(OHLCVRecordReadBenchmark):
+    """Read the same candles as a columnar frame."""
+
+    name = "ohlcv_read_frame"
+
+    async def run_once(self, iteration: int) -> int:
+        frame = await self.db_manager.get_ohlcv_frame(self.POOL_ID, "1h")
+        return len(frame)
+
+
+class QLibExportBenchmark(_DatabaseBenchmark):
+    """Export hourly OHLCV for several pools in QLib format."""
+
+    name = "qlib_export"
+    kind = "macro"
+    iterations = 5
+    POOLS = 3
+    CANDLES = 500
+
+    async def setup(self) -> None:
+        await super().setup()
+        from gecko_terminal_collector.database.models import WatchlistEntry
+        from gecko_terminal_collector.qlib.exporter import QLibExporter
+
+        start = datetime(2024, 1, 1)
+        for i in range(self.POOLS):
+            pool_id = f"{self.POOL_ID}_{i}"
+            await setup_test_pool(self.db_manager, pool_id)
+            # The exporter's symbol list comes from the active watchlist
+            await self.db_manager.add_watchlist_entry(WatchlistEntry(pool_id=pool_id, is_active=True))
+            await self.db_manager.store_ohlcv_data(generate_test_ohlcv_data(pool_id, "1h", self.CANDLES, start))
+        self.exporter = QLibExporter(self.db_manager)
+
+    async def run_once(self, iteration: int) -> int:
+        df = await self.exporter.export_ohlcv_data(timeframe="1h")
+        return len(df)
+
+
+class SignalScoringBenchmark(Benchmark):
+    """Score new pools against their recent history."""
+
+    name = "signal_scoring"
+    POOLS = 200
+    HISTORY = 24
+
+    async def setup(self) -> None:
+        from gecko_terminal_collector.analysis.signal_analyzer import NewPoolsSignalAnalyzer
+
+        self.analyzer = NewPoolsSignalAnalyzer()
+        self.pools = []
+        for i in range(self.POOLS):
+            history = [
+                {
+                    'volume_usd_h24': 1000 + 50 * h + i,
+                    'reserve_in_usd': 5000 + 20 * h,
+                    'price_change_percentage_h1': (h % 7) - 3,
+                    'price_change_percentage_h24': (h % 11) - 5,
+                    'transactions_h1_buys': 5 + h % 4,
+                    'transactions_h1_sells': 3 + h % 3,
+                }
+                for h in range(self.HISTORY)
+            ]
+            current = dict(history[-1], volume_usd_h24=5000 + i, reserve_in_usd=9000)
+            self.pools.append((current, history))
+
+    async def run_once(self, iteration: int) -> int:
+        for current, history in self.pools:
+            self.analyzer.analyze_pool_signals(current, history)
+        return len(self.pools)
+
+
+class CollectorCycleBenchmark(_DatabaseBenchmark):
+    """Full OHLCV collector cycle through the HTTP client against the replay server."""
+
+    name = "collector_cycle"
+    kind = "macro"
+    iterations = 5
+    warmup = 1
+    POOLS = 3
+
+    async def setup(self) -> None:
+        await super().setup()
+        from tests.replay_server import (
+            GeckoTerminalReplayServer, ReplayServerConfig
+        )
+        from gecko_terminal_collector.collectors.ohlcv_collector import OHLCVCollector
+        from gecko_terminal_collector.config.models import (
+            APIConfig, CollectionConfig, ErrorConfig, TimeframeConfig
+        )
+        from gecko_terminal_collector.database.models import WatchlistEntry
+        from gecko_terminal_collector.utils.enhanced_rate_limiter import EnhancedRateLimiter
+
+        for i in range(self.POOLS):
+            pool_id = f"{self.POOL_ID}_{i}"
+            await setup_test_pool(self.db_manager, pool_id)
+            await self.db_manager.add_watchlist_entry(WatchlistEntry(pool_id=pool_id, is_active=True))
+
+        self.server = GeckoTerminalReplayServer(ReplayServerConfig(
+            fixtures_path=str(Path(__file__).parent.parent / "specs"),
+            latency_distribution="fixed",
+            latency_ms=5,
+            ohlcv_history_candles=100
+        ))
+        await self.server.start()
+
+        config = CollectionConfig(
+            timeframes=TimeframeConfig(ohlcv_default="1h", supported=["15m", "1h", "1d"]),
+            api=APIConfig(base_url=self.server.base_url, rate_limit_delay=0.0),
+            error_handling=ErrorConfig(max_retries=2, backoff_factor=0.1)
+        )
+        self.collector = OHLCVCollector(
+            config=config,
+            db_manager=self.db_manager,
+            rate_limiter=EnhancedRateLimiter(requests_per_minute=100000)
+        )
+
+    async def run_once(self, iteration: int) -> int:
+        await self.collector.collect()
+        self.server.advance_time(3600)
+        return self.POOLS
+
+    async def teardown(self) -> None:
+        await self.server.stop()
+        await super().teardown()
+
+
+@dataclass
+class ImportProfile:
+    """Per-module import costs parsed from ``python -X importtime`` output."""
+    self_us: Dict[str, int] = field(default_factory=dict)
+    cumulative_us: Dict[str, int] = field(default_factory=dict)
+
+    def cumulative_seconds(self, module: str) -> float:
+        return self.cumulative_us.get(module, 0) / 1e6
+
+    def slowest(self, count: int = 10) -> List[Tuple[str, float]]:
+        """Modules with the highest self time, in seconds."""
+        ranked = sorted(self.self_us.items(), key=lambda item: item[1], reverse=True)
+        return [(module, us / 1e6) for module, us in ranked[:count]]
+
+
+def parse_importtime(output: str) -> ImportProfile:
+    """Parse the stderr of a ``python -X importtime`` run."""
+    profile = ImportProfile()
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # column header
+        module = parts[2].strip()
+        profile.self_us[module] = int(parts[0])
+        profile.cumulative_us[module] = int(parts[1])
+    return profile
+
+
+def _run_python(args: List[str], **kwargs) -> subprocess.CompletedProcess:
+    """Run a fresh interpreter against this checkout of the package."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get('PYTHONPATH')]))
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True, text=True, cwd=REPO_ROOT, env=env, **kwargs
+    )
+
+
+def profile_imports(module: str) -> ImportProfile:
+    """Import a module in a fresh interpreter with ``-X importtime``."""
+    completed = _run_python(["-X", "importtime", "-c", f"import {module}"], check=True)
+    return parse_importtime(completed.stderr)
+
+
+def check_startup_budget(budget: Optional[StartupBudget] = None) -> List[str]:
+    """
+    Check CLI startup against the startup budget.
+
+    Args:
+        budget: Startup budget (defaults to StartupBudget())
+
+    Returns:
+        Human-readable budget violations, empty when within budget
+    """
+    budget = budget or StartupBudget()
+    violations = []
+
+    profile = profile_imports(CLI_MODULE)
+    import_seconds = profile.cumulative_seconds(CLI_MODULE)
+    if import_seconds > budget.max_cli_import_seconds:
+        slowest = ", ".join(f"{module} {seconds * 1000:.0f}ms" for module, seconds in profile.slowest(5))
+        violations.append(
+            f"import {CLI_MODULE} took {import_seconds:.3f}s "
+            f"(budget {budget.max_cli_import_seconds:.3f}s); slowest: {slowest}"
+        )
+
+    eager = [module for module in budget.deferred_modules if module in profile.cumulative_us]
+    if eager:
+        violations.append(f"import {CLI_MODULE} eagerly loads {eager}")
+
+    start = time.perf_counter()
+    _run_python(["-m", CLI_MODULE, "--help"], check=True)
+    help_seconds = time.perf_counter() - start
+    if help_seconds > budget.max_cli_help_seconds:
+        violations.append(
+            f"{CLI_MODULE} --help took {help_seconds:.3f}s (budget {budget.max_cli_help_seconds:.3f}s)"
+        )
+
+    return violations
+
+
+class CLIStartupBenchmark(Benchmark):
+    """Cold start of a short-lived CLI invocation in a fresh interpreter."""
+
+    name = "cli_startup"
+    iterations = 5
+    warmup = 1
+
+    async def run_once(self, iteration: int) -> int:
+        _run_python(["-m", CLI_MODULE, "--help"], check=True)
+        return 1
+
+
+BENCHMARKS: Dict[str, Type[Benchmark]] = {
+    benchmark.name: benchmark
+    for benchmark in (
+        OHLCVUpsertBenchmark,
+        TradeInsertBenchmark,
+        GapDetectionBenchmark,
+        OHLCVRecordReadBenchmark,
+        OHLCVFrameReadBenchmark,
+        QLibExportBenchmark,
+        SignalScoringBenchmark,
+        CollectorCycleBenchmark,
+        CLIStartupBenchmark,
+    )
+}
+
+
+class BenchmarkSuite:
+    """Run registered benchmarks with warmup and repeated timed iterations."""
+
+    def __init__(
+        self,
+        benchmarks: Optional[Dict[str, Type[Benchmark]]] = None,
+        iterations: Optional[int] = None,
+        warmup: Optional[int] = None
+    ):
+        """
+        Initialize benchmark suite.
+
+        Args:
+            benchmarks: Benchmark classes by name (defaults to BENCHMARKS)
+            iterations: Override timed iterations for every benchmark
+            warmup: Override warmup iterations for every benchmark
+        """
+        self.benchmarks = benchmarks if benchmarks is not None else BENCHMARKS
+        self.iterations = iterations
+        self.warmup = warmup
+
+    async def run(self, names: Optional[List[str]] = None) -> Dict[str, BenchmarkResult]:
+        """
+        Run benchmarks by name, or all registered benchmarks.
+
+        Returns:
+            Results keyed by benchmark name
+        """
+        names = names or list(self.benchmarks)
+        unknown = [name for name in names if name not in self.benchmarks]
+        if unknown:
+            raise ValueError(f"Unknown benchmarks: {unknown}. Available: {list(self.benchmarks)}")
+
+        results = {}
+        for name in names:
+            results[name] = await self.run_benchmark(self.benchmarks[name])
+        return results
+
+    async def run_benchmark(self, benchmark_class: Type[Benchmark]) -> BenchmarkResult:
+        """Run a single benchmark in its own scratch directory."""
+        iterations = self.iterations or benchmark_class.iterations
+        warmup = benchmark_class.warmup if self.warmup is None else self.warmup
+        work_dir = tempfile.mkdtemp(prefix=f"gecko_bench_{benchmark_class.name}_")
+
+        benchmark = benchmark_class(work_dir)
+        result = BenchmarkResult(
+            name=benchmark.name,
+            kind=benchmark.kind,
+            iterations=iterations,
+            warmup=warmup,
+            items_per_iteration=0
+        )
+
+        try:
+            await benchmark.setup()
+            for i in range(warmup):
+                await benchmark.run_once(i)
+
+            items = []
+            with _PeakRSSMonitor() as rss_monitor:
+                for i in range(warmup, warmup + iterations):
+                    start = time.perf_counter()
+                    items.append(await benchmark.run_once(i))
+                    result.durations.append(time.perf_counter() - start)
+
+            result.items_per_iteration = int(statistics.median(items))
+            result.peak_rss_mb = rss_monitor.peak_mb
+        finally:
+            await benchmark.teardown()
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        logger.info(
+            f"Benchmark {result.name}: {result.throughput:.1f} items/s, "
+            f"p95 {result.p95_seconds * 1000:.1f}ms, peak RSS {result.peak_rss_mb:.0f}MB"
+        )
+        return result
+
+
+class BaselineStore:
+    """Versioned JSON baselines, one file per label."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = Path(directory) if directory else DEFAULT_BASELINE_DIR
+
+    def path_for(self, label: str) -> Path:
+        return self.directory / f"{label}.json"
+
+    def save(self, label: str, results: Dict[str, BenchmarkResult]) -> Path:
+        """Save results as the baseline for a label."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'schema_version': BASELINE_SCHEMA_VERSION,
+            'label': label,
+            'created_at': datetime.utcnow().isoformat(),
+            'git_commit': _current_git_commit(),
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'benchmarks': {name: result.to_dict() for name, result in results.items()},
+        }
+        path = self.path_for(label)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2)
+        logger.info(f"Saved benchmark baseline '{label}' to {path}")
+        return path
+
+    def load(self, label: str) -> Dict[str, BenchmarkResult]:
+        """Load the baseline for a label."""
+        path = self.path_for(label)
+        if not path.exists():
+            raise FileNotFoundError(f"No benchmark baseline '{label}' at {path}")
+
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+
+        if payload.get('schema_version') != BASELINE_SCHEMA_VERSION:
+            raise ValueError(
+                f"Baseline '{label}' has schema version {payload.get('schema_version')}, "
+                f"expected {BASELINE_SCHEMA_VERSION}; re-record it with --save-baseline"
+            )
+
+        return {
+            name: BenchmarkResult.from_dict(data)
+            for name, data in payload['benchmarks'].items()
+        }
+
+
+def compare_results(
+    baseline: Dict[str, BenchmarkResult],
+    current: Dict[str, BenchmarkResult],
+    tolerances: Optional[RegressionTolerances] = None
+) -> List[MetricComparison]:
+    """
+    Compare a run against a baseline.
+
+    The tolerance for timing metrics is widened to the baseline's noise
+    (a multiple of its relative median absolute deviation), so a
+    regression must exceed both the configured limit and run-to-run jitter.
+
+    Args:
+        baseline: Baseline results by benchmark name
+        current: Current results by benchmark name
+        tolerances: Regression tolerances (defaults to RegressionTolerances())
+
+    Returns:
+        One comparison per metric for every benchmark present in both runs
+    """
+    tolerances = tolerances or RegressionTolerances()
+    comparisons = []
+
+    for name, current_result in current.items():
+        baseline_result = baseline.get(name)
+        if baseline_result is None:
+            logger.warning(f"Benchmark {name} has no baseline, skipping comparison")
+            continue
+
+        noise = tolerances.noise_mad_multiplier * relative_mad(baseline_result.durations)
+
+        throughput_tolerance = max(tolerances.max_throughput_drop, noise)
+        comparisons.append(MetricComparison(
+            benchmark=name,
+            metric='throughput',
+            baseline=baseline_result.throughput,
+            current=current_result.throughput,
+            tolerance=throughput_tolerance,
+            regressed=current_result.throughput < baseline_result.throughput * (1 - throughput_tolerance)
+        ))
+
+        latency_tolerance = max(tolerances.max_p95_latency_increase, noise)
+        comparisons.append(MetricComparison(
+            benchmark=name,
+            metric='p95_seconds',
+            baseline=baseline_result.p95_seconds,
+            current=current_result.p95_seconds,
+            tolerance=latency_tolerance,
+            regressed=current_result.p95_seconds > baseline_result.p95_seconds * (1 + latency_tolerance)
+        ))
+
+        rss_increase = current_result.peak_rss_mb - baseline_result.peak_rss_mb
+        comparisons.append(MetricComparison(
+            benchmark=name,
+            metric='peak_rss_mb',
+            baseline=baseline_result.peak_rss_mb,
+            current=current_result.peak_rss_mb,
+            tolerance=tolerances.max_peak_rss_increase,
+            regressed=(
+                rss_increase > tolerances.min_peak_rss_increase_mb
+                and current_result.peak_rss_mb > baseline_result.peak_rss_mb * (1 + tolerances.max_peak_rss_increase)
+            )
+        ))
+
+    return comparisons
+
+
+def format_comparison_report(comparisons: List[MetricComparison]) -> str:
+    """Render comparisons as a plain-text table."""
+    lines = [
+        f"{'benchmark':<18} {'metric':<12} {'baseline':>12} {'current':>12} {'change':>8} {'limit':>7}  status",
+        "-" * 80,
+    ]
+    for comparison in comparisons:
+        lines.append(
+            f"{comparison.benchmark:<18} {comparison.metric:<12} "
+            f"{comparison.baseline:>12.4f} {comparison.current:>12.4f} "
+            f"{comparison.change:>+8.1%} {comparison.tolerance:>7.0%}  "
+            f"{'REGRESSED' if comparison.regressed else 'ok'}"
+        )
+    return "\n".join(lines)
+
+
+def _current_git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent
+        ).stdout.strip()
+    except Exception:
+        return None
@@ -3,9 +3,27 @@ Pytest configuration and shared fixtures.
 """
 
 import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
 from unittest.mock import Mock
 from gecko_terminal_collector.config.models import CollectionConfig, DatabaseConfig
 from gecko_terminal_collector.database.manager import DatabaseManager
+from gecko_terminal_collector.database.models import DEX, Pool, Trade
+from gecko_terminal_collector.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+
+POOLS = ("solana_pool1", "solana_pool2")
+
+
+def trade_row(pool_id, index, block_timestamp=None, block_number=None):
+    """Trade of a seeded pool, ``index`` minutes ago unless a timestamp is given."""
+    return Trade(
+        id=f"{pool_id}_trade{index}", pool_id=pool_id, block_number=block_number, tx_hash=f"hash{index}",
+        tx_from_address="addr", from_token_amount=Decimal("1"), to_token_amount=Decimal("100"),
+        price_usd=Decimal("2.5"), volume_usd=Decimal(100 * (index + 1)), side="buy",
+        block_timestamp=block_timestamp or datetime.now() - timedelta(minutes=index)
+    )
 
 
 @pytest.fixture
@@ -24,6 +42,22 @@ def mock_collection_config():
     return CollectionConfig()
 
 
+@pytest_asyncio.fixture
+async def db_manager(tmp_path):
+    """SQLite database manager seeded with a DEX and the POOLS."""
+    db_manager = SQLAlchemyDatabaseManager(DatabaseConfig(url=f"sqlite:///{tmp_path / 'seeded.db'}", echo=False))
+    await db_manager.initialize()
+
+    with db_manager.connection.get_session() as session:
+        session.add(DEX(id="raydium", name="Raydium", network="solana"))
+        session.flush()
+        session.add_all(Pool(id=pool_id, address=pool_id, dex_id="raydium") for pool_id in POOLS)
+        session.commit()
+
+    yield db_manager
+    await db_manager.close()
+
+
 @pytest.fixture
 def mock_database_manager(mock_database_config):
     """Mock database manager for testing."""
@@ -97,6 +97,42 @@ class PostgreSQLMigrationThresholds:
     max_connection_failure_rate: float = 0.01  # 1% of connections
 
 
+@dataclass
+class RegressionTolerances:
+    """Tolerances used when comparing benchmark runs against a stored baseline."""
+    
+    # Relative change allowed before a metric counts as a regression
+    max_throughput_drop: float = 0.15  # 15% fewer items per second
+    max_p95_latency_increase: float = 0.25  # 25% slower p95 iteration
+    max_peak_rss_increase: float = 0.20  # 20% more peak memory
+    
+    # Ignore RSS growth smaller than this, allocator noise dominates below it
+    min_peak_rss_increase_mb: float = 32.0
+    
+    # Widen the tolerance to this many relative median absolute deviations of
+    # the baseline samples, so noisy benchmarks do not fail spuriously
+    noise_mad_multiplier: float = 3.0
+
+
+@dataclass
+class StartupBudget:
+    """Startup budget for short-lived CLI invocations (cron-driven status/db-health)."""
+    
+    # Cumulative `python -X importtime` cost of importing the CLI module
+    max_cli_import_seconds: float = 0.5
+    
+    # Wall time of a full `--help` invocation, interpreter startup included
+    max_cli_help_seconds: float = 1.0
+    
+    # Heavy dependencies that must only load once a command needs them
+    deferred_modules: List[str] = None
+    
+    def __post_init__(self):
+        """Set default values for list fields."""
+        if self.deferred_modules is None:
+            self.deferred_modules = ["pandas", "sqlalchemy", "aiohttp", "apscheduler", "geckoterminal_py"]
+
+
 class PerformanceTestConfig:
     """Main configuration class for performance testing."""
     
@@ -104,6 +140,8 @@ class PerformanceTestConfig:
         self.thresholds = PerformanceThresholds()
         self.test_data = TestDataConfig()
         self.migration_thresholds = PostgreSQLMigrationThresholds()
+        self.regression_tolerances = RegressionTolerances()
+        self.startup_budget = StartupBudget()
         
         # Test execution settings
         self.enable_memory_monitoring = True
@@ -237,6 +275,8 @@ def create_custom_config(**kwargs) -> PerformanceTestConfig:
             setattr(config.test_data, key, value)
         elif hasattr(config.migration_thresholds, key):
             setattr(config.migration_thresholds, key, value)
+        elif hasattr(config.regression_tolerances, key):
+            setattr(config.regression_tolerances, key, value)
     
     return config
 
@@ -0,0 +1,489 @@
+"""
+Local GeckoTerminal replay server for end-to-end throughput benchmarks.
+
+Serves the recorded CSV fixtures from ``specs/`` over HTTP using the same
+paths and JSON:API response shapes as ``api.geckoterminal.com/api/v2``, so
+real collectors can be pointed at it through ``APIConfig.base_url`` and
+exercise the SDK, HTTP session, rate limiter and retry logic that the
+in-process ``MockGeckoTerminalClient`` bypasses.
+
+Responses are deterministic for a given configuration: latency is drawn
+from a seeded generator, 429 bursts are triggered by request count, and
+OHLCV/trade timestamps are rebased onto a fixed anchor time.
+"""
+
+import asyncio
+import calendar
+import csv
+import logging
+import math
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+
+logger = logging.getLogger(__name__)
+
+
+API_PREFIX = "/api/v2"
+
+OHLCV_UNIT_SECONDS = {
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+
+@dataclass
+class ReplayServerConfig:
+    """Configuration for the GeckoTerminal replay server."""
+    fixtures_path: str = "specs"
+    host: str = "127.0.0.1"
+    port: int = 0  # 0 picks a free port
+
+    # Latency: "none", "fixed", "uniform" or "lognormal"
+    latency_distribution: str = "none"
+    latency_ms: float = 0.0  # fixed value, or mean for uniform/lognormal
+    latency_jitter_ms: float = 0.0  # half-width for uniform, std dev for lognormal
+
+    # 429 bursts: every ``rate_limit_every`` requests, answer the next
+    # ``rate_limit_burst`` requests with 429 and a Retry-After header
+    rate_limit_every: int = 0  # 0 disables rate limiting
+    rate_limit_burst: int = 1
+    retry_after: float = 1.0  # seconds
+
+    # OHLCV history served per pool/timeframe, cycling through the fixture rows
+    ohlcv_history_candles: int = 5000
+    anchor_timestamp: Optional[int] = None  # newest candle/trade; defaults to start time
+
+    seed: int = 42
+
+
+class GeckoTerminalReplayServer:
+    """
+    Deterministic local stand-in for the GeckoTerminal API.
+
+    Any pool address is accepted and answered from the shared fixtures, so
+    a benchmark can fan out over as many synthetic pools as it needs.
+
+    Example:
+        async with GeckoTerminalReplayServer(ReplayServerConfig(latency_ms=50)) as server:
+            api_config = APIConfig(base_url=server.base_url, rate_limit_delay=0)
+    """
+
+    def __init__(self, config: Optional[ReplayServerConfig] = None):
+        """
+        Initialize replay server.
+
+        Args:
+            config: Replay server configuration
+        """
+        self.config = config or ReplayServerConfig()
+        self.fixtures_path = Path(self.config.fixtures_path)
+        self.fixtures: Dict[str, List[Dict[str, str]]] = {}
+
+        self._random = random.Random(self.config.seed)
+        self._runner: Optional[web.AppRunner] = None
+        self._port: Optional[int] = None
+        self._anchor: int = 0
+
+        self.request_counts: Counter = Counter()
+        self.total_requests = 0
+        self.rate_limited_responses = 0
+        self._burst_remaining = 0
+
+        self._load_fixtures()
+
+    def _load_fixtures(self) -> None:
+        """Load CSV fixtures into memory."""
+        fixture_files = {
+            "dexes": "get_dexes_by_network.csv",
+            "heaven_pools": "get_top_pools_by_network_dex_heaven.csv",
+            "pumpswap_pools": "get_top_pools_by_network_dex_pumpswap.csv",
+            "multiple_pools": "get_multiple_pools_by_network.csv",
+            "single_pool": "get_pool_by_network_address.csv",
+            "new_pools": "new_pools_by_network.csv",
+            "ohlcv": "get_ohlcv.csv",
+            "trades": "get_trades.csv",
+        }
+
+        for name, filename in fixture_files.items():
+            file_path = self.fixtures_path / filename
+            if not file_path.exists():
+                self.fixtures[name] = []
+                continue
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    self.fixtures[name] = list(csv.DictReader(f))
+            except Exception as e:
+                logger.warning(f"Failed to load replay fixture {file_path}: {e}")
+                self.fixtures[name] = []
+
+        # Oldest first, so candles can be replayed in their recorded order
+        self.fixtures["ohlcv"].sort(key=lambda row: int(row["timestamp"]))
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to use as ``APIConfig.base_url``."""
+        if self._port is None:
+            raise RuntimeError("Replay server is not running")
+        return f"http://{self.config.host}:{self._port}{API_PREFIX}"
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.stop()
+
+    async def start(self) -> str:
+        """
+        Start serving on the configured host and port.
+
+        Returns:
+            Base URL of the running server
+        """
+        self._anchor = self.config.anchor_timestamp or int(time.time())
+
+        self._runner = web.AppRunner(self._create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.config.host, self.config.port)
+        await site.start()
+        self._port = self._runner.addresses[0][1]
+
+        logger.info(f"GeckoTerminal replay server listening on {self.base_url}")
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+            self._port = None
+
+    def advance_time(self, seconds: int) -> None:
+        """
+        Move the replay clock forward, e.g. between benchmark collection cycles.
+
+        Args:
+            seconds: Seconds to add to the anchor timestamp
+        """
+        self._anchor += seconds
+
+    def reset_stats(self) -> None:
+        """Reset request counters and the rate limit burst state."""
+        self.request_counts.clear()
+        self.total_requests = 0
+        self.rate_limited_responses = 0
+        self._burst_remaining = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request statistics."""
+        return {
+            "total_requests": self.total_requests,
+            "rate_limited_responses": self.rate_limited_responses,
+            "requests_by_route": dict(self.request_counts),
+        }
+
+    def _create_app(self) -> web.Application:
+        """Build the aiohttp application with GeckoTerminal routes."""
+        app = web.Application(middlewares=[self._replay_middleware])
+        routes = [
+            ("/networks", self._handle_networks),
+            ("/networks/{network}/dexes", self._handle_dexes),
+            ("/networks/{network}/pools", self._handle_top_pools),
+            ("/networks/{network}/dexes/{dex}/pools", self._handle_top_pools_dex),
+            ("/networks/{network}/new_pools", self._handle_new_pools),
+            ("/networks/{network}/pools/multi/{addresses}", self._handle_multiple_pools),
+            ("/networks/{network}/pools/{address}", self._handle_pool),
+            ("/networks/{network}/pools/{address}/ohlcv/{timeframe}", self._handle_ohlcv),
+            ("/networks/{network}/pools/{address}/trades", self._handle_trades),
+            ("/networks/{network}/tokens/{token}", self._handle_token),
+        ]
+        for path, handler in routes:
+            app.router.add_get(API_PREFIX + path, handler)
+        return app
+
+    @web.middleware
+    async def _replay_middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Apply latency and 429 bursts to every request."""
+        route = request.match_info.route.resource.canonical if request.match_info.route.resource else "unknown"
+        self.request_counts[route] += 1
+        self.total_requests += 1
+
+        delay = self._next_latency()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self._should_rate_limit():
+            self.rate_limited_responses += 1
+            return web.json_response(
+                {"status": {"error_code": 429, "error_message": "You've exceeded the Rate Limit"}},
+                status=429,
+                headers={"Retry-After": f"{self.config.retry_after:g}"}
+            )
+
+        return await handler(request)
+
+    def _next_latency(self) -> float:
+        """Draw the next response delay in seconds."""
+        distribution = self.config.latency_distribution
+        mean = self.config.latency_ms
+        jitter = self.config.latency_jitter_ms
+
+        if distribution == "fixed":
+            delay_ms = mean
+        elif distribution == "uniform":
+            delay_ms = self._random.uniform(mean - jitter, mean + jitter)
+        elif distribution == "lognormal":
+            if mean <= 0:
+                return 0.0
+            # Parameterize so the distribution has the configured mean and std dev
+            sigma_sq = math.log(1 + (jitter / mean) ** 2)
+            mu = math.log(mean) - sigma_sq / 2
+            delay_ms = self._random.lognormvariate(mu, math.sqrt(sigma_sq))
+        else:
+            return 0.0
+
+        return max(delay_ms, 0.0) / 1000.0
+
+    def _should_rate_limit(self) -> bool:
+        """Decide whether the current request falls inside a 429 burst."""
+        if self.config.rate_limit_every <= 0:
+            return False
+
+        if self._burst_remaining > 0:
+            self._burst_remaining -= 1
+            return True
+
+        if self.total_requests % self.config.rate_limit_every == 0:
+            self._burst_remaining = self.config.rate_limit_burst - 1
+            return True
+
+        return False
+
+    # Route handlers
+
+    async def _handle_networks(self, request: web.Request) -> web.Response:
+        return web.json_response({"data": [{
+            "id": "solana",
+            "type": "network",
+            "attributes": {"name": "Solana", "coingecko_asset_platform_id": "solana"},
+        }]})
+
+    async def _handle_dexes(self, request: web.Request) -> web.Response:
+        return web.json_response({"data": [
+            {"id": row["id"], "type": "dex", "attributes": {"name": row["name"]}}
+            for row in self.fixtures["dexes"]
+        ]})
+
+    async def _handle_top_pools(self, request: web.Request) -> web.Response:
+        network = request.match_info["network"]
+        pools = self.fixtures["heaven_pools"] + self.fixtures["pumpswap_pools"]
+        return self._pools_response(network, pools, request)
+
+    async def _handle_top_pools_dex(self, request: web.Request) -> web.Response:
+        network = request.match_info["network"]
+        pools = self.fixtures.get(f"{request.match_info['dex']}_pools", [])
+        return self._pools_response(network, pools, request)
+
+    async def _handle_new_pools(self, request: web.Request) -> web.Response:
+        network = request.match_info["network"]
+        return self._pools_response(network, self.fixtures["new_pools"], request)
+
+    async def _handle_multiple_pools(self, request: web.Request) -> web.Response:
+        network = request.match_info["network"]
+        addresses = [a for a in request.match_info["addresses"].split(",") if a]
+        template = self.fixtures["multiple_pools"] or self.fixtures["single_pool"]
+        pools = [
+            dict(template[i % len(template)], address=address, id=f"{network}_{address}")
+            for i, address in enumerate(addresses)
+        ] if template else []
+        return web.json_response({"data": [self._format_pool(network, pool) for pool in pools]})
+
+    async def _handle_pool(self, request: web.Request) -> web.Response:
+        network = request.match_info["network"]
+        address = request.match_info["address"]
+        template = self.fixtures["single_pool"] or self.fixtures["multiple_pools"]
+        if not template:
+            return web.json_response({"errors": [{"status": "404", "title": "Not Found"}]}, status=404)
+        pool = dict(template[0], address=address, id=f"{network}_{address}")
+        return web.json_response({"data": self._format_pool(network, pool)})
+
+    async def _handle_ohlcv(self, request: web.Request) -> web.Response:
+        """Serve candles ending before ``before_timestamp``, newest first."""
+        network = request.match_info["network"]
+        address = request.match_info["address"]
+        unit = request.match_info["timeframe"]
+
+        if unit not in OHLCV_UNIT_SECONDS:
+            return web.json_response({"errors": [{"status": "400", "title": "Invalid timeframe"}]}, status=400)
+
+        try:
+            aggregate = int(request.query.get("aggregate", 1))
+            limit = min(int(request.query.get("limit", 100)), 1000)
+            before_timestamp = request.query.get("before_timestamp")
+            before_timestamp = int(before_timestamp) if before_timestamp else None
+        except ValueError:
+            return web.json_response({"errors": [{"status": "400", "title": "Invalid parameter"}]}, status=400)
+
+        interval = OHLCV_UNIT_SECONDS[unit] * aggregate
+        newest = self._anchor // interval * interval
+        oldest = newest - (self.config.ohlcv_history_candles - 1) * interval
+
+        start = newest if before_timestamp is None else min(newest, (before_timestamp - 1) // interval * interval)
+        rows = self.fixtures["ohlcv"]
+
+        ohlcv_list = []
+        timestamp = start
+        while rows and timestamp >= oldest and len(ohlcv_list) < limit:
+            row = rows[(timestamp // interval) % len(rows)]
+            ohlcv_list.append([
+                timestamp,
+                float(row["open"]),
+                float(row["high"]),
+                float(row["low"]),
+                float(row["close"]),
+                float(row["volume_usd"]),
+            ])
+            timestamp -= interval
+
+        return web.json_response({
+            "data": {
+                "id": f"{network}_{address}",
+                "type": "ohlcv_request_response",
+                "attributes": {"ohlcv_list": ohlcv_list},
+            },
+            "meta": {
+                "base": {"address": address},
+                "quote": {"address": None},
+            },
+        })
+
+    async def _handle_trades(self, request: web.Request) -> web.Response:
+        """Serve fixture trades for any pool, rebased onto the anchor time."""
+        address = request.match_info["address"]
+        min_volume = request.query.get("trade_volume_in_usd_greater_than")
+        min_volume = float(min_volume) if min_volume else 0.0
+
+        trades = self.fixtures["trades"]
+        if not trades:
+            return web.json_response({"data": []})
+
+        latest = max(self._parse_iso(row["block_timestamp"]) for row in trades)
+        offset = self._anchor - latest
+
+        data = []
+        for row in trades:
+            if float(row["volume_usd"] or 0) <= min_volume:
+                continue
+            block_time = self._parse_iso(row["block_timestamp"]) + offset
+            data.append({
+                "id": f"{row['id']}_{address}",
+                "type": "trade",
+                "attributes": {
+                    "block_number": int(row["block_number"]),
+                    "tx_hash": row["tx_hash"],
+                    "tx_from_address": row["tx_from_address"],
+                    "from_token_amount": row["from_token_amount"],
+                    "to_token_amount": row["to_token_amount"],
+                    "price_from_in_currency_token": row["price_from_in_currency_token"],
+                    "price_to_in_currency_token": row["price_to_in_currency_token"],
+                    "price_from_in_usd": row["price_from_in_usd"],
+                    "price_to_in_usd": row["price_to_in_usd"],
+                    "block_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(block_time)),
+                    "kind": row["side"],
+                    "volume_in_usd": row["volume_usd"],
+                    "from_token_address": row["from_token_address"],
+                    "to_token_address": row["to_token_address"],
+                },
+            })
+
+        return web.json_response({"data": data})
+
+    async def _handle_token(self, request: web.Request) -> web.Response:
+        network = request.match_info["network"]
+        token = request.match_info["token"]
+        return web.json_response({"data": {
+            "id": f"{network}_{token}",
+            "type": "token",
+            "attributes": {
+                "address": token,
+                "name": "Replay Token",
+                "symbol": "REPLAY",
+                "decimals": 9,
+                "total_supply": "1000000000",
+                "price_usd": "1.0",
+            },
+        }})
+
+    # Formatting helpers
+
+    def _pools_response(self, network: str, pools: List[Dict[str, str]], request: web.Request) -> web.Response:
+        """Paginate fixture pools; only page 1 has data, like a short recorded list."""
+        page = int(request.query.get("page", 1))
+        page_pools = pools if page == 1 else []
+        return web.json_response({"data": [self._format_pool(network, pool) for pool in page_pools]})
+
+    @staticmethod
+    def _prefixed(network: str, value: Optional[str]) -> Optional[str]:
+        if not value:
+            return value
+        return value if value.startswith(f"{network}_") else f"{network}_{value}"
+
+    def _format_pool(self, network: str, pool: Dict[str, str]) -> Dict[str, Any]:
+        """Convert a flattened fixture row back into the API's JSON:API shape."""
+        return {
+            "id": self._prefixed(network, pool.get("id") or pool.get("address")),
+            "type": "pool",
+            "attributes": {
+                "name": pool.get("name"),
+                "address": pool.get("address"),
+                "base_token_price_usd": pool.get("base_token_price_usd"),
+                "base_token_price_native_currency": pool.get("base_token_price_native_currency"),
+                "quote_token_price_usd": pool.get("quote_token_price_usd"),
+                "quote_token_price_native_currency": pool.get("quote_token_price_native_currency"),
+                "reserve_in_usd": pool.get("reserve_in_usd"),
+                "pool_created_at": pool.get("pool_created_at"),
+                "fdv_usd": pool.get("fdv_usd") or None,
+                "market_cap_usd": pool.get("market_cap_usd") or None,
+                "price_change_percentage": {
+                    "h1": pool.get("price_change_percentage_h1"),
+                    "h24": pool.get("price_change_percentage_h24"),
+                },
+                "transactions": {
+                    "h1": {
+                        "buys": self._to_int(pool.get("transactions_h1_buys")),
+                        "sells": self._to_int(pool.get("transactions_h1_sells")),
+                    },
+                    "h24": {
+                        "buys": self._to_int(pool.get("transactions_h24_buys")),
+                        "sells": self._to_int(pool.get("transactions_h24_sells")),
+                    },
+                },
+                "volume_usd": {"h24": pool.get("volume_usd_h24")},
+            },
+            "relationships": {
+                "dex": {"data": {"id": pool.get("dex_id"), "type": "dex"}},
+                "base_token": {"data": {"id": self._prefixed(network, pool.get("base_token_id")), "type": "token"}},
+                "quote_token": {"data": {"id": self._prefixed(network, pool.get("quote_token_id")), "type": "token"}},
+            },
+        }
+
+    @staticmethod
+    def _to_int(value: Optional[str]) -> int:
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return 0
+
+    @staticmethod
+    def _parse_iso(value: str) -> int:
+        return calendar.timegm(time.strptime(value, "%Y-%m-%dT%H:%M:%SZ"))
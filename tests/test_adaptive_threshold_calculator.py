@@ -0,0 +1,132 @@
+"""
+Tests for batch AdaptiveThresholdCalculator calculations.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nautilus_poc.adaptive_threshold_calculator import AdaptiveThresholdCalculator, ThresholdType
+
+
+def make_calculator():
+    config = SimpleNamespace(
+        monitoring={'realistic_transaction_cost': 0.0005, 'min_expected_value': 0.001},
+        regime_detection={},
+        pumpswap=SimpleNamespace(min_liquidity_sol=10.0, max_price_impact_percent=10.0)
+    )
+    return AdaptiveThresholdCalculator(config)
+
+
+def make_signals(count: int = 300, seed: int = 9) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    percentile = rng.random(count)
+    percentile[rng.random(count) < 0.7] = np.nan
+    return pd.DataFrame({
+        'q50': rng.normal(0, 0.02, count),
+        'prob_up': rng.uniform(0.2, 0.9, count),
+        'vol_risk': rng.lognormal(-2.5, 1.0, count),
+        'vol_risk_percentile': percentile,
+        'regime_multiplier': rng.choice([0.7, 0.9, 1.0, 1.1, 1.4], count),
+        'tradeable': rng.random(count) < 0.7,
+        'high_quality': rng.random(count) < 0.7,
+        'economically_significant': rng.random(count) < 0.5,
+    })
+
+
+def make_pools(count: int = 300, seed: int = 9):
+    rng = np.random.default_rng(seed + 1)
+    choices = [None, {'reserve_sol': 0}, {'reserve_sol': 0, 'reserve_in_usd': 1500.0},
+               {'reserve_sol': 5.0}, {'reserve_sol': 30.0}, {'reserve_sol': 250.0}]
+    return [choices[i] for i in rng.integers(0, len(choices), count)]
+
+
+def to_dicts(signals: pd.DataFrame):
+    records = signals.to_dict('records')
+    for record in records:
+        if np.isnan(record['vol_risk_percentile']):
+            del record['vol_risk_percentile']
+    return records
+
+
+class TestBatchMatchesScalar:
+    """Test the columnar API against per-signal calls."""
+
+    def test_economic_significance(self):
+        calculator = make_calculator()
+        signals, pools = make_signals(), make_pools()
+        liquidity = [calculator._get_pool_liquidity(pool) for pool in pools]
+
+        batch = calculator.calculate_economic_significance_batch(signals, liquidity, position_size=2.0)
+        for i, (signal, pool) in enumerate(zip(to_dicts(signals), pools)):
+            result = calculator.calculate_economic_significance(signal, pool, 2.0)
+            assert result.net_expected_value == batch['net_expected_value'][i]
+            assert result.price_impact_costs == batch['price_impact_costs'][i]
+            assert result.break_even_probability == batch['break_even_probability'][i]
+            assert result.is_economically_significant == batch['is_economically_significant'][i]
+
+    @pytest.mark.parametrize('threshold_type', list(ThresholdType))
+    def test_adaptive_thresholds(self, threshold_type):
+        calculator = make_calculator()
+        signals, pools = make_signals(), make_pools()
+        sizes = np.random.default_rng(1).choice([0.0, 0.1, 1.0, 5.0], len(signals))
+        liquidity = [calculator._get_pool_liquidity(pool) for pool in pools]
+
+        batch = calculator.calculate_adaptive_thresholds_batch(signals, liquidity, threshold_type, sizes)
+        for i, (signal, pool) in enumerate(zip(to_dicts(signals), pools)):
+            result = calculator.calculate_adaptive_threshold(signal, pool, threshold_type, float(sizes[i]))
+            assert result.final_threshold == batch['final_threshold'][i]
+            assert result.liquidity_adjustment == batch['liquidity_adjustment'][i]
+            assert result.price_impact_adjustment == batch['price_impact_adjustment'][i]
+            assert result.is_above_threshold == batch['is_above_threshold'][i]
+            assert result.calculation_details['adjustment_breakdown']['variance_regime'] == batch['variance_regime'][i]
+
+
+class TestCostModel:
+    """Test price impact and liquidity adjustments on known pools."""
+
+    def test_price_impact_costs(self):
+        calculator = make_calculator()
+        assert calculator._calculate_price_impact_cost(None, 1.0) == 0.0005
+        assert calculator._calculate_price_impact_cost({'reserve_sol': 0}, 1.0) == 0.001
+        assert calculator._calculate_price_impact_cost({'reserve_sol': 99.0}, 1.0) == pytest.approx(0.01)
+        # USD fallback, then the quadratic curve past 5% impact and the 20% cap
+        assert calculator._calculate_price_impact_cost({'reserve_sol': 0, 'reserve_in_usd': 1900.0}, 1.0) == \
+            pytest.approx(0.05)
+        assert calculator._calculate_price_impact_cost({'reserve_sol': 9.0}, 1.0) == pytest.approx(0.15)
+        assert calculator._calculate_price_impact_cost({'reserve_sol': 1.0}, 1.0) == 0.2
+
+    def test_liquidity_adjustments(self):
+        calculator = make_calculator()
+        liquidity = np.array([np.nan, 0.0, 500.0, 25.0, 12.0, 5.0])
+        adjustments = calculator._liquidity_adjustments(liquidity, np.full(len(liquidity), 0.1))
+        np.testing.assert_allclose(adjustments, [0.5, 0.5, -0.06, -0.03, 0.0, 0.075])
+
+
+class TestListApis:
+    """Test the list-of-dict APIs built on the batch calculations."""
+
+    def test_variance_based_thresholds(self):
+        calculator = make_calculator()
+        signals = [{'q50': 0.01, 'vol_risk': vol_risk} for vol_risk in (0.5, 0.1, 0.2, 0.3, 0.05, 0.4)]
+
+        thresholds = calculator.calculate_variance_based_thresholds(signals)
+        assert list(thresholds)[:4] == ['extreme_variance', 'low_variance', 'medium_variance', 'high_variance']
+        assert thresholds['extreme_variance'] == calculator.calculate_adaptive_threshold(signals[0]).final_threshold
+        assert thresholds['mean_vol_risk'] == pytest.approx(1.55 / 6)
+
+    def test_against_expected_value(self):
+        calculator = make_calculator()
+        signals, pools = to_dicts(make_signals(50)), make_pools(50)
+
+        results = calculator.test_against_expected_value(signals, pools)
+        assert results['total_signals'] == 50
+        assert results['agreement_count'] + results['disagreement_count'] == 50
+        assert results['adaptive_only'] + results['traditional_only'] == results['disagreement_count']
+        comparison = results['threshold_comparisons'][7]
+        single = calculator.calculate_economic_significance(signals[7], pools[7])
+        assert comparison['adaptive_expected_value'] == single.net_expected_value
+        assert comparison['traditional_expected_value'] == calculator._calculate_traditional_expected_value(signals[7])
+        assert calculator.test_against_expected_value([]) == {'error': 'No signals provided'}
@@ -0,0 +1,225 @@
+"""
+Tests for vectorized backtest replay against the per-tick strategy path.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from gecko_terminal_collector.database.models import Base, OHLCVData
+from nautilus_poc.backtest_replay import load_ohlcv_bars, match_signals
+from nautilus_poc.config import (
+    EnvironmentConfig, NautilusConfig, NautilusPOCConfig, PumpSwapConfig, Q50Config,
+    SecurityConfig, SolanaConfig, TradingConfig, WalletConfig
+)
+from nautilus_poc.position_sizer import KellyPositionSizer
+from nautilus_poc.q50_nautilus_strategy import Q50NautilusStrategy
+from nautilus_poc.regime_detector import REGIME_ORDER, RegimeDetector
+from nautilus_poc.risk_manager import CircuitBreakerStatus, RiskManager
+
+
+def create_signals(periods: int = 400, seed: int = 11) -> pd.DataFrame:
+    """Create random hourly Q50 signals covering every regime and decision branch."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2024-01-01', periods=periods, freq='1h')
+    vol_risk = rng.lognormal(-3.5, 0.8, periods)
+    vol_risk[rng.random(periods) < 0.02] = np.nan
+    return pd.DataFrame({
+        'q10': rng.normal(-0.05, 0.02, periods),
+        'q50': rng.normal(0.0, 0.03, periods),
+        'q90': rng.normal(0.05, 0.02, periods),
+        'vol_raw': rng.lognormal(-3.0, 0.7, periods),
+        'vol_risk': vol_risk,
+        'prob_up': rng.uniform(0.2, 0.9, periods),
+        'economically_significant': rng.random(periods) < 0.8,
+        'high_quality': rng.random(periods) < 0.9,
+        'tradeable': rng.random(periods) < 0.85,
+    }, index=index)
+
+
+def create_bars(signals: pd.DataFrame, seed: int = 3) -> pd.DataFrame:
+    """Bars around the signal times, some outside tolerance and some sharing a signal."""
+    rng = np.random.default_rng(seed)
+    offsets = pd.to_timedelta(rng.choice([-7, -5, -2, 0, 3, 5, 10, 30], size=3 * len(signals)), unit='min')
+    times = np.sort(np.repeat(signals.index.values, 3) + offsets.values)
+    close = rng.uniform(0.5, 2.0, len(times))
+    close[rng.random(len(times)) < 0.01] = 0.0
+    return pd.DataFrame({'close': close}, index=pd.DatetimeIndex(times))
+
+
+def create_config(features_path) -> NautilusPOCConfig:
+    env = EnvironmentConfig(
+        solana=SolanaConfig(network='testnet', rpc_endpoint='https://api.testnet.solana.com',
+                            commitment='confirmed', cluster='testnet'),
+        pumpswap=PumpSwapConfig(max_slippage_percent=5.0, base_position_size=0.1, max_position_size=0.5,
+                                min_liquidity_sol=10.0, max_price_impact_percent=10.0,
+                                realistic_transaction_cost=0.0005),
+        security=SecurityConfig()
+    )
+    return NautilusPOCConfig(
+        environment='testnet',
+        environments={'testnet': env},
+        q50=Q50Config(features_path=str(features_path), signal_tolerance_minutes=5,
+                      required_columns=list(create_signals(1).columns)),
+        wallet=WalletConfig(payer_public_key='test_public_key', min_balance_sol=0.1),
+        trading=TradingConfig(),
+        nautilus=NautilusConfig(instance_id='TEST-REPLAY-001', log_level='INFO', cache_database_path='test_cache.db'),
+        security=SecurityConfig(),
+        monitoring={},
+        error_handling={},
+        regime_detection={'max_history_size': 250}
+    )
+
+
+async def create_strategy(features_path) -> Q50NautilusStrategy:
+    strategy = Q50NautilusStrategy(create_config(features_path))
+    assert await strategy.signal_loader.load_signals()
+    strategy.regime_detector.cache_update_threshold = 25
+    strategy.is_initialized = True
+    strategy._execute_buy_signal = AsyncMock()
+    strategy._execute_sell_signal = AsyncMock()
+    return strategy
+
+
+@pytest.fixture
+def features_path(tmp_path):
+    path = tmp_path / "macro_features.pkl"
+    create_signals().to_pickle(path)
+    return path
+
+
+class TestReplayParity:
+    """Test that replayed decisions match on_quote_tick() decisions."""
+
+    @pytest.mark.asyncio
+    async def test_decisions_match_tick_path(self, features_path):
+        bars = create_bars(create_signals())
+        tick_strategy = await create_strategy(features_path)
+        replay_strategy = await create_strategy(features_path)
+
+        for timestamp, close in zip(bars.index, bars['close']):
+            tick = SimpleNamespace(
+                instrument_id='TEST/SOL', bid_price=close, ask_price=close,
+                bid_size=1000.0, ask_size=1000.0, ts_event=timestamp.value
+            )
+            await tick_strategy.on_quote_tick(tick)
+
+        replayed = replay_strategy.replay_bars(bars)
+
+        decisions = pd.DataFrame(tick_strategy.trade_decisions)
+        assert len(replayed) == len(decisions) == tick_strategy.processed_signals_count
+        # Negative q50 always fails the expected-return check, so there are no sells
+        assert set(decisions['action']) == {'buy', 'hold'}
+        assert decisions['reason'].str.startswith('low_regime_confidence').any()
+        assert replayed['action'].tolist() == decisions['action'].tolist()
+        assert replayed['reason'].tolist() == decisions['reason'].tolist()
+        assert replayed['regime'].tolist() == decisions['regime'].tolist()
+        np.testing.assert_array_equal(replayed['signal_strength'], decisions['signal_strength'])
+        np.testing.assert_array_equal(replayed['risk_score'], decisions['risk_score'])
+        np.testing.assert_array_equal(replayed['regime_confidence'], decisions['regime_confidence'])
+
+        # Strategy and detector state end where the tick path left them
+        assert replay_strategy.last_signal_timestamp == tick_strategy.last_signal_timestamp
+        assert replay_strategy.processed_signals_count == tick_strategy.processed_signals_count
+        tick_detector, replay_detector = tick_strategy.regime_detector, replay_strategy.regime_detector
+        np.testing.assert_array_equal(replay_detector.vol_risk_window.values(), tick_detector.vol_risk_window.values())
+        assert replay_detector.percentile_cache == tick_detector.percentile_cache
+        assert replay_detector._observations_since_refresh == tick_detector._observations_since_refresh
+
+        # Buys are sized and risk-checked; other decisions are not
+        buys = replayed['action'] == 'buy'
+        assert (replayed.loc[buys, 'position_size_sol'] > 0).all()
+        assert (replayed.loc[~buys, 'position_size_sol'] == 0).all()
+        assert replayed.loc[buys, 'risk_approved'].all()
+
+    @pytest.mark.asyncio
+    async def test_replay_without_state_update(self, features_path):
+        strategy = await create_strategy(features_path)
+        bars = create_bars(create_signals())
+
+        first = strategy.replay_bars(bars, update_state=False)
+        assert strategy.last_signal_timestamp is None
+        assert len(strategy.regime_detector.vol_risk_window) == 0
+        pd.testing.assert_frame_equal(strategy.replay_bars(bars), first)
+
+        # Replaying the same bars again starts after the last processed signal
+        assert strategy.replay_bars(bars.iloc[-1:]).empty
+
+
+class TestBatchComponents:
+    """Test the batch regime, sizing and risk helpers against their scalar versions."""
+
+    def test_classify_regime_batch_matches_sequential(self):
+        signals = create_signals(600)
+        config = {'regime_detection': {'max_history_size': 300}}
+        sequential, batch = RegimeDetector(config), RegimeDetector(config)
+        warmup = signals.iloc[:150]
+        for detector in (sequential, batch):
+            detector.cache_update_threshold = 30
+            for row in warmup.to_dict('records'):
+                detector.classify_regime(row)
+
+        rest = signals.iloc[150:]
+        expected = [sequential.classify_regime(row) for row in rest.to_dict('records')]
+        result = batch.classify_regime_batch(rest['vol_risk'].to_numpy(), rest['q50'].to_numpy(), rest['vol_raw'].to_numpy())
+
+        assert [REGIME_ORDER[i] for i in result['regime_index']] == [info['regime'] for info in expected]
+        for key in ('regime_confidence', 'enhanced_info_ratio', 'regime_adjusted_threshold', 'regime_multiplier'):
+            np.testing.assert_allclose(result[key], [info[key] for info in expected], rtol=1e-12)
+        assert batch.percentile_cache == sequential.percentile_cache
+
+    def test_position_sizes_match_scalar(self):
+        sizer = KellyPositionSizer({'pumpswap': {'max_position_size': 0.5, 'base_position_size': 0.1}})
+        rng = np.random.default_rng(5)
+        count = 200
+        vol_risk = rng.lognormal(-5, 1.5, count)
+        q50 = rng.normal(0, 0.5, count)
+        info_ratio = rng.uniform(0, 5, count)
+        multiplier = rng.choice([0.0, 0.7, 1.0, 1.4], count)
+        regime = rng.choice(list(REGIME_ORDER), count)
+        liquidity = rng.choice([np.nan, 0.0, 0.5, 2.0, 100.0], count)
+
+        sizes = sizer.calculate_position_sizes(vol_risk, q50, info_ratio, multiplier, regime, liquidity, current_balance=0.4)
+        for i in range(count):
+            signal = {'vol_risk': vol_risk[i], 'q50': q50[i], 'enhanced_info_ratio': info_ratio[i],
+                      'regime_multiplier': multiplier[i], 'regime': regime[i]}
+            pool = None if np.isnan(liquidity[i]) else {'reserve_sol': liquidity[i]}
+            assert sizes[i] == sizer.calculate_position_size(signal, pool, current_balance=0.4).final_size
+
+    def test_validate_trades_batch_matches_scalar(self):
+        risk_manager = RiskManager({'pumpswap': {'max_position_size': 0.5}})
+        sizes = np.array([0.01, 0.5, 0.51, 2.0])
+        assert risk_manager.validate_trades_batch(sizes).tolist() == [
+            risk_manager.validate_trade(size, {}).is_valid for size in sizes
+        ]
+        risk_manager.circuit_breaker_status = CircuitBreakerStatus.TRIGGERED
+        assert not risk_manager.validate_trades_batch(sizes).any()
+
+
+class TestOhlcvLoading:
+    """Test columnar bar loading and signal matching."""
+
+    def test_load_ohlcv_bars(self):
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(engine, tables=[OHLCVData.__table__])
+        with engine.begin() as connection:
+            connection.execute(OHLCVData.__table__.insert(), [
+                {'pool_id': pool, 'timeframe': '1h', 'timestamp': 1704067200 + 3600 * i,
+                 'open_price': 1.0, 'high_price': 1.5, 'low_price': 0.5, 'close_price': 1.0 + i,
+                 'volume_usd': 100.0, 'datetime': pd.Timestamp(1704067200 + 3600 * i, unit='s').to_pydatetime()}
+                for pool in ('pool_a', 'pool_b') for i in range(5)
+            ])
+
+        bars = load_ohlcv_bars(engine, 'pool_a', '1h', start=pd.Timestamp('2024-01-01 01:00'))
+        assert bars['timestamp'].tolist() == [1704067200 + 3600 * i for i in range(1, 5)]
+        assert bars['close'].tolist() == [2.0, 3.0, 4.0, 5.0]
+        assert bars['close'].dtype == np.float64
+
+    def test_match_signals_ties_go_to_earlier(self):
+        index_ns = np.array([0, 10, 20], dtype=np.int64)
+        times_ns = np.array([-3, 5, 14, 16, 26, 40], dtype=np.int64)
+        assert match_signals(index_ns, times_ns, 5).tolist() == [0, 0, 1, 2, -1, -1]
@@ -0,0 +1,210 @@
+"""
+Tests for the regression-gated benchmark suite.
+"""
+
+import json
+
+import pytest
+
+from tests.benchmark_suite import (
+    BASELINE_SCHEMA_VERSION,
+    BaselineStore,
+    Benchmark,
+    BenchmarkResult,
+    BenchmarkSuite,
+    check_startup_budget,
+    compare_results,
+    parse_importtime,
+    percentile,
+    relative_mad,
+)
+from tests.performance_config import RegressionTolerances, StartupBudget
+
+
+def make_result(name="bench", durations=None, items=100, peak_rss_mb=100.0):
+    return BenchmarkResult(
+        name=name,
+        kind="micro",
+        iterations=len(durations or [0.1] * 5),
+        warmup=1,
+        items_per_iteration=items,
+        durations=durations or [0.1] * 5,
+        peak_rss_mb=peak_rss_mb
+    )
+
+
+class CountingBenchmark(Benchmark):
+    """Trivial benchmark recording its lifecycle calls."""
+
+    name = "counting"
+    iterations = 3
+    warmup = 1
+    calls = []
+
+    async def setup(self):
+        CountingBenchmark.calls.append("setup")
+
+    async def run_once(self, iteration):
+        CountingBenchmark.calls.append(iteration)
+        return 10
+
+    async def teardown(self):
+        CountingBenchmark.calls.append("teardown")
+
+
+class TestStatistics:
+    """Test percentile and noise helpers."""
+
+    def test_percentile_interpolates(self):
+        assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 50) == 3.0
+        assert percentile([1.0, 2.0], 95) == pytest.approx(1.95)
+        assert percentile([], 95) == 0.0
+
+    def test_relative_mad(self):
+        assert relative_mad([1.0, 1.0, 1.0]) == 0.0
+        assert relative_mad([1.0, 1.1, 0.9, 1.0, 1.0]) == pytest.approx(0.0)
+        assert relative_mad([1.0, 1.2, 0.8, 1.2, 0.8]) == pytest.approx(0.2)
+
+
+class TestCompareResults:
+    """Test regression detection against a baseline."""
+
+    def test_unchanged_run_passes(self):
+        comparisons = compare_results({"bench": make_result()}, {"bench": make_result()})
+
+        assert {c.metric for c in comparisons} == {"throughput", "p95_seconds", "peak_rss_mb"}
+        assert not any(c.regressed for c in comparisons)
+
+    def test_slowdown_beyond_tolerance_regresses(self):
+        comparisons = compare_results(
+            {"bench": make_result(durations=[0.1] * 5)},
+            {"bench": make_result(durations=[0.2] * 5)}
+        )
+        regressed = {c.metric for c in comparisons if c.regressed}
+
+        assert regressed == {"throughput", "p95_seconds"}
+
+    def test_noisy_baseline_widens_tolerance(self):
+        noisy = [0.1, 0.14, 0.06, 0.14, 0.06]
+        tolerances = RegressionTolerances(max_throughput_drop=0.1, max_p95_latency_increase=0.1)
+
+        comparisons = compare_results(
+            {"bench": make_result(durations=noisy)},
+            {"bench": make_result(durations=[0.125] * 5)},
+            tolerances
+        )
+
+        throughput = next(c for c in comparisons if c.metric == "throughput")
+        assert throughput.tolerance == pytest.approx(1.2)
+        assert not throughput.regressed
+
+    def test_small_absolute_rss_growth_is_ignored(self):
+        comparisons = compare_results(
+            {"bench": make_result(peak_rss_mb=50.0)},
+            {"bench": make_result(peak_rss_mb=70.0)}
+        )
+        rss = next(c for c in comparisons if c.metric == "peak_rss_mb")
+        assert not rss.regressed
+
+        comparisons = compare_results(
+            {"bench": make_result(peak_rss_mb=100.0)},
+            {"bench": make_result(peak_rss_mb=200.0)}
+        )
+        rss = next(c for c in comparisons if c.metric == "peak_rss_mb")
+        assert rss.regressed
+
+    def test_benchmark_without_baseline_is_skipped(self):
+        comparisons = compare_results({}, {"new": make_result(name="new")})
+        assert comparisons == []
+
+
+class TestBaselineStore:
+    """Test baseline persistence."""
+
+    def test_round_trip(self, tmp_path):
+        store = BaselineStore(str(tmp_path))
+        original = {"bench": make_result(durations=[0.1, 0.2, 0.3])}
+
+        path = store.save("main", original)
+        loaded = store.load("main")
+
+        payload = json.loads(path.read_text())
+        assert payload["schema_version"] == BASELINE_SCHEMA_VERSION
+        assert payload["label"] == "main"
+        assert loaded["bench"].durations == [0.1, 0.2, 0.3]
+        assert loaded["bench"].throughput == pytest.approx(original["bench"].throughput)
+
+    def test_missing_baseline(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            BaselineStore(str(tmp_path)).load("missing")
+
+    def test_schema_mismatch(self, tmp_path):
+        store = BaselineStore(str(tmp_path))
+        store.path_for("old").write_text(json.dumps({"schema_version": 0, "benchmarks": {}}))
+
+        with pytest.raises(ValueError, match="schema version"):
+            store.load("old")
+
+
+class TestBenchmarkSuite:
+    """Test running benchmarks through the suite."""
+
+    @pytest.mark.asyncio
+    async def test_runs_warmup_and_timed_iterations(self):
+        CountingBenchmark.calls = []
+        suite = BenchmarkSuite(benchmarks={"counting": CountingBenchmark})
+
+        results = await suite.run()
+
+        result = results["counting"]
+        assert CountingBenchmark.calls == ["setup", 0, 1, 2, 3, "teardown"]
+        assert len(result.durations) == 3
+        assert result.items_per_iteration == 10
+        assert result.peak_rss_mb > 0
+
+    @pytest.mark.asyncio
+    async def test_iteration_overrides(self):
+        CountingBenchmark.calls = []
+        suite = BenchmarkSuite(benchmarks={"counting": CountingBenchmark}, iterations=2, warmup=0)
+
+        results = await suite.run(["counting"])
+
+        assert CountingBenchmark.calls == ["setup", 0, 1, "teardown"]
+        assert results["counting"].iterations == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_benchmark(self):
+        with pytest.raises(ValueError, match="Unknown benchmarks"):
+            await BenchmarkSuite(benchmarks={"counting": CountingBenchmark}).run(["nope"])
+
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       900 |       1500 | gecko_terminal_collector.utils.lazy_imports
+import time:      2000 |      52000 |     asyncio.base_events
+import time:      1150 |      60000 | gecko_terminal_collector.cli
+"""
+
+
+class TestStartupBudget:
+    """Test import-time parsing and the CLI startup budget."""
+
+    def test_parse_importtime(self):
+        profile = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert profile.cumulative_seconds("gecko_terminal_collector.cli") == pytest.approx(0.06)
+        assert profile.self_us["asyncio.base_events"] == 2000
+        assert profile.slowest(1) == [("asyncio.base_events", pytest.approx(0.002))]
+        assert profile.cumulative_seconds("pandas") == 0.0
+
+    def test_cli_startup_within_budget(self):
+        assert check_startup_budget() == []
+
+    def test_budget_violations_reported(self):
+        violations = check_startup_budget(
+            StartupBudget(max_cli_import_seconds=0.0, max_cli_help_seconds=0.0, deferred_modules=["argparse"])
+        )
+
+        assert len(violations) == 3
+        assert "eagerly loads ['argparse']" in violations[1]
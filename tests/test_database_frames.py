@@ -0,0 +1,158 @@
+"""
+Tests for the columnar frame reads of the database managers.
+"""
+
+import time
+import tracemalloc
+
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import numpy as np
+
+from gecko_terminal_collector.database.frames import (
+    OHLCV_FRAME_COLUMNS,
+    POOL_HISTORY_FRAME_COLUMNS,
+    TRADE_FRAME_COLUMNS,
+    ohlcv_records_to_frame,
+    pool_history_records,
+    rows_to_frame,
+    trade_records_to_frame,
+)
+from gecko_terminal_collector.database.manager import DatabaseManager
+from gecko_terminal_collector.database.models import NewPoolsHistory
+from gecko_terminal_collector.models.core import OHLCVRecord
+from tests.conftest import POOLS, trade_row
+
+
+START = datetime(2025, 1, 1)
+
+
+def ohlcv_record(pool_id, hour):
+    price = Decimal("1.5") + Decimal(hour) / 10
+    return OHLCVRecord(
+        pool_id=pool_id, timeframe="1h", timestamp=int((START + timedelta(hours=hour)).timestamp()),
+        open_price=price, high_price=price + 1, low_price=price - 1, close_price=price,
+        volume_usd=Decimal("1000.25") * (hour + 1), datetime=START + timedelta(hours=hour)
+    )
+
+
+@pytest_asyncio.fixture
+async def db_manager(db_manager):
+    with db_manager.connection.get_session() as session:
+        session.add_all(
+            NewPoolsHistory(
+                pool_id=pool_id, name=pool_id, address=pool_id, network_id="solana", dex_id="raydium",
+                volume_usd_h24=Decimal("500.5") if hour else None, reserve_in_usd=Decimal("9000"),
+                transactions_h1_buys=hour or None, collected_at=START + timedelta(hours=hour)
+            )
+            for pool_id in POOLS for hour in range(3)
+        )
+        session.add_all(
+            trade_row(pool_id, index, START + timedelta(minutes=10 * index), index if index % 2 else None)
+            for pool_id in POOLS for index in range(4)
+        )
+        session.commit()
+
+    await db_manager.store_ohlcv_data([ohlcv_record(pool_id, hour) for pool_id in POOLS for hour in range(5)])
+    return db_manager
+
+
+class TestDatabaseFrames:
+    """Test frame reads against the dataclass reads."""
+
+    @pytest.mark.asyncio
+    async def test_ohlcv_frame_matches_records(self, db_manager):
+        frame = await db_manager.get_ohlcv_frame(list(POOLS), "1h", start_time=START + timedelta(hours=1))
+
+        assert list(frame.columns) == list(OHLCV_FRAME_COLUMNS)
+        assert {name: str(dtype) for name, dtype in frame.dtypes.items()} == OHLCV_FRAME_COLUMNS
+        assert len(frame) == 8
+        assert list(frame['pool_id'].unique()) == list(POOLS)
+
+        records = []
+        for pool_id in POOLS:
+            records.extend(await db_manager.get_ohlcv_data(pool_id, "1h", start_time=START + timedelta(hours=1)))
+        expected = ohlcv_records_to_frame(records)
+        for name in OHLCV_FRAME_COLUMNS:
+            assert frame[name].tolist() == pytest.approx(expected[name].tolist()) \
+                if OHLCV_FRAME_COLUMNS[name] == 'float64' else frame[name].tolist() == expected[name].tolist()
+
+        # A single pool ID works too, and unknown pools give an empty typed frame
+        assert len(await db_manager.get_ohlcv_frame(POOLS[0], "1h")) == 5
+        empty = await db_manager.get_ohlcv_frame(["missing"], "1h")
+        assert empty.empty and str(empty['close_price'].dtype) == 'float64'
+
+    @pytest.mark.asyncio
+    async def test_trades_frame_matches_records(self, db_manager):
+        frame = await db_manager.get_trades_frame(list(POOLS), min_volume_usd=200)
+
+        assert list(frame.columns) == list(TRADE_FRAME_COLUMNS)
+        assert str(frame['volume_usd'].dtype) == 'float64'
+        assert str(frame['block_number'].dtype) == 'Int64'
+        assert frame['block_number'].isna().sum() == 2
+        assert len(frame) == 6
+
+        base_frame = await DatabaseManager.get_trades_frame(db_manager, list(POOLS), min_volume_usd=200)
+        assert frame['id'].tolist() == base_frame['id'].tolist()
+        assert frame['volume_usd'].tolist() == base_frame['volume_usd'].tolist()
+        assert frame['block_timestamp'].tolist() == base_frame['block_timestamp'].tolist()
+        assert trade_records_to_frame([]).empty
+
+    def test_tz_aware_times_decode_to_naive_utc(self):
+        # PostgreSQL TIMESTAMPTZ columns come back tz-aware, possibly in a non-UTC session zone
+        plus_two = timezone(timedelta(hours=2))
+        rows = [
+            ("trade1", POOLS[0], None, 1.0, 100.0, 2.5, 100.0, "buy", datetime(2025, 1, 1, 2, 30, tzinfo=plus_two)),
+            ("trade2", POOLS[0], 7, 1.0, 100.0, 2.5, 200.0, "sell", datetime(2025, 1, 1, 1, 0, tzinfo=timezone.utc)),
+        ]
+
+        frame = rows_to_frame(rows, TRADE_FRAME_COLUMNS)
+
+        assert str(frame['block_timestamp'].dtype) == 'datetime64[ns]'
+        assert frame['block_timestamp'].tolist() == [datetime(2025, 1, 1, 0, 30), datetime(2025, 1, 1, 1, 0)]
+        assert int((frame['block_timestamp'] >= datetime(2025, 1, 1, 0, 45)).sum()) == 1
+        assert str(rows_to_frame([], TRADE_FRAME_COLUMNS)['block_timestamp'].dtype) == 'datetime64[ns]'
+
+    @pytest.mark.asyncio
+    async def test_pool_history_frame_matches_dictionaries(self, db_manager):
+        frame = await db_manager.get_pool_history_frame(list(POOLS), START)
+
+        assert {name: str(dtype) for name, dtype in frame.dtypes.items()} == POOL_HISTORY_FRAME_COLUMNS
+        assert np.isnan(frame['volume_usd_h24']).sum() == 2
+
+        history = pool_history_records(frame)
+        for pool_id in POOLS:
+            assert history[pool_id] == await db_manager.get_pool_history(pool_id, START)
+
+    @pytest.mark.asyncio
+    async def test_ohlcv_frame_allocates_less_than_records(self, db_manager):
+        await db_manager.store_ohlcv_data([ohlcv_record(POOLS[0], hour) for hour in range(5, 2000)])
+
+        async def measure(read):
+            await read()  # warm up statement caches
+            tracemalloc.start()
+            start = time.perf_counter()
+            try:
+                result = await read()
+                elapsed = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return result, elapsed, peak
+
+        records, records_seconds, records_peak = await measure(
+            lambda: db_manager.get_ohlcv_data(POOLS[0], "1h")
+        )
+        frame, frame_seconds, frame_peak = await measure(
+            lambda: db_manager.get_ohlcv_frame(POOLS[0], "1h")
+        )
+
+        print(
+            f"records: {records_seconds * 1000:.1f}ms peak {records_peak / 1024:.0f}KiB, "
+            f"frame: {frame_seconds * 1000:.1f}ms peak {frame_peak / 1024:.0f}KiB"
+        )
+        assert len(frame) == len(records) == 2000
+        assert frame_peak < records_peak
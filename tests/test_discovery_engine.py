@@ -2,6 +2,8 @@
 Unit tests for DiscoveryEngine.
 """
 
+import asyncio
+import pandas as pd
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -177,7 +179,7 @@ class TestDiscoveryEngine:
         assert pools[0].dex_id == "test_dex"
         
         # Verify API was called
-        mock_client.get_top_pools_by_network_dex.assert_called_once_with("solana", "test_dex")
+        mock_client.get_top_pools_by_network_dex.assert_called_once_with("solana", "test_dex", page=1)
         
         # Verify pool was stored
         mock_db_manager.store_pool.assert_called_once()
@@ -378,5 +380,150 @@ class TestDiscoveryEngine:
         mock_db_manager.store_pool.assert_not_called()
 
 
+def make_pool_page(dex_id, start, count, token_ids=None):
+    """Build one top-pools API page of `count` pools for a DEX."""
+    return {
+        "data": [
+            {
+                "id": f"{dex_id}_pool_{i}",
+                "type": "pool",
+                "attributes": {"name": f"Pool {i}", "address": f"{dex_id}_addr_{i}", "reserve_in_usd": "5000.0"},
+                "relationships": {
+                    "base_token": {"data": {"id": f"solana_{dex_id}_token_{i}"}},
+                    "quote_token": {"data": {"id": (token_ids or {}).get(i, "solana_sol")}}
+                }
+            }
+            for i in range(start, start + count)
+        ]
+    }
+
+
+class TestBootstrapPipeline:
+    """Test the concurrent, paginated bootstrap pipeline."""
+    
+    @pytest.fixture
+    def paged_client(self, mock_client):
+        pages = {
+            ("dex_a", 1): make_pool_page("dex_a", 0, 3),
+            ("dex_a", 2): make_pool_page("dex_a", 3, 2),
+            ("dex_b", 1): make_pool_page("dex_b", 0, 2),
+        }
+        
+        async def get_top_pools(network, dex_id, page=1):
+            return pages.get((dex_id, page), {"data": []})
+        
+        mock_client.get_dexes_by_network.return_value = [{"id": "dex_a"}, {"id": "dex_b"}]
+        mock_client.get_top_pools_by_network_dex.side_effect = get_top_pools
+        return mock_client
+    
+    @pytest.mark.asyncio
+    async def test_bootstrap_streams_pages_to_bulk_storage(self, discovery_engine, paged_client, mock_db_manager):
+        """Test each page is stored in bulk and shared tokens are fetched once."""
+        mock_db_manager.get_dex_by_id.return_value = None
+        
+        result = await discovery_engine.bootstrap_system()
+        
+        assert result.success is True
+        assert result.pools_discovered == 5 + 2
+        # 7 base tokens plus the shared quote token
+        assert result.tokens_discovered == 8
+        assert paged_client.get_specific_token_on_network.call_count == 8
+        
+        pages_requested = sorted(
+            (call.args[1], call.kwargs["page"]) for call in paged_client.get_top_pools_by_network_dex.call_args_list
+        )
+        assert pages_requested == [("dex_a", 1), ("dex_a", 2), ("dex_a", 3), ("dex_b", 1), ("dex_b", 2)]
+        
+        stored_batches = sorted(len(call.args[0]) for call in mock_db_manager.store_pools.call_args_list)
+        assert stored_batches == [2, 2, 3]
+        assert mock_db_manager.store_tokens.call_count == 3
+        mock_db_manager.store_pool.assert_not_called()
+        mock_db_manager.update_pool_priorities.assert_any_call({"dex_a_pool_3": "high", "dex_a_pool_4": "high"})
+    
+    @pytest.mark.asyncio
+    async def test_bootstrap_pages_dataframe_responses(self, discovery_engine, mock_client, mock_db_manager):
+        """Test SDK DataFrame pages of flat pool records are paged and parsed."""
+        frame = pd.DataFrame([
+            {
+                "id": f"solana_pool_{i}", "address": f"addr_{i}", "name": f"Pool {i}",
+                "dex_id": "dex_a", "base_token_id": f"solana_token_{i}", "quote_token_id": "solana_sol",
+                "reserve_in_usd": 5000.0, "volume_usd_h24": 1000.0,
+                "pool_created_at": pd.Timestamp("2025-01-01T00:00:00Z"),
+            }
+            for i in range(2)
+        ])
+        
+        async def get_top_pools(network, dex_id, page=1):
+            return frame if page == 1 else pd.DataFrame()
+        
+        mock_client.get_dexes_by_network.return_value = [{"id": "dex_a"}]
+        mock_client.get_top_pools_by_network_dex.side_effect = get_top_pools
+        mock_db_manager.get_dex_by_id.return_value = None
+        
+        result = await discovery_engine.bootstrap_system()
+        
+        assert result.pools_discovered == 2
+        assert mock_client.get_top_pools_by_network_dex.call_count == 2
+        pools = mock_db_manager.store_pools.call_args.args[0]
+        assert [(pool.address, pool.base_token_id, pool.quote_token_id) for pool in pools] == [
+            ("addr_0", "solana_token_0", "solana_sol"), ("addr_1", "solana_token_1", "solana_sol")
+        ]
+        assert pools[0].reserve_usd == Decimal("5000.0")
+        assert pools[0].created_at.year == 2025
+    
+    @pytest.mark.asyncio
+    async def test_bootstrap_stops_at_pool_limit(self, discovery_engine, paged_client, mock_db_manager, mock_config):
+        """Test paging stops once max_pools_per_dex pools passed the filters."""
+        mock_config.discovery.max_pools_per_dex = 3
+        
+        result = await discovery_engine.bootstrap_system()
+        
+        assert result.pools_discovered == 3 + 2
+        dex_a_pages = [
+            call.kwargs["page"] for call in paged_client.get_top_pools_by_network_dex.call_args_list
+            if call.args[1] == "dex_a"
+        ]
+        assert dex_a_pages == [1]
+    
+    @pytest.mark.asyncio
+    async def test_bootstrap_bounds_concurrent_requests(self, discovery_engine, mock_client, mock_config):
+        """Test DEXes are discovered concurrently within api.max_concurrent."""
+        mock_config.api.max_concurrent = 2
+        mock_client.get_dexes_by_network.return_value = [{"id": f"dex_{i}"} for i in range(5)]
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def get_top_pools(network, dex_id, page=1):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return make_pool_page(dex_id, 0, 1) if page == 1 else {"data": []}
+        
+        mock_client.get_top_pools_by_network_dex.side_effect = get_top_pools
+        
+        result = await discovery_engine.bootstrap_system()
+        
+        assert result.pools_discovered == 5
+        assert max_in_flight == 2
+    
+    @pytest.mark.asyncio
+    async def test_bootstrap_records_dex_failures(self, discovery_engine, paged_client, mock_db_manager):
+        """Test a failing DEX is reported without stopping the others."""
+        async def store_pools(pools):
+            if pools[0].dex_id == "dex_b":
+                raise RuntimeError("database unavailable")
+            return len(pools)
+        
+        mock_db_manager.store_pools.side_effect = store_pools
+        
+        result = await discovery_engine.bootstrap_system()
+        
+        assert result.success is False
+        assert result.pools_discovered == 5
+        assert result.errors == ["Failed to discover pools from DEX dex_b: database unavailable"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
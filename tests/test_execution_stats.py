@@ -0,0 +1,175 @@
+"""
+Tests for incremental execution statistics in TradeExecutionRecorder.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from nautilus_poc.execution_stats import LatencySketch, RunningMoments
+from nautilus_poc.position_manager import TradeExecutionModel
+from nautilus_poc.trade_execution_recorder import TradeExecutionRecorder
+
+
+def make_config(tmp_path):
+    return {'database': {'type': 'sqlite', 'path': str(tmp_path / "trades.db")}}
+
+
+def comparable(stats):
+    """Drop the sketch-derived fields, which are approximate by design."""
+    # Slippage is stored with four decimals, so values read back differ slightly
+    return {
+        key: (pytest.approx(value, rel=1e-4) if isinstance(value, float) else value)
+        for key, value in stats.items()
+        if key not in ('execution_latency_percentiles_ms', 'regime_statistics')
+    }
+
+
+class TestRunningMoments:
+    """Test Welford updates, removal and merging."""
+
+    def test_add_remove_merge_match_numpy(self):
+        rng = np.random.default_rng(7)
+        values = rng.normal(100, 15, size=200)
+        moments = RunningMoments()
+        for value in values:
+            moments.add(value)
+        for value in values[:50]:
+            moments.remove(value)
+
+        assert moments.count == 150
+        assert moments.mean == pytest.approx(values[50:].mean())
+        assert moments.variance == pytest.approx(values[50:].var())
+
+        other = RunningMoments.from_sums(50, values[:50].sum(), (values[:50] ** 2).sum())
+        moments.merge(other)
+        assert moments.total == pytest.approx(values.sum())
+        assert moments.std == pytest.approx(values.std())
+
+
+class TestLatencySketch:
+    """Test quantile accuracy and removal."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        rng = np.random.default_rng(2)
+        values = rng.lognormal(5, 1, size=5000).round()
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95, 0.99):
+            expected = np.quantile(values, q, method='lower')
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.011)
+
+        for value in values:
+            sketch.remove(value)
+        assert sketch.count == 0
+        assert sketch.quantile(0.5) is None
+
+
+class TestRecorderStatistics:
+    """Test running aggregates against the SQL GROUP BY path."""
+
+    async def record_trades(self, recorder):
+        rng = np.random.default_rng(4)
+        trade_ids = []
+        for i in range(40):
+            regime = ('low_variance', 'high_variance', None)[i % 3]
+            trade_id = await recorder.record_trade_attempt(
+                f"mint_{i}", ('buy', 'sell')[i % 2], {'regime': regime}, 0.001, token_amount=1000.0
+            )
+            trade_ids.append(trade_id)
+            if i % 4 == 3:
+                continue
+            await recorder.update_trade_execution(
+                trade_id,
+                {
+                    'status': 'confirmed',
+                    'actual_price': 0.001 * (1 + rng.uniform(0, 0.05)),
+                    'gas_used': int(rng.integers(40000, 50000)),
+                    'sol_received': float(rng.uniform(0.9, 1.1))
+                },
+                execution_latency_ms=int(rng.integers(50, 500))
+            )
+            if i % 5 == 0:
+                await recorder.mark_trade_failed(trade_id, "reverted")
+        return trade_ids
+
+    @pytest.mark.asyncio
+    async def test_running_statistics_match_sql(self, tmp_path):
+        recorder = TradeExecutionRecorder(make_config(tmp_path))
+        await self.record_trades(recorder)
+
+        stats = await recorder.get_execution_statistics()
+        far_past = datetime.utcnow() - timedelta(days=1)
+        ranged = await recorder.get_execution_statistics(start_date=far_past)
+
+        assert stats['total_trades'] == 40
+        assert stats['successful_trades'] + stats['failed_trades'] + stats['status_counts']['pending'] == 40
+        assert stats['regime_breakdown'] == {'low_variance': 14, 'high_variance': 13, 'unknown': 13}
+        assert comparable(stats) == comparable(ranged)
+        assert stats['execution_latency_percentiles_ms'] == ranged['execution_latency_percentiles_ms']
+
+        daily = await recorder.get_daily_execution_statistics()
+        assert sum(day['total_trades'] for day in daily.values()) == 40
+
+        await recorder.close()
+
+        # A new recorder seeds the same aggregates from the table
+        reloaded = TradeExecutionRecorder(make_config(tmp_path))
+        assert comparable(await reloaded.get_execution_statistics()) == comparable(stats)
+        await reloaded.close()
+
+    @pytest.mark.asyncio
+    async def test_status_transitions_move_counts(self, tmp_path):
+        recorder = TradeExecutionRecorder(make_config(tmp_path))
+        trade_id = await recorder.record_trade_attempt("mint", 'buy', {'regime': 'low_variance'}, 0.001)
+
+        stats = await recorder.get_execution_statistics()
+        assert stats['status_counts'] == {'pending': 1}
+
+        await recorder.update_trade_execution(trade_id, {'status': 'confirmed', 'actual_price': 0.0011}, 120)
+        stats = await recorder.get_execution_statistics()
+        assert stats['successful_trades'] == 1
+        assert stats['average_slippage_percent'] == pytest.approx(10.0)
+        assert stats['average_execution_latency_ms'] == 120
+
+        await recorder.mark_trade_failed(trade_id, "dropped")
+        stats = await recorder.get_execution_statistics()
+        assert stats['successful_trades'] == 0
+        assert stats['failed_trades'] == 1
+        assert stats['total_trades'] == 1
+
+        # Unknown trades leave the aggregates untouched
+        await recorder.mark_trade_failed("missing", "dropped")
+        assert (await recorder.get_execution_statistics())['total_trades'] == 1
+
+        await recorder.close()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_rebuilds_aggregates(self, tmp_path):
+        recorder = TradeExecutionRecorder(make_config(tmp_path))
+        old_id = await recorder.record_trade_attempt("old", 'buy', {'regime': 'low_variance'}, 0.001)
+        await recorder.record_trade_attempt("new", 'buy', {'regime': 'low_variance'}, 0.001)
+        await recorder.flush()
+        with recorder.SessionLocal() as session:
+            session.query(TradeExecutionModel).filter(TradeExecutionModel.trade_id == old_id).update(
+                {'timestamp': datetime.utcnow() - timedelta(days=60)}
+            )
+            session.commit()
+
+        assert await recorder.cleanup_old_records(days_to_keep=30) == 1
+        stats = await recorder.get_execution_statistics()
+        assert stats['total_trades'] == 1
+        assert len(await recorder.get_daily_execution_statistics()) == 1
+
+        await recorder.close()
+
+    @pytest.mark.asyncio
+    async def test_empty_statistics(self, tmp_path):
+        recorder = TradeExecutionRecorder(make_config(tmp_path))
+        stats = await recorder.get_execution_statistics()
+        assert stats['total_trades'] == 0
+        assert 'regime_breakdown' not in stats
+        await recorder.close()
@@ -202,6 +202,40 @@ class TestGeckoTerminalClient:
         
         assert result == expected_response
         mock_instance.get_multiple_pools_by_network.assert_called_once_with("solana", ["addr1", "addr2"])
+    
+    @pytest.mark.asyncio
+    async def test_get_top_pools_by_network_dex_pages(self):
+        """Test top pools requests pass the page through and stop empty."""
+        client = GeckoTerminalClient(self.api_config, self.error_config)
+        pool = {
+            "id": "solana_pool1",
+            "type": "pool",
+            "attributes": {
+                "name": "A / B", "address": "pool1", "reserve_in_usd": "100",
+                "base_token_price_usd": "1", "base_token_price_native_currency": "1",
+                "quote_token_price_usd": "1", "quote_token_price_native_currency": "1",
+                "pool_created_at": None, "fdv_usd": None, "market_cap_usd": None,
+                "price_change_percentage": {"h1": "0", "h24": "0"},
+                "transactions": {"h1": {"buys": 1, "sells": 1}, "h24": {"buys": 2, "sells": 2}},
+                "volume_usd": {"h24": "10"}
+            },
+            "relationships": {
+                "dex": {"data": {"id": "heaven"}},
+                "base_token": {"data": {"id": "solana_base"}},
+                "quote_token": {"data": {"id": "solana_quote"}}
+            }
+        }
+        client._sdk_client.api_request = AsyncMock(side_effect=[{"data": [pool]}, {"data": []}])
+        
+        first_page = await client.get_top_pools_by_network_dex("solana", "heaven", page=2)
+        last_page = await client.get_top_pools_by_network_dex("solana", "heaven", page=3)
+        
+        assert first_page["id"].tolist() == ["solana_pool1"]
+        assert first_page["base_token_id"].tolist() == ["base"]
+        assert last_page.empty
+        client._sdk_client.api_request.assert_any_call(
+            "GET", "networks/solana/dexes/heaven/pools", params={"page": 2}
+        )
 
 
 class TestMockGeckoTerminalClient:
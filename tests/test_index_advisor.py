@@ -0,0 +1,191 @@
+"""
+Tests for the workload-driven index advisor.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, inspect, select, text
+
+from gecko_terminal_collector.database.index_advisor import (
+    IndexAdvisor,
+    IndexSuggestion,
+    index_parity,
+    next_revision,
+    render_migration,
+    revision_index_names,
+    run_workload,
+    statement_filters,
+)
+from gecko_terminal_collector.database.models import Trade
+from gecko_terminal_collector.models.core import OHLCVRecord
+from tests.conftest import POOLS, trade_row
+
+VERSIONS_DIR = Path(__file__).resolve().parent.parent / "migrations" / "versions"
+
+
+def index_columns(engine, table):
+    return {index["name"]: tuple(index["column_names"]) for index in inspect(engine).get_indexes(table)}
+
+
+def run_migration(engine, source, tmp_path, direction="upgrade"):
+    path = tmp_path / "migration.py"
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location("index_migration", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    with engine.begin() as connection:
+        with Operations.context(MigrationContext.configure(connection)):
+            getattr(module, direction)()
+
+
+@pytest_asyncio.fixture
+async def db_manager(db_manager):
+    with db_manager.connection.get_session() as session:
+        session.add_all(trade_row(pool_id, index) for pool_id in POOLS for index in range(20))
+        session.commit()
+    return db_manager
+
+
+async def record_workload(db_manager, **audit_options):
+    advisor = IndexAdvisor(db_manager)
+    with advisor.record():
+        await db_manager.store_ohlcv_data([
+            OHLCVRecord(
+                pool_id=POOLS[0], timeframe="1h", timestamp=1735689600 + hour * 3600,
+                open_price=Decimal("1"), high_price=Decimal("2"), low_price=Decimal("0.5"),
+                close_price=Decimal("1.5"), volume_usd=Decimal("100"),
+                datetime=datetime(2025, 1, 1) + timedelta(hours=hour)
+            )
+            for hour in range(3)
+        ])
+        await run_workload(db_manager, list(POOLS))
+    return advisor.audit(min_table_rows=0, **audit_options)
+
+
+class TestIndexAdvisor:
+    """Test workload recording, plan analysis and migration rendering."""
+
+    @pytest.mark.asyncio
+    async def test_flags_trade_scan_and_suggests_index(self, db_manager, tmp_path):
+        engine = db_manager.connection.engine
+        with engine.begin() as connection:
+            connection.execute(text("DROP INDEX idx_trades_pool_timestamp"))
+
+        report = await record_workload(db_manager)
+
+        trade_scans = [scan for scan in report.full_scans if scan["method"].endswith(".get_trade_data")]
+        assert trade_scans and trade_scans[0]["table"] == "trades"
+        assert trade_scans[0]["suggested_columns"] == ["pool_id", "block_timestamp"]
+        assert any(s.plan for s in report.statements if s.kind == "read")
+
+        create = [s for s in report.suggestions if s.action == "create" and s.table == "trades"]
+        assert [s.columns for s in create] == [("pool_id", "block_timestamp")]
+
+        # Writes are attributed to their method and counted per index
+        ohlcv_cost = next(cost for cost in report.write_costs if cost.table == "ohlcv_data")
+        assert ohlcv_cost.observed and ohlcv_cost.row_writes == 3
+        assert report.write_amplification["ohlcv_data"] == pytest.approx(2.0)
+        assert report.to_dict()["suggestions"] and "Full scans" in report.format_summary()
+
+        # The rendered migration creates the index once and the plan uses it
+        source = render_migration(report.suggestions, "100", "009")
+        run_migration(engine, source, tmp_path)
+        run_migration(engine, source, tmp_path)
+        assert ("pool_id", "block_timestamp") in index_columns(engine, "trades").values()
+
+        report = await record_workload(db_manager)
+        assert not [scan for scan in report.full_scans if scan["table"] == "trades"]
+
+        run_migration(engine, source, tmp_path, "downgrade")
+        assert ("pool_id", "block_timestamp") not in index_columns(engine, "trades").values()
+
+    @pytest.mark.asyncio
+    async def test_flags_redundant_and_unused_indexes(self, db_manager):
+        with db_manager.connection.engine.begin() as connection:
+            connection.execute(text("CREATE INDEX idx_trades_pool ON trades (pool_id)"))
+            connection.execute(text("CREATE INDEX idx_trades_side ON trades (side)"))
+
+        report = await record_workload(db_manager, drop_unused=True)
+
+        assert [(r.name, c.name) for r, c in report.redundant_indexes if r.table == "trades"] == [
+            ("idx_trades_pool", "idx_trades_pool_timestamp")
+        ]
+        assert "idx_trades_side" in {index.name for index in report.unused_indexes}
+        drops = {s.name: s.reason for s in report.suggestions if s.action == "drop"}
+        assert drops["idx_trades_pool"] == "covered by idx_trades_pool_timestamp"
+        assert "idx_trades_side" in drops
+        assert "idx_trades_pool_timestamp" not in drops
+
+        # Constraint indexes are never suggested for dropping
+        assert not [name for name in drops if name.startswith("sqlite_autoindex")]
+
+    @pytest.mark.asyncio
+    async def test_tuning_migration_is_idempotent_on_create_all_database(self, db_manager, tmp_path):
+        engine = db_manager.connection.engine
+        before = index_columns(engine, "trades")
+
+        source = (VERSIONS_DIR / "009_tune_hot_query_indexes.py").read_text()
+        run_migration(engine, source, tmp_path)
+
+        assert index_columns(engine, "trades") == before
+
+        versions = tmp_path / "versions"
+        versions.mkdir()
+        assert next_revision(versions) == ("001", None)
+        (versions / "009_tune.py").write_text(source)
+        assert next_revision(versions) == ("010", "009")
+
+    def test_tuning_migration_downgrade_keeps_earlier_revision_indexes(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'migrated.db'}")
+        initial = (VERSIONS_DIR / "001_initial_schema.py").read_text()
+        tuning = (VERSIONS_DIR / "009_tune_hot_query_indexes.py").read_text()
+
+        run_migration(engine, initial, tmp_path)
+        before = index_columns(engine, "trades")
+        run_migration(engine, tuning, tmp_path)
+        run_migration(engine, tuning, tmp_path, "downgrade")
+        # PostgreSQL-only duplicates are not recreated on SQLite
+        assert index_columns(engine, "trades") == before
+        assert before["idx_trades_pool_timestamp"] == ("pool_id", "block_timestamp")
+
+        run_migration(engine, initial, tmp_path, "downgrade")
+        assert not inspect(engine).has_table("trades")
+
+    def test_rendered_migration_only_ensures_owned_indexes(self, tmp_path):
+        owned = revision_index_names(VERSIONS_DIR)
+        assert {"idx_trades_pool_timestamp", "idx_ohlcv_datetime"} <= owned
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'migrated.db'}")
+        run_migration(engine, (VERSIONS_DIR / "001_initial_schema.py").read_text(), tmp_path)
+        suggestions = [
+            IndexSuggestion("create", "trades", "idx_trades_pool_timestamp", ("pool_id", "block_timestamp"), ""),
+            IndexSuggestion("create", "trades", "idx_trades_side", ("side",), ""),
+            IndexSuggestion("drop", "trades", "ix_trades_tx_hash", ("tx_hash",), ""),
+        ]
+        source = render_migration(suggestions, "010", "009", owned_indexes=owned, dialect="postgresql")
+        assert "('trades', 'ix_trades_tx_hash', ['tx_hash'], 'postgresql')" in source
+
+        run_migration(engine, source, tmp_path)
+        assert index_columns(engine, "trades")["idx_trades_side"] == ("side",)
+        run_migration(engine, source, tmp_path, "downgrade")
+        assert set(index_columns(engine, "trades")) == {"idx_trades_pool_timestamp", "idx_trades_volume"}
+
+    def test_statement_filters_and_parity(self):
+        statement = select(Trade).where(
+            Trade.pool_id == "pool", Trade.block_timestamp >= datetime(2025, 1, 1), Trade.volume_usd >= 10
+        )
+        assert statement_filters(statement) == {
+            "trades": (["pool_id"], ["block_timestamp", "volume_usd"])
+        }
+
+        trades = index_parity(["trades"]).get("trades", {"sqlite": [], "postgresql": []})
+        assert ("pool_id", "block_timestamp") not in trades["postgresql"]
+        assert ("pool_id",) not in trades["postgresql"]
@@ -0,0 +1,98 @@
+"""
+Tests for the incremental technical-indicator engine.
+"""
+
+import numpy as np
+import pytest
+
+from gecko_terminal_collector.analysis.indicator_engine import (
+    IndicatorEngine,
+    IndicatorSnapshot,
+    IndicatorState,
+)
+
+
+def make_history(n=60, seed=7):
+    rng = np.random.default_rng(seed)
+    timestamps = 1_700_000_000 + 3600 * np.arange(n)
+    prices = 1.0 + np.cumsum(rng.normal(0, 0.02, n))
+    volumes = rng.uniform(1_000, 5_000, n)
+    liquidity = rng.uniform(50_000, 60_000, n)
+    # Gaps in each series are skipped, not treated as zeros
+    prices[5] = np.nan
+    volumes[8] = 0
+    liquidity[11] = np.nan
+    return timestamps, prices, volumes, liquidity
+
+
+def fold_all(engine, timestamps, prices, volumes, liquidity):
+    state = IndicatorState()
+    for ts, price, volume, liq in zip(timestamps, prices, volumes, liquidity):
+        engine.update(state, int(ts), price, volume, liq)
+    return state
+
+
+def assert_same_state(actual, expected):
+    for name, value in expected.to_dict().items():
+        assert getattr(actual, name) == pytest.approx(value, rel=1e-9), name
+
+
+class TestIndicatorEngine:
+    """Test streaming updates, vectorized backfill and persistence."""
+
+    def test_backfill_matches_incremental_updates(self):
+        engine = IndicatorEngine()
+        history = make_history()
+
+        backfilled = engine.backfill(*history)
+        assert_same_state(backfilled, fold_all(engine, *history))
+        assert backfilled.price_count == 59
+        assert len(backfilled.price_window) == engine.bollinger_period
+
+        # Unordered input with a duplicate timestamp yields the same state
+        timestamps, prices, volumes, liquidity = history
+        order = np.r_[np.arange(59, -1, -1), 0]
+        shuffled = engine.backfill(timestamps[order], prices[order], volumes[order], liquidity[order])
+        assert_same_state(shuffled, backfilled)
+
+    def test_update_continues_from_restored_state(self):
+        engine = IndicatorEngine()
+        timestamps, prices, volumes, liquidity = make_history()
+
+        restored = IndicatorState.from_dict(engine.backfill(
+            timestamps[:40], prices[:40], volumes[:40], liquidity[:40]
+        ).to_dict())
+        for i in range(40, 60):
+            snapshot = engine.update(restored, int(timestamps[i]), prices[i], volumes[i], liquidity[i])
+
+        assert_same_state(restored, engine.backfill(timestamps, prices, volumes, liquidity))
+        assert 0 <= snapshot.rsi <= 100
+        assert 0 <= snapshot.bollinger_position <= 1
+        assert snapshot.macd == pytest.approx(restored.ema_fast - restored.ema_slow)
+
+        # Re-observing the last timestamp does not fold it in again
+        before = restored.to_dict()
+        engine.update(restored, int(timestamps[-1]), 99.0, 1.0, 1.0)
+        assert restored.to_dict() == before
+
+    def test_indicator_values(self):
+        engine = IndicatorEngine()
+        state = IndicatorState()
+
+        assert engine.update(state, 1, None, None, None) == IndicatorSnapshot()
+
+        for i, price in enumerate([1.0, 2.0, 3.0, 4.0]):
+            snapshot = engine.update(state, 3600 * (i + 1), price, 100.0, 1_000.0 * (i + 1))
+        assert snapshot.rsi == 100.0
+        assert snapshot.macd == 0.0
+        assert snapshot.bollinger_position == 0.5
+        assert snapshot.volume_sma_ratio == pytest.approx(1.0)
+        assert snapshot.liquidity_change_percentage > 0
+        assert snapshot.liquidity_stability == 0.5
+        # Liquidity quadrupled over three hours
+        assert snapshot.liquidity_growth_rate == pytest.approx(1.0)
+
+        snapshot = engine.update(state, 5 * 3600, 3.0, 400.0, 4_000.0)
+        assert 50 < snapshot.rsi < 100
+        assert snapshot.volume_sma_ratio == pytest.approx(4.0)
+        assert 0 < snapshot.liquidity_stability < 1
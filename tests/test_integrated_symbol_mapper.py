@@ -12,6 +12,8 @@ from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from gecko_terminal_collector.qlib.integrated_symbol_mapper import (
+    CompactSymbolIndex,
+    _normalized_symbol_key,
     IntegratedSymbolMapper, 
     IntegratedSymbolMetadata
 )
@@ -552,5 +554,218 @@ class TestIntegratedSymbolMapperRequirements:
         assert metrics['total_cached_symbols'] >= 1
 
 
+class TestNegativeCacheAndBulkResolution:
+    """Test negative caching of failed lookups and bulk symbol resolution."""
+    
+    @pytest.fixture
+    def mock_enhanced_db_manager(self):
+        """Create mock enhanced database manager with no matching pools."""
+        mock = AsyncMock(spec=EnhancedDatabaseManager)
+        mock.get_pool.return_value = None
+        mock.get_pool_by_address.return_value = None
+        mock.search_pools_by_name_or_id.return_value = []
+        mock.get_pools_by_symbols.return_value = []
+        return mock
+    
+    @pytest.fixture
+    def pools(self):
+        """Create pools whose IDs need symbol normalization."""
+        return [
+            Pool(
+                id=f"solana_AbC{i}-x",
+                address=f"AbC{i}-x",
+                name=f"Pool {i}",
+                dex_id="raydium",
+                base_token_id="base",
+                quote_token_id="quote",
+                reserve_usd=Decimal("1000"),
+                created_at=datetime(2024, 1, 1)
+            )
+            for i in range(3)
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_failed_lookup_is_negatively_cached(self, mock_enhanced_db_manager):
+        """Test that a missing symbol only hits the database once within the TTL."""
+        mapper = IntegratedSymbolMapper(mock_enhanced_db_manager)
+        
+        assert await mapper.lookup_pool_with_fallback("missing") is None
+        assert await mapper.lookup_pool_with_fallback("missing") is None
+        result = await mapper.lookup_pool_detailed_enhanced("missing")
+        
+        assert result.lookup_method == "negative_cache"
+        mock_enhanced_db_manager.get_pool.assert_awaited_once_with("missing")
+        metrics = mapper.get_performance_metrics()
+        assert metrics['negative_cache_hits'] == 2
+        assert metrics['negative_cached_symbols'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_negative_cache_expiry_and_limits(self, mock_enhanced_db_manager, pools):
+        """Test that negative entries expire, are bounded and are cleared by new pools."""
+        mapper = IntegratedSymbolMapper(mock_enhanced_db_manager, negative_cache_ttl=60, max_negative_cache_size=2)
+        
+        with patch('gecko_terminal_collector.qlib.integrated_symbol_mapper.time.monotonic', return_value=1000.0):
+            for symbol in ("a", "b", "c"):
+                await mapper.lookup_pool_with_fallback(symbol)
+            assert list(mapper._negative_cache) == ["b", "c"]
+        
+        with patch('gecko_terminal_collector.qlib.integrated_symbol_mapper.time.monotonic', return_value=1061.0):
+            assert not mapper._is_negative_cached("b")
+        
+        symbol = "solana_AbC0_x"
+        mapper._add_to_negative_cache(symbol)
+        mapper.generate_symbol(pools[0])
+        assert symbol not in mapper._negative_cache
+        
+        mapper.clear_cache()
+        assert not mapper._negative_cache
+    
+    @pytest.mark.asyncio
+    async def test_resolve_symbols_uses_one_bulk_query(self, mock_enhanced_db_manager, pools):
+        """Test bulk resolution by symbol, case-insensitive symbol, raw pool ID and address."""
+        mapper = IntegratedSymbolMapper(mock_enhanced_db_manager)
+        cached_symbol = mapper.generate_symbol(pools[0])
+        mock_enhanced_db_manager.get_pools_by_symbols.return_value = pools[1:]
+        
+        symbols = [cached_symbol, "SOLANA_ABC1_X", pools[2].address, pools[2].id, "unknown", cached_symbol]
+        resolved = await mapper.resolve_symbols(symbols)
+        
+        assert list(resolved) == symbols[:5]
+        assert resolved[cached_symbol] == pools[0]
+        assert resolved["SOLANA_ABC1_X"] == pools[1]
+        assert resolved[pools[2].address] == pools[2]
+        assert resolved[pools[2].id] == pools[2]
+        assert resolved["unknown"] is None
+        mock_enhanced_db_manager.get_pools_by_symbols.assert_awaited_once_with(symbols[1:5])
+        # Only the unresolved symbol goes through the per-symbol strategies
+        mock_enhanced_db_manager.get_pool.assert_awaited_once_with("unknown")
+        
+        # Apart from raw addresses, a second pass is answered from the positive and negative caches
+        symbols.remove(pools[2].address)
+        assert await mapper.resolve_symbols(symbols) == {symbol: resolved[symbol] for symbol in symbols}
+        assert mock_enhanced_db_manager.get_pools_by_symbols.await_count == 1
+        assert mock_enhanced_db_manager.get_pool.await_count == 1
+
+
+
+class TestCompactSymbolCache:
+    """Test the compact symbol index and lazily loaded pools."""
+    
+    POOL_IDS = ["solana_AbC-1", "solana_abc-1", "solana_Zed", "eth_0xF00"]
+    
+    @pytest.fixture
+    def mock_enhanced_db_manager(self):
+        """Create mock enhanced database manager streaming pool IDs."""
+        pools = {
+            pool_id: Pool(
+                id=pool_id,
+                address=pool_id.split("_", 1)[1],
+                name=pool_id,
+                dex_id="raydium",
+                base_token_id="base",
+                quote_token_id="quote",
+                reserve_usd=Decimal("1000"),
+                created_at=datetime(2024, 1, 1)
+            )
+            for pool_id in self.POOL_IDS
+        }
+        
+        async def iter_pool_ids(batch_size=10000, limit=None):
+            for i in range(0, len(self.POOL_IDS), 2):
+                yield self.POOL_IDS[i:i + 2]
+        
+        mock = AsyncMock(spec=EnhancedDatabaseManager)
+        mock.iter_pool_ids = iter_pool_ids
+        mock.get_pool.side_effect = lambda pool_id: pools.get(pool_id)
+        mock.get_pool_by_address.return_value = None
+        mock.search_pools_by_name_or_id.return_value = []
+        return mock
+    
+    def test_compact_index_lookup(self):
+        """Test binary-search lookup by symbol, case-insensitive symbol and raw pool ID."""
+        index = CompactSymbolIndex()
+        assert index.build(self.POOL_IDS) == 4
+        
+        assert index.lookup("solana_AbC_1") == "solana_AbC-1"
+        assert index.lookup("solana_abc_1") == "solana_abc-1"
+        assert index.lookup("eth_0xf00") == "eth_0xF00"
+        assert index.lookup("solana_Zed") == "solana_Zed"
+        assert index.lookup("solana_missing") is None
+        
+        index.add("solana_New")
+        index.add("solana_New")
+        assert len(index) == 5
+        assert index.lookup("SOLANA_NEW") == "solana_New"
+        assert index.memory_bytes() > 0
+        
+        # Inserts keep the list ordered; an ID sharing a symbol goes after it
+        for pool_id in ("eth_0xa", "solana_AAA", "solana_new", "a_0"):
+            index.add(pool_id)
+        keys = [_normalized_symbol_key(pool_id) for pool_id in index._pool_ids]
+        assert keys == sorted(keys)
+        assert index._candidates("solana_new") == ["solana_New", "solana_new"]
+    
+    @pytest.mark.asyncio
+    async def test_compact_mode_loads_pools_lazily(self, mock_enhanced_db_manager):
+        """Test that compact mode keeps only IDs and loads pools into a bounded LRU."""
+        mapper = IntegratedSymbolMapper(mock_enhanced_db_manager, compact_cache=True, pool_cache_size=2)
+        
+        assert await mapper.populate_cache_from_database() == 4
+        assert not mapper._symbol_to_pool_cache and not mapper._integrated_metadata
+        mock_enhanced_db_manager.get_pool.assert_not_called()
+        
+        pool = await mapper.lookup_pool_with_fallback("ETH_0XF00")
+        assert pool.id == "eth_0xF00"
+        assert (await mapper.lookup_pool_with_fallback("eth_0xF00")) is pool
+        mock_enhanced_db_manager.get_pool.assert_awaited_once_with("eth_0xF00")
+        
+        result = await mapper.lookup_pool_detailed_enhanced("solana_Zed")
+        assert result.lookup_method == "compact_cache"
+        assert result.confidence == 1.0
+        await mapper.lookup_pool_with_fallback("solana_AbC_1")
+        assert list(mapper._pool_lru) == ["solana_Zed", "solana_AbC-1"]
+        
+        metrics = mapper.get_performance_metrics()
+        assert metrics['cache_mode'] == 'compact'
+        assert metrics['compact_index_entries'] == 4
+        assert metrics['pool_cache_entries'] == 2
+        assert metrics['lazy_pool_loads'] == 3
+        assert metrics['memory_bytes_per_entry'] > 0
+        assert not mapper._symbol_to_pool_cache
+    
+    @pytest.mark.asyncio
+    async def test_compact_mode_resolve_symbols(self, mock_enhanced_db_manager):
+        """Test bulk resolution and database fallback additions in compact mode."""
+        mapper = IntegratedSymbolMapper(mock_enhanced_db_manager, compact_cache=True)
+        await mapper.populate_cache_from_database()
+        await mapper.lookup_pool_with_fallback("solana_Zed")
+        mock_enhanced_db_manager.get_pools_by_symbols.return_value = [
+            await mock_enhanced_db_manager.get_pool("eth_0xF00")
+        ]
+        
+        resolved = await mapper.resolve_symbols(["solana_Zed", "eth_0xF00"])
+        
+        assert {symbol: pool.id for symbol, pool in resolved.items()} == {
+            "solana_Zed": "solana_Zed", "eth_0xF00": "eth_0xF00"
+        }
+        mock_enhanced_db_manager.get_pools_by_symbols.assert_awaited_once_with(["eth_0xF00"])
+        
+        mapper.clear_cache()
+        assert len(mapper._compact_index) == 0 and not mapper._pool_lru
+    
+    def test_full_mode_reports_memory(self, mock_enhanced_db_manager):
+        """Test memory reporting for the default cache mode."""
+        mapper = IntegratedSymbolMapper(mock_enhanced_db_manager)
+        assert mapper.get_performance_metrics()['memory_bytes_per_entry'] == 0.0
+        
+        mapper.generate_symbol(Pool(
+            id="solana_Zed", address="Zed", name="Zed", dex_id="raydium", base_token_id="base",
+            quote_token_id="quote", reserve_usd=Decimal("1"), created_at=datetime(2024, 1, 1)
+        ))
+        metrics = mapper.get_performance_metrics()
+        assert metrics['cache_mode'] == 'full'
+        assert metrics['memory_bytes_per_entry'] > 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
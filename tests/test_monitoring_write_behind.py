@@ -0,0 +1,299 @@
+"""
+Tests for the monitoring write-behind queue.
+"""
+
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import IntegrityError
+
+from gecko_terminal_collector.config.models import CollectionConfig, DatabaseConfig, MonitoringConfig
+from gecko_terminal_collector.database.enhanced_manager import (
+    CollectionResult as RunResult, EnhancedDatabaseManager
+)
+from gecko_terminal_collector.database.models import (
+    CollectionMetadata, ExecutionHistory, PerformanceMetrics, SystemAlerts
+)
+from gecko_terminal_collector.monitoring.collection_monitor import Alert, AlertLevel
+from gecko_terminal_collector.monitoring.database_manager import (
+    MonitoringDatabaseManager, create_monitoring_db_manager
+)
+from gecko_terminal_collector.monitoring.execution_history import ExecutionRecord, ExecutionStatus
+from gecko_terminal_collector.monitoring.write_behind import (
+    MonitoringWriteBehindQueue, WriteBehindConfig
+)
+from gecko_terminal_collector.scheduling.scheduler import CollectionScheduler
+
+
+@pytest_asyncio.fixture
+async def enhanced_db():
+    """Create an initialized in-memory enhanced database manager."""
+    manager = EnhancedDatabaseManager(DatabaseConfig(url="sqlite:///:memory:", echo=False))
+    await manager.initialize()
+    yield manager
+    await manager.close()
+
+
+class TestMonitoringWriteBehindQueue:
+    """Test cases for MonitoringWriteBehindQueue."""
+
+    @pytest.mark.asyncio
+    async def test_flush_groups_records_by_kind(self):
+        """Each kind's handler receives its records in one call."""
+        calls = []
+        queue = MonitoringWriteBehindQueue()
+        queue.register_handler("a", lambda records: calls.append(("a", records)) or len(records))
+        queue.register_handler("b", lambda records: calls.append(("b", records)) or len(records))
+
+        for i in range(3):
+            assert queue.submit("a", i)
+        assert queue.submit("b", "x")
+
+        written = await queue.flush()
+
+        assert written == 4
+        assert sorted(calls) == [("a", [0, 1, 2]), ("b", ["x"])]
+        assert queue.pending == 0
+
+    def test_unknown_kind_rejected(self):
+        """Submitting an unregistered kind raises."""
+        queue = MonitoringWriteBehindQueue()
+        with pytest.raises(ValueError):
+            queue.submit("missing", 1)
+
+    def test_sampling_above_high_watermark(self):
+        """Sampleable records are thinned once the queue passes the watermark."""
+        queue = MonitoringWriteBehindQueue(
+            WriteBehindConfig(max_queue_size=100, high_watermark=0.5, sample_rate=5)
+        )
+        queue.register_handler("metric", len, sampleable=True)
+
+        accepted = sum(queue.submit("metric", i) for i in range(100))
+
+        stats = queue.get_stats()["kinds"]["metric"]
+        assert accepted == 50 + 10
+        assert stats["sampled_out"] == 40
+
+    def test_full_queue_evicts_sampleable_records_first(self):
+        """Critical records displace sampleable ones and are dropped only as a last resort."""
+        queue = MonitoringWriteBehindQueue(
+            WriteBehindConfig(max_queue_size=3, high_watermark=1.0)
+        )
+        queue.register_handler("metric", len, sampleable=True)
+        queue.register_handler("execution", len)
+
+        queue.submit("metric", 1)
+        queue.submit("execution", 1)
+        queue.submit("execution", 2)
+
+        assert queue.submit("execution", 3)
+        assert queue.pending == 3
+        assert not queue.submit("execution", 4)
+
+        stats = queue.get_stats()["kinds"]
+        assert stats["metric"]["dropped"] == 1
+        assert stats["execution"]["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending_records(self):
+        """Stopping the queue writes everything still buffered."""
+        stored = []
+        queue = MonitoringWriteBehindQueue(WriteBehindConfig(flush_interval=60))
+        queue.register_handler("a", lambda records: stored.extend(records) or len(records))
+
+        await queue.start()
+        queue.submit("a", 1)
+        queue.submit("a", 2)
+        await queue.stop()
+
+        assert stored == [1, 2]
+        assert not queue.is_running
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self):
+        """A transient handler failure does not lose the batch."""
+        attempts = []
+
+        def flaky(records):
+            attempts.append(len(records))
+            if len(attempts) == 1:
+                raise RuntimeError("database is locked")
+            return len(records)
+
+        queue = MonitoringWriteBehindQueue(WriteBehindConfig(retry_delay=0.0))
+        queue.register_handler("a", flaky)
+        queue.submit("a", 1)
+
+        assert await queue.flush() == 1
+        assert attempts == [1, 1]
+
+
+class TestMonitoringDatabaseManagerWriteBehind:
+    """Test batched persistence through MonitoringDatabaseManager."""
+
+    @pytest.mark.asyncio
+    async def test_records_written_on_flush(self, enhanced_db):
+        """Execution records, metrics, alerts and metadata are queued until flushed."""
+        session_factory = enhanced_db.connection.get_session
+        manager = MonitoringDatabaseManager(session_factory)
+        queue = manager.enable_write_behind()
+
+        now = datetime.now()
+        for i in range(3):
+            record = ExecutionRecord(
+                collector_type="ohlcv",
+                execution_id=f"exec_{i}",
+                start_time=now - timedelta(seconds=5),
+                end_time=now,
+                status=ExecutionStatus.SUCCESS,
+                records_collected=10,
+            )
+            assert manager.store_execution_record(record)
+            assert manager.store_performance_metric(
+                "ohlcv", "execution_time", 5.0, timestamp=now + timedelta(seconds=i)
+            )
+            assert manager.update_collection_metadata("ohlcv", 5.0, 10, success=True)
+        assert manager.store_alert(Alert(
+            id="alert_1",
+            level=AlertLevel.WARNING,
+            collector_type="ohlcv",
+            message="slow",
+            timestamp=now,
+        ))
+
+        with session_factory() as session:
+            assert session.query(ExecutionHistory).count() == 0
+
+        await queue.flush()
+
+        with session_factory() as session:
+            assert session.query(ExecutionHistory).count() == 3
+            assert session.query(PerformanceMetrics).count() == 3
+            assert session.query(SystemAlerts).count() == 1
+            metadata = session.query(CollectionMetadata).filter_by(collector_type="ohlcv").one()
+            assert metadata.run_count == 3
+            assert metadata.total_records_collected == 30
+
+    @pytest.mark.asyncio
+    async def test_repeated_execution_id_updates_existing_row(self, enhanced_db):
+        """The last state of an execution record wins within and across batches."""
+        session_factory = enhanced_db.connection.get_session
+        manager = MonitoringDatabaseManager(session_factory)
+
+        record = ExecutionRecord(
+            collector_type="trade",
+            execution_id="exec_dup",
+            start_time=datetime.now(),
+        )
+        assert manager.store_execution_records([record]) == 1
+
+        record.status = ExecutionStatus.FAILURE
+        record.errors = ["boom"]
+        assert manager.store_execution_records([record, record]) == 1
+
+        with session_factory() as session:
+            rows = session.query(ExecutionHistory).all()
+            assert len(rows) == 1
+            assert rows[0].status == "failure"
+            assert rows[0].error_message == "boom"
+
+
+class TestEnhancedDatabaseManagerWriteBehind:
+    """Test batched collection run storage in EnhancedDatabaseManager."""
+
+    @pytest.mark.asyncio
+    async def test_collection_runs_batched(self, enhanced_db):
+        """Queued collection runs are written in one transaction on flush."""
+        queue = enhanced_db.enable_monitoring_write_behind()
+
+        start = datetime.utcnow() - timedelta(seconds=2)
+        await enhanced_db.store_collection_run(RunResult(
+            collector_type="ohlcv", execution_id="run_1", start_time=start, records_collected=5
+        ))
+        await enhanced_db.store_collection_run(RunResult(
+            collector_type="ohlcv", execution_id="run_2", start_time=start,
+            status="failure", errors=["429 rate limit"]
+        ))
+
+        assert queue.pending == 2
+        assert await queue.flush() == 2
+
+        with enhanced_db.connection.get_session() as session:
+            assert session.query(ExecutionHistory).count() == 2
+            assert session.query(PerformanceMetrics).count() == 6
+            alert = session.query(SystemAlerts).one()
+            assert alert.level == "warning"
+            metadata = session.query(CollectionMetadata).filter_by(collector_type="ohlcv").one()
+            assert metadata.run_count == 2
+            assert metadata.error_count == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicate_runs_skipped_without_losing_batch(self, enhanced_db):
+        """Repeated and already stored runs are skipped; the rest of the batch is kept."""
+        start = datetime.utcnow() - timedelta(seconds=2)
+        end = datetime.utcnow()
+
+        def run(execution_id, **kwargs):
+            return RunResult(
+                collector_type="ohlcv", execution_id=execution_id, start_time=start, end_time=end, **kwargs
+            )
+
+        assert enhanced_db.store_collection_runs([run("run_1")]) == 1
+        failed = run("run_3", status="failure", errors=["timeout"])
+        assert enhanced_db.store_collection_runs([run("run_1"), run("run_2"), run("run_2"), failed, failed]) == 2
+
+        with enhanced_db.connection.get_session() as session:
+            assert session.query(ExecutionHistory).count() == 3
+            assert session.query(SystemAlerts).count() == 1
+            # Runs ending at the same time share metric keys
+            assert session.query(PerformanceMetrics).count() == 3
+            assert session.query(CollectionMetadata).filter_by(collector_type="ohlcv").one().run_count == 3
+
+    @pytest.mark.asyncio
+    async def test_conflicting_batch_falls_back_to_single_runs(self, enhanced_db, monkeypatch):
+        """A batch that hits a unique constraint is retried one run at a time."""
+        insert_runs = enhanced_db._insert_collection_runs
+
+        def conflicting_insert(session, results):
+            if len(results) > 1:
+                raise IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed"))
+            return insert_runs(session, results)
+
+        monkeypatch.setattr(enhanced_db, "_insert_collection_runs", conflicting_insert)
+
+        start = datetime.utcnow() - timedelta(seconds=2)
+        results = [
+            RunResult(collector_type="trade", execution_id=f"run_{i}", start_time=start) for i in range(3)
+        ]
+        assert enhanced_db.store_collection_runs(results) == 3
+
+        with enhanced_db.connection.get_session() as session:
+            assert session.query(ExecutionHistory).count() == 3
+
+    @pytest.mark.asyncio
+    async def test_scheduler_runs_both_queues(self, enhanced_db):
+        """The scheduler starts and flushes the queues create_monitoring_db_manager enables."""
+        monitoring_db = create_monitoring_db_manager(enhanced_db, MonitoringConfig(write_behind_flush_interval=60))
+        scheduler = CollectionScheduler(
+            CollectionConfig(), monitoring_db_manager=monitoring_db, db_manager=enhanced_db
+        )
+        queues = scheduler._write_behind_queues()
+        assert queues == [monitoring_db.write_behind, enhanced_db.monitoring_write_behind]
+
+        await scheduler.start()
+        try:
+            assert all(queue.is_running for queue in queues)
+            await enhanced_db.store_collection_run(RunResult(
+                collector_type="ohlcv", execution_id="run_1", start_time=datetime.utcnow()
+            ))
+            assert await scheduler.flush_monitoring_writes() == 1
+        finally:
+            await scheduler.stop()
+
+        assert not any(queue.is_running for queue in queues)
+        with enhanced_db.connection.get_session() as session:
+            assert session.query(ExecutionHistory).count() == 1
+
+        disabled = create_monitoring_db_manager(enhanced_db, MonitoringConfig(write_behind_enabled=False))
+        assert disabled.write_behind is None
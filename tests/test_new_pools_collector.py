@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from gecko_terminal_collector.collectors.new_pools_collector import NewPoolsCollector
 from gecko_terminal_collector.config.models import CollectionConfig, APIConfig, ErrorConfig
+from gecko_terminal_collector.database.frames import pool_history_to_frame
 from gecko_terminal_collector.models.core import CollectionResult, ValidationResult
 
 
@@ -490,6 +491,39 @@ class TestNewPoolsCollector:
         assert "network" in result.metadata
         assert result.metadata["network"] == "solana"
     
+    @pytest.mark.asyncio
+    async def test_collect_prefetches_pool_history(self, new_pools_collector, mock_db_manager, mock_api_response):
+        """Test that signal analysis reads pool history with one frame query."""
+        pool_id = mock_api_response["data"][0]["id"]
+        history = [{
+            'collected_at': datetime(2025, 9, 9, 21, 0), 'volume_usd_h24': 1500.0, 'reserve_in_usd': 5900.0,
+            'price_change_percentage_h1': 10.0, 'price_change_percentage_h24': 10.0,
+            'transactions_h1_buys': 3, 'transactions_h1_sells': 1,
+            'transactions_h24_buys': 3, 'transactions_h24_sells': 1
+        }]
+        mock_db_manager.get_pool_history_frame.return_value = pool_history_to_frame(pool_id, history)
+        
+        mock_client = AsyncMock()
+        mock_client.get_new_pools_by_network.return_value = mock_api_response
+        new_pools_collector._client = mock_client
+        new_pools_collector.rate_limiter = AsyncMock()
+        
+        seen = {}
+        analyze = new_pools_collector.signal_analyzer.analyze_pool_signals
+        def record_history(pool_data, historical_data):
+            seen[pool_data['id']] = historical_data
+            return analyze(pool_data, historical_data)
+        new_pools_collector.signal_analyzer.analyze_pool_signals = record_history
+        
+        result = await new_pools_collector.collect()
+        
+        assert result.success is True
+        mock_db_manager.get_pool_history_frame.assert_awaited_once()
+        mock_db_manager.get_pool_history.assert_not_called()
+        assert seen[pool_id] == history
+        assert seen[mock_api_response["data"][1]["id"]] == []
+        assert new_pools_collector._history_cache is None
+    
     @pytest.mark.asyncio
     async def test_collect_no_data(self, new_pools_collector):
         """Test collection with no data from API."""
@@ -14,7 +14,9 @@ Requirements covered: 1.4, 2.4, 9.2
 """
 
 import asyncio
+import contextlib
 import gc
+import io
 import logging
 import os
 import psutil
@@ -213,6 +215,7 @@ def generate_test_trade_data(
             pool_id=pool_id,
             block_number=1000000 + i,
             tx_hash=f"0x{'a' * 60}{i:04d}",
+            tx_from_address=f"wallet_{i % 50}",
             from_token_amount=Decimal(str(100 + i % 1000)),
             to_token_amount=Decimal(str(200 + i % 2000)),
             price_usd=Decimal(str(50 + (i % 100) * 0.5)),
@@ -1108,6 +1111,238 @@ class TestAPIRateLimitCompliance:
         return results
 
 
+class TestLoggingPipelineOverhead:
+    """Benchmark logging overhead of one OHLCV collection cycle."""
+    
+    POOL_COUNT = 10
+    
+    @staticmethod
+    def _build_collector(pool_count: int):
+        """Create an OHLCV collector with in-memory API, database and rate limiter."""
+        from unittest.mock import AsyncMock, MagicMock
+        from gecko_terminal_collector.collectors.ohlcv_collector import OHLCVCollector
+        from gecko_terminal_collector.config.models import CollectionConfig
+        from gecko_terminal_collector.models.core import ContinuityReport
+        
+        db_manager = AsyncMock()
+        db_manager.get_watchlist_pools.return_value = [f"solana_pool{i}" for i in range(pool_count)]
+        db_manager.store_ohlcv_data.side_effect = lambda records: len(records)
+        db_manager.get_ohlcv_data.return_value = []
+        db_manager.check_data_continuity.side_effect = lambda pool_id, timeframe: ContinuityReport(
+            pool_id=pool_id, timeframe=timeframe, total_gaps=0, gaps=[], data_quality_score=1.0
+        )
+        
+        rate_limiter = MagicMock()
+        rate_limiter.acquire = AsyncMock()
+        
+        collector = OHLCVCollector(
+            config=CollectionConfig(),
+            db_manager=db_manager,
+            use_mock=True,
+            rate_limiter=rate_limiter
+        )
+        
+        latest = int(time.time()) // 900 * 900
+        client = AsyncMock()
+        client.get_ohlcv_data.return_value = {
+            "data": {"attributes": {"ohlcv_list": [
+                [latest - 900 * i, 1.0, 1.1, 0.9, 1.05, 1000.0] for i in range(100)
+            ]}}
+        }
+        collector._client = client
+        return collector
+    
+    async def _measure_cycle(self, mode: str, log_dir: str) -> float:
+        """Run one OHLCV cycle with the given logging mode and return its duration."""
+        from gecko_terminal_collector.utils.structured_logging import (
+            LoggingManager, LogSamplingConfig, set_stdout_diagnostics_routing
+        )
+        
+        root_logger = logging.getLogger()
+        saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+        root_logger.handlers.clear()
+        manager = LoggingManager()
+        log_file = os.path.join(log_dir, f"{mode}.log")
+        
+        if mode == "disabled":
+            root_logger.addHandler(logging.NullHandler())
+            root_logger.setLevel(logging.CRITICAL)
+            set_stdout_diagnostics_routing(True)
+        elif mode == "sync":
+            manager.setup_logging(log_level="DEBUG", log_file=log_file, console_output=False)
+        else:
+            manager.setup_logging(
+                log_level="DEBUG",
+                log_file=log_file,
+                console_output=False,
+                async_logging=True,
+                sampling=LogSamplingConfig(),
+                route_stdout_diagnostics=True
+            )
+        
+        collector = self._build_collector(self.POOL_COUNT)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                result = await collector.collect()
+                duration = time.perf_counter() - start
+        finally:
+            manager.shutdown_logging()
+            for handler in root_logger.handlers[:]:
+                handler.close()
+            set_stdout_diagnostics_routing(False)
+            root_logger.handlers[:] = saved_handlers
+            root_logger.setLevel(saved_level)
+        
+        assert result.success
+        assert result.records_collected > 0
+        return duration
+    
+    @pytest.mark.asyncio
+    async def test_ohlcv_cycle_logging_overhead(self):
+        """Queued, sampled logging costs the event loop less than synchronous JSON logging."""
+        with tempfile.TemporaryDirectory() as log_dir:
+            # Warm up imports and caches
+            await self._measure_cycle("disabled", log_dir)
+            
+            baseline = await self._measure_cycle("disabled", log_dir)
+            sync_duration = await self._measure_cycle("sync", log_dir)
+            async_duration = await self._measure_cycle("async", log_dir)
+        
+        sync_overhead = max(sync_duration - baseline, 0.0)
+        async_overhead = max(async_duration - baseline, 0.0)
+        
+        logger.info(
+            f"OHLCV cycle logging overhead ({self.POOL_COUNT} pools) - "
+            f"baseline: {baseline:.3f}s, synchronous: +{sync_overhead:.3f}s, "
+            f"queued+sampled: +{async_overhead:.3f}s"
+        )
+        
+        assert async_duration < sync_duration, (
+            f"Queued logging ({async_duration:.3f}s) not faster than "
+            f"synchronous logging ({sync_duration:.3f}s)"
+        )
+        
+        return {
+            'pool_count': self.POOL_COUNT,
+            'baseline_seconds': baseline,
+            'sync_overhead_seconds': sync_overhead,
+            'async_overhead_seconds': async_overhead
+        }
+
+
+class TestReplayServerThroughput:
+    """End-to-end collector throughput against the local GeckoTerminal replay server."""
+
+    POOL_COUNT = 5
+    CYCLES = 3
+
+    @staticmethod
+    async def _setup_watchlist(db_manager: SQLAlchemyDatabaseManager, pool_count: int) -> List[str]:
+        """Create pools and active watchlist entries for the benchmark."""
+        from gecko_terminal_collector.database.models import WatchlistEntry
+
+        pool_ids = [f"solana_replay_pool_{i}" for i in range(pool_count)]
+        for pool_id in pool_ids:
+            await setup_test_pool(db_manager, pool_id)
+            await db_manager.add_watchlist_entry(WatchlistEntry(pool_id=pool_id, is_active=True))
+        return pool_ids
+
+    @staticmethod
+    def _percentile(values: List[float], percentile: float) -> float:
+        ordered = sorted(values)
+        index = min(int(round(percentile / 100 * (len(ordered) - 1))), len(ordered) - 1)
+        return ordered[index]
+
+    async def _run_cycles(self, collector, server, pool_count: int) -> Dict:
+        """Run collection cycles and summarize throughput."""
+        cycle_times = []
+        records = 0
+        pools_processed = 0
+
+        server.reset_stats()
+        for _ in range(self.CYCLES):
+            start = time.perf_counter()
+            result = await collector.collect()
+            cycle_times.append(time.perf_counter() - start)
+
+            records += result.records_collected
+            rotation = (result.metadata or {}).get('fair_rotation', {})
+            pools_processed += rotation.get('selected_pools', pool_count)
+
+            # Let an hour pass on the replay clock so every cycle sees new candles
+            server.advance_time(3600)
+
+        total_minutes = sum(cycle_times) / 60
+        api_calls = server.total_requests
+
+        return {
+            'cycles': self.CYCLES,
+            'records_collected': records,
+            'api_calls': api_calls,
+            'rate_limited_responses': server.rate_limited_responses,
+            'pools_per_minute': pools_processed / total_minutes if total_minutes else 0.0,
+            'api_calls_per_record': api_calls / records if records else float('inf'),
+            'p50_cycle_seconds': self._percentile(cycle_times, 50),
+            'p99_cycle_seconds': self._percentile(cycle_times, 99)
+        }
+
+    @pytest.mark.asyncio
+    async def test_collector_throughput_against_replay_server(self, performance_db_manager):
+        """OHLCV and trade collectors run through the real HTTP client, SDK and rate limiter."""
+        from tests.replay_server import (
+            GeckoTerminalReplayServer, ReplayServerConfig
+        )
+        from gecko_terminal_collector.collectors.ohlcv_collector import OHLCVCollector
+        from gecko_terminal_collector.collectors.trade_collector import TradeCollector
+        from gecko_terminal_collector.config.models import APIConfig, CollectionConfig, ErrorConfig
+        from gecko_terminal_collector.utils.enhanced_rate_limiter import EnhancedRateLimiter
+
+        specs_path = Path(__file__).parent.parent / "specs"
+        server_config = ReplayServerConfig(
+            fixtures_path=str(specs_path),
+            latency_distribution="lognormal",
+            latency_ms=20,
+            latency_jitter_ms=10,
+            rate_limit_every=25,
+            rate_limit_burst=2,
+            retry_after=0.05,
+            ohlcv_history_candles=100
+        )
+
+        await self._setup_watchlist(performance_db_manager, self.POOL_COUNT)
+
+        results = {}
+        async with GeckoTerminalReplayServer(server_config) as server:
+            config = CollectionConfig(
+                api=APIConfig(base_url=server.base_url, rate_limit_delay=0.0),
+                error_handling=ErrorConfig(max_retries=3, backoff_factor=0.1)
+            )
+
+            for name, collector_class in (('ohlcv', OHLCVCollector), ('trades', TradeCollector)):
+                collector = collector_class(
+                    config=config,
+                    db_manager=performance_db_manager,
+                    rate_limiter=EnhancedRateLimiter(requests_per_minute=100000)
+                )
+                results[name] = await self._run_cycles(collector, server, self.POOL_COUNT)
+
+                logger.info(
+                    f"Replay {name} ({self.POOL_COUNT} pools x {self.CYCLES} cycles): "
+                    f"{results[name]['pools_per_minute']:.0f} pools/min, "
+                    f"{results[name]['api_calls_per_record']:.3f} API calls/record, "
+                    f"p99 cycle {results[name]['p99_cycle_seconds']:.2f}s, "
+                    f"{results[name]['rate_limited_responses']} 429s"
+                )
+
+        for name, summary in results.items():
+            assert summary['api_calls'] > 0, f"{name} collector made no API calls"
+            assert summary['records_collected'] > 0, f"{name} collector stored no records"
+        assert results['ohlcv']['rate_limited_responses'] > 0
+
+        return results
+
+
 class TestPostgreSQLMigrationBenchmarks:
     """Create performance benchmarks for PostgreSQL migration decision points."""
     
@@ -0,0 +1,160 @@
+"""
+Tests for the shared PumpSwap pool-data cache.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from nautilus_poc.pool_data_cache import PumpSwapPoolCache
+
+
+class CountingSDK:
+    """PumpSwap SDK stub counting calls per mint."""
+
+    def __init__(self, delay: float = 0.0, missing=()):
+        self.delay = delay
+        self.missing = set(missing)
+        self.pair_calls = {}
+        self.pool_calls = {}
+        self.price = 0.001
+        self.fail = False
+
+    async def get_pair_address(self, mint_address):
+        self.pair_calls[mint_address] = self.pair_calls.get(mint_address, 0) + 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("rpc down")
+        return None if mint_address in self.missing else f"pair_{mint_address}"
+
+    async def get_pool_data(self, mint_address):
+        self.pool_calls[mint_address] = self.pool_calls.get(mint_address, 0) + 1
+        await asyncio.sleep(self.delay)
+        return {'mint_address': mint_address, 'reserve_sol': 500, 'price': self.price}
+
+
+def advance_clock(seconds):
+    """Patch the cache's monotonic clock forward."""
+    now = time.monotonic() + seconds
+    return patch('nautilus_poc.pool_data_cache.time.monotonic', return_value=now)
+
+
+class TestPumpSwapPoolCache:
+    """Test caching, coalescing and eviction."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        sdk = CountingSDK(delay=0.01)
+        cache = PumpSwapPoolCache(sdk)
+
+        results = await asyncio.gather(*[cache.get("mint") for _ in range(10)])
+
+        assert sdk.pair_calls == {"mint": 1}
+        assert sdk.pool_calls == {"mint": 1}
+        assert all(result == results[0] for result in results)
+        assert cache.get_stats()['coalesced'] == 9
+
+        assert await cache.get("mint") == results[0]
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_pair_is_cached(self):
+        sdk = CountingSDK(missing={"gone"})
+        cache = PumpSwapPoolCache(sdk)
+
+        assert await cache.get("gone") == (None, None)
+        assert await cache.get("gone") == (None, None)
+        assert sdk.pair_calls == {"gone": 1}
+        assert sdk.pool_calls == {}
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self):
+        sdk = CountingSDK()
+        cache = PumpSwapPoolCache(sdk, ttl_seconds=60, stale_ttl_seconds=300)
+        await cache.get("mint")
+        sdk.price = 0.002
+
+        with advance_clock(120):
+            pool_data, _ = await cache.get("mint")
+            assert pool_data['price'] == 0.001
+            # Let the background refresh complete
+            for _ in range(5):
+                await asyncio.sleep(0)
+            pool_data, _ = await cache.get("mint")
+
+        assert pool_data['price'] == 0.002
+        assert cache.stale_hits == 1
+        assert cache.refreshes == 1
+
+    @pytest.mark.asyncio
+    async def test_execution_path_waits_for_fresh_data(self):
+        sdk = CountingSDK()
+        cache = PumpSwapPoolCache(sdk, ttl_seconds=60, stale_ttl_seconds=300)
+        await cache.get("mint")
+        sdk.price = 0.002
+
+        with advance_clock(120):
+            pool_data, _ = await cache.get("mint", allow_stale=False)
+
+        assert pool_data['price'] == 0.002
+        assert sdk.pool_calls == {"mint": 2}
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        sdk = CountingSDK()
+        sdk.fail = True
+        cache = PumpSwapPoolCache(sdk)
+
+        with pytest.raises(ConnectionError):
+            await cache.get("mint")
+        assert "mint" not in cache
+
+        sdk.fail = False
+        assert (await cache.get("mint"))[1] == "pair_mint"
+        assert cache.fetch_errors == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = PumpSwapPoolCache(CountingSDK(), max_entries=2)
+        await cache.get("a")
+        await cache.get("b")
+        await cache.get("a")
+        await cache.get("c")
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_discards_inflight_result(self):
+        sdk = CountingSDK(delay=0.01)
+        cache = PumpSwapPoolCache(sdk)
+
+        pending = asyncio.ensure_future(cache.get("mint"))
+        await asyncio.sleep(0)
+        cache.invalidate("mint")
+
+        assert (await pending)[1] == "pair_mint"
+        assert "mint" not in cache
+
+    @pytest.mark.asyncio
+    async def test_prefetch_deduplicates_batch(self):
+        sdk = CountingSDK(delay=0.001, missing={"gone"})
+        cache = PumpSwapPoolCache(sdk, max_concurrency=2)
+
+        resolved = await cache.prefetch(["a", "b", "a", "gone", "c", "b"])
+
+        assert set(resolved) == {"a", "b", "c", "gone"}
+        assert resolved["gone"] == (None, None)
+        assert sdk.pair_calls == {"a": 1, "b": 1, "gone": 1, "c": 1}
+
+    def test_from_config(self):
+        config = SimpleNamespace(monitoring={'pool_cache_ttl_seconds': 5, 'pool_cache_max_entries': 8})
+        cache = PumpSwapPoolCache.from_config(CountingSDK(), config)
+
+        assert cache.ttl_seconds == 5
+        assert cache.stale_ttl_seconds == 300
+        assert cache.max_entries == 8
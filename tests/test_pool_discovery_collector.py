@@ -0,0 +1,196 @@
+"""
+Tests for batch pool activity re-evaluation in PoolDiscoveryCollector.
+"""
+
+import pandas as pd
+import pytest
+import pytest_asyncio
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from gecko_terminal_collector.collectors.pool_discovery_collector import PoolDiscoveryCollector
+from gecko_terminal_collector.config.models import CollectionConfig, DatabaseConfig
+from gecko_terminal_collector.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from gecko_terminal_collector.models.core import Pool
+
+
+def make_pool(index: int, dex_id: str = "pumpswap", network: str = "solana"):
+    return SimpleNamespace(id=f"{network}_addr{index}", address=f"addr{index}", dex_id=dex_id)
+
+
+def make_pool_data(pool, volume: str) -> dict:
+    return {
+        "id": pool.id,
+        "type": "pool",
+        "attributes": {
+            "address": pool.address,
+            "volume_usd": {"h24": volume},
+            "transactions": {"h24": 500},
+            "reserve_in_usd": "250000",
+            "price_change_percentage": {"h24": "5"},
+        },
+    }
+
+
+def multi_pool_response(pools_by_address: dict, volume: str = "2000000"):
+    async def get_multiple_pools_by_network(network, addresses):
+        return {"data": [make_pool_data(pools_by_address[address], volume) for address in addresses]}
+    return AsyncMock(side_effect=get_multiple_pools_by_network)
+
+
+@pytest.fixture
+def mock_db_manager():
+    networks = {"pumpswap": "solana", "uniswap": "eth"}
+    db_manager = AsyncMock()
+    db_manager.get_dex_by_id = AsyncMock(
+        side_effect=lambda dex_id: SimpleNamespace(id=dex_id, network=networks[dex_id]) if dex_id in networks else None
+    )
+    return db_manager
+
+
+@pytest.fixture
+def collector(mock_db_manager):
+    collector = PoolDiscoveryCollector(CollectionConfig(), mock_db_manager, use_mock=True)
+    collector._client = AsyncMock()
+    collector.rate_limiter = AsyncMock()
+    collector.rate_limiter.acquire = AsyncMock()
+    return collector
+
+
+class TestBatchActivityEvaluation:
+    """Test activity re-evaluation through the multi-pool endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_pools_fetched_in_chunks_per_network(self, collector, mock_db_manager):
+        pools = [make_pool(i) for i in range(65)] + [make_pool(i, "uniswap", "eth") for i in range(5)]
+        pools.append(make_pool(99, "unknown_dex"))
+        collector.client.get_multiple_pools_by_network = multi_pool_response({p.address: p for p in pools})
+
+        started = datetime.now()
+        scores = await collector.evaluate_pools_activity(pools)
+
+        calls = collector.client.get_multiple_pools_by_network.await_args_list
+        assert [(c.args[0], len(c.args[1])) for c in calls] == [("solana", 30), ("solana", 30), ("solana", 5), ("eth", 5)]
+        assert mock_db_manager.get_dex_by_id.await_count == 3
+        collector.client.get_pool_by_network_address.assert_not_called()
+
+        assert len(scores) == 70 and "solana_addr99" not in scores
+        mock_db_manager.update_pool_activity_scores.assert_awaited_once()
+        mock_db_manager.update_pool_priorities.assert_awaited_once()
+        written_scores = mock_db_manager.update_pool_activity_scores.await_args.args[0]
+        assert started <= mock_db_manager.update_pool_activity_scores.await_args.kwargs['checked_at'] <= datetime.now()
+        priorities = mock_db_manager.update_pool_priorities.await_args.args[0]
+        assert written_scores == scores
+        expected = collector.activity_scorer.get_collection_priority(scores["eth_addr0"]).value
+        assert set(priorities.values()) == {expected}
+        mock_db_manager.store_pool.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_falls_back_to_single_pool(self, collector, mock_db_manager):
+        pools = [make_pool(i) for i in range(35)]
+        batch = multi_pool_response({p.address: p for p in pools})
+
+        async def fail_first_chunk(network, addresses):
+            if len(addresses) == 30:
+                raise RuntimeError("upstream error")
+            return await batch(network, addresses)
+
+        collector.client.get_multiple_pools_by_network = AsyncMock(side_effect=fail_first_chunk)
+        collector.evaluate_pool_activity = AsyncMock(return_value=Decimal("42"))
+
+        scores = await collector.evaluate_pools_activity(pools)
+
+        assert collector.evaluate_pool_activity.await_count == 30
+        assert len(scores) == 35
+        assert scores["solana_addr0"] == Decimal("42")
+        assert len(mock_db_manager.update_pool_activity_scores.await_args.args[0]) == 5
+
+    @pytest.mark.asyncio
+    async def test_pools_missing_from_response_are_skipped(self, collector, mock_db_manager):
+        pools = [make_pool(i) for i in range(3)]
+        collector.client.get_multiple_pools_by_network = AsyncMock(
+            return_value={"data": [make_pool_data(pools[1], "100")]}
+        )
+
+        scores = await collector.evaluate_pools_activity(pools)
+
+        assert list(scores) == ["solana_addr1"]
+
+    @pytest.mark.asyncio
+    async def test_dataframe_response_is_matched_on_flat_columns(self, collector, mock_db_manager):
+        pools = [make_pool(i) for i in range(3)]
+        collector.client.get_multiple_pools_by_network = AsyncMock(return_value=pd.DataFrame([
+            {
+                "id": pool.id, "address": pool.address, "volume_usd_h24": volume, "reserve_in_usd": 250000.0,
+                "transactions_h24_buys": 300, "transactions_h24_sells": 200,
+                "price_change_percentage_h24": 5.0, "name": float("nan"),
+            }
+            for pool, volume in zip(pools[:2], (2000000.0, 100.0))
+        ]))
+        collector.evaluate_pool_activity = AsyncMock()
+
+        scores = await collector.evaluate_pools_activity(pools)
+
+        collector.evaluate_pool_activity.assert_not_called()
+        assert set(scores) == {"solana_addr0", "solana_addr1"}
+        assert scores["solana_addr0"] > scores["solana_addr1"]
+        expected = collector.activity_scorer.calculate_activity_score(make_pool_data(pools[0], "2000000"))
+        assert scores["solana_addr0"] == expected
+
+    @pytest.mark.asyncio
+    async def test_evaluate_and_update_uses_batch_path(self, collector, mock_db_manager):
+        pools = [make_pool(i) for i in range(4)]
+        mock_db_manager.get_pools_needing_activity_update = AsyncMock(return_value=pools)
+        collector.client.get_multiple_pools_by_network = multi_pool_response({p.address: p for p in pools})
+
+        assert await collector._evaluate_and_update_pool_activity() == 4
+        collector.client.get_multiple_pools_by_network.assert_awaited_once()
+
+
+@pytest_asyncio.fixture
+async def initialized_db():
+    db_manager = SQLAlchemyDatabaseManager(DatabaseConfig(url="sqlite:///:memory:", pool_size=1, echo=False))
+    await db_manager.initialize()
+    await db_manager.store_pools([
+        Pool(id=f"solana_addr{i}", address=f"addr{i}", name=f"Pool {i}", dex_id="pumpswap",
+             base_token_id="base", quote_token_id="quote", reserve_usd=Decimal("1000"),
+             created_at=datetime(2024, 1, 1))
+        for i in range(3)
+    ])
+    yield db_manager
+    await db_manager.close()
+
+
+class TestBulkActivityUpdates:
+    """Test single-statement activity score and priority updates."""
+
+    @pytest.mark.asyncio
+    async def test_update_pool_activity_scores(self, initialized_db):
+        checked_at = datetime(2024, 6, 1, 12, 0)
+        updated = await initialized_db.update_pool_activity_scores(
+            {"solana_addr0": Decimal("81.5"), "solana_addr2": Decimal("12.25"), "missing": Decimal("50")},
+            checked_at=checked_at
+        )
+
+        assert updated == 2
+        with initialized_db.connection.get_session() as session:
+            pools = {p.id: p for p in session.query(initialized_db.PoolModel).all()}
+        assert pools["solana_addr0"].activity_score == Decimal("81.5")
+        assert pools["solana_addr2"].activity_score == Decimal("12.25")
+        assert pools["solana_addr0"].last_activity_check == checked_at
+        assert pools["solana_addr1"].activity_score is None
+        assert pools["solana_addr1"].last_activity_check is None
+
+    @pytest.mark.asyncio
+    async def test_update_pool_priorities(self, initialized_db):
+        updated = await initialized_db.update_pool_priorities({"solana_addr0": "high", "solana_addr1": "paused"})
+
+        assert updated == 2
+        with initialized_db.connection.get_session() as session:
+            pools = {p.id: p for p in session.query(initialized_db.PoolModel).all()}
+        assert pools["solana_addr0"].collection_priority == "high"
+        assert pools["solana_addr1"].collection_priority == "paused"
+        assert pools["solana_addr2"].collection_priority == "normal"
+        assert await initialized_db.update_pool_priorities({}) == 0
@@ -83,6 +83,12 @@ class TestPoolIDUtils:
         assert not PoolIDUtils.is_valid_pool_id_format("invalid_network_ABC123")
         assert not PoolIDUtils.is_valid_pool_id_format("ABC@123")  # Invalid chars
         assert not PoolIDUtils.is_valid_pool_id_format(None)
+    
+    def test_to_symbol(self):
+        """Test QLib symbol generation from pool IDs."""
+        assert PoolIDUtils.to_symbol("solana_7bqJG2ZdMKbEkgSm") == "solana_7bqJG2ZdMKbEkgSm"
+        assert PoolIDUtils.to_symbol("eth_0xAbC--123.") == "eth_0xAbC_123"
+        assert PoolIDUtils.to_normalized_symbol("eth_0xAbC--123.") == "eth_0xabc_123"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+"""
+Tests for indexed pool symbol lookup and fuzzy search on SQLite.
+"""
+
+import sqlite3
+
+import pytest
+import pytest_asyncio
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import inspect, text
+
+from gecko_terminal_collector.config.models import DatabaseConfig
+from gecko_terminal_collector.database.enhanced_manager import EnhancedDatabaseManager
+from gecko_terminal_collector.models.core import Pool
+
+
+LEGACY_POOLS_TABLE = """
+CREATE TABLE pools (
+    id VARCHAR(100) PRIMARY KEY, address VARCHAR(100) NOT NULL, name VARCHAR(200),
+    dex_id VARCHAR(50) NOT NULL, base_token_id VARCHAR(100), quote_token_id VARCHAR(100),
+    reserve_usd NUMERIC(20, 8), created_at DATETIME, last_updated DATETIME,
+    activity_score NUMERIC(5, 2), discovery_source VARCHAR(20), collection_priority VARCHAR(10),
+    auto_discovered_at DATETIME, last_activity_check DATETIME, metadata_json TEXT
+)
+"""
+
+
+def make_pool(index: int) -> Pool:
+    return Pool(id=f"solana_AbC{index}-x", address=f"AbC{index}-x", name=f"Token{index} / SOL",
+                dex_id="raydium", base_token_id="base", quote_token_id="quote",
+                reserve_usd=Decimal("1000"), created_at=datetime(2024, 1, 1))
+
+
+@pytest_asyncio.fixture
+async def db_manager(tmp_path):
+    # Start from a database created before pools.symbol_normalized existed
+    path = tmp_path / "pools.db"
+    connection = sqlite3.connect(path)
+    connection.execute(LEGACY_POOLS_TABLE)
+    connection.execute("INSERT INTO pools (id, address, name, dex_id) VALUES ('solana_Old-Pool', 'Old-Pool', 'Legacy / SOL', 'raydium')")
+    connection.commit()
+    connection.close()
+
+    db_manager = EnhancedDatabaseManager(DatabaseConfig(url=f"sqlite:///{path}", pool_size=1, echo=False))
+    await db_manager.initialize()
+    await db_manager.store_pools([make_pool(i) for i in range(3)])
+    yield db_manager
+    await db_manager.close()
+
+
+class TestPoolSymbolSearch:
+    """Test the normalized symbol column, FTS5 search and bulk lookup."""
+
+    @pytest.mark.asyncio
+    async def test_symbol_column_backfilled_and_populated_on_insert(self, db_manager):
+        with db_manager.connection.get_session() as session:
+            symbols = dict(session.query(db_manager.PoolModel.id, db_manager.PoolModel.symbol_normalized).all())
+
+        assert symbols == {
+            "solana_Old-Pool": "solana_old_pool",
+            "solana_AbC0-x": "solana_abc0_x",
+            "solana_AbC1-x": "solana_abc1_x",
+            "solana_AbC2-x": "solana_abc2_x",
+        }
+
+    @pytest.mark.asyncio
+    async def test_symbol_index_uses_migration_name(self, db_manager):
+        def symbol_indexes():
+            return sorted(
+                index['name'] for index in inspect(db_manager.connection.engine).get_indexes('pools')
+                if index['column_names'] == ['symbol_normalized']
+            )
+
+        assert symbol_indexes() == ["idx_pools_symbol_normalized"]
+
+        # Databases from before the rename lose their duplicate index
+        with db_manager.connection.engine.begin() as conn:
+            conn.execute(text("CREATE INDEX ix_pools_symbol_normalized ON pools (symbol_normalized)"))
+        db_manager._ensure_pool_symbol_search()
+        assert symbol_indexes() == ["idx_pools_symbol_normalized"]
+
+    @pytest.mark.asyncio
+    async def test_search_pools_by_name_or_id(self, db_manager):
+        assert db_manager._pool_symbol_fts
+
+        exact = await db_manager.search_pools_by_name_or_id("SOLANA_ABC2_X")
+        assert [pool.id for pool in exact] == ["solana_AbC2-x"]
+        assert [pool.id for pool in await db_manager.search_pools_by_name_or_id("abc1")] == ["solana_AbC1-x"]
+        assert [pool.id for pool in await db_manager.search_pools_by_name_or_id("legacy")] == ["solana_Old-Pool"]
+        # Too short for a trigram, served by LIKE instead
+        assert len(await db_manager.search_pools_by_name_or_id("ab", limit=2)) == 2
+
+        await db_manager.store_pools([make_pool(7)])
+        assert [pool.id for pool in await db_manager.search_pools_by_name_or_id("token7")] == ["solana_AbC7-x"]
+
+    @pytest.mark.asyncio
+    async def test_get_pools_by_symbols(self, db_manager):
+        pools = await db_manager.get_pools_by_symbols(["SOLANA_ABC0_X", "AbC1-x", "solana_Old-Pool", "missing"], chunk_size=2)
+
+        assert sorted(pool.id for pool in pools) == ["solana_AbC0-x", "solana_AbC1-x", "solana_Old-Pool"]
+        assert (await db_manager.get_pool_by_address("AbC2-x")).id == "solana_AbC2-x"
+
+    @pytest.mark.asyncio
+    async def test_iter_pool_ids_streams_batches(self, db_manager):
+        batches = [batch async for batch in db_manager.iter_pool_ids(batch_size=3)]
+
+        assert [len(batch) for batch in batches] == [3, 1]
+        assert sorted(pool_id for batch in batches for pool_id in batch) == [
+            "solana_AbC0-x", "solana_AbC1-x", "solana_AbC2-x", "solana_Old-Pool"
+        ]
+        assert len([batch async for batch in db_manager.iter_pool_ids(limit=2)][0]) == 2
@@ -0,0 +1,209 @@
+"""
+Tests for the position book, write-behind persistence and shared database.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from nautilus_poc.database_manager import acquire_database, release_database
+from nautilus_poc.position_manager import Position, PositionBook, PositionManager, PositionModel
+from nautilus_poc.trade_execution_recorder import TradeExecutionRecorder
+
+
+def make_config(tmp_path):
+    return {'database': {'type': 'sqlite', 'path': str(tmp_path / "positions.db")}}
+
+
+def make_position(mint, tokens=1000.0, invested=1.0, active=True):
+    return Position(
+        mint_address=mint,
+        token_amount=tokens,
+        average_buy_price=invested / tokens if tokens else 0.0,
+        total_sol_invested=invested,
+        current_value_sol=0.0,
+        unrealized_pnl_sol=0.0,
+        unrealized_pnl_percent=0.0,
+        first_buy_timestamp=None,
+        last_trade_timestamp=None,
+        trade_count=1,
+        is_active=active
+    )
+
+
+class TestPositionBook:
+    """Test the columnar in-memory position book."""
+
+    def test_put_get_and_growth(self):
+        book = PositionBook(capacity=2)
+        for i in range(5):
+            book.put(make_position(f"mint_{i}", tokens=100.0 * (i + 1)))
+
+        assert len(book) == 5
+        assert book.get("mint_3").token_amount == 400.0
+        assert book.get("missing") is None
+
+        updated = book.get("mint_3")
+        updated.token_amount = 1.0
+        assert book.get("mint_3").token_amount == 400.0
+        book.put(updated)
+        assert book.get("mint_3").token_amount == 1.0
+        assert len(book) == 5
+
+    def test_apply_prices_matches_scalar_formula(self):
+        book = PositionBook()
+        rng = np.random.default_rng(1)
+        for i in range(50):
+            book.put(make_position(f"mint_{i}", tokens=float(rng.uniform(1, 1000)), invested=float(rng.uniform(0, 2))))
+        book.put(make_position("inactive", active=False))
+        book.put(make_position("empty", tokens=0.0, invested=0.0))
+        prices = {f"mint_{i}": float(rng.uniform(0.0001, 0.01)) for i in range(0, 50, 2)}
+        prices.update({"inactive": 1.0, "empty": 1.0, "unknown": 1.0, "mint_1": 0.0})
+
+        updated = book.apply_prices(prices)
+
+        assert sorted(updated) == sorted(f"mint_{i}" for i in range(0, 50, 2))
+        for mint in updated:
+            position = book.get(mint)
+            value = position.token_amount * prices[mint]
+            assert position.current_value_sol == pytest.approx(value)
+            assert position.unrealized_pnl_sol == pytest.approx(value - position.total_sol_invested)
+            if position.total_sol_invested > 0:
+                assert position.unrealized_pnl_percent == pytest.approx(
+                    (value - position.total_sol_invested) / position.total_sol_invested * 100
+                )
+        assert book.get("inactive").current_value_sol == 0.0
+        assert book.get("mint_1").current_value_sol == 0.0
+
+    def test_active_mints_and_totals(self):
+        book = PositionBook()
+        book.put(make_position("a", invested=1.0))
+        book.put(make_position("b", invested=2.0, active=False))
+
+        assert book.mints() == ["a"]
+        assert book.mints(active_only=False) == ["a", "b"]
+        assert book.totals()['total_sol_invested'] == 1.0
+        assert book.totals(active_only=False)['total_sol_invested'] == 3.0
+
+
+class TestWriteBehindJournal:
+    """Test ordering, flushing and failure isolation."""
+
+    @pytest.mark.asyncio
+    async def test_batches_apply_in_order_and_isolate_failures(self, tmp_path):
+        database = acquire_database(make_config(tmp_path))
+        try:
+            database.ensure_tables(PositionModel.metadata)
+            journal = database.journal
+
+            journal.submit(lambda session: session.add(PositionModel(mint_address="a", trade_count=1)))
+
+            def failing(session):
+                raise ValueError("bad write")
+
+            journal.submit(failing)
+            journal.submit(lambda session: session.get(PositionModel, "a").__setattr__('trade_count', 2))
+            assert journal.pending_count == 3
+
+            await journal.flush()
+
+            assert journal.pending_count == 0
+            assert journal.operations_failed == 1
+            with database.session_factory() as session:
+                assert session.get(PositionModel, "a").trade_count == 2
+        finally:
+            await release_database(database)
+
+    def test_applies_immediately_without_event_loop(self, tmp_path):
+        database = acquire_database(make_config(tmp_path))
+        try:
+            database.ensure_tables(PositionModel.metadata)
+            database.journal.submit(lambda session: session.add(PositionModel(mint_address="sync")))
+            with database.session_factory() as session:
+                assert session.get(PositionModel, "sync") is not None
+        finally:
+            asyncio.run(release_database(database))
+
+
+class TestPositionManager:
+    """Test PositionManager on the in-memory book."""
+
+    @pytest.mark.asyncio
+    async def test_updates_are_served_from_memory_and_persisted(self, tmp_path):
+        config = make_config(tmp_path)
+        manager = PositionManager(config)
+        recorder = TradeExecutionRecorder(config)
+        assert manager.engine is recorder.engine
+
+        await manager.update_position("mint", 1.0, 'buy', {'actual_price': 0.001, 'tokens_received': 1000.0})
+        # Served from the book before the journal has written anything
+        position = await manager.get_position("mint")
+        assert position.token_amount == 1000.0
+        assert manager.journal.pending_count >= 1
+
+        await manager.update_position_prices({"mint": 0.002})
+        summary = await manager.get_portfolio_summary()
+        assert summary['total_unrealized_pnl_sol'] == pytest.approx(1.0)
+        assert summary['portfolio_pnl_percent'] == pytest.approx(100.0)
+
+        trade_id = await recorder.record_trade_attempt("mint", 'buy', {'regime': 'low_variance'}, 0.001, sol_amount=1.0)
+        await recorder.update_trade_execution(trade_id, {'status': 'confirmed', 'actual_price': 0.0011})
+        record = await recorder.get_trade_record(trade_id)
+        assert record.execution_status == 'confirmed'
+        assert record.slippage_percent == pytest.approx(10.0)
+
+        await recorder.close()
+        await manager.close()
+
+        reloaded = PositionManager(config)
+        position = await reloaded.get_position("mint")
+        assert position.token_amount == 1000.0
+        assert position.unrealized_pnl_sol == pytest.approx(1.0)
+        await reloaded.close()
+
+    @pytest.mark.asyncio
+    async def test_engine_disposed_after_last_user(self, tmp_path):
+        config = make_config(tmp_path)
+        first = PositionManager(config)
+        second = TradeExecutionRecorder(config)
+
+        await first.close()
+        assert acquire_database(config) is second.database
+        await release_database(second.database)
+        await second.close()
+
+        third = PositionManager(config)
+        assert third.database is not second.database
+        await third.close()
+
+    @pytest.mark.asyncio
+    async def test_repeated_close_releases_database_once(self, tmp_path):
+        config = make_config(tmp_path)
+        manager = PositionManager(config)
+        recorder = TradeExecutionRecorder(config)
+
+        await manager.close()
+        await manager.close()
+        assert recorder.database.users == 1
+        assert acquire_database(config) is recorder.database
+        await release_database(recorder.database)
+        await recorder.close()
+
+    @pytest.mark.asyncio
+    async def test_repeated_recorder_close_keeps_manager_database(self, tmp_path):
+        config = make_config(tmp_path)
+        manager = PositionManager(config)
+        recorder = TradeExecutionRecorder(config)
+
+        await recorder.close()
+        await recorder.close()
+        assert manager.database.users == 1
+        assert acquire_database(config) is manager.database
+        await release_database(manager.database)
+
+        await manager.update_position("mint", 1.0, 'buy', {'actual_price': 0.001, 'tokens_received': 1000.0})
+        await manager.flush()
+        with manager.SessionLocal() as session:
+            assert session.get(PositionModel, "mint").token_amount == 1000.0
+        await manager.close()
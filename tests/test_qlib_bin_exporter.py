@@ -0,0 +1,130 @@
+"""
+Tests for the history fetch path of the QLib bin exporter.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects import postgresql
+
+from qlib_integration import QLibBinDataExporter
+
+
+FEATURE_MAPPING = {'close_price_usd': 'close', 'volume_usd_h24': 'volume'}
+START, END = datetime(2025, 1, 1), datetime(2025, 1, 2)
+
+
+def history_row(pool_id, network, hour, close, volume="500", quality=80, reserve="5000"):
+    return {
+        'pool_id': pool_id, 'network_id': network, 'qlib_symbol': pool_id.upper(),
+        'datetime': f"2025-01-01 {hour:02d}:00:00+00:00", 'close_price_usd': close,
+        'volume_usd_h24': volume, 'reserve_in_usd': reserve, 'data_quality_score': quality,
+        'open_price_usd': "1", 'qlib_features_json': '{"unused": true}',
+    }
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'history.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("""
+            CREATE TABLE new_pools_history_enhanced (
+                id INTEGER PRIMARY KEY, pool_id TEXT, network_id TEXT, qlib_symbol TEXT, datetime TEXT,
+                open_price_usd NUMERIC, close_price_usd NUMERIC, volume_usd_h24 NUMERIC,
+                reserve_in_usd NUMERIC, data_quality_score NUMERIC, qlib_features_json TEXT
+            )
+        """))
+        connection.execute(
+            text("""
+                INSERT INTO new_pools_history_enhanced (
+                    pool_id, network_id, qlib_symbol, datetime, open_price_usd, close_price_usd,
+                    volume_usd_h24, reserve_in_usd, data_quality_score, qlib_features_json
+                ) VALUES (
+                    :pool_id, :network_id, :qlib_symbol, :datetime, :open_price_usd, :close_price_usd,
+                    :volume_usd_h24, :reserve_in_usd, :data_quality_score, :qlib_features_json
+                )
+            """),
+            [
+                history_row("solana_a", "solana", 1, "1.5"),
+                history_row("solana_a", "solana", 2, None),
+                history_row("solana_b", "solana", 1, None),
+                history_row("solana_b", "solana", 2, "3.0"),
+                history_row("eth_c", "eth", 1, "9.0"),
+                history_row("solana_low", "solana", 1, "1.0", quality=10),
+            ]
+        )
+
+    db_manager = SimpleNamespace(connection=SimpleNamespace(engine=engine))
+    exporter = QLibBinDataExporter(
+        db_manager, qlib_dir=str(tmp_path / "qlib"), feature_mapping=FEATURE_MAPPING
+    )
+    exporter.FETCH_CHUNK_SIZE = 2
+    yield exporter
+    engine.dispose()
+
+
+class TestHistoryFetch:
+    """Test column pruning, filtering and typing of fetched history chunks."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_only_mapped_columns_as_typed_chunks(self, exporter):
+        statements = []
+        event.listen(
+            exporter.db_manager.connection.engine, "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement)
+        )
+
+        data = await exporter._fetch_history_data(START, END, networks=["solana"])
+
+        select_sql = next(s for s in statements if "new_pools_history_enhanced" in s)
+        selected = select_sql.split("SELECT", 1)[1].split("FROM", 1)[0]
+        assert [c.strip() for c in selected.split(",")] == [
+            "pool_id", "datetime", "qlib_symbol", "close_price_usd", "volume_usd_h24"
+        ]
+        assert "qlib_features_json" not in select_sql
+
+        # Expanding IN on SQLite; low-quality and other-network rows filtered in SQL
+        assert "IN (" in select_sql and "ANY" not in select_sql
+        assert list(data.columns) == ["pool_id", "datetime", "qlib_symbol", "close_price_usd", "volume_usd_h24"]
+        assert list(data["pool_id"]) == ["solana_a", "solana_a", "solana_b", "solana_b"]
+
+        assert data["close_price_usd"].dtype == np.float64
+        assert data["volume_usd_h24"].dtype == np.float64
+        assert data["datetime"].dtype == "datetime64[ns]"
+        assert data["datetime"].iloc[0] == pd.Timestamp("2025-01-01 01:00:00")
+
+        all_networks = await exporter._fetch_history_data(START, END, networks=["solana", "eth"])
+        assert set(all_networks["pool_id"]) == {"solana_a", "solana_b", "eth_c"}
+
+    @pytest.mark.asyncio
+    async def test_forward_fill_stays_within_pool(self, exporter):
+        data = await exporter._fetch_history_data(START, END, networks=["solana"])
+
+        processed = exporter._process_for_qlib_bin(data)
+
+        closes = processed.set_index(["pool_id", processed["datetime"].dt.hour])["close_price_usd"]
+        assert closes[("solana_a", 2)] == 1.5  # filled from the pool's previous row
+        assert closes[("solana_b", 1)] == 0.0  # not filled from another pool
+        assert closes[("solana_b", 2)] == 3.0
+        assert list(processed["symbol"].unique()) == ["SOLANA_A", "SOLANA_B"]
+
+    def test_copy_statement_compiles_for_postgresql(self, exporter):
+        exporter.db_manager.connection.engine = SimpleNamespace(dialect=postgresql.psycopg2.dialect())
+        query, params = exporter._build_history_query(
+            exporter._history_columns(), START, END, ["solana"], 1000, 100
+        )
+
+        def mogrify(sql, parameters):
+            return (sql % {name: repr(value) for name, value in parameters.items()}).encode()
+
+        copy_sql = exporter._history_copy_sql(postgresql.psycopg2.dialect(), query, params, mogrify)
+
+        assert copy_sql.startswith("COPY (")
+        assert copy_sql.endswith(") TO STDOUT WITH (FORMAT csv, HEADER true)")
+        assert "SELECT pool_id, datetime, qlib_symbol, close_price_usd, volume_usd_h24" in copy_sql
+        assert "network_id = ANY(['solana'])" in copy_sql
+        assert "%(" not in copy_sql and ":start_date" not in copy_sql
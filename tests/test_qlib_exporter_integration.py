@@ -8,6 +8,7 @@ the system.
 
 import pytest
 import pandas as pd
+from dataclasses import replace
 from datetime import datetime, timedelta
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -17,6 +18,7 @@ import tempfile
 from gecko_terminal_collector.qlib.exporter import QLibExporter
 from gecko_terminal_collector.qlib.integrated_symbol_mapper import IntegratedSymbolMapper
 from gecko_terminal_collector.database.enhanced_manager import EnhancedDatabaseManager
+from gecko_terminal_collector.database.frames import ohlcv_records_to_frame
 from gecko_terminal_collector.models.core import Pool, OHLCVRecord
 
 
@@ -204,9 +206,9 @@ class TestQLibExporterIntegration:
         # Setup mocks
         mock_enhanced_db_manager.get_watchlist_pools.return_value = [pool.id]
         mock_enhanced_db_manager.get_pool.return_value = pool
-        mock_enhanced_db_manager.get_ohlcv_data.return_value = sample_ohlcv_records
+        mock_enhanced_db_manager.get_ohlcv_frame.return_value = ohlcv_records_to_frame(sample_ohlcv_records)
         mock_symbol_mapper.generate_symbol.return_value = symbol
-        mock_symbol_mapper.lookup_pool_with_fallback.return_value = pool
+        mock_symbol_mapper.resolve_symbols.return_value = {symbol: pool}
         
         # Test
         df = await qlib_exporter_with_mapper.export_ohlcv_data(
@@ -218,7 +220,7 @@ class TestQLibExporterIntegration:
         assert not df.empty
         assert len(df) == 24
         assert df['symbol'].iloc[0] == symbol
-        mock_symbol_mapper.lookup_pool_with_fallback.assert_called_with(symbol)
+        mock_symbol_mapper.resolve_symbols.assert_called_once_with([symbol])
     
     @pytest.mark.asyncio
     async def test_case_insensitive_symbol_lookup(self, qlib_exporter_with_mapper, mock_symbol_mapper, sample_pools):
@@ -253,7 +255,7 @@ class TestQLibExporterIntegration:
         # Setup database mocks
         mock_enhanced_db_manager.get_watchlist_pools.return_value = [pool.id]
         mock_enhanced_db_manager.get_pool.return_value = pool
-        mock_enhanced_db_manager.get_ohlcv_data.return_value = sample_ohlcv_records
+        mock_enhanced_db_manager.get_ohlcv_frame.return_value = ohlcv_records_to_frame(sample_ohlcv_records)
         
         # Generate symbol using exporter
         symbol1 = exporter._generate_symbol_name(pool)
@@ -275,8 +277,8 @@ class TestQLibExporterIntegration:
         symbol = "uncached_symbol"
         
         # Setup mocks - symbol not in cache initially, but found in database
-        mock_symbol_mapper.lookup_pool_with_fallback.return_value = pool
-        mock_enhanced_db_manager.get_ohlcv_data.return_value = sample_ohlcv_records
+        mock_symbol_mapper.resolve_symbols.return_value = {symbol: pool}
+        mock_enhanced_db_manager.get_ohlcv_frame.return_value = ohlcv_records_to_frame(sample_ohlcv_records)
         
         # Test
         df = await qlib_exporter_with_mapper.export_ohlcv_data(
@@ -287,7 +289,7 @@ class TestQLibExporterIntegration:
         # Assertions
         assert not df.empty
         assert len(df) == 24
-        mock_symbol_mapper.lookup_pool_with_fallback.assert_called_with(symbol)
+        mock_symbol_mapper.resolve_symbols.assert_called_once_with([symbol])
     
     @pytest.mark.asyncio
     async def test_bulk_symbol_operations(self, mock_enhanced_db_manager, sample_pools, sample_ohlcv_records):
@@ -302,7 +304,9 @@ class TestQLibExporterIntegration:
         mock_enhanced_db_manager.get_pool.side_effect = lambda pool_id: next(
             (pool for pool in sample_pools if pool.id == pool_id), None
         )
-        mock_enhanced_db_manager.get_ohlcv_data.return_value = sample_ohlcv_records
+        mock_enhanced_db_manager.get_ohlcv_frame.return_value = ohlcv_records_to_frame(
+            replace(record, pool_id=pool.id) for pool in sample_pools for record in sample_ohlcv_records
+        )
         
         # Initialize cache
         await exporter.initialize_symbol_cache()
@@ -357,9 +361,9 @@ class TestQLibExporterIntegration:
         # Setup mocks
         mock_enhanced_db_manager.get_watchlist_pools.return_value = [pool.id]
         mock_enhanced_db_manager.get_pool.return_value = pool
-        mock_enhanced_db_manager.get_ohlcv_data.return_value = sample_ohlcv_records
+        mock_enhanced_db_manager.get_ohlcv_frame.return_value = ohlcv_records_to_frame(sample_ohlcv_records)
         mock_symbol_mapper.generate_symbol.return_value = symbol
-        mock_symbol_mapper.lookup_pool_with_fallback.return_value = pool
+        mock_symbol_mapper.resolve_symbols.return_value = {symbol: pool}
         
         with tempfile.TemporaryDirectory() as temp_dir:
             # Test
@@ -515,7 +519,7 @@ class TestSymbolMapperRequirementsIntegration:
         
         # Setup database mocks
         mock_enhanced_db_manager.get_pool.return_value = sample_pool_mixed_case
-        mock_enhanced_db_manager.get_ohlcv_data.return_value = sample_ohlcv_records
+        mock_enhanced_db_manager.get_ohlcv_frame.return_value = ohlcv_records_to_frame(sample_ohlcv_records)
         
         # Generate original symbol
         original_symbol = exporter._generate_symbol_name(sample_pool_mixed_case)
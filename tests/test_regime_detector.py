@@ -0,0 +1,109 @@
+"""
+Tests for RegimeDetector and its rolling percentile window.
+"""
+
+import numpy as np
+import pytest
+
+from nautilus_poc.regime_detector import RegimeDetector, RollingPercentileWindow
+
+
+class TestRollingPercentileWindow:
+    """Test the ring buffer and sorted order statistics."""
+
+    def test_matches_numpy_over_sliding_window(self):
+        rng = np.random.default_rng(3)
+        stream = rng.lognormal(size=1000)
+        # Repeated values exercise deletion of duplicates from the sorted list
+        stream[::7] = 1.0
+        window = RollingPercentileWindow(capacity=128)
+
+        for i, value in enumerate(stream):
+            window.append(value)
+            expected = stream[max(0, i - 127):i + 1]
+
+            assert len(window) == len(expected)
+            assert window.rank(value) == pytest.approx((expected < value).mean())
+            for q in (0.0, 0.3, 0.7, 0.9, 1.0):
+                assert window.quantile(q) == pytest.approx(np.percentile(expected, q * 100))
+
+        assert np.array_equal(window.values(), stream[-128:])
+        assert np.array_equal(window.recent(5), stream[-5:])
+        assert np.array_equal(window.sorted_values(), np.sort(stream[-128:]))
+
+    def test_extend_keeps_most_recent_values(self):
+        window = RollingPercentileWindow(capacity=5)
+        for value in (1.0, 2.0, 3.0):
+            window.append(value)
+
+        window.extend([4.0, 5.0, 6.0, 7.0])
+
+        assert window.values().tolist() == [3.0, 4.0, 5.0, 6.0, 7.0]
+        assert window.quantile(0.5) == 5.0
+
+        window.append(0.0)
+        assert window.values().tolist() == [4.0, 5.0, 6.0, 7.0, 0.0]
+        assert window.rank(5.0) == pytest.approx(0.4)
+
+    def test_empty_window(self):
+        window = RollingPercentileWindow(capacity=3)
+        assert window.rank(1.0) == 0.0
+        assert window.values().size == 0
+        with pytest.raises(ValueError):
+            window.quantile(0.5)
+
+
+class TestRegimeDetector:
+    """Test regime classification on top of the rolling window."""
+
+    def test_bounded_history_and_percentiles(self):
+        detector = RegimeDetector({'regime_detection': {'max_history_size': 500}})
+        rng = np.random.default_rng(11)
+        history = rng.uniform(0, 1, size=2000)
+
+        detector.load_historical_data(np.append(history, [np.nan, np.inf]))
+
+        retained = history[-500:]
+        assert detector.vol_risk_history == retained.tolist()
+        percentiles = detector._get_current_percentiles()
+        assert percentiles['low'] == pytest.approx(np.percentile(retained, 30))
+        assert percentiles['extreme'] == pytest.approx(np.percentile(retained, 90))
+
+    def test_classification_matches_scalar_rules(self):
+        detector = RegimeDetector({})
+        rng = np.random.default_rng(5)
+        detector.load_historical_data(list(rng.uniform(0, 1, size=300)))
+
+        info = detector.classify_regime({'vol_risk': 0.95, 'q50': 0.01, 'vol_raw': 0.1})
+        assert info['regime'] == 'extreme_variance'
+        assert info['vol_risk_percentile'] == pytest.approx((np.array(detector.vol_risk_history) < 0.95).mean() * 100)
+
+        percentiles = detector._get_current_percentiles()
+        values = np.array(detector.vol_risk_history)
+        indices = detector._classify_vol_risk_array(values, percentiles)
+        scalar = [detector._classify_vol_risk_regime(v, percentiles)['regime'] for v in values]
+        vectorized = [('low_variance', 'medium_variance', 'high_variance', 'extreme_variance')[i] for i in indices]
+        assert vectorized == scalar
+
+        stats = detector.get_regime_statistics()
+        assert stats['total_observations'] == 301
+        assert sum(stats['regime_distribution'].values()) == pytest.approx(1.0)
+        assert stats['vol_risk_stats']['median'] == pytest.approx(np.median(values))
+
+    def test_percentile_cache_refreshes_after_threshold(self):
+        detector = RegimeDetector({})
+        detector.load_historical_data([0.1] * 200)
+        first = detector._get_current_percentiles()
+
+        for _ in range(detector.cache_update_threshold - 1):
+            detector.classify_regime({'vol_risk': 0.9})
+        assert detector._get_current_percentiles() is first
+
+        detector.classify_regime({'vol_risk': 0.9})
+        assert detector._get_current_percentiles() is not first
+
+    def test_reset_history(self):
+        detector = RegimeDetector({})
+        detector.load_historical_data([0.2, 0.4])
+        detector.reset_history()
+        assert detector.get_regime_statistics() == {'status': 'no_history'}
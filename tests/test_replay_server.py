@@ -0,0 +1,136 @@
+"""
+Tests for the local GeckoTerminal replay server.
+"""
+
+import time
+
+import aiohttp
+import pytest
+import pytest_asyncio
+
+from gecko_terminal_collector.clients.gecko_client import GeckoTerminalClient
+from tests.replay_server import (
+    GeckoTerminalReplayServer, ReplayServerConfig
+)
+from gecko_terminal_collector.config.models import APIConfig, ErrorConfig
+
+
+ANCHOR = 1_760_000_400  # aligned to the hour
+
+
+@pytest_asyncio.fixture
+async def replay_server():
+    """Run a replay server with a fixed anchor time."""
+    async with GeckoTerminalReplayServer(ReplayServerConfig(anchor_timestamp=ANCHOR)) as server:
+        yield server
+
+
+def _client_for(server, max_retries: int = 0) -> GeckoTerminalClient:
+    return GeckoTerminalClient(
+        APIConfig(base_url=server.base_url, rate_limit_delay=0),
+        ErrorConfig(max_retries=max_retries, backoff_factor=0.01)
+    )
+
+
+class TestReplayServerResponses:
+    """Test that recorded fixtures are served in API format."""
+
+    @pytest.mark.asyncio
+    async def test_sdk_parses_ohlcv_from_replay(self, replay_server):
+        """The real client, SDK and HTTP stack read OHLCV through the replay server."""
+        client = _client_for(replay_server)
+
+        df = await client.get_ohlcv_data("solana", "pool_a", timeframe="1h", limit=24)
+
+        assert len(df) == 24
+        assert int(df["timestamp"].max()) == ANCHOR
+        assert replay_server.total_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_ohlcv_paginates_with_before_timestamp(self, replay_server):
+        """Each page ends strictly before the requested timestamp without overlap."""
+        url = f"{replay_server.base_url}/networks/solana/pools/pool_a/ohlcv/minute"
+
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, params={"aggregate": 15, "limit": 10}) as response:
+                first_page = (await response.json())["data"]["attributes"]["ohlcv_list"]
+            oldest = first_page[-1][0]
+            async with session.get(
+                url, params={"aggregate": 15, "limit": 10, "before_timestamp": oldest}
+            ) as response:
+                second_page = (await response.json())["data"]["attributes"]["ohlcv_list"]
+
+        assert [row[0] for row in first_page] == [ANCHOR - 900 * i for i in range(10)]
+        assert second_page[0][0] == oldest - 900
+        assert len(second_page) == 10
+
+    @pytest.mark.asyncio
+    async def test_sdk_parses_trades_rebased_to_anchor(self, replay_server):
+        """Trades carry per-pool ids and timestamps rebased onto the anchor."""
+        client = _client_for(replay_server)
+
+        df = await client.get_trades("solana", "pool_b", trade_volume_filter=None)
+
+        assert len(df) > 0
+        assert all(trade_id.endswith("_pool_b") for trade_id in df["id"])
+        assert max(df["block_timestamp"]) == time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ANCHOR))
+
+    @pytest.mark.asyncio
+    async def test_sdk_parses_pool_listings(self, replay_server):
+        """New pool and multi-pool endpoints round-trip through the SDK's pool spec."""
+        client = _client_for(replay_server)
+
+        new_pools = await client.get_new_pools_by_network("solana")
+        multi = await client.get_multiple_pools_by_network("solana", ["addr1", "addr2"])
+
+        assert len(new_pools) > 0
+        assert list(multi["address"]) == ["addr1", "addr2"]
+
+
+class TestReplayServerFaults:
+    """Test latency and rate limit injection."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_burst_with_retry_after(self):
+        """Every Nth request starts a burst of 429 responses with Retry-After."""
+        config = ReplayServerConfig(rate_limit_every=3, rate_limit_burst=2, retry_after=0.25)
+        async with GeckoTerminalReplayServer(config) as server:
+            statuses = []
+            async with aiohttp.ClientSession() as session:
+                for _ in range(6):
+                    async with session.get(f"{server.base_url}/networks") as response:
+                        statuses.append((response.status, response.headers.get("Retry-After")))
+
+        assert [status for status, _ in statuses] == [200, 200, 429, 429, 200, 429]
+        assert statuses[2][1] == "0.25"
+        assert server.rate_limited_responses == 3
+
+    @pytest.mark.asyncio
+    async def test_client_honours_retry_after(self):
+        """The client retries a 429 after the server's Retry-After instead of its backoff."""
+        config = ReplayServerConfig(rate_limit_every=2, rate_limit_burst=1, retry_after=0.05)
+        async with GeckoTerminalReplayServer(config) as server:
+            client = GeckoTerminalClient(
+                APIConfig(base_url=server.base_url, rate_limit_delay=0),
+                ErrorConfig(max_retries=1, backoff_factor=30.0)
+            )
+            await client.get_networks()
+            # Request 2 is rate limited and retried as request 3
+            start = time.perf_counter()
+            await client.get_networks()
+            elapsed = time.perf_counter() - start
+
+        assert server.total_requests == 3
+        assert server.rate_limited_responses == 1
+        assert elapsed < 5
+
+    def test_latency_is_deterministic_for_seed(self):
+        """The same seed produces the same latency sequence."""
+        config = ReplayServerConfig(latency_distribution="lognormal", latency_ms=50, latency_jitter_ms=20)
+
+        first = GeckoTerminalReplayServer(config)
+        second = GeckoTerminalReplayServer(config)
+
+        samples = [first._next_latency() for _ in range(50)]
+        assert samples == [second._next_latency() for _ in range(50)]
+        assert 0.03 < sum(samples) / len(samples) < 0.07
@@ -0,0 +1,253 @@
+"""
+Tests for Q50SignalLoader timestamp lookups.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytest_asyncio
+
+from nautilus_poc.signal_loader import Q50SignalLoader, SignalLookupIndex, SignalRow
+from nautilus_poc.signal_store import SignalStore, SignalStoreError, convert_pickle_to_store, write_signal_store
+
+
+def create_signals(periods: int = 48, freq: str = '1h') -> pd.DataFrame:
+    """Create a deterministic Q50 signal frame."""
+    index = pd.date_range('2024-01-01', periods=periods, freq=freq)
+    values = np.arange(periods, dtype=float)
+    return pd.DataFrame({
+        'q10': values - 1,
+        'q50': values,
+        'q90': values + 1,
+        'vol_raw': values / 100,
+        'vol_risk': values / 50,
+        'prob_up': np.full(periods, 0.6),
+        'economically_significant': values % 2 == 0,
+        'high_quality': np.ones(periods, dtype=bool),
+        'tradeable': values % 2 == 0,
+    }, index=index)
+
+
+@pytest.fixture
+def features_path(tmp_path):
+    path = tmp_path / "macro_features.pkl"
+    create_signals().to_pickle(path)
+    return path
+
+
+@pytest_asyncio.fixture
+async def loader(features_path):
+    signal_loader = Q50SignalLoader({
+        'q50': {'features_path': str(features_path), 'signal_tolerance_minutes': 5, 'signal_cache_size': 4},
+        'database': {'url': 'sqlite://'}
+    })
+    assert await signal_loader.load_signals()
+    yield signal_loader
+    signal_loader.close()
+
+
+class TestSignalLookup:
+    """Test nearest-within-tolerance signal lookups."""
+
+    @pytest.mark.asyncio
+    async def test_exact_and_nearest_match(self, loader):
+        exact = await loader.get_signal_for_timestamp(pd.Timestamp('2024-01-01 03:00'))
+        assert exact['timestamp'] == pd.Timestamp('2024-01-01 03:00')
+        assert exact['time_diff_minutes'] == 0.0
+        assert exact['q50'] == 3.0
+
+        after = await loader.get_signal_for_timestamp(pd.Timestamp('2024-01-01 03:04'))
+        assert after['timestamp'] == pd.Timestamp('2024-01-01 03:00')
+        assert after['time_diff_minutes'] == pytest.approx(4.0)
+
+        before = await loader.get_signal_for_timestamp(pd.Timestamp('2024-01-01 02:57'))
+        assert before['timestamp'] == pd.Timestamp('2024-01-01 03:00')
+        assert before['time_diff_minutes'] == pytest.approx(3.0)
+
+    @pytest.mark.asyncio
+    async def test_outside_tolerance_returns_none(self, loader):
+        assert await loader.get_signal_for_timestamp(pd.Timestamp('2024-01-01 03:30')) is None
+        assert await loader.get_signal_for_timestamp(pd.Timestamp('2023-12-31 23:54')) is None
+        assert await loader.get_signal_for_timestamp(pd.Timestamp('2024-01-02 23:06')) is None
+
+    @pytest.mark.asyncio
+    async def test_accepts_nanoseconds_and_datetime(self, loader):
+        target = pd.Timestamp('2024-01-01 05:01')
+        by_ns = await loader.get_signal_for_timestamp(target.value)
+        by_datetime = await loader.get_signal_for_timestamp(target.to_pydatetime())
+        assert by_ns['q50'] == by_datetime['q50'] == 5.0
+
+    @pytest.mark.asyncio
+    async def test_row_matches_to_dict(self, loader):
+        signal = await loader.get_signal_for_timestamp(pd.Timestamp('2024-01-01 04:00'))
+        expected = {
+            'timestamp': pd.Timestamp('2024-01-01 04:00'),
+            'time_diff_minutes': 0.0,
+            **loader.signals_df.loc[pd.Timestamp('2024-01-01 04:00')].to_dict()
+        }
+
+        assert isinstance(signal, SignalRow)
+        assert dict(signal) == expected
+        assert list(signal) == list(expected)
+        assert type(signal['tradeable']) is bool
+        assert signal.get('missing', 'default') == 'default'
+
+        mutable = signal.copy()
+        mutable['regime_info'] = {}
+        assert 'regime_info' not in signal
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded_and_keyed_by_row(self, loader):
+        # Many ticks around one signal share a single cached row
+        for second in range(0, 240, 10):
+            await loader.get_signal_for_timestamp(pd.Timestamp('2024-01-01 06:00') + pd.Timedelta(seconds=second))
+        assert len(loader.lookup_index.row_cache) == 1
+
+        for hour in range(12):
+            await loader.get_signal_for_timestamp(pd.Timestamp('2024-01-01') + pd.Timedelta(hours=hour))
+        assert len(loader.lookup_index.row_cache) == 4
+        assert loader.get_signal_statistics()['cache_size'] == 4
+
+        loader.clear_cache()
+        assert len(loader.lookup_index.row_cache) == 0
+
+
+class TestSignalLookupIndex:
+    """Test the lookup index directly."""
+
+    def test_ties_resolve_to_earlier_signal(self):
+        index = SignalLookupIndex.from_frame(create_signals(freq='10min'))
+        midpoint = pd.Timestamp('2024-01-01 00:05').value
+
+        position, diff = index.nearest(midpoint, 5 * 60_000_000_000)
+        assert position == 0
+        assert diff == 5 * 60_000_000_000
+
+    def test_duplicate_timestamps_use_first_row(self):
+        frame = create_signals(periods=3)
+        frame = pd.concat([frame.iloc[:2], frame.iloc[1:2].assign(q50=99.0), frame.iloc[2:]])
+        index = SignalLookupIndex.from_frame(frame)
+
+        signal = index.lookup(pd.Timestamp('2024-01-01 01:00').value, 0)
+        assert len(index) == 3
+        assert signal['q50'] == 1.0
+
+    def test_matches_window_scan(self):
+        frame = create_signals(periods=500, freq='7min')
+        index = SignalLookupIndex.from_frame(frame)
+        tolerance = pd.Timedelta(minutes=3)
+        rng = np.random.default_rng(7)
+
+        # Out-of-order queries exercise both the search and the cached bracket
+        for offset in rng.integers(-600, 500 * 7 * 60 + 600, size=300):
+            target = frame.index[0] + pd.Timedelta(seconds=int(offset))
+            window = frame[(frame.index >= target - tolerance) & (frame.index <= target + tolerance)]
+            result = index.lookup(target.value, tolerance.value)
+
+            if window.empty:
+                assert result is None
+            else:
+                distances = abs(window.index - target)
+                assert result['timestamp'] == window.index[distances.argmin()]
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    frame = create_signals()
+    frame.to_pickle(tmp_path / "macro_features.pkl")
+    return convert_pickle_to_store(tmp_path / "macro_features.pkl")
+
+
+def make_loader(features_path, **q50_options) -> Q50SignalLoader:
+    return Q50SignalLoader({
+        'q50': {'features_path': str(features_path), 'signal_tolerance_minutes': 5, **q50_options},
+        'database': {'url': 'sqlite://'}
+    })
+
+
+class TestSignalStore:
+    """Test the memory-mapped signal store."""
+
+    def test_round_trip_is_sorted_and_deduplicated(self, tmp_path):
+        frame = create_signals(periods=4)
+        shuffled = pd.concat([frame.iloc[[2, 0, 3, 1]], frame.iloc[[1]].assign(q50=99.0)])
+        path = write_signal_store(shuffled, tmp_path / "signals.arrow")
+
+        store = SignalStore(path)
+
+        assert len(store) == 4
+        assert list(store.timestamps) == list(frame.index.asi8)
+        assert list(store.columns['q50']) == [0.0, 1.0, 2.0, 3.0]
+        assert store.columns['tradeable'].dtype == np.bool_
+        assert store.header['rows'] == 4
+        assert not store.columns['q50'].flags.writeable
+
+    def test_rejects_non_store_files(self, tmp_path):
+        path = tmp_path / "other.arrow"
+        path.write_bytes(b"not an arrow file")
+        with pytest.raises(SignalStoreError):
+            SignalStore(path)
+
+    def test_non_numeric_columns_are_skipped(self, tmp_path):
+        frame = create_signals(periods=3).assign(label=['a', 'b', 'c'])
+        store = SignalStore(write_signal_store(frame, tmp_path / "signals.arrow"))
+        assert 'label' not in store.columns
+
+
+class TestSignalStoreLoading:
+    """Test Q50SignalLoader on signal stores."""
+
+    @pytest.mark.asyncio
+    async def test_pickle_is_replaced_by_sibling_store(self, store_path):
+        loader = make_loader(store_path.with_suffix('.pkl'))
+        assert await loader.load_signals()
+
+        assert loader.source_path == store_path
+        assert loader.signals_df is None
+        signal = await loader.get_signal_for_timestamp(pd.Timestamp('2024-01-01 02:02'))
+        assert signal['q50'] == 2.0
+        assert type(signal['tradeable']) is bool
+        loader.close()
+
+    @pytest.mark.asyncio
+    async def test_store_matches_pickle(self, store_path, monkeypatch):
+        pickle_loader = make_loader(store_path.with_suffix('.pkl'))
+        # Force the legacy path for comparison
+        monkeypatch.setattr(pickle_loader, 'resolve_signal_source', lambda: store_path.with_suffix('.pkl'))
+        store_loader = make_loader(store_path)
+        assert await pickle_loader.load_signals()
+        assert await store_loader.load_signals()
+
+        pickle_stats = pickle_loader.get_signal_statistics()
+        store_stats = store_loader.get_signal_statistics()
+        for key in ('total_signals', 'date_range', 'tradeable_signals', 'high_quality'):
+            assert store_stats[key] == pickle_stats[key]
+        assert store_stats['q50_stats'] == pytest.approx(pickle_stats['q50_stats'])
+        assert store_stats['vol_risk_stats']['percentiles'] == pytest.approx(pickle_stats['vol_risk_stats']['percentiles'])
+
+        start, end = pd.Timestamp('2024-01-01 03:00'), pd.Timestamp('2024-01-01 06:00')
+        pd.testing.assert_frame_equal(
+            store_loader.get_signals_in_range(start, end),
+            pickle_loader.get_signals_in_range(start, end),
+            check_names=False
+        )
+        assert store_loader.get_latest_signal() == pickle_loader.get_latest_signal()
+        assert list(store_loader.get_column('vol_risk')) == list(pickle_loader.get_column('vol_risk'))
+        pickle_loader.close()
+        store_loader.close()
+
+    @pytest.mark.asyncio
+    async def test_hot_reload_on_atomic_swap(self, store_path):
+        loader = make_loader(store_path)
+        assert await loader.load_signals()
+        before = await loader.get_signal_for_timestamp(pd.Timestamp('2024-01-01 01:00'))
+        assert not await loader.reload_if_changed()
+
+        write_signal_store(create_signals().assign(q50=lambda df: df['q50'] * 10), store_path)
+
+        assert await loader.reload_if_changed()
+        after = await loader.get_signal_for_timestamp(pd.Timestamp('2024-01-01 01:00'))
+        assert after['q50'] == 10.0
+        # Rows handed out before the swap stay valid
+        assert before['q50'] == 1.0
+        loader.close()
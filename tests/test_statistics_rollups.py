@@ -0,0 +1,220 @@
+"""
+Tests for the incremental statistics rollups and the rollup-backed StatisticsEngine.
+"""
+
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from sqlalchemy import DateTime
+from sqlalchemy.dialects import postgresql
+
+from gecko_terminal_collector.config.models import DatabaseConfig
+from gecko_terminal_collector.database.models import (
+    ExecutionHistory,
+    NewPoolsHistory,
+    NewPoolsHistoryHourly,
+    NewPoolsHistoryTotals,
+    RollupWatermark,
+)
+from gecko_terminal_collector.database import rollups
+from gecko_terminal_collector.database.rollups import hour_floor
+from gecko_terminal_collector.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from gecko_terminal_collector.utils.statistics_engine import StatisticsEngine
+
+
+CURRENT_HOUR = hour_floor(datetime.utcnow())
+
+
+def history_row(pool: str, network: str, dex: str, hours_ago: int, minute: int, reserve=None, volume=None):
+    return NewPoolsHistory(
+        pool_id=f"{network}_{pool}", name=pool, address=pool, network_id=network, dex_id=dex,
+        reserve_in_usd=Decimal(reserve) if reserve is not None else None,
+        volume_usd_h24=Decimal(volume) if volume is not None else None,
+        collected_at=CURRENT_HOUR - timedelta(hours=hours_ago) + timedelta(minutes=minute)
+    )
+
+
+def execution_row(index: int, collector_type: str, status: str, hours_ago: int, execution_time=None, records=0):
+    return ExecutionHistory(
+        collector_type=collector_type, execution_id=f"exec-{index}", status=status,
+        start_time=CURRENT_HOUR - timedelta(hours=hours_ago) + timedelta(minutes=index % 60),
+        execution_time=Decimal(execution_time) if execution_time is not None else None,
+        records_collected=records
+    )
+
+
+def add_rows(db_manager, rows):
+    with db_manager.connection.get_session() as session:
+        session.add_all(rows)
+        session.commit()
+
+
+@pytest_asyncio.fixture
+async def db_manager(tmp_path):
+    db_manager = SQLAlchemyDatabaseManager(DatabaseConfig(url=f"sqlite:///{tmp_path / 'stats.db'}", echo=False))
+    await db_manager.initialize()
+    add_rows(db_manager, [
+        history_row("a", "solana", "raydium", 3, 5, "1000", "500"),
+        history_row("a", "solana", "raydium", 3, 35, "3000", "700"),
+        history_row("b", "solana", "orca", 3, 10, None, "100"),
+        history_row("a", "solana", "raydium", 1, 0, "2000", None),
+        history_row("c", "eth", "uniswap", 1, 20, "4000", "900"),
+        history_row("d", "eth", None, 0, 1),
+    ])
+    add_rows(db_manager, [
+        execution_row(1, "new_pools_solana", "success", 2, "1.5", 10),
+        execution_row(2, "new_pools_solana", "failure", 2, None, 0),
+        execution_row(3, "new_pools_solana", "partial", 1, "4.5", 6),
+        execution_row(4, "new_pools_eth", "success", 1, "2.0", 4),
+        execution_row(5, "ohlcv", "success", 1, "9.0", 100),
+        execution_row(6, "new_pools_solana", "success", 30, "8.0", 50),
+    ])
+    yield db_manager
+    await db_manager.close()
+
+
+async def collect(engine, network_filter=None):
+    stats = await engine.get_comprehensive_statistics(network_filter=network_filter, hours_back=24)
+    performance = await engine.get_collection_performance_metrics(network_filter=network_filter, hours_back=24)
+    return stats, performance
+
+
+def assert_same_statistics(rollup, raw):
+    rollup_stats, rollup_performance = rollup
+    raw_stats, raw_performance = raw
+
+    assert rollup_stats.total_history_records == raw_stats.total_history_records
+    assert rollup_stats.network_distribution == raw_stats.network_distribution
+    assert rollup_stats.dex_distribution == raw_stats.dex_distribution
+    assert rollup_stats.error_summary == raw_stats.error_summary
+    assert rollup_performance == pytest.approx(raw_performance)
+
+    assert [h['hour'] for h in rollup_stats.collection_activity] == [h['hour'] for h in raw_stats.collection_activity]
+    for rollup_hour, raw_hour in zip(rollup_stats.collection_activity, raw_stats.collection_activity):
+        assert rollup_hour['records'] == raw_hour['records']
+        assert rollup_hour['unique_pools'] == raw_hour['unique_pools']
+        assert rollup_hour['avg_reserve_usd'] == pytest.approx(raw_hour['avg_reserve_usd'])
+        assert rollup_hour['total_volume_h24'] == pytest.approx(raw_hour['total_volume_h24'])
+
+
+class TestStatisticsRollups:
+    """Test rollup compaction and rollup-backed statistics."""
+
+    @pytest.mark.asyncio
+    async def test_rollups_match_history_scans(self, db_manager):
+        rollup_engine = StatisticsEngine(db_manager)
+        raw_engine = StatisticsEngine(db_manager, use_rollups=False)
+
+        for network_filter in (None, "solana"):
+            assert_same_statistics(await collect(rollup_engine, network_filter), await collect(raw_engine, network_filter))
+
+        assert rollup_engine._rollups_current
+        assert not raw_engine._rollups_current
+
+        stats, performance = await collect(rollup_engine)
+        assert stats.total_history_records == 6
+        assert stats.network_distribution == {"solana": 4, "eth": 2}
+        assert stats.dex_distribution == {"raydium": 3, "orca": 1, "uniswap": 1}
+        assert stats.collection_activity[0]['unique_pools'] == 2
+        assert stats.collection_activity[0]['avg_reserve_usd'] == pytest.approx(2000.0)
+        assert stats.error_summary['total_executions'] == 4
+        assert performance['total_executions'] == 3
+        assert performance['max_execution_time'] == 4.5
+
+    @pytest.mark.asyncio
+    async def test_compaction_is_incremental(self, db_manager):
+        engine = StatisticsEngine(db_manager)
+        assert await engine.rollups.compact() == {"new_pools_history": 6, "execution_history": 6}
+        assert await engine.rollups.compact() == {"new_pools_history": 0, "execution_history": 0}
+
+        # A pool seen again in an already rolled-up hour, plus a new one
+        add_rows(db_manager, [
+            history_row("a", "solana", "raydium", 3, 50, "5000", "100"),
+            history_row("e", "solana", "raydium", 3, 55, "1000", "100"),
+        ])
+        assert (await engine.rollups.compact())["new_pools_history"] == 2
+
+        with db_manager.connection.get_session() as session:
+            bucket = session.query(NewPoolsHistoryHourly).filter_by(
+                bucket_start=CURRENT_HOUR - timedelta(hours=3), network_id="solana", dex_id="raydium"
+            ).one()
+            totals = session.query(NewPoolsHistoryTotals).filter_by(network_id="solana", dex_id="raydium").one()
+            watermark = session.get(RollupWatermark, "new_pools_history")
+            assert (bucket.records, bucket.unique_pools, bucket.reserve_in_usd_count) == (4, 2, 4)
+            assert totals.records == 5
+            assert watermark.last_id == 8
+
+        assert_same_statistics(
+            await collect(engine), await collect(StatisticsEngine(db_manager, use_rollups=False))
+        )
+
+    @pytest.mark.asyncio
+    async def test_rows_committed_below_watermark_are_reconciled(self, db_manager, monkeypatch):
+        engine = StatisticsEngine(db_manager)
+        late = history_row("f", "eth", "uniswap", 0, 30, "3000", "10")
+        late.id = 50
+        early = history_row("g", "eth", "uniswap", 1, 40)
+        early.id = 100
+        add_rows(db_manager, [early])
+        await engine.rollups.compact()
+
+        # Row 50 commits after the watermark moved to 100, with no newer rows
+        add_rows(db_manager, [late])
+        assert (await engine.rollups.compact())["new_pools_history"] == 0
+        monkeypatch.setattr(rollups, "RECONCILE_INTERVAL", timedelta(0))
+        assert (await engine.rollups.compact())["new_pools_history"] == 0
+
+        with db_manager.connection.get_session() as session:
+            totals = session.query(NewPoolsHistoryTotals).filter_by(network_id="eth", dex_id="uniswap").one()
+            assert totals.records == 3
+            assert session.get(RollupWatermark, "new_pools_history").last_id == 100
+
+        assert_same_statistics(
+            await collect(engine), await collect(StatisticsEngine(db_manager, use_rollups=False))
+        )
+
+    @pytest.mark.asyncio
+    async def test_rebuild_resyncs_after_deletes(self, db_manager):
+        engine = StatisticsEngine(db_manager)
+        await engine.rollups.compact()
+
+        with db_manager.connection.get_session() as session:
+            session.query(NewPoolsHistory).filter(NewPoolsHistory.network_id == "eth").delete()
+            session.commit()
+
+        assert await engine.rollups.rebuild() == {"new_pools_history": 4, "execution_history": 6}
+        stats, _ = await collect(engine)
+        assert stats.network_distribution == {"solana": 4}
+
+    def test_postgresql_buckets_tz_aware_columns_in_utc(self, monkeypatch):
+        engine = SimpleNamespace(dialect=postgresql.dialect())
+        stats_rollups = rollups.StatisticsRollups(SimpleNamespace(connection=SimpleNamespace(engine=engine)))
+        columns = {
+            "new_pools_history": [{"name": "collected_at", "type": postgresql.TIMESTAMP(timezone=True)}],
+            "execution_history": [{"name": "start_time", "type": DateTime()}],
+        }
+        monkeypatch.setattr(rollups, "inspect", lambda bind: SimpleNamespace(
+            get_table_names=lambda: list(columns), get_columns=lambda table: columns[table]
+        ))
+        for model in rollups.ROLLUP_MODELS + (NewPoolsHistory, ExecutionHistory):
+            monkeypatch.setattr(model.__table__, "create", lambda **kwargs: None)
+            for index in model.__table__.indexes:
+                monkeypatch.setattr(index, "create", lambda **kwargs: None)
+        stats_rollups.ensure_tables()
+
+        bucket = stats_rollups._hour_bucket(NewPoolsHistory.collected_at)
+        sql = str(bucket.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        assert sql == "date_trunc('hour', timezone('UTC', new_pools_history.collected_at))"
+        [(start, end)] = stats_rollups._bucket_ranges({CURRENT_HOUR}, NewPoolsHistory.collected_at)
+        assert start == CURRENT_HOUR.replace(tzinfo=timezone.utc) and end - start == timedelta(hours=1)
+
+        # Naive columns keep naive bounds and truncate as stored
+        sql = str(stats_rollups._hour_bucket(ExecutionHistory.start_time).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        ))
+        assert sql == "date_trunc('hour', execution_history.start_time)"
+        [(start, _)] = stats_rollups._bucket_ranges({CURRENT_HOUR}, ExecutionHistory.start_time)
+        assert start.tzinfo is None
@@ -0,0 +1,149 @@
+"""
+Tests for the structured logging pipeline.
+"""
+
+import json
+import logging
+import queue
+
+import pytest
+
+from gecko_terminal_collector.utils.structured_logging import (
+    LoggingManager, LogSamplingConfig, NonBlockingQueueHandler, RateLimitingFilter,
+    diagnostic, set_stdout_diagnostics_routing, correlation_id
+)
+
+
+def _record(level=logging.INFO, lineno=10, msg="message", args=None):
+    return logging.LogRecord("test", level, "/tmp/module.py", lineno, msg, args, None)
+
+
+@pytest.fixture
+def isolated_root_logger():
+    """Give each test a clean root logger and restore it afterwards."""
+    root_logger = logging.getLogger()
+    saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+    root_logger.handlers.clear()
+    yield root_logger
+    root_logger.handlers[:] = saved_handlers
+    root_logger.setLevel(saved_level)
+    set_stdout_diagnostics_routing(False)
+
+
+class TestRateLimitingFilter:
+    """Test cases for RateLimitingFilter."""
+
+    def test_burst_then_sampling_per_call_site(self):
+        """A call site passes its burst, then only every Nth record."""
+        rate_filter = RateLimitingFilter(LogSamplingConfig(burst=5, interval=60, sample_rate=10))
+
+        passed = [rate_filter.filter(_record()) for _ in range(35)]
+
+        assert sum(passed) == 5 + 3
+        assert rate_filter.total_suppressed == 27
+
+    def test_sampled_record_reports_suppressed_count(self):
+        """The record let through after suppression carries the dropped count."""
+        rate_filter = RateLimitingFilter(LogSamplingConfig(burst=1, interval=60, sample_rate=3))
+
+        records = [_record() for _ in range(4)]
+        results = [rate_filter.filter(record) for record in records]
+
+        assert results == [True, False, False, True]
+        assert records[3].suppressed == 2
+
+    def test_call_sites_are_independent(self):
+        """Exhausting one call site does not limit another."""
+        rate_filter = RateLimitingFilter(LogSamplingConfig(burst=1, interval=60, sample_rate=1000))
+
+        rate_filter.filter(_record(lineno=1))
+        assert not rate_filter.filter(_record(lineno=1))
+        assert rate_filter.filter(_record(lineno=2))
+
+    def test_warnings_never_limited(self):
+        """Records above max_level always pass."""
+        rate_filter = RateLimitingFilter(LogSamplingConfig(burst=0, interval=60, sample_rate=1000))
+
+        assert all(rate_filter.filter(_record(level=logging.WARNING)) for _ in range(100))
+
+
+class TestNonBlockingQueueHandler:
+    """Test cases for NonBlockingQueueHandler."""
+
+    def test_prepare_merges_args_without_formatting(self):
+        """Arguments are merged but exception info is kept for the listener."""
+        handler = NonBlockingQueueHandler(queue.Queue())
+        record = _record(msg="pool %s", args=("abc",))
+        record.exc_info = (ValueError, ValueError("bad"), None)
+
+        prepared = handler.prepare(record)
+
+        assert prepared.msg == "pool abc"
+        assert prepared.args is None
+        assert prepared.exc_info[0] is ValueError
+
+    def test_full_queue_drops_records(self):
+        """A full queue drops records instead of blocking the caller."""
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+
+        handler.emit(_record())
+        handler.emit(_record())
+
+        assert handler.dropped == 1
+
+
+class TestAsyncLoggingPipeline:
+    """Test the queue/listener pipeline installed by LoggingManager."""
+
+    def test_records_written_by_listener_with_correlation_id(self, isolated_root_logger, tmp_path):
+        """Records are formatted on the listener thread and keep the caller's correlation ID."""
+        log_file = tmp_path / "collector.log"
+        manager = LoggingManager()
+        manager.setup_logging(
+            log_level="DEBUG",
+            log_file=str(log_file),
+            console_output=False,
+            async_logging=True
+        )
+
+        token = correlation_id.set("corr-123")
+        try:
+            logging.getLogger("gecko.test").info("collected %d records", 5)
+        finally:
+            correlation_id.reset(token)
+        manager.shutdown_logging()
+
+        entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+        entry = next(e for e in entries if e["logger"] == "gecko.test")
+        assert entry["message"] == "collected 5 records"
+        assert entry["correlation_id"] == "corr-123"
+        assert manager.get_log_stats()["async_logging"] is False
+
+    def test_routed_diagnostics_are_logged_not_printed(self, isolated_root_logger, tmp_path, capsys):
+        """With routing enabled, diagnostics go to the log at DEBUG instead of stdout."""
+        log_file = tmp_path / "collector.log"
+        manager = LoggingManager()
+        manager.setup_logging(
+            log_level="DEBUG",
+            log_file=str(log_file),
+            console_output=False,
+            async_logging=True,
+            route_stdout_diagnostics=True
+        )
+
+        diagnostic(logging.getLogger("gecko.diag"), "pool_id:", "solana_abc")
+        manager.shutdown_logging()
+
+        assert capsys.readouterr().out == ""
+        entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+        entry = next(e for e in entries if e["logger"] == "gecko.diag")
+        assert entry["message"] == "pool_id: solana_abc"
+        assert entry["level"] == "DEBUG"
+
+    def test_diagnostics_printed_by_default(self, capsys):
+        """Without routing, diagnostics behave like print()."""
+        set_stdout_diagnostics_routing(False)
+
+        diagnostic(logging.getLogger("gecko.diag"), "a", 1)
+
+        assert capsys.readouterr().out == "a 1\n"
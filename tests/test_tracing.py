@@ -0,0 +1,232 @@
+"""
+Tests for opt-in span tracing and the sampling profiler.
+"""
+
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from gecko_terminal_collector.config.models import CollectionConfig
+from gecko_terminal_collector.models.core import CollectionResult
+from gecko_terminal_collector.collectors.base import BaseDataCollector
+from gecko_terminal_collector.monitoring.tracing import (
+    SamplingProfiler,
+    Tracer,
+    instrument_methods,
+    traced,
+    tracer,
+)
+from gecko_terminal_collector.utils.structured_logging import correlation_id
+
+
+@pytest.fixture
+def enabled_tracer():
+    """Enable the global tracer for one test."""
+    tracer.reset()
+    tracer.enable()
+    yield tracer
+    tracer.disable()
+    tracer.reset()
+
+
+class TracedCollector(BaseDataCollector):
+    """Collector whose parse step is picked up by auto-instrumentation."""
+
+    def get_collection_key(self) -> str:
+        return "traced"
+
+    async def collect(self) -> CollectionResult:
+        data = await self.make_api_request(self.client.get_ohlcv_data, "pool")
+        parsed = self._parse_response(data)
+        await self.validate_data(parsed)
+        await self.db_manager.store_ohlcv_data(parsed)
+        return self.create_success_result(len(parsed), collection_time=None)
+
+    def _parse_response(self, data):
+        return list(data)
+
+
+class StubClient:
+    async def get_ohlcv_data(self, pool_id):
+        return [1, 2, 3]
+
+
+def make_collector():
+    rate_limiter = MagicMock()
+    rate_limiter.acquire = AsyncMock()
+    collector = TracedCollector(
+        config=CollectionConfig(),
+        db_manager=AsyncMock(),
+        use_mock=True,
+        rate_limiter=rate_limiter
+    )
+    collector._client = StubClient()
+    return collector
+
+
+class TestTracerDisabled:
+    """Test the disabled fast path."""
+
+    def test_span_is_shared_noop(self):
+        local = Tracer()
+        assert local.span("a") is local.span("b")
+        assert local.cycle("c") is local.span("a")
+
+    @pytest.mark.asyncio
+    async def test_traced_functions_record_nothing(self):
+        tracer.reset()
+
+        @traced()
+        async def work():
+            return 42
+
+        assert await work() == 42
+        assert tracer.get_cycles() == []
+        assert not tracer.global_spans
+
+
+class TestSpans:
+    """Test span nesting and aggregation."""
+
+    def test_nested_spans_split_self_time(self, enabled_tracer):
+        with enabled_tracer.cycle("cycle") as profile:
+            with enabled_tracer.span("outer"):
+                time.sleep(0.01)
+                with enabled_tracer.span("inner"):
+                    time.sleep(0.02)
+
+        outer = profile.spans[("cycle", "outer")]
+        inner = profile.spans[("cycle", "outer", "inner")]
+        assert outer.count == inner.count == 1
+        assert inner.total_seconds >= 0.02
+        assert outer.total_seconds >= outer.self_seconds + inner.total_seconds - 1e-6
+        assert outer.self_seconds < inner.self_seconds
+        assert enabled_tracer.get_cycles("cycle") == [profile]
+
+    def test_spans_outside_cycle_are_global(self, enabled_tracer):
+        with enabled_tracer.span("loose"):
+            pass
+        assert ("loose",) in enabled_tracer.global_spans
+        assert enabled_tracer.get_cycles() == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_keep_separate_stacks(self, enabled_tracer):
+        async def task(name):
+            with enabled_tracer.span(name):
+                await asyncio.sleep(0.01)
+                with enabled_tracer.span("leaf"):
+                    await asyncio.sleep(0.01)
+
+        with enabled_tracer.cycle("cycle") as profile:
+            await asyncio.gather(task("a"), task("b"))
+
+        assert set(profile.spans) == {
+            ("cycle",), ("cycle", "a"), ("cycle", "b"), ("cycle", "a", "leaf"), ("cycle", "b", "leaf")
+        }
+        # Overlapping children must not drive the parent's self time negative
+        assert profile.spans[("cycle",)].self_seconds >= 0
+
+    def test_cycle_uses_correlation_id(self, enabled_tracer):
+        token = correlation_id.set("corr-123")
+        try:
+            with enabled_tracer.cycle("cycle") as profile:
+                pass
+        finally:
+            correlation_id.reset(token)
+        assert profile.correlation_id == "corr-123"
+
+        token = correlation_id.set(None)
+        try:
+            with enabled_tracer.cycle("cycle") as profile:
+                assert correlation_id.get() == profile.correlation_id
+            assert correlation_id.get() is None
+        finally:
+            correlation_id.reset(token)
+
+    def test_nested_cycle_becomes_span(self, enabled_tracer):
+        with enabled_tracer.cycle("outer") as profile:
+            with enabled_tracer.cycle("inner"):
+                pass
+        assert ("outer", "inner") in profile.spans
+        assert len(enabled_tracer.get_cycles()) == 1
+
+    def test_folded_output_and_summary(self, enabled_tracer, tmp_path):
+        enabled_tracer.enable(output_dir=str(tmp_path))
+        with enabled_tracer.cycle("cycle") as profile:
+            with enabled_tracer.span("work"):
+                time.sleep(0.005)
+
+        folded = profile.to_folded().splitlines()
+        assert any(line.startswith("cycle;work ") for line in folded)
+        assert "work" in profile.format_summary()
+        files = os.listdir(tmp_path)
+        assert len(files) == 1 and files[0].endswith(".folded")
+
+
+class TestInstrumentation:
+    """Test automatic instrumentation of collectors and database managers."""
+
+    def test_instrument_methods_wraps_matching_functions(self):
+        class Store:
+            def store_rows(self):
+                return "stored"
+
+            def other(self):
+                return "other"
+
+        instrument_methods(Store, lambda name: name.startswith("store_"))
+        assert getattr(Store.store_rows, "__traced__", False)
+        assert not getattr(Store.other, "__traced__", False)
+        assert Store().store_rows() == "stored"
+
+    def test_database_manager_methods_are_traced(self):
+        from gecko_terminal_collector.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+        assert getattr(SQLAlchemyDatabaseManager.store_ohlcv_data, "__traced__", False)
+        assert getattr(SQLAlchemyDatabaseManager.get_pool, "__traced__", False)
+        assert not getattr(SQLAlchemyDatabaseManager.initialize, "__traced__", False)
+
+    @pytest.mark.asyncio
+    async def test_collection_cycle_profile(self, enabled_tracer):
+        collector = make_collector()
+
+        await collector.collect_with_error_handling()
+
+        profile = enabled_tracer.get_cycles("traced")[0]
+        names = set(profile.by_span_name())
+        assert {
+            "BaseDataCollector.make_api_request",
+            "rate_limiter.acquire",
+            "api.get_ohlcv_data",
+            "TracedCollector._parse_response",
+            "BaseDataCollector.validate_data",
+        } <= names
+
+
+class TestSamplingProfiler:
+    """Test the sampling profiler."""
+
+    def test_samples_calling_thread(self, tmp_path):
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        deadline = time.perf_counter() + 0.1
+        while time.perf_counter() < deadline:
+            sum(range(1000))
+        profiler.stop()
+
+        assert profiler.total_samples > 0
+        assert "test_samples_calling_thread" in profiler.to_folded()
+        path = profiler.dump(str(tmp_path / "samples.folded"))
+        assert os.path.getsize(path) > 0
+
+    def test_tracer_sampling_toggle(self, tmp_path):
+        local = Tracer()
+        local.output_dir = str(tmp_path)
+        assert local.toggle_sampling() is None
+        time.sleep(0.02)
+        path = local.toggle_sampling()
+        assert path is not None and os.path.exists(path)
+        assert local.stop_sampling() is None
@@ -3,7 +3,7 @@ Tests for the TradeCollector.
 """
 
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
@@ -12,6 +12,7 @@ import pytest
 
 from gecko_terminal_collector.collectors.trade_collector import TradeCollector
 from gecko_terminal_collector.config.models import CollectionConfig, DEXConfig, ThresholdConfig
+from gecko_terminal_collector.database.frames import TRADE_FRAME_COLUMNS, rows_to_frame, trade_records_to_frame
 from gecko_terminal_collector.models.core import (
     TradeRecord, ValidationResult, CollectionResult
 )
@@ -457,7 +458,7 @@ class TestTradeCollector:
             )
         ]
         
-        trade_collector.db_manager.get_trade_data.return_value = trades
+        trade_collector.db_manager.get_trades_frame.return_value = trade_records_to_frame(trades)
         
         continuity = await trade_collector.verify_data_continuity("pool1")
         
@@ -468,11 +469,30 @@ class TestTradeCollector:
         assert continuity["pool_id"] == "pool1"
         assert continuity["has_trades"] is True
         assert continuity["trade_count"] == 2
+        assert continuity["significant_gaps"] == 1
+        assert continuity["gaps"][0]["duration_hours"] == pytest.approx(3.0)
+        assert continuity["total_volume_usd"] == 500.0
+    
+    @pytest.mark.asyncio
+    async def test_pool_priority_counts_recent_tz_aware_trades(self, trade_collector):
+        """Test pool priority on the tz-aware trade timestamps PostgreSQL returns."""
+        now = datetime.now(timezone.utc)
+        rows = [
+            (f"trade{hours}", "pool1", hours, 1.0, 100.0, 2.5, 1000.0, "buy", now - timedelta(hours=hours))
+            for hours in (1, 2, 3, 10, 20)
+        ]
+        trade_collector.db_manager.get_trades_frame.return_value = rows_to_frame(rows, TRADE_FRAME_COLUMNS)
+        trade_collector.detect_trade_data_gaps = AsyncMock(return_value=[])
+
+        priority = await trade_collector._calculate_pool_priority("pool1")
+
+        # volume 5000/10000, 3 of the trades in the last 4 hours, never collected, no gaps
+        assert priority == pytest.approx(0.5 * 0.4 + (3 / 20.0) * 0.3 + 1.0 * 0.2 + 1.0 * 0.1)
     
     @pytest.mark.asyncio
     async def test_verify_data_continuity_no_trades(self, trade_collector):
         """Test verifying data continuity with no trades."""
-        trade_collector.db_manager.get_trade_data.return_value = []
+        trade_collector.db_manager.get_trades_frame.return_value = trade_records_to_frame([])
         
         continuity = await trade_collector.verify_data_continuity("pool1")
         
@@ -753,7 +773,7 @@ class TestTradeDataContinuityVerification:
         pool_ids = ["pool1", "pool2", "pool3"]
         
         # Mock different activity levels for each pool
-        def mock_get_trade_data(pool_id, start_time, end_time, min_volume_usd):
+        def mock_trades(pool_id):
             if pool_id == "pool1":
                 # High volume, high activity
                 return [
@@ -785,7 +805,9 @@ class TestTradeDataContinuityVerification:
                     ) for i in range(3)  # Low activity
                 ]
         
-        continuity_collector.db_manager.get_trade_data.side_effect = mock_get_trade_data
+        continuity_collector.db_manager.get_trades_frame.return_value = trade_records_to_frame(
+            trade for pool_id in pool_ids for trade in mock_trades(pool_id)
+        )
         
         # Mock gap detection to return no gaps for simplicity
         continuity_collector.detect_trade_data_gaps = AsyncMock(return_value=[])
@@ -0,0 +1,95 @@
+"""
+Tests for the incremental watchlist CSV index.
+"""
+
+import os
+
+import pytest
+
+from gecko_terminal_collector.utils.watchlist_index import WatchlistIndex
+
+
+HEADER = "tokenSymbol,poolAddress,networkAddress\n"
+
+
+def make_index(path):
+    return WatchlistIndex(
+        path,
+        lambda row, row_num: dict(row) if row.get("tokenSymbol") else None,
+        key=lambda row: row["poolAddress"],
+        aliases=lambda row: (row["tokenSymbol"].lower(), row["networkAddress"])
+    )
+
+
+def write(path, text, mtime_offset=0):
+    path.write_text(text)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+
+
+class TestWatchlistIndex:
+    """Test change detection, incremental reads and lookups."""
+
+    def test_appended_rows_are_read_incrementally(self, tmp_path):
+        path = tmp_path / "watchlist.csv"
+        write(path, HEADER + "AAA,pool1,net1\n,missing,net0\n")
+        index = make_index(path)
+
+        refresh = index.refresh()
+        assert refresh.modified and refresh.full_reload
+        assert [row["poolAddress"] for row in refresh.records] == ["pool1"]
+        assert not index.refresh().modified
+
+        with open(path, "a") as file:
+            file.write("BBB,pool2,net2\nAAA,pool1,net1\n")
+        refresh = index.refresh()
+        assert refresh.modified and not refresh.full_reload
+        assert [row["poolAddress"] for row in refresh.records] == ["pool2"]
+        assert len(index) == 2
+
+        assert index.get("pool2")["tokenSymbol"] == "BBB"
+        assert index.get("aaa")["poolAddress"] == "pool1"
+        assert index.get("net2")["poolAddress"] == "pool2"
+        assert "pool3" not in index
+
+    def test_edits_trigger_full_reload(self, tmp_path):
+        path = tmp_path / "watchlist.csv"
+        write(path, HEADER + "AAA,pool1,net1\nBBB,pool2,net2\n")
+        index = make_index(path)
+        index.refresh()
+
+        # Same size, different content
+        write(path, HEADER + "AAA,pool1,net1\nCCC,pool3,net3\n", mtime_offset=10**9)
+        refresh = index.refresh()
+        assert refresh.full_reload
+        assert [row["poolAddress"] for row in index.records()] == ["pool1", "pool3"]
+        assert index.get("pool2") is None and index.get("bbb") is None
+
+        # Touched without a content change
+        write(path, HEADER + "AAA,pool1,net1\nCCC,pool3,net3\n", mtime_offset=2 * 10**9)
+        assert not index.refresh().modified
+
+        # Grown, but an earlier row was edited
+        write(path, HEADER + "AAA,pool9,net1\nCCC,pool3,net3\nDDD,pool4,net4\n", mtime_offset=3 * 10**9)
+        refresh = index.refresh()
+        assert refresh.full_reload
+        assert [row["poolAddress"] for row in index.records()] == ["pool9", "pool3", "pool4"]
+
+    def test_edit_far_before_appended_tail_triggers_full_reload(self, tmp_path):
+        path = tmp_path / "watchlist.csv"
+        rows = "".join(f"SYM{i},pool{i},net{i}\n" for i in range(500))
+        write(path, HEADER + rows)
+        index = make_index(path)
+        index.refresh()
+
+        # Edit the first row (well over 4 KiB before the old end) and append
+        write(path, HEADER + rows.replace("SYM0,pool0,", "SYM0,poolX,", 1) + "NEW,pool500,net500\n",
+              mtime_offset=10**9)
+        refresh = index.refresh()
+        assert refresh.full_reload
+        assert index.get("poolX") is not None and index.get("pool0") is None
+        assert len(index) == 501
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            make_index(tmp_path / "missing.csv").refresh()
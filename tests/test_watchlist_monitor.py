@@ -15,8 +15,9 @@ from gecko_terminal_collector.collectors.watchlist_monitor import (
     WatchlistMonitor,
     WatchlistRecord,
 )
-from gecko_terminal_collector.config.models import CollectionConfig, WatchlistConfig
-from gecko_terminal_collector.database.models import WatchlistEntry
+from gecko_terminal_collector.config.models import CollectionConfig, DatabaseConfig, WatchlistConfig
+from gecko_terminal_collector.database.models import DEX, Pool, WatchlistEntry
+from gecko_terminal_collector.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
 from gecko_terminal_collector.models.core import CollectionResult
 
 
@@ -282,8 +283,7 @@ class TestWatchlistMonitor:
         """Test processing new records when auto-add is enabled."""
         # Setup
         watchlist_monitor.auto_add_new_tokens = True
-        mock_db_manager.get_watchlist_entry_by_pool_id.return_value = None  # No existing entry
-        mock_db_manager.add_watchlist_entry = AsyncMock()
+        mock_db_manager.add_or_reactivate_watchlist_entries = AsyncMock(return_value=1)
         
         record = WatchlistRecord("CBRL", "Cracker Barrel", "SOL", "PumpSwap", "pool1", "network1")
         new_records = [record]
@@ -293,10 +293,12 @@ class TestWatchlistMonitor:
         
         # Verify
         assert processed_count == 1
-        mock_db_manager.add_watchlist_entry.assert_called_once()
+        mock_db_manager.add_or_reactivate_watchlist_entries.assert_called_once()
         
         # Check the WatchlistEntry that was added
-        call_args = mock_db_manager.add_watchlist_entry.call_args[0][0]
+        entries = mock_db_manager.add_or_reactivate_watchlist_entries.call_args[0][0]
+        assert len(entries) == 1
+        call_args = entries[0]
         assert call_args.pool_id == "pool1"
         assert call_args.token_symbol == "CBRL"
         assert call_args.token_name == "Cracker Barrel"
@@ -317,36 +319,48 @@ class TestWatchlistMonitor:
         
         # Verify
         assert processed_count == 0
-        mock_db_manager.add_watchlist_entry.assert_not_called()
+        mock_db_manager.add_or_reactivate_watchlist_entries.assert_not_called()
     
     @pytest.mark.asyncio
-    async def test_process_new_records_reactivate_existing(self, watchlist_monitor, mock_db_manager):
-        """Test reactivating an existing inactive watchlist entry."""
-        # Setup
+    async def test_process_new_records_reactivate_existing(self, tmp_path, watchlist_monitor):
+        """Test adding new and reactivating inactive entries in bulk."""
+        db_manager = SQLAlchemyDatabaseManager(DatabaseConfig(url=f"sqlite:///{tmp_path / 'watchlist.db'}", echo=False))
+        await db_manager.initialize()
+        watchlist_monitor.db_manager = db_manager
         watchlist_monitor.auto_add_new_tokens = True
         
-        # Mock existing inactive entry
-        existing_entry = MagicMock()
-        existing_entry.is_active = False
-        mock_db_manager.get_watchlist_entry_by_pool_id.return_value = existing_entry
-        mock_db_manager.update_watchlist_entry_status = AsyncMock()
-        
-        record = WatchlistRecord("CBRL", "Cracker Barrel", "SOL", "PumpSwap", "pool1", "network1")
-        new_records = [record]
-        
-        # Execute
-        processed_count = await watchlist_monitor._process_new_records(new_records)
-        
-        # Verify
-        assert processed_count == 1
-        mock_db_manager.update_watchlist_entry_status.assert_called_once_with("pool1", True)
-        mock_db_manager.add_watchlist_entry.assert_not_called()
+        try:
+            with db_manager.connection.get_session() as session:
+                session.add(DEX(id="pumpswap", name="PumpSwap", network="solana"))
+                session.add_all([
+                    Pool(id=f"pool{i}", address=f"pool{i}", dex_id="pumpswap") for i in (1, 2, 3)
+                ])
+                session.commit()
+            
+            await db_manager.add_watchlist_entry(WatchlistEntry(pool_id="pool1", token_symbol="CBRL", is_active=False))
+            await db_manager.add_watchlist_entry(WatchlistEntry(pool_id="pool2", token_symbol="TEST", is_active=True))
+            
+            new_records = [
+                WatchlistRecord("CBRL", "Cracker Barrel", "SOL", "PumpSwap", "pool1", "network1"),
+                WatchlistRecord("TEST", "Test Token", "SOL", "Heaven", "pool2", "network2"),
+                WatchlistRecord("NEW", "New Token", "SOL", "PumpSwap", "pool3", "network3"),
+                WatchlistRecord("GONE", "Unknown Pool", "SOL", "PumpSwap", "pool4", "network4"),
+            ]
+            
+            # Existing active pool2 is left alone and unknown pool4 is skipped
+            assert await watchlist_monitor._process_new_records(new_records) == 2
+            assert sorted(await db_manager.get_watchlist_pools()) == ["pool1", "pool2", "pool3"]
+            
+            await watchlist_monitor._process_removed_records(new_records[:2])
+            assert await db_manager.get_watchlist_pools() == ["pool3"]
+        finally:
+            await db_manager.close()
     
     @pytest.mark.asyncio
     async def test_process_removed_records(self, watchlist_monitor, mock_db_manager):
         """Test processing removed records."""
         # Setup
-        mock_db_manager.update_watchlist_entry_status = AsyncMock()
+        mock_db_manager.deactivate_watchlist_entries = AsyncMock(return_value=1)
         
         record = WatchlistRecord("CBRL", "Cracker Barrel", "SOL", "PumpSwap", "pool1", "network1")
         removed_records = [record]
@@ -355,7 +369,7 @@ class TestWatchlistMonitor:
         await watchlist_monitor._process_removed_records(removed_records)
         
         # Verify
-        mock_db_manager.update_watchlist_entry_status.assert_called_once_with("pool1", False)
+        mock_db_manager.deactivate_watchlist_entries.assert_called_once_with(["pool1"])
     
     @pytest.mark.asyncio
     async def test_validate_specific_data(self, watchlist_monitor):
@@ -419,8 +433,7 @@ class TestWatchlistMonitor:
             watchlist_monitor.auto_add_new_tokens = True
             
             # Mock database responses
-            mock_db_manager.get_watchlist_entry_by_pool_id.return_value = None
-            mock_db_manager.add_watchlist_entry = AsyncMock()            
+            mock_db_manager.add_or_reactivate_watchlist_entries = AsyncMock(return_value=2)
             
             try:
                 # Execute collection
@@ -434,7 +447,8 @@ class TestWatchlistMonitor:
                 assert len(result.errors) == 0
                 
                 # Verify database calls
-                assert mock_db_manager.add_watchlist_entry.call_count == 2
+                assert mock_db_manager.add_or_reactivate_watchlist_entries.call_count == 1
+                assert len(mock_db_manager.add_or_reactivate_watchlist_entries.call_args[0][0]) == 2
                 
                 # Verify internal state
                 assert len(watchlist_monitor._last_processed_records) == 2
@@ -444,4 +458,36 @@ class TestWatchlistMonitor:
                 try:
                     os.unlink(temp_file.name)
                 except PermissionError:
-                    pass  # Ignore permission errors on Windows
\ No newline at end of file
+                    pass  # Ignore permission errors on Windows    
+    @pytest.mark.asyncio
+    async def test_collect_appended_and_removed_rows(self, tmp_path, watchlist_monitor, mock_db_manager, sample_csv_content):
+        """Test that appended rows are applied incrementally and removals on rewrite."""
+        watchlist_file = tmp_path / "watchlist.csv"
+        watchlist_file.write_text(sample_csv_content + "\n")
+        watchlist_monitor.watchlist_file_path = watchlist_file
+        mock_db_manager.add_or_reactivate_watchlist_entries = AsyncMock(side_effect=lambda entries: len(entries))
+        mock_db_manager.deactivate_watchlist_entries = AsyncMock(return_value=1)
+        
+        assert (await watchlist_monitor.collect()).records_collected == 2
+        
+        with open(watchlist_file, "a") as file:
+            file.write('"NEW","New Token","SOL","PumpSwap","NewPoolAddress789","NewNetworkAddress789"\n')
+        
+        with patch.object(watchlist_monitor, "_detect_changes", wraps=watchlist_monitor._detect_changes) as detect:
+            result = await watchlist_monitor.collect()
+            detect.assert_not_called()  # Only the appended tail was read
+        
+        assert result.records_collected == 1
+        added = mock_db_manager.add_or_reactivate_watchlist_entries.call_args[0][0]
+        assert [entry.pool_id for entry in added] == ["NewPoolAddress789"]
+        assert len(watchlist_monitor._last_processed_records) == 3
+        
+        # Rewriting the file without the first row deactivates it
+        lines = watchlist_file.read_text().splitlines(keepends=True)
+        watchlist_file.write_text(lines[0] + "".join(lines[2:]))
+        
+        assert (await watchlist_monitor.collect()).records_collected == 0
+        mock_db_manager.deactivate_watchlist_entries.assert_called_once_with(
+            ["7bqJG2ZdMKbEkgSmfuqNVBvqEvWavgL8UEo33ZqdL3NP"]
+        )
+        assert len(watchlist_monitor._last_processed_records) == 2
@@ -0,0 +1,173 @@
+"""
+Tests for database-backed work leases and sharded scheduling.
+"""
+
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+
+from gecko_terminal_collector.config.models import CollectionConfig, DatabaseConfig
+from gecko_terminal_collector.config.validation import validate_config_dict
+from gecko_terminal_collector.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from gecko_terminal_collector.scheduling import leases
+from gecko_terminal_collector.scheduling.leases import WorkLeaseManager, pool_shard
+from gecko_terminal_collector.scheduling.scheduler import CollectionScheduler, SchedulerConfig
+from gecko_terminal_collector.utils.enhanced_rate_limiter import GlobalRateLimitCoordinator
+
+from tests.test_collection_scheduler import MockCollector
+
+
+@pytest_asyncio.fixture
+async def db_managers(tmp_path):
+    """Two managers on one SQLite file, like two nodes sharing a database."""
+    url = f"sqlite:///{tmp_path / 'leases.db'}"
+    managers = [SQLAlchemyDatabaseManager(DatabaseConfig(url=url, echo=False)) for _ in range(2)]
+    for manager in managers:
+        await manager.initialize()
+    yield managers
+    for manager in managers:
+        await manager.close()
+
+
+def make_node(db_manager, node_id):
+    node = WorkLeaseManager(db_manager, node_id=node_id, lease_ttl=60)
+    node.register_units("ohlcv", 4)
+    node.register_units("new_pools", 1)
+    return node
+
+
+def all_units(*nodes):
+    return [
+        (key, shard) for node in nodes
+        for key in ("ohlcv", "new_pools") for shard in node.owned_shards(key)
+    ]
+
+
+class PoolCollector(MockCollector):
+    """Mock collector recording the watchlist pools it would collect."""
+
+    supports_pool_sharding = True
+
+    def __init__(self, key, pool_ids):
+        super().__init__(key)
+        self.pool_ids = pool_ids
+        self.collected = []
+
+    async def collect(self):
+        self.collected.append(self.filter_owned_pools(self.pool_ids))
+        return await super().collect()
+
+
+class TestWorkLeases:
+    """Test lease claiming, rebalancing and failover."""
+
+    @pytest.mark.asyncio
+    async def test_nodes_split_units_and_take_over_from_dead_node(self, db_managers, monkeypatch):
+        now = datetime(2025, 1, 1, 12, 0, 0)
+        monkeypatch.setattr(leases, "_utcnow", lambda: now)
+        node_a, node_b = make_node(db_managers[0], "node-a"), make_node(db_managers[1], "node-b")
+
+        assert await node_a.rebalance() == {"owned": 5, "claimed": 5, "released": 0, "live_nodes": 1}
+
+        # A second node waits for the first to release its excess units
+        assert (await node_b.rebalance())["owned"] == 0
+        assert (await node_a.rebalance())["released"] == 2
+        assert (await node_b.rebalance())["claimed"] == 2
+
+        units = all_units(node_a, node_b)
+        assert sorted(units) == sorted([("ohlcv", s) for s in range(4)] + [("new_pools", 0)])
+        assert len(node_a._owned) == 3 and len(node_b._owned) == 2
+
+        # node-a stops heartbeating: its leases expire and node-b takes everything
+        now += timedelta(seconds=61)
+        assert node_a.owned_shards("ohlcv") == []
+        assert await node_b.rebalance() == {"owned": 5, "claimed": 3, "released": 0, "live_nodes": 1}
+
+        # A node coming back late finds its leases taken over
+        assert (await node_a.rebalance())["owned"] == 0
+
+        assert await node_b.release_all() == 5
+        assert (await node_a.rebalance())["owned"] == 5
+
+    @pytest.mark.asyncio
+    async def test_sharded_scheduler_runs_only_leased_pools(self, db_managers, tmp_path):
+        pool_ids = [f"solana_pool{i}" for i in range(40)]
+        coordinator = GlobalRateLimitCoordinator(requests_per_minute=60, daily_limit=1000, state_dir=str(tmp_path))
+        limiter = await coordinator.get_limiter("ohlcv")
+
+        schedulers, collectors = [], []
+        for index, db_manager in enumerate(db_managers):
+            scheduler = CollectionScheduler(
+                CollectionConfig(),
+                SchedulerConfig(sharding_enabled=True, node_id=f"node-{index}", pool_shards=4),
+                db_manager=db_manager,
+                rate_limit_coordinator=coordinator
+            )
+            collector = PoolCollector("ohlcv", pool_ids)
+            scheduler.register_collector(collector, "1h")
+            schedulers.append(scheduler)
+            collectors.append(collector)
+
+        for _ in range(2):
+            for scheduler in schedulers:
+                await scheduler._rebalance_leases()
+        for scheduler in schedulers:
+            await scheduler._execute_collector("collector_ohlcv")
+
+        first, second = collectors[0].collected[0], collectors[1].collected[0]
+        assert first and second
+        assert sorted(first + second) == sorted(pool_ids)
+        assert not set(first) & set(second)
+        assert {pool_shard(p, 4) for p in first}.isdisjoint({pool_shard(p, 4) for p in second})
+
+        # Quotas are split between the live nodes
+        assert coordinator.node_count == 2
+        assert (limiter.requests_per_minute, limiter.daily_limit) == (30, 500)
+        assert schedulers[0].get_status()["sharding"]["live_nodes"] == 2
+
+    @pytest.mark.asyncio
+    async def test_units_inserted_concurrently_by_another_node_are_skipped(self, db_managers, monkeypatch):
+        node_a, node_b = make_node(db_managers[0], "node-a"), make_node(db_managers[1], "node-b")
+        await node_a.rebalance()
+
+        # node-b read the units as missing just before node-a inserted them
+        unit_ids = sorted(node_b._units)
+        with node_b._transaction() as session:
+            monkeypatch.setattr(session, "scalars", lambda statement: iter(()))
+            node_b._create_missing_units(session, unit_ids)
+
+        assert (await node_b.rebalance())["live_nodes"] == 2
+        assert len(all_units(node_a, node_b)) == 5
+
+    @pytest.mark.asyncio
+    async def test_scheduler_built_from_collection_config(self, db_managers, tmp_path):
+        config = validate_config_dict({
+            "scheduling": {"sharding_enabled": True, "node_id": "node-x", "pool_shards": 8, "lease_ttl": 90}
+        }).to_legacy_config()
+        scheduler_config = SchedulerConfig.from_collection_config(config)
+        assert (scheduler_config.sharding_enabled, scheduler_config.node_id) == (True, "node-x")
+        assert (scheduler_config.pool_shards, scheduler_config.lease_ttl) == (8, 90)
+
+        with pytest.raises(ValueError):
+            validate_config_dict({"scheduling": {"lease_ttl": 10, "lease_heartbeat_interval": 20}})
+
+        coordinator = GlobalRateLimitCoordinator(requests_per_minute=60, daily_limit=1000, state_dir=str(tmp_path))
+        scheduler = CollectionScheduler(
+            config, scheduler_config, db_manager=db_managers[0], rate_limit_coordinator=coordinator
+        )
+        collector = PoolCollector("ohlcv", [])
+        scheduler.register_collector(collector, "1h")
+        await scheduler.start()
+        try:
+            assert collector.rate_limiter is await coordinator.get_limiter("ohlcv")
+            assert scheduler.lease_manager.owned_shards("ohlcv") == list(range(8))
+        finally:
+            await scheduler.stop()
+
+    def test_sharding_requires_database_manager(self):
+        with pytest.raises(ValueError):
+            CollectionScheduler(CollectionConfig(), SchedulerConfig(sharding_enabled=True))
+
+        collector = MockCollector("plain")
+        assert collector.filter_owned_pools(["a", "b"]) == ["a", "b"]
+        assert MockCollector.supports_pool_sharding is False